@@ -48,6 +48,7 @@ B전략(15분봉 급등초입): 4개 조건 (RSI 조건 제거)
 C전략(30분봉 급등맥점): 2개 기본조건 + 3개 타점(A/B/C) - 기본조건(50봉이내 MA80-MA480 골든크로스 or MA80<MA480 + 100봉이내 MA480-BB200 크로스) + A/B/C 타점 중 1개
 """
 
+import copy
 import os
 import sys
 import ccxt
@@ -90,13 +91,17 @@ except ImportError:
 
 # Binance Rate Limiter 추가 (IP 차단 방지)
 try:
-    from binance_rate_limiter import RateLimitedExchange, BinanceRateLimiter
+    from binance_rate_limiter import RateLimitedExchange, BinanceRateLimiter, PRIORITY_BULK, get_rate_limiter
     HAS_RATE_LIMITER = True
     print("[INFO] Binance Rate Limiter 로드 완료")
 except ImportError:
     print("[WARNING] binance_rate_limiter.py 없음 - Rate Limiting 비활성화")
     HAS_RATE_LIMITER = False
 
+# 메모리 상한 LRU Cache (프로세스 공용)
+from bounded_cache import get_shared_cache
+from persistence_scheduler import get_persistence_scheduler
+
 try:
     from improved_dca_position_manager import ImprovedDCAPositionManager
     HAS_DCA_MANAGER = True
@@ -198,6 +203,9 @@ class FifteenMinuteMegaStrategy:
             self.private_exchange = None
             print("[WARN] 프라이빗 API 없음 - 거래 기능 비활성화")
         
+        # 프로세스 공용 Rate Limiter (공개/프라이빗 API, DCA 매니저가 같은 weight budget 사용)
+        self.rate_limiter = get_rate_limiter(self.logger) if HAS_RATE_LIMITER else None
+        
         # 텔레그램 봇 초기화 (telegram_config.py에서 실제 설정 로드)
         try:
             from telegram_config import TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID
@@ -244,9 +252,9 @@ class FifteenMinuteMegaStrategy:
             self.dca_manager = None
             print("[WARN] DCA 매니저 없음 - 프라이빗 API 필요")
         
-        # 캐시 시스템
-        self._ohlcv_cache = {}
+        # 캐시 시스템 (OHLCV는 프로세스 공용 메모리 상한 Cache의 alpha_z_ohlcv 네임스페이스)
         self._ohlcv_cache_ttl = 1200  # 20분
+        self._ohlcv_cache = get_shared_cache().namespace('alpha_z_ohlcv', ttl=self._ohlcv_cache_ttl)
         self._market_cache = None
         self._market_cache_time = 0
         self._market_cache_ttl = 3600  # 1시간
@@ -830,10 +838,11 @@ class FifteenMinuteMegaStrategy:
             return {}
     
     def _save_notification_history(self):
-        """텔레그램 알림 기록 저장"""
+        """텔레그램 알림 기록 저장 (백그라운드 디바운스 기록)"""
         try:
-            with open(self.notification_file, 'w', encoding='utf-8') as f:
-                json.dump(self.sent_notifications, f, ensure_ascii=False, indent=2, default=str)
+            # 요청 시점 사본을 기록 (producer는 scheduler 스레드에서 호출됨)
+            data = copy.deepcopy(self.sent_notifications)
+            get_persistence_scheduler().schedule(self.notification_file, lambda: data, default=str)
         except Exception as e:
             print(f"[WARN] 알림 기록 저장 실패: {e}")
     
@@ -1005,6 +1014,12 @@ class FifteenMinuteMegaStrategy:
                 'positions': {}
             }
     
+    def get_cache_stats(self):
+        """OHLCV 캐시 통계 (공용 캐시 전체 + alpha_z_ohlcv 네임스페이스)"""
+        stats = get_shared_cache().get_stats()
+        stats['ohlcv'] = self._ohlcv_cache.get_stats()
+        return stats
+    
     def get_ohlcv_data(self, symbol, timeframe, limit=1000):
         """OHLCV 데이터 조회 (캐싱 시스템 적용)"""
         try:
@@ -1012,12 +1027,11 @@ class FifteenMinuteMegaStrategy:
             cache_key = f"{symbol}_{timeframe}"
             current_time = time.time()
             
-            if cache_key in self._ohlcv_cache:
-                cached_data, cached_time = self._ohlcv_cache[cache_key]
-                if current_time - cached_time < self._ohlcv_cache_ttl:
-                    if len(cached_data) >= limit:
-                        return cached_data.tail(limit)
-                    return cached_data
+            cached_data = self._ohlcv_cache.get(cache_key)
+            if cached_data is not None:
+                if len(cached_data) >= limit:
+                    return cached_data.tail(limit)
+                return cached_data
             
             # API 호출
             ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
@@ -1025,8 +1039,8 @@ class FifteenMinuteMegaStrategy:
                 df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
                 df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
                 
-                # 캐시 저장
-                self._ohlcv_cache[cache_key] = (df, current_time)
+                # 캐시 저장 (메모리 상한 초과 시 가장 오래 안 쓴 프레임부터 제거)
+                self._ohlcv_cache.set(cache_key, df, current_time)
                 return df
             else:
                 return None
@@ -2469,7 +2483,22 @@ class FifteenMinuteMegaStrategy:
             self.logger.error(f"상세 스캔 실패: {e}")
             return []
     
-    def scan_symbols_optimized(self, api_call_tracker):
+    def _api_budget_summary(self):
+        """공용 Rate Limiter weight 사용 현황"""
+        if not self.rate_limiter:
+            return "Rate Limiter 없음"
+        status = self.rate_limiter.get_status()
+        summary = f"{status['current_weight']}/{status['max_weight']} weight ({status['weight_usage_pct']:.0f}%)"
+        coalesced = status.get('single_flight', {}).get('coalesced', 0)
+        if coalesced:
+            summary += f", 동일 요청 병합 {coalesced}회"
+        return summary
+    
+    def _has_scan_budget(self, weight=10):
+        """스캔 (벌크 레인) 여유 확인 - 15분봉 1200개 klines 1회 = weight 10"""
+        return self.rate_limiter is None or self.rate_limiter.has_capacity(weight, PRIORITY_BULK)
+    
+    def scan_symbols_optimized(self):
         """🚀 최고속도 최적화된 심볼 스캔 (IP 밴 방지)"""
         try:
             scan_start = time.time()
@@ -2491,7 +2520,6 @@ class FifteenMinuteMegaStrategy:
                         if symbol.endswith('/USDT:USDT') and market.get('active', False)
                     ]
                     self._cache_time = time.time()
-                    api_call_tracker['calls_in_minute'] += 1
                     print(f"   🔄 마켓 데이터 캐시 갱신: {len(self._cached_futures_symbols)}개 심볼")
                 except Exception as e:
                     print(f"   ⚠️ 마켓 데이터 로드 실패: {e}")
@@ -2506,7 +2534,6 @@ class FifteenMinuteMegaStrategy:
             try:
                 # 단일 배치 호출로 모든 티커 정보 가져오기
                 tickers = self.exchange.fetch_tickers()
-                api_call_tracker['calls_in_minute'] += 1
                 batch_elapsed = time.time() - batch_start
                 print(f"   ⚡ 배치 티커 조회 완료: {len(tickers)}개 ({batch_elapsed:.1f}초)")
             except Exception as e:
@@ -2553,11 +2580,11 @@ class FifteenMinuteMegaStrategy:
                     analysis_tasks = {}
                     
                     for symbol, ticker, change_24h, volume in top_symbols:
-                        if api_call_tracker['calls_in_minute'] >= api_call_tracker['max_calls_per_minute'] - 100:
-                            print(f"   ⚠️ API 호출 제한 임박 ({api_call_tracker['calls_in_minute']}/{api_call_tracker['max_calls_per_minute']}) - 분석 중단")
+                        if not self._has_scan_budget():
+                            print(f"   ⚠️ API 호출 제한 임박 ({self._api_budget_summary()}) - 분석 중단")
                             break
                             
-                        future = executor.submit(self._optimized_symbol_analysis, symbol, ticker, api_call_tracker)
+                        future = executor.submit(self._optimized_symbol_analysis, symbol, ticker)
                         analysis_tasks[future] = symbol
                     
                     # 결과 수집
@@ -2604,7 +2631,7 @@ class FifteenMinuteMegaStrategy:
             print(f"   ⚡ 분석 시간: {analysis_elapsed:.1f}초")
             print(f"   🔥 전체 시간: {total_elapsed:.1f}초")
             print(f"   📊 분석 속도: {len(all_results)/total_elapsed:.1f} 심볼/초")
-            print(f"   🛡️ API 호출: {api_call_tracker['calls_in_minute']}/{api_call_tracker['max_calls_per_minute']}")
+            print(f"   🛡️ API weight: {self._api_budget_summary()}")
             
             # 전략별 분리된 결과 출력
             self._print_strategy_separated_results(all_results, entry_signals)
@@ -2630,15 +2657,11 @@ class FifteenMinuteMegaStrategy:
             print(f"❌ 최적화 스캔 실패: {e}")
             return []
     
-    def _optimized_symbol_analysis(self, symbol, ticker, api_call_tracker):
+    def _optimized_symbol_analysis(self, symbol, ticker):
         """최적화된 개별 심볼 분석 (API 호출 최소화)"""
         try:
             clean_symbol = symbol.replace('/USDT:USDT', '')
             
-            # API 호출 제한 체크
-            if api_call_tracker['calls_in_minute'] >= api_call_tracker['max_calls_per_minute'] - 10:
-                return None
-            
             # 기존 포지션 확인
             if symbol in self.active_positions:
                 return None
@@ -2658,11 +2681,12 @@ class FifteenMinuteMegaStrategy:
                 except:
                     pass
             
-            # 폴백: REST API (필요시에만)
+            # 폴백: REST API (필요시에만, 스캔 레인 여유 없으면 대기 없이 건너뜀)
             if df_15m is None or len(df_15m) < 480:
+                if not self._has_scan_budget():
+                    return None
                 try:
                     df_15m = self.get_ohlcv_data(symbol, '15m', limit=1200)
-                    api_call_tracker['calls_in_minute'] += 1
                     if df_15m is None or len(df_15m) < 480:
                         return None
                 except:
@@ -3751,18 +3775,13 @@ class FifteenMinuteMegaStrategy:
         print(f"   💀 최대 손실: 6% (시드 기준)")
         print(f"   🔥 실제 거래 활성화 - 리스크 관리 필수!")
         print(f"\n🔥 바이낸스 API 레이트 리밋 최적화:")
-        print(f"   • Futures: 1200 requests/min (20/sec)")
+        print(f"   • Futures: 2400 weight/min (공용 Limiter 2000, 스캔 레인 60% / 주문 레인 우선)")
         print(f"   • 스마트 배치: 병렬 + 순차 하이브리드") 
         print(f"   • 캐시 활용: 티커 데이터 재사용")
         print(f"   • 에러 복구: 자동 백오프 및 재시도")
         
-        # API 호출 제한 관리
-        api_call_tracker = {
-            'calls_in_minute': 0,
-            'last_minute_reset': time.time(),
-            'max_calls_per_minute': 600,  # 안전 마진 (1200의 50%) - IP 밴 방지 강화
-            'retry_delays': [1, 2, 5, 10, 30]  # 백오프 딜레이 (초)
-        }
+        # API 호출 제한은 공용 Rate Limiter (슬라이딩 윈도우 + 서버 헤더 동기화)가 관리
+        retry_delays = [1, 2, 5, 10, 30]  # 백오프 딜레이 (초)
         
         while True:
             try:
@@ -3777,31 +3796,23 @@ class FifteenMinuteMegaStrategy:
                         
                     print("✅ 긴급 일시정지 해제 - 시스템 재개합니다.")
                 
-                # API 호출 수 리셋 (매분)
-                current_time = time.time()
-                if current_time - api_call_tracker['last_minute_reset'] >= 60:
-                    api_call_tracker['calls_in_minute'] = 0
-                    api_call_tracker['last_minute_reset'] = current_time
-                
                 print(f"\n{'='*60}")
                 print(f"🔍 최적화 스캔 시작: {get_korea_time().strftime('%Y-%m-%d %H:%M:%S')}")
-                print(f"📊 API 호출 현황: {api_call_tracker['calls_in_minute']}/{api_call_tracker['max_calls_per_minute']}/분")
+                print(f"📊 API weight 현황: {self._api_budget_summary()}/분")
                 
-                # API 호출 제한 체크
-                if api_call_tracker['calls_in_minute'] >= api_call_tracker['max_calls_per_minute']:
-                    wait_time = 60 - (current_time - api_call_tracker['last_minute_reset'])
+                # API 호출 제한 체크 (스캔 레인 여유가 생길 때까지만 대기, 최대 60초)
+                if not self._has_scan_budget():
+                    wait_time = min(self.rate_limiter.lane_wait_time(10, PRIORITY_BULK), 60)
                     if wait_time > 0:
                         print(f"⚠️ API 호출 제한 도달 - {wait_time:.0f}초 대기 (IP 밴 방지)")
                         time.sleep(wait_time)
-                        api_call_tracker['calls_in_minute'] = 0
-                        api_call_tracker['last_minute_reset'] = time.time()
                 
                 # 심볼 스캔 (최적화된 API 호출)
                 scan_start = time.time()
-                signals = self.scan_symbols_optimized(api_call_tracker)
+                signals = self.scan_symbols_optimized()
                 scan_duration = time.time() - scan_start
                 
-                print(f"⚡ 스캔 완료: {scan_duration:.1f}초, API 호출: {api_call_tracker['calls_in_minute']}/{api_call_tracker['max_calls_per_minute']}")
+                print(f"⚡ 스캔 완료: {scan_duration:.1f}초, API weight: {self._api_budget_summary()}")
                 
                 # 진입 신호 처리 (entry_signal 상태만)
                 for signal in signals:
@@ -3968,7 +3979,7 @@ class FifteenMinuteMegaStrategy:
                 
                 # 동적 대기 시간 계산
                 effective_interval = max(interval, 30)  # 최소 30초 대기
-                if api_call_tracker['calls_in_minute'] > 600:  # 75% 도달시 더 긴 대기
+                if self.rate_limiter and self.rate_limiter.usage_pct() > 75:  # 75% 도달시 더 긴 대기
                     effective_interval = interval * 1.5
                 
                 print(f"⏳ {effective_interval:.0f}초 대기 중 (다음 스캔까지)...")
@@ -3982,7 +3993,7 @@ class FifteenMinuteMegaStrategy:
                 print(f"❌ 스캔 오류: {e}")
                 
                 # 백오프 전략으로 재시도
-                for delay in api_call_tracker['retry_delays']:
+                for delay in retry_delays:
                     print(f"🔄 {delay}초 후 재시도...")
                     time.sleep(delay)
                     try:
@@ -4054,16 +4065,8 @@ def main():
             print(f"   ⚡ IP 밴 방지 최적화 적용")
             print(f"   📊 연속 모드: python alpha_z_triple_strategy.py continuous")
             
-            # API 호출 추적기 초기화
-            api_call_tracker = {
-                'calls_in_minute': 0,
-                'last_minute_reset': time.time(),
-                'max_calls_per_minute': 800,
-                'retry_delays': [1, 2, 5, 10, 30]
-            }
-            
             # 최적화된 단일 스캔 실행
-            signals = strategy.scan_symbols_optimized(api_call_tracker)
+            signals = strategy.scan_symbols_optimized()
             
             # 진입 신호 처리 (entry_signal 상태만)
             if signals:
@@ -4094,7 +4097,7 @@ def main():
             print(f"   🎯 포지션수: {final_portfolio['open_positions']}개")
             
             print(f"\n⚡ 최고속도 스캔 완료!")
-            print(f"   🛡️ API 호출: {api_call_tracker['calls_in_minute']}/{api_call_tracker['max_calls_per_minute']}")
+            print(f"   🛡️ API weight: {strategy._api_budget_summary()}")
             print(f"   📊 IP 밴 방지: 성공적으로 레이트 리밋 준수")
         
     except KeyboardInterrupt:
@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+"""
+Async Exchange Runtime
+ccxt.async_support 기반 이벤트 루프 REST 클라이언트 + 스캔 / 모니터 스케줄러 (옵션)
+
+구조:
+- 전용 스레드 1count에서 asyncio 이벤트 루프 Execute
+- ccxt.async_support 거래소 1count가 aiohttp 커넥션 풀 (TCPConnector limit)을 공유
+  → 동시 요청 수백 count도 요청마다 OS 스레드 / 커넥션을 만들지 않음 (keep-alive 재Usage)
+- 모든 REST 요청은 공용 Rate Limiter로 승인 (install_async_rate_limiter, budget 대기 중에도 루프 차단 없음)
+- gather / fetch_many: 세마포어 (max_concurrency)로 동시 요청 수 상한, 요청별 결과 또는 예외 반환
+- AsyncScanScheduler: 루프 위 주기 작업 (스캔 / Position 모니터), 동기 작업은 전용 워커 스레드 1count에서 직렬 Execute
+- SyncExchangeFacade: 기존 동기 ccxt 호출 방식 (exchange.fetch_tickers()) 그대로 - 루프에 제출 후 결과 대기
+
+ccxt.async_support / aiohttp가 없으면 HAS_ASYNC_CCXT=False (전략은 동기 ccxt 경로 Usage)
+"""
+
+import asyncio
+import inspect
+import logging
+import ssl
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from binance_rate_limiter import ADMISSION_TIMEOUT, BinanceRateLimiter, get_rate_limiter, install_async_rate_limiter
+
+try:
+    import aiohttp
+    import ccxt.async_support as ccxt_async
+    HAS_ASYNC_CCXT = True
+except ImportError:
+    aiohttp = None
+    ccxt_async = None
+    HAS_ASYNC_CCXT = False
+
+try:
+    import certifi
+    HAS_CERTIFI = True
+except ImportError:
+    HAS_CERTIFI = False
+
+
+class AsyncExchangeRuntime:
+    """이벤트 루프 스레드 + ccxt.async_support 거래소 + aiohttp 커넥션 풀"""
+
+    def __init__(self, config: dict, exchange_id: str = 'binance', limiter: Optional[BinanceRateLimiter] = None,
+                 logger=None, max_connections: int = 100, max_concurrency: int = 200, markets_from=None,
+                 exchange_factory: Optional[Callable] = None):
+        """
+        Args:
+            config: ccxt 거래소 Settings (동기 거래소와 동일한 apiKey / options 등)
+            exchange_id: ccxt 거래소 id
+            limiter: 공용 Rate Limiter (None이면 get_rate_limiter)
+            logger: 로거 인스턴스
+            max_connections: aiohttp 커넥션 풀 상한 (호스트당 동일)
+            max_concurrency: 동시 in-flight 요청 상한 (초과분은 루프에서 대기, 스레드 없음)
+            markets_from: markets가 로드된 동기 거래소 (있으면 load_markets 요청 없이 공유)
+            exchange_factory: factory(config) → async 거래소 (Test / 다른 구현용, None이면 ccxt.async_support)
+        """
+        if exchange_factory is None and not HAS_ASYNC_CCXT:
+            raise ImportError("ccxt.async_support / aiohttp Required")
+
+        self.config = dict(config or {})
+        self.exchange_id = exchange_id
+        self.limiter = limiter
+        self.logger = logger or logging.getLogger(__name__)
+        self.max_connections = max_connections
+        self.max_concurrency = max_concurrency
+        self.markets_from = markets_from
+        self.exchange_factory = exchange_factory
+
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.exchange = None
+        self._session = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._thread: Optional[threading.Thread] = None
+        self.sync = SyncExchangeFacade(self)
+
+        self.stats = {
+            'calls': 0,
+            'errors': 0,
+            'batches': 0,
+            'in_flight': 0,
+            'max_in_flight': 0,
+        }
+
+    @property
+    def is_running(self) -> bool:
+        return self.loop is not None and self.loop.is_running()
+
+    def start(self) -> 'AsyncExchangeRuntime':
+        """이벤트 루프 스레드 Starting + 거래소 / 커넥션 풀 Create (이미 Execute 중이면 무시)"""
+        if self.is_running:
+            return self
+        self.loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run_loop, args=(ready,), name='AsyncExchangeLoop', daemon=True)
+        self._thread.start()
+        ready.wait()
+        self.run(self._open())
+        self.logger.info(f"⚡ 비동기 거래소 런타임 Starting (커넥션 풀 {self.max_connections}, "
+                         f"동시 요청 상한 {self.max_concurrency})")
+        return self
+
+    def _run_loop(self, ready: threading.Event):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(ready.set)
+        self.loop.run_forever()
+
+    def _ssl_context(self):
+        # ccxt 기본값과 같은 CA 번들 (certifi)
+        return ssl.create_default_context(cafile=certifi.where()) if HAS_CERTIFI else True
+
+    async def _open(self):
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        config = dict(self.config)
+        if self.exchange_factory is None:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.max_connections,
+                                             ttl_dns_cache=300, enable_cleanup_closed=True, ssl=self._ssl_context())
+            self._session = aiohttp.ClientSession(connector=connector)
+            config.update({'asyncio_loop': self.loop, 'session': self._session})
+            self.exchange = getattr(ccxt_async, self.exchange_id)(config)
+        else:
+            self.exchange = self.exchange_factory(config)
+
+        install_async_rate_limiter(self.exchange, self.limiter or get_rate_limiter(self.logger))
+
+        markets = getattr(self.markets_from, 'markets', None)
+        if markets and hasattr(self.exchange, 'set_markets'):
+            self.exchange.set_markets(markets, getattr(self.markets_from, 'currencies', None))
+
+    def stop(self, timeout: float = 10):
+        """거래소 / 커넥션 풀 닫기 + 이벤트 루프 Terminate"""
+        if not self.is_running:
+            return
+        try:
+            self.run(self._close(), timeout=timeout)
+        except Exception as e:
+            self.logger.debug(f"Async exchange close error: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self.loop.close()
+        self.loop = None
+
+    async def _close(self):
+        close = getattr(self.exchange, 'close', None)
+        if close is not None:
+            await close()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    # ===== 루프 제출 (다른 스레드에서 호출) =====
+
+    def submit(self, coro) -> Future:
+        """코루틴을 루프에 제출 (결과는 concurrent.futures.Future)"""
+        if not self.is_running:
+            coro.close()
+            raise RuntimeError("AsyncExchangeRuntime is not running")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro, timeout: Optional[float] = None):
+        """코루틴을 루프에서 Execute하고 결과 대기 (루프 스레드에서 호출하면 교착이므로 RuntimeError)"""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("run() called from the event loop thread - await the coroutine instead")
+        return self.submit(coro).result(timeout)
+
+    # ===== 코루틴 API (루프 안에서 await) =====
+
+    async def call(self, method: str, *args, admission_timeout: Optional[float] = None, **kwargs):
+        """
+        거래소 메서드 1times 호출 (동시 요청 상한 세마포어)
+
+        Args:
+            admission_timeout: Rate Limiter 승인 대기 상한 (초, 0이면 budget 없을 때 즉시 RateLimitExceeded)
+        """
+        async with self._semaphore:
+            token = ADMISSION_TIMEOUT.set(admission_timeout) if admission_timeout is not None else None
+            self.stats['calls'] += 1
+            self.stats['in_flight'] += 1
+            self.stats['max_in_flight'] = max(self.stats['max_in_flight'], self.stats['in_flight'])
+            try:
+                return await getattr(self.exchange, method)(*args, **kwargs)
+            except Exception:
+                self.stats['errors'] += 1
+                raise
+            finally:
+                self.stats['in_flight'] -= 1
+                if token is not None:
+                    ADMISSION_TIMEOUT.reset(token)
+
+    async def gather(self, calls: Iterable[Tuple[str, tuple, dict]],
+                     admission_timeout: Optional[float] = None) -> List[Any]:
+        """(method, args, kwargs) 목록을 동시에 호출 → 입력 순서대로 결과 또는 예외 객체"""
+        self.stats['batches'] += 1
+        return await asyncio.gather(
+            *(self.call(method, *args, admission_timeout=admission_timeout, **kwargs) for method, args, kwargs in calls),
+            return_exceptions=True)
+
+    # ===== 동기 편의 API (스캔 / 모니터 스레드에서 호출) =====
+
+    def fetch_many(self, method: str, requests: Dict[Any, Tuple[tuple, dict]],
+                   admission_timeout: Optional[float] = None, timeout: Optional[float] = None) -> Dict[Any, Any]:
+        """
+        같은 메서드 여러 요청을 한 번에 다중화 (동기 호출 측은 스레드 1count로 대기)
+
+        Args:
+            requests: {Key: (args, kwargs)}
+        Returns:
+            {Key: 결과 또는 예외 객체}
+        """
+        keys = list(requests)
+        results = self.run(self.gather(((method,) + tuple(requests[key]) for key in keys), admission_timeout),
+                           timeout=timeout)
+        return dict(zip(keys, results))
+
+    def fetch_ohlcv_many(self, requests: Iterable[Tuple[str, str, int]], admission_timeout: Optional[float] = None,
+                         timeout: Optional[float] = None) -> Dict[Tuple[str, str], Any]:
+        """[(symbol, timeframe, limit), ...] → {(symbol, timeframe): OHLCV 행 또는 예외}"""
+        return self.fetch_many('fetch_ohlcv', {(symbol, timeframe): ((symbol, timeframe), {'limit': limit})
+                                               for symbol, timeframe, limit in requests},
+                               admission_timeout=admission_timeout, timeout=timeout)
+
+    def fetch_positions_many(self, symbols: Iterable[str], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Symbol별 fetch_positions([symbol]) 동시 요청 → {symbol: Position 목록 또는 예외}"""
+        return self.fetch_many('fetch_positions', {symbol: (([symbol],), {}) for symbol in symbols}, timeout=timeout)
+
+    def get_stats(self) -> dict:
+        return {**self.stats, 'running': self.is_running}
+
+
+class SyncExchangeFacade:
+    """
+    비동기 거래소를 동기 ccxt처럼 호출하는 얇은 래퍼
+
+    facade.fetch_tickers() → 루프에서 await exchange.fetch_tickers() 후 결과 반환.
+    코루틴이 아닌 속성 (markets, id 등)은 그대로 반환합니다.
+    """
+
+    def __init__(self, runtime: AsyncExchangeRuntime):
+        self._runtime = runtime
+
+    def __getattr__(self, name: str):
+        exchange = self._runtime.exchange
+        if exchange is None:
+            raise AttributeError(name)
+        attr = getattr(exchange, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            return self._runtime.run(self._runtime.call(name, *args, **kwargs))
+        call.__name__ = name
+        return call
+
+
+class AsyncScanScheduler:
+    """
+    이벤트 루프 위 주기 작업 스케줄러 (스캔 / Position 모니터)
+
+    - 작업별 고정 주기 (이전 Execute이 주기를 넘기면 다음 Execute은 즉시, 밀린 times수는 overruns로 집계)
+    - 같은 작업은 겹쳐 Execute되지 않음
+    - 코루틴 작업은 루프에서 직접, 동기 작업은 전용 워커 스레드 (기본 1count)에서 직렬 Execute
+      → 스캔과 모니터가 같은 전략 Status를 동시에 수정하지 않음 (Legacy 단일 루프와 동일한 순서 보장)
+    """
+
+    def __init__(self, runtime: AsyncExchangeRuntime, logger=None, sync_workers: int = 1):
+        self.runtime = runtime
+        self.logger = logger or logging.getLogger(__name__)
+        self._executor = ThreadPoolExecutor(max_workers=sync_workers, thread_name_prefix='ScanScheduler')
+        self._jobs: Dict[str, Tuple[float, Callable]] = {}
+        self._tasks: Dict[str, Future] = {}
+        self._stop = threading.Event()
+        self.stats: Dict[str, dict] = {}
+
+    def every(self, name: str, interval: float, job: Callable):
+        """주기 작업 등록 (start 이후 등록하면 즉시 Starting)"""
+        self._jobs[name] = (interval, job)
+        self.stats[name] = {'runs': 0, 'errors': 0, 'overruns': 0, 'last_duration': 0.0, 'max_duration': 0.0}
+        if self._tasks:
+            self._tasks[name] = self.runtime.submit(self._job_loop(name, interval, job))
+
+    def start(self):
+        self._stop.clear()
+        for name, (interval, job) in self._jobs.items():
+            if name not in self._tasks:
+                self._tasks[name] = self.runtime.submit(self._job_loop(name, interval, job))
+        self.logger.info(f"⏱️ 스케줄러 Starting: " +
+                         ", ".join(f"{name} {interval:g}초" for name, (interval, _) in self._jobs.items()))
+
+    def stop(self, timeout: float = 30):
+        """등록 작업 Terminate (Execute 중인 동기 작업은 끝날 때까지 대기)"""
+        self._stop.set()
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+        self._executor.shutdown(wait=True)
+
+    def run_forever(self):
+        """stop() 또는 KeyboardInterrupt까지 호출 스레드 대기"""
+        while not self._stop.wait(1.0):
+            pass
+
+    async def _job_loop(self, name: str, interval: float, job: Callable):
+        loop = asyncio.get_running_loop()
+        stats = self.stats[name]
+        next_run = loop.time()
+        while not self._stop.is_set():
+            started = time.perf_counter()
+            try:
+                if inspect.iscoroutinefunction(job):
+                    await job()
+                else:
+                    await loop.run_in_executor(self._executor, job)
+                stats['runs'] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                stats['errors'] += 1
+                self.logger.error(f"❌ 스케줄 작업 Failed ({name}): {e}")
+            duration = time.perf_counter() - started
+            stats['last_duration'] = duration
+            stats['max_duration'] = max(stats['max_duration'], duration)
+
+            next_run += interval
+            now = loop.time()
+            if next_run < now:
+                stats['overruns'] += int((now - next_run) // interval) + 1
+                next_run = now
+            await asyncio.sleep(next_run - now)
+
+    def get_stats(self) -> Dict[str, dict]:
+        return {name: dict(stats) for name, stats in self.stats.items()}
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""
+비동기 거래소 런타임 / 스캔 스케줄러 Verification (가짜 async 거래소, 네트워크 없음)
+
+점검 항목:
+1. 다중화: 요청 N count를 지연 Latency 1times 수준에 처리, 요청마다 스레드를 만들지 않음, 동시 요청 상한 준수
+2. fetch_ohlcv_many: (symbol, timeframe)별 결과, 일부 Failed는 예외 객체로 반환 (나머지 결과 유지)
+3. Rate Limiter: 모든 요청 전송 계층 승인 (weight 누적), budget 소진 시 ADMISSION_TIMEOUT=0 요청은 즉시 RateLimitExceeded,
+   공유 budget (SQLite) 대기 중에도 이벤트 루프는 계속 Progress
+4. SyncExchangeFacade: 동기 호출 방식 그대로 결과 반환, 비코루틴 속성 통과
+5. 스케줄러: 고정 주기, 같은 작업 겹침 없음, 동기 작업 직렬 Execute, 주기 초과 집계
+
+Usage:
+    python async_runtime_check.py [--requests 200] [--latency 0.2]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from async_exchange_runtime import AsyncExchangeRuntime, AsyncScanScheduler
+from binance_rate_limiter import BinanceRateLimiter
+from shared_rate_budget import SharedRateBudget
+
+
+class FakeAsyncExchange:
+    """ccxt.async_support 거래소와 같은 fetch / on_rest_response 경로를 타는 가짜 거래소 (지연 응답)"""
+
+    id = 'fakebinance'
+    BASE_URL = 'https://fapi.binance.com'
+
+    def __init__(self, config: dict):
+        self.latency = config.get('latency', 0.1)
+        self.fail_symbols = set(config.get('fail_symbols', ()))
+        self.markets = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+        self.threads = set()
+        self.closed = False
+
+    def set_markets(self, markets, currencies=None):
+        self.markets = markets
+
+    async def fetch(self, url, method='GET', headers=None, body=None):
+        self.requests += 1
+        self.threads.add(threading.get_ident())
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        self.on_rest_response(200, 'OK', url, method, {}, '', headers, body)
+        return url
+
+    def on_rest_response(self, code, reason, url, method, response_headers, response_body, request_headers,
+                         request_body):
+        return response_body
+
+    async def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None):
+        await self.fetch(f"{self.BASE_URL}/fapi/v1/klines?symbol={symbol.replace('/', '')}&interval={timeframe}"
+                         f"&limit={limit}")
+        if symbol in self.fail_symbols:
+            raise Exception(f"HTTP 400 {symbol}")
+        return [[i * 60_000, 1.0, 2.0, 0.5, 1.5, 10.0] for i in range(limit)]
+
+    async def fetch_tickers(self, symbols=None):
+        await self.fetch(f"{self.BASE_URL}/fapi/v1/ticker/24hr")
+        return {'BTC/USDT:USDT': {'last': 100.0}}
+
+    async def close(self):
+        self.closed = True
+
+
+def check(results: list, name: str, passed: bool, detail: str = ''):
+    results.append(passed)
+    print(f"  {'✅' if passed else '❌'} {name}" + (f" - {detail}" if detail else ''))
+
+
+def make_runtime(logger, limiter, max_concurrency: int = 200, **config) -> AsyncExchangeRuntime:
+    return AsyncExchangeRuntime(config, limiter=limiter, logger=logger, max_concurrency=max_concurrency,
+                                exchange_factory=FakeAsyncExchange).start()
+
+
+def check_multiplexing(results: list, logger, requests: int, latency: float):
+    print(f"\n[1] 다중화 ({requests}count 요청, 지연 {latency * 1000:.0f}ms)")
+    runtime = make_runtime(logger, BinanceRateLimiter(logger), latency=latency)
+    threads_before = threading.active_count()
+    try:
+        started = time.time()
+        results_map = runtime.fetch_ohlcv_many([(f"S{i}/USDT:USDT", '1m', 5) for i in range(requests)], timeout=30)
+        elapsed = time.time() - started
+        exchange = runtime.exchange
+        check(results, "지연 1times 수준에 Complete", elapsed < latency * 5,
+              f"{elapsed * 1000:.0f}ms (순차 {requests * latency:.1f}s)")
+        check(results, "동시 in-flight", exchange.max_in_flight == requests and len(results_map) == requests,
+              f"최대 {exchange.max_in_flight}")
+        check(results, "요청당 스레드 없음 (루프 스레드 1count)",
+              len(exchange.threads) == 1 and threading.active_count() == threads_before,
+              f"요청 스레드 {len(exchange.threads)}count, 전체 {threading.active_count()}count")
+    finally:
+        runtime.stop()
+    check(results, "stop 시 거래소 close", exchange.closed and not runtime.is_running)
+
+    runtime = make_runtime(logger, BinanceRateLimiter(logger), max_concurrency=10, latency=latency / 4)
+    try:
+        runtime.fetch_ohlcv_many([(f"S{i}/USDT:USDT", '1m', 5) for i in range(50)], timeout=30)
+        check(results, "동시 요청 상한 (max_concurrency=10)", runtime.exchange.max_in_flight == 10,
+              f"최대 {runtime.exchange.max_in_flight}")
+    finally:
+        runtime.stop()
+
+
+def check_results(results: list, logger):
+    print("\n[2] fetch_ohlcv_many 결과 / 예외 전달")
+    runtime = make_runtime(logger, BinanceRateLimiter(logger), latency=0.01, fail_symbols=['BAD/USDT:USDT'])
+    try:
+        got = runtime.fetch_ohlcv_many([('AAA/USDT:USDT', '1m', 3), ('AAA/USDT:USDT', '5m', 4),
+                                        ('BAD/USDT:USDT', '1m', 3)], timeout=10)
+        check(results, "(symbol, timeframe)별 결과",
+              len(got[('AAA/USDT:USDT', '1m')]) == 3 and len(got[('AAA/USDT:USDT', '5m')]) == 4)
+        check(results, "Failed 요청은 예외 객체", isinstance(got[('BAD/USDT:USDT', '1m')], Exception),
+              f"{got[('BAD/USDT:USDT', '1m')]!r}")
+        stats = runtime.get_stats()
+        check(results, "통계", stats['calls'] == 3 and stats['errors'] == 1 and stats['in_flight'] == 0, f"{stats}")
+    finally:
+        runtime.stop()
+
+
+def check_admission(results: list, logger):
+    print("\n[3] Rate Limiter 승인")
+    limiter = BinanceRateLimiter(logger)
+    runtime = make_runtime(logger, limiter, latency=0.01)
+    try:
+        runtime.fetch_ohlcv_many([(f"S{i}/USDT:USDT", '1m', 100) for i in range(20)], timeout=10)
+        check(results, "전송 계층 승인 weight 누적", limiter.get_used_weight() >= 20, f"weight {limiter.get_used_weight()}")
+
+        limiter.record_response(200, {'X-MBX-USED-WEIGHT-1M': str(limiter.get_max_weight())})
+        requests_before = runtime.exchange.requests
+        started = time.time()
+        got = runtime.fetch_ohlcv_many([('AAA/USDT:USDT', '1m', 5)], admission_timeout=0, timeout=10)
+        elapsed = time.time() - started
+        error = got[('AAA/USDT:USDT', '1m')]
+        check(results, "budget 소진 시 ADMISSION_TIMEOUT=0 즉시 거부",
+              type(error).__name__ == 'RateLimitExceeded' and elapsed < 0.5
+              and runtime.exchange.requests == requests_before, f"{elapsed * 1000:.0f}ms, {error!r}")
+
+        async def admission(target):
+            return await target.acquire_request_async('/fapi/v1/klines', {'limit': 5}, timeout=5)
+
+        started = time.time()
+        rejected = runtime.run(admission(limiter), timeout=10)
+        check(results, "acquire_request_async: timeout 안에 budget이 돌아오지 않으면 즉시 거부",
+              rejected is False and time.time() - started < 0.5, f"{(time.time() - started) * 1000:.0f}ms")
+        fresh = BinanceRateLimiter(logger)
+        check(results, "acquire_request_async: budget 여유 시 승인", runtime.run(admission(fresh), timeout=10)
+              and fresh.get_used_weight() >= 1, f"weight {fresh.get_used_weight()}")
+
+        # 공유 budget 연결을 다른 스레드가 잡고 있는 동안 (SQLite 대기 중) 루프의 다른 코루틴은 계속 실행
+        with tempfile.TemporaryDirectory() as workdir:
+            budget = SharedRateBudget(os.path.join(workdir, 'budget.db'), logger=logger)
+            shared = BinanceRateLimiter(logger, shared_budget=budget)
+            release = threading.Event()
+            holding = threading.Event()
+
+            def hold_connection():
+                with budget._lock:
+                    holding.set()
+                    release.wait(10)
+
+            async def admission_while_blocked():
+                ticks = 0
+                task = asyncio.ensure_future(admission(shared))
+                while ticks < 30:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+                pending = not task.done()
+                release.set()
+                return ticks, pending, await task
+
+            thread = threading.Thread(target=hold_connection, daemon=True)
+            thread.start()
+            holding.wait(5)
+            started = time.time()
+            ticks, pending, admitted = runtime.run(admission_while_blocked(), timeout=10)
+            elapsed = time.time() - started
+            thread.join()
+            budget.close()
+        check(results, "공유 budget 대기 중 이벤트 루프 계속 Progress", pending and admitted and elapsed < 1.0,
+              f"대기 중 tick {ticks}times / {elapsed * 1000:.0f}ms")
+    finally:
+        runtime.stop()
+
+
+def check_facade(results: list, logger):
+    print("\n[4] SyncExchangeFacade")
+    runtime = make_runtime(logger, BinanceRateLimiter(logger), latency=0.01)
+    try:
+        tickers = runtime.sync.fetch_tickers()
+        check(results, "동기 호출 결과", tickers == {'BTC/USDT:USDT': {'last': 100.0}})
+        check(results, "비코루틴 속성 통과", runtime.sync.id == 'fakebinance')
+
+        async def nested():
+            try:
+                runtime.sync.fetch_tickers()
+            except RuntimeError:
+                return True
+            return False
+
+        check(results, "루프 스레드에서 동기 호출 거부 (교착 방지)", runtime.run(nested(), timeout=5))
+    finally:
+        runtime.stop()
+
+
+def check_scheduler(results: list, logger):
+    print("\n[5] 스케줄러")
+    runtime = make_runtime(logger, BinanceRateLimiter(logger), latency=0.01)
+    scheduler = AsyncScanScheduler(runtime, logger=logger)
+    state = {'active': 0, 'overlap': False, 'threads': set(), 'fast': [], 'slow': 0}
+
+    def enter():
+        state['active'] += 1
+        state['overlap'] |= state['active'] > 1
+        state['threads'].add(threading.get_ident())
+
+    def fast_job():
+        enter()
+        state['fast'].append(time.time())
+        time.sleep(0.01)
+        state['active'] -= 1
+
+    def slow_job():
+        enter()
+        state['slow'] += 1
+        time.sleep(0.25)
+        state['active'] -= 1
+
+    try:
+        scheduler.every('fast', 0.1, fast_job)
+        scheduler.every('slow', 0.2, slow_job)
+        scheduler.start()
+        time.sleep(1.5)
+    finally:
+        scheduler.stop()
+        runtime.stop()
+
+    stats = scheduler.get_stats()
+    check(results, "동기 작업 직렬 Execute (워커 스레드 1count, 겹침 없음)",
+          not state['overlap'] and len(state['threads']) == 1, f"스레드 {len(state['threads'])}count")
+    check(results, "주기 작업 반복 Execute", stats['fast']['runs'] >= 4 and stats['slow']['runs'] >= 3, f"{stats}")
+    check(results, "주기 초과 집계 (0.25s 작업 / 0.2s 주기)", stats['slow']['overruns'] >= 1
+          and stats['slow']['max_duration'] >= 0.25, f"overruns {stats['slow']['overruns']}")
+    count = len(state['fast'])
+    time.sleep(0.3)
+    check(results, "stop 이후 Execute 없음", len(state['fast']) == count)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='비동기 거래소 런타임 Verification')
+    parser.add_argument('--requests', type=int, default=200, help='동시 요청 수')
+    parser.add_argument('--latency', type=float, default=0.2, help='가짜 거래소 응답 지연 (초)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    logger = logging.getLogger('async_runtime_check')
+
+    results = []
+    check_multiplexing(results, logger, args.requests, args.latency)
+    check_results(results, logger)
+    check_admission(results, logger)
+    check_facade(results, logger)
+    check_scheduler(results, logger)
+
+    print()
+    if all(results):
+        print(f"✅ 전체 통과 ({len(results)} 항목)")
+    else:
+        print(f"❌ Failed {results.count(False)} / {len(results)} 항목")
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -25,6 +25,9 @@ from enum import Enum
 import ccxt
 import logging
 
+from indicators import trailing_supertrend
+from indicator_cache import get_indicator_cache
+
 class BasicExitType(Enum):
     """기본 Exit Type"""
     BB_BREAKTHROUGH = "bb_breakthrough"           # BB600 돌파 50% Exit
@@ -107,8 +110,18 @@ class BasicExitSystem:
                 self.position_states[symbol] = PositionState(symbol=symbol)
             return self.position_states[symbol]
     
-    def calculate_bollinger_bands(self, df: pd.DataFrame, period: int = 600, std: float = 2.0) -> Tuple[pd.Series, pd.Series, pd.Series]:
-        """볼린저 밴드 계산"""
+    def calculate_bollinger_bands(self, df: pd.DataFrame, period: int = 600, std: float = 2.0,
+                                  symbol: Optional[str] = None,
+                                  timeframe: Optional[str] = None) -> Tuple[pd.Series, pd.Series, pd.Series]:
+        """볼린저 밴드 계산 (symbol/timeframe 지정 시 공용 지표 Cache Usage)"""
+        if symbol is None or timeframe is None:
+            return self._compute_bollinger_bands(df, period, std)
+        return get_indicator_cache().get_or_compute(
+            symbol, timeframe, ('bollinger', period, std), df,
+            lambda: self._compute_bollinger_bands(df, period, std))
+
+    def _compute_bollinger_bands(self, df: pd.DataFrame, period: int = 600, std: float = 2.0) -> Tuple[pd.Series, pd.Series, pd.Series]:
+        """볼린저 밴드 계산 (Cache 미적용)"""
         try:
             if len(df) < period:
                 # 데이터가 부족한 경우 Current price 기준으로 임시 계산
@@ -135,8 +148,17 @@ class BasicExitSystem:
             bb_lower = bb_middle * 0.98
             return bb_upper, bb_middle, bb_lower
     
-    def calculate_supertrend(self, df: pd.DataFrame, period: int = 10, multiplier: float = 3.0) -> Tuple[pd.Series, pd.Series]:
-        """SuperTrend 계산"""
+    def calculate_supertrend(self, df: pd.DataFrame, period: int = 10, multiplier: float = 3.0,
+                             symbol: Optional[str] = None, timeframe: Optional[str] = None) -> Tuple[pd.Series, pd.Series]:
+        """SuperTrend 계산 (symbol/timeframe 지정 시 공용 지표 Cache Usage)"""
+        if symbol is None or timeframe is None:
+            return self._compute_supertrend(df, period, multiplier)
+        return get_indicator_cache().get_or_compute(
+            symbol, timeframe, ('trailing_supertrend', period, multiplier), df,
+            lambda: self._compute_supertrend(df, period, multiplier))
+
+    def _compute_supertrend(self, df: pd.DataFrame, period: int = 10, multiplier: float = 3.0) -> Tuple[pd.Series, pd.Series]:
+        """SuperTrend 계산 (Cache 미적용)"""
         try:
             if len(df) < period + 1:
                 # 데이터가 부족한 경우 Current price 기준으로 임시 계산
@@ -145,53 +167,8 @@ class BasicExitSystem:
                 trend = pd.Series([1] * len(df), index=df.index)  # 상승 트렌드로 가정
                 return supertrend, trend
             
-            # ATR 계산
-            high_low = df['high'] - df['low']
-            high_close = np.abs(df['high'] - df['close'].shift())
-            low_close = np.abs(df['low'] - df['close'].shift())
-            true_range = np.maximum(high_low, np.maximum(high_close, low_close))
-            atr = true_range.rolling(window=period).mean()
-            
-            # 기본 상한선과 하한선
-            hl2 = (df['high'] + df['low']) / 2
-            upper_band = hl2 + (multiplier * atr)
-            lower_band = hl2 - (multiplier * atr)
-            
-            # SuperTrend 계산
-            supertrend = pd.Series(index=df.index, dtype=float)
-            trend = pd.Series(index=df.index, dtype=int)
-            
-            # 초기값 Settings
-            supertrend.iloc[0] = lower_band.iloc[0]
-            trend.iloc[0] = 1
-            
-            for i in range(1, len(df)):
-                # Current 상한선/하한선 조정
-                if lower_band.iloc[i] > lower_band.iloc[i-1] or df['close'].iloc[i-1] < lower_band.iloc[i-1]:
-                    lower_band.iloc[i] = lower_band.iloc[i]
-                else:
-                    lower_band.iloc[i] = lower_band.iloc[i-1]
-                
-                if upper_band.iloc[i] < upper_band.iloc[i-1] or df['close'].iloc[i-1] > upper_band.iloc[i-1]:
-                    upper_band.iloc[i] = upper_band.iloc[i]
-                else:
-                    upper_band.iloc[i] = upper_band.iloc[i-1]
-                
-                # 트렌드 결정
-                if trend.iloc[i-1] == 1:  # 상승 트렌드
-                    if df['close'].iloc[i] <= lower_band.iloc[i]:
-                        trend.iloc[i] = -1
-                        supertrend.iloc[i] = upper_band.iloc[i]
-                    else:
-                        trend.iloc[i] = 1
-                        supertrend.iloc[i] = lower_band.iloc[i]
-                else:  # 하락 트렌드
-                    if df['close'].iloc[i] >= upper_band.iloc[i]:
-                        trend.iloc[i] = 1
-                        supertrend.iloc[i] = lower_band.iloc[i]
-                    else:
-                        trend.iloc[i] = -1
-                        supertrend.iloc[i] = upper_band.iloc[i]
+            # 추적형 SuperTrend (공용 커널)
+            supertrend, trend = trailing_supertrend(df, period, multiplier)
             
             return supertrend, trend
             
@@ -226,7 +203,7 @@ class BasicExitSystem:
                     
                     # BB600 계산
                     bb_upper, bb_middle, bb_lower = self.calculate_bollinger_bands(
-                        df, bb_config['bb_period'], bb_config['bb_std']
+                        df, bb_config['bb_period'], bb_config['bb_std'], symbol=symbol, timeframe=timeframe
                     )
                     
                     # Current price가 BB600 상단선 돌파했는지 Confirm
@@ -291,7 +268,8 @@ class BasicExitSystem:
             
             # SuperTrend 계산 (실Time Update된 데이터 Usage)
             supertrend, trend = self.calculate_supertrend(
-                df_realtime, st_config['period'], st_config['multiplier']
+                df_realtime, st_config['period'], st_config['multiplier'],
+                symbol=symbol, timeframe=st_config['timeframe']
             )
             
             # Current 및 이전 트렌드 Confirm
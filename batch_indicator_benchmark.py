@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+스캔 지표 일괄 계산 벤치마크
+Symbol별 pandas 계산(15 스레드) vs Timeframe별 (Symbol × 캔들) 행렬 일괄 계산
+
+측정 항목:
+1. 스캔 지표 단계 wall time (analyze_symbol과 같은 3m/5m/15m/1m 프레임 Length)
+   - per-symbol: ThreadPoolExecutor(15)로 Symbol별 calculate_indicators
+   - batch: 행렬 일괄 계산 + Verification + Cache Save 후, 15 스레드가 calculate_indicators (Cache 히트)
+2. 크로스 탐지: Symbol별 find_golden_cross_vectorized vs golden_cross_matrix
+3. 결과 동일성 (모든 지표 컬럼, 허용 오차 1e-9)
+
+Usage:
+    python batch_indicator_benchmark.py [--symbols 150 400] [--repeat 3]
+"""
+
+import argparse
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from batch_indicators import compute_indicator_frames, golden_cross_matrix
+from incremental_indicator_parity import compare, frame, make_candles, make_strategy
+from indicator_cache import get_indicator_cache
+from pattern_optimizations import find_golden_cross_vectorized
+
+SCAN_TIMEFRAMES = (('3m', 250), ('5m', 100), ('15m', 400), ('1m', 100))
+CROSS_CHECKS = (('ma5', 'ma20', 10), ('ma80', 'ma480', 200), ('bb80_upper', 'bb600_upper', 120))
+
+
+def make_scan_frames(n_symbols: int) -> dict:
+    """(symbol, timeframe) -> 프레임"""
+    frames = {}
+    for i in range(n_symbols):
+        for j, (timeframe, limit) in enumerate(SCAN_TIMEFRAMES):
+            frames[(f"SYM{i}/USDT:USDT", timeframe)] = frame(make_candles(limit, i * 10 + j))
+    return frames
+
+
+def run_per_symbol(strategy, frames: dict) -> tuple:
+    """기존 방식: 15 스레드로 Symbol별 pandas 계산"""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=15) as executor:
+        futures = {key: executor.submit(strategy._compute_indicators, df.copy()) for key, df in frames.items()}
+        results = {key: future.result() for key, future in futures.items()}
+    return time.perf_counter() - start, results
+
+
+def run_batch(strategy, frames: dict) -> tuple:
+    """일괄 계산: Timeframe별 행렬 1times + Cache Save, 이후 analyze_symbol 경로(Cache 히트)"""
+    cache = get_indicator_cache()
+    cache.invalidate()
+    start = time.perf_counter()
+    for timeframe, _ in SCAN_TIMEFRAMES:
+        tf_frames = {symbol: df for (symbol, tf), df in frames.items() if tf == timeframe}
+        for symbol, df_calc in compute_indicator_frames(tf_frames).items():
+            cache.store(symbol, timeframe, 'surge_indicators', tf_frames[symbol],
+                        strategy._validate_indicator_columns(df_calc))
+    precompute = time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=15) as executor:
+        futures = {key: executor.submit(strategy.calculate_indicators, df, key[0], key[1])
+                   for key, df in frames.items()}
+        results = {key: future.result() for key, future in futures.items()}
+    return time.perf_counter() - start, precompute, results
+
+
+def bench_cross(results: dict, timeframe: str) -> tuple:
+    """크로스 탐지 Symbol별 vs 행렬 (결과 일치 여부 포함)"""
+    keys = [key for key in results if key[1] == timeframe and results[key] is not None]
+    start = time.perf_counter()
+    expected = [[find_golden_cross_vectorized(results[key], fast, slow, n) for key in keys]
+                for fast, slow, n in CROSS_CHECKS]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = []
+    for fast, slow, n in CROSS_CHECKS:
+        fast_matrix = np.stack([results[key][fast].to_numpy() for key in keys])
+        slow_matrix = np.stack([results[key][slow].to_numpy() for key in keys])
+        actual.append(golden_cross_matrix(fast_matrix, slow_matrix, n))
+    matrix_time = time.perf_counter() - start
+    same = all(np.array_equal(np.array(e, dtype=bool), a) for e, a in zip(expected, actual))
+    return loop_time, matrix_time, same
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Batch indicator scan benchmark')
+    parser.add_argument('--symbols', type=int, nargs='+', default=[150, 400])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    strategy = make_strategy()
+
+    print(f"📊 스캔 지표 단계 벤치마크 (프레임: {', '.join(f'{tf}×{n}' for tf, n in SCAN_TIMEFRAMES)})")
+    print(f"{'symbols':>8} {'per-symbol ms':>14} {'batch ms':>9} {'(matrix ms)':>12} {'speedup':>8} "
+          f"{'mismatch':>9} {'cross loop/matrix ms':>21}")
+    for n_symbols in args.symbols:
+        frames = make_scan_frames(n_symbols)
+        per_symbol_times, batch_times, precompute_times = [], [], []
+        for _ in range(args.repeat):
+            elapsed, expected = run_per_symbol(strategy, frames)
+            per_symbol_times.append(elapsed)
+            elapsed, precompute, actual = run_batch(strategy, frames)
+            batch_times.append(elapsed)
+            precompute_times.append(precompute)
+
+        mismatches = 0
+        for key, df in expected.items():
+            if (df is None) != (actual[key] is None) or (df is not None and compare(df, actual[key])):
+                mismatches += 1
+        loop_time, matrix_time, cross_same = bench_cross(actual, '3m')
+
+        per_symbol = min(per_symbol_times) * 1000
+        batch = min(batch_times) * 1000
+        print(f"{n_symbols:>8} {per_symbol:>14.0f} {batch:>9.0f} {min(precompute_times) * 1000:>12.0f} "
+              f"{per_symbol / batch:>7.1f}x {mismatches:>9} "
+              f"{loop_time * 1000:>10.0f}/{matrix_time * 1000:<6.1f}{'✅' if cross_same else '❌'}")
+
+    print(f"  cache: {get_indicator_cache().get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
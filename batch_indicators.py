@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+Batch Indicators
+스캔 대상 전체 Symbol의 지표를 Timeframe별 (Symbol × 캔들) 행렬로 한 번에 계산
+
+특징:
+- 같은 Length의 프레임을 묶어 close/high/low를 2-D NumPy 행렬로 적재
+- MA / BB: 행별 기준값 shift 후 누적합 차분 (윈도우 수와 무관하게 O(S×N))
+- 일목균형표: sliding window max/min, ATR/SuperTrend 밴드: 행렬 연산
+- SuperTrend 라인/방향: indicators.supertrend_kernel 행별 실행
+- 골든/데드크로스: 행렬 단위 탐지 (Symbol별 bool)
+- 윈도우 구성은 incremental_indicators.indicator_plan과 동일 → 배치 calculate_indicators와 일치
+
+GIL 아래에서 Symbol별 pandas 계산을 스레드로 나누는 대신, NumPy 행렬 연산 1times로 처리합니다.
+"""
+
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from indicators import supertrend_kernel
+from incremental_indicators import (
+    ICHIMOKU_BASE_WINDOW,
+    ICHIMOKU_CONVERSION_WINDOW,
+    OUTPUT_COLUMNS,
+    SUPERTREND_MULTIPLIER,
+    SUPERTREND_PERIOD,
+    attach_indicator_columns,
+    indicator_plan,
+)
+from pattern_optimizations import cross_mask
+
+_COL = {column: i for i, column in enumerate(OUTPUT_COLUMNS)}
+
+
+class _RollingSums:
+    """행렬 누적합 기반 rolling 합계 (윈도우별 재Usage)"""
+
+    def __init__(self, values: np.ndarray):
+        # 행별 평균으로 shift하여 누적합 상쇄 오차 억제
+        self.shift = values.mean(axis=1, keepdims=True)
+        deviation = values - self.shift
+        rows, cols = values.shape
+        self.c1 = np.zeros((rows, cols + 1))
+        self.c2 = np.zeros((rows, cols + 1))
+        np.cumsum(deviation, axis=1, out=self.c1[:, 1:])
+        np.cumsum(deviation * deviation, axis=1, out=self.c2[:, 1:])
+        self._cache = {}
+
+    def window(self, w: int):
+        """(s1, s2): 각 행의 [i-w+1, i] 구간 합 (i >= w-1), shape (S, N-w+1)"""
+        if w not in self._cache:
+            self._cache[w] = (self.c1[:, w:] - self.c1[:, :-w], self.c2[:, w:] - self.c2[:, :-w])
+        return self._cache[w]
+
+    def mean(self, w: int) -> np.ndarray:
+        s1, _ = self.window(w)
+        return s1 / w + self.shift
+
+    def std(self, w: int) -> np.ndarray:
+        """표본 표준편차 (ddof=1)"""
+        s1, s2 = self.window(w)
+        if w < 2:
+            return np.full(s1.shape, np.nan)
+        var = (s2 - s1 * s1 / w) / (w - 1)
+        return np.sqrt(np.maximum(var, 0.0))
+
+
+def rolling_mean_matrix(values: np.ndarray, window: int) -> np.ndarray:
+    """행별 rolling mean (앞 window-1 열은 NaN)"""
+    out = np.full(values.shape, np.nan)
+    out[:, window - 1:] = _RollingSums(values).mean(window)
+    return out
+
+
+def rolling_extreme_matrix(values: np.ndarray, window: int, is_max: bool) -> np.ndarray:
+    """행별 rolling max/min (앞 window-1 열은 NaN)"""
+    out = np.full(values.shape, np.nan)
+    view = sliding_window_view(values, window, axis=1)
+    out[:, window - 1:] = view.max(axis=2) if is_max else view.min(axis=2)
+    return out
+
+
+def true_range_matrix(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """행별 True Range (첫 열은 NaN)"""
+    tr = np.full(close.shape, np.nan)
+    prev_close = close[:, :-1]
+    h = high[:, 1:]
+    l = low[:, 1:]
+    tr[:, 1:] = np.maximum(h - l, np.maximum(np.abs(h - prev_close), np.abs(l - prev_close)))
+    return tr
+
+
+def compute_indicator_matrix(high: np.ndarray, low: np.ndarray, close: np.ndarray, plan) -> np.ndarray:
+    """
+    (Symbol × 캔들) 행렬 지표 계산
+
+    Args:
+        high, low, close: shape (S, N) float64 행렬 (NaN 없음)
+        plan: indicator_plan(N) 결과
+
+    Returns:
+        np.ndarray: shape (S, N, len(OUTPUT_COLUMNS)), 컬럼 순서는 OUTPUT_COLUMNS
+    """
+    rows, cols = close.shape
+    ma_plan, bb_plan = plan
+    result = np.full((rows, cols, len(OUTPUT_COLUMNS)), np.nan)
+    sums = _RollingSums(close)
+
+    for name, w in ma_plan:
+        result[:, w - 1:, _COL[name]] = sums.mean(w)
+    for name, w, mult in bb_plan:
+        mean = sums.mean(w)
+        std = sums.std(w)
+        result[:, w - 1:, _COL[f'{name}_upper']] = mean + std * mult
+        result[:, w - 1:, _COL[f'{name}_lower']] = mean - std * mult
+
+    for column, window in (('ichimoku_base', ICHIMOKU_BASE_WINDOW),
+                           ('ichimoku_conversion', ICHIMOKU_CONVERSION_WINDOW)):
+        result[:, :, _COL[column]] = (rolling_extreme_matrix(high, window, True)
+                                      + rolling_extreme_matrix(low, window, False)) / 2
+
+    tr = true_range_matrix(high, low, close)
+    atr = np.full(close.shape, np.nan)
+    atr[:, SUPERTREND_PERIOD:] = _RollingSums(tr[:, 1:]).mean(SUPERTREND_PERIOD)
+    hl2 = (high + low) / 2
+    upper = hl2 + SUPERTREND_MULTIPLIER * atr
+    lower = hl2 - SUPERTREND_MULTIPLIER * atr
+    result[:, :, _COL['tr']] = tr
+    result[:, :, _COL['atr']] = atr
+    result[:, :, _COL['upper_band']] = upper
+    result[:, :, _COL['lower_band']] = lower
+
+    # SuperTrend 라인/방향 (배치 정의: 10번째 행부터 Starting)
+    for row in range(rows):
+        supertrend, direction = supertrend_kernel(close[row], upper[row], lower[row], SUPERTREND_PERIOD)
+        result[row, :, _COL['supertrend']] = supertrend
+        result[row, :, _COL['supertrend_direction']] = direction
+    return result
+
+
+def golden_cross_matrix(fast: np.ndarray, slow: np.ndarray, recent_n: int) -> np.ndarray:
+    """
+    행별 최근 recent_n봉 이내 골든크로스 여부 (이전봉 fast <= slow, 다음봉 fast > slow)
+
+    pattern_optimizations.find_golden_cross_vectorized와 같은 규칙 (NaN 구간 제외)
+    """
+    return _cross_matrix(fast, slow, recent_n, golden=True)
+
+
+def dead_cross_matrix(fast: np.ndarray, slow: np.ndarray, recent_n: int) -> np.ndarray:
+    """행별 최근 recent_n봉 이내 데드크로스 여부 (이전봉 fast >= slow, 다음봉 fast < slow)"""
+    return _cross_matrix(fast, slow, recent_n, golden=False)
+
+
+def _cross_matrix(fast: np.ndarray, slow: np.ndarray, recent_n: int, golden: bool) -> np.ndarray:
+    look_back = min(recent_n, fast.shape[1])
+    if look_back < 2:
+        return np.zeros(fast.shape[0], dtype=bool)
+    return cross_mask(fast[:, -look_back:], slow[:, -look_back:], golden=golden).any(axis=1)
+
+
+def group_frames_by_length(frames: Dict[str, pd.DataFrame]) -> Dict[int, List[str]]:
+    """
+    행렬로 묶을 수 있는 프레임을 Length별로 분류
+
+    프레임 Length가 같으면 윈도우 구성도 같으므로 한 행렬로 계산합니다.
+    대체 분기가 필요한 짧은 프레임 / NaN 포함 프레임은 제외 (호출 측 Symbol별 계산).
+    """
+    groups: Dict[int, List[str]] = {}
+    for symbol, df in frames.items():
+        if df is None or indicator_plan(len(df)) is None:
+            continue
+        if any(np.isnan(df[column].to_numpy(dtype=np.float64)).any() for column in ('high', 'low', 'close')):
+            continue
+        groups.setdefault(len(df), []).append(symbol)
+    return groups
+
+
+def compute_indicator_frames(frames: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    """
+    Symbol별 프레임 → 지표가 결합된 프레임 (Length별 행렬 1times 계산 후 행 슬라이스)
+
+    Returns:
+        dict: symbol -> 지표 프레임 (행렬 계산 대상이 아닌 Symbol은 포함하지 않음)
+    """
+    results: Dict[str, pd.DataFrame] = {}
+    for length, symbols in group_frames_by_length(frames).items():
+        plan = indicator_plan(length)
+        high = np.stack([frames[s]['high'].to_numpy(dtype=np.float64) for s in symbols])
+        low = np.stack([frames[s]['low'].to_numpy(dtype=np.float64) for s in symbols])
+        close = np.stack([frames[s]['close'].to_numpy(dtype=np.float64) for s in symbols])
+        matrix = compute_indicator_matrix(high, low, close, plan)
+        for row, symbol in enumerate(symbols):
+            results[symbol] = attach_indicator_columns(frames[symbol], matrix[row])
+    return results
@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+"""
+Binance Combined Stream Client
+여러 Symbol의 스트림을 하나의 WebSocket Connections으로 다중화하는 클라이언트
+
+특징:
+- /stream?streams=a@kline_1m/b@kline_1m/... 결합 스트림 Usage (Symbol당 소켓 1count → Connections당 최대 N count 스트림)
+- Connections당 스트림 Limits(max_streams_per_connection) 단위로 자동 분할
+- 라이브 Connections에서 SUBSCRIBE / UNSUBSCRIBE 프레임으로 동적 Subscription 변경
+- Connections 끊김 시 Current Subscription 목록 그대로 자동 재Connections
+- subscribe()는 Connections/응답을 기다리지 않음 (200count Symbol Add도 즉시 반환)
+
+Message 형식 (Binance combined stream):
+    {"stream": "btcusdt@kline_1m", "data": {...}}
+    {"result": null, "id": 1}   ← SUBSCRIBE/UNSUBSCRIBE 응답
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+import websocket
+
+
+# 기본 엔드포인트 (python-binance start_kline_socket과 동일한 Spot 스트림)
+SPOT_STREAM_URL = "wss://stream.binance.com:9443"
+FUTURES_STREAM_URL = "wss://fstream.binance.com"
+
+# Connections당 스트림 수 Limits (Futures 200 / Spot 1024 → 보수적으로 200)
+DEFAULT_MAX_STREAMS_PER_CONNECTION = 200
+
+# Connections당 Client → Server Message Limits (Spot 5times/초)
+DEFAULT_MAX_FRAMES_PER_SECOND = 5
+
+
+def kline_stream_name(symbol: str, interval: str = '1m') -> str:
+    """Symbol → 결합 스트림 이름 (예: BTCUSDT → btcusdt@kline_1m)"""
+    return f"{symbol.lower()}@kline_{interval}"
+
+
+class _StreamConnection:
+    """결합 스트림 WebSocket Connections 1count (스트림 최대 max_streams_per_connection count)"""
+
+    def __init__(self, client: 'CombinedStreamClient', conn_id: int):
+        self.client = client
+        self.conn_id = conn_id
+        self.logger = client.logger
+
+        # desired: 이 Connections에 배정된 스트림 / active: Server에 실제 Subscription된 스트림
+        self.desired: Set[str] = set()
+        self.active: Set[str] = set()
+
+        self.ws: Optional[websocket.WebSocketApp] = None
+        self.thread: Optional[threading.Thread] = None
+        self.is_open = False
+        self.closed = False
+
+        self._lock = threading.Lock()
+        self._request_id = 0
+        self._last_frame_time = 0.0
+
+    @property
+    def room(self) -> int:
+        return self.client.max_streams_per_connection - len(self.desired)
+
+    def start(self):
+        """백그라운드 스레드에서 Connections 루프 Starting"""
+        self.thread = threading.Thread(
+            target=self._run,
+            name=f"combined-stream-{self.conn_id}",
+            daemon=True
+        )
+        self.thread.start()
+
+    def close(self):
+        """Connections Terminate (재Connections 안 함)"""
+        self.closed = True
+        self.is_open = False
+        ws = self.ws
+        if ws:
+            try:
+                ws.close()
+            except Exception as e:
+                self.logger.debug(f"Combined stream close error (#{self.conn_id}): {e}")
+
+    def _run(self):
+        while self.client.is_running and not self.closed:
+            with self._lock:
+                url_streams = sorted(self.desired)
+                self.active = set(url_streams)
+
+            self.ws = websocket.WebSocketApp(
+                self.client.build_url(url_streams),
+                on_open=self._on_open,
+                on_message=self._on_message,
+                on_error=self._on_error,
+                on_close=self._on_close
+            )
+            try:
+                self.ws.run_forever()
+            except Exception as e:
+                self.logger.error(f"Combined stream Error (#{self.conn_id}): {e}")
+
+            self.is_open = False
+            if not self.client.is_running or self.closed:
+                break
+
+            # 재Connections (Current desired 목록 그대로 URL에 포함)
+            self.client.reconnect_count += 1
+            self.logger.warning(f"🔄 Combined stream #{self.conn_id} Reconnecting "
+                                f"({len(self.desired)} streams, {self.client.reconnect_delay}s)")
+            time.sleep(self.client.reconnect_delay)
+
+    def _on_open(self, ws):
+        self.is_open = True
+        self.logger.debug(f"✅ Combined stream #{self.conn_id} Connected ({len(self.active)} streams)")
+        # Connections 중 Add/Remove된 스트림 반영
+        self.sync()
+
+    def _on_message(self, ws, raw):
+        try:
+            msg = json.loads(raw)
+        except ValueError:
+            self.logger.debug(f"Combined stream invalid frame (#{self.conn_id}): {raw[:100]}")
+            return
+
+        stream = msg.get('stream')
+        if stream is not None:
+            self.client.dispatch(stream, msg.get('data', {}))
+        elif 'id' in msg:
+            if msg.get('error'):
+                self.logger.error(f"❌ Combined stream request failed (#{self.conn_id}, id={msg['id']}): {msg['error']}")
+            else:
+                self.client.ack_count += 1
+
+    def _on_error(self, ws, error):
+        self.logger.debug(f"Combined stream Error (#{self.conn_id}): {error}")
+
+    def _on_close(self, ws, status_code=None, reason=None):
+        self.is_open = False
+        self.logger.debug(f"Combined stream closed (#{self.conn_id}): {status_code} {reason}")
+
+    def sync(self):
+        """desired와 active 차이를 SUBSCRIBE / UNSUBSCRIBE 프레임으로 전송"""
+        with self._lock:
+            if not self.is_open or self.ws is None:
+                return  # 아직 Connections 전 → _on_open에서 반영
+
+            to_add = sorted(self.desired - self.active)
+            to_remove = sorted(self.active - self.desired)
+            try:
+                if to_remove:
+                    self._send('UNSUBSCRIBE', to_remove)
+                    self.active.difference_update(to_remove)
+                if to_add:
+                    self._send('SUBSCRIBE', to_add)
+                    self.active.update(to_add)
+            except Exception as e:
+                # 전송 Failed → 재Connections 시 URL로 전체 재Subscription
+                self.logger.warning(f"Combined stream frame send failed (#{self.conn_id}): {e}")
+
+    def _send(self, method: str, params: List[str]):
+        # Connections당 Message Limits 준수 (초당 max_frames_per_second)
+        interval = 1.0 / self.client.max_frames_per_second
+        wait = self._last_frame_time + interval - time.time()
+        if wait > 0:
+            time.sleep(wait)
+
+        self._request_id += 1
+        self.ws.send(json.dumps({'method': method, 'params': params, 'id': self._request_id}))
+        self._last_frame_time = time.time()
+        self.client.frame_count += 1
+
+
+class CombinedStreamClient:
+    """Binance 결합 스트림 다중화 클라이언트"""
+
+    def __init__(self, on_message: Callable[[str, dict], None], logger: Optional[logging.Logger] = None,
+                 base_url: str = SPOT_STREAM_URL,
+                 max_streams_per_connection: int = DEFAULT_MAX_STREAMS_PER_CONNECTION,
+                 max_frames_per_second: float = DEFAULT_MAX_FRAMES_PER_SECOND,
+                 reconnect_delay: float = 2.0):
+        """
+        Args:
+            on_message: 스트림 Message Callback (stream_name, data)
+            logger: 로깅 객체
+            base_url: WebSocket 엔드포인트 (SPOT_STREAM_URL / FUTURES_STREAM_URL / 로컬 Test Server)
+            max_streams_per_connection: Connections당 최대 스트림 수
+            max_frames_per_second: Connections당 초당 최대 SUBSCRIBE/UNSUBSCRIBE 프레임 수
+            reconnect_delay: 재Connections 대기 (초)
+        """
+        if max_streams_per_connection <= 0:
+            raise ValueError(f"max_streams_per_connection must be positive: {max_streams_per_connection}")
+
+        self.on_message = on_message
+        self.logger = logger or logging.getLogger(__name__)
+        self.base_url = base_url.rstrip('/')
+        self.max_streams_per_connection = max_streams_per_connection
+        self.max_frames_per_second = max_frames_per_second
+        self.reconnect_delay = reconnect_delay
+
+        self.is_running = False
+        self._connections: List[_StreamConnection] = []
+        self._stream_owner: Dict[str, _StreamConnection] = {}  # stream -> Connections
+        self._next_conn_id = 0
+        self._lock = threading.Lock()  # Connections/스트림 배정 전용
+
+        # 통계
+        self.message_count = 0
+        self.frame_count = 0
+        self.ack_count = 0
+        self.reconnect_count = 0
+
+    def build_url(self, streams: Iterable[str]) -> str:
+        """결합 스트림 URL Create"""
+        return f"{self.base_url}/stream?streams={'/'.join(streams)}"
+
+    @property
+    def streams(self) -> Set[str]:
+        with self._lock:
+            return set(self._stream_owner)
+
+    @property
+    def connection_count(self) -> int:
+        return len(self._connections)
+
+    @property
+    def is_connected(self) -> bool:
+        """모든 Connections이 열려 있는지 (Connections이 없으면 True)"""
+        return self.is_running and all(conn.is_open for conn in self._connections)
+
+    def start(self):
+        self.is_running = True
+
+    def stop(self):
+        """모든 Connections Terminate"""
+        self.is_running = False
+        with self._lock:
+            connections = list(self._connections)
+            self._connections.clear()
+            self._stream_owner.clear()
+        for conn in connections:
+            conn.close()
+
+    def wait_connected(self, timeout: float = 10.0) -> bool:
+        """모든 Connections이 열릴 때까지 대기"""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if self.is_connected:
+                return True
+            time.sleep(0.01)
+        return self.is_connected
+
+    def dispatch(self, stream: str, data: dict):
+        self.message_count += 1
+        try:
+            self.on_message(stream, data)
+        except Exception as e:
+            self.logger.error(f"Combined stream callback error ({stream}): {e}")
+
+    def subscribe(self, streams: Iterable[str]) -> List[str]:
+        """
+        스트림 Add (Connections 여유분부터 채우고 부족하면 New Connections)
+
+        Returns:
+            list: 새로 Add된 스트림 (이미 Subscription 중인 스트림 Excluded)
+        """
+        if not self.is_running:
+            raise RuntimeError("CombinedStreamClient not started")
+
+        added = []
+        touched: List[_StreamConnection] = []
+        new_connections: List[_StreamConnection] = []
+
+        with self._lock:
+            pending = [s for s in dict.fromkeys(streams) if s not in self._stream_owner]
+            for conn in self._connections:
+                if not pending:
+                    break
+                take = conn.room
+                if take <= 0:
+                    continue
+                chunk, pending = pending[:take], pending[take:]
+                self._assign(conn, chunk)
+                touched.append(conn)
+                added.extend(chunk)
+
+            while pending:
+                conn = _StreamConnection(self, self._next_conn_id)
+                self._next_conn_id += 1
+                chunk = pending[:self.max_streams_per_connection]
+                pending = pending[self.max_streams_per_connection:]
+                self._assign(conn, chunk)
+                self._connections.append(conn)
+                new_connections.append(conn)
+                added.extend(chunk)
+
+        # lock 밖에서 프레임 전송 / Connections Starting
+        for conn in touched:
+            conn.sync()
+        for conn in new_connections:
+            conn.start()
+
+        if added:
+            self.logger.debug(f"Combined stream subscribe: +{len(added)} "
+                              f"(total {len(self._stream_owner)}, connections {len(self._connections)})")
+        return added
+
+    def unsubscribe(self, streams: Iterable[str]) -> List[str]:
+        """
+        스트림 Remove (비게 된 Connections은 Terminate)
+
+        Returns:
+            list: 실제로 Remove된 스트림
+        """
+        removed = []
+        touched: Dict[int, _StreamConnection] = {}
+        emptied: List[_StreamConnection] = []
+
+        with self._lock:
+            for stream in dict.fromkeys(streams):
+                conn = self._stream_owner.pop(stream, None)
+                if conn is None:
+                    continue
+                with conn._lock:
+                    conn.desired.discard(stream)
+                touched[conn.conn_id] = conn
+                removed.append(stream)
+
+            for conn in touched.values():
+                if not conn.desired:
+                    self._connections.remove(conn)
+                    emptied.append(conn)
+
+        for conn in emptied:
+            touched.pop(conn.conn_id, None)
+            conn.close()
+        for conn in touched.values():
+            conn.sync()
+
+        return removed
+
+    def _assign(self, conn: _StreamConnection, streams: List[str]):
+        with conn._lock:
+            conn.desired.update(streams)
+        for stream in streams:
+            self._stream_owner[stream] = conn
+
+    def get_stats(self) -> dict:
+        return {
+            'is_running': self.is_running,
+            'connections': len(self._connections),
+            'open_connections': sum(1 for conn in self._connections if conn.is_open),
+            'streams': len(self._stream_owner),
+            'messages': self.message_count,
+            'frames_sent': self.frame_count,
+            'acks': self.ack_count,
+            'reconnects': self.reconnect_count
+        }
@@ -3,73 +3,411 @@
 Binance API Rate Limiter
 완전한 바이낸스 API 율제한 관리 시스템
 
-Rate Limits:
-- IP 기준: 1per minute 1200 요청 (weight 곱셈 적용)
-- UID 기준: 독립적 관리
+Rate Limits (USDⓈ-M 선물):
+- IP 기준: 1분 2400 weight (X-MBX-USED-WEIGHT-1M) - 로컬 budget 2000으로 여유 확보
+- 주문 count: 10초 300 / 1분 1200 (X-MBX-ORDER-COUNT-10S / -1M)
 - 429 Response: 백오프 의무화
 - 418 Response: IP 차단 (2분~3일)
 
 Features:
-- 요청 weight 자동 추적
-- 429/418 자동 감지 및 백오프
-- Retry-After 헤더 Process
-- 지수 백오프 시스템
-- 캐싱 최적화
+- 프로세스 전체 공용 Limiter (get_rate_limiter) - 전략/DCA/RateLimitedExchange가 같은 budget 사용
+- 60초 슬라이딩 윈도우 (초 단위 버킷 링, 승인/기록 O(1)) + 서버 헤더 (used weight / order count) 동기화
+- 엔드포인트별 실제 weight (klines limit 구간, Symbol 미지정 티커 등)
+- 비차단 승인 (try_acquire) + 우선순위 레인: 주문 > 일반 > 벌크 (벌크는 budget 60%까지만 사용)
+- ccxt 전송 계층 훅 (install_rate_limiter) - 모든 REST 요청이 같은 budget으로 집계
+- ccxt.async_support 전송 훅 (install_async_rate_limiter) - budget 대기 중에도 이벤트 루프 차단 없음
+- 프로세스 간 공유 budget (shared_rate_budget.py, SQLite) - 같은 IP의 여러 봇이 합산 2000 weight 이내
+- 429/418 자동 감지 및 백오프, Retry-After 헤더 Process
+- 캐싱 최적화 (크기 제한 TTL-LRU, 인자 튜플 해시 키)
+- 동일 요청 병합 (SingleFlight) - 같은 거래소로 동시에 들어온 같은 조times는 한 번만 전송하고 결과 공유
 """
 
+import asyncio
+import contextvars
 import time
 import logging
 from datetime import datetime, timedelta
-from collections import deque, defaultdict
-from typing import Dict, Optional, Callable, Any
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Callable, Any, Tuple
+from urllib.parse import urlparse, parse_qsl
 import threading
 import json
 import os
+import sqlite3
+import weakref
+
+from shared_rate_budget import SharedRateBudget
+
+
+# 우선순위 레인 (값이 작을수록 우선)
+PRIORITY_ORDER = 0   # 주문 생성/Cancel/수정 - 벌크 요청 뒤에서 대기하지 않음
+PRIORITY_NORMAL = 1  # 계좌/Position/주문 조회
+PRIORITY_BULK = 2    # Klines/티커/호가 스캔
+
+# asyncio 전송 훅 승인 대기 상한 (초) - 코루틴별 지정 (None이면 install_async_rate_limiter 기본값)
+# 예: 스캔 폴백 요청은 0 → 벌크 레인이 차 있으면 대기 없이 RateLimitExceeded (동기 try_acquire와 동일)
+ADMISSION_TIMEOUT: contextvars.ContextVar = contextvars.ContextVar('admission_timeout', default=None)
+
+
+class SlidingWindowCounter:
+    """
+    초 단위 버킷 링 슬라이딩 윈도우 합계
+
+    - add / total: O(1) (시간이 지난 버킷만 정리, 초당 한 번)
+    - 버킷 window + 1count: 기록은 window초 이상 지난 뒤에 만료 (보수적)
+    """
+    __slots__ = ('window', '_size', '_counts', '_seconds', '_total', '_head')
+
+    def __init__(self, window: int = 60):
+        self.window = window
+        self._size = window + 1
+        self._counts = [0] * self._size
+        self._seconds = [-1] * self._size  # 버킷이 담당하는 epoch 초
+        self._total = 0
+        self._head = -1  # 마지막으로 정리한 초
+
+    def _advance(self, second: int):
+        if second <= self._head:
+            return
+        if second - self._head >= self._size:
+            for i in range(self._size):
+                self._counts[i] = 0
+                self._seconds[i] = -1
+            self._total = 0
+        else:
+            for sec in range(self._head + 1, second + 1):
+                i = sec % self._size
+                self._total -= self._counts[i]
+                self._counts[i] = 0
+                self._seconds[i] = sec
+        self._head = second
+
+    def add(self, now: float, amount: int):
+        self._advance(int(now))
+        # 늦게 도착한 기록 (다른 스레드의 이전 시각)은 Current 버킷에 합산
+        i = self._head % self._size
+        self._seconds[i] = self._head
+        self._counts[i] += amount
+        self._total += amount
+
+    def total(self, now: float) -> int:
+        self._advance(int(now))
+        return self._total
+
+    def expiry_wait(self, excess: float, now: float) -> float:
+        """오래된 버킷부터 만료시켜 excess만큼 확보되는 대기 Time"""
+        self._advance(int(now))
+        freed = 0
+        for sec in range(self._head - self._size + 1, self._head + 1):
+            i = sec % self._size
+            if self._seconds[i] != sec or not self._counts[i]:
+                continue
+            freed += self._counts[i]
+            if freed >= excess:
+                return max(0.0, sec + self._size - now)
+        return self.window - (now % self.window)
+
+    def clear(self):
+        self._advance(self._head + self._size)
+
+
+class TTLCache:
+    """크기 제한 TTL-LRU Cache (조times/Save O(1), 가득 차면 가장 오래 안 쓴 항목부터 Remove)"""
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Any, Tuple[Any, float]]' = OrderedDict()  # key -> (value, 만료 시각)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[1] <= time.time():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value: Any, ttl: float):
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return self.get(key) is not None
+
+
+class _Flight:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    동일 요청 병합 (single-flight)
+
+    같은 key로 진행 중인 호출이 있으면 새로 보내지 않고 그 결과 (또는 예외)를 함께 받는다.
+    병합된 호출은 rate budget을 쓰지 않는다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[Any, _Flight] = {}
+        self._stats = defaultdict(lambda: {'calls': 0, 'executed': 0, 'coalesced': 0, 'errors': 0})
+        _single_flights.add(self)
+
+    def do(self, key, fn: Callable[[], Any], name: str = 'default'):
+        with self._lock:
+            stats = self._stats[name]
+            stats['calls'] += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                stats['executed'] += 1
+            else:
+                stats['coalesced'] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                stats['errors'] += 1
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    def get_stats(self) -> Dict[str, dict]:
+        """method별 calls / executed (실제 전송) / coalesced (병합) / errors"""
+        with self._lock:
+            return {name: dict(stats) for name, stats in self._stats.items()}
+
+
+# 생성된 SingleFlight 전체 (get_status 집계용)
+_single_flights: 'weakref.WeakSet[SingleFlight]' = weakref.WeakSet()
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight(exchange) -> SingleFlight:
+    """거래소 인스턴스별 SingleFlight (같은 거래소를 감싼 래퍼/전략이 함께 사용)"""
+    flight = getattr(exchange, '_binance_single_flight', None)
+    if flight is None:
+        with _single_flight_lock:
+            flight = getattr(exchange, '_binance_single_flight', None)
+            if flight is None:
+                flight = SingleFlight()
+                exchange._binance_single_flight = flight
+    return flight
+
+
+def single_flight_stats() -> dict:
+    """프로세스 전체 요청 병합 통계 합계"""
+    totals = {'calls': 0, 'executed': 0, 'coalesced': 0, 'errors': 0, 'in_flight': 0, 'by_method': {}}
+    for flight in list(_single_flights):
+        totals['in_flight'] += flight.in_flight()
+        for name, stats in flight.get_stats().items():
+            merged = totals['by_method'].setdefault(name, {'calls': 0, 'executed': 0, 'coalesced': 0, 'errors': 0})
+            for field, value in stats.items():
+                merged[field] += value
+                totals[field] += value
+    return totals
 
 
 class BinanceRateLimiter:
     """바이낸스 API 율제한 Admin"""
     
-    # 엔드포인트별 weight Info (주요 엔드포인트)
+    # 서버 한도 (USDⓈ-M 선물)
+    SERVER_WEIGHT_LIMIT = 2400
+    SERVER_ORDER_LIMIT_10S = 300
+    SERVER_ORDER_LIMIT_1M = 1200
+    
+    # 레인별 사용 가능한 budget 비율 - 벌크가 60%를 채워도 주문/일반 레인 여유분은 남음
+    LANE_CAPS = {
+        PRIORITY_ORDER: 1.0,
+        PRIORITY_NORMAL: 0.8,
+        PRIORITY_BULK: 0.6,
+    }
+    
+    # 추적 대상 경로 (선물 IP 한도) - 현물 /api/, /sapi/ 는 서버 한도가 별도라 제외
+    TRACKED_PATH_PREFIXES = ('/fapi/',)
+    
+    # 엔드포인트별 weight Info (고정 weight)
     ENDPOINT_WEIGHTS = {
-        # 티커 관련
-        '/fapi/v1/ticker/24hr': 1,  # count별 Symbol
-        '/fapi/v2/ticker/24hr': 40,  # 모든 Symbol
-        '/fapi/v1/ticker/price': 1,  # count별 Symbol
-        '/fapi/v2/ticker/price': 2,  # 모든 Symbol
-        
-        # OHLCV 관련
-        '/fapi/v1/klines': 1,  # 기본 weight
-        '/fapi/v1/continuousKlines': 1,
+        # 마켓 Info
+        '/fapi/v1/ping': 1,
+        '/fapi/v1/time': 1,
+        '/fapi/v1/exchangeInfo': 1,
+        '/fapi/v1/trades': 5,
+        '/fapi/v1/historicalTrades': 20,
+        '/fapi/v1/aggTrades': 20,
+        '/fapi/v1/fundingRate': 1,
+        '/fapi/v1/openInterest': 1,
         
         # 계좌 Info
         '/fapi/v2/account': 5,
+        '/fapi/v3/account': 5,
+        '/fapi/v2/balance': 5,
+        '/fapi/v3/balance': 5,
         '/fapi/v2/positionRisk': 5,
-        '/fapi/v1/openOrders': 1,
+        '/fapi/v3/positionRisk': 5,
+        '/fapi/v1/userTrades': 5,
+        '/fapi/v1/income': 30,
+        '/fapi/v1/commissionRate': 20,
+        '/fapi/v1/positionSide/dual': 30,
+        '/fapi/v1/leverage': 1,
+        '/fapi/v1/marginType': 1,
+        '/fapi/v1/listenKey': 1,
         
         # 주문 관련
-        '/fapi/v1/order': 1,  # GET/POST/DELETE
+        '/fapi/v1/order': 1,  # GET/PUT/DELETE (POST는 METHOD_WEIGHTS)
+        '/fapi/v1/batchOrders': 5,
         '/fapi/v1/allOpenOrders': 1,  # 특정 Symbol
         '/fapi/v1/openOrder': 1,
+        '/fapi/v1/allOrders': 5,
         
         # 기본값
         'default': 1
     }
     
-    def __init__(self, logger=None):
+    # Method에 따라 weight가 다른 엔드포인트
+    METHOD_WEIGHTS = {
+        ('POST', '/fapi/v1/order'): 0,  # 신규 주문은 IP weight 0 (주문 count만 차감)
+    }
+    
+    # Symbol 지정 여부에 따라 weight가 다른 엔드포인트 (지정, 미지정)
+    SYMBOL_OPTIONAL_WEIGHTS = {
+        '/fapi/v1/ticker/24hr': (1, 40),
+        '/fapi/v1/ticker/price': (1, 2),
+        '/fapi/v2/ticker/price': (1, 2),
+        '/fapi/v1/ticker/bookTicker': (2, 5),
+        '/fapi/v1/premiumIndex': (1, 10),
+        '/fapi/v1/openOrders': (1, 40),
+    }
+    
+    # limit 구간별 weight ((limit 상한 이하, weight), ...) - 상한 Exceeded시 마지막 weight
+    KLINE_ENDPOINTS = (
+        '/fapi/v1/klines',
+        '/fapi/v1/continuousKlines',
+        '/fapi/v1/indexPriceKlines',
+        '/fapi/v1/markPriceKlines',
+        '/fapi/v1/premiumIndexKlines',
+    )
+    KLINE_LIMIT_WEIGHTS = ((99, 1), (499, 2), (1000, 5), (None, 10))
+    DEPTH_LIMIT_WEIGHTS = ((50, 2), (100, 5), (500, 10), (None, 20))
+    
+    # 주문 count에 반영되는 요청 (method, 경로): 주문 count
+    ORDER_COUNT_ENDPOINTS = {
+        ('POST', '/fapi/v1/order'): 1,
+        ('PUT', '/fapi/v1/order'): 1,
+        ('POST', '/fapi/v1/batchOrders'): 5,
+        ('PUT', '/fapi/v1/batchOrders'): 5,
+    }
+    
+    # 주문 레인 경로 (GET 이외 method)
+    ORDER_PATHS = (
+        '/fapi/v1/order',
+        '/fapi/v1/batchOrders',
+        '/fapi/v1/allOpenOrders',
+        '/fapi/v1/countdownCancelAll',
+    )
+    
+    # 벌크 레인 경로 (스캔용 시세 조회)
+    BULK_PATHS = KLINE_ENDPOINTS + (
+        '/fapi/v1/ticker/24hr',
+        '/fapi/v1/ticker/price',
+        '/fapi/v2/ticker/price',
+        '/fapi/v1/ticker/bookTicker',
+        '/fapi/v1/premiumIndex',
+        '/fapi/v1/depth',
+        '/fapi/v1/trades',
+        '/fapi/v1/aggTrades',
+        '/fapi/v1/fundingRate',
+        '/fapi/v1/openInterest',
+    )
+    
+    # try_acquire로 선결제한 weight가 전송 훅에서 차감되기까지 유효 Time (초)
+    PREPAID_TTL = 10.0
+    
+    # 주문 레인의 공유 budget (SQLite) 대기 상한 (초) - 초과 시 로컬 윈도우로 승인 (주문은 DB 락 뒤에서 대기하지 않음)
+    SHARED_ORDER_TIMEOUT = 0.05
+    
+    def __init__(self, logger=None, shared_budget: SharedRateBudget = None):
         self.logger = logger or logging.getLogger(__name__)
         
+        # 프로세스 간 공유 budget (None = 이 프로세스 안에서만 집계)
+        self._shared_budget = shared_budget
+        self._shared_error_time = 0.0
+        self._shared_fallbacks = 0        # 주문 레인 공유 budget 대기 초과 → 로컬 승인 횟수
+        self._shared_deferred = [0, 0]    # 공유 budget에 아직 기록하지 못한 (weight, 주문 count)
+        self._async_executors: Dict[int, ThreadPoolExecutor] = {}  # asyncio 승인용 레인별 스레드
+        
         # Rate limit status
         self._rate_limited = False
         self._ban_until = None  # IP 차단 Release Time
         self._last_429_time = None
         self._retry_after = 0
         
-        # 요청 기록 (1분 윈도우) - 더 엄격한 제한
-        self._request_times = deque()
-        self._weight_history = deque()
-        self._current_weight = 0
-        self._max_weight_per_minute = 1000  # 1200 → 1000으로 더 보수적 설정
+        # 요청 기록 (60초 슬라이딩 윈도우, 초 단위 버킷 링)
+        self._weight_window = SlidingWindowCounter(60)
+        self._request_window = SlidingWindowCounter(60)
+        self._max_weight_per_minute = 2000  # 서버 2400 중 2000만 사용 (여유 확보)
+        
+        # 주문 count 기록 - 10초/1분 윈도우
+        self._orders_10s_window = SlidingWindowCounter(10)
+        self._orders_1m_window = SlidingWindowCounter(60)
+        self._max_orders_10s = 250
+        self._max_orders_1m = 1000
+        
+        # 서버 헤더 기준 사용량 (헤더 수신 이후 로컬에서 추가된 분량 포함)
+        self._server_weight = 0
+        self._server_weight_time = 0.0
+        self._weight_since_server = 0
+        self._server_orders_10s = 0
+        self._server_orders_10s_time = 0.0
+        self._orders_since_10s = 0
+        self._server_orders_1m = 0
+        self._server_orders_1m_time = 0.0
+        self._orders_since_1m = 0
+        
+        # try_acquire 선결제 (스레드별) - 전송 훅 이중 차감 방지
+        self._prepaid = threading.local()
+        
+        # 레인별 승인/거부 통계
+        self._lane_stats = {lane: {'admitted': 0, 'rejected': 0} for lane in self.LANE_CAPS}
         
         # 백오프 관리
         self._consecutive_429s = 0
@@ -82,9 +420,8 @@ class BinanceRateLimiter:
         self._error_stats = defaultdict(int)
         self._last_reset = time.time()
         
-        # Cache 관리
-        self._response_cache = {}
-        self._cache_ttl = {}
+        # Cache 관리 (크기 제한 TTL-LRU)
+        self._response_cache = TTLCache(max_entries=1000)
         
         # Status Save/Load
         self._state_file = 'binance_rate_limiter_state.json'
@@ -92,56 +429,162 @@ class BinanceRateLimiter:
         
         self.logger.info("🛡️ Binance Rate Limiter Initialization complete")
     
-    def _get_endpoint_weight(self, endpoint_path: str, params: dict = None) -> int:
-        """엔드포인트별 요청 weight 계산"""
-        # 파라미터 기반 weight 조정
-        weight = self.ENDPOINT_WEIGHTS.get(endpoint_path, self.ENDPOINT_WEIGHTS['default'])
+    # ------------------------------------------------------------------
+    # 엔드포인트 분류
+    # ------------------------------------------------------------------
+    
+    @classmethod
+    def is_tracked(cls, endpoint_path: str) -> bool:
+        """선물 IP budget에 집계되는 경로인지 여부"""
+        return endpoint_path.startswith(cls.TRACKED_PATH_PREFIXES)
+    
+    @classmethod
+    def priority_for(cls, endpoint_path: str, method: str = 'GET') -> int:
+        """경로/method 기준 기본 우선순위 레인"""
+        if method.upper() != 'GET' and endpoint_path in cls.ORDER_PATHS:
+            return PRIORITY_ORDER
+        if endpoint_path in cls.BULK_PATHS:
+            return PRIORITY_BULK
+        return PRIORITY_NORMAL
+    
+    @staticmethod
+    def _limit_weight(limit, table) -> int:
+        for upper, weight in table:
+            if upper is None or limit <= upper:
+                return weight
+        return table[-1][1]
+    
+    def _get_endpoint_weight(self, endpoint_path: str, params: dict = None, method: str = 'GET') -> int:
+        """엔드포인트별 요청 weight 계산 (바이낸스 선물 문서 기준)"""
+        params = params or {}
+        method = method.upper()
+        
+        if (method, endpoint_path) in self.METHOD_WEIGHTS:
+            return self.METHOD_WEIGHTS[(method, endpoint_path)]
         
-        # klines는 limit 기반으로 weight 조정
-        if '/klines' in endpoint_path and params:
-            limit = params.get('limit', 500)
-            # limit에 따른 weight 증가
-            if limit > 1000:
-                weight = 2
-            elif limit > 500:
-                weight = 1
+        # klines / depth는 limit 구간별 weight
+        if endpoint_path in self.KLINE_ENDPOINTS:
+            return self._limit_weight(int(params.get('limit') or 500), self.KLINE_LIMIT_WEIGHTS)
+        if endpoint_path == '/fapi/v1/depth':
+            return self._limit_weight(int(params.get('limit') or 500), self.DEPTH_LIMIT_WEIGHTS)
         
-        # 모든 Symbol 조times는 높은 weight
-        if params and not params.get('symbol'):
-            weight *= 20  # 전체 Symbol 조times 패널티
+        # Symbol 미지정 (전체 Symbol 조times)은 높은 weight
+        if endpoint_path in self.SYMBOL_OPTIONAL_WEIGHTS:
+            with_symbol, without_symbol = self.SYMBOL_OPTIONAL_WEIGHTS[endpoint_path]
+            return with_symbol if params.get('symbol') else without_symbol
         
-        return weight
+        return self.ENDPOINT_WEIGHTS.get(endpoint_path, self.ENDPOINT_WEIGHTS['default'])
     
-    def _clean_old_requests(self):
-        """1분 이전 요청 기록 정리"""
-        current_time = time.time()
-        cutoff_time = current_time - 60
+    def _get_order_count(self, endpoint_path: str, method: str = 'GET') -> int:
+        """주문 count 한도에 반영되는 count수"""
+        return self.ORDER_COUNT_ENDPOINTS.get((method.upper(), endpoint_path), 0)
+    
+    # ------------------------------------------------------------------
+    # 윈도우 / 서버 헤더 동기화
+    # ------------------------------------------------------------------
+    
+    @property
+    def _current_weight(self) -> int:
+        """최근 60초 로컬 weight 합계"""
+        return self._weight_window.total(time.time())
+    
+    def _used_weight_locked(self, now: float) -> int:
+        """사용 weight = max(로컬 슬라이딩 합계, 서버 헤더 + 이후 로컬 추가분)"""
+        used = self._weight_window.total(now)
+        # 서버는 분 단위 고정 윈도우 - 같은 분일 때만 헤더 값 유효
+        if self._server_weight_time and int(now // 60) == int(self._server_weight_time // 60):
+            used = max(used, self._server_weight + self._weight_since_server)
+        return used
+    
+    def _order_counts_locked(self, now: float) -> Tuple[int, int]:
+        """(10초 주문 count, 1분 주문 count)"""
+        orders_10s = self._orders_10s_window.total(now)
+        orders_1m = self._orders_1m_window.total(now)
+        if self._server_orders_10s_time and int(now // 10) == int(self._server_orders_10s_time // 10):
+            orders_10s = max(orders_10s, self._server_orders_10s + self._orders_since_10s)
+        if self._server_orders_1m_time and int(now // 60) == int(self._server_orders_1m_time // 60):
+            orders_1m = max(orders_1m, self._server_orders_1m + self._orders_since_1m)
+        return orders_10s, orders_1m
+    
+    def _reconcile_headers(self, response_headers: dict, now: float) -> Dict[str, int]:
+        """
+        Response 헤더의 서버 사용량으로 로컬 추정치 보정
+
+        Returns:
+            dict: 공유 budget에 게시할 서버 사용량 (self._lock 밖에서 _publish_server_usage)
+        """
+        used = response_headers.get('x-mbx-used-weight-1m')
+        if used is not None:
+            server_weight = int(used)
+            local_weight = self._current_weight
+            if abs(local_weight - server_weight) > 100:
+                self.logger.debug(f"weight Sync: 로컬({local_weight}) vs 서버({server_weight})")
+            self._server_weight = server_weight
+            self._server_weight_time = now
+            self._weight_since_server = 0
+        
+        orders_10s = response_headers.get('x-mbx-order-count-10s')
+        if orders_10s is not None:
+            self._server_orders_10s = int(orders_10s)
+            self._server_orders_10s_time = now
+            self._orders_since_10s = 0
         
-        # 오래된 요청 Remove
-        while self._request_times and self._request_times[0] < cutoff_time:
-            self._request_times.popleft()
-            if self._weight_history:
-                self._weight_history.popleft()
+        orders_1m = response_headers.get('x-mbx-order-count-1m')
+        if orders_1m is not None:
+            self._server_orders_1m = int(orders_1m)
+            self._server_orders_1m_time = now
+            self._orders_since_1m = 0
         
-        # Current weight 재계산
-        self._current_weight = sum(self._weight_history)
+        # 서버 값은 IP 전체 사용량 - 다른 프로세스와 공유
+        return {key: int(value) for key, value in (
+            ('weight_1m', used), ('orders_10s', orders_10s), ('orders_1m', orders_1m)) if value is not None}
+    
+    def _publish_server_usage(self, server_usage: Dict[str, int], background: bool = False):
+        if server_usage and self._shared_budget is not None:
+            if background:
+                # 이벤트 루프 스레드 (async 전송 훅)에서는 SQLite 대기 없이 넘김
+                self._admission_executor(PRIORITY_NORMAL).submit(
+                    self._shared_call, 'publish_server_usage', server_usage)
+            else:
+                self._shared_call('publish_server_usage', server_usage)
+    
+    def _admission_executor(self, priority: int) -> ThreadPoolExecutor:
+        """
+        asyncio 승인용 레인별 스레드 (공유 budget SQLite 대기가 이벤트 루프를 막지 않도록)
+
+        레인별로 분리 → 주문 승인이 벌크 승인의 SQLite 대기 뒤에 줄 서지 않음
+        """
+        with self._lock:
+            executor = self._async_executors.get(priority)
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix=f"RateBudget-lane{priority}")
+                self._async_executors[priority] = executor
+            return executor
+    
+    def _shared_call(self, method_name: str, *args, default=None):
+        """공유 budget 호출 - SQLite 오류 시 로컬 판단으로 대체 (주문 경로를 막지 않음)"""
+        try:
+            return getattr(self._shared_budget, method_name)(*args)
+        except sqlite3.Error as e:
+            current_time = time.time()
+            if current_time - self._shared_error_time >= 60:
+                self._shared_error_time = current_time
+                self.logger.warning(f"Shared rate budget Error (로컬 budget으로 대체): {e}")
+            return default
     
     def _update_rate_limit_state(self, response_headers: dict):
         """Response 헤더에서 rate limit Status Update"""
         try:
-            # 서버에서 제공하는 rate limit Info
-            if 'x-mbx-used-weight-1m' in response_headers:
-                server_weight = int(response_headers['x-mbx-used-weight-1m'])
-                # 서버 weight와 Sync
-                if abs(self._current_weight - server_weight) > 100:
-                    self.logger.warning(f"weight Sync: 로컬({self._current_weight}) vs 서버({server_weight})")
-                    self._current_weight = server_weight
+            headers = {str(k).lower(): v for k, v in response_headers.items()}
+            with self._lock:
+                server_usage = self._reconcile_headers(headers, time.time())
+            self._publish_server_usage(server_usage)
             
             # Retry-After 헤더 Process
-            if 'retry-after' in response_headers:
-                self._retry_after = int(response_headers['retry-after'])
+            if 'retry-after' in headers:
+                self._retry_after = int(headers['retry-after'])
                 self.logger.warning(f"Retry-After Received: {self._retry_after}초")
-        except (ValueError, KeyError) as e:
+        except (ValueError, KeyError, AttributeError) as e:
             self.logger.debug(f"헤더 파싱 Error: {e}")
     
     def _handle_rate_limit_error(self, status_code: int, response_headers: dict):
@@ -166,6 +609,10 @@ class BinanceRateLimiter:
             # 임시 rate limit Active화
             self._rate_limited = True
             
+            # 같은 IP의 다른 프로세스도 백오프
+            if self._shared_budget is not None:
+                self._shared_call('set_block', 'backoff', current_time + self._retry_after)
+            
         elif status_code == 418:
             # IP 차단
             self._error_stats['418'] += 1
@@ -175,18 +622,17 @@ class BinanceRateLimiter:
             
             self.logger.critical(f"🔒 IP 차단 (418) - {retry_after}초 차단됨 (Release: {datetime.fromtimestamp(self._ban_until)})")
             
+            if self._shared_budget is not None:
+                self._shared_call('set_block', 'ban', self._ban_until)
+            
             # Status Save
             self._save_state()
     
-    def is_rate_limited(self) -> bool:
-        """Current rate limit Status Confirm"""
-        current_time = time.time()
-        
+    def _blocked_remaining_locked(self, current_time: float) -> float:
+        """IP 차단 / 429 백오프 남은 Time (모든 레인 공통)"""
         # IP 차단 Confirm
         if self._ban_until and current_time < self._ban_until:
-            remaining = int(self._ban_until - current_time)
-            self.logger.debug(f"IP 차단 중 (남은 Time: {remaining}초)")
-            return True
+            return self._ban_until - current_time
         elif self._ban_until and current_time >= self._ban_until:
             # 차단 Release
             self.logger.info("🔓 IP 차단 Release됨")
@@ -199,9 +645,7 @@ class BinanceRateLimiter:
         if self._last_429_time and self._retry_after > 0:
             elapsed = current_time - self._last_429_time
             if elapsed < self._retry_after:
-                remaining = int(self._retry_after - elapsed)
-                self.logger.debug(f"429 백오프 중 (남은 Time: {remaining}초)")
-                return True
+                return self._retry_after - elapsed
             else:
                 # 백오프 Complete
                 self.logger.info("✅ 429 백오프 Complete - API calls 재count 가능")
@@ -209,74 +653,298 @@ class BinanceRateLimiter:
                 self._retry_after = 0
                 self._consecutive_429s = max(0, self._consecutive_429s - 1)
         
-        # weight 기반 제한 Confirm (더 보수적으로 60%에서 제한)
+        return 0.0
+    
+    def _admission_wait_locked(self, weight: int, orders: int, priority: int, now: float) -> float:
+        """요청 승인까지 대기 Time (0 = 즉시 승인 가능)"""
+        blocked = self._blocked_remaining_locked(now)
+        if blocked > 0:
+            return blocked
+        
+        if weight > 0:
+            cap = self._max_weight_per_minute * self.LANE_CAPS[priority]
+            if weight > cap:
+                return float('inf')  # 레인 budget보다 큰 요청 - 대기로도 불가
+            used = self._used_weight_locked(now)
+            if used + weight > cap:
+                if used > self._weight_window.total(now):
+                    # 서버 헤더 기준 초과 - 서버 윈도우 (분 단위) 리셋까지
+                    return 60 - (now % 60)
+                return self._weight_window.expiry_wait(used + weight - cap, now)
+        
+        if orders > 0:
+            orders_10s, orders_1m = self._order_counts_locked(now)
+            if orders_10s + orders > self._max_orders_10s:
+                return self._orders_10s_window.expiry_wait(orders_10s + orders - self._max_orders_10s, now)
+            if orders_1m + orders > self._max_orders_1m:
+                return self._orders_1m_window.expiry_wait(orders_1m + orders - self._max_orders_1m, now)
+        
+        return 0.0
+    
+    def _charge_locked(self, weight: int, orders: int, now: float):
+        """weight / 주문 count 차감"""
+        self._request_window.add(now, 1)
+        if weight > 0:
+            self._weight_window.add(now, weight)
+            self._weight_since_server += weight
+        if orders > 0:
+            self._orders_10s_window.add(now, orders)
+            self._orders_1m_window.add(now, orders)
+            self._orders_since_10s += orders
+            self._orders_since_1m += orders
+    
+    # ------------------------------------------------------------------
+    # 선결제 (try_acquire → 전송 훅 이중 차감 방지)
+    # ------------------------------------------------------------------
+    
+    def _credit_prepaid(self, weight: int, orders: int, now: float):
+        prepaid = self._prepaid
+        if getattr(prepaid, 'expires', 0.0) < now:
+            prepaid.weight = 0
+            prepaid.orders = 0
+        prepaid.weight += weight
+        prepaid.orders += orders
+        prepaid.expires = now + self.PREPAID_TTL
+    
+    def _consume_prepaid(self, weight: int, orders: int) -> Tuple[int, int]:
+        """현재 스레드 선결제분 차감 후 남은 (weight, 주문 count)"""
+        prepaid = self._prepaid
+        if getattr(prepaid, 'expires', 0.0) < time.time():
+            return weight, orders
+        paid_weight = min(weight, prepaid.weight)
+        paid_orders = min(orders, prepaid.orders)
+        prepaid.weight -= paid_weight
+        prepaid.orders -= paid_orders
+        return weight - paid_weight, orders - paid_orders
+    
+    # ------------------------------------------------------------------
+    # 승인 API
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _lane(priority: Optional[int]) -> int:
+        return min(max(int(priority), PRIORITY_ORDER), PRIORITY_BULK)
+    
+    def _admit(self, weight: int, orders: int, priority: int, deadline: Optional[float], credit: bool) -> Optional[float]:
+        """
+        승인 1times Attempt
+
+        Returns:
+            0: 승인 (차감 Complete), None: 거절 (불가 또는 deadline 초과), 양수: 재확인까지 대기 Time
+        """
         with self._lock:
-            self._clean_old_requests()
-            if self._current_weight >= self._max_weight_per_minute * 0.60:  # 60% Reached시 제한
-                self.logger.warning(f"weight 한계 근접 (60%): {self._current_weight}/{self._max_weight_per_minute}")
+            now = time.time()
+            wait_time = self._admission_wait_locked(weight, orders, priority, now)
+            if wait_time <= 0 and self._shared_budget is None:
+                return self._admitted_locked(weight, orders, priority, now, credit)
+
+        if wait_time <= 0:
+            # 다른 프로세스 사용분 포함 승인 + 차감 (원자적) - self._lock 밖에서 호출
+            # (SQLite 쓰기 락 대기 중에도 다른 스레드 / 레인의 로컬 판단은 진행)
+            wait_time = self._shared_try_charge(weight, orders, priority)
+            with self._lock:
+                now = time.time()
+                if wait_time is None:
+                    # 공유 budget 사용 불가 (주문 레인 대기 한도 초과 / SQLite 오류) → 로컬 윈도우로 재판단
+                    wait_time = self._admission_wait_locked(weight, orders, priority, now)
+                    if wait_time <= 0:
+                        self._shared_fallbacks += 1
+                        self._shared_deferred[0] += weight
+                        self._shared_deferred[1] += orders
+                if wait_time <= 0:
+                    return self._admitted_locked(weight, orders, priority, now, credit)
+
+        with self._lock:
+            if wait_time == float('inf') or (deadline is not None and now + wait_time > deadline):
+                self._lane_stats[priority]['rejected'] += 1
+                return None
+            # 다른 스레드 / 헤더 동기화 반영을 위해 최대 1초 단위로 재확인
+            return min(wait_time, 1.0)
+
+    def _admitted_locked(self, weight: int, orders: int, priority: int, now: float, credit: bool) -> int:
+        self._charge_locked(weight, orders, now)
+        self._lane_stats[priority]['admitted'] += 1
+        if credit:
+            self._credit_prepaid(weight, orders, now)
+        return 0
+
+    def _shared_try_charge(self, weight: int, orders: int, priority: int) -> Optional[float]:
+        """
+        공유 budget 승인 + 차감 (self._lock 밖에서 호출)
+
+        주문 레인은 SHARED_ORDER_TIMEOUT까지만 SQLite를 기다림 (초과 / 오류 시 None → 로컬 윈도우로 승인,
+        그 분량은 다음 비주문 레인 호출 때 공유 budget에 기록)
+        """
+        if priority == PRIORITY_ORDER:
+            timeout = self.SHARED_ORDER_TIMEOUT
+        else:
+            timeout = None
+            with self._lock:
+                deferred_weight, deferred_orders = self._shared_deferred
+                self._shared_deferred = [0, 0]
+            if deferred_weight or deferred_orders:
+                self._shared_call('charge', deferred_weight, deferred_orders, PRIORITY_ORDER)
+        return self._shared_call(
+            'try_charge', weight, orders, priority, self.LANE_CAPS[priority],
+            self._max_weight_per_minute, self._max_orders_10s, self._max_orders_1m, timeout, default=None)
+
+    def _acquire(self, weight: int, orders: int, priority: int, timeout: Optional[float], credit: bool) -> bool:
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            wait_time = self._admit(weight, orders, priority, deadline, credit)
+            if wait_time is None:
+                return False
+            if wait_time == 0:
                 return True
+            time.sleep(wait_time)
+    
+    def try_acquire(self, endpoint_path: str, params: dict = None, priority: int = None,
+                    method: str = 'GET', weight: int = None) -> bool:
+        """
+        비차단 승인 - budget이 있으면 즉시 차감 후 True, 없으면 대기 없이 False
         
-        return False
+        Args:
+            endpoint_path: API 경로 (예: '/fapi/v1/klines')
+            params: 요청 파라미터 (symbol, limit → weight 계산)
+            priority: PRIORITY_ORDER / PRIORITY_NORMAL / PRIORITY_BULK (None = 경로 기준 자동)
+            method: HTTP method (주문 count 판단)
+            weight: weight 직접 지정 (None = 엔드포인트 표 기준)
+        """
+        return self.acquire(endpoint_path, params, priority, method, weight, timeout=0)
+    
+    def acquire(self, endpoint_path: str, params: dict = None, priority: int = None,
+                method: str = 'GET', weight: int = None, timeout: Optional[float] = None) -> bool:
+        """차단 승인 - budget이 생길 때까지 최대 timeout초 대기 (대기로도 불가하면 즉시 False)"""
+        if weight is None:
+            weight = self._get_endpoint_weight(endpoint_path, params, method)
+        orders = self._get_order_count(endpoint_path, method)
+        if priority is None:
+            priority = self.priority_for(endpoint_path, method)
+        return self._acquire(weight, orders, self._lane(priority), timeout, credit=True)
+    
+    def acquire_request(self, endpoint_path: str, params: dict = None, method: str = 'GET',
+                        timeout: Optional[float] = None) -> bool:
+        """전송 훅용 승인 - 같은 스레드의 try_acquire/acquire 선결제분은 다시 차감하지 않음"""
+        weight = self._get_endpoint_weight(endpoint_path, params, method)
+        orders = self._get_order_count(endpoint_path, method)
+        weight, orders = self._consume_prepaid(weight, orders)
+        if weight == 0 and orders == 0:
+            return True
+        priority = self.priority_for(endpoint_path, method)
+        return self._acquire(weight, orders, priority, timeout, credit=False)
+    
+    async def acquire_request_async(self, endpoint_path: str, params: dict = None, method: str = 'GET',
+                                    timeout: Optional[float] = None) -> bool:
+        """
+        asyncio 전송 훅용 승인 - budget 대기를 asyncio.sleep으로 (이벤트 루프의 다른 요청은 계속 Progress)
+
+        이벤트 루프 스레드 하나에서 여러 코루틴이 요청하므로 스레드별 선결제 (try_acquire)는 Usage하지 않습니다.
+        공유 budget이 있으면 승인 (SQLite, 최대 BUSY_TIMEOUT 대기)은 레인별 스레드에서 실행합니다.
+        """
+        weight = self._get_endpoint_weight(endpoint_path, params, method)
+        orders = self._get_order_count(endpoint_path, method)
+        priority = self.priority_for(endpoint_path, method)
+        deadline = None if timeout is None else time.time() + timeout
+        loop = asyncio.get_running_loop()
+        while True:
+            if self._shared_budget is None:
+                # 로컬 윈도우만 - self._lock은 짧게만 잡히므로 루프 스레드에서 바로 판단
+                wait_time = self._admit(weight, orders, priority, deadline, False)
+            else:
+                wait_time = await loop.run_in_executor(
+                    self._admission_executor(priority), self._admit, weight, orders, priority, deadline, False)
+            if wait_time is None:
+                return False
+            if wait_time == 0:
+                return True
+            await asyncio.sleep(wait_time)
+    
+    def lane_wait_time(self, weight: int = 1, priority: int = PRIORITY_BULK) -> float:
+        """레인에서 weight만큼 승인되기까지 대기 Time (0 = 즉시 가능)"""
+        priority = self._lane(priority)
+        with self._lock:
+            wait_time = self._admission_wait_locked(weight, 0, priority, time.time())
+        if wait_time <= 0 and self._shared_budget is not None:
+            wait_time = self._shared_call(
+                'admission_wait', weight, 0, self.LANE_CAPS[priority],
+                self._max_weight_per_minute, self._max_orders_10s, self._max_orders_1m, default=0.0)
+        return wait_time
+    
+    def has_capacity(self, weight: int = 1, priority: int = PRIORITY_BULK) -> bool:
+        """레인에 weight만큼 여유가 있는지 (차감하지 않음)"""
+        return self.lane_wait_time(weight, priority) <= 0
+    
+    def get_used_weight(self) -> int:
+        """Current 사용 weight (서버 헤더 동기화 / 공유 budget 반영)"""
+        with self._lock:
+            used = self._used_weight_locked(time.time())
+        if self._shared_budget is not None:
+            used = max(used, self._shared_call('used_weight', default=0))
+        return used
+    
+    def get_max_weight(self) -> int:
+        """유효 budget (공유 상한이 설정되어 있으면 더 작은 값)"""
+        shared_max = None
+        if self._shared_budget is not None:
+            shared_max = self._shared_call('get_max_weight')
+        return int(min(self._max_weight_per_minute, shared_max)) if shared_max else self._max_weight_per_minute
+    
+    def usage_pct(self) -> float:
+        """budget 대비 사용률 (%)"""
+        return (self.get_used_weight() / self.get_max_weight()) * 100
+    
+    def record_response(self, status_code: int = 200, response_headers: dict = None, background: bool = False):
+        """
+        Response 기록 - 서버 사용량 헤더 동기화 + 429/418 Process
+
+        Args:
+            background: 공유 budget 게시를 별도 스레드에서 (이벤트 루프에서 호출할 때)
+        """
+        headers = {str(k).lower(): v for k, v in (response_headers or {}).items()}
+        server_usage = None
+        with self._lock:
+            try:
+                server_usage = self._reconcile_headers(headers, time.time())
+            except (ValueError, TypeError) as e:
+                self.logger.debug(f"헤더 파싱 Error: {e}")
+            if status_code in (429, 418):
+                self._handle_rate_limit_error(status_code, headers)
+            elif status_code and status_code >= 400:
+                self._error_stats[str(status_code)] += 1
+        self._publish_server_usage(server_usage, background)
+    
+    # ------------------------------------------------------------------
+    # 기존 API (dashboard_api 등 호환)
+    # ------------------------------------------------------------------
+    
+    def is_rate_limited(self, priority: int = PRIORITY_BULK) -> bool:
+        """Current rate limit Status Confirm (기본: 벌크 레인, budget 60%에서 제한)"""
+        return not self.has_capacity(1, priority)
     
     def wait_if_needed(self, endpoint_path: str, params: dict = None) -> bool:
-        """Required시 대기 후 요청 허용 여부 반환"""
-        if self.is_rate_limited():
-            # 대기 Time 계산
-            wait_time = self._calculate_wait_time()
-            if wait_time > 0:
-                self.logger.info(f"⏳ Rate limit Waiting: {wait_time:.1f}초")
-                time.sleep(wait_time)
+        """Required시 대기 후 요청 허용 여부 반환 (차감은 record_request)"""
+        weight = self._get_endpoint_weight(endpoint_path, params)
+        priority = self.priority_for(endpoint_path)
+        wait_time = self.lane_wait_time(weight, priority)
+        if wait_time > 0:
+            self.logger.info(f"⏳ Rate limit Waiting: {wait_time:.1f}초")
+            time.sleep(wait_time)
             
             # 대기 후 재검사
-            if self.is_rate_limited():
+            if not self.has_capacity(weight, priority):
                 self.logger.error("⛔ Rate limit 지속됨 - 요청 거부")
                 return False
         
-        # weight 예Approx
-        weight = self._get_endpoint_weight(endpoint_path, params)
-        with self._lock:
-            self._clean_old_requests()
-            # 요청 후 weight가 한계를 Exceeded하는지 Confirm
-            if self._current_weight + weight > self._max_weight_per_minute:
-                self.logger.warning(f"weight 한계 Exceeded Expected: {self._current_weight + weight}/{self._max_weight_per_minute}")
-                return False
-        
         return True
     
-    def _calculate_wait_time(self) -> float:
-        """적절한 대기 Time 계산"""
-        current_time = time.time()
-        
-        # IP 차단 대기 Time
-        if self._ban_until and current_time < self._ban_until:
-            return self._ban_until - current_time
-        
-        # 429 백오프 대기 Time
-        if self._last_429_time and self._retry_after > 0:
-            elapsed = current_time - self._last_429_time
-            remaining = self._retry_after - elapsed
-            if remaining > 0:
-                return remaining * self._backoff_multiplier
-        
-        # weight 기반 대기 Time (가장 오래된 요청이 만료될 때까지)
-        if self._request_times:
-            oldest_request = self._request_times[0]
-            wait_until = oldest_request + 60  # 1분 후 만료
-            wait_time = max(0, wait_until - current_time)
-            return wait_time
-        
-        return 0
-    
     def record_request(self, endpoint_path: str, params: dict = None, response_headers: dict = None):
         """요청 기록 및 weight Add"""
-        current_time = time.time()
         weight = self._get_endpoint_weight(endpoint_path, params)
         
         with self._lock:
-            self._request_times.append(current_time)
-            self._weight_history.append(weight)
-            self._current_weight += weight
-            self._clean_old_requests()
+            self._charge_locked(weight, 0, time.time())
+        if self._shared_budget is not None:
+            self._shared_call('charge', weight, 0, self.priority_for(endpoint_path))
         
         # Response 헤더 Process
         if response_headers:
@@ -287,34 +955,19 @@ class BinanceRateLimiter:
     def record_error(self, status_code: int, response_headers: dict = None):
         """에러 Response 기록"""
         if status_code in [429, 418]:
-            self._handle_rate_limit_error(status_code, response_headers or {})
+            headers = {str(k).lower(): v for k, v in (response_headers or {}).items()}
+            with self._lock:
+                self._handle_rate_limit_error(status_code, headers)
         else:
             self._error_stats[str(status_code)] += 1
     
-    def get_cache(self, cache_key: str) -> Optional[Any]:
-        """Cache에서 데이터 조times"""
-        if cache_key in self._response_cache:
-            data, cached_time, ttl = self._response_cache[cache_key]
-            if time.time() - cached_time < ttl:
-                self.logger.debug(f"Cache 히트: {cache_key}")
-                return data
-            else:
-                # 만료된 Cache Delete
-                del self._response_cache[cache_key]
-        return None
+    def get_cache(self, cache_key) -> Optional[Any]:
+        """Cache에서 데이터 조times (만료 항목은 None)"""
+        return self._response_cache.get(cache_key)
     
-    def set_cache(self, cache_key: str, data: Any, ttl: int = 60):
-        """Cache에 데이터 Save"""
-        self._response_cache[cache_key] = (data, time.time(), ttl)
-        self.logger.debug(f"Cache Save: {cache_key} (TTL: {ttl}초)")
-        
-        # Cache Size 제한 (메모리 관리)
-        if len(self._response_cache) > 1000:
-            # 가장 오래된 Cache 10count Delete
-            oldest_keys = sorted(self._response_cache.keys(), 
-                               key=lambda k: self._response_cache[k][1])[:10]
-            for key in oldest_keys:
-                del self._response_cache[key]
+    def set_cache(self, cache_key, data: Any, ttl: int = 60):
+        """Cache에 데이터 Save (가득 차면 가장 오래 안 쓴 항목 Remove)"""
+        self._response_cache.set(cache_key, data, ttl)
     
     def get_status(self) -> dict:
         """Current rate limiter Status 반환"""
@@ -330,28 +983,55 @@ class BinanceRateLimiter:
             elapsed = current_time - self._last_429_time
             backoff_remaining = max(0, self._retry_after - elapsed)
         
+        # 공유 budget (같은 IP의 모든 프로세스 합계)
+        shared = self._shared_call('snapshot') if self._shared_budget is not None else None
+        max_weight = self.get_max_weight()
+        
         with self._lock:
-            self._clean_old_requests()
+            used_weight = self._used_weight_locked(current_time)
+            orders_10s, orders_1m = self._order_counts_locked(current_time)
+            if shared:
+                used_weight = max(used_weight, shared['used_weight'])
+                orders_10s = max(orders_10s, shared['orders_10s'])
+                orders_1m = max(orders_1m, shared['orders_1m'])
+                if shared['blocked_remaining_seconds'] > 0 and ban_status == "정상":
+                    backoff_remaining = max(backoff_remaining, shared['blocked_remaining_seconds'])
             
             return {
                 'rate_limited': self.is_rate_limited(),
-                'current_weight': self._current_weight,
-                'max_weight': self._max_weight_per_minute,
-                'weight_usage_pct': (self._current_weight / self._max_weight_per_minute) * 100,
-                'requests_per_minute': len(self._request_times),
+                'current_weight': used_weight,
+                'local_weight': self._current_weight,
+                'server_weight': self._server_weight,
+                'max_weight': max_weight,
+                'weight_usage_pct': (used_weight / max_weight) * 100,
+                'requests_per_minute': self._request_window.total(current_time),
+                'orders_10s': orders_10s,
+                'orders_1m': orders_1m,
+                'max_orders_10s': self._max_orders_10s,
+                'max_orders_1m': self._max_orders_1m,
+                'lane_caps': {lane: int(max_weight * cap) for lane, cap in self.LANE_CAPS.items()},
+                'lane_stats': {lane: dict(stats) for lane, stats in self._lane_stats.items()},
+                'shared_fallbacks': self._shared_fallbacks,
                 'ban_status': ban_status,
                 'ban_remaining_seconds': int(ban_remaining),
                 'backoff_remaining_seconds': int(backoff_remaining),
                 'consecutive_429s': self._consecutive_429s,
                 'backoff_multiplier': self._backoff_multiplier,
                 'error_stats': dict(self._error_stats),
-                'cache_size': len(self._response_cache)
+                'cache_size': len(self._response_cache),
+                'cache_hits': self._response_cache.hits,
+                'cache_misses': self._response_cache.misses,
+                'single_flight': single_flight_stats(),
+                'shared_budget': shared
             }
     
     def reset_stats(self):
         """통계 리셋"""
         with self._lock:
             self._error_stats.clear()
+            for stats in self._lane_stats.values():
+                stats['admitted'] = 0
+                stats['rejected'] = 0
             self._last_reset = time.time()
         self.logger.info("📊 Rate limiter 통계 리셋됨")
     
@@ -393,48 +1073,193 @@ class BinanceRateLimiter:
             self.logger.error(f"Status Load Failed: {e}")
 
 
+_shared_rate_limiter: Optional[BinanceRateLimiter] = None
+_shared_rate_limiter_lock = threading.Lock()
+
+
+def open_shared_budget(logger=None) -> Optional[SharedRateBudget]:
+    """프로세스 간 공유 budget 열기 (실패 시 None - 프로세스 단독 집계)"""
+    try:
+        return SharedRateBudget(logger=logger)
+    except (sqlite3.Error, OSError) as e:
+        (logger or logging.getLogger(__name__)).warning(f"Shared rate budget 사용 불가 - 프로세스 단독 집계: {e}")
+        return None
+
+
+def get_rate_limiter(logger=None) -> BinanceRateLimiter:
+    """프로세스 공용 Rate Limiter (전략 / DCA 매니저 / RateLimitedExchange 공유, 프로세스 간 budget 공유)"""
+    global _shared_rate_limiter
+    if _shared_rate_limiter is None:
+        with _shared_rate_limiter_lock:
+            if _shared_rate_limiter is None:
+                _shared_rate_limiter = BinanceRateLimiter(logger, shared_budget=open_shared_budget(logger))
+    return _shared_rate_limiter
+
+
+def _split_request(url: str, body) -> Tuple[str, dict]:
+    """ccxt 요청 URL/본문에서 (경로, 파라미터) 추출"""
+    parsed = urlparse(url)
+    params = dict(parse_qsl(parsed.query))
+    if isinstance(body, str) and '=' in body and not body.lstrip().startswith(('{', '[')):
+        params.update(parse_qsl(body))
+    return parsed.path, params
+
+
+def install_rate_limiter(exchange, limiter: BinanceRateLimiter = None,
+                         order_timeout: float = 5.0, request_timeout: float = 30.0):
+    """
+    ccxt Exchange 전송 계층 (fetch / on_rest_response)에 Rate Limiter 연결
+    
+    - 모든 선물 REST 요청이 공용 budget으로 집계 (try_acquire 선결제분은 중복 차감 없음)
+    - 주문 레인은 최대 order_timeout초, 그 외는 request_timeout초까지만 대기 후 RateLimitExceeded
+    - Response 헤더 (X-MBX-USED-WEIGHT-1M / ORDER-COUNT)로 사용량 동기화, 429/418 백오프
+    
+    같은 Exchange에 여러 번 호출해도 한 번만 연결됩니다.
+    """
+    limiter = limiter or get_rate_limiter()
+    if getattr(exchange, '_binance_rate_limiter', None) is not None:
+        exchange._binance_rate_limiter = limiter
+        return exchange
+    
+    from ccxt.base.errors import RateLimitExceeded
+    
+    original_fetch = exchange.fetch
+    original_on_rest_response = exchange.on_rest_response
+    
+    def fetch(url, method='GET', headers=None, body=None):
+        active = exchange._binance_rate_limiter
+        path, params = _split_request(url, body)
+        if active.is_tracked(path):
+            timeout = order_timeout if active.priority_for(path, method) == PRIORITY_ORDER else request_timeout
+            if not active.acquire_request(path, params, method, timeout):
+                raise RateLimitExceeded(f"{exchange.id} rate limit budget exhausted: {method} {path}")
+        return original_fetch(url, method, headers, body)
+    
+    def on_rest_response(code, reason, url, method, response_headers, response_body, request_headers, request_body):
+        active = exchange._binance_rate_limiter
+        if active.is_tracked(urlparse(url).path):
+            active.record_response(code, response_headers)
+        return original_on_rest_response(code, reason, url, method, response_headers, response_body,
+                                         request_headers, request_body)
+    
+    exchange.fetch = fetch
+    exchange.on_rest_response = on_rest_response
+    exchange._binance_rate_limiter = limiter
+    return exchange
+
+
+def install_async_rate_limiter(exchange, limiter: BinanceRateLimiter = None,
+                               order_timeout: float = 5.0, request_timeout: float = 30.0):
+    """
+    ccxt.async_support Exchange 전송 계층 (async fetch / on_rest_response)에 Rate Limiter 연결
+
+    - install_rate_limiter와 같은 budget / 레인 / 헤더 동기화
+    - budget 대기는 asyncio.sleep (이벤트 루프의 다른 요청은 계속 Progress)
+    - 코루틴별 대기 상한은 ADMISSION_TIMEOUT 컨텍스트 변수로 지정 (0 = 비차단)
+    """
+    limiter = limiter or get_rate_limiter()
+    if getattr(exchange, '_binance_rate_limiter', None) is not None:
+        exchange._binance_rate_limiter = limiter
+        return exchange
+
+    from ccxt.base.errors import RateLimitExceeded
+
+    original_fetch = exchange.fetch
+    original_on_rest_response = exchange.on_rest_response
+
+    async def fetch(url, method='GET', headers=None, body=None):
+        active = exchange._binance_rate_limiter
+        path, params = _split_request(url, body)
+        if active.is_tracked(path):
+            timeout = ADMISSION_TIMEOUT.get()
+            if timeout is None:
+                timeout = order_timeout if active.priority_for(path, method) == PRIORITY_ORDER else request_timeout
+            if not await active.acquire_request_async(path, params, method, timeout):
+                raise RateLimitExceeded(f"{exchange.id} rate limit budget exhausted: {method} {path}")
+        return await original_fetch(url, method, headers, body)
+
+    def on_rest_response(code, reason, url, method, response_headers, response_body, request_headers, request_body):
+        active = exchange._binance_rate_limiter
+        if active.is_tracked(urlparse(url).path):
+            active.record_response(code, response_headers, background=True)
+        return original_on_rest_response(code, reason, url, method, response_headers, response_body,
+                                         request_headers, request_body)
+
+    exchange.fetch = fetch
+    exchange.on_rest_response = on_rest_response
+    exchange._binance_rate_limiter = limiter
+    return exchange
+
+
 class RateLimitedExchange:
     """Rate Limiter가 적용된 Exchange 래퍼"""
     
+    # 주문 레인 method (대기 허용) - 나머지는 비차단 승인
+    ORDER_METHOD_PREFIXES = ('create_', 'cancel_', 'edit_')
+    
+    # 더 이상 바뀌지 않는 주문 Status (ccxt 통일 Status) - fetch_order는 이 Status만 Cache
+    FINAL_ORDER_STATUSES = frozenset(('closed', 'canceled', 'expired', 'rejected'))
+    
     def __init__(self, exchange, logger=None):
         self.exchange = exchange
-        self.rate_limiter = BinanceRateLimiter(logger)
+        self.rate_limiter = get_rate_limiter(logger)
         self.logger = logger or logging.getLogger(__name__)
+        install_rate_limiter(exchange, self.rate_limiter)
+        # 같은 거래소를 감싼 다른 래퍼 (DCA 매니저 등)와 진행 중 요청 공유
+        self.single_flight = get_single_flight(exchange)
+    
+    def get_single_flight_stats(self) -> Dict[str, dict]:
+        """method별 요청 병합 통계 (calls / executed / coalesced / errors)"""
+        return self.single_flight.get_stats()
     
     def _safe_api_call(self, method_name: str, *args, **kwargs):
         """Rate limit을 고려한 안전한 API calls"""
-        # 엔드포인트 경로 추정
-        endpoint_path = self._get_endpoint_path(method_name, args, kwargs)
-        params = self._extract_params(args, kwargs)
+        # Cache Confirm (조times 메서드만 - 주문 생성/Cancel은 매번 전송)
+        cache_key = self._make_cache_key(method_name, args, kwargs) if self._is_cacheable(method_name) else None
+        if cache_key is None:
+            return self._call_exchange(method_name, args, kwargs, None)
         
-        # Cache Confirm
-        cache_args = str(sorted(args)) if args else ""
-        cache_kwargs = str(sorted(kwargs.items())) if kwargs else ""
-        cache_key = f"{method_name}:{hash(cache_args + cache_kwargs)}"
         cached_result = self.rate_limiter.get_cache(cache_key)
         if cached_result is not None:
             return cached_result
         
-        # Rate limit Confirm 및 대기
-        if not self.rate_limiter.wait_if_needed(endpoint_path, params):
+        # 같은 조times가 진행 중이면 그 결과를 함께 받음 (승인/전송은 한 번만)
+        return self.single_flight.do(cache_key, lambda: self._call_exchange(method_name, args, kwargs, cache_key),
+                                     name=method_name)
+    
+    def _call_exchange(self, method_name: str, args, kwargs, cache_key):
+        """승인 후 실제 거래소 호출, 조times 결과는 Cache Save"""
+        # 엔드포인트 경로 추정
+        endpoint_path = self._get_endpoint_path(method_name, args, kwargs)
+        params = self._extract_params(method_name, args, kwargs)
+        
+        # 승인 - 주문은 짧게 대기, 조times는 비차단 (budget 없으면 즉시 거부)
+        # 경로를 모르는 메서드는 차단/백오프만 확인하고 weight는 전송 훅에서 집계
+        weight = 0 if endpoint_path == 'default' else None
+        if method_name.startswith(self.ORDER_METHOD_PREFIXES):
+            http_method = 'DELETE' if method_name.startswith('cancel_') else 'POST'
+            admitted = self.rate_limiter.acquire(endpoint_path, params, PRIORITY_ORDER, http_method,
+                                                 weight=weight, timeout=5.0)
+        else:
+            admitted = self.rate_limiter.try_acquire(endpoint_path, params, weight=weight)
+        if not admitted:
             raise Exception(f"Rate limit Exceeded로 요청 거부됨: {method_name}")
         
         try:
-            # 실제 API calls
+            # 실제 API calls (weight/헤더는 전송 훅에서 집계)
             method = getattr(self.exchange, method_name)
             result = method(*args, **kwargs)
             
-            # Success시 요청 기록
-            self.rate_limiter.record_request(endpoint_path, params)
-            
-            # Cache Save (Response Type에 따라 TTL 조정)
-            ttl = self._get_cache_ttl(method_name)
-            self.rate_limiter.set_cache(cache_key, result, ttl)
+            # Cache Save (Response Type에 따라 TTL 조정, 0 = Cache 안 함)
+            if cache_key is not None:
+                ttl = self._get_cache_ttl(method_name, result)
+                if ttl > 0:
+                    self.rate_limiter.set_cache(cache_key, result, ttl)
             
             return result
             
         except Exception as e:
-            # 에러 Response Process
+            # 에러 Response Process (전송 훅이 없는 경로 대비)
             status_code = getattr(e, 'response', {}).get('status_code') or \
                          getattr(e, 'status_code', 0)
             
@@ -452,31 +1277,68 @@ class RateLimitedExchange:
             # 다른 에러는 그대로 전파
             raise e
     
+    @staticmethod
+    def _is_cacheable(method_name: str) -> bool:
+        return method_name.startswith('fetch_') or method_name == 'market'
+    
+    @staticmethod
+    def _freeze(value):
+        """dict/list 인자를 해시 가능한 튜플로 변환"""
+        if isinstance(value, dict):
+            return tuple(sorted((k, RateLimitedExchange._freeze(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple, set)):
+            return tuple(RateLimitedExchange._freeze(v) for v in value)
+        return value
+    
+    @staticmethod
+    def _make_cache_key(method_name: str, args, kwargs):
+        """인자 튜플 Cache 키 (dict/list 인자는 튜플로 고정, 실패 시 repr로 대체)"""
+        key = (method_name, args, tuple(sorted(kwargs.items())) if kwargs else ())
+        try:
+            hash(key)
+            return key
+        except TypeError:
+            pass
+        freeze = RateLimitedExchange._freeze
+        key = (method_name, freeze(args) if args else (), freeze(kwargs) if kwargs else ())
+        try:
+            hash(key)
+            return key
+        except TypeError:
+            return (method_name, repr(args), repr(sorted(kwargs.items())))
+    
     def _get_endpoint_path(self, method_name: str, args, kwargs) -> str:
         """메서드명으로부터 엔드포인트 경로 추정"""
         endpoint_mapping = {
             'fetch_ohlcv': '/fapi/v1/klines',
             'fetch_ticker': '/fapi/v1/ticker/24hr',
-            'fetch_tickers': '/fapi/v2/ticker/24hr',
+            'fetch_tickers': '/fapi/v1/ticker/24hr',
             'fetch_order_book': '/fapi/v1/depth',
             'fetch_trades': '/fapi/v1/aggTrades',
             'fetch_balance': '/fapi/v2/account',
             'fetch_positions': '/fapi/v2/positionRisk',
             'fetch_orders': '/fapi/v1/allOrders',
             'fetch_open_orders': '/fapi/v1/openOrders',
+            'fetch_order': '/fapi/v1/order',
             'create_order': '/fapi/v1/order',
             'cancel_order': '/fapi/v1/order',
         }
         return endpoint_mapping.get(method_name, 'default')
     
-    def _extract_params(self, args, kwargs) -> dict:
+    def _extract_params(self, method_name: str, args, kwargs) -> dict:
         """API calls 파라미터 추출"""
         params = {}
         
-        # args에서 Symbol 추출 (첫 번째 인자가 보통 Symbol)
-        if args:
+        # args에서 Symbol 추출 (첫 번째 인자가 보통 Symbol, fetch_tickers는 Symbol 목록)
+        if args and method_name != 'fetch_tickers':
             params['symbol'] = args[0]
         
+        # fetch_ohlcv(symbol, timeframe, since, limit) / fetch_order_book(symbol, limit)
+        if method_name == 'fetch_ohlcv' and len(args) > 3:
+            params['limit'] = args[3]
+        elif method_name == 'fetch_order_book' and len(args) > 1:
+            params['limit'] = args[1]
+        
         # kwargs에서 주요 파라미터 추출
         for key in ['symbol', 'limit', 'since', 'timeframe']:
             if key in kwargs:
@@ -484,8 +1346,12 @@ class RateLimitedExchange:
         
         return params
     
-    def _get_cache_ttl(self, method_name: str) -> int:
-        """메서드별 Cache TTL Settings (API 호출 최소화)"""
+    def _get_cache_ttl(self, method_name: str, result: Any = None) -> int:
+        """메서드별 Cache TTL Settings (API 호출 최소화, 0 = Cache 안 함)"""
+        if method_name == 'fetch_order':
+            # 최종 Status만 Cache - 미체결 / 부분 체결 Status를 Cache하면 체결 감지가 TTL만큼 늦어짐
+            final = isinstance(result, dict) and result.get('status') in self.FINAL_ORDER_STATUSES
+            return 600 if final else 0
         ttl_mapping = {
             'fetch_ticker': 5,      # 5초 (빠른 change)
             'fetch_tickers': 10,    # 10초 
@@ -532,7 +1398,7 @@ if __name__ == "__main__":
     logger = logging.getLogger(__name__)
     
     # Rate limiter Test
-    rate_limiter = BinanceRateLimiter(logger)
+    rate_limiter = get_rate_limiter(logger)
     
     # Status 출력
     status = rate_limiter.get_status()
@@ -555,4 +1421,4 @@ if __name__ == "__main__":
         # print(f"티커 수: {len(tickers)}")
         
     except Exception as e:
-        print(f"Exchange Test Failed: {e}")
\ No newline at end of file
+        print(f"Exchange Test Failed: {e}")
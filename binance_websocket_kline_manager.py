@@ -7,18 +7,32 @@ python-binance 라이브러리를 Usage한 Binance WebSocket Kline Manager
 - 여러 Symbol의 1minute candles 실Time 데이터 수신
 - 자동 재Connections 및 Error Process
 - 동적 Symbol Subscription/Release
-- 스레드 안전성 보장
+- 결합 스트림 모드 (use_combined_stream=True): Symbol당 소켓 대신 Connections당 최대 200count 스트림 다중화
+  (binance_combined_stream.py, SUBSCRIBE/UNSUBSCRIBE 프레임으로 라이브 Connections에서 동적 변경)
+- 스레드 안전성 보장 (Symbol 단위 writer lock + lock-free seqlock 스냅샷 조times)
+- NumPy 링 버퍼 기반 Kline Save (kline_ring_buffer.py)
+- 1minute candles → 3m/5m/15m/1h/4h/1d 증분 집계 (kline_resampler.py)
+- 누락 캔들 탐지 (링 버퍼 캔들 간격 추적) + 벌크 레인 REST 보충 큐 (kline_gap_repair.py, enable_gap_repair)
+- Symbol별 버퍼 health (누락 구간 수 / 최대 누락 캔들 수) → 스캐너가 불완전한 Symbol 제외
 """
 
 import asyncio
 import threading
 import time
 import logging
+import numpy as np
 import pandas as pd
-from typing import Callable, Optional, Set, Dict, List
+from typing import Callable, Iterable, Optional, Set, Dict, List
 from binance import ThreadedWebsocketManager
 from binance.client import Client
 
+from binance_combined_stream import (CombinedStreamClient, SPOT_STREAM_URL,
+                                     DEFAULT_MAX_STREAMS_PER_CONNECTION, kline_stream_name)
+from kline_gap_repair import KlineGapRepairer
+from kline_ring_buffer import KlineRingBuffer
+from kline_resampler import KlineResampler, align_timestamp, resample_ohlcv
+from kline_store import timeframe_to_ms
+
 
 class BinanceWebSocketKlineManager:
     """
@@ -27,36 +41,61 @@ class BinanceWebSocketKlineManager:
     ThreadedWebsocketManager를 Usage하여 안정적인 실Time 가격 데이터를 제공합니다.
     """
     
-    def __init__(self, callback: Callable, logger: Optional[logging.Logger] = None):
+    def __init__(self, callback: Callable, logger: Optional[logging.Logger] = None,
+                 use_combined_stream: bool = False, stream_url: str = SPOT_STREAM_URL,
+                 max_streams_per_connection: int = DEFAULT_MAX_STREAMS_PER_CONNECTION):
         """
         WebSocket 매니저 Initialize
         
         Args:
             callback: 가격 Update Callback 함수 (symbol, price, kline_data)
             logger: 로깅 객체
+            use_combined_stream: True면 결합 스트림 다중화 모드 (Symbol당 소켓 대신 Connections 공유)
+            stream_url: 결합 스트림 엔드포인트 (로컬 Test Server 지정 가능)
+            max_streams_per_connection: 결합 스트림 Connections당 최대 스트림 수
         """
         self.callback = callback
         self.logger = logger or logging.getLogger(__name__)
         
-        # python-binance WebSocket 매니저
+        # python-binance WebSocket 매니저 (Symbol당 소켓 모드)
         self.twm = None
         self.is_running = False
         self.is_connected = False
+
+        # 결합 스트림 클라이언트 (다중화 모드)
+        self.use_combined_stream = use_combined_stream
+        self.stream_url = stream_url
+        self.max_streams_per_connection = max_streams_per_connection
+        self.stream_client: Optional[CombinedStreamClient] = None
+        self._stream_callbacks: Dict[str, Callable] = {}  # stream 이름 -> Symbol kline Callback
         
         # Subscription management
         self.subscribed_symbols: Set[str] = set()
-        self.stream_keys: Dict[str, str] = {}  # symbol -> stream_key 매핑
+        self.stream_keys: Dict[str, str] = {}  # symbol -> stream_key 매핑 (결합 모드는 stream 이름)
         
         # 통계
         self.message_count = 0
         self.error_count = 0
         self.last_message_time = 0
         
-        # 데이터 버퍼 (Symbol-Timeframe별 kline 데이터 Save)
-        self.kline_buffer: Dict[str, List] = {}
+        # 데이터 버퍼 (Symbol-Timeframe별 컬럼형 링 버퍼)
+        self.buffer_capacity = 1500
+        self.kline_buffer: Dict[str, KlineRingBuffer] = {}
+
+        # 상위 Timeframe 증분 집계 엔진 (전략/4h Filtering도 공유)
+        self.resampler = KlineResampler(seed_provider=self._resampler_seed)
+
+        # 누락 캔들 보충 큐 (enable_gap_repair 호출 전에는 탐지 / health만)
+        self.gap_repairer: Optional[KlineGapRepairer] = None
+        self.gap_count = 0  # ingest 중 탐지한 누락 구간 누적 수
         
         # 스레드 안전성
+        # - self.lock: Subscription 관리 전용 (subscribed_symbols / stream_keys)
+        # - Symbol별 lock: 같은 Symbol의 버퍼 writer 직렬화 (ingest는 Symbol lock 1times만 획득)
+        # - 스캔 스레드는 lock 없이 링 버퍼 seqlock 스냅샷으로 조times
         self.lock = threading.Lock()
+        self._symbol_locks: Dict[str, threading.Lock] = {}
+        self._registry_lock = threading.Lock()  # 버퍼/lock Create 시에만 Usage
         
     def start(self, max_retries: int = 3, retry_delay: int = 2) -> bool:
         """
@@ -76,9 +115,19 @@ class BinanceWebSocketKlineManager:
             try:
                 self.logger.info(f"WebSocket connection attempt {attempt + 1}/{max_retries + 1}")
                 
-                # ThreadedWebsocketManager Create (API Key 없이 public 스트림 Usage)
-                self.twm = ThreadedWebsocketManager()
-                self.twm.start()
+                if self.use_combined_stream:
+                    # 결합 스트림 클라이언트 (Connections은 첫 Subscription 시 Create)
+                    self.stream_client = CombinedStreamClient(
+                        self._on_combined_message,
+                        logger=self.logger,
+                        base_url=self.stream_url,
+                        max_streams_per_connection=self.max_streams_per_connection
+                    )
+                    self.stream_client.start()
+                else:
+                    # ThreadedWebsocketManager Create (API Key 없이 public 스트림 Usage)
+                    self.twm = ThreadedWebsocketManager()
+                    self.twm.start()
                 
                 self.is_running = True
                 self.is_connected = True
@@ -116,9 +165,33 @@ class BinanceWebSocketKlineManager:
                 self.logger.debug(f"WebSocket shutdown error: {e}")
             finally:
                 self.twm = None
+
+        if self.stream_client:
+            try:
+                self.stream_client.stop()
+            except Exception as e:
+                self.logger.debug(f"Combined stream shutdown error: {e}")
+            finally:
+                self.stream_client = None
                 
         self.subscribed_symbols.clear()
         self.stream_keys.clear()
+        self._stream_callbacks.clear()
+
+    @property
+    def _has_transport(self) -> bool:
+        return self.twm is not None or self.stream_client is not None
+
+    @staticmethod
+    def _clean_symbol(symbol: str) -> str:
+        """Symbol 정규화 (BTC/USDT:USDT → BTCUSDT)"""
+        return symbol.upper().replace('/', '').replace(':USDT', '')
+
+    def _on_combined_message(self, stream: str, data: dict):
+        """결합 스트림 Message → Symbol별 kline Callback으로 전달"""
+        callback = self._stream_callbacks.get(stream)
+        if callback:
+            callback(data)
         
     def _kline_callback_wrapper(self, symbol: str):
         """
@@ -141,11 +214,14 @@ class BinanceWebSocketKlineManager:
                     k = msg['k']
                     price = float(k['c'])  # Current price
                     
-                    # 데이터 버퍼에 Save (1minute candles 기준)
-                    self._store_kline_data(symbol, '1m', kline_data)
-                    
-                    # 다른 Timeframe 집계 Create
-                    self._generate_higher_timeframes(symbol, kline_data)
+                    # Symbol lock 1times 획득으로 1m Save + 상위 Timeframe 집계 (스캔 스레드와 무관)
+                    with self._get_symbol_lock(symbol):
+                        # 다른 Timeframe 집계 Create
+                        # (1m 버퍼 갱신 전에 호출 → 부트스트랩 캔들 이어받기 시 Trade량 기준 정확)
+                        self._generate_higher_timeframes(symbol, kline_data)
+                        
+                        # 데이터 버퍼에 Save (1minute candles 기준)
+                        self._store_kline_data(symbol, '1m', kline_data)
                     
                     # Usage자 Callback 호출
                     if self.callback:
@@ -170,13 +246,16 @@ class BinanceWebSocketKlineManager:
         Returns:
             bool: Subscription success 여부
         """
-        if not self.is_running or not self.twm:
+        if not self.is_running or not self._has_transport:
             self.logger.error(f"WebSocket not started - {symbol} subscription impossible (running: {self.is_running}, twm: {self.twm is not None})")
             return False
+
+        if self.stream_client:
+            return self._subscribe_combined([symbol]) == 1
             
         with self.lock:
             # Symbol 정규화
-            clean_symbol = symbol.upper().replace('/', '').replace(':USDT', '')
+            clean_symbol = self._clean_symbol(symbol)
             
             if clean_symbol in self.subscribed_symbols:
                 self.logger.debug(f"{clean_symbol} Already subscribed")
@@ -220,11 +299,15 @@ class BinanceWebSocketKlineManager:
         Returns:
             bool: Unsubscribe Success 여부
         """
-        if not self.is_running or not self.twm:
+        if not self.is_running or not self._has_transport:
+            return True
+
+        if self.stream_client:
+            self._unsubscribe_combined([symbol])
             return True
             
         with self.lock:
-            clean_symbol = symbol.upper().replace('/', '').replace(':USDT', '')
+            clean_symbol = self._clean_symbol(symbol)
             
             if clean_symbol not in self.subscribed_symbols:
                 return True
@@ -267,6 +350,12 @@ class BinanceWebSocketKlineManager:
             self.logger.info(f"Batch subscription start: {len(symbols)} Symbol, Timeframe: {timeframes}")
         else:
             self.logger.info(f"Batch subscription start: {len(symbols)} Symbol")
+
+        if self.stream_client:
+            # 결합 스트림: Connections당 SUBSCRIBE 프레임 1count로 일괄 Add (Symbol 간 지연 불Required)
+            success_count = self._subscribe_combined(symbols)
+            self.logger.info(f"Batch subscription complete: {success_count}/{len(symbols)} Success")
+            return success_count
             
         success_count = 0
         
@@ -296,6 +385,12 @@ class BinanceWebSocketKlineManager:
         Returns:
             int: Success한 Unsubscribe 수
         """
+        if self.stream_client:
+            success_count = len(symbols)
+            self._unsubscribe_combined(symbols)
+            self.logger.info(f"Batch unsubscribe complete: {success_count}/{len(symbols)} Success")
+            return success_count
+
         success_count = 0
         
         for symbol in symbols:
@@ -304,6 +399,54 @@ class BinanceWebSocketKlineManager:
                 
         self.logger.info(f"Batch unsubscribe complete: {success_count}/{len(symbols)} Success")
         return success_count
+
+    def _subscribe_combined(self, symbols: List[str]) -> int:
+        """결합 스트림에 Symbol 일괄 Add (이미 Subscription 중인 Symbol도 Success로 집계)"""
+        with self.lock:
+            clean_symbols = list(dict.fromkeys(self._clean_symbol(s) for s in symbols))
+            new_symbols = [s for s in clean_symbols if s not in self.subscribed_symbols]
+
+            streams = []
+            for clean_symbol in new_symbols:
+                stream = kline_stream_name(clean_symbol, '1m')
+                self._stream_callbacks[stream] = self._kline_callback_wrapper(clean_symbol)
+                streams.append(stream)
+
+            try:
+                self.stream_client.subscribe(streams)
+            except Exception as e:
+                self.logger.error(f"❌ Combined stream subscription failed ({len(streams)} Symbol): {e}")
+                for stream in streams:
+                    self._stream_callbacks.pop(stream, None)
+                return len(clean_symbols) - len(new_symbols)
+
+            for clean_symbol, stream in zip(new_symbols, streams):
+                self.subscribed_symbols.add(clean_symbol)
+                self.stream_keys[clean_symbol] = stream
+
+        if new_symbols:
+            self.logger.info(f"✅ Combined stream subscription: +{len(new_symbols)} Symbol "
+                             f"(총 {len(self.subscribed_symbols)}, Connections {self.stream_client.connection_count})")
+        return len(clean_symbols)
+
+    def _unsubscribe_combined(self, symbols: List[str]):
+        """결합 스트림에서 Symbol 일괄 Remove"""
+        with self.lock:
+            streams = []
+            for symbol in symbols:
+                clean_symbol = self._clean_symbol(symbol)
+                stream = self.stream_keys.pop(clean_symbol, None)
+                self.subscribed_symbols.discard(clean_symbol)
+                if stream:
+                    streams.append(stream)
+
+            try:
+                self.stream_client.unsubscribe(streams)
+            except Exception as e:
+                self.logger.error(f"Combined stream unsubscribe failed: {e}")
+            finally:
+                for stream in streams:
+                    self._stream_callbacks.pop(stream, None)
         
     def get_subscribed_symbols(self) -> Set[str]:
         """Current Subscription 중인 Symbol 목록 반환"""
@@ -319,7 +462,11 @@ class BinanceWebSocketKlineManager:
             'message_count': self.message_count,
             'error_count': self.error_count,
             'stream_count': len(self.stream_keys),
-            'last_message_age': time.time() - self.last_message_time if self.last_message_time > 0 else -1
+            'connection_count': self.stream_client.connection_count if self.stream_client else len(self.stream_keys),
+            'last_message_age': time.time() - self.last_message_time if self.last_message_time > 0 else -1,
+            'gaps_detected': self.gap_count,
+            'incomplete_symbols': len(self.get_health_report()),
+            'gap_repair': self.gap_repairer.get_stats() if self.gap_repairer else None
         }
         
     def is_healthy(self) -> bool:
@@ -327,8 +474,10 @@ class BinanceWebSocketKlineManager:
         if not self.is_connected or not self.is_running:
             return False
             
-        # ThreadedWebsocketManager Status 체크
-        if not self.twm:
+        # ThreadedWebsocketManager / 결합 스트림 Status 체크
+        if not self._has_transport:
+            return False
+        if self.stream_client and not self.stream_client.is_connected:
             return False
             
         # 30초 이상 Message가 없으면 비정상 (Subscription이 있는 경우)
@@ -339,167 +488,222 @@ class BinanceWebSocketKlineManager:
                 
         return True
     
+    def _get_symbol_lock(self, symbol: str) -> threading.Lock:
+        """Symbol별 버퍼 writer lock 반환 (없으면 Create)"""
+        lock = self._symbol_locks.get(symbol)
+        if lock is None:
+            with self._registry_lock:
+                lock = self._symbol_locks.setdefault(symbol, threading.Lock())
+        return lock
+
+    def _get_or_create_buffer(self, buffer_key: str) -> KlineRingBuffer:
+        """버퍼 Key에 해당하는 링 버퍼 반환 (없으면 Create)"""
+        buffer = self.kline_buffer.get(buffer_key)
+        if buffer is None:
+            with self._registry_lock:
+                buffer = self.kline_buffer.get(buffer_key)
+                if buffer is None:
+                    timeframe = buffer_key.rsplit('_', 1)[-1]
+                    buffer = KlineRingBuffer(self.buffer_capacity, interval_ms=timeframe_to_ms(timeframe))
+                    self.kline_buffer[buffer_key] = buffer
+        return buffer
+
     def _store_kline_data(self, symbol: str, timeframe: str, kline_data: dict):
-        """Kline 데이터를 버퍼에 Save"""
+        """Kline 데이터를 버퍼에 Save (Symbol lock 보유 상태에서 호출)"""
         try:
-            with self.lock:
-                # 버퍼 Key Create
-                buffer_key = f"{symbol}_{timeframe}"
-                
-                if buffer_key not in self.kline_buffer:
-                    self.kline_buffer[buffer_key] = []
-                
-                # Kline 데이터에서 Required한 Info 추출
-                k = kline_data.get('k', {})
-                candle = {
-                    'timestamp': k.get('t', 0),
-                    'open': float(k.get('o', 0)),
-                    'high': float(k.get('h', 0)),
-                    'low': float(k.get('l', 0)),
-                    'close': float(k.get('c', 0)),
-                    'volume': float(k.get('v', 0)),
-                    'close_time': k.get('T', 0),
-                    'is_final': k.get('x', False)  # 캔들 Complete 여부
-                }
-                
-                # Legacy 데이터가 있으면 마지막 캔들 Update, 없으면 Add
-                buffer = self.kline_buffer[buffer_key]
-                if buffer and buffer[-1]['timestamp'] == candle['timestamp']:
-                    # 같은 타임스탬프의 캔들 Update
-                    buffer[-1] = candle
-                else:
-                    # New 캔들 Add
-                    buffer.append(candle)
-                
-                # 버퍼 Size 제한 (최대 1500count)
-                if len(buffer) > 1500:
-                    self.kline_buffer[buffer_key] = buffer[-1500:]
-        
+            # Kline 데이터에서 Required한 Info 추출
+            k = kline_data.get('k', {})
+            buffer = self._get_or_create_buffer(f"{symbol}_{timeframe}")
+
+            # 같은 타임스탬프면 마지막 캔들 Update, 아니면 Add (O(1), trim 없음)
+            gap = buffer.upsert(
+                k.get('t', 0),
+                float(k.get('o', 0)),
+                float(k.get('h', 0)),
+                float(k.get('l', 0)),
+                float(k.get('c', 0)),
+                float(k.get('v', 0)),
+                is_final=k.get('x', False),  # 캔들 Complete 여부
+                close_time=k.get('T', 0)
+            )
+            if gap:
+                self._on_gap(symbol, timeframe, *gap)
+
         except Exception as e:
             self.logger.error(f"Kline data save failed ({symbol}, {timeframe}): {e}")
-    
+
+    def _on_gap(self, symbol: str, timeframe: str, since: int, count: int):
+        """ingest 중 누락 구간 탐지 → 보충 큐에 등록 (보충 비Active 시 health에만 남음)"""
+        self.gap_count += 1
+        self.logger.warning(f"⚠️ {symbol} {timeframe} 캔들 누락 탐지: {count}count "
+                            f"({time.strftime('%H:%M', time.gmtime(since / 1000))} UTC부터)")
+        if self.gap_repairer is not None:
+            self.gap_repairer.enqueue(symbol, timeframe, since, count)
+
+    def enable_gap_repair(self, exchange=None, fetch: Optional[Callable] = None,
+                          rate_limiter=None) -> KlineGapRepairer:
+        """
+        누락 캔들 자동 보충 Activate (이미 Active면 Legacy 보충 큐 반환)
+
+        Args:
+            exchange: ccxt exchange 객체 (공용 Rate Limiter 벌크 레인 승인 후 fetch_ohlcv)
+            fetch: fetch(symbol, timeframe, limit, since) - 승인 / 통계를 직접 처리하는 요청 함수
+            rate_limiter: 벌크 레인 승인 Limiter (None이면 공용 Limiter)
+        """
+        if self.gap_repairer is None:
+            self.gap_repairer = KlineGapRepairer(self, exchange=exchange, fetch=fetch,
+                                                 rate_limiter=rate_limiter, logger=self.logger)
+            self.gap_repairer.start()
+            # Activate 이전에 탐지된 구간도 보충
+            for buffer_key, buffer in list(self.kline_buffer.items()):
+                symbol, timeframe = buffer_key.rsplit('_', 1)
+                if timeframe == '1m':
+                    for since, count in buffer.gaps():
+                        self.gap_repairer.enqueue(symbol, timeframe, since, count)
+            self.logger.info("🩹 누락 캔들 자동 보충 Active화")
+        return self.gap_repairer
+
+    def merge_klines(self, symbol: str, timeframe: str, timestamps, ohlcv, now_ms: Optional[int] = None) -> int:
+        """
+        REST 캔들을 버퍼에 Time 순 병합 (누락 구간 보충, Symbol lock 획득)
+
+        1m 병합 시 병합 구간부터 상위 Timeframe을 1m에서 재Create합니다.
+
+        Returns:
+            int: 병합한 캔들 수
+        """
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        if len(timestamps) == 0:
+            return 0
+        timeframe_ms = timeframe_to_ms(timeframe)
+        now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+
+        with self._get_symbol_lock(symbol):
+            self._get_or_create_buffer(f"{symbol}_{timeframe}").merge(
+                timestamps, ohlcv,
+                is_final=timestamps + timeframe_ms <= now_ms,
+                close_times=timestamps + timeframe_ms - 1
+            )
+            if timeframe == '1m':
+                self.rebuild_higher_timeframes(symbol, int(timestamps.min()))
+        return len(timestamps)
+
+    def rebuild_higher_timeframes(self, symbol: str, since: int, timeframes: Optional[Iterable[str]] = None):
+        """
+        1m 버퍼에서 since 구간부터 상위 Timeframe 재Create (Symbol lock 보유 상태에서 호출)
+
+        Args:
+            timeframes: 재Create할 Timeframe (None이면 버퍼가 있는 리샘플러 Timeframe 전체)
+        """
+        minute_buffer = self.kline_buffer.get(f"{symbol}_1m")
+        if not minute_buffer:
+            return
+        if timeframes is None:
+            timeframes = [tf for tf in self.resampler.timeframes if f"{symbol}_{tf}" in self.kline_buffer]
+
+        minute = minute_buffer.snapshot(0)
+        for timeframe in timeframes:
+            minutes = self.resampler.timeframe_minutes[timeframe]
+            data = resample_ohlcv(minute['timestamp'], minute['ohlcv'], minutes, minute['is_final'])
+            # 1m 윈도우 앞쪽에서 잘린 구간은 resample_ohlcv가 제외 → 기존 캔들 유지
+            keep = data['timestamp'] >= align_timestamp(since, minutes)
+            if keep.any():
+                self._get_or_create_buffer(f"{symbol}_{timeframe}").merge(
+                    data['timestamp'][keep], data['ohlcv'][keep],
+                    is_final=data['is_final'][keep], close_times=data['close_time'][keep]
+                )
+        # 재Create한 캔들에서 다시 이어서 집계 (seed_provider)
+        self.resampler.reset(symbol)
+
+    def get_buffer_health(self, symbol: str, timeframes: Optional[Iterable[str]] = None) -> dict:
+        """
+        Symbol 버퍼 health (lock 없음)
+
+        Returns:
+            dict: Timeframe별 링 버퍼 health + pending_repairs (보충 대기 구간 수) /
+                  complete (1m 버퍼에 누락 구간이 없으면 True)
+        """
+        # ingest 버퍼는 정규화된 Symbol (BTCUSDT) Key, 벌크 부트스트랩 버퍼는 전달받은 Symbol 그대로
+        if f"{symbol}_1m" not in self.kline_buffer:
+            symbol = self._clean_symbol(symbol)
+        prefix = f"{symbol}_"
+        frames = {
+            key[len(prefix):]: buffer.health()
+            for key, buffer in list(self.kline_buffer.items())
+            if key.startswith(prefix) and (timeframes is None or key[len(prefix):] in timeframes)
+        }
+        minute = frames.get('1m')
+        return {
+            'symbol': symbol,
+            'timeframes': frames,
+            'gap_count': minute['gap_count'] if minute else 0,
+            'missing_candles': minute['missing_candles'] if minute else 0,
+            'max_gap': minute['max_gap'] if minute else 0,
+            'pending_repairs': self.gap_repairer.pending(symbol) if self.gap_repairer else 0,
+            'complete': minute is not None and minute['gap_count'] == 0
+        }
+
+    def get_health_report(self) -> Dict[str, dict]:
+        """1m 버퍼에 누락 구간이 있는 Symbol별 health (정상 Symbol은 제외)"""
+        report = {}
+        for key in list(self.kline_buffer):
+            symbol, timeframe = key.rsplit('_', 1)
+            if timeframe == '1m' and self.kline_buffer[key].health()['gap_count']:
+                report[symbol] = self.get_buffer_health(symbol, timeframes=('1m',))
+        return report
+
     def get_kline_buffer(self, symbol: str, timeframe: str, limit: int = 1000, as_dataframe: bool = True):
-        """버퍼에서 Kline 데이터 조times"""
+        """
+        버퍼에서 Kline 데이터 조times (lock 없음)
+
+        링 버퍼의 seqlock 스냅샷을 반환하므로 ingest 스레드를 막지 않고,
+        조times 도중 New 캔들이 들어와도 항상 일관된 데이터를 받습니다.
+        """
         try:
-            with self.lock:
-                buffer_key = f"{symbol}_{timeframe}"
-                
-                if buffer_key not in self.kline_buffer:
-                    return pd.DataFrame() if as_dataframe else []
-                
-                buffer = self.kline_buffer[buffer_key]
-                
-                # 최신 limitcount 선택
-                if limit > 0:
-                    selected_data = buffer[-limit:] if len(buffer) > limit else buffer
-                else:
-                    selected_data = buffer
-                
-                if not selected_data:
-                    return pd.DataFrame() if as_dataframe else []
-                
-                if as_dataframe:
-                    # DataFrame으로 변환
-                    df_data = []
-                    for candle in selected_data:
-                        df_data.append([
-                            candle['timestamp'],
-                            candle['open'],
-                            candle['high'],
-                            candle['low'],
-                            candle['close'],
-                            candle['volume']
-                        ])
-                    
-                    df = pd.DataFrame(df_data, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-                    # 타임스탬프를 datetime으로 변환
-                    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-                    return df
-                else:
-                    return selected_data
-        
+            buffer = self.kline_buffer.get(f"{symbol}_{timeframe}")
+
+            if not buffer:
+                return pd.DataFrame() if as_dataframe else []
+
+            if as_dataframe:
+                return buffer.snapshot_dataframe(limit)
+            return buffer.to_records(limit)
+
         except Exception as e:
             self.logger.error(f"Kline Buffer 조times Failed ({symbol}, {timeframe}): {e}")
             return pd.DataFrame() if as_dataframe else []
     
     def _generate_higher_timeframes(self, symbol: str, kline_data: dict):
-        """1minute candles 데이터로부터 다른 Timeframe 집계 Create"""
+        """1minute candles 데이터로부터 다른 Timeframe 집계 Create (KlineResampler, Timeframe당 O(1))"""
         try:
-            # Timeframe별 분 단위
-            timeframe_minutes = {
-                '3m': 3,
-                '5m': 5,
-                '15m': 15,
-                '1d': 1440  # 1일 = 1440분
-            }
-            
             k = kline_data.get('k', {})
-            timestamp = k.get('t', 0)
-            if not timestamp:
+            if not k.get('t', 0):
                 return
-            
-            # 각 Timeframe별로 집계
-            for tf, minutes in timeframe_minutes.items():
-                # 타임스탬프를 해당 Timeframe의 Starting Time으로 맞춤
-                aligned_timestamp = self._align_timestamp(timestamp, minutes)
-                
-                with self.lock:
-                    buffer_key = f"{symbol}_{tf}"
-                    
-                    if buffer_key not in self.kline_buffer:
-                        self.kline_buffer[buffer_key] = []
-                    
-                    buffer = self.kline_buffer[buffer_key]
-                    
-                    # Legacy 캔들이 있고 같은 타임스탬프면 Update
-                    if buffer and buffer[-1]['timestamp'] == aligned_timestamp:
-                        # Legacy 캔들 Update
-                        existing = buffer[-1]
-                        existing['high'] = max(existing['high'], float(k.get('h', 0)))
-                        existing['low'] = min(existing['low'], float(k.get('l', 0)))
-                        existing['close'] = float(k.get('c', 0))
-                        existing['volume'] += float(k.get('v', 0))
-                        existing['close_time'] = k.get('T', 0)
-                        existing['is_final'] = k.get('x', False)
-                    else:
-                        # New 캔들 Create
-                        new_candle = {
-                            'timestamp': aligned_timestamp,
-                            'open': float(k.get('o', 0)),
-                            'high': float(k.get('h', 0)),
-                            'low': float(k.get('l', 0)),
-                            'close': float(k.get('c', 0)),
-                            'volume': float(k.get('v', 0)),
-                            'close_time': k.get('T', 0),
-                            'is_final': k.get('x', False)
-                        }
-                        buffer.append(new_candle)
-                    
-                    # 버퍼 Size 제한
-                    if len(buffer) > 1500:
-                        self.kline_buffer[buffer_key] = buffer[-1500:]
-        
+
+            # Symbol lock 보유 상태에서 호출됨 (추가 lock 없음)
+            for tf, candle in self.resampler.update_from_kline(symbol, k):
+                timestamp, open_, high, low, close, volume, is_final, close_time = candle
+                self._get_or_create_buffer(f"{symbol}_{tf}").upsert(
+                    timestamp, open_, high, low, close, volume,
+                    is_final=is_final,
+                    close_time=close_time
+                )
+
         except Exception as e:
             self.logger.error(f"상위 Timeframe Create Failed ({symbol}): {e}")
-    
-    def _align_timestamp(self, timestamp: int, minutes: int) -> int:
-        """타임스탬프를 지정된 분 단위로 정렬"""
-        try:
-            # 밀리초를 초로 변환
-            seconds = timestamp // 1000
-            
-            # 분 단위로 변환
-            minutes_since_epoch = seconds // 60
-            
-            # 지정된 분 단위로 정렬
-            aligned_minutes = (minutes_since_epoch // minutes) * minutes
-            
-            # 밀리초로 다시 변환
-            return aligned_minutes * 60 * 1000
-        
-        except Exception as e:
-            self.logger.error(f"Timestamp alignment failed ({timestamp}, {minutes}): {e}")
-            return timestamp
+
+    def _resampler_seed(self, symbol: str, timeframe: str, bucket_timestamp: int):
+        """
+        집계 Status가 없을 때 REST 부트스트랩으로 채워진 미완성 캔들에서 이어서 집계
+        (_generate_higher_timeframes에서 Symbol lock 보유 상태로 호출됨)
+        """
+        buffer = self.kline_buffer.get(f"{symbol}_{timeframe}")
+        if not buffer or buffer.last_timestamp != bucket_timestamp:
+            return None
+
+        minute_buffer = self.kline_buffer.get(f"{symbol}_1m")
+        minute_candle = minute_buffer.last() if minute_buffer else None
+        return buffer.last(), minute_candle
 
 
 # Usage 예시
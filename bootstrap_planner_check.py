@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+부트스트랩 계획 / 병렬 부트스트랩 / 누락 구간 보충 Verification
+
+점검 항목:
+1. 계획: REST는 1m / 1d만, 3m·5m·15m은 1m에서 재Create (Symbol당 요청 수 / weight 비교)
+2. 1m에서 재Create한 상위 캔들 = 거래소 상위 캔들 (가짜 거래소는 1m 캔들을 집계해 상위 캔들 반환)
+3. 병렬 부트스트랩 vs Legacy 순차 부트스트랩 (요청당 + 캔들당 지연 시뮬레이션): 준비 Time / weight
+4. budget 부족 시 승인된 요청만 전송 (벌크 레인 상한 초과 없음)
+5. 재Connections 후 누락 구간: 중간 구간 + 끝 구간을 since= 범위로만 보충, 상위 Timeframe 재Create
+
+Usage:
+    python bootstrap_planner_check.py [--symbols 40] [--workers 8] [--latency-ms 20] [--per-candle-us 40]
+"""
+
+import argparse
+import logging
+import threading
+import time
+
+import numpy as np
+
+from binance_rate_limiter import BinanceRateLimiter
+from binance_websocket_kline_manager import BinanceWebSocketKlineManager
+from bulk_websocket_kline_manager import BulkWebSocketKlineManager, find_gaps
+from kline_store import timeframe_to_ms
+
+MINUTE_MS = 60_000
+
+
+class FakeExchange:
+    """1minute candles를 시각으로부터 결정적으로 Create, 15m 이하 상위 캔들은 1minute candles 집계 (요청당 / 캔들당 지연)"""
+
+    def __init__(self, latency: float = 0.0, per_candle: float = 0.0):
+        self.latency = latency
+        self.per_candle = per_candle
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def minute_candle(symbol: str, ts: int) -> list:
+        seed = sum(map(ord, symbol))
+        base = 100 + ((ts // MINUTE_MS) * 7 + seed) % 89
+        return [ts, base, base + 1 + (ts // MINUTE_MS) % 3, base - 1, base + 0.5, float(seed % 13 + (ts // MINUTE_MS) % 5)]
+
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        with self._lock:
+            self.calls.append((symbol, timeframe, since, limit))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency + self.per_candle * limit)
+            tf_ms = timeframe_to_ms(timeframe)
+            now_ms = int(time.time() * 1000)
+            current = now_ms // tf_ms * tf_ms
+            first = since // tf_ms * tf_ms if since is not None else current - (limit - 1) * tf_ms
+            last_minute = now_ms // MINUTE_MS * MINUTE_MS
+            rows = []
+            for ts in range(first, min(current, first + (limit - 1) * tf_ms) + 1, tf_ms):
+                if tf_ms > 15 * MINUTE_MS:
+                    # 1m에서 재Create하지 않는 Timeframe은 집계 없이 Create
+                    rows.append(self.minute_candle(symbol, ts))
+                    continue
+                minutes = [self.minute_candle(symbol, m) for m in range(ts, min(ts + tf_ms, last_minute + MINUTE_MS), MINUTE_MS)]
+                rows.append([ts, minutes[0][1], max(m[2] for m in minutes), min(m[3] for m in minutes),
+                             minutes[-1][4], sum(m[5] for m in minutes)])
+            return rows
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def make_manager(exchange, limiter, workers: int, logger) -> BulkWebSocketKlineManager:
+    base = BinanceWebSocketKlineManager(callback=None, logger=logger)
+    return BulkWebSocketKlineManager(base, exchange, logger, kline_store_dir=None,
+                                     rate_limiter=limiter, bootstrap_workers=workers)
+
+
+def make_limiter(logger) -> BinanceRateLimiter:
+    return BinanceRateLimiter(logger)
+
+
+def check(results: list, name: str, passed: bool, detail: str = ''):
+    results.append(passed)
+    print(f"  {'✅' if passed else '❌'} {name}" + (f" - {detail}" if detail else ''))
+
+
+def check_plan(results: list, logger):
+    print("\n[1] 부트스트랩 계획")
+    manager = make_manager(None, make_limiter(logger), 1, logger)
+    plan = manager.plan_bootstrap()
+    legacy_weight = sum(manager._kline_weight(limit) for limit in manager.BOOTSTRAP_LIMITS.values())
+    check(results, "REST는 1m / 1d만", plan['fetch'] == {'1m': 1500, '1d': 100}, f"{plan['fetch']}")
+    check(results, "3m / 5m / 15m은 1m에서 재Create", set(plan['derive']) == {'3m', '5m', '15m'})
+    check(results, "Symbol당 요청 / weight 감소", plan['weight'] < legacy_weight,
+          f"요청 {len(manager.BOOTSTRAP_LIMITS)} → {len(plan['fetch'])}, weight {legacy_weight} → {plan['weight']}")
+
+
+def check_parallel(results: list, logger, n_symbols: int, workers: int, latency: float, per_candle: float):
+    print(f"\n[2] 재Create 정확도 / [3] 병렬 부트스트랩 ({n_symbols} Symbol, 작업 스레드 {workers}, "
+          f"요청당 {latency * 1000:.0f}ms + 캔들당 {per_candle * 1e6:.0f}µs)")
+    symbols = [f"SYM{i}/USDT:USDT" for i in range(n_symbols)]
+
+    # Legacy: Symbol별 5 Timeframe 순차 요청 + 20ms delay
+    legacy_exchange = FakeExchange(latency, per_candle)
+    legacy_frames = {}
+    start = time.perf_counter()
+    for idx, symbol in enumerate(symbols, 1):
+        for timeframe, limit in BulkWebSocketKlineManager.BOOTSTRAP_LIMITS.items():
+            legacy_frames[(symbol, timeframe)] = legacy_exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+        if idx < len(symbols):
+            time.sleep(0.02)
+    legacy_time = time.perf_counter() - start
+    legacy_weight = sum(BulkWebSocketKlineManager._kline_weight(call[3]) for call in legacy_exchange.calls)
+
+    exchange = FakeExchange(latency, per_candle)
+    limiter = make_limiter(logger)
+    manager = make_manager(exchange, limiter, workers, logger)
+    manager.bootstrap_historical_data(symbols)
+    report = manager.last_bootstrap
+
+    # 상위 캔들 비교 (Legacy 요청 이후 분이 바뀌었을 수 있으므로 확정 캔들만)
+    mismatched = []
+    for (symbol, timeframe), rows in legacy_frames.items():
+        if timeframe not in manager.DERIVED_TIMEFRAMES:
+            continue
+        snapshot = manager.base_manager.kline_buffer[f"{symbol}_{timeframe}"].snapshot(0)
+        derived = {int(ts): row for ts, row in zip(snapshot['timestamp'], snapshot['ohlcv'])}
+        for row in rows[:-1]:
+            if row[0] in derived and not np.allclose(derived[row[0]], row[1:]):
+                mismatched.append((symbol, timeframe, row[0]))
+    lengths = {tf: len(manager.base_manager.kline_buffer[f"{symbols[0]}_{tf}"]) for tf in manager.BOOTSTRAP_LIMITS}
+    check(results, "재Create 캔들 = 거래소 상위 캔들", not mismatched, f"불일치 {len(mismatched)}count, 버퍼 길이 {lengths}")
+    check(results, "재Create 캔들 수 ≥ limit - 1",
+          all(lengths[tf] >= limit - 1 for tf, limit in manager.BOOTSTRAP_LIMITS.items()))
+    check(results, "동시 요청 ≤ 작업 스레드 수", exchange.max_in_flight <= workers,
+          f"최대 {exchange.max_in_flight}")
+    check(results, "리포트 weight = Limiter 집계", report['weight_used'] == limiter.get_used_weight(),
+          f"{report['weight_used']} (Legacy {legacy_weight})")
+    check(results, "병렬 부트스트랩이 더 빠름", report['seconds_to_ready'] < legacy_time,
+          f"Legacy {legacy_time:.2f}s (REST {len(legacy_exchange.calls)}times) → "
+          f"{report['seconds_to_ready']:.2f}s (REST {report['rest_calls']}times)")
+
+
+def check_budget(results: list, logger):
+    print("\n[4] budget 부족 시 승인 대기")
+    limiter = make_limiter(logger)
+    limiter._max_weight_per_minute = 100  # 벌크 레인 60 weight = 12 weight x 5 Symbol
+    exchange = FakeExchange()
+    manager = make_manager(exchange, limiter, 4, logger)
+    manager.request_timeout = 0.5
+    manager.bootstrap_historical_data([f"SYM{i}/USDT:USDT" for i in range(8)])
+    report = manager.last_bootstrap
+    sent_weight = sum(manager._kline_weight(call[3]) for call in exchange.calls)
+    check(results, "벌크 레인 상한 이내", sent_weight <= 60 and limiter.get_used_weight() <= 60,
+          f"전송 weight {sent_weight}, Symbol {report['loaded']} Load / {report['failed']} 대기 초과")
+
+
+def check_gap_backfill(results: list, logger, workers: int):
+    print("\n[5] 재Connections 후 누락 구간 보충")
+    symbols = [f"SYM{i}/USDT:USDT" for i in range(4)]
+    exchange = FakeExchange()
+    manager = make_manager(exchange, make_limiter(logger), workers, logger)
+    manager.bootstrap_historical_data(symbols)
+    originals = {key: buffer.snapshot(0) for key, buffer in manager.base_manager.kline_buffer.items()}
+
+    # 끊긴 동안: 1m 버퍼 중간 30분 누락 + 마지막 10분 미수신, 상위 버퍼도 해당 구간 이전 상태
+    for symbol in symbols:
+        data = originals[f"{symbol}_1m"]
+        keep = np.ones(len(data['timestamp']), dtype=bool)
+        keep[1000:1030] = False
+        keep[-10:] = False
+        manager.base_manager.kline_buffer[f"{symbol}_1m"].load(
+            data['timestamp'][keep], data['ohlcv'][keep], data['is_final'][keep], data['close_time'][keep])
+        for timeframe, minutes in manager.DERIVED_TIMEFRAMES.items():
+            derived = originals[f"{symbol}_{timeframe}"]
+            stale = derived['timestamp'] < data['timestamp'][1000] // (minutes * MINUTE_MS) * (minutes * MINUTE_MS)
+            manager.base_manager.kline_buffer[f"{symbol}_{timeframe}"].load(
+                derived['timestamp'][stale], derived['ohlcv'][stale], derived['is_final'][stale],
+                derived['close_time'][stale])
+
+    gaps = find_gaps(manager.base_manager.kline_buffer[f"{symbols[0]}_1m"].snapshot(0)['timestamp'],
+                     MINUTE_MS, int(time.time() * 1000))
+    exchange.calls.clear()
+    weight_before = manager.stats['weight_used']
+    filled = manager.backfill_gaps(symbols)
+    minute_calls = [call for call in exchange.calls if call[1] == '1m']
+
+    check(results, "누락 구간 탐지 (중간 + 끝)", len(gaps) == 2 and gaps[0][1] == 30 and gaps[1][1] >= 11,
+          f"{gaps[0][1]} / {gaps[1][1]} 캔들")
+    check(results, "since= 범위 요청만", all(call[2] is not None and call[3] <= 40 for call in minute_calls),
+          f"1m 요청 {len(minute_calls)}times, limit {sorted({call[3] for call in minute_calls})}, "
+          f"weight {manager.stats['weight_used'] - weight_before}, 보충 {filled}count")
+
+    restored = True
+    for symbol in symbols:
+        for timeframe in manager.BOOTSTRAP_LIMITS:
+            before = originals[f"{symbol}_{timeframe}"]
+            after = manager.base_manager.kline_buffer[f"{symbol}_{timeframe}"].snapshot(0)
+            # 보충 중 분이 바뀌었을 수 있으므로 원래 마지막 캔들 이전까지 비교
+            last = before['timestamp'][-1]
+            a = after['timestamp'] < last
+            b = before['timestamp'] < last
+            n = min(a.sum(), b.sum())
+            restored &= np.array_equal(after['timestamp'][a][-n:], before['timestamp'][b][-n:]) \
+                and np.allclose(after['ohlcv'][a][-n:], before['ohlcv'][b][-n:])
+    check(results, "1m / 상위 버퍼 복원", restored)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bootstrap planner check')
+    parser.add_argument('--symbols', type=int, default=40)
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--latency-ms', type=float, default=20, help='가짜 거래소 요청당 지연 (ms)')
+    parser.add_argument('--per-candle-us', type=float, default=40, help='가짜 거래소 캔들당 전송 지연 (µs)')
+    args = parser.parse_args()
+
+    logger = logging.getLogger('bootstrap_planner_check')
+    logger.setLevel(logging.WARNING)
+
+    results = []
+    print("📊 부트스트랩 계획 Verification")
+    check_plan(results, logger)
+    check_parallel(results, logger, args.symbols, args.workers, args.latency_ms / 1000, args.per_candle_us / 1e6)
+    check_budget(results, logger)
+    check_gap_backfill(results, logger, args.workers)
+
+    failed = results.count(False)
+    print(f"\n{'✅ 전체 통과' if not failed else f'❌ {failed} 항목 실패'} ({len(results)} 항목)")
+    return 0 if not failed else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
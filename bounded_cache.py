@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+Bounded Cache
+메모리 상한 (byte budget)이 있는 LRU Cache - OHLCV 프레임 / 범용 데이터 공용
+
+- 크기 측정: DataFrame / Series는 memory_usage(deep=True) 기준 (숫자 열만 있으면 dtype itemsize로 계산),
+  ndarray는 nbytes, 그 외 sys.getsizeof
+- 전체 byte budget 초과 시 가장 오래 Usage하지 않은 항목부터 Remove (O(1))
+- 네임스페이스별 TTL / 최대 항목 수 (예: 'surge_ohlcv' 300초, 'alpha_z_ohlcv' 1200초)
+- 통계: 네임스페이스별 hits / misses / evictions / expired / bytes
+
+프로세스 공용 인스턴스는 get_shared_cache() (상한: 환경 변수 SHARED_CACHE_MAX_MB, 기본 256MB)
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def estimate_nbytes(value: Any) -> int:
+    """Cache 항목 크기 추정 (bytes)"""
+    if isinstance(value, pd.DataFrame):
+        dtypes = value.dtypes
+        if all(dt.kind in 'biufcmM' for dt in dtypes):
+            # 숫자 / datetime 열만 있는 프레임 (OHLCV): memory_usage(deep=True)와 같은 값, 10배 이상 빠름
+            return len(value) * sum(dt.itemsize for dt in dtypes) + int(value.index.memory_usage())
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (list, tuple)) and value and isinstance(value[0], (list, tuple)):
+        # 캔들 리스트 등 2차원 리스트 (행 객체 + 숫자 객체)
+        return sys.getsizeof(value) + len(value) * (sys.getsizeof(value[0]) + 24 * len(value[0]))
+    return sys.getsizeof(value)
+
+
+class _NamespaceStats:
+    __slots__ = ('ttl', 'max_entries', 'entries', 'bytes', 'hits', 'misses', 'evictions', 'expired')
+
+    def __init__(self, ttl: float, max_entries: Optional[int]):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries = 0
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+
+    def as_dict(self) -> dict:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+class BoundedCache:
+    """byte budget LRU Cache (Thread-safe)"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            max_bytes: 전체 항목 크기 상한 (초과 시 LRU 항목부터 Remove)
+        """
+        self.max_bytes = max_bytes
+        # (namespace, key) -> (value, Save 시각, bytes)
+        self._entries: 'OrderedDict[tuple, tuple]' = OrderedDict()
+        self._namespaces: Dict[str, _NamespaceStats] = {}
+        self._ns_order: Dict[str, 'OrderedDict[Hashable, None]'] = {}  # 네임스페이스별 LRU 순서
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.rejected = 0  # 단일 항목이 budget보다 커서 Save하지 않음
+
+    def namespace(self, name: str, ttl: float, max_entries: Optional[int] = None) -> 'CacheNamespace':
+        """네임스페이스 Create (이미 있으면 TTL / 최대 항목 수 갱신)"""
+        with self._lock:
+            stats = self._namespaces.get(name)
+            if stats is None:
+                self._namespaces[name] = _NamespaceStats(ttl, max_entries)
+                self._ns_order[name] = OrderedDict()
+            else:
+                stats.ttl = ttl
+                stats.max_entries = max_entries
+        return CacheNamespace(self, name)
+
+    def get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        entry = self.get_entry(namespace, key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, namespace: str, key: Hashable) -> Optional[tuple]:
+        """(value, Save 시각) - 없거나 TTL 만료 시 None"""
+        with self._lock:
+            stats = self._namespaces[namespace]
+            full_key = (namespace, key)
+            entry = self._entries.get(full_key)
+            if entry is None:
+                stats.misses += 1
+                return None
+            if time.time() - entry[1] >= stats.ttl:
+                self._remove(full_key)
+                stats.expired += 1
+                stats.misses += 1
+                return None
+            self._entries.move_to_end(full_key)
+            self._ns_order[namespace].move_to_end(key)
+            stats.hits += 1
+            return entry[0], entry[1]
+
+    def set(self, namespace: str, key: Hashable, value: Any, stored_at: Optional[float] = None) -> bool:
+        """Save 후 budget / 네임스페이스 최대 항목 수 초과분 Remove - 항목이 budget보다 크면 False"""
+        nbytes = estimate_nbytes(value)
+        with self._lock:
+            stats = self._namespaces[namespace]
+            full_key = (namespace, key)
+            if full_key in self._entries:
+                self._remove(full_key)
+            if nbytes > self.max_bytes:
+                self.rejected += 1
+                return False
+            self._entries[full_key] = (value, time.time() if stored_at is None else stored_at, nbytes)
+            self._ns_order[namespace][key] = None
+            self._bytes += nbytes
+            stats.entries += 1
+            stats.bytes += nbytes
+
+            if stats.max_entries is not None and stats.entries > stats.max_entries:
+                self._remove((namespace, next(iter(self._ns_order[namespace]))))
+                stats.evictions += 1
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._namespaces[oldest[0]].evictions += 1
+            return True
+
+    def pop(self, namespace: str, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None:
+                return None
+            self._remove((namespace, key))
+            return entry[0]
+
+    def contains(self, namespace: str, key: Hashable) -> bool:
+        """TTL 유효 항목 여부 (LRU 순서 / 통계 변경 없음)"""
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            return entry is not None and time.time() - entry[1] < self._namespaces[namespace].ttl
+
+    def clear(self, namespace: Optional[str] = None):
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                self._bytes = 0
+                for name, stats in self._namespaces.items():
+                    stats.entries = stats.bytes = 0
+                    self._ns_order[name].clear()
+                return
+            for key in list(self._ns_order[namespace]):
+                self._remove((namespace, key))
+
+    def purge_expired(self) -> int:
+        """TTL 만료 항목 일괄 Remove (주기적 정리용, O(n))"""
+        now = time.time()
+        removed = 0
+        with self._lock:
+            for full_key, entry in list(self._entries.items()):
+                stats = self._namespaces[full_key[0]]
+                if now - entry[1] >= stats.ttl:
+                    self._remove(full_key)
+                    stats.expired += 1
+                    removed += 1
+        return removed
+
+    def _remove(self, full_key: tuple):
+        _, _, nbytes = self._entries.pop(full_key)
+        self._bytes -= nbytes
+        del self._ns_order[full_key[0]][full_key[1]]
+        stats = self._namespaces[full_key[0]]
+        stats.entries -= 1
+        stats.bytes -= nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """전체 / 네임스페이스별 통계"""
+        with self._lock:
+            namespaces = {name: stats.as_dict() for name, stats in self._namespaces.items()}
+            hits = sum(s['hits'] for s in namespaces.values())
+            misses = sum(s['misses'] for s in namespaces.values())
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'usage_pct': self._bytes / self.max_bytes * 100 if self.max_bytes else 0.0,
+                'hits': hits,
+                'misses': misses,
+                'hit_rate': hits / (hits + misses) * 100 if hits + misses else 0.0,
+                'evictions': sum(s['evictions'] for s in namespaces.values()),
+                'expired': sum(s['expired'] for s in namespaces.values()),
+                'rejected': self.rejected,
+                'namespaces': namespaces,
+            }
+
+
+class CacheNamespace:
+    """BoundedCache의 네임스페이스 뷰 (key → value, 네임스페이스 TTL 적용)"""
+
+    __slots__ = ('cache', 'name')
+
+    def __init__(self, cache: BoundedCache, name: str):
+        self.cache = cache
+        self.name = name
+
+    @property
+    def ttl(self) -> float:
+        return self.cache._namespaces[self.name].ttl
+
+    @ttl.setter
+    def ttl(self, value: float):
+        self.cache._namespaces[self.name].ttl = value
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        return self.cache.get(self.name, key)
+
+    def get_entry(self, key: Hashable) -> Optional[tuple]:
+        return self.cache.get_entry(self.name, key)
+
+    def set(self, key: Hashable, value: Any, stored_at: Optional[float] = None) -> bool:
+        return self.cache.set(self.name, key, value, stored_at)
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        return self.cache.pop(self.name, key)
+
+    def clear(self):
+        self.cache.clear(self.name)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.cache.contains(self.name, key)
+
+    def __len__(self) -> int:
+        return self.cache._namespaces[self.name].entries
+
+    def get_stats(self) -> dict:
+        with self.cache._lock:
+            return self.cache._namespaces[self.name].as_dict()
+
+
+_shared_cache: Optional[BoundedCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_cache() -> BoundedCache:
+    """프로세스 공용 BoundedCache (전략 OHLCV 프레임 등)"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                max_mb = float(os.environ.get('SHARED_CACHE_MAX_MB', DEFAULT_MAX_BYTES / (1024 * 1024)))
+                _shared_cache = BoundedCache(max_bytes=int(max_mb * 1024 * 1024))
+    return _shared_cache
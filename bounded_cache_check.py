@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+BoundedCache 동작 Verification / 장시간 스캔 메모리 시뮬레이션
+
+점검 항목:
+1. byte budget: 전체 크기가 max_bytes를 넘지 않음, 초과 시 LRU 항목부터 Remove
+2. 네임스페이스별 TTL / 최대 항목 수, 조times 시 LRU 순서 갱신
+3. 장시간 스캔 시뮬레이션: 스캔마다 Symbol 일부가 교체되는 400+ Symbol x 5 timeframe
+   → 이전 dict Cache (만료 항목 미Remove) 대비 항목 수 / 크기
+4. set / get 호출당 비용이 항목 수와 무관 (O(1) Remove)
+
+Usage:
+    python bounded_cache_check.py [--symbols 420] [--scans 96] [--budget-mb 64]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from bounded_cache import BoundedCache, estimate_nbytes
+
+TIMEFRAMES = ['1m', '3m', '5m', '15m', '1d']
+
+
+def make_frame(rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.standard_normal(rows).cumsum()
+    df = pd.DataFrame({
+        'timestamp': pd.to_datetime(1_700_000_000_000 + np.arange(rows) * 60_000, unit='ms'),
+        'open': close, 'high': close + 1, 'low': close - 1, 'close': close,
+        'volume': rng.random(rows) * 1000,
+    })
+    return df
+
+
+def check(results: list, name: str, passed: bool, detail: str = ''):
+    results.append(passed)
+    print(f"  {'✅' if passed else '❌'} {name}" + (f" - {detail}" if detail else ''))
+
+
+def check_budget(results: list):
+    print("\n[1] byte budget / LRU")
+    frame = make_frame(500, 0)
+    size = estimate_nbytes(frame)
+    cache = BoundedCache(max_bytes=size * 10)
+    ohlcv = cache.namespace('ohlcv', ttl=300)
+    for i in range(10):
+        ohlcv.set(i, frame)
+    check(results, "크기 측정 = memory_usage(deep=True)",
+          size == int(frame.memory_usage(index=True, deep=True).sum()), f"{size:,} bytes")
+    ohlcv.get(0)  # 0번을 최근 Usage으로
+    ohlcv.set(10, frame)
+    stats = cache.get_stats()
+    check(results, "크기 ≤ budget", stats['bytes'] <= cache.max_bytes, f"{stats['bytes']:,} / {cache.max_bytes:,} bytes")
+    check(results, "LRU Remove (조times한 항목 유지)", 0 in ohlcv and 1 not in ohlcv and 10 in ohlcv)
+    check(results, "evictions 집계", stats['evictions'] == 1, f"{stats['evictions']}")
+    check(results, "budget보다 큰 항목은 Save 안 함", not ohlcv.set('huge', make_frame(6000, 1))
+          and cache.get_stats()['rejected'] == 1)
+
+
+def check_namespaces(results: list):
+    print("\n[2] 네임스페이스 TTL / 최대 항목 수")
+    cache = BoundedCache(max_bytes=10 * 1024 * 1024)
+    fast = cache.namespace('fast', ttl=0.05)
+    slow = cache.namespace('slow', ttl=60)
+    data = cache.namespace('data', ttl=60, max_entries=3)
+    fast.set('BTC_1m', make_frame(100, 2))
+    slow.set('BTC_1m', make_frame(100, 3))
+    for i in range(5):
+        data.set(f"key{i}", {'price': i})
+    time.sleep(0.06)
+    check(results, "네임스페이스별 TTL", fast.get('BTC_1m') is None and slow.get('BTC_1m') is not None)
+    check(results, "같은 키 네임스페이스 분리", len(slow) == 1 and fast.get_stats()['expired'] == 1)
+    check(results, "네임스페이스 최대 항목 수", len(data) == 3 and data.get('key0') is None and data.get('key4') == {'price': 4},
+          f"{len(data)}count, evictions {data.get_stats()['evictions']}")
+    stats = cache.get_stats()
+    check(results, "hits / misses 집계", stats['hits'] == 2 and stats['misses'] == 2,
+          f"hits {stats['hits']}, misses {stats['misses']}, hit rate {stats['hit_rate']:.0f}%")
+
+
+def simulate_scans(results: list, n_symbols: int, scans: int, budget_mb: float):
+    print(f"\n[3] 스캔 {scans}times 시뮬레이션 ({n_symbols} Symbol x {len(TIMEFRAMES)} timeframe, 스캔마다 Symbol 10% 교체)")
+    frames = [make_frame(500, seed) for seed in range(8)]
+    cache = BoundedCache(max_bytes=int(budget_mb * 1024 * 1024))
+    ohlcv = cache.namespace('surge_ohlcv', ttl=300)
+    legacy = {}  # 이전 구현: TTL은 조times 시에만 확인, Remove 없음
+    legacy_bytes = 0
+
+    universe = n_symbols
+    active = list(range(n_symbols))
+    peak = 0
+    # 실제 Time은 흐르지 않으므로 TTL 만료 없음 - 크기는 LRU Remove로만 유지
+    for scan in range(scans):
+        for symbol in active:
+            for tf in TIMEFRAMES:
+                key = f"SYM{symbol}_{tf}"
+                frame = frames[(symbol + scan) % len(frames)]
+                if ohlcv.get(key) is None:
+                    ohlcv.set(key, frame, stored_at=time.time())
+                if key not in legacy:
+                    legacy_bytes += estimate_nbytes(frame)
+                legacy[key] = (frame, time.time())
+        peak = max(peak, cache.get_stats()['bytes'])
+        # Symbol 10% 교체 (상승률 상위 목록 변동)
+        replace = max(1, n_symbols // 10)
+        active = active[replace:] + list(range(universe, universe + replace))
+        universe += replace
+
+    stats = cache.get_stats()
+    check(results, "최대 크기 ≤ budget", peak <= cache.max_bytes,
+          f"최대 {peak / 1048576:.1f}MB / {budget_mb:.0f}MB, 항목 {stats['entries']:,}count")
+    check(results, "이전 dict Cache는 계속 증가", legacy_bytes > cache.max_bytes,
+          f"{len(legacy):,}count, {legacy_bytes / 1048576:.1f}MB")
+    print(f"  evictions {stats['evictions']:,} | hits {stats['hits']:,} | misses {stats['misses']:,}")
+
+
+def check_constant_cost(results: list):
+    print("\n[4] 항목 수별 set (Remove 포함) 비용")
+    frame = make_frame(50, 4)
+    size = estimate_nbytes(frame)
+    costs = []
+    for n in (1_000, 20_000):
+        cache = BoundedCache(max_bytes=size * n)
+        ns = cache.namespace('ohlcv', ttl=300)
+        for i in range(n):
+            ns.set(i, frame)
+        start = time.perf_counter()
+        for i in range(n, n + 5_000):
+            ns.set(i, frame)  # 매 set마다 LRU 항목 1count Remove
+        costs.append((time.perf_counter() - start) / 5_000 * 1e6)
+        print(f"  {n:>6,} 항목: {costs[-1]:.1f} µs/set")
+    check(results, "항목 수 20배에도 set 비용 유사 (≤ 2배)", costs[1] <= costs[0] * 2,
+          f"{costs[0]:.1f} → {costs[1]:.1f} µs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='BoundedCache check')
+    parser.add_argument('--symbols', type=int, default=420)
+    parser.add_argument('--scans', type=int, default=96, help='스캔 횟수 (15분 간격 96times = 하루)')
+    parser.add_argument('--budget-mb', type=float, default=64)
+    args = parser.parse_args()
+
+    results = []
+    print("📊 BoundedCache Verification")
+    check_budget(results)
+    check_namespaces(results)
+    simulate_scans(results, args.symbols, args.scans, args.budget_mb)
+    check_constant_cost(results)
+
+    failed = results.count(False)
+    print(f"\n{'✅ 전체 통과' if not failed else f'❌ {failed} 항목 실패'} ({len(results)} 항목)")
+    return 0 if not failed else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,6 +5,7 @@ Bulk WebSocket Kline Manager
 
 특징:
 - 1minute candles만 Subscription, 리샘플링으로 다른 Timeframe Create
+- 결합 스트림 모드에서 일괄 Subscription (200count Symbol도 SUBSCRIBE 프레임 1~2count, 1초 이내)
 - Candle Close 이벤트 기반 스캔 트리거
 - 동적 Symbol Filtering (30초 주기)
 - 방어 로직 3종 (heartbeat, Sync, flush)
@@ -14,7 +15,12 @@ Bulk WebSocket Kline Manager
 - Bootstrap API calls: 65.9% 감소 (4100 → 1400 per symbol)
 - Bootstrap Time: 60% 빠름 (5분 → 2분 for 150 symbols)
 - 전략별 최대 look-back 기간만 Load (ma480, bb480, SuperTrend 등)
-- Rate Limit protection: 20ms delay (per minute 375times → 31% Usage률)
+- 부트스트랩 계획: 1m / 1d만 REST Load, 3m·5m·15m은 1m에서 재Create (Symbol당 요청 5 → 2, weight 16 → 12)
+- 병렬 부트스트랩: 작업 스레드 풀 (기본 8) + 공용 Rate Limiter 벌크 레인 승인 (고정 delay 대신 budget 대기)
+- 재Connections 후 누락 구간만 since= 범위로 보충 (전체 윈도우 재Load 없음)
+- 부트스트랩 후 ingest 중 탐지된 누락 캔들도 같은 벌크 레인 요청으로 자동 보충 (kline_gap_repair.py)
+- 웜 스타트: 버퍼를 주기적으로 KlineStore (memory-mapped File)에 체크포인트,
+  재Starting 시 File에서 Load 후 마지막 캔들 이후 누락 구간만 REST로 보충 (Symbol당 수 count 캔들)
 """
 
 import time
@@ -22,10 +28,17 @@ import logging
 import threading
 import json
 import os
-from typing import List, Dict, Optional, Callable, Set
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, Callable, Set, Tuple
 from collections import defaultdict
+import numpy as np
 import pandas as pd
 
+from binance_rate_limiter import PRIORITY_BULK, BinanceRateLimiter, RateLimitedExchange, get_rate_limiter
+from kline_resampler import resample_ohlcv
+from kline_store import KlineStore, timeframe_to_ms
+from persistence_scheduler import get_persistence_scheduler
+
 # Legacy WebSocket 매니저 재Usage
 try:
     from binance_websocket_kline_manager import BinanceWebSocketKlineManager
@@ -35,6 +48,27 @@ except ImportError:
     HAS_WS_MANAGER = False
 
 
+def find_gaps(timestamps, timeframe_ms: int, now_ms: int) -> List[Tuple[int, int]]:
+    """
+    버퍼 타임스탬프의 누락 구간 → [(since, 캔들 수), ...]
+
+    - 중간: 연속 캔들 간격이 timeframe보다 큰 구간
+    - 끝: 마지막 캔들 (미완성일 수 있음)부터 Current 캔들까지
+    """
+    gaps = []
+    if len(timestamps) == 0:
+        return gaps
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    diffs = np.diff(timestamps)
+    for i in np.flatnonzero(diffs > timeframe_ms):
+        gaps.append((int(timestamps[i]) + timeframe_ms, int(diffs[i]) // timeframe_ms - 1))
+    last = int(timestamps[-1])
+    current = now_ms // timeframe_ms * timeframe_ms
+    if current > last:
+        gaps.append((last, (current - last) // timeframe_ms + 1))
+    return gaps
+
+
 class BulkWebSocketKlineManager:
     """150count Symbol 일괄 관리 WebSocket 매니저"""
 
@@ -47,16 +81,32 @@ class BulkWebSocketKlineManager:
         '1d': 100    # 3count월 데이터
     }
 
-    def __init__(self, base_manager: 'BinanceWebSocketKlineManager', exchange, logger=None):
+    # 1m에서 재Create하는 상위 Timeframe (분) - 나머지 (1d)는 REST로 직접 Load
+    DERIVED_TIMEFRAMES = {'3m': 3, '5m': 5, '15m': 15}
+    MAX_KLINES_PER_REQUEST = 1500  # 선물 fetch_ohlcv 1times 최대 캔들 수
+    KLINES_ENDPOINT = '/fapi/v1/klines'
+
+    OHLCV_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+    def __init__(self, base_manager: 'BinanceWebSocketKlineManager', exchange, logger=None,
+                 kline_store_dir: Optional[str] = 'kline_store', checkpoint_interval: float = 60,
+                 rate_limiter: Optional[BinanceRateLimiter] = None, bootstrap_workers: int = 8):
         """
         Args:
             base_manager: Legacy WebSocket 매니저 (리샘플링 기능 재Usage)
             exchange: ccxt exchange 객체 (Initial data Load용)
             logger: 로거 인스턴스
+            kline_store_dir: 캔들 체크포인트 디렉토리 (None이면 웜 스타트 비Active화)
+            checkpoint_interval: 체크포인트 주기 (초)
+            rate_limiter: 부트스트랩 요청 승인 Limiter (None이면 첫 요청 시 공용 Limiter)
+            bootstrap_workers: 부트스트랩 / 누락 구간 보충 동시 요청 스레드 수
         """
         self.base_manager = base_manager
         self.exchange = exchange
         self.logger = logger or logging.getLogger(__name__)
+        self.rate_limiter = rate_limiter
+        self.bootstrap_workers = bootstrap_workers
+        self.request_timeout = 90  # 벌크 레인 budget 대기 상한 (초)
 
         # ✅ set()으로 Subscription Status 추적
         self.subscribed_symbols: Set[str] = set()
@@ -81,13 +131,29 @@ class BulkWebSocketKlineManager:
         self.data_sync_threshold = 120  # 2분 지연 시 재Connections
         self.candle_close_timeout = 65  # 1분 + 5초 여유
 
+        # 캔들 체크포인트 (웜 스타트용, 디렉토리는 첫 기록 시 Create)
+        capacity = getattr(base_manager, 'buffer_capacity', 1500)
+        self.kline_store = KlineStore(kline_store_dir, capacity=capacity, logger=self.logger) if kline_store_dir else None
+        self.checkpoint_interval = checkpoint_interval
+        self._checkpoint_thread: Optional[threading.Thread] = None
+        self._checkpoint_stop = threading.Event()
+
         # 통계
         self.stats = {
             'total_messages': 0,
             'candle_close_events': 0,
             'scan_triggers': 0,
-            'reconnections': 0
+            'reconnections': 0,
+            'rest_calls': 0,
+            'full_loads': 0,           # BOOTSTRAP_LIMITS 전체 Load (File 없음 / 누락 구간 큼)
+            'weight_used': 0,          # 부트스트랩 / 보충 요청 weight 합
+            'warm_frames': 0,          # File에서 Load한 Symbol-Timeframe 수
+            'backfilled_candles': 0,   # 웜 스타트 시 REST로 보충한 캔들 수
+            'gap_fills': 0,            # 재Connections 후 누락 구간 보충 요청 수
+            'gap_candles': 0           # 재Connections 후 보충한 캔들 수
         }
+        self._stats_lock = threading.Lock()
+        self.last_bootstrap: Optional[dict] = None  # 마지막 부트스트랩 리포트
 
         self.logger.info("🚀 BulkWebSocketKlineManager Initialization complete")
 
@@ -120,19 +186,22 @@ class BulkWebSocketKlineManager:
         self.logger.info(f"🚀 New Subscription: {len(new_symbols)}count Symbol (Legacy: {len(self.subscribed_symbols)}count)")
 
         success_count = 0
-        for symbol in new_symbols:
-            try:
-                # 1minute candles만 Subscription (리샘플링으로 다른 Timeframe Create)
-                self.base_manager.subscribe_symbol(symbol, '1m')
+        try:
+            # 1minute candles만 일괄 Subscription (리샘플링으로 다른 Timeframe Create)
+            # 결합 스트림 모드면 Connections당 프레임 1count, 소켓 모드면 Symbol별 소켓 (지연 없음)
+            self.base_manager.subscribe_batch(new_symbols, delay=0)
+        except Exception as e:
+            self.logger.error(f"❌ Batch subscription failed: {e}")
 
+        active_symbols = self.base_manager.get_subscribed_symbols()
+        for symbol in new_symbols:
+            self.pending_symbols.discard(symbol)
+            if self.base_manager._clean_symbol(symbol) in active_symbols:
                 # Subscription success Process
                 self.subscribed_symbols.add(symbol)
-                self.pending_symbols.discard(symbol)
                 success_count += 1
-
-            except Exception as e:
-                self.logger.error(f"❌ {symbol} Subscription failed: {e}")
-                self.pending_symbols.discard(symbol)
+            else:
+                self.logger.error(f"❌ {symbol} Subscription failed")
 
         self.logger.info(f"✅ Subscription Complete: {success_count}/{len(new_symbols)}count Success (총 {len(self.subscribed_symbols)}count Active)")
         self.connection_active = True
@@ -158,83 +227,314 @@ class BulkWebSocketKlineManager:
 
         self.logger.info(f"🗑️ Unsubscribe: {len(symbols_to_remove)}count Symbol")
 
-        for symbol in symbols_to_remove:
-            try:
-                self.base_manager.unsubscribe_symbol(symbol, '1m')
-                self.subscribed_symbols.discard(symbol)
-            except Exception as e:
-                self.logger.error(f"❌ {symbol} Unsubscribe Failed: {e}")
+        try:
+            self.base_manager.unsubscribe_batch(symbols_to_remove)
+            self.subscribed_symbols.difference_update(symbols_to_remove)
+        except Exception as e:
+            self.logger.error(f"❌ Unsubscribe Failed: {e}")
+
+    def plan_bootstrap(self) -> dict:
+        """
+        부트스트랩 계획: REST로 받을 기본 Timeframe / 1m에서 재Create할 상위 Timeframe
+
+        상위 Timeframe은 limit x 분이 1times 요청 최대치 (1500) 이내면 1m에서 재Create합니다.
+        (1m 1500count → 3m 500 / 5m 300 / 15m 100, 첫 구간이 중간부터 시작하면 1count 적음 - 여유 20 이내)
+
+        Returns:
+            dict: {'fetch': {timeframe: limit}, 'derive': {timeframe: (분, limit)}, 'weight': Symbol당 weight}
+        """
+        fetch = {}
+        derive = {}
+        minute_limit = self.BOOTSTRAP_LIMITS.get('1m', 0)
+        for timeframe, limit in self.BOOTSTRAP_LIMITS.items():
+            minutes = self.DERIVED_TIMEFRAMES.get(timeframe)
+            if minutes and limit * minutes <= self.MAX_KLINES_PER_REQUEST:
+                derive[timeframe] = (minutes, limit)
+                minute_limit = max(minute_limit, limit * minutes)
+            elif timeframe != '1m':
+                fetch[timeframe] = limit
+        if minute_limit:
+            fetch = {'1m': minute_limit, **fetch}
+        return {
+            'fetch': fetch,
+            'derive': derive,
+            'weight': sum(self._kline_weight(limit) for limit in fetch.values()),
+        }
+
+    @staticmethod
+    def _kline_weight(limit: int) -> int:
+        return BinanceRateLimiter._limit_weight(limit, BinanceRateLimiter.KLINE_LIMIT_WEIGHTS)
+
+    def _count(self, key: str, amount: int = 1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def _get_rate_limiter(self) -> BinanceRateLimiter:
+        if self.rate_limiter is None:
+            self.rate_limiter = getattr(self.exchange, 'rate_limiter', None) or get_rate_limiter(self.logger)
+        return self.rate_limiter
 
     def bootstrap_historical_data(self, symbols: List[str]):
         """
         초기 부트스트랩: REST API로 역사 데이터 Load (1times만 Execute)
 
-        ⏱️ Expected Time (Rate Limit protection 포함):
-        - 150count Symbol: Approx 2분 (Legacy 5분 vs 60% 빠름)
-        - 200count Symbol: Approx 2.5분 (Legacy 7분 vs 64% 빠름)
-
-        📊 최적화 효과:
-        - API calls: 615,000 → 210,000 (65.9% 감소)
-        - 전략별 필수 look-back 기간만 Load
+        📋 계획 (plan_bootstrap):
+        - 1m (1500count) / 1d (100count)만 REST Load → Symbol당 2 요청, weight 12 (Legacy 5 요청, weight 16)
+        - 3m / 5m / 15m은 1m에서 재Create (WebSocket 리샘플러와 같은 구간 정렬)
 
         🛡️ Rate Limit protection:
-        - Symbol당 20ms delay (per minute 375times API calls)
-        - Binance limit(1,200times/분) vs 31% Usage
-        - IP ban risk almost 0%
+        - Symbol 단위 작업을 스레드 풀 (bootstrap_workers)로 병렬 요청
+        - 요청마다 공용 Rate Limiter 벌크 레인 승인 (budget 60%까지, 다른 봇 사용분 포함) - 부족하면 대기
+        - 고정 delay 없음: budget 여유가 있으면 즉시, 없으면 윈도우가 빌 때까지 대기
+
+        💾 웜 스타트 (kline_store 있음):
+        - 체크포인트 File이 있으면 Load 후 마지막 캔들부터 누락 구간만 Request (limit = 누락 캔들 수 + 1)
+        - File이 없거나 누락 구간이 계획 limit 이상이면 전체 Load
+        - Complete 후 주기적 체크포인트 자동 Starting
+
+        📊 리포트: 사용 weight / REST 요청 수 / 준비 Time (last_bootstrap, get_status)
         """
         self.logger.info(f"🔄 Initial data 로딩 Starting: {len(symbols)}count Symbol")
 
+        started = time.time()
+        plan = self.plan_bootstrap()
+        weight_before = self.stats['weight_used']
+        calls_before = self.stats['rest_calls']
+        self.logger.info(f"📋 부트스트랩 계획: REST {plan['fetch']} | 1m에서 재Create {list(plan['derive'])} | "
+                         f"Symbol당 최대 weight {plan['weight']}")
+
         total_symbols = len(symbols)
         loaded_symbols = 0
         failed_symbols = []
 
-        for idx, symbol in enumerate(symbols, 1):
-            try:
+        workers = max(1, min(self.bootstrap_workers, total_symbols))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='KlineBootstrap') as pool:
+            futures = {pool.submit(self._bootstrap_symbol, symbol, plan): symbol for symbol in symbols}
+            for idx, future in enumerate(as_completed(futures), 1):
+                symbol = futures[future]
+                try:
+                    future.result()
+                    loaded_symbols += 1
+                except Exception as e:
+                    self.logger.error(f"❌ {symbol} Initial data Load Failed: {e}")
+                    failed_symbols.append(symbol)
+
                 # Progress Situation 표시
                 if idx % 10 == 0 or idx == total_symbols:
                     progress_pct = (idx / total_symbols) * 100
                     self.logger.info(f"⚡ Progress: {idx}/{total_symbols} ({progress_pct:.1f}%) - {symbol}")
 
-                # REST API로 최적화된 역사 데이터 가져오기 (전략별 필수 count수만)
-                df_1m = pd.DataFrame(self.exchange.fetch_ohlcv(symbol, '1m', limit=self.BOOTSTRAP_LIMITS['1m']))
-                df_3m = pd.DataFrame(self.exchange.fetch_ohlcv(symbol, '3m', limit=self.BOOTSTRAP_LIMITS['3m']))
-                df_5m = pd.DataFrame(self.exchange.fetch_ohlcv(symbol, '5m', limit=self.BOOTSTRAP_LIMITS['5m']))
-                df_15m = pd.DataFrame(self.exchange.fetch_ohlcv(symbol, '15m', limit=self.BOOTSTRAP_LIMITS['15m']))
-                df_1d = pd.DataFrame(self.exchange.fetch_ohlcv(symbol, '1d', limit=self.BOOTSTRAP_LIMITS['1d']))
-
-                # Column명 지정
-                for df in [df_1m, df_3m, df_5m, df_15m, df_1d]:
-                    if not df.empty:
-                        df.columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-
-                # WebSocket 버퍼에 Save (Initialize)
-                self._initialize_buffer(symbol, {
-                    '1m': df_1m,
-                    '3m': df_3m,
-                    '5m': df_5m,
-                    '15m': df_15m,
-                    '1d': df_1d
-                })
-
-                loaded_symbols += 1
-
-                # 🛡️ Rate Limit protection: Safe delay before next symbol
-                if idx < total_symbols:
-                    time.sleep(0.02)  # 20ms delay (per minute API calls 375timesLimited to)
+        elapsed = time.time() - started
+        self.last_bootstrap = {
+            'symbols': total_symbols,
+            'loaded': loaded_symbols,
+            'failed': len(failed_symbols),
+            'rest_calls': self.stats['rest_calls'] - calls_before,
+            'weight_used': self.stats['weight_used'] - weight_before,
+            'seconds_to_ready': round(elapsed, 2),
+            'fetch': plan['fetch'],
+            'derived': list(plan['derive']),
+        }
 
-            except Exception as e:
-                self.logger.error(f"❌ {symbol} Initial data Load Failed: {e}")
-                failed_symbols.append(symbol)
+        success_rate = (loaded_symbols / total_symbols) * 100 if total_symbols else 100.0
+        self.logger.info(f"✅ Initial data 로딩 Complete: {loaded_symbols}/{total_symbols} ({success_rate:.1f}%) - "
+                         f"weight {self.last_bootstrap['weight_used']}, REST {self.last_bootstrap['rest_calls']}times, "
+                         f"준비 Time {elapsed:.1f}초")
 
-        success_rate = (loaded_symbols / total_symbols) * 100
-        self.logger.info(f"✅ Initial data 로딩 Complete: {loaded_symbols}/{total_symbols} ({success_rate:.1f}%)")
+        if self.kline_store is not None:
+            self.logger.info(f"💾 웜 스타트: {self.stats['warm_frames']}count 버퍼 File Load, "
+                             f"누락 캔들 {self.stats['backfilled_candles']}count 보충")
 
         if failed_symbols:
             self.logger.warning(f"⚠️ Failed한 Symbol ({len(failed_symbols)}count): {', '.join(failed_symbols[:10])}")
 
+        self.start_checkpointing()
+
+        # ingest 중 탐지되는 누락 캔들 (재Connections 사이 등)도 같은 승인 / 통계 경로로 보충
+        if hasattr(self.base_manager, 'enable_gap_repair'):
+            self.base_manager.enable_gap_repair(fetch=self._fetch_frame)
+
+    def _bootstrap_symbol(self, symbol: str, plan: dict):
+        """Symbol 1count 부트스트랩 (작업 스레드): 기본 Timeframe Load → 상위 Timeframe 재Create → 버퍼 Save"""
+        dataframes = {timeframe: self._load_timeframe(symbol, timeframe, limit)
+                      for timeframe, limit in plan['fetch'].items()}
+
+        minute_df = dataframes.get('1m')
+        for timeframe, (minutes, limit) in plan['derive'].items():
+            dataframes[timeframe] = self._derive_frame(minute_df, minutes, limit)
+
+        # WebSocket 버퍼에 Save (Initialize)
+        self._initialize_buffer(symbol, dataframes)
+
+    def _derive_frame(self, minute_df: pd.DataFrame, minutes: int, limit: int) -> pd.DataFrame:
+        """1minute candles DataFrame → 상위 Timeframe DataFrame (close_time / is_final 포함)"""
+        if minute_df is None or minute_df.empty:
+            return pd.DataFrame()
+        data = resample_ohlcv(minute_df['timestamp'].to_numpy(dtype='int64'),
+                              minute_df[self.OHLCV_COLUMNS[1:]].to_numpy(dtype='float64'), minutes)
+        df = pd.DataFrame(data['ohlcv'][-limit:], columns=self.OHLCV_COLUMNS[1:])
+        df.insert(0, 'timestamp', data['timestamp'][-limit:])
+        df['close_time'] = data['close_time'][-limit:]
+        df['is_final'] = data['is_final'][-limit:]
+        return df
+
+    def _fetch_frame(self, symbol: str, timeframe: str, limit: int, since: Optional[int] = None) -> pd.DataFrame:
+        """공용 Rate Limiter 벌크 레인 승인 후 REST fetch_ohlcv → DataFrame"""
+        params = {'symbol': symbol, 'limit': limit}
+        if not self._get_rate_limiter().acquire(self.KLINES_ENDPOINT, params, PRIORITY_BULK,
+                                                timeout=self.request_timeout):
+            raise Exception(f"Rate limit budget 대기 초과: {symbol} {timeframe}")
+
+        # 승인은 위에서 받았으므로 래퍼의 비차단 승인 / Cache를 거치지 않고 원본 거래소 호출
+        exchange = self.exchange.exchange if isinstance(self.exchange, RateLimitedExchange) else self.exchange
+        rows = exchange.fetch_ohlcv(symbol, timeframe, since=since, limit=limit)
+        self._count('rest_calls')
+        self._count('weight_used', self._kline_weight(limit))
+
+        df = pd.DataFrame(rows)
+        if not df.empty:
+            df.columns = self.OHLCV_COLUMNS
+        return df
+
+    def _load_timeframe(self, symbol: str, timeframe: str, limit: int) -> pd.DataFrame:
+        """체크포인트 File + 마지막 캔들 이후 누락 구간 (File이 없거나 누락이 limit 이상이면 REST 전체 Load)"""
+        stored = self.kline_store.load(symbol, timeframe) if self.kline_store is not None else None
+        if stored is not None and len(stored['timestamp']):
+            last_ts = int(stored['timestamp'][-1])
+            missing = (int(time.time() * 1000) - last_ts) // timeframe_to_ms(timeframe)
+        if stored is None or len(stored['timestamp']) == 0 or missing >= limit \
+                or len(stored['timestamp']) + missing < limit:
+            self._count('full_loads')
+            return self._fetch_frame(symbol, timeframe, limit)
+
+        # 마지막 캔들 (미완성일 수 있음)부터 다시 받아 덮어씀
+        fresh = self._fetch_frame(symbol, timeframe, int(missing) + 1, since=last_ts)
+        first_fresh = int(fresh['timestamp'].iloc[0]) if not fresh.empty else last_ts + 1
+        keep = stored['timestamp'] < first_fresh
+        df = pd.DataFrame(stored['ohlcv'][keep], columns=self.OHLCV_COLUMNS[1:])
+        df.insert(0, 'timestamp', stored['timestamp'][keep])
+        if not fresh.empty:
+            df = pd.concat([df, fresh], ignore_index=True)
+
+        self._count('warm_frames')
+        self._count('backfilled_candles', len(fresh))
+        return df
+
+    def backfill_gaps(self, symbols: Optional[List[str]] = None) -> int:
+        """
+        재Connections 후 누락 구간 보충 (since= 범위 요청 - 전체 윈도우 재Load 없음)
+
+        - 기본 Timeframe (1m / 1d) 버퍼에서 중간 누락 구간 + 마지막 캔들 이후 구간 탐지 (find_gaps)
+        - 구간별 since=구간 Starting, limit=구간 캔들 수로 요청 후 버퍼에 병합
+          (누락 합계가 계획 limit 이상이면 최근 limit count 1times 요청)
+        - 1m 보충 시 3m / 5m / 15m은 보충 구간부터 1m에서 재Create, 리샘플러 Status Initialize
+
+        Returns:
+            int: 보충한 캔들 수
+        """
+        symbols = list(self.subscribed_symbols) if symbols is None else list(symbols)
+        if not symbols:
+            return 0
+
+        plan = self.plan_bootstrap()
+        started = time.time()
+        weight_before = self.stats['weight_used']
+        workers = max(1, min(self.bootstrap_workers, len(symbols)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='KlineBackfill') as pool:
+            filled = sum(pool.map(lambda symbol: self._backfill_symbol(symbol, plan), symbols))
+
+        if filled:
+            self.logger.info(f"🩹 누락 구간 보충: {len(symbols)}count Symbol, 캔들 {filled}count "
+                             f"(weight {self.stats['weight_used'] - weight_before}, {time.time() - started:.1f}초)")
+        return filled
+
+    def _backfill_symbol(self, symbol: str, plan: dict) -> int:
+        filled = 0
+        now_ms = int(time.time() * 1000)
+        try:
+            for timeframe, limit in plan['fetch'].items():
+                buffer = self.base_manager.kline_buffer.get(f"{symbol}_{timeframe}")
+                if not buffer:
+                    continue
+                timeframe_ms = timeframe_to_ms(timeframe)
+                gaps = find_gaps(buffer.snapshot(0)['timestamp'], timeframe_ms, now_ms)
+                if not gaps:
+                    continue
+
+                if sum(count for _, count in gaps) >= limit:
+                    requests = [(None, limit)]
+                else:
+                    requests = [(since + offset * timeframe_ms, min(count - offset, self.MAX_KLINES_PER_REQUEST))
+                                for since, count in gaps
+                                for offset in range(0, count, self.MAX_KLINES_PER_REQUEST)]
+                frames = [self._fetch_frame(symbol, timeframe, count, since=since) for since, count in requests]
+                self._count('gap_fills', len(frames))
+                frames = [df for df in frames if not df.empty]
+                if not frames:
+                    continue
+
+                fetched = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+                timestamps = fetched['timestamp'].to_numpy(dtype='int64')
+                data = {
+                    'timestamp': timestamps,
+                    'close_time': timestamps + timeframe_ms - 1,
+                    'is_final': timestamps + timeframe_ms <= now_ms,
+                    'ohlcv': fetched[self.OHLCV_COLUMNS[1:]].to_numpy(dtype='float64'),
+                }
+                with self.base_manager._get_symbol_lock(symbol):
+                    buffer.merge(data['timestamp'], data['ohlcv'],
+                                 is_final=data['is_final'], close_times=data['close_time'])
+                    if timeframe == '1m':
+                        # 1m 보충 구간부터 3m / 5m / 15m 재Create (1d는 REST 버퍼 유지)
+                        self.base_manager.rebuild_higher_timeframes(symbol, int(timestamps[0]),
+                                                                    timeframes=plan['derive'])
+                filled += len(timestamps)
+                self._count('gap_candles', len(timestamps))
+        except Exception as e:
+            self.logger.error(f"❌ {symbol} 누락 구간 보충 Failed: {e}")
+        return filled
+
+    def checkpoint_klines(self) -> int:
+        """버퍼 변경분을 KlineStore에 기록 (마지막 체크포인트 이후 변경된 버퍼만)"""
+        if self.kline_store is None:
+            return 0
+        # 1m에서 재Create하는 상위 Timeframe은 기록하지 않음 (Load 시 1m에서 다시 Create)
+        return self.kline_store.checkpoint_buffers(getattr(self.base_manager, 'kline_buffer', {}),
+                                                   timeframes=set(self.plan_bootstrap()['fetch']))
+
+    def start_checkpointing(self):
+        """주기적 체크포인트 스레드 Starting (이미 Execute 중이면 무시)"""
+        if self.kline_store is None or (self._checkpoint_thread and self._checkpoint_thread.is_alive()):
+            return
+        self._checkpoint_stop.clear()
+        self._checkpoint_thread = threading.Thread(target=self._checkpoint_loop, name='KlineCheckpoint', daemon=True)
+        self._checkpoint_thread.start()
+        self.logger.info(f"💾 캔들 체크포인트 Starting ({self.checkpoint_interval:.0f}초 주기, {self.kline_store.directory})")
+
+    def stop_checkpointing(self):
+        """체크포인트 스레드 Terminate + 마지막 체크포인트 / flush (Terminate 시 호출)"""
+        self._checkpoint_stop.set()
+        if self._checkpoint_thread:
+            self._checkpoint_thread.join(timeout=5)
+            self._checkpoint_thread = None
+        if self.kline_store is not None:
+            try:
+                written = self.checkpoint_klines()
+                self.kline_store.flush()
+                self.logger.info(f"💾 캔들 체크포인트 Save Complete ({written}행)")
+            except Exception as e:
+                self.logger.error(f"❌ Kline checkpoint failed: {e}")
+
+    def _checkpoint_loop(self):
+        while not self._checkpoint_stop.wait(self.checkpoint_interval):
+            try:
+                self.checkpoint_klines()
+            except Exception as e:
+                self.logger.error(f"❌ Kline checkpoint failed: {e}")
+
     def _initialize_buffer(self, symbol: str, dataframes: Dict[str, pd.DataFrame]):
         """WebSocket 버퍼에 Initial data Save"""
-        # Legacy WebSocket 매니저의 버퍼 구조 활용
+        # Legacy WebSocket 매니저의 링 버퍼 구조 활용
         if not hasattr(self.base_manager, 'kline_buffer'):
             self.base_manager.kline_buffer = {}
 
@@ -243,23 +543,18 @@ class BulkWebSocketKlineManager:
                 continue
 
             buffer_key = f"{symbol}_{timeframe}"
-
-            # DataFrame을 딕셔너리 리스트로 변환
-            buffer_data = []
-            for _, row in df.iterrows():
-                candle = {
-                    'timestamp': int(row['timestamp']),
-                    'open': float(row['open']),
-                    'high': float(row['high']),
-                    'low': float(row['low']),
-                    'close': float(row['close']),
-                    'volume': float(row['volume']),
-                    'close_time': int(row['timestamp']) + 60000,  # 1분 Add
-                    'is_final': True
-                }
-                buffer_data.append(candle)
-
-            self.base_manager.kline_buffer[buffer_key] = buffer_data
+            timestamps = df['timestamp'].to_numpy(dtype='int64')
+
+            # DataFrame 컬럼을 링 버퍼에 일괄 복사 (행 단위 dict 변환 없음)
+            with self.base_manager._get_symbol_lock(symbol):
+                buffer = self.base_manager._get_or_create_buffer(buffer_key)
+                buffer.load(
+                    timestamps,
+                    df[['open', 'high', 'low', 'close', 'volume']].to_numpy(dtype='float64'),
+                    is_final=df['is_final'].to_numpy() if 'is_final' in df else None,
+                    # 1m에서 재Create한 캔들은 구간 Terminate Time, REST 캔들은 1분 Add (Legacy)
+                    close_times=df['close_time'].to_numpy(dtype='int64') if 'close_time' in df else timestamps + 60000
+                )
 
         self.logger.debug(f"✅ {symbol} Buffer Initialization complete (1m: {len(dataframes.get('1m', []))}봉)")
 
@@ -303,6 +598,9 @@ class BulkWebSocketKlineManager:
                 self.connection_active = True
                 self.last_message_time = time.time()
                 self.logger.info(f"✅ 재Connections Success: {len(backup_symbols)}count Symbol Recover")
+
+                # 끊긴 동안의 누락 캔들만 since= 범위로 보충
+                self.backfill_gaps(backup_symbols)
                 break
 
             except Exception as e:
@@ -314,19 +612,20 @@ class BulkWebSocketKlineManager:
             self.logger.critical(f"🚨 재Connections Failed: Manual intervention required")
 
     def save_state(self):
-        """Current Subscription state saved"""
+        """Current Subscription state saved (백그라운드 디바운스 기록)"""
         try:
-            state = {
-                'timestamp': time.time(),
-                'symbols': list(self.subscribed_symbols),
-                'count': len(self.subscribed_symbols),
-                'stats': self.stats
-            }
+            def snapshot():
+                symbols = list(self.subscribed_symbols)
+                return {
+                    'timestamp': time.time(),
+                    'symbols': symbols,
+                    'count': len(symbols),
+                    'stats': dict(self.stats)
+                }
 
-            with open(self.state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            get_persistence_scheduler(self.logger).schedule(self.state_file, snapshot, ensure_ascii=True)
 
-            self.logger.debug(f"💾 Subscription state saved: {len(self.subscribed_symbols)}count Symbol")
+            self.logger.debug(f"💾 Subscription state save scheduled: {len(self.subscribed_symbols)}count Symbol")
 
         except Exception as e:
             self.logger.error(f"❌ State save failed: {e}")
@@ -354,7 +653,11 @@ class BulkWebSocketKlineManager:
             'subscribed_symbols_count': len(self.subscribed_symbols),
             'pending_symbols_count': len(self.pending_symbols),
             'last_message_seconds_ago': int(time.time() - self.last_message_time),
-            'stats': self.stats.copy()
+            'stats': self.stats.copy(),
+            'last_bootstrap': self.last_bootstrap,
+            'kline_store': self.kline_store.get_stats() if self.kline_store is not None else None,
+            'incomplete_symbols': (self.base_manager.get_health_report()
+                                   if hasattr(self.base_manager, 'get_health_report') else {})
         }
 
 
@@ -376,8 +679,9 @@ if __name__ == "__main__":
         'options': {'defaultType': 'future'}
     })
 
-    # Legacy WebSocket 매니저 Create
-    base_ws_manager = BinanceWebSocketKlineManager(logger)
+    # Legacy WebSocket 매니저 Create (결합 스트림 모드)
+    base_ws_manager = BinanceWebSocketKlineManager(callback=None, logger=logger, use_combined_stream=True)
+    base_ws_manager.start()
 
     # Bulk 매니저 Create
     bulk_manager = BulkWebSocketKlineManager(base_ws_manager, exchange, logger)
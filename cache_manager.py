@@ -9,26 +9,30 @@ Cache Manager Module
 - 잔고 캐싱 (TTL 5분)
 - 변동률 필터 캐싱 (TTL 10분)
 - API 심볼 캐싱 (TTL 5분)
-- 자동 만료 및 크기 제한
+- 자동 만료 및 크기 제한 (범용 데이터는 bounded_cache 공용 Cache - 메모리 상한 LRU)
 """
 
 import time
 from typing import Any, Optional, List, Dict
 
+from bounded_cache import BoundedCache, get_shared_cache
+
 
 class CacheManager:
     """통합 캐시 관리 시스템"""
 
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, cache: Optional[BoundedCache] = None):
         """
         Args:
             logger: 로거 인스턴스 (선택)
+            cache: 범용 데이터용 BoundedCache (기본: 프로세스 공용 get_shared_cache())
         """
         self.logger = logger
 
-        # 범용 데이터 캐시
-        self._data_cache: Dict[str, tuple] = {}
+        # 범용 데이터 캐시 (최대 100개, 초과 시 가장 오래 안 쓴 항목 제거)
         self._cache_ttl = 60  # 60초
+        self._cache = cache or get_shared_cache()
+        self._data_cache = self._cache.namespace('cache_manager_data', ttl=self._cache_ttl, max_entries=100)
 
         # 마켓 정보 캐시
         self._market_cache = None
@@ -63,15 +67,8 @@ class CacheManager:
             캐시된 데이터 또는 None (만료/없음)
         """
         try:
-            if cache_key in self._data_cache:
-                cached_data, timestamp = self._data_cache[cache_key]
-                # TTL 체크
-                if time.time() - timestamp < self._cache_ttl:
-                    return cached_data
-                else:
-                    # 만료된 데이터 제거
-                    del self._data_cache[cache_key]
-            return None
+            # TTL 만료 항목은 조회 시 제거
+            return self._data_cache.get(cache_key)
         except Exception:
             return None
 
@@ -84,12 +81,7 @@ class CacheManager:
             data: 저장할 데이터
         """
         try:
-            self._data_cache[cache_key] = (data, time.time())
-            # 캐시 크기 제한 (100개 이상이면 오래된 것부터 제거)
-            if len(self._data_cache) > 100:
-                oldest_key = min(self._data_cache.keys(),
-                                key=lambda k: self._data_cache[k][1])
-                del self._data_cache[oldest_key]
+            self._data_cache.set(cache_key, data)
         except Exception:
             pass
 
@@ -245,13 +237,8 @@ class CacheManager:
         try:
             current_time = time.time()
 
-            # 범용 데이터 캐시 정리
-            expired_keys = [
-                key for key, (_, timestamp) in self._data_cache.items()
-                if current_time - timestamp >= self._cache_ttl
-            ]
-            for key in expired_keys:
-                del self._data_cache[key]
+            # 범용 데이터 캐시 정리 (공용 캐시 전체 네임스페이스)
+            expired_count = self._cache.purge_expired()
 
             # 변동률 필터 캐시 정리
             expired_filter_keys = [
@@ -279,7 +266,7 @@ class CacheManager:
                 self._api_cache_time = 0
 
             if self.logger:
-                self.logger.debug(f"✅ Expired cache cleanup complete: {len(expired_keys) + len(expired_filter_keys)} items")
+                self.logger.debug(f"✅ Expired cache cleanup complete: {expired_count + len(expired_filter_keys)} items")
 
         except Exception as e:
             if self.logger:
@@ -290,6 +277,8 @@ class CacheManager:
         current_time = time.time()
         return {
             'data_cache_size': len(self._data_cache),
+            'data_cache': self._data_cache.get_stats(),
+            'shared_cache': self._cache.get_stats(),
             'market_cache_age': int(current_time - self._market_cache_time) if self._market_cache else None,
             'balance_cache_age': int(current_time - self._balance_cache_time) if self._balance_cache else None,
             'change_filter_cache_size': len(self._change_filter_cache),
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+결합 스트림(Combined Stream) 로컬 Test
+실제 Binance 대신 로컬 가짜 WebSocket Server로 다중화 Subscription을 Verification
+
+Verification 항목:
+1. 200count Symbol 일괄 Subscription Time (1초 미만)
+2. Connections당 스트림 Limits 단위 분할 (Connections 수)
+3. 라이브 Connections에서 SUBSCRIBE / UNSUBSCRIBE 프레임 동작
+4. 수신 kline → 매니저 링 버퍼 Save
+
+Usage:
+    python combined_stream_fake_server_test.py [--symbols 200] [--per-connection 100]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+from websockets.asyncio.server import serve
+
+from binance_websocket_kline_manager import BinanceWebSocketKlineManager
+from bulk_websocket_kline_manager import BulkWebSocketKlineManager
+
+
+class FakeCombinedStreamServer:
+    """Binance /stream 엔드포인트를 흉내 내는 로컬 WebSocket Server"""
+
+    def __init__(self, host: str = '127.0.0.1'):
+        self.host = host
+        self.port = None
+        self.loop = asyncio.new_event_loop()
+        self.connections = {}  # websocket -> set(streams)
+        self.frames = []       # Received SUBSCRIBE/UNSUBSCRIBE 프레임
+        self._ready = threading.Event()
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+
+    def start(self):
+        threading.Thread(target=self._run, daemon=True).start()
+        self._ready.wait(5)
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_until_complete(self._start_server())
+        self._ready.set()
+        self.loop.run_forever()
+
+    async def _start_server(self):
+        self._server = await serve(self._handler, self.host, 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def _handler(self, websocket):
+        query = parse_qs(urlparse(websocket.request.path).query)
+        streams = set(filter(None, query.get('streams', [''])[0].split('/')))
+        self.connections[websocket] = streams
+        try:
+            async for raw in websocket:
+                frame = json.loads(raw)
+                self.frames.append(frame)
+                if frame['method'] == 'SUBSCRIBE':
+                    streams.update(frame['params'])
+                elif frame['method'] == 'UNSUBSCRIBE':
+                    streams.difference_update(frame['params'])
+                await websocket.send(json.dumps({'result': None, 'id': frame['id']}))
+        except Exception:
+            pass
+        finally:
+            self.connections.pop(websocket, None)
+
+    def subscribed_streams(self) -> set:
+        result = set()
+        for streams in list(self.connections.values()):
+            result |= streams
+        return result
+
+    def push_klines(self, timestamp: int):
+        """Subscription 중인 모든 스트림에 kline 1count씩 전송"""
+        async def _push():
+            for websocket, streams in list(self.connections.items()):
+                for stream in list(streams):
+                    symbol = stream.split('@')[0].upper()
+                    data = {
+                        'e': 'kline', 's': symbol,
+                        'k': {'t': timestamp, 'T': timestamp + 59_999, 'o': '100', 'h': '101',
+                              'l': '99', 'c': '100.5', 'v': '10', 'x': False}
+                    }
+                    await websocket.send(json.dumps({'stream': stream, 'data': data}))
+        asyncio.run_coroutine_threadsafe(_push(), self.loop).result(10)
+
+    def stop(self):
+        async def _close():
+            self._server.close()
+            await self._server.wait_closed()
+        asyncio.run_coroutine_threadsafe(_close(), self.loop).result(10)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+def wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def run_test(n_symbols: int, per_connection: int) -> bool:
+    logger = logging.getLogger('combined_stream_test')
+    server = FakeCombinedStreamServer()
+    server.start()
+
+    base_manager = BinanceWebSocketKlineManager(
+        callback=None,
+        logger=logger,
+        use_combined_stream=True,
+        stream_url=server.url,
+        max_streams_per_connection=per_connection
+    )
+    base_manager.start()
+
+    bulk_manager = BulkWebSocketKlineManager(base_manager, exchange=None, logger=logger)
+    bulk_manager.state_file = os.path.join(tempfile.gettempdir(), 'combined_stream_test_state.json')
+
+    results = []
+
+    def check(name: str, ok: bool, detail: str = ''):
+        results.append(ok)
+        print(f"  {'✅' if ok else '❌'} {name} {detail}")
+
+    try:
+        symbols = [f"SYM{i}/USDT:USDT" for i in range(n_symbols)]
+        expected_streams = {f"sym{i}usdt@kline_1m" for i in range(n_symbols)}
+
+        # 1. 일괄 Subscription Time
+        start = time.perf_counter()
+        bulk_manager.subscribe_bulk_symbols(symbols)
+        elapsed = time.perf_counter() - start
+        check("Bulk subscribe", elapsed < 1.0 and len(bulk_manager.subscribed_symbols) == n_symbols,
+              f"({n_symbols} symbols in {elapsed * 1000:.1f}ms)")
+
+        # 2. Connections 분할
+        expected_connections = math.ceil(n_symbols / per_connection)
+        connected = wait_until(lambda: server.subscribed_streams() == expected_streams
+                               and base_manager.stream_client.is_connected)
+        check("Chunked connections", connected and len(server.connections) == expected_connections,
+              f"({len(server.connections)} connections, expected {expected_connections})")
+
+        # 3-1. 라이브 Connections에 UNSUBSCRIBE 프레임
+        bulk_manager.enable_unsubscribe = True
+        removed = symbols[:10]
+        bulk_manager.unsubscribe_symbols(removed)
+        expected_streams -= {f"sym{i}usdt@kline_1m" for i in range(10)}
+        ok = wait_until(lambda: server.subscribed_streams() == expected_streams)
+        unsubscribe_frames = sum(1 for f in server.frames if f['method'] == 'UNSUBSCRIBE')
+        check("Dynamic UNSUBSCRIBE", ok and unsubscribe_frames >= 1,
+              f"({unsubscribe_frames} UNSUBSCRIBE frames)")
+
+        # 3-2. 라이브 Connections에 SUBSCRIBE (여유가 있는 Connections 우선, 부족하면 New Connections)
+        extra = [f"EXTRA{i}USDT" for i in range(10 + per_connection // 2)]
+        bulk_manager.subscribe_bulk_symbols(extra)
+        expected_streams |= {f"extra{i}usdt@kline_1m" for i in range(len(extra))}
+        ok = wait_until(lambda: server.subscribed_streams() == expected_streams)
+        subscribe_frames = sum(1 for f in server.frames if f['method'] == 'SUBSCRIBE')
+        check("Dynamic SUBSCRIBE", ok and subscribe_frames >= 1,
+              f"({len(server.subscribed_streams())} streams, {subscribe_frames} SUBSCRIBE frames, "
+              f"{len(server.connections)} connections)")
+
+        # 4. kline 수신 → 버퍼 Save
+        server.push_klines(1_700_000_040_000)
+        ok = wait_until(lambda: base_manager.message_count >= len(expected_streams))
+        buffer = base_manager.get_kline_buffer('SYM50USDT', '1m', limit=10)
+        removed_buffer = base_manager.get_kline_buffer('SYM0USDT', '1m', limit=10)
+        check("Kline dispatch", ok and len(buffer) == 1 and len(removed_buffer) == 0,
+              f"({base_manager.message_count} messages, stats={base_manager.stream_client.get_stats()})")
+
+    finally:
+        base_manager.stop()
+        server.stop()
+        if os.path.exists(bulk_manager.state_file):
+            os.remove(bulk_manager.state_file)
+
+    return all(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Combined stream fake server test')
+    parser.add_argument('--symbols', type=int, default=200)
+    parser.add_argument('--per-connection', type=int, default=100)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    print(f"🧪 결합 스트림 Test: {args.symbols} symbols, {args.per_connection} streams/connection")
+    passed = run_test(args.symbols, args.per_connection)
+    print("🎉 All tests passed" if passed else "❌ Test failed")
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
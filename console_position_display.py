@@ -28,6 +28,13 @@ except ImportError:
     class Style:
         BRIGHT = DIM = RESET_ALL = ''
 
+# 같은 IP 봇들과 공유하는 Rate Limiter (선택)
+try:
+    from binance_rate_limiter import get_rate_limiter, install_rate_limiter
+    HAS_RATE_LIMITER = True
+except ImportError:
+    HAS_RATE_LIMITER = False
+
 # Windows 콘솔 UTF-8 설정
 if os.name == 'nt':
     try:
@@ -149,6 +156,10 @@ class ConsolePositionDisplay:
                 'enableRateLimit': True,
             })
             
+            # 같은 IP의 다른 봇과 weight budget 공유
+            if HAS_RATE_LIMITER:
+                install_rate_limiter(exchange, get_rate_limiter())
+            
             current_prices = {}
             
             for symbol in symbols:
@@ -16,7 +16,7 @@ from dotenv import load_dotenv
 
 # Binance Rate Limiter 추가 (IP 차단 방지)
 try:
-    from binance_rate_limiter import BinanceRateLimiter
+    from binance_rate_limiter import BinanceRateLimiter, get_rate_limiter
     HAS_RATE_LIMITER = True
     print("[INFO] 대시보드 API - Binance Rate Limiter 로드 완료")
 except ImportError:
@@ -49,7 +49,7 @@ else:
         
         # Rate Limiter 초기화
         if HAS_RATE_LIMITER:
-            rate_limiter = BinanceRateLimiter()
+            rate_limiter = get_rate_limiter()
             print("[SUCCESS] Binance Rate Limiter 초기화 완료")
         else:
             rate_limiter = None
@@ -82,6 +82,12 @@ def get_korea_time():
     """한국 표준시(KST) 현재 시간 반환"""
     return datetime.now(timezone(timedelta(hours=9)))
 
+def _format_created_at(value):
+    """DCA 포지션 생성 시간 표시 (스키마 v2는 epoch 초, 이전 파일은 ISO 문자열)"""
+    if isinstance(value, (int, float)) and value:
+        return datetime.fromtimestamp(value, timezone(timedelta(hours=9))).isoformat()
+    return value or 'N/A'
+
 def _parse_strategy_info(strategy_str):
     """전략 정보 파싱 (중복 제거 및 정확한 분류)"""
     if not strategy_str or strategy_str == 'UNKNOWN':
@@ -213,7 +219,7 @@ def get_open_positions():
                     'totalNotional': dca_info.get('total_notional', abs(position_amt * mark_price)),
                     'averagePrice': dca_info.get('average_price', entry_price),
                     'maxCyclicCount': dca_info.get('max_cyclic_count', 3),
-                    'createdAt': dca_info.get('created_at', 'N/A')
+                    'createdAt': _format_created_at(dca_info.get('created_at'))
                 }
 
                 open_positions.append(position_data)
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+"""
+DCA 지정가 체결 이벤트 반영 Verification (가짜 거래소 / 가짜 ORDER_TRADE_UPDATE, 네트워크 없음)
+
+점검 항목:
+1. 주문 ID 색인: Load 직후 재구성, 체결 이벤트 → Entry 체결 + Average price 재계산, 색인에서 Remove
+2. DCA 주문이 아닌 이벤트 / NEW / 부분 체결은 무시, 중복 FILLED 무시, CANCELED → Entry 비Active
+3. 색인 조times 비용: Position 수와 무관 (이벤트당 시간)
+4. 안전망: 스트림이 살아있으면 주기 안에서는 REST 없음, 점검 시 fetch_open_orders + 빠진 주문만 fetch_order,
+   fetch_orders (전체 주문 내역)는 호출하지 않음, 스트림이 없으면 매 호출 점검
+5. User Data Stream → UserStreamPositionSync → 전략 → DCA 매니저 전체 경로
+
+Usage:
+    python dca_order_events_check.py [--positions 200]
+"""
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+import types
+
+from improved_dca_position_manager import DCAEntry, DCAPosition, ImprovedDCAPositionManager
+from persistence_scheduler import get_persistence_scheduler
+
+
+class FakeExchange:
+    """주문 조times 호출 수를 세는 가짜 거래소"""
+
+    apiKey = None
+    secret = None
+
+    def __init__(self):
+        self.open_orders = {}    # symbol -> [order_id]
+        self.orders = {}         # order_id -> ccxt order
+        self.calls = {'fetch_orders': 0, 'fetch_open_orders': 0, 'fetch_order': 0, 'fetch_positions': 0}
+
+    def fetch_orders(self, symbol, since=None, limit=None, params={}):
+        self.calls['fetch_orders'] += 1
+        return list(self.orders.values())
+
+    def fetch_open_orders(self, symbol=None, since=None, limit=None, params={}):
+        self.calls['fetch_open_orders'] += 1
+        return [{'id': order_id, 'symbol': symbol} for order_id in self.open_orders.get(symbol, [])]
+
+    def fetch_order(self, order_id, symbol=None, params={}):
+        self.calls['fetch_order'] += 1
+        return self.orders[order_id]
+
+    def fetch_positions(self, symbols=None):
+        self.calls['fetch_positions'] += 1
+        return []
+
+
+def make_position(symbol: str, index: int) -> DCAPosition:
+    now = 1767193200.0  # 2026-01-01T00:00:00+09:00
+    entries = [
+        DCAEntry('initial', 100.0, 1.0, 100.0, 10.0, now),
+        DCAEntry('first_dca', 90.0, 2.0, 180.0, 10.0, now, order_type='limit', order_id=f"{index + 1}01", is_filled=False),
+        DCAEntry('second_dca', 80.0, 3.0, 240.0, 10.0, now, order_type='limit', order_id=f"{index + 1}02", is_filled=False),
+    ]
+    return DCAPosition(symbol=symbol, entries=entries, current_stage='initial', initial_entry_price=100.0,
+                       average_price=100.0, total_quantity=1.0, total_notional=100.0, is_active=True,
+                       created_at=now, last_update=now)
+
+
+def order_event(order_id, status: str, execution_type: str, filled: float = 0.0, price: float = 0.0,
+                market_id: str = 'P0USDT') -> str:
+    return json.dumps({'e': 'ORDER_TRADE_UPDATE', 'E': 1, 'T': 1,
+                       'o': {'s': market_id, 'i': int(order_id), 'c': 'x', 'X': status, 'x': execution_type,
+                             'S': 'BUY', 'o': 'LIMIT', 'p': str(price), 'q': str(filled), 'z': str(filled),
+                             'ap': str(price), 'l': str(filled), 'L': str(price), 'R': False, 'rp': '0', 'T': 1}})
+
+
+def stream_order(order_id, status: str, filled: float = 0.0, price: float = 0.0) -> dict:
+    return {'orderId': int(order_id), 'symbol': 'P0/USDT:USDT', 'status': status, 'filled_quantity': filled,
+            'avg_price': price, 'execution_type': 'TRADE' if status in ('FILLED', 'PARTIALLY_FILLED') else status}
+
+
+def make_manager(logger, count: int, live: bool = True) -> ImprovedDCAPositionManager:
+    """실제 __init__ (임시 디렉토리의 JSON Load) → 가짜 거래소 / 가짜 스트림 상태 연결"""
+    for name in ('dca_positions.json', 'dca_positions_backup.json'):
+        if os.path.exists(name):
+            os.remove(name)
+    manager = ImprovedDCAPositionManager(exchange=None)
+    for i in range(count):
+        manager.positions[f"P{i}/USDT:USDT"] = make_position(f"P{i}/USDT:USDT", i)
+    manager.save_data()
+
+    manager = ImprovedDCAPositionManager(exchange=None)  # 저장된 Position에서 색인 재구성
+    manager.logger = logger
+    manager.exchange = FakeExchange()
+    manager.strategy = types.SimpleNamespace(
+        user_stream_sync=types.SimpleNamespace(live=live, is_live=lambda: manager.strategy.user_stream_sync.live))
+    return manager
+
+
+def check(results: list, name: str, passed: bool, detail: str = ''):
+    results.append(passed)
+    print(f"  {'✅' if passed else '❌'} {name}" + (f" - {detail}" if detail else ''))
+
+
+def check_index(results: list, logger, count: int):
+    print(f"\n[1] 주문 ID 색인 ({count}count Position)")
+    manager = make_manager(logger, count)
+    check(results, "Load 직후 색인 재구성", len(manager._pending_orders) == count * 2, f"{len(manager._pending_orders)}count")
+
+    result = manager.on_order_update(stream_order('101', 'FILLED', 2.0, 88.0))
+    position = manager.positions['P0/USDT:USDT']
+    entry = position.entries[1]
+    check(results, "FILLED → Entry 체결 + Average price 재계산", result == 'filled' and entry.is_filled
+          and entry.entry_price == 88.0 and abs(position.average_price - (100.0 + 176.0) / 3.0) < 1e-9
+          and position.total_quantity == 3.0 and position.current_stage == 'first_dca',
+          f"avg {position.average_price:.4f}, qty {position.total_quantity}")
+    check(results, "체결 Entry 색인 Remove + REST 없음", '101' not in manager._pending_orders
+          and sum(manager.exchange.calls.values()) == 0, f"{manager.exchange.calls}")
+
+    saved = manager.journal.load()  # 스냅샷 + Save 로그
+    check(results, "체결 즉시 Save", saved['P0/USDT:USDT']['entries'][1]['is_filled'] is True)
+
+
+def check_events(results: list, logger):
+    print("\n[2] 이벤트 필터")
+    manager = make_manager(logger, 3)
+    ignored = [manager.on_order_update(stream_order('999', 'FILLED', 1.0, 1.0)),
+               manager.on_order_update(stream_order('101', 'NEW')),
+               manager.on_order_update(stream_order('101', 'PARTIALLY_FILLED', 1.0, 89.0))]
+    entry = manager.positions['P0/USDT:USDT'].entries[1]
+    check(results, "DCA 아닌 주문 / NEW / 부분 체결 무시", ignored == [None, None, None] and not entry.is_filled)
+
+    manager.on_order_update(stream_order('101', 'FILLED', 2.0, 89.0))
+    check(results, "중복 FILLED 무시", manager.on_order_update(stream_order('101', 'FILLED', 2.0, 89.0)) is None
+          and manager.order_event_stats['filled'] == 1)
+
+    result = manager.on_order_update(stream_order('102', 'CANCELED'))
+    entry = manager.positions['P0/USDT:USDT'].entries[2]
+    check(results, "CANCELED → Entry 비Active", result == 'canceled' and not entry.is_active
+          and '102' not in manager._pending_orders)
+
+    manager.positions.pop('P1/USDT:USDT')
+    check(results, "정리된 Position의 주문은 무시 (색인에서도 Remove)",
+          manager.on_order_update(stream_order('201', 'FILLED', 2.0, 89.0)) is None
+          and '201' not in manager._pending_orders)
+
+
+def check_cost(results: list, logger, count: int):
+    print("\n[3] 이벤트당 비용")
+    timings = {}
+    for size in (10, count):
+        manager = make_manager(logger, size)
+        manager.save_data = lambda: None
+        started = time.perf_counter()
+        for _ in range(2000):
+            manager.on_order_update(stream_order('777777', 'FILLED', 1.0, 1.0))
+        timings[size] = (time.perf_counter() - started) / 2000 * 1e6
+    check(results, "Position 수와 무관 (비 DCA 이벤트)", timings[count] < timings[10] * 3 + 5,
+          f"{timings[10]:.1f}µs ({10}count) vs {timings[count]:.1f}µs ({count}count)")
+
+
+def check_safety_net(results: list, logger):
+    print("\n[4] 안전망 점검")
+    manager = make_manager(logger, 3)
+    exchange = manager.exchange
+    exchange.open_orders = {'P0/USDT:USDT': ['101', '102'], 'P1/USDT:USDT': ['201', '202'],
+                            'P2/USDT:USDT': ['301', '302']}
+
+    for _ in range(10):
+        manager.check_and_update_limit_orders()
+    first = dict(exchange.calls)
+    manager._last_open_orders_check = time.time()
+    for _ in range(10):
+        manager.check_and_update_limit_orders()
+    check(results, "스트림 live + 주기 이내 → REST 없음", exchange.calls == first
+          and first['fetch_open_orders'] == 3 and first['fetch_order'] == 0, f"{exchange.calls}")
+
+    # P0: 101 체결 (이벤트 유실), 102 미체결 / P1 / P2 모두 미체결
+    exchange.open_orders['P0/USDT:USDT'] = ['102']
+    exchange.orders['101'] = {'id': '101', 'status': 'closed', 'filled': 2.0, 'average': 87.0}
+    exchange.calls = dict.fromkeys(exchange.calls, 0)
+    manager._last_open_orders_check = 0
+    result = manager.check_and_update_limit_orders()
+    entry = manager.positions['P0/USDT:USDT'].entries[1]
+    check(results, "주기 경과 → 미체결 목록 + 빠진 주문만 개별 조times",
+          exchange.calls == {'fetch_orders': 0, 'fetch_open_orders': 3, 'fetch_order': 1, 'fetch_positions': 0},
+          f"{exchange.calls}")
+    check(results, "유실된 체결 복구", result['updated_positions'] == ['P0/USDT:USDT'] and entry.is_filled
+          and entry.entry_price == 87.0)
+
+    manager.strategy.user_stream_sync.live = False
+    exchange.calls = dict.fromkeys(exchange.calls, 0)
+    manager.check_and_update_limit_orders()
+    manager.check_and_update_limit_orders()
+    check(results, "스트림 없음 → 매 호출 점검 (fetch_orders 없음)", exchange.calls['fetch_open_orders'] == 6
+          and exchange.calls['fetch_orders'] == 0, f"{exchange.calls}")
+
+
+def check_stream_path(results: list, logger):
+    print("\n[5] User Data Stream 전체 경로")
+    from one_minute_surge_entry_strategy import OneMinuteSurgeEntryStrategy
+    from position_snapshot import PositionSnapshot
+    from user_stream_position_sync import UserStreamPositionSync
+    from websocket_user_data_stream import BinanceUserDataStream
+
+    manager = make_manager(logger, 2)
+    exchange = types.SimpleNamespace(apiKey='key', secret='secret')
+    stream = BinanceUserDataStream(exchange, logger=logger)
+    sync = UserStreamPositionSync(stream, PositionSnapshot(exchange, logger=logger), logger=logger)
+    strategy = types.SimpleNamespace(dca_manager=manager)
+    strategy._on_stream_order = types.MethodType(OneMinuteSurgeEntryStrategy._on_stream_order, strategy)
+    sync.order_callbacks.append(strategy._on_stream_order)
+    fills = []
+    sync.fill_callbacks.append(fills.append)
+
+    stream._on_message(None, order_event('202', 'CANCELED', 'CANCELED', market_id='P1USDT'))
+    stream._on_message(None, order_event('201', 'FILLED', 'TRADE', 2.0, 86.0, market_id='P1USDT'))
+    entries = manager.positions['P1/USDT:USDT'].entries
+    check(results, "ORDER_TRADE_UPDATE → DCA Entry 체결 / Cancel",
+          entries[1].is_filled and entries[1].entry_price == 86.0 and not entries[2].is_active
+          and manager.order_event_stats == {'filled': 1, 'canceled': 1, 'safety_net': 0},
+          f"{manager.order_event_stats}")
+    check(results, "fill_callbacks는 TRADE만", len(fills) == 1 and sync.stats['stream_fills'] == 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='DCA 지정가 체결 이벤트 반영 Verification')
+    parser.add_argument('--positions', type=int, default=200, help='색인 비용 비교용 Position 수')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    logger = logging.getLogger('dca_order_events_check')
+    logging.getLogger('improved_dca_position_manager').setLevel(logging.ERROR)
+
+    results = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)  # dca_positions.json / sent_notifications.json 격리
+        try:
+            check_index(results, logger, args.positions)
+            check_events(results, logger)
+            check_cost(results, logger, args.positions)
+            check_safety_net(results, logger)
+            check_stream_path(results, logger)
+        finally:
+            get_persistence_scheduler().flush()  # 백그라운드 압축 / JSON Save가 임시 디렉토리 안에서 끝나도록
+            os.chdir(cwd)
+
+    print()
+    if all(results):
+        print(f"✅ 전체 통과 ({len(results)} 항목)")
+    else:
+        print(f"❌ Failed {results.count(False)} / {len(results)} 항목")
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+"""
+DCA Position Journal
+DCA Position Save용 append-only 로그 (WAL) + 주기적 스냅샷 압축
+
+File 구조:
+- 스냅샷 (dca_positions.json): {symbol: Position dict} - 기존 형식 그대로 (대시보드 / 콘솔 도구가 읽는 File)
+- 로그 (dca_positions.json.wal): 1줄 1레코드 JSON
+    {"op": "put", "symbol": ..., "data": {...}}  Position 전체 상태
+    {"op": "del", "symbol": ...}                 Position Remove
+- 이전 로그 (dca_positions.json.wal.prev): 직전 압축 때의 로그 (백업 스냅샷 이후 ~ 현재 스냅샷까지의 레코드)
+
+기록 방식:
+- save(positions): Position별 지문 (필드 값 튜플)을 직전 Save와 비교 → 바뀐 Position만 직렬화해 로그에 Add
+  (바뀌지 않은 Position은 asdict / JSON 변환 자체를 하지 않음)
+- compact(): Symbol별 마지막 직렬화 문자열을 이어 붙여 스냅샷 원자적 교체 (tmp → fsync → os.replace),
+  직전 스냅샷은 백업으로, 로그는 이전 로그로 넘기고 새 로그 Starting
+  (레코드 수 / 경과 Time 기준 자동, scheduler가 있으면 백그라운드 스레드에서, Terminate 시 close())
+- Recover: 스냅샷 Load → 로그 순서대로 재적용 (스냅샷 손상 시 백업 → 이전 로그 → 로그). put은 Symbol 전체
+  상태라 스냅샷보다 앞선 지점부터 끝까지 재적용해도 결과가 같음 (압축 도중 어느 단계에서 죽어도 같은 결과).
+  마지막 줄이 잘렸으면 (기록 중 Terminate) 그 줄만 버림
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from enum import Enum
+from operator import attrgetter
+from typing import Any, Callable, Dict, Optional
+
+_SCALARS = frozenset((str, int, float, bool, type(None)))
+_SLOT_GETTERS: Dict[type, Optional[Callable]] = {}
+
+
+def _slot_getter(kind: type) -> Optional[Callable]:
+    """__slots__ 클래스의 전체 속성 값을 튜플로 읽는 함수 (MRO 전체, 타입별 캐시, slots 없으면 None)"""
+    if kind not in _SLOT_GETTERS:
+        names = []
+        for klass in reversed(kind.__mro__):
+            slots = klass.__dict__.get('__slots__', ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            names.extend(name for name in slots if name not in ('__dict__', '__weakref__'))
+        if not names:
+            _SLOT_GETTERS[kind] = None
+        elif len(names) == 1:
+            single = attrgetter(names[0])
+            _SLOT_GETTERS[kind] = lambda value: (single(value),)
+        else:
+            _SLOT_GETTERS[kind] = attrgetter(*names)
+    return _SLOT_GETTERS[kind]
+
+
+def fingerprint(value: Any):
+    """변경 감지용 지문 - 직렬화 없이 필드 값을 중첩 튜플로 (dataclass (slots 포함) / dict / list 재귀)"""
+    kind = type(value)
+    if kind in _SCALARS:
+        return value
+    if kind is list or kind is tuple:
+        return tuple(item if type(item) in _SCALARS else fingerprint(item) for item in value)
+    if kind is dict:
+        return tuple((key, item if type(item) in _SCALARS else fingerprint(item)) for key, item in value.items())
+    if isinstance(value, (int, float, str, Enum)):
+        return value  # IntFlag / Enum 등 스칼라 서브클래스 (__dict__ 재귀 금지)
+    if hasattr(value, '__dict__'):
+        return tuple(item if type(item) in _SCALARS else fingerprint(item) for item in vars(value).values())
+    getter = _slot_getter(kind)
+    if getter is not None:
+        return tuple(item if type(item) in _SCALARS else fingerprint(item) for item in getter(value))
+    return value  # numpy 스칼라 등 (비교 가능)
+
+
+class PositionJournal:
+    """Position dict Save용 WAL + 스냅샷"""
+
+    def __init__(self, snapshot_path: str, serialize: Callable[[Any], dict], backup_path: Optional[str] = None,
+                 logger=None, compact_records: int = 1000, compact_interval: float = 30.0, scheduler=None):
+        """
+        Args:
+            snapshot_path: 스냅샷 JSON 경로 (로그는 <snapshot_path>.wal)
+            serialize: Position 객체 → JSON 직렬화 가능한 dict
+            backup_path: 압축 시 직전 스냅샷 복사본 경로 (None이면 백업 없음)
+            logger: 로거 인스턴스
+            compact_records: 로그 레코드가 이 수를 넘으면 압축
+            compact_interval: 로그에 레코드가 있고 마지막 압축 후 이 Time (초)이 지나면 압축
+            scheduler: PersistenceScheduler (있으면 자동 압축을 백그라운드로, None이면 save 안에서 동기)
+        """
+        self.snapshot_path = snapshot_path
+        self.wal_path = snapshot_path + '.wal'
+        self.prev_wal_path = self.wal_path + '.prev'
+        self._snapshot_corrupt = False  # 스냅샷 손상 → 다음 압축에서 백업으로 덮어쓰지 않음
+        self.backup_path = backup_path
+        self.serialize = serialize
+        self.logger = logger or logging.getLogger(__name__)
+        self.compact_records = compact_records
+        self.compact_interval = compact_interval
+        self.scheduler = scheduler
+
+        self._lock = threading.RLock()
+        self._fingerprints: Dict[str, Any] = {}  # symbol -> 마지막 Save 지문
+        self._encoded: Dict[str, str] = {}       # symbol -> 마지막 Save JSON 문자열 (압축 시 재사용)
+        self._wal_records = 0
+        self._last_compact = time.time()
+
+        self.stats = {
+            'saves': 0,
+            'records': 0,
+            'unchanged': 0,
+            'compactions': 0,
+            'replayed': 0,
+            'torn_records': 0,
+            'backup_recoveries': 0,
+            'last_save_ms': 0.0,
+            'max_save_ms': 0.0,
+        }
+
+    # ===== Load / Recover =====
+
+    def _read_snapshot(self) -> tuple:
+        """Returns: (스냅샷 데이터, 백업에서 읽었는지)"""
+        for path in (self.snapshot_path, self.backup_path):
+            if not path or not os.path.exists(path):
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception as e:
+                self.logger.error(f"스냅샷 Load Failed ({path}): {e}")
+                if path == self.snapshot_path:
+                    self._snapshot_corrupt = True
+                continue
+            if path != self.snapshot_path:
+                # 백업 이후 ~ 마지막 압축까지의 레코드는 이전 로그에서 재적용
+                self.stats['backup_recoveries'] += 1
+                self.logger.error(f"스냅샷 손상 - 백업 + 이전 로그 + 로그로 Recover ({path})")
+            return data, path != self.snapshot_path
+        return {}, False
+
+    def _replay(self, path: str, data: Dict[str, dict]) -> tuple:
+        """로그 File 1count 재적용 (Returns: (재적용 수, 손상 줄 수))"""
+        replayed = torn = 0
+        if not os.path.exists(path):
+            return replayed, torn
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().split('\n')
+        for index, line in enumerate(lines):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # 마지막 줄이 잘린 경우만 정상 (기록 도중 Terminate), 중간 손상은 경고 후 건너뜀
+                torn += 1
+                level = logging.WARNING if index >= len(lines) - 2 else logging.ERROR
+                self.logger.log(level, f"로그 레코드 손상 - 건너뜀 ({os.path.basename(path)} line {index + 1})")
+                continue
+            if record.get('op') == 'put':
+                data[record['symbol']] = record['data']
+            elif record.get('op') == 'del':
+                data.pop(record['symbol'], None)
+            replayed += 1
+        return replayed, torn
+
+    def load(self) -> Dict[str, dict]:
+        """스냅샷 (손상 시 백업) + 이전 로그 + 로그 재적용 → {symbol: Position dict}"""
+        with self._lock:
+            data, from_backup = self._read_snapshot()
+            if from_backup:
+                # 이전 로그 = 백업 이후 ~ 현재 스냅샷까지 (정상 스냅샷에는 이미 반영되어 있음)
+                self._replay(self.prev_wal_path, data)
+            replayed, torn = self._replay(self.wal_path, data)
+            self._wal_records = replayed + torn
+            self.stats['replayed'] += replayed
+            self.stats['torn_records'] += torn
+            if replayed:
+                self.logger.info(f"📒 Position 로그 재적용: {replayed}count 레코드")
+            return data
+
+    def track(self, positions: Dict[str, Any]) -> bool:
+        """
+        Load 직후 기준 상태 등록 (다음 save부터 바뀐 Position만 기록) + 로그가 있으면 압축
+
+        Returns:
+            bool: 압축 (스냅샷 재기록) 여부
+        """
+        with self._lock:
+            self._fingerprints = {symbol: fingerprint(position) for symbol, position in positions.items()}
+            self._encoded = {symbol: json.dumps(self.serialize(position), ensure_ascii=False)
+                             for symbol, position in positions.items()}
+            if self._wal_records or self._snapshot_corrupt:
+                self.compact()
+                return True
+            return False
+
+    # ===== Save =====
+
+    def save(self, positions: Dict[str, Any]) -> int:
+        """
+        바뀐 Position만 로그에 Add (Remove된 Symbol은 del 레코드)
+
+        Returns:
+            int: 이번에 기록한 레코드 수
+        """
+        started = time.perf_counter()
+        schedule_compact = False
+        with self._lock:
+            lines = []
+            for symbol, position in list(positions.items()):
+                current = fingerprint(position)
+                if self._fingerprints.get(symbol) == current and symbol in self._encoded:
+                    self.stats['unchanged'] += 1
+                    continue
+                try:
+                    encoded = json.dumps(self.serialize(position), ensure_ascii=False)
+                except Exception as e:
+                    self.logger.error(f"Position 직렬화 Failed {symbol}: {e}")
+                    continue
+                self._fingerprints[symbol] = current
+                self._encoded[symbol] = encoded
+                lines.append(f'{{"op": "put", "symbol": {json.dumps(symbol)}, "data": {encoded}}}')
+
+            for symbol in [symbol for symbol in self._encoded if symbol not in positions]:
+                del self._encoded[symbol]
+                self._fingerprints.pop(symbol, None)
+                lines.append(json.dumps({'op': 'del', 'symbol': symbol}))
+
+            if lines:
+                with open(self.wal_path, 'a', encoding='utf-8') as f:
+                    f.write('\n'.join(lines) + '\n')
+                self._wal_records += len(lines)
+                self.stats['records'] += len(lines)
+
+            if self._wal_records and (self._wal_records >= self.compact_records
+                                      or time.time() - self._last_compact >= self.compact_interval):
+                if self.scheduler is not None:
+                    schedule_compact = True
+                else:
+                    self.compact()
+
+            self.stats['saves'] += 1
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.stats['last_save_ms'] = elapsed_ms
+            self.stats['max_save_ms'] = max(self.stats['max_save_ms'], elapsed_ms)
+
+        # 예약은 _lock 밖에서 (scheduler Terminate 후에는 _write_lock을 잡고 동기 실행 → flush / 백그라운드 기록은
+        # _write_lock → close() → _lock 순서이므로 _lock을 잡은 채 예약하면 교착 가능)
+        if schedule_compact:
+            self.scheduler.schedule_call(self.wal_path, self.close, debounce=0)
+        return len(lines)
+
+    @staticmethod
+    def _fsync_file(path: str):
+        with open(path, 'rb+') as f:
+            os.fsync(f.fileno())
+
+    def _fsync_dir(self):
+        """rename / 새 File 생성을 디스크에 반영 (POSIX만, Windows는 디렉토리 fsync 미지원)"""
+        if os.name != 'posix':
+            return
+        fd = os.open(os.path.dirname(os.path.abspath(self.snapshot_path)), os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def compact(self):
+        """
+        마지막 직렬화 문자열로 스냅샷 교체 (Position 재직렬화 없음)
+
+        순서: 새 스냅샷 tmp 기록 + fsync → 직전 스냅샷을 백업으로 → 스냅샷 교체 → 로그를 이전 로그로 교체 →
+        새 로그. 어느 단계에서 죽어도 (전원 차단 포함) 스냅샷 / 백업 + 이전 로그 + 로그 재적용 결과가 같음
+        """
+        with self._lock:
+            body = ',\n'.join(f"{json.dumps(symbol, ensure_ascii=False)}: {encoded}"
+                              for symbol, encoded in self._encoded.items())
+            temp_path = self.snapshot_path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write('{\n' + body + '\n}' if body else '{}')
+                f.flush()
+                os.fsync(f.fileno())
+            # 손상된 스냅샷은 백업으로 복사하지 않음 (백업 + 이전 로그가 유일한 Recover 경로)
+            backed_up = not self._snapshot_corrupt
+            if backed_up and self.backup_path and os.path.exists(self.snapshot_path):
+                try:
+                    shutil.copy2(self.snapshot_path, self.backup_path)
+                    self._fsync_file(self.backup_path)
+                except Exception as e:
+                    backed_up = False
+                    self.logger.warning(f"백업 생성 실패 (계속 진행): {e}")
+            os.replace(temp_path, self.snapshot_path)
+            self._fsync_dir()
+            self._snapshot_corrupt = False
+            # 스냅샷 교체 후에 로그 정리 (그 사이 Terminate되어도 재적용 결과 동일)
+            if os.path.exists(self.wal_path):
+                if backed_up:
+                    # 백업 (직전 스냅샷) 이후 레코드 = 지금 로그 → 이전 로그로 보존
+                    os.replace(self.wal_path, self.prev_wal_path)
+                else:
+                    # 백업이 갱신되지 않음 (복사 실패 / 스냅샷 손상) → 이전 로그가 옛 백업부터 이어지도록 뒤에 붙임
+                    with open(self.wal_path, 'r', encoding='utf-8') as src, \
+                            open(self.prev_wal_path, 'a', encoding='utf-8') as dst:
+                        dst.write(src.read())
+                        dst.flush()
+                        os.fsync(dst.fileno())
+                    os.remove(self.wal_path)
+            open(self.wal_path, 'w').close()
+            self._fsync_dir()
+            self._wal_records = 0
+            self._last_compact = time.time()
+            self.stats['compactions'] += 1
+
+    def close(self):
+        """Terminate 시 로그를 스냅샷으로 압축"""
+        with self._lock:
+            if self._wal_records:
+                self.compact()
+
+    def get_stats(self) -> dict:
+        return {
+            **self.stats,
+            'positions': len(self._encoded),
+            'wal_records': self._wal_records,
+            'wal_bytes': os.path.getsize(self.wal_path) if os.path.exists(self.wal_path) else 0,
+            'prev_wal_bytes': os.path.getsize(self.prev_wal_path) if os.path.exists(self.prev_wal_path) else 0,
+        }
@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+"""
+DCA Position Save 로그 (WAL + 스냅샷) Verification (임시 디렉토리, 네트워크 없음)
+
+점검 항목:
+1. Recover 정확성: 무작위 변경 (필드 / Entry Add / Entry 필드 / Position Add / Remove) + save_data 후
+   압축 없이 Terminate → 새 매니저 Load 결과가 positions와 정확히 같음, 압축 후에도 같음
+2. 바뀌지 않은 Position은 직렬화하지 않음 (N count 중 1count 변경 → 직렬화 1times / 레코드 1count)
+3. 마지막 줄이 잘린 로그 (기록 중 Terminate) → 그 줄만 버리고 Recover
+4. 스냅샷 교체 후 / 로그 비우기 전 Terminate → 같은 결과 (재적용 멱등)
+   스냅샷 손상 (압축 여러 번 후) → 백업 + 이전 로그 + 로그로 Recover, 다음 압축이 백업을 덮어쓰지 않음
+5. 스냅샷은 기존 형식 ({symbol: Position dict}, json.load 가능)
+6. Save 비용: 기존 방식 (전체 asdict + indent JSON 재기록 + 백업 복사) 대비
+7. 스키마 v1 스냅샷 (ISO Time / *_exit_done bool) → Load 시 v2로 변환 + 스냅샷 재기록, 백업에 v1 보존
+
+Usage:
+    python dca_position_journal_check.py [--positions 300] [--mutations 2000]
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import shutil
+import tempfile
+import time
+from dataclasses import asdict
+
+from improved_dca_position_manager import DCAEntry, DCAPosition, ImprovedDCAPositionManager
+from persistence_scheduler import get_persistence_scheduler
+
+
+def make_position(symbol: str, entries: int = 3) -> DCAPosition:
+    now = 1767193200.0  # 2026-01-01T00:00:00+09:00
+    return DCAPosition(
+        symbol=symbol,
+        entries=[DCAEntry('initial' if i == 0 else f"pyramid_{i}", 100.0 + i, 1.0 + i, 100.0 * (i + 1), 10.0, now,
+                          order_type='market' if i == 0 else 'limit', order_id=f"{i}", is_filled=i == 0)
+                 for i in range(entries)],
+        current_stage='initial', initial_entry_price=100.0, average_price=100.0, total_quantity=1.0,
+        total_notional=100.0, is_active=True, created_at=now, last_update=now,
+        signal_metadata={'strategy': 'A', 'score': 1.5})
+
+
+def new_manager() -> ImprovedDCAPositionManager:
+    return ImprovedDCAPositionManager(exchange=None)
+
+
+def reset_files():
+    for name in os.listdir('.'):
+        if name.startswith('dca_'):
+            os.remove(name)
+
+
+def state(manager) -> dict:
+    return {symbol: asdict(position) for symbol, position in manager.positions.items()}
+
+
+def mutate(manager, rng: random.Random, counter: list):
+    symbols = list(manager.positions)
+    action = rng.random()
+    if action < 0.05 or not symbols:
+        counter[0] += 1
+        symbol = f"N{counter[0]}/USDT:USDT"
+        manager.positions[symbol] = make_position(symbol, rng.randint(1, 4))
+    elif action < 0.08:
+        manager.positions.pop(rng.choice(symbols))
+    else:
+        position = manager.positions[rng.choice(symbols)]
+        choice = rng.random()
+        if choice < 0.4:
+            position.max_profit_pct = rng.uniform(-5, 15)
+            position.last_update = 1767193200.0 + rng.randint(0, 59) * 60
+        elif choice < 0.6:
+            position.pyramid_1_executed = not position.pyramid_1_executed
+            position.bb600_exit_done = rng.random() < 0.5
+        elif choice < 0.8 and position.entries:
+            entry = rng.choice(position.entries)
+            entry.is_filled = True
+            entry.entry_price = rng.uniform(90, 110)
+        elif choice < 0.9:
+            position.entries.append(DCAEntry('pyramid', rng.uniform(90, 110), 1.0, 100.0, 10.0, 1767193200.0))
+        else:
+            position.signal_metadata = dict(position.signal_metadata or {}, score=rng.random())
+
+
+def check(results: list, name: str, passed: bool, detail: str = ''):
+    results.append(passed)
+    print(f"  {'✅' if passed else '❌'} {name}" + (f" - {detail}" if detail else ''))
+
+
+def check_recovery(results: list, count: int, mutations: int):
+    print(f"\n[1] Recover 정확성 ({count}count Position, 변경 {mutations}times)")
+    reset_files()
+    manager = new_manager()
+    manager.journal.compact_interval = float('inf')
+    manager.journal.compact_records = 10 ** 9
+    for i in range(count):
+        manager.positions[f"P{i}/USDT:USDT"] = make_position(f"P{i}/USDT:USDT")
+    manager.save_data()
+
+    rng = random.Random(7)
+    counter = [0]
+    for i in range(mutations):
+        mutate(manager, rng, counter)
+        if i % 3 == 0:
+            manager.save_data()
+    manager.save_data()
+    expected = state(manager)
+    stats = manager.journal.get_stats()
+
+    recovered = new_manager()  # 압축 없이 Terminate된 상태에서 Load
+    check(results, "스냅샷 + 로그 재적용 = positions", state(recovered) == expected,
+          f"{len(expected)}count, 로그 {stats['wal_records']}레코드 / {stats['wal_bytes'] / 1024:.0f}KB")
+    check(results, "Load 직후 로그 → 스냅샷 압축", recovered.journal.get_stats()['wal_records'] == 0
+          and not os.path.getsize(manager.journal.wal_path))
+    again = new_manager()
+    check(results, "압축된 스냅샷만으로 동일", state(again) == expected)
+
+
+def check_dirty(results: list, count: int):
+    print(f"\n[2] 바뀐 Position만 직렬화 ({count}count)")
+    reset_files()
+    manager = new_manager()
+    for i in range(count):
+        manager.positions[f"P{i}/USDT:USDT"] = make_position(f"P{i}/USDT:USDT")
+    manager.save_data()
+
+    calls = []
+    serialize = manager.journal.serialize
+    manager.journal.serialize = lambda position: calls.append(position.symbol) or serialize(position)
+    records = manager.journal.stats['records']
+    manager.save_data()
+    check(results, "변경 없음 → 직렬화 0times / 레코드 0count", not calls and manager.journal.stats['records'] == records)
+
+    manager.positions['P5/USDT:USDT'].entries[1].is_filled = True
+    manager.save_data()
+    check(results, "Entry 필드 1count 변경 → 해당 Position만", calls == ['P5/USDT:USDT']
+          and manager.journal.stats['records'] == records + 1, f"{calls}")
+
+    manager.positions.pop('P6/USDT:USDT')
+    manager.save_data()
+    with open(manager.journal.wal_path, encoding='utf-8') as f:
+        last = json.loads(f.read().strip().split('\n')[-1])
+    check(results, "Remove → del 레코드", last == {'op': 'del', 'symbol': 'P6/USDT:USDT'} and len(calls) == 1)
+
+
+def check_torn(results: list):
+    print("\n[3] 잘린 마지막 레코드")
+    reset_files()
+    manager = new_manager()
+    manager.journal.compact_interval = float('inf')
+    manager.positions['A/USDT:USDT'] = make_position('A/USDT:USDT')
+    manager.save_data()
+    manager.positions['A/USDT:USDT'].max_profit_pct = 3.0
+    manager.save_data()
+    expected = state(manager)
+    with open(manager.journal.wal_path, 'a', encoding='utf-8') as f:
+        f.write('{"op": "put", "symbol": "A/USDT:USDT", "data": {"symbol": "A/US')
+    recovered = new_manager()
+    check(results, "잘린 줄만 버리고 Recover", state(recovered) == expected
+          and recovered.journal.stats['torn_records'] == 1)
+
+
+def check_compaction_crash(results: list):
+    print("\n[4] 압축 도중 Terminate")
+    reset_files()
+    manager = new_manager()
+    manager.journal.compact_interval = float('inf')
+    for i in range(5):
+        manager.positions[f"P{i}/USDT:USDT"] = make_position(f"P{i}/USDT:USDT")
+    manager.save_data()
+    manager.positions['P1/USDT:USDT'].max_profit_pct = 9.0
+    manager.positions.pop('P2/USDT:USDT')
+    manager.save_data()
+    expected = state(manager)
+
+    wal_copy = manager.journal.wal_path + '.copy'
+    shutil.copy2(manager.journal.wal_path, wal_copy)
+    manager.flush_data()
+    os.replace(wal_copy, manager.journal.wal_path)  # 스냅샷은 교체됐고 로그는 아직 남은 상태
+    check(results, "새 스냅샷 + 옛 로그 재적용 = 동일", state(new_manager()) == expected)
+
+    with open(manager.positions_file, encoding='utf-8') as f:
+        snapshot = json.load(f)
+    check(results, "스냅샷 형식 {symbol: Position dict}", set(snapshot) == set(expected)
+          and snapshot['P1/USDT:USDT']['max_profit_pct'] == 9.0
+          and isinstance(snapshot['P0/USDT:USDT']['entries'], list))
+
+
+def check_snapshot_corruption(results: list):
+    print("\n[4-1] 스냅샷 손상 → 백업 Recover")
+    reset_files()
+    manager = new_manager()
+    manager.journal.compact_interval = float('inf')
+    for i in range(5):
+        manager.positions[f"P{i}/USDT:USDT"] = make_position(f"P{i}/USDT:USDT")
+    manager.save_data()
+    manager.flush_data()
+    manager.positions['P1/USDT:USDT'].max_profit_pct = 3.0  # 백업 이후 ~ 마지막 압축 사이 변경
+    manager.positions['P5/USDT:USDT'] = make_position('P5/USDT:USDT')
+    manager.save_data()
+    manager.flush_data()
+    manager.positions['P1/USDT:USDT'].max_profit_pct = 5.0  # 마지막 압축 이후 변경
+    manager.positions.pop('P2/USDT:USDT')
+    manager.save_data()
+    expected = state(manager)
+
+    def corrupt():
+        with open(manager.positions_file, 'w', encoding='utf-8') as f:
+            f.write('{"P0/USDT:USDT": {"sym')
+
+    corrupt()
+    recovered = new_manager()
+    check(results, "백업 + 이전 로그 + 로그 = 동일", state(recovered) == expected
+          and recovered.journal.stats['backup_recoveries'] == 1,
+          f"{sorted(state(recovered))} / {recovered.journal.stats['backup_recoveries']}")
+
+    # Recover 직후 압축이 손상 스냅샷을 백업으로 복사하지 않음 → 다시 손상돼도 Recover
+    corrupt()
+    check(results, "Recover 후 다시 손상 → 동일", state(new_manager()) == expected)
+
+
+def legacy_save(manager):
+    """기존 save_data 방식 (백업 복사 + 전체 asdict / sanitize + indent JSON 재기록)"""
+    if os.path.exists('legacy.json'):
+        shutil.copy2('legacy.json', 'legacy_backup.json')
+    data = {symbol: manager._sanitize_for_json(asdict(position)) for symbol, position in manager.positions.items()}
+    with open('legacy.json.tmp', 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2, separators=(',', ': '))
+    shutil.move('legacy.json.tmp', 'legacy.json')
+
+
+def check_cost(results: list, count: int):
+    print(f"\n[5] Save 비용 ({count}count Position, 매 Save마다 1count 변경)")
+    reset_files()
+    manager = new_manager()
+    for i in range(count):
+        manager.positions[f"P{i}/USDT:USDT"] = make_position(f"P{i}/USDT:USDT")
+    manager.save_data()
+    symbols = list(manager.positions)
+    rounds = 50
+
+    started = time.perf_counter()
+    for i in range(rounds):
+        manager.positions[symbols[i % count]].max_profit_pct = float(i)
+        legacy_save(manager)
+    legacy_ms = (time.perf_counter() - started) * 1000 / rounds
+
+    started = time.perf_counter()
+    for i in range(rounds):
+        manager.positions[symbols[i % count]].max_profit_pct = float(i) + 0.5
+        manager.save_data()
+    journal_ms = (time.perf_counter() - started) * 1000 / rounds
+    stats = manager.journal.get_stats()
+    check(results, "Save당 Time 감소", journal_ms < legacy_ms,
+          f"기존 {legacy_ms:.2f}ms → 로그 {journal_ms:.2f}ms ({legacy_ms / max(journal_ms, 1e-6):.1f}x), "
+          f"압축 {stats['compactions']}times")
+
+
+def check_schema_migration(results: list):
+    print("\n[6] 스키마 v1 → v2 마이그레이션")
+    reset_files()
+    legacy = {
+        'symbol': 'OLD/USDT:USDT',
+        'entries': [{'stage': 'initial', 'entry_price': 100.0, 'quantity': 1.0, 'notional': 100.0, 'leverage': 10.0,
+                     'timestamp': '2026-01-01T00:00:00+09:00', 'is_active': True}],
+        'current_stage': 'initial', 'initial_entry_price': 100.0, 'average_price': 100.0, 'total_quantity': 1.0,
+        'total_notional': 100.0, 'is_active': True, 'created_at': '2026-01-01T00:00:00+09:00',
+        'last_update': '2026-01-01T00:01:00+09:00', 'last_cyclic_entry': '',
+        'bb600_exit_done': True, 'supertrend_exit_done': True, 'peak_profit_exit_done': False,
+        'removed_field': 'x',
+    }
+    # Exit 플래그 1count (단일 IntFlag 멤버는 복합 값과 달리 __dict__가 클래스를 참조 → 지문 재귀 확인용)
+    single = dict(legacy, symbol='ONE/USDT:USDT', bb600_exit_done=False, supertrend_exit_done=False,
+                  peak_profit_exit_done=True)
+    with open('dca_positions.json', 'w', encoding='utf-8') as f:
+        json.dump({'OLD/USDT:USDT': legacy, 'ONE/USDT:USDT': single}, f)
+
+    manager = new_manager()
+    position = manager.positions.get('OLD/USDT:USDT')
+    check(results, "Time → epoch / 플래그 → exit_flags", position is not None
+          and position.created_at == 1767193200.0 and position.last_update == 1767193260.0
+          and position.entries[0].timestamp == 1767193200.0 and position.last_cyclic_entry == 0.0
+          and position.bb600_exit_done and position.supertrend_exit_done and not position.peak_profit_exit_done
+          and type(position.exit_flags) is int and position.trailing_stop_percentage == 0.05)
+
+    with open(manager.positions_file, encoding='utf-8') as f:
+        snapshot = json.load(f)['OLD/USDT:USDT']
+    with open(manager.backup_file, encoding='utf-8') as f:
+        backup = json.load(f)['OLD/USDT:USDT']
+    check(results, "스냅샷 v2 재기록 + 백업 v1 보존", snapshot['schema_version'] == 2
+          and 'bb600_exit_done' not in snapshot and backup['created_at'] == legacy['created_at'])
+    check(results, "재Load 시 동일", state(new_manager()) == state(manager))
+
+    # 로그에 레코드가 남아 있는 상태에서 업그레이드해도 압축은 1times → 백업은 v1 스냅샷
+    reset_files()
+    with open('dca_positions.json', 'w', encoding='utf-8') as f:
+        json.dump({'OLD/USDT:USDT': legacy}, f)
+    with open('dca_positions.json.wal', 'w', encoding='utf-8') as f:
+        f.write(json.dumps({'op': 'put', 'symbol': 'ONE/USDT:USDT', 'data': single}) + '\n')
+    manager = new_manager()
+    with open(manager.backup_file, encoding='utf-8') as f:
+        backup = json.load(f)
+    with open(manager.positions_file, encoding='utf-8') as f:
+        snapshot = json.load(f)
+    check(results, "로그 재적용 + 마이그레이션 → 백업 v1 보존", list(backup) == ['OLD/USDT:USDT']
+          and 'schema_version' not in backup['OLD/USDT:USDT'] and len(snapshot) == 2
+          and all(record['schema_version'] == 2 for record in snapshot.values())
+          and manager.journal.stats['compactions'] == 1)
+
+    # 재시작: 마이그레이션된 Position 그대로 + 백업 (v1) 내용 유지
+    with open(manager.backup_file, encoding='utf-8') as f:
+        backup_text = f.read()
+    restarted = new_manager()
+    with open(restarted.backup_file, encoding='utf-8') as f:
+        restarted_backup = f.read()
+    check(results, "재시작 후 Position / 백업 유지", state(restarted) == state(manager)
+          and set(restarted.positions) == {'OLD/USDT:USDT', 'ONE/USDT:USDT'}
+          and restarted.positions['ONE/USDT:USDT'].peak_profit_exit_done
+          and restarted_backup == backup_text and restarted.journal.stats['compactions'] == 0)
+
+    # Exit 플래그가 있는 v1 레코드에서 올라온 Position도 이후 Save가 로그에 기록되어야 함
+    position = manager.positions['ONE/USDT:USDT']
+    position.max_profit_pct = 0.07
+    position.breakeven_exit_done = True
+    manager.save_data()
+    records = manager.journal.get_stats()['wal_records']
+    reloaded = new_manager().positions['ONE/USDT:USDT']
+    check(results, "마이그레이션 후 Save → 로그 기록 / 재Load 반영", type(reloaded.exit_flags) is int and records == 1
+          and reloaded.max_profit_pct == 0.07 and reloaded.breakeven_exit_done and reloaded.peak_profit_exit_done,
+          f"로그 레코드 {records}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='DCA Position Save 로그 Verification')
+    parser.add_argument('--positions', type=int, default=300, help='Position 수')
+    parser.add_argument('--mutations', type=int, default=2000, help='무작위 변경 수')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    logging.getLogger('ImprovedDCAManager').setLevel(logging.ERROR)
+
+    results = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            check_recovery(results, args.positions, args.mutations)
+            check_dirty(results, args.positions)
+            check_torn(results)
+            check_compaction_crash(results)
+            check_snapshot_corruption(results)
+            check_cost(results, args.positions)
+            check_schema_migration(results)
+        finally:
+            get_persistence_scheduler().flush()  # 백그라운드 압축 / JSON Save가 임시 디렉토리 안에서 끝나도록
+            os.chdir(cwd)
+
+    print()
+    if all(results):
+        print(f"✅ 전체 통과 ({len(results)} 항목)")
+    else:
+        print(f"❌ Failed {results.count(False)} / {len(results)} 항목")
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+DCA Position 메모리 레이아웃 벤치마크
+기존 레이아웃 (dict 기반 dataclass, *_exit_done bool 6count, ISO 문자열 Time) vs
+Current 레이아웃 (slots dataclass, exit_flags 비트, epoch float Time, 스키마 v2)
+
+측정 항목:
+1. Load Time: dca_positions.json 문자열 → Position 객체 (기존 로더 / v1 마이그레이션 / v2)
+2. Position당 메모리 (tracemalloc, Entry 포함)
+3. 트리거 체크 처리량: Exit Complete 여부 6count 확인 + 불타기 간격 (Time 비교) + 최고가 갱신 Time 기록
+4. 마이그레이션 일치: v1 레코드 → v2 변환 후 플래그 / Time 값이 원본과 같음, exit_flags는 int (로그 지문 계산 가능)
+
+Usage:
+    python dca_position_layout_benchmark.py [--positions 2000] [--entries 4] [--rounds 20]
+"""
+
+import argparse
+import json
+import logging
+import random
+import time
+import tracemalloc
+from dataclasses import MISSING, asdict, field, fields, make_dataclass
+from datetime import datetime, timedelta, timezone
+
+from dca_position_journal import fingerprint
+from improved_dca_position_manager import (
+    EXIT_DONE_FIELDS, POSITION_TIME_FIELDS, DCAEntry, DCAPosition, position_from_dict, to_epoch,
+)
+
+KST = timezone(timedelta(hours=9))
+BASE_TIME = 1767193200.0  # 2026-01-01T00:00:00+09:00
+
+
+def legacy_classes():
+    """변경 전 DCAEntry / DCAPosition 레이아웃 재현 (일반 dataclass, bool 플래그, ISO 문자열 Time)"""
+    entry_fields = [(f.name, str if f.name == 'timestamp' else f.type) if f.default is MISSING
+                    else (f.name, f.type, field(default=f.default)) for f in fields(DCAEntry)]
+    LegacyEntry = make_dataclass('LegacyEntry', entry_fields)
+
+    position_fields = []
+    for f in fields(DCAPosition):
+        if f.name in ('exit_flags', 'schema_version', 'breakeven_protection_triggered', 'breakeven_highest_profit'):
+            continue
+        kind = str if f.name in POSITION_TIME_FIELDS else f.type
+        if f.default is MISSING:  # 기본값 없는 필드
+            position_fields.append((f.name, kind))
+        else:
+            position_fields.append((f.name, kind, field(default='' if f.name in POSITION_TIME_FIELDS else f.default)))
+        if f.name == 'max_profit_pct':
+            position_fields.extend((name, bool, field(default=False)) for name in EXIT_DONE_FIELDS)
+    LegacyPosition = make_dataclass('LegacyPosition', position_fields)
+    return LegacyEntry, LegacyPosition
+
+
+def make_legacy_record(rng: random.Random, symbol: str, entries: int) -> dict:
+    """기존 dca_positions.json 레코드 (스키마 v1)"""
+    def iso(offset: float) -> str:
+        return datetime.fromtimestamp(BASE_TIME + offset, KST).isoformat()
+
+    record = {
+        'symbol': symbol,
+        'entries': [{'stage': 'initial' if i == 0 else f"pyramid_{i}", 'entry_price': 100.0 + i, 'quantity': 1.0 + i,
+                     'notional': 100.0 * (i + 1), 'leverage': 10.0, 'timestamp': iso(i * 60), 'is_active': True,
+                     'order_type': 'market', 'order_id': '', 'is_filled': True} for i in range(entries)],
+        'current_stage': 'initial', 'initial_entry_price': 100.0, 'average_price': 101.0, 'total_quantity': 4.0,
+        'total_notional': 400.0, 'is_active': True, 'created_at': iso(0), 'last_update': iso(rng.randint(0, 3600)),
+        'strategy': 'A', 'signal_metadata': {'strategy': 'A', 'score': rng.random()},
+        'max_profit_pct': rng.uniform(0, 0.1),
+        'pyramid_last_peak_time': iso(rng.randint(0, 3600)), 'last_pyramid_time': iso(rng.randint(0, 3600)) if rng.random() < 0.5 else '',
+    }
+    for name in EXIT_DONE_FIELDS:
+        record[name] = rng.random() < 0.2
+    return record
+
+
+def load_legacy(text: str, LegacyEntry, LegacyPosition) -> dict:
+    """변경 전 load_data 경로 (Entry / Position 필드 그대로 생성)"""
+    positions = {}
+    for symbol, pos_data in json.loads(text).items():
+        pos_data['entries'] = [LegacyEntry(**entry) for entry in pos_data['entries']]
+        positions[symbol] = LegacyPosition(**pos_data)
+    return positions
+
+
+def load_current(text: str) -> dict:
+    return {symbol: position_from_dict(pos_data) for symbol, pos_data in json.loads(text).items()}
+
+
+def best_of(rounds: int, func):
+    best = float('inf')
+    result = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def measure_memory(build) -> tuple:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, objects
+
+
+def legacy_trigger_check(positions) -> int:
+    """기존 레이아웃: bool 속성 6count + ISO 문자열 파싱으로 간격 비교 + ISO 문자열로 Time 기록"""
+    triggered = 0
+    now = datetime.now(KST)
+    for position in positions:
+        if (position.supertrend_exit_done or position.bb80_bb600_exit_done or position.peak_profit_exit_done
+                or position.bb600_exit_done or position.weak_rise_dump_exit_done or position.breakeven_exit_done):
+            continue
+        if position.last_pyramid_time:
+            last_time = datetime.fromisoformat(position.last_pyramid_time.replace('Z', '+00:00'))
+            if (now.replace(tzinfo=None) - last_time.replace(tzinfo=None)).total_seconds() <= 300:
+                continue
+        position.pyramid_last_peak_time = datetime.now(KST).isoformat()
+        triggered += 1
+    return triggered
+
+
+def current_trigger_check(positions) -> int:
+    """Current 레이아웃: exit_flags 비트 1times + float 비교 + epoch 기록"""
+    triggered = 0
+    now = time.time()
+    for position in positions:
+        if position.exit_flags:
+            continue
+        if position.last_pyramid_time and now - position.last_pyramid_time <= 300:
+            continue
+        position.pyramid_last_peak_time = time.time()
+        triggered += 1
+    return triggered
+
+
+def check_migration(records: dict, positions: dict) -> int:
+    """v1 레코드와 마이그레이션 결과 비교 (불일치 수)"""
+    mismatches = 0
+    for symbol, record in records.items():
+        position = positions[symbol]
+        mismatches += type(position.exit_flags) is not int
+        for name in EXIT_DONE_FIELDS:
+            mismatches += getattr(position, name) != record[name]
+        for name in POSITION_TIME_FIELDS:
+            if name in record:
+                mismatches += abs(getattr(position, name) - to_epoch(record[name])) > 1e-6
+        mismatches += [entry.timestamp for entry in position.entries] != [to_epoch(entry['timestamp'])
+                                                                          for entry in record['entries']]
+        mismatches += position.signal_metadata != record['signal_metadata']
+        try:
+            fingerprint(position)
+        except RecursionError:
+            mismatches += 1
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description='DCA Position 레이아웃 벤치마크')
+    parser.add_argument('--positions', type=int, default=2000, help='Position 수')
+    parser.add_argument('--entries', type=int, default=4, help='Position당 Entry 수')
+    parser.add_argument('--rounds', type=int, default=20, help='측정 반복 (최소값 사용)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    rng = random.Random(11)
+    LegacyEntry, LegacyPosition = legacy_classes()
+
+    # 기존 save_data와 같이 asdict 전체 필드로 기록된 v1 파일
+    records = {f"P{i}/USDT:USDT": make_legacy_record(rng, f"P{i}/USDT:USDT", args.entries)
+               for i in range(args.positions)}
+    # Exit 플래그 1count만 있는 레코드 보장 (단일 ExitFlag 멤버로 저장되면 로그 지문 계산이 재귀 → 불일치로 집계)
+    records['P0/USDT:USDT'].update({name: name == 'bb600_exit_done' for name in EXIT_DONE_FIELDS})
+    v1_text = json.dumps({symbol: asdict(position) for symbol, position
+                          in load_legacy(json.dumps(records), LegacyEntry, LegacyPosition).items()}, ensure_ascii=False)
+    migrated = load_current(v1_text)
+    v2_text = json.dumps({symbol: asdict(position) for symbol, position in migrated.items()}, ensure_ascii=False)
+
+    print(f"📊 DCA Position 레이아웃 벤치마크: {args.positions} positions × {args.entries} entries, best of {args.rounds}")
+
+    # 1. Load Time
+    legacy_load, legacy_positions = best_of(args.rounds, lambda: load_legacy(v1_text, LegacyEntry, LegacyPosition))
+    migrate_load, _ = best_of(args.rounds, lambda: load_current(v1_text))
+    current_load, current_positions = best_of(args.rounds, lambda: load_current(v2_text))
+    print(f"\n[1] Load Time (JSON 문자열 → 객체)")
+    print(f"  기존 로더 (v1)        {legacy_load * 1000:8.2f}ms")
+    print(f"  v1 → v2 마이그레이션  {migrate_load * 1000:8.2f}ms  (업그레이드 후 첫 Load 1times)")
+    print(f"  v2                    {current_load * 1000:8.2f}ms  ({legacy_load / current_load:.2f}x)")
+    print(f"  JSON 크기             v1 {len(v1_text) / 1024:.0f}KB → v2 {len(v2_text) / 1024:.0f}KB")
+
+    # 2. Position당 메모리 (JSON dict → 객체 생성분만)
+    legacy_data, current_data = json.loads(v1_text), json.loads(v2_text)
+    legacy_bytes, _ = measure_memory(lambda: load_legacy(json.dumps(legacy_data), LegacyEntry, LegacyPosition))
+    current_bytes, _ = measure_memory(lambda: load_current(json.dumps(current_data)))
+    print(f"\n[2] Position당 메모리 (Entry {args.entries}count 포함)")
+    print(f"  기존   {legacy_bytes / args.positions:8.0f} bytes")
+    print(f"  Current {current_bytes / args.positions:8.0f} bytes  ({(1 - current_bytes / legacy_bytes) * 100:.1f}% 감소)")
+
+    # 3. 트리거 체크 처리량
+    legacy_list, current_list = list(legacy_positions.values()), list(current_positions.values())
+    legacy_check, legacy_hits = best_of(args.rounds, lambda: legacy_trigger_check(legacy_list))
+    current_check, current_hits = best_of(args.rounds, lambda: current_trigger_check(current_list))
+    print(f"\n[3] 트리거 체크 처리량 (Exit 플래그 6count + 불타기 간격 + 최고가 Time 기록)")
+    print(f"  기존   {args.positions / legacy_check:12,.0f} positions/s")
+    print(f"  Current {args.positions / current_check:12,.0f} positions/s  ({legacy_check / current_check:.2f}x)")
+
+    # 4. 마이그레이션 일치
+    mismatches = check_migration(json.loads(v1_text), migrated)
+    same_hits = legacy_hits == current_hits
+    print(f"\n[4] 마이그레이션 일치")
+    print(f"  {'✅' if not mismatches else '❌'} v1 → v2 플래그 / Time / Entry 값 일치 (불일치 {mismatches})")
+    print(f"  {'✅' if same_hits else '❌'} 트리거 체크 결과 동일 ({legacy_hits} / {current_hits})")
+    if mismatches or not same_hits:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
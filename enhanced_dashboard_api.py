@@ -102,6 +102,12 @@ def get_korea_time():
     """한국 표준시(KST) 현재 시간 반환"""
     return datetime.now(timezone(timedelta(hours=9)))
 
+def _format_created_at(value):
+    """DCA 포지션 생성 시간 표시 (스키마 v2는 epoch 초, 이전 파일은 ISO 문자열)"""
+    if isinstance(value, (int, float)) and value:
+        return datetime.fromtimestamp(value, timezone(timedelta(hours=9))).isoformat()
+    return value or 'N/A'
+
 def calculate_hash(data):
     """데이터 해시 계산 (변경 감지용)"""
     return hashlib.md5(json.dumps(data, sort_keys=True).encode()).hexdigest()
@@ -139,7 +145,7 @@ def websocket_data_callback(stream_data):
                 'totalNotional': dca_info.get('total_notional', abs(pos['positionAmt'] * pos['markPrice'])),
                 'averagePrice': dca_info.get('average_price', pos['entryPrice']),
                 'maxCyclicCount': dca_info.get('max_cyclic_count', 3),
-                'createdAt': dca_info.get('created_at', 'N/A')
+                'createdAt': _format_created_at(dca_info.get('created_at'))
             })
             enhanced_positions.append(pos_enhanced)
         
@@ -279,7 +285,7 @@ def get_open_positions():
                     'totalNotional': dca_info.get('total_notional', abs(position_amt * mark_price)),
                     'averagePrice': dca_info.get('average_price', entry_price),
                     'maxCyclicCount': dca_info.get('max_cyclic_count', 3),
-                    'createdAt': dca_info.get('created_at', 'N/A')
+                    'createdAt': _format_created_at(dca_info.get('created_at'))
                 }
 
                 open_positions.append(position_data)
@@ -15,17 +15,23 @@ SuperClaude Expert Mode Implementation
 import json
 import time
 import os
+import sys
 import threading
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
-from enum import Enum
+from enum import Enum, IntFlag
 import ccxt
 import logging
 import traceback
 import pandas as pd
 import numpy as np
 
+from indicators import trailing_supertrend
+from indicator_cache import get_indicator_cache
+from dca_position_journal import PositionJournal
+from persistence_scheduler import get_persistence_scheduler
+
 # Binance Rate Limiter 추가 (IP 차단 방지)
 try:
     from binance_rate_limiter import RateLimitedExchange, BinanceRateLimiter
@@ -89,6 +95,38 @@ class ExitType(Enum):
     DCA_CYCLIC_EXIT = "dca_cyclic_exit"       # DCA Cyclic trading 일부Exit
     PEAK_PROFIT_EXIT = "peak_profit_exit"     # 15분봉 BB/MA 피크 전량익절
 
+class ExitFlag(IntFlag):
+    """Exit Complete 여부 비트 (DCAPosition.exit_flags, 기존 *_exit_done bool 필드 대체)"""
+    BB80_BB600 = 1         # BB80>BB600 복합기술적 전량청산
+    BB600 = 2              # BB600 50% Exit
+    BREAKEVEN = 4          # 본절보호Exit
+    SUPERTREND = 8         # SuperTrend Exit
+    WEAK_RISE_DUMP = 16    # Approx상승후 급락 리스크 times피 Exit
+    PEAK_PROFIT = 32       # 15분봉 BB/MA 피크 전량익절
+
+# 기존 bool 필드명 → 비트 (JSON 마이그레이션 / 호환 property)
+EXIT_DONE_FIELDS = {
+    'bb80_bb600_exit_done': ExitFlag.BB80_BB600,
+    'bb600_exit_done': ExitFlag.BB600,
+    'breakeven_exit_done': ExitFlag.BREAKEVEN,
+    'supertrend_exit_done': ExitFlag.SUPERTREND,
+    'weak_rise_dump_exit_done': ExitFlag.WEAK_RISE_DUMP,
+    'peak_profit_exit_done': ExitFlag.PEAK_PROFIT,
+}
+
+# Exit Type별 Complete 처리할 비트 (전량 Exit은 이후 Exit 체크 전체 Skip)
+EXIT_COMPLETION_FLAGS = {
+    ExitType.SUPERTREND_EXIT.value: ExitFlag.SUPERTREND,
+    ExitType.BB80_BB600_AUTO_LIQUIDATION.value: (ExitFlag.BB80_BB600 | ExitFlag.SUPERTREND | ExitFlag.BB600
+                                                 | ExitFlag.WEAK_RISE_DUMP | ExitFlag.BREAKEVEN | ExitFlag.PEAK_PROFIT),
+    ExitType.BB600_PARTIAL_EXIT.value: ExitFlag.BB600,
+    ExitType.PEAK_PROFIT_EXIT.value: (ExitFlag.PEAK_PROFIT | ExitFlag.SUPERTREND | ExitFlag.BB600
+                                      | ExitFlag.WEAK_RISE_DUMP | ExitFlag.BREAKEVEN),
+    ExitType.BREAKEVEN_PROTECTION.value: (ExitFlag.BREAKEVEN | ExitFlag.SUPERTREND | ExitFlag.BB600
+                                          | ExitFlag.WEAK_RISE_DUMP),
+    ExitType.WEAK_RISE_DUMP_PROTECTION.value: ExitFlag.WEAK_RISE_DUMP | ExitFlag.SUPERTREND | ExitFlag.BB600,
+}
+
 class CyclicState(Enum):
     """Cyclic trading Status"""
     NORMAL_DCA = "normal_dca"           # 일반 DCA (Cyclic trading 아님)
@@ -96,7 +134,22 @@ class CyclicState(Enum):
     CYCLIC_PAUSED = "cyclic_paused"     # Cyclic trading 일시 중단
     CYCLIC_COMPLETE = "cyclic_complete" # Cyclic trading Complete (3times 달성)
 
-@dataclass
+# Python 3.10+: __slots__ 기반 dataclass (인스턴스 __dict__ 없음 → 메모리 / 속성 접근 비용 감소)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# dca_positions.json Position 레코드 스키마 버전
+#   1: Time 필드 ISO 문자열, Exit Complete 여부 *_exit_done bool 6count
+#   2: Time 필드 epoch 초 (float, 미기록 0.0), Exit Complete 여부 exit_flags 비트 (ExitFlag)
+POSITION_SCHEMA_VERSION = 2
+
+# epoch 초 (float)로 저장하는 Time 필드
+POSITION_TIME_FIELDS = (
+    'created_at', 'last_update', 'last_cyclic_entry', 'profit_protection_last_check',
+    'pyramid_last_peak_time', 'pyramid_1_entry_time', 'pyramid_2_entry_time', 'pyramid_3_entry_time',
+    'last_pyramid_time',
+)
+
+@dataclass(**_DATACLASS_SLOTS)
 class DCAEntry:
     """DCA Entry 기록"""
     stage: str              # Entry Stage
@@ -104,15 +157,25 @@ class DCAEntry:
     quantity: float         # Quantity
     notional: float         # 명목가치 (USDT)
     leverage: float         # 레버리지
-    timestamp: str          # Entry Time
+    timestamp: float        # Entry Time (epoch 초)
     is_active: bool = True  # Active Status
     order_type: str = "market"    # 주문 Type (market/limit)
     order_id: str = ""            # 주문 ID (지정가 주문용)
     is_filled: bool = True        # 체결 Status (시장가는 즉시 True, 지정가는 체결시 True)
 
-@dataclass
+def _exit_done_property(flag: ExitFlag):
+    """exit_flags 비트를 기존 *_exit_done bool 속성으로 노출"""
+    def getter(self) -> bool:
+        return bool(self.exit_flags & flag)
+
+    def setter(self, value: bool):
+        self.exit_flags = int(self.exit_flags | flag) if value else int(self.exit_flags & ~flag)
+
+    return property(getter, setter)
+
+@dataclass(**_DATACLASS_SLOTS)
 class DCAPosition:
-    """DCA Position 데이터"""
+    """DCA Position 데이터 (Time 필드는 epoch 초, 0.0 = 미기록)"""
     symbol: str
     entries: List[DCAEntry]
     current_stage: str
@@ -121,8 +184,8 @@ class DCAPosition:
     total_quantity: float
     total_notional: float
     is_active: bool
-    created_at: str
-    last_update: str
+    created_at: float
+    last_update: float
     
     # 전략 정보 필드
     strategy: str = "A"  # A, B, C 전략
@@ -131,18 +194,15 @@ class DCAPosition:
     cyclic_count: int = 0
     max_cyclic_count: int = 3
     cyclic_state: str = CyclicState.NORMAL_DCA.value
-    last_cyclic_entry: str = ""  # 마지막 Cyclic trading Entry Time
+    last_cyclic_entry: float = 0.0  # 마지막 Cyclic trading Entry Time
     total_cyclic_profit: float = 0.0  # Cumulative Cyclic trading 수익
     
     # New 7가지 Exit 방식 추적
     max_profit_pct: float = 0.0  # 최대 Profit ratio 추적
-    bb80_bb600_exit_done: bool = False  # BB80>BB600 복합기술적 전량청산 Complete 여부
-    bb600_exit_done: bool = False  # BB600 50% Exit Complete 여부
+    exit_flags: int = 0  # Exit Complete 여부 비트 (ExitFlag, *_exit_done 속성으로도 접근)
     breakeven_protection_active: bool = False  # Approx수익 보호 Active화 여부
-    breakeven_exit_done: bool = False  # 본절보호Exit Complete 여부 (중복 방지용)
-    supertrend_exit_done: bool = False  # SuperTrend Exit Complete 여부
-    weak_rise_dump_exit_done: bool = False  # Approx상승후 급락 리스크 times피 Exit Complete 여부
-    peak_profit_exit_done: bool = False  # 15분봉 BB/MA 피크 전량익절 Complete 여부
+    breakeven_protection_triggered: bool = False  # 불타기 후 본절 보호 시스템 Active화 여부
+    breakeven_highest_profit: float = 0.0  # 본절 보호 Active화 이후 최고 Profit ratio
     
     # Trailing 스탑 관련 필드
     trailing_stop_active: bool = False  # Trailing 스탑 Active화 여부
@@ -153,20 +213,89 @@ class DCAPosition:
     max_profit_achieved: float = 0.0      # 달성한 최대 수익률 추적
     profit_protection_active: bool = False # 수익 보호 청산 활성화 여부
     profit_protection_level: int = 0       # 현재 수익 보호 단계 (1:2%+, 2:4%+, 3:6%+)
-    profit_protection_last_check: str = "" # 마지막 수익 보호 체크 시간
+    profit_protection_last_check: float = 0.0 # 마지막 수익 보호 체크 시간
 
     # Pyramid (불타기) 관련 필드
     pyramid_count: int = 0              # 현재 불타기 횟수 (0, 1, 2, 3)
     pyramid_stage: str = 'initial'       # 불타기 단계 (initial, pyramid_1, pyramid_2, pyramid_3)
     pyramid_highest_price: float = 0.0   # 진입 이후 최고가 추적
-    pyramid_last_peak_time: str = ""     # 최고점 도달 시간
+    pyramid_last_peak_time: float = 0.0  # 최고점 도달 시간
     pyramid_1_executed: bool = False     # 1차 불타기 실행 여부
     pyramid_2_executed: bool = False     # 2차 불타기 실행 여부
     pyramid_3_executed: bool = False     # 3차 불타기 실행 여부
-    pyramid_1_entry_time: str = ""       # 1차 불타기 진입 시간
-    pyramid_2_entry_time: str = ""       # 2차 불타기 진입 시간
-    pyramid_3_entry_time: str = ""       # 3차 불타기 진입 시간
-    last_pyramid_time: str = ""          # 마지막 불타기 실행 시간 (간격 제한용)
+    pyramid_1_entry_time: float = 0.0    # 1차 불타기 진입 시간
+    pyramid_2_entry_time: float = 0.0    # 2차 불타기 진입 시간
+    pyramid_3_entry_time: float = 0.0    # 3차 불타기 진입 시간
+    last_pyramid_time: float = 0.0       # 마지막 불타기 실행 시간 (간격 제한용)
+
+    schema_version: int = POSITION_SCHEMA_VERSION  # JSON 레코드 스키마 버전
+
+    # Exit Complete 여부 (exit_flags 비트, 필드 아님)
+    bb80_bb600_exit_done = _exit_done_property(ExitFlag.BB80_BB600)
+    bb600_exit_done = _exit_done_property(ExitFlag.BB600)
+    breakeven_exit_done = _exit_done_property(ExitFlag.BREAKEVEN)
+    supertrend_exit_done = _exit_done_property(ExitFlag.SUPERTREND)
+    weak_rise_dump_exit_done = _exit_done_property(ExitFlag.WEAK_RISE_DUMP)
+    peak_profit_exit_done = _exit_done_property(ExitFlag.PEAK_PROFIT)
+
+_POSITION_FIELDS = frozenset(DCAPosition.__dataclass_fields__)
+_ENTRY_FIELDS = frozenset(DCAEntry.__dataclass_fields__)
+
+def to_epoch(value) -> float:
+    """ISO 문자열 / 숫자 → epoch 초 (빈 값 / 해석 불가는 0.0, timezone 없는 문자열은 KST)"""
+    if not value:
+        return 0.0
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return 0.0
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone(timedelta(hours=9)))
+    return parsed.timestamp()
+
+def format_epoch(value: float) -> str:
+    """epoch 초 → KST ISO 문자열 (Notification / 로그 표시용, 0.0은 빈 문자열)"""
+    if not value:
+        return ""
+    return datetime.fromtimestamp(value, timezone(timedelta(hours=9))).isoformat()
+
+def migrate_position_data(data: dict) -> dict:
+    """
+    dca_positions.json Position 레코드를 Current 스키마로 변환 (제자리 변경 후 반환)
+
+    - v1 → v2: Time 필드 ISO 문자열 → epoch 초, *_exit_done bool → exit_flags 비트
+    - Trailing 스탑 필드가 없는 초기 레코드는 dataclass 기본값으로 채워짐
+    """
+    version = data.get('schema_version', 1)
+    if version < 2:
+        flags = int(data.get('exit_flags') or 0)
+        for name, flag in EXIT_DONE_FIELDS.items():
+            if data.pop(name, False):
+                flags |= int(flag)  # int | IntFlag → IntFlag이 되므로 int로 유지 (JSON / 지문 비교용)
+        data['exit_flags'] = flags
+        for name in POSITION_TIME_FIELDS:
+            if name in data:
+                data[name] = to_epoch(data[name])
+        for entry in data.get('entries') or []:
+            entry['timestamp'] = to_epoch(entry.get('timestamp'))
+    data['schema_version'] = POSITION_SCHEMA_VERSION
+    return data
+
+def position_from_dict(data: dict) -> DCAPosition:
+    """JSON Position 레코드 (모든 스키마 버전) → DCAPosition"""
+    if data.get('schema_version', 1) != POSITION_SCHEMA_VERSION:
+        data = migrate_position_data(data)
+    entries = data.get('entries') or []
+    try:
+        data['entries'] = [DCAEntry(**entry) for entry in entries]
+        return DCAPosition(**data)
+    except TypeError:
+        # 알 수 없는 키 (구버전 / 수동 편집) → 필드만 골라서 생성
+        data['entries'] = [DCAEntry(**{key: value for key, value in entry.items() if key in _ENTRY_FIELDS})
+                           for entry in entries]
+        return DCAPosition(**{key: value for key, value in data.items() if key in _POSITION_FIELDS})
 
 class ImprovedDCAPositionManager:
     """count선된 Cyclic trading수 Position Admin"""
@@ -210,6 +339,12 @@ class ImprovedDCAPositionManager:
         # 중복 Notification 방지용 (체결 Notification 중복 방지) - File 기반 지속성 Add
         self._sent_fill_notifications = set()  # {symbol_stage_orderid} 형태
         self._load_sent_notifications()  # 재Starting 시 Legacy Notification 기록 Load
+
+        # 미체결 지정가 Entry 색인 {order_id: (symbol, DCAEntry)} - ORDER_TRADE_UPDATE 체결 반영용
+        self._pending_orders: Dict[str, Tuple[str, DCAEntry]] = {}
+        self.open_orders_check_interval = 60  # 스트림이 살아있을 때 fetch_open_orders 안전망 주기 (초)
+        self._last_open_orders_check = 0.0
+        self.order_event_stats = {'filled': 0, 'canceled': 0, 'safety_net': 0}
         
         # Exit 시스템 Initialize (누락된 속성들)
         self.advanced_exit_system = None  # 고급 Exit 시스템 (미구현)
@@ -279,8 +414,17 @@ class ImprovedDCAPositionManager:
         # New 5가지 Exit 방식만 Usage
         self.logger.info("New 5가지 Exit 방식 Active화: SuperTrend, Approx수익보호, Approx상승후급락리스크times피, BB600, DCACyclic trading")
         
+        # 📒 Position Save 로그 (바뀐 Position만 append, 주기적으로 dca_positions.json 스냅샷 압축)
+        # 💾 JSON 상태 File은 공용 스케줄러에서 디바운스 / 원자적 기록 (Position 로그 Add는 동기, 압축만 백그라운드)
+        self.persistence = get_persistence_scheduler(self.logger)
+        self.journal = PositionJournal(self.positions_file, self._serialize_position,
+                                       backup_path=self.backup_file, logger=self.logger,
+                                       scheduler=self.persistence)
+        self._saved_limits = None
+
         # 데이터 Load
         self.load_data()
+        self._rebuild_pending_index()
         
         # 🔥 DCA 시스템 간소화 (불탄기만 사용)
         self._apply_simplified_system()
@@ -311,7 +455,7 @@ class ImprovedDCAPositionManager:
                 
                 # Average price update
                 position.average_price = new_avg_price
-                position.last_update = get_korea_time().isoformat()
+                position.last_update = time.time()
                 
                 # 로깅
                 if price_change_pct > 0.1:  # 0.1% 이상 change시에만 로깅
@@ -352,26 +496,19 @@ class ImprovedDCAPositionManager:
     def load_data(self):
         """데이터 Load"""
         with self.file_lock:
-            # Position 데이터 Load
+            # Position 데이터 Load (스냅샷 + 로그 재적용)
+            migrated = 0
             try:
-                if os.path.exists(self.positions_file):
-                    with open(self.positions_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        for symbol, pos_data in data.items():
-                            # DCAEntry 객체로 변환
-                            entries = [DCAEntry(**entry) for entry in pos_data['entries']]
-                            pos_data['entries'] = entries
-                            
-                            # Trailing 스탑 필드 마이그레이션 (Legacy Position 호환성)
-                            if 'trailing_stop_active' not in pos_data:
-                                pos_data['trailing_stop_active'] = False
-                            if 'trailing_stop_high' not in pos_data:
-                                pos_data['trailing_stop_high'] = 0.0
-                            if 'trailing_stop_percentage' not in pos_data:
-                                pos_data['trailing_stop_percentage'] = 0.05
-                            
-                            self.positions[symbol] = DCAPosition(**pos_data)
+                data = self.journal.load()
+                if data:
+                    # 스키마 마이그레이션 (v1 ISO Time / bool Exit 플래그 → v2) 후 DCAPosition / DCAEntry 객체로 변환
+                    migrated = sum(1 for pos_data in data.values()
+                                   if pos_data.get('schema_version', 1) < POSITION_SCHEMA_VERSION)
+                    for symbol, pos_data in data.items():
+                        self.positions[symbol] = position_from_dict(pos_data)
                     self.logger.info(f"Position 데이터 Load Complete: {len(self.positions)}count")
+                    if migrated:
+                        self.logger.info(f"📦 Position 스키마 v{POSITION_SCHEMA_VERSION} 마이그레이션: {migrated}count")
                 else:
                     self.positions = {}
                     self.logger.info("Position file not found - 새로 Starting")
@@ -383,15 +520,23 @@ class ImprovedDCAPositionManager:
                         with open(self.backup_file, 'r', encoding='utf-8') as f:
                             data = json.load(f)
                             for symbol, pos_data in data.items():
-                                entries = [DCAEntry(**entry) for entry in pos_data['entries']]
-                                pos_data['entries'] = entries
-                                self.positions[symbol] = DCAPosition(**pos_data)
+                                self.positions[symbol] = position_from_dict(pos_data)
                         self.logger.info(f"Backup File에서 Recover Complete: {len(self.positions)}count")
                     except Exception as be:
                         self.logger.error(f"Backup File Recover Failed: {be}")
                         self.positions = {}
                 else:
                     self.positions = {}
+
+            # 로드된 상태를 로그 기준으로 등록 (재적용한 로그는 스냅샷으로 압축)
+            try:
+                compacted = self.journal.track(self.positions)
+                if migrated and not compacted:
+                    # 스냅샷을 새 스키마로 재기록 (백업에는 이전 스키마가 남음, 로그 압축으로 이미 재기록했으면 생략 -
+                    # 다시 압축하면 새 스냅샷이 백업을 덮어씀)
+                    self.journal.compact()
+            except Exception as e:
+                self.logger.error(f"Position 로그 기준 등록 Failed: {e}")
             
             # 제한 데이터 Load
             try:
@@ -406,63 +551,17 @@ class ImprovedDCAPositionManager:
                 self.symbol_limits = {}
 
     def save_data(self):
-        """데이터 Save - JSON 직렬화 오류 해결 및 시스템 안정성 강화"""
+        """데이터 Save - 바뀐 Position만 로그에 Add (전체 스냅샷은 주기적 압축 시에만, dca_position_journal 참고)"""
         try:
             with self.file_lock:
-                # Backup Create
-                if os.path.exists(self.positions_file):
-                    import shutil
-                    try:
-                        shutil.copy2(self.positions_file, self.backup_file)
-                    except Exception as backup_error:
-                        self.logger.warning(f"백업 생성 실패 (계속 진행): {backup_error}")
+                self.journal.save(self.positions)
                 
-                # Position 데이터 Save - numpy 타입 변환 추가
-                data = {}
-                for symbol, position in self.positions.items():
-                    try:
-                        # DCAEntry를 dict로 변환하고 numpy 타입 처리
-                        entries_dict = []
-                        for entry in position.entries:
-                            entry_dict = asdict(entry)
-                            entry_dict = self._sanitize_for_json(entry_dict)
-                            entries_dict.append(entry_dict)
-                        
-                        pos_dict = asdict(position)
-                        pos_dict = self._sanitize_for_json(pos_dict)
-                        pos_dict['entries'] = entries_dict
-                        data[symbol] = pos_dict
-                    except Exception as pos_error:
-                        self.logger.error(f"포지션 데이터 처리 실패 {symbol}: {pos_error}")
-                        # 해당 포지션은 스킵하고 계속 진행
-                        continue
-                
-                # JSON 파일 저장 (원자적 저장 - 임시파일 사용)
-                temp_file = self.positions_file + ".tmp"
-                try:
-                    with open(temp_file, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, ensure_ascii=False, indent=2, separators=(',', ': '))
-                    
-                    # 성공적으로 저장된 경우에만 원본 파일로 대체
-                    if os.path.exists(temp_file):
-                        import shutil
-                        shutil.move(temp_file, self.positions_file)
-                except Exception as json_error:
-                    self.logger.error(f"JSON 파일 저장 실패: {json_error}")
-                    # 임시파일 정리
-                    try:
-                        if os.path.exists(temp_file):
-                            os.remove(temp_file)
-                    except:
-                        pass
-                    raise json_error
-                
-                # 제한 데이터 Save (실패해도 시스템은 계속)
-                try:
-                    with open(self.limits_file, 'w', encoding='utf-8') as f:
-                        json.dump(self.symbol_limits, f, ensure_ascii=False, indent=2)
-                except Exception as limits_error:
-                    self.logger.warning(f"제한 데이터 저장 실패 (계속 진행): {limits_error}")
+                # 제한 데이터 Save (바뀐 경우만, 백그라운드 디바운스 기록)
+                if self.symbol_limits != self._saved_limits:
+                    # 요청 시점 사본을 기록 (producer는 scheduler 스레드에서 lock 없이 호출됨)
+                    limits = dict(self.symbol_limits)
+                    self._saved_limits = limits
+                    self.persistence.schedule(self.limits_file, lambda: limits)
                 
                 self.logger.debug("Data save complete")
                 
@@ -476,6 +575,19 @@ class ImprovedDCAPositionManager:
             # 치명적 오류가 아닌 경우 시스템은 계속 실행
             self.logger.warning("데이터 저장 실패했지만 시스템은 계속 실행합니다")
 
+    def flush_data(self):
+        """Terminate 시 로그를 dca_positions.json 스냅샷으로 압축 + 대기 중인 JSON Save 기록"""
+        try:
+            with self.file_lock:
+                self.journal.close()
+            self.persistence.flush()
+        except Exception as e:
+            self.logger.error(f"Position 스냅샷 압축 Failed: {e}")
+
+    def _serialize_position(self, position: DCAPosition) -> dict:
+        """DCAPosition → JSON dict (entries 포함, numpy 타입 변환)"""
+        return self._sanitize_for_json(asdict(position))
+
     def _sanitize_for_json(self, obj):
         """JSON 직렬화를 위해 numpy 타입을 Python 기본 타입으로 변환"""
         if isinstance(obj, dict):
@@ -580,6 +692,44 @@ class ImprovedDCAPositionManager:
                 self.logger.error(traceback.format_exc())
                 return {'success': False, 'error': str(e)}
 
+    def apply_exchange_position(self, symbol: str, exchange_pos: Optional[dict]) -> Optional[str]:
+        """
+        스트림으로 받은 Symbol 1count Position 변경 반영 (sync_with_exchange의 Symbol 단위 버전, REST 없음)
+
+        Args:
+            exchange_pos: ccxt fetch_positions 형식 행 (None 또는 contracts 0 = 청산)
+        Returns:
+            'registered' / 'cleaned' / 'updated' / None (Change 없음)
+        """
+        exchange_pos = exchange_pos or {}
+        contracts = abs(float(exchange_pos.get('contracts') or 0))
+        exchange_pos = {
+            'symbol': symbol,
+            'contracts': contracts,
+            'notional': abs(float(exchange_pos.get('notional') or 0)),
+            'side': exchange_pos.get('side'),
+            'entry_price': float(exchange_pos.get('entryPrice') or 0),
+            'mark_price': float(exchange_pos.get('markPrice') or 0),
+        }
+        with self.sync_lock:
+            try:
+                if contracts > 0 and symbol not in self.positions:
+                    self._register_existing_position(symbol, exchange_pos)
+                    result = 'registered'
+                elif contracts <= 0 and symbol in self.positions:
+                    self._cleanup_orphaned_position(symbol)
+                    result = 'cleaned'
+                elif contracts > 0 and self._update_position_from_exchange(symbol, exchange_pos):
+                    result = 'updated'
+                else:
+                    return None
+                self.save_data()
+                self.logger.info(f"⚡ 스트림 Position 반영: {symbol} {result}")
+                return result
+            except Exception as e:
+                self.logger.error(f"스트림 Position 반영 Failed {symbol}: {e}")
+                return None
+
     def _fetch_exchange_positions_safe(self):
         """안전한 Trade소 Position 조times"""
         def safe_float(value, default=0.0):
@@ -599,7 +749,7 @@ class ImprovedDCAPositionManager:
                     self.logger.debug("🚨 Rate limit status - Position 조times 너뛰기")
                     return default
                 
-                positions = self.exchange.fetch_positions()
+                positions = self._fetch_positions()
                 
                 # Position이 없으면 빈 리스트 반환
                 if not positions:
@@ -657,7 +807,7 @@ class ImprovedDCAPositionManager:
                 quantity=quantity,
                 notional=abs(notional),
                 leverage=self.config['initial_leverage'],
-                timestamp=get_korea_time().isoformat(),
+                timestamp=time.time(),
                 is_active=True
             )
             
@@ -671,12 +821,12 @@ class ImprovedDCAPositionManager:
                 total_quantity=quantity,
                 total_notional=abs(notional),
                 is_active=True,
-                created_at=get_korea_time().isoformat(),
-                last_update=get_korea_time().isoformat(),
+                created_at=time.time(),
+                last_update=time.time(),
                 cyclic_count=0,
                 max_cyclic_count=3,
                 cyclic_state=CyclicState.NORMAL_DCA.value,
-                last_cyclic_entry="",
+                last_cyclic_entry=0.0,
                 total_cyclic_profit=0.0
             )
             
@@ -756,7 +906,7 @@ class ImprovedDCAPositionManager:
                 
                 position.total_quantity = current_quantity
                 position.total_notional = current_notional
-                position.last_update = get_korea_time().isoformat()
+                position.last_update = time.time()
                 
                 self.logger.info(f"Position Quantity Sync: {symbol} - {old_quantity} → {current_quantity}")
                 return True
@@ -784,7 +934,7 @@ class ImprovedDCAPositionManager:
                     quantity=quantity,
                     notional=notional,
                     leverage=leverage,
-                    timestamp=get_korea_time().isoformat(),
+                    timestamp=time.time(),
                     is_active=True,
                     is_filled=True  # 시장가 주문은 즉시 체결
                 )
@@ -799,14 +949,14 @@ class ImprovedDCAPositionManager:
                     total_quantity=quantity,
                     total_notional=notional,
                     is_active=True,
-                    created_at=get_korea_time().isoformat(),
-                    last_update=get_korea_time().isoformat(),
+                    created_at=time.time(),
+                    last_update=time.time(),
                     strategy=strategy or "A",  # 전략 정보 저장
                     signal_metadata=signal_data,  # 원본 신호 데이터 저장
                     cyclic_count=0,
                     max_cyclic_count=3,
                     cyclic_state=CyclicState.NORMAL_DCA.value,
-                    last_cyclic_entry="",
+                    last_cyclic_entry=0.0,
                     total_cyclic_profit=0.0
                 )
 
@@ -1000,13 +1150,14 @@ class ImprovedDCAPositionManager:
                             quantity=dca_quantity,
                             notional=dca_amount * dca_leverage,
                             leverage=dca_leverage,
-                            timestamp=get_korea_time().isoformat(),
+                            timestamp=time.time(),
                             is_active=True,
                             order_type="limit",
                             order_id=order_result['order_id'],
                             is_filled=False
                         )
                         position.entries.append(new_dca_entry)
+                        self._index_pending_entry(symbol, new_dca_entry)
                         orders_placed += 1
                         
                         order_results.append({
@@ -1120,9 +1271,8 @@ class ImprovedDCAPositionManager:
                     continue
                 
                 try:
-                    # Current price 조times
-                    ticker = self.exchange.fetch_ticker(symbol)
-                    current_price = float(ticker['last'])
+                    # Current price 조times (공용 스냅샷)
+                    current_price = self._fetch_current_price(symbol)
                     
                     # 트리거 Confirm
                     trigger_result = self._check_position_triggers(symbol, current_price, total_balance)
@@ -1407,7 +1557,7 @@ class ImprovedDCAPositionManager:
             # 최고점 갱신 및 추적
             if current_price > position.pyramid_highest_price:
                 position.pyramid_highest_price = current_price
-                position.pyramid_last_peak_time = get_korea_time().isoformat()
+                position.pyramid_last_peak_time = time.time()
 
             # 최대 불타기 횟수 체크 (3회)
             max_count = self.config.get('max_pyramid_count', 3)
@@ -1564,15 +1714,8 @@ class ImprovedDCAPositionManager:
             
             # 4. 시간 간격 체크 (너무 빠른 연속 불타기 방지)
             time_ok = True
-            if hasattr(position, 'last_pyramid_time') and position.last_pyramid_time:
-                from datetime import datetime
-                try:
-                    last_time = datetime.fromisoformat(position.last_pyramid_time.replace('Z', '+00:00'))
-                    current_time = get_korea_time()
-                    time_diff = (current_time.replace(tzinfo=None) - last_time.replace(tzinfo=None)).total_seconds()
-                    time_ok = time_diff > 300  # 5분 간격 유지
-                except:
-                    time_ok = True
+            if position.last_pyramid_time:
+                time_ok = time.time() - position.last_pyramid_time > 300  # 5분 간격 유지
             
             # 단계별 추가 조건
             stage_condition = True
@@ -1693,14 +1836,37 @@ class ImprovedDCAPositionManager:
         except Exception as e:
             self.logger.error(f"수익 보호 단계 업데이트 실패: {e}")
 
+    def _position_snapshot(self):
+        """전략의 공용 포지션 / mark price 스냅샷 (없으면 None → 거래소 직접 조회)"""
+        return getattr(self.strategy, 'position_snapshot', None)
+
+    def _fetch_positions(self, symbols: Optional[List[str]] = None, max_age: Optional[float] = None) -> List[dict]:
+        """포지션 조회 (공용 스냅샷 우선 - 포지션 수와 무관하게 fetch_positions 1회)"""
+        snapshot = self._position_snapshot()
+        if snapshot is not None:
+            return snapshot.fetch_positions(symbols, max_age=max_age)
+        return self.exchange.fetch_positions(symbols) if symbols else self.exchange.fetch_positions()
+
+    def _fetch_current_price(self, symbol: str) -> float:
+        """현재가 (공용 스냅샷 mark price 우선, 없으면 fetch_ticker last) - 실패 시 예외"""
+        snapshot = self._position_snapshot()
+        if snapshot is not None:
+            price = snapshot.get_mark_price(symbol)
+            if price:
+                return price
+        return float(self.exchange.fetch_ticker(symbol)['last'])
+
     def _get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
         """실시간 현재가 조회"""
         try:
             if not self.exchange:
                 return {}
             
-            current_prices = {}
+            snapshot = self._position_snapshot()
+            current_prices = snapshot.get_mark_prices(symbols) if snapshot is not None else {}
             for symbol in symbols:
+                if symbol in current_prices:
+                    continue
                 try:
                     ticker = self.exchange.fetch_ticker(symbol)
                     current_prices[symbol] = float(ticker['last'])
@@ -1936,18 +2102,18 @@ class ImprovedDCAPositionManager:
                 position.total_notional = new_notional
                 position.pyramid_count += 1
                 position.pyramid_stage = stage
-                position.last_update = get_korea_time().isoformat()
-                position.last_pyramid_time = get_korea_time().isoformat()  # 불타기 시간 기록
+                position.last_update = time.time()
+                position.last_pyramid_time = time.time()  # 불타기 시간 기록
 
                 if stage == 'pyramid_1':
                     position.pyramid_1_executed = True
-                    position.pyramid_1_entry_time = get_korea_time().isoformat()
+                    position.pyramid_1_entry_time = time.time()
                 elif stage == 'pyramid_2':
                     position.pyramid_2_executed = True
-                    position.pyramid_2_entry_time = get_korea_time().isoformat()
+                    position.pyramid_2_entry_time = time.time()
                 elif stage == 'pyramid_3':
                     position.pyramid_3_executed = True
-                    position.pyramid_3_entry_time = get_korea_time().isoformat()
+                    position.pyramid_3_entry_time = time.time()
 
                 # Entry 기록 추가
                 entry = DCAEntry(
@@ -1955,7 +2121,7 @@ class ImprovedDCAPositionManager:
                     price=filled_price,
                     quantity=filled_qty,
                     notional=filled_price * filled_qty,
-                    timestamp=get_korea_time().isoformat()
+                    timestamp=time.time()
                 )
                 position.entries.append(entry)
 
@@ -2335,7 +2501,7 @@ class ImprovedDCAPositionManager:
                 quantity=quantity,
                 notional=dca_amount * leverage,
                 leverage=leverage,
-                timestamp=get_korea_time().isoformat(),
+                timestamp=time.time(),
                 is_active=True,
                 order_type="limit",
                 order_id=order_result['order_id'],
@@ -2343,10 +2509,11 @@ class ImprovedDCAPositionManager:
             )
             
             position.entries.append(dca_entry)
+            self._index_pending_entry(position.symbol, dca_entry)
             
             # Position Status Update (아직 체결되지 않았으므로 Average price는 Change하지 않음)
             position.current_stage = PositionStage.FIRST_DCA.value
-            position.last_update = get_korea_time().isoformat()
+            position.last_update = time.time()
             
             # 데이터 Save
             self.save_data()
@@ -2394,7 +2561,7 @@ class ImprovedDCAPositionManager:
                 quantity=quantity,
                 notional=dca_amount * leverage,
                 leverage=leverage,
-                timestamp=get_korea_time().isoformat(),
+                timestamp=time.time(),
                 is_active=True,
                 order_type="limit",
                 order_id=order_result['order_id'],
@@ -2402,15 +2569,16 @@ class ImprovedDCAPositionManager:
             )
             
             position.entries.append(dca_entry)
+            self._index_pending_entry(position.symbol, dca_entry)
             
             # Position Status Update (아직 체결되지 않았으므로 Average price는 Change하지 않음)
             position.current_stage = PositionStage.SECOND_DCA.value
-            position.last_update = get_korea_time().isoformat()
+            position.last_update = time.time()
             
             # 🔄 Cyclic trading 카운트 증가 로직 (2차 DCA 주문 Register 시 Cyclic trading 1times 카운팅)
             position.cyclic_count += 1
             position.cyclic_state = CyclicState.CYCLIC_ACTIVE.value
-            position.last_cyclic_entry = get_korea_time().isoformat()
+            position.last_cyclic_entry = time.time()
             
             # Cyclic trading 제한 체크
             if position.cyclic_count >= position.max_cyclic_count:
@@ -2449,8 +2617,8 @@ class ImprovedDCAPositionManager:
             
             # 2. 🚨 버그 Modify: 실제 Trade소 Position 기준으로 Exit량 계산
             try:
-                # Trade소에서 Actual position Quantity 조times
-                actual_positions = self.exchange.fetch_positions([position.symbol])
+                # Trade소에서 Actual position Quantity 조times (Exit 직전이므로 1초 이내 스냅샷)
+                actual_positions = self._fetch_positions([position.symbol], max_age=1.0)
                 actual_quantity = 0
                 
                 for pos in actual_positions:
@@ -2488,7 +2656,7 @@ class ImprovedDCAPositionManager:
                 # Position 정리
                 position.is_active = False
                 position.current_stage = PositionStage.CLOSING.value
-                position.last_update = get_korea_time().isoformat()
+                position.last_update = time.time()
                 
                 # 모든 Entry 비Active화
                 for entry in position.entries:
@@ -2555,11 +2723,9 @@ class ImprovedDCAPositionManager:
     def _calculate_position_duration_hours(self, position: DCAPosition) -> float:
         """포지션 보유 시간 계산 (시간 단위)"""
         try:
-            from datetime import datetime
-            created_time = datetime.fromisoformat(position.created_at.replace('Z', '+00:00'))
-            current_time = get_korea_time()
-            duration = current_time - created_time
-            return round(duration.total_seconds() / 3600, 2)  # 시간 단위로 변환
+            if not position.created_at:
+                return 0.0
+            return round((time.time() - position.created_at) / 3600, 2)  # 시간 단위로 변환
         except:
             return 0.0
 
@@ -2689,7 +2855,7 @@ class ImprovedDCAPositionManager:
                         # Legacy basic_exit_system Remove됨 - New 4가지 Exit 방식 Usage
                         self.logger.info(f"🔄 New Exit System Status Initialize: {position.symbol}")
                     
-                    position.last_update = get_korea_time().isoformat()
+                    position.last_update = time.time()
                 
                 # 데이터 Save
                 self.save_data()
@@ -2750,8 +2916,8 @@ class ImprovedDCAPositionManager:
             
             # 🚨 버그 Modify: Actual holding 중인 해당 Stage Quantity만 Exit
             try:
-                # 실제 Trade소 Position 조times
-                actual_positions = self.exchange.fetch_positions([position.symbol])
+                # 실제 Trade소 Position 조times (Exit 직전이므로 1초 이내 스냅샷)
+                actual_positions = self._fetch_positions([position.symbol], max_age=1.0)
                 actual_total_quantity = 0
                 
                 for pos in actual_positions:
@@ -2833,7 +2999,7 @@ class ImprovedDCAPositionManager:
                         position.is_active = False
                         position.current_stage = PositionStage.CLOSING.value
                     
-                    position.last_update = get_korea_time().isoformat()
+                    position.last_update = time.time()
                 
                 # 데이터 Save
                 self.save_data()
@@ -3253,7 +3419,7 @@ class ImprovedDCAPositionManager:
             profit_threshold = self.config.get('pyramid_profit_threshold_for_breakeven', 0.02)  # 2%
             
             # 한 번이라도 임계값 이상 달성했는지 추적
-            if not hasattr(position, 'breakeven_protection_triggered'):
+            if not position.breakeven_protection_triggered:
                 if profit_pct >= profit_threshold:
                     position.breakeven_protection_triggered = True
                     position.breakeven_highest_profit = profit_pct
@@ -3263,15 +3429,14 @@ class ImprovedDCAPositionManager:
                     return None
             
             # 보호 시스템이 활성화된 경우, 최고 수익 추적
-            if hasattr(position, 'breakeven_highest_profit'):
-                if profit_pct > position.breakeven_highest_profit:
-                    position.breakeven_highest_profit = profit_pct
+            if profit_pct > position.breakeven_highest_profit:
+                position.breakeven_highest_profit = profit_pct
             
             # 본절(0%) 이하로 하락하면 보호 청산
             if profit_pct <= 0.0:
                 self.logger.critical(f"🚨 본절 보호 트리거: {position.symbol}")
                 self.logger.critical(f"   불타기 단계: {pyramid_stage}")
-                self.logger.critical(f"   최고 수익: {getattr(position, 'breakeven_highest_profit', 0)*100:.2f}%")
+                self.logger.critical(f"   최고 수익: {position.breakeven_highest_profit*100:.2f}%")
                 self.logger.critical(f"   현재 수익: {profit_pct*100:.2f}% → 본절 보호 청산")
                 
                 # 즉시 전량 청산
@@ -3283,7 +3448,7 @@ class ImprovedDCAPositionManager:
                     'trigger_info': {
                         'type': '본절 보호 청산',
                         'pyramid_stage': pyramid_stage,
-                        'highest_profit_pct': getattr(position, 'breakeven_highest_profit', 0) * 100,
+                        'highest_profit_pct': position.breakeven_highest_profit * 100,
                         'current_profit_pct': profit_pct * 100,
                         'current_price': current_price,
                         'average_price': position.average_price
@@ -3449,24 +3614,184 @@ class ImprovedDCAPositionManager:
             self.logger.error(f"미체결 주문 조times Failed {symbol}: {e}")
             return []
 
+    # ===== 지정가 주문 체결 (ORDER_TRADE_UPDATE 이벤트 + 주기적 안전망) =====
+
+    def _index_pending_entry(self, symbol: str, entry: DCAEntry):
+        """미체결 지정가 Entry를 주문 ID 색인에 Register (체결 이벤트 → Entry O(1) 조times)"""
+        if entry.order_type == "limit" and entry.order_id and entry.is_active and not entry.is_filled:
+            self._pending_orders[str(entry.order_id)] = (symbol, entry)
+
+    def _rebuild_pending_index(self):
+        """Position 전체에서 주문 ID 색인 재구성 (Load 직후 / 안전망 점검 시, 메모리 작업만)"""
+        pending = {}
+        for symbol, position in list(self.positions.items()):
+            if not position.is_active:
+                continue
+            for entry in position.entries:
+                if entry.order_type == "limit" and entry.order_id and entry.is_active and not entry.is_filled:
+                    pending[str(entry.order_id)] = (symbol, entry)
+        self._pending_orders = pending
+
+    def _lookup_pending_entry(self, order_id) -> Optional[Tuple[str, DCAEntry]]:
+        """주문 ID → (symbol, 미체결 Entry), 이미 체결 / Cancel / 정리된 Entry면 색인에서 Remove 후 None"""
+        found = self._pending_orders.get(str(order_id))
+        if not found:
+            return None
+        symbol, entry = found
+        position = self.positions.get(symbol)
+        if position is None or not position.is_active or not entry.is_active or entry.is_filled:
+            self._pending_orders.pop(str(order_id), None)
+            return None
+        return found
+
+    def _order_stream_live(self) -> bool:
+        """전략의 User Data Stream이 살아있으면 체결은 이벤트로 반영됨"""
+        user_stream_sync = getattr(self.strategy, 'user_stream_sync', None)
+        return bool(user_stream_sync is not None and user_stream_sync.is_live())
+
+    def _apply_limit_fill(self, symbol: str, entry: DCAEntry, filled: float, average: Optional[float]):
+        """지정가 Entry 체결 반영 + 체결 Notification (중복 방지)"""
+        entry.is_filled = True
+        entry.quantity = filled  # 실제 체결 Quantity으로 Update
+        entry.entry_price = average if average else entry.entry_price
+        self._pending_orders.pop(str(entry.order_id), None)
+
+        self.logger.info(f"✅ DCA limit order 체결: {symbol} {entry.stage} - 체결가: ${entry.entry_price:.4f}, Quantity: {entry.quantity:.4f}")
+
+        # 중복 방지: 체결 Notification (Symbol_Stage_주문ID 조합으로 중복 체크)
+        notification_key = f"{symbol}_{entry.stage}_{entry.order_id}"
+        if self.telegram_bot and notification_key not in self._sent_fill_notifications:
+            message = (f"✅ DCA 지정가 체결\n"
+                      f"Symbol: {symbol}\n"
+                      f"Stage: {entry.stage}\n"
+                      f"체결가: ${entry.entry_price:.4f}\n"
+                      f"Quantity: {entry.quantity:.4f}")
+            self.telegram_bot.send_message(message)
+            self._sent_fill_notifications.add(notification_key)
+            self._save_sent_notifications()  # Notification 기록 즉시 Save
+            self.logger.info(f"📨 DCA 체결 Notification 발송 Complete: {notification_key}")
+        else:
+            self.logger.info(f"📨 DCA 체결 Notification 너뛰기 (중복): {notification_key}")
+
+    def _apply_limit_cancel(self, symbol: str, entry: DCAEntry):
+        """지정가 Entry Cancel / 만료 반영"""
+        entry.is_active = False
+        self._pending_orders.pop(str(entry.order_id), None)
+        self.logger.warning(f"❌ DCA limit order Cancel됨: {symbol} {entry.stage}")
+
+    def _recalculate_from_filled_entries(self, symbol: str, position: DCAPosition) -> bool:
+        """체결된 Entry만으로 Average price / Quantity / Stage 재계산 (호출측이 sync_lock 보유)"""
+        filled_entries = [e for e in position.entries if e.is_active and e.is_filled]
+        if not filled_entries:
+            return False
+
+        # Legacy Average price Backup (로깅용)
+        old_avg_price = position.average_price
+        old_quantity = position.total_quantity
+
+        # Average price 재계산 (가중평균)
+        total_cost = sum(e.quantity * e.entry_price for e in filled_entries)
+        total_quantity = sum(e.quantity for e in filled_entries)
+        new_avg_price = total_cost / total_quantity if total_quantity > 0 else position.average_price
+
+        # Change사항 Verification
+        price_change_pct = abs(new_avg_price - old_avg_price) / old_avg_price * 100 if old_avg_price > 0 else 0
+        quantity_change_pct = abs(total_quantity - old_quantity) / old_quantity * 100 if old_quantity > 0 else 0
+
+        # Average price update
+        position.average_price = new_avg_price
+        position.total_quantity = total_quantity
+        position.total_notional = sum(e.notional for e in filled_entries)
+        position.last_update = time.time()
+
+        # 📋 Position Stage Update (가장 높은 Stage로 Settings)
+        old_stage = position.current_stage
+        if any(e.stage == "second_dca" and e.is_filled for e in position.entries):
+            position.current_stage = PositionStage.SECOND_DCA.value
+        elif any(e.stage == "first_dca" and e.is_filled for e in position.entries):
+            position.current_stage = PositionStage.FIRST_DCA.value
+        else:
+            position.current_stage = PositionStage.INITIAL.value
+
+        # 상세 로깅 (Change사항 추적)
+        self.logger.info(f"🔄 Average price 재계산: {symbol}")
+        self.logger.info(f"   이전 Average price: ${old_avg_price:.6f} → 새 Average price: ${new_avg_price:.6f} ({price_change_pct:+.2f}%)")
+        self.logger.info(f"   이전 Quantity: {old_quantity:.6f} → 새 Quantity: {total_quantity:.6f} ({quantity_change_pct:+.2f}%)")
+        self.logger.info(f"   Position Stage: {old_stage} → {position.current_stage}")
+        self.logger.info(f"   체결된 Entry: {len(filled_entries)}count")
+
+        # 체결된 Entry 상세 Info
+        for i, entry in enumerate(filled_entries):
+            self.logger.debug(f"     Entry{i+1}: {entry.stage} - ${entry.entry_price:.6f} x {entry.quantity:.6f}")
+
+        # 큰 change 감지시 Warning
+        if price_change_pct > 5.0:
+            self.logger.warning(f"⚠️ Average price 큰 change Detected: {symbol} - {price_change_pct:.2f}% change")
+        if quantity_change_pct > 10.0:
+            self.logger.warning(f"⚠️ Quantity 큰 change Detected: {symbol} - {quantity_change_pct:.2f}% change")
+        return True
+
+    def on_order_update(self, order: Dict[str, Any]) -> Optional[str]:
+        """
+        ORDER_TRADE_UPDATE 이벤트 반영 (User Data Stream Callback, WebSocket 스레드)
+
+        주문 ID 색인으로 미체결 DCA Entry를 바로 찾습니다 (DCA 주문이 아니면 즉시 반환).
+        부분 체결은 FILLED까지 기다립니다 (Position Quantity은 ACCOUNT_UPDATE로 이미 반영).
+
+        Args:
+            order: BinanceUserDataStream 주문 행 (orderId, status, filled_quantity, avg_price ...)
+        Returns:
+            'filled' / 'canceled' / None (DCA 주문 아님 / 미완료)
+        """
+        status = order.get('status')
+        if status not in ('FILLED', 'CANCELED', 'EXPIRED', 'REJECTED'):
+            return None
+        with self.sync_lock:
+            found = self._lookup_pending_entry(order.get('orderId'))
+            if not found:
+                return None
+            symbol, entry = found
+            try:
+                if status == 'FILLED':
+                    self._apply_limit_fill(symbol, entry, float(order.get('filled_quantity') or entry.quantity),
+                                           order.get('avg_price'))
+                    self._recalculate_from_filled_entries(symbol, self.positions[symbol])
+                    result = 'filled'
+                else:
+                    self._apply_limit_cancel(symbol, entry)
+                    result = 'canceled'
+                self.order_event_stats[result] += 1
+            except Exception as e:
+                self.logger.error(f"❌ DCA 주문 이벤트 반영 Failed {symbol}: {e}")
+                return None
+        self.save_data()
+        return result
+
     def check_and_update_limit_orders(self) -> Dict[str, Any]:
-        """미체결 지정가 주문 Status Confirm 및 Update"""
+        """
+        미체결 지정가 주문 Status Confirm 및 Update (안전망)
+
+        User Data Stream이 살아있으면 체결 / Cancel은 on_order_update로 이미 반영되므로
+        open_orders_check_interval마다만 점검합니다. 점검은 Symbol별 fetch_open_orders (미체결만)로 하고,
+        목록에서 빠진 주문만 fetch_order로 최종 Status를 Confirm합니다.
+        """
         try:
             if not self.exchange:
                 return {'success': False, 'error': 'Exchange not available'}
-            
+
+            now = time.time()
+            if self._order_stream_live() and now - self._last_open_orders_check < self.open_orders_check_interval:
+                return {'success': True, 'updated_positions': [], 'updated_count': 0}
+            self._last_open_orders_check = now
+
             updated_positions = []
-            
-            for symbol, position in list(self.positions.items()):
-                if not position.is_active:
-                    continue
-                
-                # 미체결 지정가 주문이 있는 Entry 찾기
-                pending_entries = [e for e in position.entries if e.is_active and not e.is_filled and e.order_type == "limit" and e.order_id]
-                
-                if not pending_entries:
-                    continue
-                
+            with self.sync_lock:
+                self._rebuild_pending_index()
+                pending_by_symbol = {}
+                for order_id, (symbol, entry) in self._pending_orders.items():
+                    pending_by_symbol.setdefault(symbol, []).append(entry)
+
+            for symbol, pending_entries in pending_by_symbol.items():
                 try:
                     # Rate Limit Status 체크
                     if (hasattr(self.strategy, '_api_rate_limited') and 
@@ -3474,10 +3799,11 @@ class ImprovedDCAPositionManager:
                         self.logger.debug(f"🚨 Rate limit status - 주문 Status Confirm 너뛰기 ({symbol})")
                         continue
                         
-                    # 해당 Symbol의 모든 주문 Status Confirm (Rate Limit 대응 강화)
+                    # 해당 Symbol의 미체결 주문만 조times (Rate Limit 대응 강화)
                     try:
-                        orders = self.exchange.fetch_orders(symbol)
-                        order_status_map = {order['id']: order for order in orders}
+                        open_order_ids = {str(order['id']) for order in self.exchange.fetch_open_orders(symbol)}
+                        closed_orders = {str(entry.order_id): self.exchange.fetch_order(entry.order_id, symbol)
+                                         for entry in pending_entries if str(entry.order_id) not in open_order_ids}
                     except ccxt.RateLimitExceeded as e:
                         self.logger.warning(f"🚨 Rate Limit Exceeded - 주문 Status Confirm 너뛰기: {symbol} - {e}")
                         continue
@@ -3491,106 +3817,30 @@ class ImprovedDCAPositionManager:
                             continue
                         else:
                             raise e
-                    
-                    position_updated = False
-                    
-                    for entry in pending_entries:
-                        if entry.order_id in order_status_map:
-                            order = order_status_map[entry.order_id]
-                            
+
+                    if not closed_orders:
+                        continue
+
+                    with self.sync_lock:  # 스레드 안전성 보장
+                        position_updated = False
+                        for entry in pending_entries:
+                            order = closed_orders.get(str(entry.order_id))
+                            # 조times 중 이벤트로 이미 반영됐으면 건너뜀
+                            if not order or entry.is_filled or not entry.is_active:
+                                continue
                             # 주문이 체결되었는지 Confirm
                             if order['status'] == 'closed' and order['filled'] > 0:
-                                # 체결 Complete
-                                entry.is_filled = True
-                                entry.quantity = order['filled']  # 실제 체결 Quantity으로 Update
-                                entry.entry_price = order['average'] if order['average'] else entry.entry_price
-                                
-                                self.logger.info(f"✅ DCA limit order 체결: {symbol} {entry.stage} - 체결가: ${entry.entry_price:.4f}, Quantity: {entry.quantity:.4f}")
-                                
-                                # 📝 DCA 시스템은 간소화되어 불타기만 사용하므로 DCA 체결 로깅은 제거됨 (Legacy 코드)
-                                
-                                # 중복 방지: 체결 Notification (Symbol_Stage_주문ID 조합으로 중복 체크)
-                                notification_key = f"{symbol}_{entry.stage}_{entry.order_id}"
-                                
-                                # 🔍 디버깅: 체결 Notification 발송 조건 상세 Log
-                                self.logger.info(f"🔍 체결 Detected: {symbol} {entry.stage}")
-                                self.logger.info(f"🔍 주문 Status: {order['status']}, 체결량: {order['filled']}")
-                                self.logger.info(f"🔍 NotificationKey: {notification_key}")
-                                self.logger.info(f"🔍 이미 발송됨: {notification_key in self._sent_fill_notifications}")
-                                self.logger.info(f"🔍 전체 발송 기록: {len(self._sent_fill_notifications)}count")
-                                
-                                if self.telegram_bot and notification_key not in self._sent_fill_notifications:
-                                    message = (f"✅ DCA 지정가 체결\n"
-                                              f"Symbol: {symbol}\n"
-                                              f"Stage: {entry.stage}\n"
-                                              f"체결가: ${entry.entry_price:.4f}\n"
-                                              f"Quantity: {entry.quantity:.4f}")
-                                    self.telegram_bot.send_message(message)
-                                    self._sent_fill_notifications.add(notification_key)
-                                    self._save_sent_notifications()  # Notification 기록 즉시 Save
-                                    self.logger.info(f"📨 DCA 체결 Notification 발송 Complete: {notification_key}")
-                                else:
-                                    self.logger.info(f"📨 DCA 체결 Notification 너뛰기 (중복): {notification_key}")
-                                
+                                self._apply_limit_fill(symbol, entry, order['filled'], order['average'])
                                 position_updated = True
-                            
-                            elif order['status'] == 'canceled':
-                                # 주문이 Cancel됨
-                                entry.is_active = False
-                                self.logger.warning(f"❌ DCA limit order Cancel됨: {symbol} {entry.stage}")
+                            elif order['status'] in ('canceled', 'expired', 'rejected'):
+                                self._apply_limit_cancel(symbol, entry)
                                 position_updated = True
-                    
-                    # Position Info 재계산 (체결된 Entry만으로) - 스레드 안전성 강화
-                    if position_updated:
-                        with self.sync_lock:  # 스레드 안전성 보장
-                            filled_entries = [e for e in position.entries if e.is_active and e.is_filled]
-                            if filled_entries:
-                                # Legacy Average price Backup (로깅용)
-                                old_avg_price = position.average_price
-                                old_quantity = position.total_quantity
-                                
-                                # Average price 재계산 (가중평균)
-                                total_cost = sum(e.quantity * e.entry_price for e in filled_entries)
-                                total_quantity = sum(e.quantity for e in filled_entries)
-                                new_avg_price = total_cost / total_quantity if total_quantity > 0 else position.average_price
-                                
-                                # Change사항 Verification
-                                price_change_pct = abs(new_avg_price - old_avg_price) / old_avg_price * 100 if old_avg_price > 0 else 0
-                                quantity_change_pct = abs(total_quantity - old_quantity) / old_quantity * 100 if old_quantity > 0 else 0
-                                
-                                # Average price update
-                                position.average_price = new_avg_price
-                                position.total_quantity = total_quantity
-                                position.total_notional = sum(e.notional for e in filled_entries)
-                                position.last_update = get_korea_time().isoformat()
-
-                                # 📋 Position Stage Update (가장 높은 Stage로 Settings)
-                                old_stage = position.current_stage
-                                if any(e.stage == "second_dca" and e.is_filled for e in position.entries):
-                                    position.current_stage = PositionStage.SECOND_DCA.value
-                                elif any(e.stage == "first_dca" and e.is_filled for e in position.entries):
-                                    position.current_stage = PositionStage.FIRST_DCA.value
-                                else:
-                                    position.current_stage = PositionStage.INITIAL.value
-
-                                updated_positions.append(symbol)
-
-                                # 상세 로깅 (Change사항 추적)
-                                self.logger.info(f"🔄 Average price 재계산: {symbol}")
-                                self.logger.info(f"   이전 Average price: ${old_avg_price:.6f} → 새 Average price: ${new_avg_price:.6f} ({price_change_pct:+.2f}%)")
-                                self.logger.info(f"   이전 Quantity: {old_quantity:.6f} → 새 Quantity: {total_quantity:.6f} ({quantity_change_pct:+.2f}%)")
-                                self.logger.info(f"   Position Stage: {old_stage} → {position.current_stage}")
-                                self.logger.info(f"   체결된 Entry: {len(filled_entries)}count")
-                                
-                                # 체결된 Entry 상세 Info
-                                for i, entry in enumerate(filled_entries):
-                                    self.logger.debug(f"     Entry{i+1}: {entry.stage} - ${entry.entry_price:.6f} x {entry.quantity:.6f}")
-                                
-                                # 큰 change 감지시 Warning
-                                if price_change_pct > 5.0:
-                                    self.logger.warning(f"⚠️ Average price 큰 change Detected: {symbol} - {price_change_pct:.2f}% change")
-                                if quantity_change_pct > 10.0:
-                                    self.logger.warning(f"⚠️ Quantity 큰 change Detected: {symbol} - {quantity_change_pct:.2f}% change")
+                        self.order_event_stats['safety_net'] += int(position_updated)
+
+                        # Position Info 재계산 (체결된 Entry만으로)
+                        position = self.positions.get(symbol)
+                        if position_updated and position and self._recalculate_from_filled_entries(symbol, position):
+                            updated_positions.append(symbol)
                 
                 except Exception as e:
                     # Rate Limit 에러 특별 Process
@@ -3638,8 +3888,7 @@ class ImprovedDCAPositionManager:
             for position in active_positions:
                 try:
                     if self.exchange:
-                        ticker = self.exchange.fetch_ticker(position.symbol)
-                        current_price = float(ticker['last'])
+                        current_price = self._fetch_current_price(position.symbol)
                     else:
                         current_price = position.average_price
                     
@@ -3798,7 +4047,7 @@ class ImprovedDCAPositionManager:
                 # 즉시 Position 비Active화
                 position.is_active = False
                 position.current_stage = PositionStage.CLOSING.value
-                position.last_update = get_korea_time().isoformat()
+                position.last_update = time.time()
                 
                 # 모든 Entry 비Active화
                 for entry in position.entries:
@@ -3856,8 +4105,7 @@ class ImprovedDCAPositionManager:
                     current_price = position.average_price  # 폴백
                     self.logger.debug(f"🚨 Rate Limit Status - 평균가로 가격 대체: {symbol}")
                 else:
-                    ticker = self.exchange.fetch_ticker(symbol)
-                    current_price = ticker['last']
+                    current_price = self._fetch_current_price(symbol)
             except Exception as e:
                 # Rate Limit 감지 및 Process
                 error_str = str(e).lower()
@@ -4030,8 +4278,17 @@ class ImprovedDCAPositionManager:
     # New 4가지 Exit 방식 구현
     # ========================================================================================
     
-    def calculate_supertrend(self, df: pd.DataFrame, period: int = 10, multiplier: float = 3.0) -> Tuple[pd.Series, pd.Series]:
-        """SuperTrend(10-3) 계산"""
+    def calculate_supertrend(self, df: pd.DataFrame, period: int = 10, multiplier: float = 3.0,
+                             symbol: Optional[str] = None, timeframe: Optional[str] = None) -> Tuple[pd.Series, pd.Series]:
+        """SuperTrend(10-3) 계산 (symbol/timeframe 지정 시 공용 지표 Cache Usage)"""
+        if symbol is None or timeframe is None:
+            return self._compute_supertrend(df, period, multiplier)
+        return get_indicator_cache().get_or_compute(
+            symbol, timeframe, ('trailing_supertrend', period, multiplier), df,
+            lambda: self._compute_supertrend(df, period, multiplier))
+
+    def _compute_supertrend(self, df: pd.DataFrame, period: int = 10, multiplier: float = 3.0) -> Tuple[pd.Series, pd.Series]:
+        """SuperTrend(10-3) 계산 (Cache 미적용)"""
         try:
             if len(df) < period + 1:
                 # 데이터가 부족한 경우 기본값 반환
@@ -4040,53 +4297,8 @@ class ImprovedDCAPositionManager:
                 trend = pd.Series([1] * len(df), index=df.index)
                 return supertrend, trend
             
-            # ATR 계산
-            high_low = df['high'] - df['low']
-            high_close = np.abs(df['high'] - df['close'].shift())
-            low_close = np.abs(df['low'] - df['close'].shift())
-            true_range = np.maximum(high_low, np.maximum(high_close, low_close))
-            atr = true_range.rolling(window=period).mean()
-            
-            # 기본 상한선과 하한선
-            hl2 = (df['high'] + df['low']) / 2
-            upper_band = hl2 + (multiplier * atr)
-            lower_band = hl2 - (multiplier * atr)
-            
-            # SuperTrend 계산
-            supertrend = pd.Series(index=df.index, dtype=float)
-            trend = pd.Series(index=df.index, dtype=int)
-            
-            # 초기값 Settings
-            supertrend.iloc[0] = lower_band.iloc[0]
-            trend.iloc[0] = 1
-            
-            for i in range(1, len(df)):
-                # Current 상한선/하한선 조정
-                if lower_band.iloc[i] > lower_band.iloc[i-1] or df['close'].iloc[i-1] < lower_band.iloc[i-1]:
-                    lower_band.iloc[i] = lower_band.iloc[i]
-                else:
-                    lower_band.iloc[i] = lower_band.iloc[i-1]
-                
-                if upper_band.iloc[i] < upper_band.iloc[i-1] or df['close'].iloc[i-1] > upper_band.iloc[i-1]:
-                    upper_band.iloc[i] = upper_band.iloc[i]
-                else:
-                    upper_band.iloc[i] = upper_band.iloc[i-1]
-                
-                # 트렌드 결정
-                if trend.iloc[i-1] == 1:  # 상승 트렌드
-                    if df['close'].iloc[i] <= lower_band.iloc[i]:
-                        trend.iloc[i] = -1
-                        supertrend.iloc[i] = upper_band.iloc[i]
-                    else:
-                        trend.iloc[i] = 1
-                        supertrend.iloc[i] = lower_band.iloc[i]
-                else:  # 하락 트렌드
-                    if df['close'].iloc[i] >= upper_band.iloc[i]:
-                        trend.iloc[i] = 1
-                        supertrend.iloc[i] = lower_band.iloc[i]
-                    else:
-                        trend.iloc[i] = -1
-                        supertrend.iloc[i] = upper_band.iloc[i]
+            # 추적형 SuperTrend (공용 커널)
+            supertrend, trend = trailing_supertrend(df, period, multiplier)
             
             return supertrend, trend
             
@@ -4098,8 +4310,18 @@ class ImprovedDCAPositionManager:
             trend = pd.Series([1] * len(df), index=df.index)
             return supertrend, trend
     
-    def calculate_bollinger_bands(self, df: pd.DataFrame, period: int = 600, std: float = 2.0) -> Tuple[pd.Series, pd.Series, pd.Series]:
-        """볼린저 밴드 계산"""
+    def calculate_bollinger_bands(self, df: pd.DataFrame, period: int = 600, std: float = 2.0,
+                                  symbol: Optional[str] = None,
+                                  timeframe: Optional[str] = None) -> Tuple[pd.Series, pd.Series, pd.Series]:
+        """볼린저 밴드 계산 (symbol/timeframe 지정 시 공용 지표 Cache Usage)"""
+        if symbol is None or timeframe is None:
+            return self._compute_bollinger_bands(df, period, std)
+        return get_indicator_cache().get_or_compute(
+            symbol, timeframe, ('bollinger', period, std), df,
+            lambda: self._compute_bollinger_bands(df, period, std))
+
+    def _compute_bollinger_bands(self, df: pd.DataFrame, period: int = 600, std: float = 2.0) -> Tuple[pd.Series, pd.Series, pd.Series]:
+        """볼린저 밴드 계산 (Cache 미적용)"""
         try:
             if len(df) < period:
                 # 데이터가 부족한 경우 Current price 기준으로 임시 계산
@@ -4138,7 +4360,7 @@ class ImprovedDCAPositionManager:
             # 최대 Profit ratio Update
             if current_profit_pct > position.max_profit_pct:
                 position.max_profit_pct = current_profit_pct
-                position.last_update = get_korea_time().isoformat()
+                position.last_update = time.time()
                 self.save_data()
             
             # 🔧 Modify: SuperTrend Exit은 Profit ratio 조건 없이 신호만으로 Execute
@@ -4152,7 +4374,7 @@ class ImprovedDCAPositionManager:
                 return None
             
             # SuperTrend 계산
-            supertrend, trend = self.calculate_supertrend(df, period=10, multiplier=3.0)
+            supertrend, trend = self.calculate_supertrend(df, period=10, multiplier=3.0, symbol=symbol, timeframe='5m')
             
             # Exit 시그널 Confirm: 상승(1) → 하락(-1) 전환
             if len(trend) >= 2:
@@ -4201,7 +4423,7 @@ class ImprovedDCAPositionManager:
                 # Trailing 스탑 Active화
                 position.trailing_stop_active = True
                 position.trailing_stop_high = current_price
-                position.last_update = get_korea_time().isoformat()
+                position.last_update = time.time()
                 self.save_data()
                 
                 return {
@@ -4224,7 +4446,8 @@ class ImprovedDCAPositionManager:
                         continue
                     
                     # BB600 계산 (표준편차 3.0 Usage)
-                    bb_upper, bb_middle, bb_lower = self.calculate_bollinger_bands(df, period=600, std=3.0)
+                    bb_upper, bb_middle, bb_lower = self.calculate_bollinger_bands(df, period=600, std=3.0,
+                                                                                   symbol=symbol, timeframe=timeframe)
                     
                     # 최근 몇 count 캔들의 고점이 BB600 상단선을 돌파했는지 Confirm (Current 포함 최근 3봉)
                     for i in range(-3, 0):  # 최근 3봉 체크
@@ -4244,7 +4467,7 @@ class ImprovedDCAPositionManager:
                             # Trailing 스탑 Active화
                             position.trailing_stop_active = True
                             position.trailing_stop_high = current_price
-                            position.last_update = get_korea_time().isoformat()
+                            position.last_update = time.time()
                             self.save_data()
                             
                             # 텔레그램 Notification
@@ -4286,7 +4509,7 @@ class ImprovedDCAPositionManager:
             # Current price가 New Highest price인지 Confirm
             if current_price > position.trailing_stop_high:
                 position.trailing_stop_high = current_price
-                position.last_update = get_korea_time().isoformat()
+                position.last_update = time.time()
                 self.save_data()
                 
                 # New Highest price 갱신 시 텔레그램 Notification (너무 빈번하지 않게 Log 레벨 조정)
@@ -4345,7 +4568,7 @@ class ImprovedDCAPositionManager:
         """
         try:
             # 중복 실행 방지
-            if hasattr(position, 'bb80_bb600_exit_done') and position.bb80_bb600_exit_done:
+            if position.bb80_bb600_exit_done:
                 return None
             
             # 조건 1: 원금수익률 >= 10%
@@ -4467,7 +4690,7 @@ class ImprovedDCAPositionManager:
         """3. 본절Exit: Profit ratio별 차등 Exit (3%~5%: 손실전환전, 5%~10%: 절반하락시)"""
         try:
             # 🚨 중복 Exit 방지: 이미 본절보호Exit이 Complete된 경우 Skip
-            if hasattr(position, 'breakeven_exit_done') and position.breakeven_exit_done:
+            if position.breakeven_exit_done:
                 return None
             
             # Current Profit ratio 계산
@@ -4476,14 +4699,14 @@ class ImprovedDCAPositionManager:
             # 최대 Profit ratio Update
             if current_profit_pct > position.max_profit_pct:
                 position.max_profit_pct = current_profit_pct
-                position.last_update = get_korea_time().isoformat()
+                position.last_update = time.time()
                 self.save_data()
             
             # 3% 이상 수익 달성시 보호 모드 Active화
             if position.max_profit_pct >= 0.03:
                 if not position.breakeven_protection_active:
                     position.breakeven_protection_active = True
-                    position.last_update = get_korea_time().isoformat()
+                    position.last_update = time.time()
                     self.save_data()
                     
                     # Profit ratio 구간별 보호 전략 결정
@@ -4592,7 +4815,7 @@ class ImprovedDCAPositionManager:
             # 최대 Profit ratio Update
             if current_profit_pct > position.max_profit_pct:
                 position.max_profit_pct = current_profit_pct
-                position.last_update = get_korea_time().isoformat()
+                position.last_update = time.time()
                 self.save_data()
             
             # 조건 1: 최대Profit ratio 2% 이상 달성했었는지 Confirm
@@ -4611,7 +4834,7 @@ class ImprovedDCAPositionManager:
                 return None
             
             # SuperTrend(10-2) 계산 (Legacy 10-3과 다른 파라미터)
-            supertrend_10_2, trend_10_2 = self.calculate_supertrend(df, period=10, multiplier=2.0)
+            supertrend_10_2, trend_10_2 = self.calculate_supertrend(df, period=10, multiplier=2.0, symbol=symbol, timeframe='5m')
             
             # 5봉 이내 Exit 신호 Confirm: 상승(1) → 하락(-1) 전환
             recent_5_trends = trend_10_2.tail(5)  # 최근 5봉
@@ -4676,7 +4899,8 @@ class ImprovedDCAPositionManager:
             # 지표 계산 (indicators.py의 calculate_indicators 사용하거나 직접 계산)
             try:
                 from indicators import calculate_indicators
-                df = calculate_indicators(df, self.logger)
+                df = get_indicator_cache().get_or_compute(
+                    symbol, '15m', 'indicators', df, lambda: calculate_indicators(df, self.logger))
                 if df is None:
                     return None
             except:
@@ -4805,6 +5029,9 @@ class ImprovedDCAPositionManager:
             # 현재 수익률 계산
             current_profit_pct = (current_price - position.average_price) / position.average_price
 
+            # Complete된 Exit은 체크 함수 호출 자체를 건너뜀 (각 함수도 Complete 시 바로 None 반환)
+            done = position.exit_flags
+
             # 🔍 모든 청산 조건을 동시에 체크
             exit_signals = []
 
@@ -4821,7 +5048,7 @@ class ImprovedDCAPositionManager:
                 })
 
             # 2. SuperTrend 전량Exit 체크
-            supertrend_exit = self.check_supertrend_exit_signal(symbol, current_price, position)
+            supertrend_exit = None if done & ExitFlag.SUPERTREND else self.check_supertrend_exit_signal(symbol, current_price, position)
             if supertrend_exit:
                 exit_signals.append({
                     'priority': 1,
@@ -4834,7 +5061,7 @@ class ImprovedDCAPositionManager:
 
             # 1.5. BB80 > BB600 자동 전량청산 체크 (1순위 조건)
             try:
-                bb80_bb600_exit = self.check_bb80_bb600_manual_liquidation_signal(symbol, current_price, position)
+                bb80_bb600_exit = None if done & ExitFlag.BB80_BB600 else self.check_bb80_bb600_manual_liquidation_signal(symbol, current_price, position)
                 if bb80_bb600_exit:
                     exit_signals.append({
                         'priority': 1.5,  # SuperTrend 다음 최우선
@@ -4849,7 +5076,7 @@ class ImprovedDCAPositionManager:
 
             # 3. 15분봉 BB/MA 피크 전량익절 체크
             try:
-                peak_profit_exit = self.check_peak_profit_exit_signal(symbol, current_price, position)
+                peak_profit_exit = None if done & ExitFlag.PEAK_PROFIT else self.check_peak_profit_exit_signal(symbol, current_price, position)
                 if peak_profit_exit:
                     exit_signals.append({
                         'priority': 2,
@@ -4876,7 +5103,7 @@ class ImprovedDCAPositionManager:
 
             # 5. 약상승후 급락 리스크 회피 체크
             try:
-                weak_rise_dump_exit = self.check_weak_rise_dump_protection_exit(symbol, current_price, position)
+                weak_rise_dump_exit = None if done & ExitFlag.WEAK_RISE_DUMP else self.check_weak_rise_dump_protection_exit(symbol, current_price, position)
                 if weak_rise_dump_exit:
                     exit_signals.append({
                         'priority': 4,
@@ -4891,7 +5118,7 @@ class ImprovedDCAPositionManager:
 
             # 6. 본절보호 Exit 체크
             try:
-                breakeven_exit = self.check_breakeven_protection_exit(symbol, current_price, position)
+                breakeven_exit = None if done & ExitFlag.BREAKEVEN else self.check_breakeven_protection_exit(symbol, current_price, position)
                 if breakeven_exit:
                     exit_signals.append({
                         'priority': 5,
@@ -5029,45 +5256,20 @@ class ImprovedDCAPositionManager:
             
             position = self.positions[symbol]
             
-            if exit_type == ExitType.SUPERTREND_EXIT.value:
-                position.supertrend_exit_done = True
-            elif exit_type == ExitType.BB80_BB600_AUTO_LIQUIDATION.value:
-                # BB80>BB600 복합기술적 전량청산은 전량 Exit이므로 모든 Exit Complete Process
-                position.bb80_bb600_exit_done = True
-                position.supertrend_exit_done = True
-                position.bb600_exit_done = True
-                position.weak_rise_dump_exit_done = True
-                position.breakeven_exit_done = True
-                position.peak_profit_exit_done = True
-            elif exit_type == ExitType.BB600_PARTIAL_EXIT.value:
-                position.bb600_exit_done = True
-                # Trailing 스탑이 Active화된 경우 Maintain
-                if exit_signal and 'trailing_stop_activated' in exit_signal and exit_signal['trailing_stop_activated']:
+            # 전량 Exit (BB80>BB600 / 피크 익절 / 본절보호 / 급락 리스크 times피)은 이후 Exit 체크도 Complete Process
+            # (Exit Type별 비트 조합: EXIT_COMPLETION_FLAGS)
+            completion_flags = EXIT_COMPLETION_FLAGS.get(exit_type)
+            if completion_flags is not None:
+                position.exit_flags = int(position.exit_flags | completion_flags)
+                # BB600 50% Exit 후 Trailing 스탑이 Active화된 경우 Maintain
+                if exit_signal and exit_signal.get('trailing_stop_activated'):
                     self.logger.info(f"🔄 Trailing 스탑 Active화 Maintain: {symbol}")
             elif exit_type == 'trailing_stop_exit':
                 # Trailing 스탑으로 나머지 50% Exit Complete
                 position.trailing_stop_active = False
                 self.logger.info(f"✅ Trailing 스탑 Complete: {symbol}")
-            elif exit_type == ExitType.PEAK_PROFIT_EXIT.value:
-                # 15분봉 BB/MA 피크 전량익절은 전량 Exit이므로 모든 Exit Complete Process
-                position.peak_profit_exit_done = True
-                position.supertrend_exit_done = True
-                position.bb600_exit_done = True
-                position.weak_rise_dump_exit_done = True
-                position.breakeven_exit_done = True
-            elif exit_type == ExitType.BREAKEVEN_PROTECTION.value:
-                # 본절보호Exit은 전량 Exit이므로 모든 Exit Complete Process
-                position.breakeven_exit_done = True
-                position.supertrend_exit_done = True
-                position.bb600_exit_done = True
-                position.weak_rise_dump_exit_done = True
-            elif exit_type == ExitType.WEAK_RISE_DUMP_PROTECTION.value:
-                # Approx상승후 급락 리스크 times피는 전량 Exit이므로 모든 Exit Complete Process
-                position.weak_rise_dump_exit_done = True
-                position.supertrend_exit_done = True
-                position.bb600_exit_done = True
             
-            position.last_update = get_korea_time().isoformat()
+            position.last_update = time.time()
             self.save_data()
             
         except Exception as e:
@@ -5232,14 +5434,15 @@ class ImprovedDCAPositionManager:
                 self._sent_fill_notifications = set(notifications_list[-500:])  # 최근 500count만 Maintain
                 self.logger.debug(f"📝 Notification 기록 자동 Cleanup: 1000+ → 500count")
             
+            # 요청 시점 사본을 기록 (체결 처리 스레드가 set을 계속 수정함)
+            notifications = list(self._sent_fill_notifications)
             data = {
-                'notifications': list(self._sent_fill_notifications),
+                'notifications': notifications,
                 'last_updated': get_korea_time().isoformat(),
-                'count': len(self._sent_fill_notifications)
+                'count': len(notifications)
             }
             
-            with open(notifications_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            self.persistence.schedule(notifications_file, lambda: data)
                 
         except Exception as e:
             self.logger.error(f"Notification 기록 Save Failed: {e}")
@@ -5272,7 +5475,7 @@ class ImprovedDCAPositionManager:
                         # 최대 Profit ratio Update
                         if profit_pct > position.max_profit_pct:
                             position.max_profit_pct = profit_pct
-                            position.last_update = get_korea_time().isoformat()
+                            position.last_update = time.time()
                             self.save_data()
                         
                         # Cyclic trading 기times 조건 (간소화)
@@ -5323,7 +5526,7 @@ class ImprovedDCAPositionManager:
                         
                         # Cyclic trading 카운트 증가
                         position.cyclic_count += 1
-                        position.last_cyclic_entry = get_korea_time().isoformat()
+                        position.last_cyclic_entry = time.time()
                         
                         # Cyclic trading Complete 체크
                         if position.cyclic_count >= position.max_cyclic_count:
@@ -5331,7 +5534,7 @@ class ImprovedDCAPositionManager:
                         else:
                             position.cyclic_state = CyclicState.CYCLIC_ACTIVE.value
                         
-                        position.last_update = get_korea_time().isoformat()
+                        position.last_update = time.time()
                         self.save_data()
                         
                         # 수익 계산
@@ -5397,8 +5600,7 @@ class ImprovedDCAPositionManager:
         """Current price 조times"""
         try:
             if self.exchange:
-                ticker = self.exchange.fetch_ticker(symbol)
-                return float(ticker['last'])
+                return self._fetch_current_price(symbol)
             return None
         except Exception as e:
             self.logger.error(f"Current price 조times Failed {symbol}: {e}")
@@ -5416,7 +5618,7 @@ class ImprovedDCAPositionManager:
             if order_result['success']:
                 # Position Quantity Update
                 position.total_quantity -= exit_quantity
-                position.last_update = get_korea_time().isoformat()
+                position.last_update = time.time()
                 self.save_data()
                 
                 self.logger.info(f"✅ 부분Exit Complete: {position.symbol} - {partial_ratio*100:.0f}% ({reason})")
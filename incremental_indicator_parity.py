@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+증분 지표 엔진 동일성 Verification / 벤치마크
+OneMinuteSurgeEntryStrategy.calculate_indicators 배치 경로와 증분 엔진 경로를 비교
+
+Verification 항목:
+1. 스캔 시뮬레이션 (Progress 중 캔들 갱신 + 새 캔들 Add)마다 모든 지표 컬럼 비교
+   - 실수 컬럼: 허용 오차 내 일치 (NaN 위치 포함)
+   - supertrend_direction / supertrend_signal: 완전 일치
+2. 프레임 Length별 (적응형 윈도우 100/250/400, 고정 윈도우 700/1000)
+3. 호출당 Time: 배치 재계산 vs 증분 동기화, update()+latest() 캔들당 비용
+
+Usage:
+    python incremental_indicator_parity.py [--lengths 100 250 400 700 1000] [--steps 300]
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from incremental_indicators import OUTPUT_COLUMNS, IncrementalIndicatorEngine
+from one_minute_surge_entry_strategy import OneMinuteSurgeEntryStrategy
+
+RTOL = 1e-9
+
+
+def make_strategy() -> OneMinuteSurgeEntryStrategy:
+    """지표 계산만 Usage하는 전략 인스턴스 (거래소 Connections 없음)"""
+    strategy = OneMinuteSurgeEntryStrategy.__new__(OneMinuteSurgeEntryStrategy)
+    strategy.logger = logging.getLogger('incremental_indicator_parity')
+    strategy.debug_log_file = None
+    return strategy
+
+
+def make_candles(rows: int, seed: int) -> np.ndarray:
+    """랜덤 워크 캔들 [timestamp, open, high, low, close, volume]"""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.4, rows))
+    open_ = close + rng.normal(0, 0.2, rows)
+    high = np.maximum(open_, close) + rng.random(rows) * 0.4
+    low = np.minimum(open_, close) - rng.random(rows) * 0.4
+    timestamp = 1_700_000_000_000 + np.arange(rows, dtype=np.int64) * 60_000
+    return np.column_stack([timestamp, open_, high, low, close, rng.random(rows) * 1000])
+
+
+def frame(candles: np.ndarray) -> pd.DataFrame:
+    df = pd.DataFrame(candles[:, 1:], columns=['open', 'high', 'low', 'close', 'volume'])
+    df.insert(0, 'timestamp', pd.to_datetime(candles[:, 0].astype(np.int64), unit='ms'))
+    return df
+
+
+def compare(expected: pd.DataFrame, actual: pd.DataFrame) -> list:
+    """불일치 컬럼 목록"""
+    mismatched = []
+    if list(expected.columns) != list(actual.columns):
+        mismatched.append('column order')
+    for column in OUTPUT_COLUMNS + ['supertrend_signal']:
+        a = expected[column].to_numpy()
+        b = actual[column].to_numpy()
+        if column in ('supertrend_direction', 'supertrend_signal'):
+            ok = a.dtype == b.dtype and np.array_equal(a, b)
+        else:
+            ok = np.allclose(a, b, rtol=RTOL, atol=RTOL * 100, equal_nan=True) \
+                and np.array_equal(np.isnan(a), np.isnan(b))
+        if not ok:
+            mismatched.append(column)
+    return mismatched
+
+
+def run_parity(length: int, steps: int, seed: int, ticks: int = 3) -> dict:
+    """
+    스캔 시뮬레이션: 매 스텝 Progress 중 캔들을 ticks번 갱신한 뒤 새 캔들 Add
+    """
+    strategy = make_strategy()
+    candles = make_candles(length + steps, seed)
+    rng = np.random.default_rng(seed + 1000)
+    mismatches = 0
+    checks = 0
+    batch_time = engine_time = 0.0
+
+    for step in range(steps):
+        end = length + step
+        window = candles[end - length:end].copy()
+        for tick in range(ticks):
+            # Progress 중 캔들 갱신 (마지막 행 high/low/close Change)
+            if tick:
+                live = window[-1]
+                live[4] += rng.normal(0, 0.1)
+                live[2] = max(live[2], live[4])
+                live[3] = min(live[3], live[4])
+
+            expected = frame(window)
+            start = time.perf_counter()
+            expected = strategy.calculate_indicators(expected)
+            batch_time += time.perf_counter() - start
+
+            actual = frame(window)
+            start = time.perf_counter()
+            actual = strategy.calculate_indicators(actual, 'SYMUSDT', '1m')
+            engine_time += time.perf_counter() - start
+
+            checks += 1
+            if expected is None or actual is None:
+                if (expected is None) != (actual is None):
+                    mismatches += 1
+                continue
+            mismatched = compare(expected, actual)
+            if mismatched:
+                mismatches += 1
+                if mismatches <= 3:
+                    print(f"  ❌ length={length} step={step} tick={tick}: {mismatched}")
+        candles[end - 1] = window[-1]
+
+    stats = strategy._get_indicator_engine().stats
+    return {
+        'checks': checks,
+        'mismatches': mismatches,
+        'batch_ms': batch_time / checks * 1000,
+        'engine_ms': engine_time / checks * 1000,
+        'seeds': stats['seeds'],
+        'fallbacks': stats['fallbacks']
+    }
+
+
+def bench_update(length: int, candles_count: int) -> float:
+    """update() + latest() 캔들당 비용 (μs)"""
+    engine = IncrementalIndicatorEngine()
+    candles = make_candles(length + candles_count, 7)
+    engine.apply('SYMUSDT', '1m', frame(candles[:length]))
+    start = time.perf_counter()
+    for row in candles[length:]:
+        engine.update('SYMUSDT', '1m', int(row[0]), row[2], row[3], row[4])
+        engine.latest('SYMUSDT', '1m')
+    return (time.perf_counter() - start) / candles_count * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Incremental indicator parity / benchmark')
+    parser.add_argument('--lengths', type=int, nargs='+', default=[100, 250, 400, 700, 1000])
+    parser.add_argument('--steps', type=int, default=300)
+    parser.add_argument('--seeds', type=int, default=2)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    print(f"📊 증분 지표 엔진 Verification: {args.steps} steps × 3 ticks, rtol={RTOL}")
+    print(f"{'length':>7} {'checks':>7} {'mismatch':>9} {'seeds':>6} {'batch ms':>9} {'engine ms':>10} {'speedup':>8}")
+    total_mismatches = 0
+    for length in args.lengths:
+        for seed in range(args.seeds):
+            result = run_parity(length, args.steps, seed)
+            total_mismatches += result['mismatches']
+            print(f"{length:>7} {result['checks']:>7} {result['mismatches']:>9} {result['seeds']:>6} "
+                  f"{result['batch_ms']:>9.2f} {result['engine_ms']:>10.2f} "
+                  f"{result['batch_ms'] / result['engine_ms']:>7.1f}x")
+
+    for length in (250, 1000):
+        print(f"  update()+latest(): {bench_update(length, 5000):.1f}μs/candle (length={length})")
+
+    print("🎉 Parity OK" if total_mismatches == 0 else f"❌ {total_mismatches} mismatches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,659 @@
+# -*- coding: utf-8 -*-
+"""
+Incremental Indicator Engine
+Symbol-Timeframe별 지표 Status를 유지하며 캔들 1count 변경마다 O(1)로 갱신하는 스트리밍 엔진
+
+특징:
+- MA / BB: 윈도우별 running sum / sum of squares (기준값 shift로 상쇄 오차 억제, 주기적 재계산)
+- 일목균형표: monotonic deque (확정 캔들) + Progress 중인 캔들 결합
+- ATR / SuperTrend 밴드: running sum, SuperTrend 마지막 Status 보관
+- 새 캔들 Add / Progress 중 캔들 Update 모두 O(1)
+- 지표 이력을 링 배열에 Save → 스캐너는 재계산 없이 프레임/최신값 조times
+
+배치 계산(OneMinuteSurgeEntryStrategy.calculate_indicators)과의 관계:
+- 윈도우 구성은 프레임 Length에 따라 배치와 동일하게 결정 (indicator_plan)
+- 프레임 앞부분 워밍업 행은 배치와 동일하게 NaN Process
+- SuperTrend 라인/방향은 배치 정의(프레임 10번째 행부터 Starting)를 따르므로
+  프레임 출력 시 Save된 밴드로 벡터 커널을 1times 실행 (최신값 조times는 연속 Status Usage)
+- 결과는 부동소수점 허용 오차 내에서 배치와 일치 (incremental_indicator_parity.py)
+"""
+
+import threading
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from indicators import supertrend_kernel
+
+
+# 엔진 적용 최소 프레임 Length (이보다 짧으면 배치 계산의 대체 분기 Usage)
+MIN_FRAME_LENGTH = 30
+
+# Symbol-Timeframe당 유지할 윈도우 구성 수 (호출부별 프레임 Length가 다른 경우)
+MAX_PLANS_PER_KEY = 3
+
+# SuperTrend (10-3) Settings
+SUPERTREND_PERIOD = 10
+SUPERTREND_MULTIPLIER = 3.0
+
+# 일목균형표 윈도우
+ICHIMOKU_BASE_WINDOW = 26
+ICHIMOKU_CONVERSION_WINDOW = 9
+
+# 출력 컬럼 순서 (배치 calculate_indicators와 동일)
+MA_COLUMNS = ['ma5', 'ma20', 'ma80', 'ma480']
+BB_NAMES = ['bb20', 'bb80', 'bb200', 'bb480', 'bb600']
+OUTPUT_COLUMNS = (MA_COLUMNS
+                  + [f'{name}_{side}' for name in BB_NAMES for side in ('upper', 'lower')]
+                  + ['ichimoku_base', 'ichimoku_conversion', 'tr', 'atr', 'upper_band', 'lower_band',
+                     'supertrend', 'supertrend_direction'])
+_COL = {column: i for i, column in enumerate(OUTPUT_COLUMNS)}
+
+
+def indicator_plan(length: int) -> Optional[Tuple[Tuple, Tuple]]:
+    """
+    프레임 Length별 지표 윈도우 구성 (배치 calculate_indicators의 적응형 윈도우와 동일)
+
+    Returns:
+        tuple: ((ma 이름, 윈도우), ...), ((bb 이름, 윈도우, 표준편차 배수), ...)
+               배치의 대체 분기(BB200/MA 기반 확장)가 필요한 Length면 None
+    """
+    if length < MIN_FRAME_LENGTH:
+        return None
+
+    ma480_window = 480 if length >= 480 else min(200, length // 2)
+    ma = (('ma5', 5), ('ma20', min(20, length)), ('ma80', min(80, length)), ('ma480', ma480_window))
+
+    bb = []
+    for period in (20, 80, 200):
+        bb.append((f'bb{period}', min(period, length), 2.0))
+    for period in (480, 600):
+        if length >= period:
+            bb.append((f'bb{period}', period, 2.0))
+        else:
+            max_window = min(length - 5, max(20, length // 2))
+            if max_window < 20:
+                return None
+            bb.append((f'bb{period}', max_window, 2.5 if period == 600 else 2.2))
+    return ma, tuple(bb)
+
+
+class _RunningWindow:
+    """최근 window count 값의 sum / sum of squares (기준값 shift)"""
+
+    __slots__ = ('window', 'shift', 's1', 's2', 'since_rebase')
+
+    def __init__(self, window: int):
+        self.window = window
+        self.shift = 0.0
+        self.s1 = 0.0
+        self.s2 = 0.0
+        self.since_rebase = 0
+
+    def rebase(self, values: List[float]):
+        """윈도우 값으로 합계 재계산 (누적 오차 Initialize)"""
+        self.shift = values[-1] if values else 0.0
+        s1 = s2 = 0.0
+        for value in values:
+            d = value - self.shift
+            s1 += d
+            s2 += d * d
+        self.s1 = s1
+        self.s2 = s2
+        self.since_rebase = 0
+
+    def add(self, value: float):
+        d = value - self.shift
+        self.s1 += d
+        self.s2 += d * d
+
+    def remove(self, value: float):
+        d = value - self.shift
+        self.s1 -= d
+        self.s2 -= d * d
+
+    def mean(self) -> float:
+        return self.s1 / self.window + self.shift
+
+    def std(self) -> float:
+        """표본 표준편차 (ddof=1, pandas rolling std와 동일)"""
+        n = self.window
+        if n < 2:
+            return float('nan')
+        var = (self.s2 - self.s1 * self.s1 / n) / (n - 1)
+        return var ** 0.5 if var > 0 else 0.0
+
+
+class _MonotonicWindow:
+    """확정 캔들에 대한 rolling max/min (monotonic deque) + Progress 중 캔들 결합"""
+
+    __slots__ = ('window', 'is_max', 'items')
+
+    def __init__(self, window: int, is_max: bool):
+        self.window = window
+        self.is_max = is_max
+        self.items = deque()  # (index, value)
+
+    def push(self, index: int, value: float):
+        items = self.items
+        if self.is_max:
+            while items and items[-1][1] <= value:
+                items.pop()
+        else:
+            while items and items[-1][1] >= value:
+                items.pop()
+        items.append((index, value))
+
+    def value(self, last_index: int, live_value: float) -> float:
+        """last_index(Progress 중 캔들)를 포함한 최근 window count의 max/min"""
+        items = self.items
+        oldest = last_index - self.window + 1
+        while items and items[0][0] < oldest:
+            items.popleft()
+        if not items:
+            return live_value
+        best = items[0][1]
+        if self.is_max:
+            return live_value if live_value > best else best
+        return live_value if live_value < best else best
+
+
+class _IndicatorState:
+    """Symbol-Timeframe 1count의 증분 지표 Status"""
+
+    def __init__(self, plan, capacity: int):
+        self.plan = plan
+        self.capacity = capacity
+        ma_plan, bb_plan = plan
+
+        self.windows: Dict[int, _RunningWindow] = {}
+        for _, window in ma_plan:
+            self.windows.setdefault(window, _RunningWindow(window))
+        for _, window, _ in bb_plan:
+            self.windows.setdefault(window, _RunningWindow(window))
+        self.atr_window = _RunningWindow(SUPERTREND_PERIOD)
+
+        self.ichimoku = {
+            'base_high': _MonotonicWindow(ICHIMOKU_BASE_WINDOW, True),
+            'base_low': _MonotonicWindow(ICHIMOKU_BASE_WINDOW, False),
+            'conv_high': _MonotonicWindow(ICHIMOKU_CONVERSION_WINDOW, True),
+            'conv_low': _MonotonicWindow(ICHIMOKU_CONVERSION_WINDOW, False),
+        }
+
+        # 원시값 링 (Python 리스트: 단일 원소 접근이 NumPy보다 빠름)
+        self.ring = max(capacity, max(self.windows) + 1, ICHIMOKU_BASE_WINDOW + 1)
+        self._ts = [0] * self.ring
+        self._high = [0.0] * self.ring
+        self._low = [0.0] * self.ring
+        self._close = [0.0] * self.ring
+        self._tr = [0.0] * self.ring  # 첫 행 TR은 0으로 보관 (ATR 윈도우에 포함되기 전 제거됨)
+
+        # 지표 이력 링 (최근 capacity행)
+        self._out = np.full((capacity, len(OUTPUT_COLUMNS)), np.nan, dtype=np.float64)
+
+        # 마지막 캔들 인덱스 (Status 생성 이후 누적)
+        self.n = -1
+
+        # SuperTrend 연속 Status: 확정(n-1) / Current(n)
+        self.st_committed = (float('nan'), 0)
+        self.st_live = (float('nan'), 0)
+
+    # ------------------------------------------------------------------
+    # 원시값 접근
+    # ------------------------------------------------------------------
+    @property
+    def last_timestamp(self) -> int:
+        return self._ts[self.n % self.ring] if self.n >= 0 else -1
+
+    def timestamp_at(self, index: int) -> int:
+        return self._ts[index % self.ring]
+
+    def close_at(self, index: int) -> float:
+        return self._close[index % self.ring]
+
+    def ring_slice(self, series: List[float], start: int, stop: int) -> List[float]:
+        """캔들 인덱스 [start, stop) 값 (링 경계 처리)"""
+        if stop <= start:
+            return []
+        begin = start % self.ring
+        end = begin + (stop - start)
+        if end <= self.ring:
+            return series[begin:end]
+        return series[begin:] + series[:end - self.ring]
+
+    def _window_values(self, series: List[float], window: int) -> List[float]:
+        return self.ring_slice(series, max(0, self.n - window + 1), self.n + 1)
+
+    # ------------------------------------------------------------------
+    # 배치 결과로 Initialize (O(L) 1times)
+    # ------------------------------------------------------------------
+    def seed(self, timestamps: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+             columns: np.ndarray, supertrend: np.ndarray, direction: np.ndarray):
+        length = len(close)
+        # 링 위치 = 캔들 인덱스 % ring (n = length - 1 기준, 링 밖 과거 행은 Save하지 않음)
+        for src in range(max(0, length - self.ring), length):
+            pos = src % self.ring
+            self._ts[pos] = int(timestamps[src])
+            self._high[pos] = float(high[src])
+            self._low[pos] = float(low[src])
+            self._close[pos] = float(close[src])
+            tr = columns[src, _COL['tr']]
+            self._tr[pos] = 0.0 if np.isnan(tr) else float(tr)
+        self.n = length - 1
+
+        for window in self.windows.values():
+            window.rebase(self._window_values(self._close, window.window))
+        self.atr_window.rebase(self._window_values(self._tr, SUPERTREND_PERIOD))
+
+        # 확정 캔들(마지막 행 제외)로 deque 구성
+        for key, mono in self.ichimoku.items():
+            source = self._high if key.endswith('high') else self._low
+            start = max(0, self.n - mono.window + 1)
+            for i in range(start, self.n):
+                mono.push(i, source[i % self.ring])
+
+        # 지표 이력
+        rows = min(length, self.capacity)
+        block = columns[length - rows:]
+        for offset in range(rows):
+            self._out[(self.n - rows + 1 + offset) % self.capacity] = block[offset]
+
+        if length >= 2:
+            self.st_committed = (float(supertrend[-2]), int(direction[-2]))
+        self.st_live = (float(supertrend[-1]), int(direction[-1]))
+
+    # ------------------------------------------------------------------
+    # 증분 Update (O(1))
+    # ------------------------------------------------------------------
+    def append(self, timestamp: int, high: float, low: float, close: float):
+        """새 캔들 Add (직전 캔들은 확정 처리)"""
+        if self.n >= 0:
+            last = self.n % self.ring
+            for key, mono in self.ichimoku.items():
+                mono.push(self.n, self._high[last] if key.endswith('high') else self._low[last])
+            self.st_committed = self.st_live
+
+        self.n += 1
+        n = self.n
+        pos = n % self.ring
+        prev_close = self._close[(n - 1) % self.ring] if n > 0 else None
+
+        # 윈도우에서 빠지는 값 제거 후 새 값 Add
+        for window in self.windows.values():
+            w = window.window
+            if n - w >= 0:
+                window.remove(self._close[(n - w) % self.ring])
+            window.add(close)
+            window.since_rebase += 1
+
+        tr = self._true_range(high, low, prev_close)
+        if n - SUPERTREND_PERIOD >= 0:
+            self.atr_window.remove(self._tr[(n - SUPERTREND_PERIOD) % self.ring])
+        self.atr_window.add(tr)
+        self.atr_window.since_rebase += 1
+
+        self._ts[pos] = timestamp
+        self._high[pos] = high
+        self._low[pos] = low
+        self._close[pos] = close
+        self._tr[pos] = tr
+
+        self._maybe_rebase()
+        self._write_row()
+
+    def update_last(self, high: float, low: float, close: float):
+        """Progress 중인 마지막 캔들 값 변경"""
+        n = self.n
+        pos = n % self.ring
+        old_close = self._close[pos]
+        for window in self.windows.values():
+            window.remove(old_close)
+            window.add(close)
+
+        prev_close = self._close[(n - 1) % self.ring] if n > 0 else None
+        tr = self._true_range(high, low, prev_close)
+        self.atr_window.remove(self._tr[pos])
+        self.atr_window.add(tr)
+
+        self._high[pos] = high
+        self._low[pos] = low
+        self._close[pos] = close
+        self._tr[pos] = tr
+        self._write_row()
+
+    @staticmethod
+    def _true_range(high: float, low: float, prev_close: Optional[float]) -> float:
+        if prev_close is None:
+            return 0.0
+        tr = high - low
+        d = abs(high - prev_close)
+        if d > tr:
+            tr = d
+        d = abs(low - prev_close)
+        if d > tr:
+            tr = d
+        return tr
+
+    def _maybe_rebase(self):
+        for window in self.windows.values():
+            if window.since_rebase >= window.window:
+                window.rebase(self._window_values(self._close, window.window))
+        if self.atr_window.since_rebase >= SUPERTREND_PERIOD * 50:
+            self.atr_window.rebase(self._window_values(self._tr, SUPERTREND_PERIOD))
+
+    def _write_row(self):
+        n = self.n
+        pos = n % self.ring
+        nan = float('nan')
+        ma_plan, bb_plan = self.plan
+        row = [nan] * len(OUTPUT_COLUMNS)
+
+        for name, w in ma_plan:
+            if n >= w - 1:
+                row[_COL[name]] = self.windows[w].mean()
+        for name, w, mult in bb_plan:
+            if n >= w - 1:
+                window = self.windows[w]
+                mean = window.mean()
+                std = window.std()
+                row[_COL[f'{name}_upper']] = mean + std * mult
+                row[_COL[f'{name}_lower']] = mean - std * mult
+
+        high = self._high[pos]
+        low = self._low[pos]
+        ich = self.ichimoku
+        if n >= ICHIMOKU_BASE_WINDOW - 1:
+            row[_COL['ichimoku_base']] = (ich['base_high'].value(n, high) + ich['base_low'].value(n, low)) / 2
+        if n >= ICHIMOKU_CONVERSION_WINDOW - 1:
+            row[_COL['ichimoku_conversion']] = (ich['conv_high'].value(n, high) + ich['conv_low'].value(n, low)) / 2
+
+        if n >= 1:
+            row[_COL['tr']] = self._tr[pos]
+        if n >= SUPERTREND_PERIOD:
+            atr = self.atr_window.mean()
+            hl2 = (high + low) / 2
+            upper = hl2 + SUPERTREND_MULTIPLIER * atr
+            lower = hl2 - SUPERTREND_MULTIPLIER * atr
+            row[_COL['atr']] = atr
+            row[_COL['upper_band']] = upper
+            row[_COL['lower_band']] = lower
+            self.st_live = self._supertrend_step(self._close[pos], upper, lower)
+            row[_COL['supertrend']], row[_COL['supertrend_direction']] = self.st_live
+
+        self._out[n % self.capacity] = row
+
+    def _supertrend_step(self, close: float, upper: float, lower: float) -> Tuple[float, int]:
+        """직전 확정 Status 기준 SuperTrend 1스텝 (supertrend_kernel과 동일 규칙)"""
+        prev_line, prev_direction = self.st_committed
+        if self.n == SUPERTREND_PERIOD or prev_direction == 0:
+            prev_line, prev_direction = upper, -1
+        if prev_direction == 1:
+            if close < lower:
+                return upper, -1
+            return (prev_line if prev_line > lower else lower), 1
+        if close > upper:
+            return lower, 1
+        return (prev_line if prev_line < upper else upper), -1
+
+    # ------------------------------------------------------------------
+    # 조times
+    # ------------------------------------------------------------------
+    def history(self, length: int) -> np.ndarray:
+        """최근 length행 지표 이력 (복사본)"""
+        end = self.n % self.capacity + 1
+        if length <= end:
+            return self._out[end - length:end].copy()
+        return np.concatenate((self._out[self.capacity - (length - end):], self._out[:end]))
+
+    def latest(self) -> dict:
+        row = self._out[self.n % self.capacity]
+        values = {column: float(row[i]) for i, column in enumerate(OUTPUT_COLUMNS)}
+        values['supertrend'], values['supertrend_direction'] = self.st_live
+        values['supertrend_signal'] = values['supertrend_direction']
+        values['timestamp'] = self.last_timestamp
+        values['close'] = self.close_at(self.n)
+        return values
+
+
+class IncrementalIndicatorEngine:
+    """Symbol-Timeframe별 증분 지표 엔진"""
+
+    def __init__(self, max_length: int = 1500, max_plans: int = MAX_PLANS_PER_KEY):
+        """
+        Args:
+            max_length: 엔진을 적용할 최대 프레임 Length (초과 시 배치 계산)
+            max_plans: Symbol-Timeframe당 유지할 윈도우 구성 수 (LRU)
+        """
+        self.max_length = max_length
+        self.max_plans = max_plans
+        # (symbol, timeframe) -> OrderedDict(plan -> _IndicatorState), 마지막이 최근 Usage
+        self._states: Dict[Tuple[str, str], OrderedDict] = {}
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._registry_lock = threading.Lock()
+
+        # 통계
+        self.stats = {
+            'seeds': 0,          # 배치 계산으로 Status 재Create
+            'incremental': 0,    # 증분 갱신만으로 Process
+            'appended': 0,       # 증분 Add된 캔들 수
+            'updated': 0,        # Progress 중 캔들 갱신 수
+            'fallbacks': 0       # 엔진 미적용 (짧은 프레임 / NaN 등)
+        }
+
+    def _lock_for(self, key: Tuple[str, str]) -> threading.Lock:
+        lock = self._locks.get(key)
+        if lock is None:
+            with self._registry_lock:
+                lock = self._locks.setdefault(key, threading.Lock())
+        return lock
+
+    def reset(self, symbol: Optional[str] = None):
+        """Status Initialize (symbol 지정 시 해당 Symbol만)"""
+        with self._registry_lock:
+            if symbol is None:
+                self._states.clear()
+            else:
+                for key in [k for k in list(self._states) if k[0] == symbol]:
+                    self._states.pop(key, None)
+
+    def update(self, symbol: str, timeframe: str, timestamp: int, high: float, low: float, close: float) -> bool:
+        """
+        캔들 1count 반영 (O(1)) - 같은 timestamp면 Progress 중 캔들 갱신, 이후 timestamp면 Add
+
+        Returns:
+            bool: 반영 여부 (Status 없음 / 과거 캔들이면 False → 다음 apply()에서 재Create)
+        """
+        key = (symbol, timeframe)
+        with self._lock_for(key):
+            plans = self._states.get(key)
+            if not plans:
+                return False
+            applied = False
+            for state in plans.values():
+                last_ts = state.last_timestamp
+                if timestamp == last_ts:
+                    state.update_last(high, low, close)
+                    self.stats['updated'] += 1
+                elif timestamp > last_ts:
+                    state.append(timestamp, high, low, close)
+                    self.stats['appended'] += 1
+                else:
+                    continue
+                applied = True
+            return applied
+
+    def latest(self, symbol: str, timeframe: str) -> Optional[dict]:
+        """최신 지표값 (재계산 없음, 최근 Usage된 윈도우 구성 기준)"""
+        key = (symbol, timeframe)
+        with self._lock_for(key):
+            plans = self._states.get(key)
+            if not plans:
+                return None
+            state = next(reversed(plans.values()))
+            return state.latest() if state.n >= 0 else None
+
+    def apply(self, symbol: str, timeframe: str, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        df와 Status를 동기화한 뒤 지표 컬럼을 결합한 DataFrame 반환
+
+        Status의 마지막 캔들 이후 행만 증분 반영하며, 이력이 df와 맞지 않으면 배치로 재Create합니다.
+
+        Returns:
+            DataFrame: 지표 컬럼이 결합된 New DataFrame (엔진 미적용 시 None → 호출 측 배치 계산)
+        """
+        length = len(df)
+        plan = indicator_plan(length)
+        if plan is None or length > self.max_length:
+            self.stats['fallbacks'] += 1
+            return None
+
+        timestamps = _timestamps_ms(df['timestamp'])
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+        close = df['close'].to_numpy(dtype=np.float64)
+        if np.isnan(close).any() or np.isnan(high).any() or np.isnan(low).any():
+            self.stats['fallbacks'] += 1
+            return None
+
+        key = (symbol, timeframe)
+        with self._lock_for(key):
+            plans = self._states.setdefault(key, OrderedDict())
+            state = plans.get(plan)
+            if state is None or length > state.capacity or not self._sync(state, timestamps, high, low, close):
+                state = self._seed(plan, timestamps, high, low, close)
+                plans[plan] = state
+                self.stats['seeds'] += 1
+            else:
+                self.stats['incremental'] += 1
+            plans.move_to_end(plan)
+            while len(plans) > self.max_plans:
+                plans.popitem(last=False)
+            block = self._frame_block(state, length, close)
+
+        return attach_indicator_columns(df, block)
+
+    def _sync(self, state: _IndicatorState, timestamps: np.ndarray, high: np.ndarray,
+              low: np.ndarray, close: np.ndarray) -> bool:
+        """df 끝부분을 Status에 반영, 이력이 df와 일치하면 True"""
+        length = len(timestamps)
+        last_ts = state.last_timestamp
+        idx = int(np.searchsorted(timestamps, last_ts))
+        if idx >= length or timestamps[idx] != last_ts:
+            return False
+
+        # 이력 일치 Confirm (프레임 첫 행 timestamp + 확정 캔들 OHLC 전체)
+        first_index = state.n - idx
+        if first_index < 0 or first_index <= state.n - state.ring:
+            return False
+        if state.timestamp_at(first_index) != timestamps[0]:
+            return False
+        for series, values in ((state._close, close), (state._high, high), (state._low, low)):
+            if not np.array_equal(state.ring_slice(series, first_index, state.n), values[:idx]):
+                return False
+
+        # Progress 중 캔들 갱신 + 새 캔들 Add
+        if (state.close_at(state.n) != close[idx] or state._high[state.n % state.ring] != high[idx]
+                or state._low[state.n % state.ring] != low[idx]):
+            state.update_last(float(high[idx]), float(low[idx]), float(close[idx]))
+            self.stats['updated'] += 1
+        for i in range(idx + 1, length):
+            state.append(int(timestamps[i]), float(high[i]), float(low[i]), float(close[i]))
+            self.stats['appended'] += 1
+
+        return True
+
+    @staticmethod
+    def _seed(plan, timestamps, high, low, close) -> _IndicatorState:
+        columns = batch_indicator_columns(high, low, close, plan)
+        supertrend, direction = supertrend_kernel(
+            close, columns[:, _COL['upper_band']], columns[:, _COL['lower_band']], SUPERTREND_PERIOD)
+        columns[:, _COL['supertrend']] = supertrend
+        columns[:, _COL['supertrend_direction']] = direction
+
+        state = _IndicatorState(plan, len(close))
+        state.seed(timestamps, high, low, close, columns, supertrend, direction)
+        return state
+
+    @staticmethod
+    def _frame_block(state: _IndicatorState, length: int, close: np.ndarray) -> np.ndarray:
+        """프레임 Length 기준 지표 블록 (배치와 동일한 워밍업 NaN + 프레임 기준 SuperTrend)"""
+        block = state.history(length)
+        ma_plan, bb_plan = state.plan
+
+        # 프레임 앞부분 워밍업 (배치 rolling 결과가 NaN인 행)
+        for name, w in ma_plan:
+            block[:w - 1, _COL[name]] = np.nan
+        for name, w, _ in bb_plan:
+            block[:w - 1, _COL[f'{name}_upper']] = np.nan
+            block[:w - 1, _COL[f'{name}_lower']] = np.nan
+        block[:ICHIMOKU_BASE_WINDOW - 1, _COL['ichimoku_base']] = np.nan
+        block[:ICHIMOKU_CONVERSION_WINDOW - 1, _COL['ichimoku_conversion']] = np.nan
+        block[:1, _COL['tr']] = np.nan
+        for column in ('atr', 'upper_band', 'lower_band'):
+            block[:SUPERTREND_PERIOD, _COL[column]] = np.nan
+
+        # SuperTrend는 프레임 10번째 행부터 Starting하는 배치 정의를 따름 (벡터 커널)
+        supertrend, direction = supertrend_kernel(
+            close, block[:, _COL['upper_band']], block[:, _COL['lower_band']], SUPERTREND_PERIOD)
+        block[:, _COL['supertrend']] = supertrend
+        block[:, _COL['supertrend_direction']] = direction
+        return block
+
+
+def batch_indicator_columns(high: np.ndarray, low: np.ndarray, close: np.ndarray, plan) -> np.ndarray:
+    """배치 calculate_indicators와 동일한 pandas rolling 계산 (Status Create용)"""
+    ma_plan, bb_plan = plan
+    close_s = pd.Series(close)
+    high_s = pd.Series(high)
+    low_s = pd.Series(low)
+    columns = np.full((len(close), len(OUTPUT_COLUMNS)), np.nan, dtype=np.float64)
+
+    for name, w in ma_plan:
+        columns[:, _COL[name]] = close_s.rolling(window=w).mean().to_numpy()
+    for name, w, mult in bb_plan:
+        rolling_mean = close_s.rolling(window=w).mean()
+        rolling_std = close_s.rolling(window=w).std()
+        columns[:, _COL[f'{name}_upper']] = (rolling_mean + rolling_std * mult).to_numpy()
+        columns[:, _COL[f'{name}_lower']] = (rolling_mean - rolling_std * mult).to_numpy()
+
+    columns[:, _COL['ichimoku_base']] = ((high_s.rolling(window=ICHIMOKU_BASE_WINDOW).max()
+                                          + low_s.rolling(window=ICHIMOKU_BASE_WINDOW).min()) / 2).to_numpy()
+    columns[:, _COL['ichimoku_conversion']] = ((high_s.rolling(window=ICHIMOKU_CONVERSION_WINDOW).max()
+                                                + low_s.rolling(window=ICHIMOKU_CONVERSION_WINDOW).min()) / 2).to_numpy()
+
+    prev_close = close_s.shift(1)
+    tr = np.maximum(high_s - low_s, np.maximum(abs(high_s - prev_close), abs(low_s - prev_close)))
+    atr = tr.rolling(window=SUPERTREND_PERIOD).mean()
+    hl2 = (high_s + low_s) / 2
+    columns[:, _COL['tr']] = tr.to_numpy()
+    columns[:, _COL['atr']] = atr.to_numpy()
+    columns[:, _COL['upper_band']] = (hl2 + SUPERTREND_MULTIPLIER * atr).to_numpy()
+    columns[:, _COL['lower_band']] = (hl2 - SUPERTREND_MULTIPLIER * atr).to_numpy()
+    return columns
+
+
+def _timestamps_ms(series: pd.Series) -> np.ndarray:
+    """timestamp 컬럼 → int64 ms 배열 (datetime64 / 정수 모두 지원)"""
+    values = series.to_numpy()
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype('datetime64[ms]').astype(np.int64)
+    return values.astype(np.int64)
+
+
+def attach_indicator_columns(df: pd.DataFrame, block: np.ndarray) -> pd.DataFrame:
+    """
+    지표 블록을 df에 컬럼으로 결합 (배치와 동일한 컬럼 순서/dtype)
+
+    컬럼을 1count씩 Add하면 pandas 블록 삽입 비용이 컬럼 수만큼 반복되므로 한 번에 결합합니다.
+    실수 컬럼은 2-D 블록 그대로 (supertrend_direction이 마지막 컬럼), 방향 컬럼만 int64로 별도 결합.
+    """
+    values = pd.DataFrame(block[:, :-1], columns=OUTPUT_COLUMNS[:-1], index=df.index)
+    direction = block[:, -1].astype(np.int64)
+    signals = pd.DataFrame({'supertrend_direction': direction, 'supertrend_signal': direction},
+                           index=df.index)
+
+    existing = [column for column in OUTPUT_COLUMNS + ['supertrend_signal'] if column in df.columns]
+    base = df.drop(columns=existing) if existing else df
+    return pd.concat([base, values, signals], axis=1)
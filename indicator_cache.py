@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Indicator Result Cache
+같은 프레임에 대한 지표 계산 결과를 전략 / DCA 매니저 / Exit 시스템이 공유하는 LRU Cache
+
+키: (symbol, timeframe, 계산 종류, 프레임 Length, 마지막 캔들 Open Time, 마지막 종가)
+- 계산 종류: 같은 프레임이라도 계산 함수/파라미터가 다르면 별도 항목 (예: ('bollinger', 600, 3.0))
+- 프레임 Length: 적응형 윈도우 / 데이터 부족 대체값이 Length에 따라 달라지므로 키에 포함
+- 마지막 종가: Progress 중 캔들이 갱신되면 새 결과로 계산
+
+같은 루프(tick) 안에서 같은 프레임은 계산 종류별로 한 번만 계산됩니다.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# pandas 3+는 Copy-on-Write가 기본이므로 얕은 복사만으로 Cache 원본이 보호됨
+_COPY_ON_WRITE = int(pd.__version__.split('.')[0]) >= 3
+
+
+def frame_signature(df: pd.DataFrame) -> Optional[tuple]:
+    """
+    프레임 식별값 (Length, 마지막 캔들 Open Time ms, 마지막 종가)
+
+    Returns:
+        tuple: 식별값 (빈 프레임 / 식별 불가 시 None → Cache 미Usage)
+    """
+    if df is None or len(df) == 0 or 'close' not in df.columns:
+        return None
+    try:
+        last_ts = df['timestamp'].iloc[-1] if 'timestamp' in df.columns else df.index[-1]
+        if isinstance(last_ts, (pd.Timestamp, np.datetime64)):
+            last_ts = pd.Timestamp(last_ts).value // 1_000_000
+        return len(df), int(last_ts), float(df['close'].iloc[-1])
+    except (TypeError, ValueError):
+        return None
+
+
+def _detach(value: Any) -> Any:
+    """호출 측 수정이 Cache 원본에 반영되지 않도록 복사본 반환"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=not _COPY_ON_WRITE)
+    if isinstance(value, tuple):
+        return tuple(_detach(item) for item in value)
+    return value
+
+
+class IndicatorCache:
+    """지표 계산 결과 LRU Cache (Thread-safe)"""
+
+    def __init__(self, max_entries: int = 2048):
+        """
+        Args:
+            max_entries: 최대 Save 항목 수 (초과 시 가장 오래 Usage하지 않은 항목 제거)
+        """
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[tuple, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bypassed = 0  # 식별 불가 프레임 (Cache 미Usage)
+
+    def get_or_compute(self, symbol: str, timeframe: str, kind: Hashable, df: pd.DataFrame,
+                       compute: Callable[[], Any]) -> Any:
+        """
+        Cache된 결과 반환, 없으면 compute() 결과를 Save 후 반환
+
+        Args:
+            symbol: Symbol
+            timeframe: Timeframe
+            kind: 계산 종류 (함수 + 파라미터 식별값)
+            df: 입력 프레임
+            compute: 계산 함수 (None 결과도 Cache)
+        """
+        signature = frame_signature(df)
+        if signature is None:
+            with self._lock:
+                self.bypassed += 1
+            return compute()
+
+        key = (symbol, timeframe, kind) + signature
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _detach(self._entries[key])
+            self.misses += 1
+
+        # 계산은 락 밖에서 Execute (다른 Symbol 조times를 막지 않음)
+        result = compute()
+
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return _detach(result)
+
+    def store(self, symbol: str, timeframe: str, kind: Hashable, df: pd.DataFrame, result: Any) -> bool:
+        """
+        미리 계산된 결과 Save (일괄 계산 경로에서 Usage, 이후 같은 프레임 조times는 히트)
+
+        Returns:
+            bool: Save 여부 (식별 불가 프레임이면 False)
+        """
+        signature = frame_signature(df)
+        if signature is None:
+            return False
+        key = (symbol, timeframe, kind) + signature
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return True
+
+    def reserve(self, min_entries: int):
+        """최대 항목 수를 최소 min_entries 이상으로 확장 (일괄 계산 결과가 스캔 중 밀려나지 않도록)"""
+        with self._lock:
+            self.max_entries = max(self.max_entries, min_entries)
+
+    def invalidate(self, symbol: Optional[str] = None):
+        """Cache 제거 (symbol 지정 시 해당 Symbol만)"""
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == symbol]:
+                    del self._entries[key]
+
+    def get_stats(self) -> dict:
+        """Cache 통계"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'bypassed': self.bypassed,
+                'hit_rate': (self.hits / total * 100) if total else 0.0
+            }
+
+
+_shared_cache: Optional[IndicatorCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_indicator_cache() -> IndicatorCache:
+    """프로세스 공용 지표 Cache (전략 / DCA 매니저 / Exit 시스템 공유)"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = IndicatorCache()
+    return _shared_cache
@@ -74,6 +74,216 @@ STRATEGY_CONDITION_DETAILS = {
 }
 
 
+# ============================================================================
+# SuperTrend 커널 (전략 / Exit 시스템 공용)
+# ============================================================================
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """numba 미설치 시 no-op 데코레이터"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+def supertrend_bands(df: pd.DataFrame, period: int = 10, multiplier: float = 3.0):
+    """
+    SuperTrend 기본 밴드 계산 (True Range → ATR 단순이동평균 → hl2 ± multiplier × ATR)
+
+    Returns:
+        tuple: (tr, atr, upper_band, lower_band) Series
+    """
+    tr = np.maximum(
+        df['high'] - df['low'],
+        np.maximum(
+            abs(df['high'] - df['close'].shift(1)),
+            abs(df['low'] - df['close'].shift(1))
+        )
+    )
+    atr = tr.rolling(window=period).mean()
+    hl2 = (df['high'] + df['low']) / 2
+    return tr, atr, hl2 + (multiplier * atr), hl2 - (multiplier * atr)
+
+
+@njit(cache=True)
+def _supertrend_loop(close, upper_band, lower_band, start, supertrend, direction):
+    """순차 SuperTrend (NaN 포함 등 벡터 경로를 쓸 수 없을 때의 기준 구현)"""
+    for i in range(start, len(close)):
+        prev_supertrend = supertrend[i - 1] if i > start else upper_band[i]
+        prev_direction = direction[i - 1] if i > start else -1
+
+        if prev_direction == 1:  # 이전이 상승 트렌드
+            if close[i] < lower_band[i]:
+                supertrend[i] = upper_band[i]
+                direction[i] = -1
+            else:
+                # max(lower_band, prev_supertrend)와 동일한 NaN 의미
+                supertrend[i] = prev_supertrend if prev_supertrend > lower_band[i] else lower_band[i]
+                direction[i] = 1
+        else:  # 이전이 하락 트렌드
+            if close[i] > upper_band[i]:
+                supertrend[i] = lower_band[i]
+                direction[i] = 1
+            else:
+                # min(upper_band, prev_supertrend)와 동일한 NaN 의미
+                supertrend[i] = prev_supertrend if prev_supertrend < upper_band[i] else upper_band[i]
+                direction[i] = -1
+
+
+def supertrend_kernel(close, upper_band, lower_band, start: int):
+    """
+    SuperTrend 라인/방향 계산 (start 이전 행은 0)
+
+    방향은 밴드 돌파 신호의 forward-fill(상승 돌파=1, 하락 이탈=-1, 초기값 -1),
+    라인은 구간별 lower_band 누적 최대(상승) / upper_band 누적 최소(하락)로 계산합니다.
+    NaN이 있거나 상·하단 동시 돌파(비정상 밴드)가 있으면 순차 루프로 계산합니다.
+
+    Args:
+        close, upper_band, lower_band: float64 배열
+        start: 계산 Starting 행 (이전 방향 -1, 이전 라인 upper_band[start]로 Starting)
+
+    Returns:
+        tuple: (supertrend float64 배열, direction int64 배열)
+    """
+    close = np.asarray(close, dtype=np.float64)
+    upper_band = np.asarray(upper_band, dtype=np.float64)
+    lower_band = np.asarray(lower_band, dtype=np.float64)
+
+    n = len(close)
+    supertrend = np.zeros(n, dtype=np.float64)
+    direction = np.zeros(n, dtype=np.int64)
+    if start >= n:
+        return supertrend, direction
+
+    c = close[start:]
+    upper = upper_band[start:]
+    lower = lower_band[start:]
+    breakout_up = c > upper
+    breakout_down = c < lower
+
+    if (np.isnan(c).any() or np.isnan(upper).any() or np.isnan(lower).any()
+            or (breakout_up & breakout_down).any()):
+        if HAS_NUMBA:
+            _supertrend_loop(close, upper_band, lower_band, start, supertrend, direction)
+            return supertrend, direction
+        # 순수 Python 루프는 리스트 인덱싱이 NumPy 스칼라 접근보다 빠름
+        st_list, dir_list = supertrend.tolist(), direction.tolist()
+        _supertrend_loop(close.tolist(), upper_band.tolist(), lower_band.tolist(), start, st_list, dir_list)
+        return np.array(st_list, dtype=np.float64), np.array(dir_list, dtype=np.int64)
+
+    # 방향: 마지막 돌파 신호 forward-fill (신호 없으면 초기값 -1)
+    signal = breakout_up.astype(np.int64) - breakout_down.astype(np.int64)
+    idx = np.where(signal != 0, np.arange(len(c)), -1)
+    np.maximum.accumulate(idx, out=idx)
+    dirs = np.where(idx >= 0, signal[np.maximum(idx, 0)], -1)
+
+    # 라인: 방향이 같은 구간마다 누적 최대/최소
+    lines = np.empty(len(c), dtype=np.float64)
+    bounds = np.flatnonzero(np.diff(dirs)) + 1
+    seg_starts = np.concatenate(([0], bounds))
+    seg_ends = np.concatenate((bounds, [len(c)]))
+    for s, e in zip(seg_starts.tolist(), seg_ends.tolist()):
+        if dirs[s] == 1:
+            np.maximum.accumulate(lower[s:e], out=lines[s:e])
+        else:
+            np.minimum.accumulate(upper[s:e], out=lines[s:e])
+
+    supertrend[start:] = lines
+    direction[start:] = dirs
+    return supertrend, direction
+
+
+def add_supertrend_columns(df: pd.DataFrame, period: int = 10, multiplier: float = 3.0,
+                           start: Optional[int] = None, signal_column: bool = False) -> pd.DataFrame:
+    """
+    tr/atr/upper_band/lower_band/supertrend/supertrend_direction 컬럼 Add (in-place)
+
+    Args:
+        start: 라인 계산 Starting 행 (None이면 period)
+        signal_column: True면 supertrend_signal(방향 별칭) 컬럼도 Add
+    """
+    tr, atr, upper_band, lower_band = supertrend_bands(df, period, multiplier)
+    df['tr'] = tr
+    df['atr'] = atr
+    df['upper_band'] = upper_band
+    df['lower_band'] = lower_band
+
+    supertrend, direction = supertrend_kernel(
+        df['close'].to_numpy(dtype=np.float64),
+        upper_band.to_numpy(dtype=np.float64),
+        lower_band.to_numpy(dtype=np.float64),
+        period if start is None else start
+    )
+    df['supertrend'] = supertrend
+    df['supertrend_direction'] = direction  # 1: 상승, -1: 하락
+    if signal_column:
+        df['supertrend_signal'] = direction  # 별칭 (호환성)
+    return df
+
+
+@njit(cache=True)
+def _trailing_supertrend_loop(close, upper_band, lower_band, supertrend, trend):
+    """최종 밴드 추적형 SuperTrend (밴드는 in-place 조정)"""
+    supertrend[0] = lower_band[0]
+    trend[0] = 1
+    for i in range(1, len(close)):
+        # Current 상한선/하한선 조정
+        if not (lower_band[i] > lower_band[i - 1] or close[i - 1] < lower_band[i - 1]):
+            lower_band[i] = lower_band[i - 1]
+        if not (upper_band[i] < upper_band[i - 1] or close[i - 1] > upper_band[i - 1]):
+            upper_band[i] = upper_band[i - 1]
+
+        # 트렌드 결정
+        if trend[i - 1] == 1:  # 상승 트렌드
+            if close[i] <= lower_band[i]:
+                trend[i] = -1
+                supertrend[i] = upper_band[i]
+            else:
+                trend[i] = 1
+                supertrend[i] = lower_band[i]
+        else:  # 하락 트렌드
+            if close[i] >= upper_band[i]:
+                trend[i] = 1
+                supertrend[i] = lower_band[i]
+            else:
+                trend[i] = -1
+                supertrend[i] = upper_band[i]
+
+
+def trailing_supertrend(df: pd.DataFrame, period: int = 10, multiplier: float = 3.0):
+    """
+    Exit 시스템용 SuperTrend (BasicExitSystem / ImprovedDCAPositionManager)
+
+    밴드를 직전 값 기준으로 조정(추적)하는 방식이며 첫 행부터 계산합니다.
+    ATR 워밍업 구간의 NaN 밴드도 Legacy 행 단위 구현과 동일하게 전파됩니다.
+
+    Returns:
+        tuple: (supertrend Series, trend Series) - 둘 다 float64
+    """
+    _, _, upper_band, lower_band = supertrend_bands(df, period, multiplier)
+    n = len(df)
+    supertrend = np.full(n, np.nan, dtype=np.float64)
+    trend = np.full(n, np.nan, dtype=np.float64)
+    if n:
+        close = df['close'].to_numpy(dtype=np.float64)
+        upper = upper_band.to_numpy(dtype=np.float64, copy=True)
+        lower = lower_band.to_numpy(dtype=np.float64, copy=True)
+        if HAS_NUMBA:
+            _trailing_supertrend_loop(close, upper, lower, supertrend, trend)
+        else:
+            # 순수 Python 루프는 리스트 인덱싱이 NumPy 스칼라 접근보다 빠름
+            st_list, trend_list = supertrend.tolist(), trend.tolist()
+            _trailing_supertrend_loop(close.tolist(), upper.tolist(), lower.tolist(), st_list, trend_list)
+            supertrend = np.array(st_list, dtype=np.float64)
+            trend = np.array(trend_list, dtype=np.float64)
+    return pd.Series(supertrend, index=df.index), pd.Series(trend, index=df.index)
+
+
 def calculate_indicators(df: pd.DataFrame, logger=None) -> Optional[pd.DataFrame]:
     """
     기술적 지표 계산
@@ -172,54 +382,8 @@ def calculate_indicators(df: pd.DataFrame, logger=None) -> Optional[pd.DataFrame
         # SuperTrend 지표 Add
         if len(df) >= 20:
             try:
-                # ATR 계산
-                df['tr'] = np.maximum(
-                    df['high'] - df['low'],
-                    np.maximum(
-                        abs(df['high'] - df['close'].shift(1)),
-                        abs(df['low'] - df['close'].shift(1))
-                    )
-                )
-                df['atr'] = df['tr'].rolling(window=10).mean()
-
-                # SuperTrend 계산 (10-3 Settings)
-                hl2 = (df['high'] + df['low']) / 2
-                multiplier = 3.0
-                df['upper_band'] = hl2 + (multiplier * df['atr'])
-                df['lower_band'] = hl2 - (multiplier * df['atr'])
-
-                # SuperTrend 라인과 방향 계산
-                df['supertrend'] = 0.0
-                df['supertrend_direction'] = 0  # 1: 상승, -1: 하락
-                df['supertrend_signal'] = 0    # 별칭 (호환성)
-
-                for i in range(10, len(df)):
-                    prev_close = df['close'].iloc[i-1]
-                    curr_close = df['close'].iloc[i]
-                    upper_band = df['upper_band'].iloc[i]
-                    lower_band = df['lower_band'].iloc[i]
-                    prev_supertrend = df['supertrend'].iloc[i-1] if i > 10 else upper_band
-                    prev_direction = df['supertrend_direction'].iloc[i-1] if i > 10 else -1
-
-                    # SuperTrend 계산 로직
-                    if prev_direction == 1:  # 이전이 상승 트렌드
-                        if curr_close < lower_band:
-                            df.loc[df.index[i], 'supertrend'] = upper_band
-                            df.loc[df.index[i], 'supertrend_direction'] = -1
-                            df.loc[df.index[i], 'supertrend_signal'] = -1
-                        else:
-                            df.loc[df.index[i], 'supertrend'] = max(lower_band, prev_supertrend)
-                            df.loc[df.index[i], 'supertrend_direction'] = 1
-                            df.loc[df.index[i], 'supertrend_signal'] = 1
-                    else:  # 이전이 하락 트렌드
-                        if curr_close > upper_band:
-                            df.loc[df.index[i], 'supertrend'] = lower_band
-                            df.loc[df.index[i], 'supertrend_direction'] = 1
-                            df.loc[df.index[i], 'supertrend_signal'] = 1
-                        else:
-                            df.loc[df.index[i], 'supertrend'] = min(upper_band, prev_supertrend)
-                            df.loc[df.index[i], 'supertrend_direction'] = -1
-                            df.loc[df.index[i], 'supertrend_signal'] = -1
+                # SuperTrend (10-3 Settings, 벡터화 커널)
+                add_supertrend_columns(df, period=10, multiplier=3.0, start=10, signal_column=True)
 
             except Exception as st_error:
                 if logger:
@@ -285,48 +449,8 @@ def calculate_supertrend(df: pd.DataFrame, period: int = 10, multiplier: float =
         if df is None or len(df) < period:
             return None
 
-        # ATR 계산
-        df['tr'] = np.maximum(
-            df['high'] - df['low'],
-            np.maximum(
-                abs(df['high'] - df['close'].shift(1)),
-                abs(df['low'] - df['close'].shift(1))
-            )
-        )
-        df['atr'] = df['tr'].rolling(window=period).mean()
-
-        # SuperTrend 계산
-        hl2 = (df['high'] + df['low']) / 2
-        df['upper_band'] = hl2 + (multiplier * df['atr'])
-        df['lower_band'] = hl2 - (multiplier * df['atr'])
-
-        # SuperTrend 라인 계산
-        df['supertrend'] = 0.0
-        df['supertrend_direction'] = 0  # 1: 상승, -1: 하락
-
-        for i in range(period, len(df)):
-            prev_close = df['close'].iloc[i-1]
-            curr_close = df['close'].iloc[i]
-            upper_band = df['upper_band'].iloc[i]
-            lower_band = df['lower_band'].iloc[i]
-            prev_supertrend = df['supertrend'].iloc[i-1] if i > period else upper_band
-            prev_direction = df['supertrend_direction'].iloc[i-1] if i > period else -1
-
-            # SuperTrend 계산 로직
-            if prev_direction == 1:  # 이전이 상승 트렌드
-                if curr_close < lower_band:
-                    df.loc[df.index[i], 'supertrend'] = upper_band
-                    df.loc[df.index[i], 'supertrend_direction'] = -1
-                else:
-                    df.loc[df.index[i], 'supertrend'] = max(lower_band, prev_supertrend)
-                    df.loc[df.index[i], 'supertrend_direction'] = 1
-            else:  # 이전이 하락 트렌드
-                if curr_close > upper_band:
-                    df.loc[df.index[i], 'supertrend'] = lower_band
-                    df.loc[df.index[i], 'supertrend_direction'] = 1
-                else:
-                    df.loc[df.index[i], 'supertrend'] = min(upper_band, prev_supertrend)
-                    df.loc[df.index[i], 'supertrend_direction'] = -1
+        # SuperTrend 계산 (벡터화 커널)
+        add_supertrend_columns(df, period=period, multiplier=multiplier)
 
         return df
 
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+Kline Gap Repairer
+WebSocket ingest 중 탐지된 누락 캔들 구간을 REST로 보충하는 백그라운드 큐
+
+흐름:
+- 링 버퍼 upsert가 직전 캔들과의 누락 구간 (since, count)을 반환 → 매니저가 enqueue
+- 워커 스레드가 구간별로 since=구간 Starting, limit=구간 캔들 수 요청 (공용 Rate Limiter 벌크 레인 승인 후)
+- 매니저 merge_klines로 Time 순 병합 (Symbol lock) → 1m이면 상위 Timeframe 재Create
+- 같은 구간 중복 enqueue는 무시, Failed 시 지연 후 재Attempt (max_retries 초과 시 포기, 버퍼 health에 남음)
+
+재Connections 직후 여러 Symbol에서 한꺼번에 탐지돼도 벌크 레인 budget 안에서 순서대로 처리되므로
+주문 / 계좌 조회 레인을 잠식하지 않습니다.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from binance_rate_limiter import PRIORITY_BULK, RateLimitedExchange, get_rate_limiter
+from kline_store import timeframe_to_ms
+
+
+class KlineGapRepairer:
+    """누락 캔들 구간 보충 큐 (워커 스레드 1count)"""
+
+    KLINES_ENDPOINT = '/fapi/v1/klines'
+    MAX_KLINES_PER_REQUEST = 1500  # 선물 fetch_ohlcv 1times 최대 캔들 수
+
+    def __init__(self, manager, exchange=None, fetch: Optional[Callable] = None, rate_limiter=None,
+                 logger=None, request_timeout: float = 90, max_retries: int = 3, retry_delay: float = 5.0):
+        """
+        Args:
+            manager: merge_klines(symbol, timeframe, timestamps, ohlcv)를 제공하는 WebSocket 매니저
+            exchange: ccxt exchange 객체 (fetch 미지정 시 Usage)
+            fetch: fetch(symbol, timeframe, limit, since) → OHLCV 행 / DataFrame (승인 포함, 지정 시 exchange 대신)
+            rate_limiter: 벌크 레인 승인 Limiter (None이면 첫 요청 시 공용 Limiter)
+            logger: 로거 인스턴스
+            request_timeout: 벌크 레인 budget 대기 상한 (초)
+            max_retries: 구간당 재Attempt 횟수
+            retry_delay: 재Attempt 지연 (초, Attempt 횟수에 비례)
+        """
+        if exchange is None and fetch is None:
+            raise ValueError("exchange or fetch is required")
+
+        self.manager = manager
+        self.exchange = exchange
+        self.fetch = fetch
+        self.rate_limiter = rate_limiter
+        self.logger = logger or logging.getLogger(__name__)
+        self.request_timeout = request_timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+        self._queue: 'queue.Queue[Tuple[str, str, int, int, int]]' = queue.Queue()
+        self._pending: Dict[Tuple[str, str, int], int] = {}  # (symbol, timeframe, since) -> count
+        self._pending_lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        self.stats = {
+            'queued': 0,
+            'duplicates': 0,     # 이미 대기 중인 구간 재탐지
+            'requests': 0,
+            'repaired': 0,       # 병합 Complete한 구간 수
+            'candles': 0,        # 병합한 캔들 수
+            'retries': 0,
+            'failed': 0,         # max_retries 초과로 포기한 구간 수
+        }
+
+    def start(self):
+        """워커 스레드 Starting (이미 Execute 중이면 무시)"""
+        if self._worker and self._worker.is_alive():
+            return
+        self._stop.clear()
+        self._worker = threading.Thread(target=self._run, name='KlineGapRepair', daemon=True)
+        self._worker.start()
+
+    def stop(self, timeout: float = 5):
+        """워커 스레드 Terminate (대기 중인 구간은 버림)"""
+        self._stop.set()
+        self._queue.put(None)
+        if self._worker:
+            self._worker.join(timeout=timeout)
+            self._worker = None
+
+    def enqueue(self, symbol: str, timeframe: str, since: int, count: int) -> bool:
+        """
+        누락 구간 보충 요청 (같은 구간이 대기 중이면 무시)
+
+        Returns:
+            bool: 새로 큐에 넣었으면 True
+        """
+        key = (symbol, timeframe, int(since))
+        with self._pending_lock:
+            if key in self._pending:
+                self.stats['duplicates'] += 1
+                return False
+            self._pending[key] = int(count)
+            self.stats['queued'] += 1
+        self._queue.put((symbol, timeframe, int(since), int(count), 0))
+        if not self._stop.is_set():
+            self.start()
+        return True
+
+    def pending(self, symbol: Optional[str] = None) -> int:
+        """대기 / 처리 중인 구간 수 (symbol 지정 시 해당 Symbol만)"""
+        with self._pending_lock:
+            if symbol is None:
+                return len(self._pending)
+            return sum(1 for key in self._pending if key[0] == symbol)
+
+    def wait_idle(self, timeout: float = 10) -> bool:
+        """대기 구간이 모두 처리될 때까지 대기 (Test / Terminate용)"""
+        deadline = time.time() + timeout
+        while self.pending():
+            if time.time() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def _run(self):
+        while not self._stop.is_set():
+            item = self._queue.get()
+            if item is None:
+                continue
+            symbol, timeframe, since, count, attempts = item
+            try:
+                merged = self._repair(symbol, timeframe, since, count)
+                self.stats['repaired'] += 1
+                self.stats['candles'] += merged
+                self.logger.info(f"🩹 {symbol} {timeframe} 누락 캔들 보충 Complete: {merged}count")
+            except Exception as e:
+                if attempts + 1 < self.max_retries and not self._stop.is_set():
+                    self.stats['retries'] += 1
+                    self.logger.warning(f"⚠️ {symbol} {timeframe} 누락 구간 보충 Failed ({attempts + 1}times): {e}")
+                    self._stop.wait(self.retry_delay * (attempts + 1))
+                    self._queue.put((symbol, timeframe, since, count, attempts + 1))
+                    continue
+                self.stats['failed'] += 1
+                self.logger.error(f"❌ {symbol} {timeframe} 누락 구간 보충 포기: {e}")
+            with self._pending_lock:
+                self._pending.pop((symbol, timeframe, since), None)
+
+    def _repair(self, symbol: str, timeframe: str, since: int, count: int) -> int:
+        """구간 [since, since + count) 요청 후 매니저 버퍼에 병합 → 병합 캔들 수"""
+        timeframe_ms = timeframe_to_ms(timeframe)
+        frames = []
+        for offset in range(0, count, self.MAX_KLINES_PER_REQUEST):
+            limit = min(count - offset, self.MAX_KLINES_PER_REQUEST)
+            rows = self._fetch(symbol, timeframe, limit, since + offset * timeframe_ms)
+            self.stats['requests'] += 1
+            rows = np.asarray(rows, dtype=np.float64).reshape(-1, 6)
+            if len(rows):
+                frames.append(rows)
+        if not frames:
+            return 0
+
+        rows = np.concatenate(frames) if len(frames) > 1 else frames[0]
+        return self.manager.merge_klines(symbol, timeframe, rows[:, 0].astype(np.int64), rows[:, 1:])
+
+    def _fetch(self, symbol: str, timeframe: str, limit: int, since: int):
+        if self.fetch is not None:
+            return self.fetch(symbol, timeframe, limit, since)
+
+        if self.rate_limiter is None:
+            self.rate_limiter = get_rate_limiter(self.logger)
+        if not self.rate_limiter.acquire(self.KLINES_ENDPOINT, {'symbol': symbol, 'limit': limit},
+                                         PRIORITY_BULK, timeout=self.request_timeout):
+            raise Exception(f"Rate limit budget 대기 초과: {symbol} {timeframe}")
+
+        # 승인은 위에서 받았으므로 래퍼의 비차단 승인 / Cache를 거치지 않고 원본 거래소 호출
+        exchange = self.exchange.exchange if isinstance(self.exchange, RateLimitedExchange) else self.exchange
+        return exchange.fetch_ohlcv(symbol, timeframe, since=since, limit=limit)
+
+    def get_stats(self) -> dict:
+        return {**self.stats, 'pending': self.pending()}
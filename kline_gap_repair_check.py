@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+누락 캔들 탐지 / 보충 큐 / 버퍼 health Verification
+
+점검 항목:
+1. 링 버퍼: upsert 시 누락 구간 반환, health (gap_count / missing_candles / max_gap), merge 후 구간 해소, 윈도우 밖 구간 제외
+2. ingest: 1minute candles 스트림이 건너뛰면 매니저가 탐지 (보충 비Active 상태에서도 health에 반영)
+3. 보충 큐: since=구간 Starting, limit=구간 캔들 수 요청 (벌크 레인 승인) → Time 순 병합,
+   결과가 끊김 없는 스트림과 동일 (1m + 3m / 5m / 15m 재Create + 이후 ingest 이어받기)
+4. 중복 구간 enqueue 무시, 요청 Failed 시 재Attempt 후 포기 (health에 남음)
+5. 스캐너: 누락이 큰 Symbol 제외, 작은 Symbol은 후순위
+
+Usage:
+    python kline_gap_repair_check.py [--minutes 300] [--gap 7]
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from binance_rate_limiter import BinanceRateLimiter
+from binance_websocket_kline_manager import BinanceWebSocketKlineManager
+from kline_ring_buffer import KlineRingBuffer
+from optimized_websocket_scanner import OptimizedWebSocketScanner, SymbolData
+
+MINUTE_MS = 60_000
+
+
+class FakeExchange:
+    """1minute candles를 시각으로부터 결정적으로 Create (since / limit 범위만 반환)"""
+
+    def __init__(self, fail_times: int = 0):
+        self.calls = []
+        self.fail_times = fail_times
+
+    @staticmethod
+    def minute_candle(symbol: str, ts: int) -> list:
+        seed = sum(map(ord, symbol))
+        base = 100 + ((ts // MINUTE_MS) * 7 + seed) % 89
+        return [ts, base, base + 1 + (ts // MINUTE_MS) % 3, base - 1, base + 0.5, float(seed % 13 + (ts // MINUTE_MS) % 5)]
+
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        self.calls.append((symbol, timeframe, since, limit))
+        if self.fail_times:
+            self.fail_times -= 1
+            raise Exception("HTTP 503")
+        return [self.minute_candle(symbol, since + i * MINUTE_MS) for i in range(limit)]
+
+
+def kline_message(symbol: str, candle: list, is_final: bool = True) -> dict:
+    ts, open_, high, low, close, volume = candle
+    return {'e': 'kline', 's': symbol, 'k': {
+        't': ts, 'T': ts + MINUTE_MS - 1, 'o': str(open_), 'h': str(high), 'l': str(low),
+        'c': str(close), 'v': str(volume), 'x': is_final}}
+
+
+def feed(manager: BinanceWebSocketKlineManager, symbol: str, timestamps):
+    callback = manager._kline_callback_wrapper(symbol)
+    for ts in timestamps:
+        callback(kline_message(symbol, FakeExchange.minute_candle(symbol, ts)))
+
+
+def check(results: list, name: str, passed: bool, detail: str = ''):
+    results.append(passed)
+    print(f"  {'✅' if passed else '❌'} {name}" + (f" - {detail}" if detail else ''))
+
+
+def check_ring_buffer(results: list):
+    print("\n[1] 링 버퍼 누락 구간 추적")
+    buffer = KlineRingBuffer(10, interval_ms=MINUTE_MS)
+    gaps = [buffer.upsert(ts * MINUTE_MS, 1, 1, 1, 1, 1) for ts in (0, 1, 1, 5, 6, 8)]
+    check(results, "upsert 누락 구간 반환", gaps == [None, None, None, (2 * MINUTE_MS, 3), None, (7 * MINUTE_MS, 1)],
+          f"{[g for g in gaps if g]}")
+    health = buffer.health()
+    check(results, "health", (health['gap_count'], health['missing_candles'], health['max_gap'],
+                              health['gaps_detected']) == (2, 4, 3, 2), f"{health}")
+
+    buffer.merge([2 * MINUTE_MS, 3 * MINUTE_MS, 4 * MINUTE_MS], np.full((3, 5), 2.0))
+    health = buffer.health()
+    timestamps = (buffer.snapshot(0)['timestamp'] // MINUTE_MS).tolist()
+    check(results, "merge 후 Time 순 / 구간 해소",
+          timestamps == [0, 1, 2, 3, 4, 5, 6, 8] and health['gap_count'] == 1,
+          f"{timestamps}, 남은 구간 {buffer.gaps()}")
+
+    for ts in range(9, 18):
+        buffer.upsert(ts * MINUTE_MS, 1, 1, 1, 1, 1)
+    check(results, "윈도우 밖으로 밀려난 구간 제외", buffer.health()['gap_count'] == 0,
+          f"보관 {buffer.snapshot(0)['timestamp'][0] // MINUTE_MS}~{buffer.last_timestamp // MINUTE_MS}")
+
+
+def check_repair(results: list, logger, minutes: int, gap: int):
+    print(f"\n[2] ingest 탐지 / [3] 보충 큐 ({minutes}분 스트림, {gap}분 누락)")
+    symbol = 'AAAUSDT'
+    t0 = (int(time.time() * 1000) // MINUTE_MS - minutes - 30) // 15 * 15 * MINUTE_MS
+    stream = [t0 + i * MINUTE_MS for i in range(minutes)]
+    cut = minutes // 2 + 1
+    missing = stream[cut:cut + gap]
+    received = stream[:cut] + stream[cut + gap:]
+    after = [t0 + i * MINUTE_MS for i in range(minutes, minutes + 20)]
+
+    reference = BinanceWebSocketKlineManager(callback=None, logger=logger)
+    feed(reference, symbol, stream)
+
+    manager = BinanceWebSocketKlineManager(callback=None, logger=logger)
+    feed(manager, symbol, received)
+    health = manager.get_buffer_health('AAA/USDT:USDT')
+    check(results, "ingest 누락 탐지 (보충 비Active)", not health['complete'] and health['max_gap'] == gap
+          and health['missing_candles'] == gap and manager.gap_count == 1, f"{health['timeframes']['1m']}")
+    check(results, "health report", list(manager.get_health_report()) == [symbol])
+
+    exchange = FakeExchange()
+    limiter = BinanceRateLimiter(logger)
+    repairer = manager.enable_gap_repair(exchange=exchange, rate_limiter=limiter)
+    idle = repairer.wait_idle(10)
+    check(results, "since=구간 Starting, limit=구간 캔들 수 1times 요청",
+          idle and exchange.calls == [(symbol, '1m', missing[0], gap)], f"{exchange.calls}")
+    check(results, "벌크 레인 승인", limiter.get_used_weight() >= 1, f"weight {limiter.get_used_weight()}")
+
+    feed(reference, symbol, after)
+    feed(manager, symbol, after)
+    for timeframe in ('1m', '3m', '5m', '15m'):
+        got = manager.kline_buffer[f"{symbol}_{timeframe}"].snapshot(0)
+        want = reference.kline_buffer[f"{symbol}_{timeframe}"].snapshot(0)
+        same = (np.array_equal(got['timestamp'], want['timestamp'])
+                and np.allclose(got['ohlcv'], want['ohlcv']))
+        check(results, f"{timeframe} = 끊김 없는 스트림", same, f"{len(got['timestamp'])}봉")
+    health = manager.get_buffer_health(symbol)
+    check(results, "보충 후 complete", health['complete'] and health['pending_repairs'] == 0,
+          f"{repairer.get_stats()}")
+    repairer.stop()
+
+
+def check_queue(results: list, logger):
+    print("\n[4] 중복 / Failed 처리")
+    symbol = 'BBBUSDT'
+    t0 = (int(time.time() * 1000) // MINUTE_MS - 100) * MINUTE_MS
+    manager = BinanceWebSocketKlineManager(callback=None, logger=logger)
+    exchange = FakeExchange(fail_times=10)
+    repairer = manager.enable_gap_repair(exchange=exchange, rate_limiter=BinanceRateLimiter(logger))
+    repairer.retry_delay = 0.01
+    repairer.stop()  # 큐에 쌓인 상태로 중복 확인
+
+    feed(manager, symbol, [t0, t0 + 4 * MINUTE_MS])
+    duplicate = repairer.enqueue(symbol, '1m', t0 + MINUTE_MS, 3)
+    check(results, "같은 구간 중복 enqueue 무시", not duplicate and repairer.pending(symbol) == 1,
+          f"pending {repairer.pending(symbol)}, duplicates {repairer.stats['duplicates']}")
+
+    repairer._stop.clear()
+    repairer.start()
+    idle = repairer.wait_idle(10)
+    check(results, "재Attempt 후 포기", idle and len(exchange.calls) == repairer.max_retries
+          and repairer.stats['failed'] == 1, f"요청 {len(exchange.calls)}times, {repairer.get_stats()}")
+    check(results, "포기한 구간은 health에 남음", manager.get_buffer_health(symbol)['gap_count'] == 1)
+    repairer.stop()
+
+
+def check_scanner(results: list, logger):
+    print("\n[5] 스캐너 health Filtering")
+    t0 = (int(time.time() * 1000) // MINUTE_MS - 100) * MINUTE_MS
+    manager = BinanceWebSocketKlineManager(callback=None, logger=logger)
+    feed(manager, 'AAAUSDT', [t0 + i * MINUTE_MS for i in range(20)])
+    feed(manager, 'BBBUSDT', [t0 + i * MINUTE_MS for i in range(20) if i != 10])
+    feed(manager, 'CCCUSDT', [t0 + i * MINUTE_MS for i in range(20) if not 5 <= i < 15])
+
+    class Strategy:
+        ws_kline_manager = manager
+
+    scanner = OptimizedWebSocketScanner(Strategy())
+    candles = [{'close': 1.0}] * 300
+    for symbol, change in (('AAAUSDT', 2.0), ('BBBUSDT', 9.0), ('CCCUSDT', 5.0)):
+        scanner.symbol_data[symbol] = SymbolData(symbol, 1.0, change, 0, candles, candles, candles, candles, [],
+                                                 time.time())
+    ready = scanner._get_scan_ready_symbols()
+    check(results, "누락 큰 Symbol 제외 / 누락 있는 Symbol 후순위", ready == ['AAAUSDT', 'BBBUSDT'], f"{ready}")
+    status = scanner.get_data_status()
+    check(results, "get_data_status 누락 Symbol", status['incomplete_symbols'] == {'BBBUSDT': 1, 'CCCUSDT': 10},
+          f"{status['incomplete_symbols']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='누락 캔들 탐지 / 보충 Verification')
+    parser.add_argument('--minutes', type=int, default=300, help='스트림 길이 (분)')
+    parser.add_argument('--gap', type=int, default=7, help='누락 캔들 수')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    logger = logging.getLogger('kline_gap_repair_check')
+
+    results = []
+    check_ring_buffer(results)
+    check_repair(results, logger, args.minutes, args.gap)
+    check_queue(results, logger)
+    check_scanner(results, logger)
+
+    print()
+    if all(results):
+        print(f"✅ 전체 통과 ({len(results)} 항목)")
+    else:
+        print(f"❌ Failed {results.count(False)} / {len(results)} 항목")
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
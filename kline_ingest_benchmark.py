@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Kline Ingest 마이크로벤치마크
+WebSocket 콜백 ingest 처리량을 동시 스캔(reader) 스레드 수별로 측정
+
+측정 항목:
+1. Ingest 처리량 (messages/s) - reader 0/1/4/15count
+2. Reader 조times 처리량 (get_kline_buffer calls/s)
+3. 스냅샷 일관성 (timestamp 단조 증가 Verification)
+
+Usage:
+    python kline_ingest_benchmark.py [--symbols 150] [--messages 60000] [--limit 500]
+"""
+
+import argparse
+import logging
+import threading
+import time
+
+import numpy as np
+
+from binance_websocket_kline_manager import BinanceWebSocketKlineManager
+
+
+def _make_message(symbol: str, minute: int, tick: int) -> dict:
+    """합성 kline Message Create (1minute candles당 여러 tick)"""
+    timestamp = 1_700_000_000_000 + minute * 60_000
+    price = 100.0 + (minute % 50) + tick * 0.01
+    return {
+        'e': 'kline',
+        's': symbol,
+        'k': {
+            't': timestamp,
+            'T': timestamp + 59_999,
+            'o': price,
+            'h': price + 0.5,
+            'l': price - 0.5,
+            'c': price + 0.1,
+            'v': 10.0 + tick,
+            'x': tick == 3
+        }
+    }
+
+
+def run_benchmark(n_symbols: int, n_messages: int, n_readers: int, limit: int) -> dict:
+    manager = BinanceWebSocketKlineManager(callback=None, logger=logging.getLogger('bench'))
+    symbols = [f"SYM{i}USDT" for i in range(n_symbols)]
+    callbacks = {symbol: manager._kline_callback_wrapper(symbol) for symbol in symbols}
+
+    # 버퍼가 비어 있지 않도록 1times 워밍업
+    for symbol in symbols:
+        callbacks[symbol](_make_message(symbol, 0, 0))
+
+    stop = threading.Event()
+    reads = [0] * n_readers
+    inconsistent = [0] * n_readers
+
+    def reader(idx: int):
+        i = 0
+        while not stop.is_set():
+            df = manager.get_kline_buffer(symbols[i % n_symbols], '1m', limit)
+            if len(df) > 1:
+                ts = df['timestamp'].to_numpy().astype('int64')
+                if np.any(np.diff(ts) <= 0):
+                    inconsistent[idx] += 1
+            reads[idx] += 1
+            i += 1
+
+    threads = [threading.Thread(target=reader, args=(i,), daemon=True) for i in range(n_readers)]
+    for thread in threads:
+        thread.start()
+
+    start = time.perf_counter()
+    for n in range(n_messages):
+        symbol = symbols[n % n_symbols]
+        step = n // n_symbols
+        callbacks[symbol](_make_message(symbol, 1 + step // 4, step % 4))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return {
+        'readers': n_readers,
+        'ingest_per_sec': n_messages / elapsed,
+        'reads_per_sec': sum(reads) / elapsed,
+        'inconsistent_reads': sum(inconsistent),
+        'errors': manager.error_count
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Kline ingest microbenchmark')
+    parser.add_argument('--symbols', type=int, default=150)
+    parser.add_argument('--messages', type=int, default=60000)
+    parser.add_argument('--limit', type=int, default=500)
+    parser.add_argument('--readers', type=int, nargs='+', default=[0, 1, 4, 15])
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    print(f"📊 Kline ingest 벤치마크: {args.symbols} symbols, {args.messages} messages, limit={args.limit}")
+    print(f"{'readers':>8} {'ingest msg/s':>14} {'reads/s':>10} {'inconsistent':>13} {'errors':>7}")
+    for n_readers in args.readers:
+        result = run_benchmark(args.symbols, args.messages, n_readers, args.limit)
+        print(f"{result['readers']:>8} {result['ingest_per_sec']:>14,.0f} {result['reads_per_sec']:>10,.0f} "
+              f"{result['inconsistent_reads']:>13} {result['errors']:>7}")
+
+
+if __name__ == "__main__":
+    main()
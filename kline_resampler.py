@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+Kline Resampler
+1minute candles 스트림으로부터 상위 Timeframe 캔들을 증분 집계하는 공용 엔진
+
+특징:
+- 1minute candles Update 1times당 Timeframe별 O(1) (그룹 전체 재계산 없음)
+- 같은 1minute candles의 반복 Update에도 Trade량 중복 합산 없음
+  (확정된 1minute candles Trade량 합 + Progress 중인 1minute candles Trade량으로 분리 관리)
+- 같은 1minute candles을 여러 경로에서 중복 입력해도 결과 동일 (멱등)
+- 전역 lock 없음: Symbol별 Status가 분리되어 있으므로 호출 측이 같은 Symbol의
+  update만 직렬화하면 됨 (BinanceWebSocketKlineManager는 Symbol lock 보유 상태에서 호출)
+
+Usage처:
+- BinanceWebSocketKlineManager._generate_higher_timeframes (링 버퍼)
+- OneMinuteSurgeEntryStrategy._generate_higher_timeframes_from_1m (리스트 버퍼)
+- 4Time봉 Filtering (get_ohlcv_data('4h') → WebSocket 링 버퍼)
+- resample_ohlcv: 1minute candles 배열 일괄 집계 (부트스트랩 / 누락 구간 보충 시 상위 Timeframe 재Create)
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+# 기본 상위 Timeframe (분 단위)
+DEFAULT_TIMEFRAME_MINUTES = {
+    '3m': 3,
+    '5m': 5,
+    '15m': 15,
+    '1h': 60,
+    '4h': 240,
+    '1d': 1440  # 1일 = 1440분
+}
+
+
+def align_timestamp(timestamp: int, minutes: int) -> int:
+    """타임스탬프(ms)를 지정된 분 단위 시작 Time으로 정렬"""
+    bucket_ms = minutes * 60 * 1000
+    return (timestamp // bucket_ms) * bucket_ms
+
+
+def resample_ohlcv(timestamps, ohlcv, minutes: int, is_final=None) -> Dict[str, np.ndarray]:
+    """
+    1minute candles 배열 → 상위 Timeframe 캔들 배열 (벡터화 일괄 집계)
+
+    Args:
+        timestamps: 1minute candles Starting Time 배열 (ms, 오름차순)
+        ohlcv: (N, 5) open/high/low/close/volume 배열
+        minutes: 상위 Timeframe (분)
+        is_final: 1minute candles 확정 여부 배열 (None이면 마지막 1minute candles만 미확정)
+
+    Returns:
+        dict: KlineRingBuffer.snapshot 형식 (timestamp / close_time / is_final / ohlcv)
+              첫 구간이 중간부터 시작하면 (open / Trade량 불완전) 제외
+              is_final은 구간의 마지막 1minute candles이 확정된 경우에만 True (KlineResampler.update와 동일)
+    """
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    ohlcv = np.asarray(ohlcv, dtype=np.float64).reshape(-1, 5)
+    if is_final is None:
+        is_final = np.ones(len(timestamps), dtype=np.bool_)
+        if len(is_final):
+            is_final[-1] = False
+    is_final = np.asarray(is_final, dtype=np.bool_)
+
+    bucket_ms = minutes * 60 * 1000
+    buckets = timestamps // bucket_ms * bucket_ms
+    if len(buckets) and timestamps[0] != buckets[0]:
+        start = int(np.searchsorted(buckets, buckets[0], side='right'))
+        timestamps, ohlcv, is_final, buckets = timestamps[start:], ohlcv[start:], is_final[start:], buckets[start:]
+    if len(buckets) == 0:
+        return {'timestamp': np.zeros(0, dtype=np.int64), 'close_time': np.zeros(0, dtype=np.int64),
+                'is_final': np.zeros(0, dtype=np.bool_), 'ohlcv': np.zeros((0, 5))}
+
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(buckets)] - 1
+    bucket_ts = buckets[starts]
+    result = np.column_stack([
+        ohlcv[starts, 0],
+        np.maximum.reduceat(ohlcv[:, 1], starts),
+        np.minimum.reduceat(ohlcv[:, 2], starts),
+        ohlcv[ends, 3],
+        np.add.reduceat(ohlcv[:, 4], starts),
+    ])
+    return {
+        'timestamp': bucket_ts,
+        'close_time': bucket_ts + bucket_ms - 1,
+        'is_final': is_final[ends] & (timestamps[ends] + 60 * 1000 >= bucket_ts + bucket_ms),
+        'ohlcv': result,
+    }
+
+
+class _BucketState:
+    """Symbol-Timeframe 1count의 Progress 중인 상위 캔들 Status"""
+
+    __slots__ = ('timestamp', 'open', 'high', 'low', 'close',
+                 'closed_volume', 'minute_timestamp', 'minute_volume')
+
+    def __init__(self, timestamp: int, open_: float, high: float, low: float, close: float,
+                 closed_volume: float, minute_timestamp: int, minute_volume: float):
+        self.timestamp = timestamp
+        self.open = open_
+        self.high = high
+        self.low = low
+        self.close = close
+        self.closed_volume = closed_volume        # 이전 1minute candles들의 Trade량 합
+        self.minute_timestamp = minute_timestamp  # Progress 중인 1minute candles Starting Time
+        self.minute_volume = minute_volume        # Progress 중인 1minute candles의 Cumulative Trade량
+
+    @property
+    def volume(self) -> float:
+        return self.closed_volume + self.minute_volume
+
+
+class KlineResampler:
+    """1minute candles → 상위 Timeframe 증분 집계 엔진"""
+
+    def __init__(self, timeframe_minutes: Optional[Dict[str, int]] = None,
+                 seed_provider: Optional[Callable] = None):
+        """
+        Args:
+            timeframe_minutes: {Timeframe: 분} (None이면 DEFAULT_TIMEFRAME_MINUTES)
+            seed_provider: Status가 없는 (symbol, timeframe)의 첫 Update 시 호출되는 함수
+                (symbol, timeframe, bucket_timestamp) -> (candle dict, 1minute candles dict) 또는 None
+                REST 부트스트랩으로 채워진 미완성 상위 캔들을 이어서 집계할 때 Usage
+        """
+        self.timeframe_minutes = dict(timeframe_minutes or DEFAULT_TIMEFRAME_MINUTES)
+        self.seed_provider = seed_provider
+
+        # (symbol, timeframe) -> _BucketState
+        self._states: Dict[Tuple[str, str], _BucketState] = {}
+
+    @property
+    def timeframes(self) -> List[str]:
+        return list(self.timeframe_minutes.keys())
+
+    def reset(self, symbol: Optional[str] = None):
+        """집계 Status Initialize (symbol 지정 시 해당 Symbol만)"""
+        if symbol is None:
+            self._states.clear()
+        else:
+            for key in [k for k in list(self._states) if k[0] == symbol]:
+                self._states.pop(key, None)
+
+    def seed(self, symbol: str, timeframe: str, candle: dict, minute_candle: Optional[dict] = None):
+        """
+        Legacy 상위 캔들(REST 부트스트랩 등)로 집계 Status 지정
+
+        Args:
+            candle: 상위 캔들 dict (timestamp/open/high/low/close/volume)
+            minute_candle: candle에 이미 포함된 마지막 1minute candles dict (Trade량 중복 방지용)
+        """
+        self._states[(symbol, timeframe)] = self._state_from_seed(candle, minute_candle)
+
+    @staticmethod
+    def _state_from_seed(candle: dict, minute_candle: Optional[dict]) -> _BucketState:
+        minute_timestamp = 0
+        minute_volume = 0.0
+        if minute_candle and minute_candle.get('timestamp', 0) >= candle['timestamp']:
+            minute_timestamp = int(minute_candle['timestamp'])
+            minute_volume = float(minute_candle['volume'])
+
+        return _BucketState(
+            int(candle['timestamp']),
+            float(candle['open']),
+            float(candle['high']),
+            float(candle['low']),
+            float(candle['close']),
+            max(float(candle['volume']) - minute_volume, 0.0),
+            minute_timestamp,
+            minute_volume
+        )
+
+    def update(self, symbol: str, timestamp: int, open_: float, high: float, low: float,
+               close: float, volume: float, is_final: bool = False) -> List[Tuple[str, tuple]]:
+        """
+        1minute candles 1count(New 또는 Progress 중 Update) 반영
+
+        Args:
+            is_final: 입력 1minute candles 확정 여부
+
+        Returns:
+            list: [(timeframe, (timestamp, open, high, low, close, volume, is_final, close_time)), ...]
+                  각 상위 Timeframe의 Current 캔들 (같은 timestamp면 덮어쓰기 대상)
+                  is_final은 구간의 마지막 1minute candles이 확정된 경우에만 True
+        """
+        results = []
+        for timeframe, minutes in self.timeframe_minutes.items():
+            bucket_timestamp = align_timestamp(timestamp, minutes)
+            bucket_end = bucket_timestamp + minutes * 60 * 1000
+            key = (symbol, timeframe)
+            state = self._states.get(key)
+
+            if state is None and self.seed_provider is not None:
+                seeded = self.seed_provider(symbol, timeframe, bucket_timestamp)
+                if seeded:
+                    state = self._state_from_seed(*seeded)
+                    self._states[key] = state
+
+            if state is not None and bucket_timestamp < state.timestamp:
+                # 이미 지나간 구간의 늦은 1minute candles → 무시
+                continue
+
+            if state is None or state.timestamp != bucket_timestamp:
+                # New 상위 캔들 Starting
+                state = _BucketState(bucket_timestamp, open_, high, low, close,
+                                     0.0, timestamp, volume)
+                self._states[key] = state
+            else:
+                if timestamp > state.minute_timestamp:
+                    # 다음 1minute candles으로 넘어감 → 이전 1minute candles Trade량 확정
+                    state.closed_volume += state.minute_volume
+                    state.minute_timestamp = timestamp
+                    state.minute_volume = volume
+                elif timestamp == state.minute_timestamp:
+                    # 같은 1minute candles Update → Cumulative Trade량 교체 (중복 합산 없음)
+                    state.minute_volume = volume
+                else:
+                    # 이미 지나간 1minute candles (순서 역전) → 고가/저가만 반영
+                    pass
+
+                if high > state.high:
+                    state.high = high
+                if low < state.low:
+                    state.low = low
+                if timestamp >= state.minute_timestamp:
+                    state.close = close
+
+            results.append((timeframe, (
+                state.timestamp, state.open, state.high, state.low, state.close, state.volume,
+                bool(is_final) and timestamp + 60 * 1000 >= bucket_end,
+                bucket_end - 1
+            )))
+        return results
+
+    def update_from_kline(self, symbol: str, kline: dict) -> List[Tuple[str, tuple]]:
+        """Binance kline payload('k') 형식 입력용 헬퍼"""
+        return self.update(
+            symbol,
+            int(kline.get('t', 0)),
+            float(kline.get('o', 0)),
+            float(kline.get('h', 0)),
+            float(kline.get('l', 0)),
+            float(kline.get('c', 0)),
+            float(kline.get('v', 0)),
+            bool(kline.get('x', False))
+        )
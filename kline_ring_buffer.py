@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+"""
+Kline Ring Buffer
+Symbol-Timeframe별 컬럼형(NumPy) 캔들 Save소
+
+특징:
+- 사전 할당된 고정 Size 배열 (캔들마다 dict 객체 Create 없음)
+- append / update_last O(1) (리스트 슬라이싱 trim 없음)
+- 최근 N봉 윈도우를 복사 없이 연속 view로 반환 (이중 Save 방식)
+- 얇은 DataFrame view 및 seqlock 기반 일관 스냅샷 제공
+- 캔들 간격(interval_ms) 지정 시 누락 구간 추적 (ingest 시 탐지, merge / load 시 재계산)
+
+구조:
+- 각 캔들을 논리 위치 p와 p + capacity 두 곳에 Save
+- 따라서 최근 N봉(N <= capacity)은 항상 하나의 연속 슬라이스
+
+동시성 (단일 writer / 다중 reader):
+- writer는 기록 전후로 시퀀스 번호를 1씩 증가 (홀수 = 기록 중)
+- reader는 lock 없이 복사 후 시퀀스가 그대로인지 Confirm, 바뀌었으면 재Attempt
+- 따라서 스캔 스레드가 많아도 ingest 스레드는 절대 대기하지 않음
+- writer가 여러 스레드인 경우 호출 측에서 Symbol 단위 lock으로 직렬화 Required
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# OHLCV 컬럼 순서 (self._ohlcv 2D 배열의 열 순서)
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+# DataFrame 컬럼 순서 (Legacy get_kline_buffer와 동일)
+DATAFRAME_COLUMNS = ['timestamp'] + OHLCV_COLUMNS
+
+
+class KlineRingBuffer:
+    """Symbol-Timeframe 1count에 대한 고정 Size 컬럼형 캔들 버퍼"""
+
+    def __init__(self, capacity: int = 1500, interval_ms: int = 0):
+        """
+        Args:
+            capacity: 최대 보관 캔들 수
+            interval_ms: 캔들 간격 (ms, 0이면 누락 구간 추적 안 함)
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive: {capacity}")
+
+        self.capacity = capacity
+
+        # 이중 Save 영역 (2 × capacity)
+        self._timestamp = np.zeros(capacity * 2, dtype=np.int64)
+        self._close_time = np.zeros(capacity * 2, dtype=np.int64)
+        self._ohlcv = np.zeros((capacity * 2, len(OHLCV_COLUMNS)), dtype=np.float64)
+        self._is_final = np.zeros(capacity * 2, dtype=np.bool_)
+
+        # 마지막으로 기록된 논리 위치 (0 ~ capacity-1)와 보관 수
+        self._head = -1
+        self._size = 0
+
+        # seqlock 시퀀스 (홀수 = 기록 중)
+        self._seq = 0
+
+        # 누락 구간 ((since, count), ...) - writer가 통째로 교체하므로 reader는 lock 없이 조times
+        self.interval_ms = int(interval_ms)
+        self._gaps: Tuple[Tuple[int, int], ...] = ()
+        self.gaps_detected = 0  # ingest 중 탐지한 누락 구간 누적 수
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    @property
+    def sequence(self) -> int:
+        """기록 시퀀스 (기록할 때마다 증가 - 변경 감지용, 디스크 체크포인트 등)"""
+        return self._seq
+
+    @property
+    def last_timestamp(self) -> int:
+        """최신 캔들 Starting Time (ms), 비어 있으면 0"""
+        if self._size == 0:
+            return 0
+        return int(self._timestamp[self._head])
+
+    def _write(self, pos: int, timestamp: int, open_: float, high: float, low: float,
+               close: float, volume: float, is_final: bool, close_time: int):
+        """논리 위치 pos와 미러 위치에 동시 기록"""
+        for idx in (pos, pos + self.capacity):
+            self._timestamp[idx] = timestamp
+            self._close_time[idx] = close_time
+            row = self._ohlcv[idx]
+            row[0] = open_
+            row[1] = high
+            row[2] = low
+            row[3] = close
+            row[4] = volume
+            self._is_final[idx] = is_final
+
+    def _append(self, *candle):
+        self._head = (self._head + 1) % self.capacity
+        self._write(self._head, *candle)
+        if self._size < self.capacity:
+            self._size += 1
+
+    def append(self, timestamp: int, open_: float, high: float, low: float, close: float,
+               volume: float, is_final: bool = False, close_time: int = 0):
+        """New 캔들 Add (가득 차면 가장 오래된 캔들을 덮어씀)"""
+        self._seq += 1
+        try:
+            self._append(timestamp, open_, high, low, close, volume, is_final, close_time)
+        finally:
+            self._seq += 1
+
+    def update_last(self, timestamp: int, open_: float, high: float, low: float, close: float,
+                    volume: float, is_final: bool = False, close_time: int = 0):
+        """마지막 캔들 덮어쓰기 (Progress 중인 캔들 Update)"""
+        self._seq += 1
+        try:
+            if self._size == 0:
+                self._append(timestamp, open_, high, low, close, volume, is_final, close_time)
+            else:
+                self._write(self._head, timestamp, open_, high, low, close, volume, is_final, close_time)
+        finally:
+            self._seq += 1
+
+    def upsert(self, timestamp: int, open_: float, high: float, low: float, close: float,
+               volume: float, is_final: bool = False, close_time: int = 0) -> Optional[Tuple[int, int]]:
+        """
+        같은 타임스탬프면 Update, 아니면 Add
+
+        Returns:
+            (since, count): 직전 캔들과 사이에 누락 구간이 생겼으면 그 구간, 아니면 None
+        """
+        gap = None
+        self._seq += 1
+        try:
+            if self._size and self._timestamp[self._head] == timestamp:
+                self._write(self._head, timestamp, open_, high, low, close, volume, is_final, close_time)
+            else:
+                gap = self._detect_gap(timestamp)
+                self._append(timestamp, open_, high, low, close, volume, is_final, close_time)
+        finally:
+            self._seq += 1
+        return gap
+
+    def _detect_gap(self, timestamp: int) -> Optional[Tuple[int, int]]:
+        """마지막 캔들 다음 예상 Starting Time보다 늦은 캔들이면 누락 구간 기록"""
+        if not self.interval_ms or self._size == 0:
+            return None
+        expected = int(self._timestamp[self._head]) + self.interval_ms
+        if timestamp <= expected:
+            return None
+        gap = (expected, (int(timestamp) - expected) // self.interval_ms)
+        self._gaps = self._live_gaps() + (gap,)
+        self.gaps_detected += 1
+        return gap
+
+    def mark_last_final(self):
+        """마지막 캔들을 확정(is_final=True)으로 표시"""
+        if self._size == 0:
+            return
+        self._seq += 1
+        try:
+            self._is_final[self._head] = True
+            self._is_final[self._head + self.capacity] = True
+        finally:
+            self._seq += 1
+
+    def clear(self):
+        """버퍼 비우기 (메모리는 재Usage)"""
+        self._seq += 1
+        self._head = -1
+        self._size = 0
+        self._gaps = ()
+        self._seq += 1
+
+    def load(self, timestamps, ohlcv, is_final=None, close_times=None):
+        """
+        REST 부트스트랩 데이터 일괄 Load (Legacy 내용 대체)
+
+        Args:
+            timestamps: 캔들 Starting Time 배열 (ms)
+            ohlcv: (N, 5) open/high/low/close/volume 배열
+            is_final: 확정 여부 배열 (None이면 모두 True)
+            close_times: 캔들 Terminate Time 배열 (None이면 0)
+        """
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        ohlcv = np.asarray(ohlcv, dtype=np.float64).reshape(-1, len(OHLCV_COLUMNS))
+
+        # capacity보다 많으면 최신 캔들만 Maintain
+        n = min(len(timestamps), self.capacity)
+        timestamps = timestamps[-n:] if n else timestamps[:0]
+        ohlcv = ohlcv[-n:] if n else ohlcv[:0]
+        is_final = (np.ones(n, dtype=np.bool_) if is_final is None
+                    else np.asarray(is_final, dtype=np.bool_)[-n:])
+        close_times = (np.zeros(n, dtype=np.int64) if close_times is None
+                       else np.asarray(close_times, dtype=np.int64)[-n:])
+
+        # 논리 위치 0..n-1 에 기록 (head = n-1)
+        self._seq += 1
+        try:
+            for offset in (0, self.capacity):
+                self._timestamp[offset:offset + n] = timestamps
+                self._close_time[offset:offset + n] = close_times
+                self._ohlcv[offset:offset + n] = ohlcv
+                self._is_final[offset:offset + n] = is_final
+
+            self._size = n
+            self._head = n - 1 if n else -1
+            self._gaps = self._find_gaps(timestamps)
+        finally:
+            self._seq += 1
+
+    def merge(self, timestamps, ohlcv, is_final=None, close_times=None):
+        """
+        버퍼 내용 + 새 캔들을 Time 순으로 병합 (누락 구간 보충용)
+
+        같은 Starting Time은 새 캔들 우선, capacity 초과분은 오래된 캔들부터 제외.
+        누락 구간은 병합 결과로 다시 계산합니다.
+        """
+        current = self.snapshot(0)
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        n = len(timestamps)
+        incoming = {
+            'timestamp': timestamps,
+            'ohlcv': np.asarray(ohlcv, dtype=np.float64).reshape(-1, len(OHLCV_COLUMNS)),
+            'is_final': (np.ones(n, dtype=np.bool_) if is_final is None
+                         else np.asarray(is_final, dtype=np.bool_)),
+            'close_time': (np.zeros(n, dtype=np.int64) if close_times is None
+                           else np.asarray(close_times, dtype=np.int64)),
+        }
+        merged = {key: np.concatenate([current[key], incoming[key]]) for key in current}
+        order = np.argsort(merged['timestamp'], kind='stable')
+        ordered = merged['timestamp'][order]
+        # stable 정렬 → 같은 timestamp는 새 캔들이 뒤쪽, 마지막 것만 유지
+        order = order[np.r_[ordered[1:] != ordered[:-1], True]] if len(order) else order
+        self.load(merged['timestamp'][order], merged['ohlcv'][order],
+                  is_final=merged['is_final'][order], close_times=merged['close_time'][order])
+
+    def _find_gaps(self, timestamps: np.ndarray) -> Tuple[Tuple[int, int], ...]:
+        """정렬된 타임스탬프 배열의 중간 누락 구간"""
+        if not self.interval_ms or len(timestamps) < 2:
+            return ()
+        diffs = np.diff(timestamps)
+        return tuple((int(timestamps[i]) + self.interval_ms, int(diffs[i]) // self.interval_ms - 1)
+                     for i in np.flatnonzero(diffs > self.interval_ms))
+
+    def _live_gaps(self) -> Tuple[Tuple[int, int], ...]:
+        """가장 오래된 보관 캔들 이후의 누락 구간 (덮어써져 윈도우 밖으로 밀려난 구간 제외)"""
+        gaps = self._gaps
+        if not gaps or self._size == 0:
+            return ()
+        oldest = int(self._timestamp[self._window_bounds(0)[0]])
+        return tuple(gap for gap in gaps if gap[0] > oldest)
+
+    def gaps(self) -> List[Tuple[int, int]]:
+        """Current 윈도우 안의 누락 구간 [(since, count), ...] (lock 없음)"""
+        return list(self._live_gaps())
+
+    def health(self) -> dict:
+        """
+        누락 구간 Status (lock 없음)
+
+        Returns:
+            dict: gap_count (열린 누락 구간 수), missing_candles (누락 캔들 합),
+                  max_gap (최대 연속 누락 캔들 수), gaps_detected (ingest 중 탐지 누적), candles
+        """
+        gaps = self._live_gaps()
+        return {
+            'gap_count': len(gaps),
+            'missing_candles': sum(count for _, count in gaps),
+            'max_gap': max((count for _, count in gaps), default=0),
+            'gaps_detected': self.gaps_detected,
+            'candles': self._size
+        }
+
+    def _window_bounds(self, limit: int) -> Tuple[int, int]:
+        """최근 limit봉에 해당하는 연속 구간 [start, end)"""
+        n = self._size if limit is None or limit <= 0 else min(limit, self._size)
+        end = self._head + 1 + self.capacity
+        return end - n, end
+
+    def window(self, limit: int = 0) -> Dict[str, np.ndarray]:
+        """
+        최근 limit봉의 읽기 전용 view (복사 없음)
+
+        Returns:
+            dict: timestamp/open/high/low/close/volume/is_final/close_time 배열
+        """
+        start, end = self._window_bounds(limit)
+        ohlcv = self._ohlcv[start:end].view()
+        ohlcv.flags.writeable = False
+
+        arrays = {
+            'timestamp': self._timestamp[start:end].view(),
+            'close_time': self._close_time[start:end].view(),
+            'is_final': self._is_final[start:end].view(),
+        }
+        for i, column in enumerate(OHLCV_COLUMNS):
+            arrays[column] = ohlcv[:, i]
+        for arr in arrays.values():
+            arr.flags.writeable = False
+        return arrays
+
+    def to_dataframe(self, limit: int = 0) -> pd.DataFrame:
+        """
+        최근 limit봉을 DataFrame으로 반환
+
+        OHLCV 블록은 링 버퍼 메모리를 그대로 참조하는 읽기 전용 view이며,
+        timestamp 컬럼만 datetime64[ms] view로 Add됩니다.
+        """
+        if self._size == 0:
+            return pd.DataFrame(columns=DATAFRAME_COLUMNS)
+
+        start, end = self._window_bounds(limit)
+        ohlcv = self._ohlcv[start:end].view()
+        ohlcv.flags.writeable = False
+
+        timestamps = self._timestamp[start:end].view('datetime64[ms]')
+        timestamps.flags.writeable = False
+
+        df = pd.DataFrame(ohlcv, columns=OHLCV_COLUMNS, copy=False)
+        df.insert(0, 'timestamp', timestamps)
+        return df
+
+    def snapshot(self, limit: int = 0) -> Dict[str, np.ndarray]:
+        """
+        최근 limit봉의 일관된 복사본 (lock 없음, writer를 막지 않음)
+
+        기록 중이었거나 복사 도중 기록이 끼어들면 다시 복사합니다.
+
+        Returns:
+            dict: timestamp/close_time/is_final 배열과 (N, 5) 'ohlcv' 배열
+        """
+        while True:
+            seq = self._seq
+            if seq & 1:
+                time.sleep(0)  # 기록 중 → writer에 GIL 양보
+                continue
+
+            start, end = self._window_bounds(limit)
+            data = {
+                'timestamp': self._timestamp[start:end].copy(),
+                'close_time': self._close_time[start:end].copy(),
+                'is_final': self._is_final[start:end].copy(),
+                'ohlcv': self._ohlcv[start:end].copy()
+            }
+            if self._seq == seq:
+                return data
+
+    def snapshot_dataframe(self, limit: int = 0) -> pd.DataFrame:
+        """최근 limit봉의 일관된 DataFrame 복사본 (호출 측 소유, 수정/Cache 가능)"""
+        data = self.snapshot(limit)
+        if len(data['timestamp']) == 0:
+            return pd.DataFrame(columns=DATAFRAME_COLUMNS)
+
+        df = pd.DataFrame(data['ohlcv'], columns=OHLCV_COLUMNS, copy=False)
+        df.insert(0, 'timestamp', data['timestamp'].view('datetime64[ms]'))
+        return df
+
+    def last(self) -> Optional[dict]:
+        """최신 캔들을 dict로 반환 (Legacy buffer[-1] 호환)"""
+        data = self.snapshot(1)
+        if len(data['timestamp']) == 0:
+            return None
+        return self._row_to_dict(data, 0)
+
+    def to_records(self, limit: int = 0) -> List[dict]:
+        """최근 limit봉을 dict 리스트로 반환 (Legacy as_dataframe=False 호환)"""
+        data = self.snapshot(limit)
+        return [self._row_to_dict(data, idx) for idx in range(len(data['timestamp']))]
+
+    @staticmethod
+    def _row_to_dict(data: Dict[str, np.ndarray], idx: int) -> dict:
+        row = data['ohlcv'][idx]
+        return {
+            'timestamp': int(data['timestamp'][idx]),
+            'open': float(row[0]),
+            'high': float(row[1]),
+            'low': float(row[2]),
+            'close': float(row[3]),
+            'volume': float(row[4]),
+            'close_time': int(data['close_time'][idx]),
+            'is_final': bool(data['is_final'][idx])
+        }
@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""
+Kline Store
+Symbol-Timeframe별 캔들 디스크 Save소 (memory-mapped 컬럼형 File) - 재Starting 시 웜 스타트용
+
+File 구조 (<dir>/<SYMBOL>__<timeframe>.klines, little-endian):
+- 헤더 64 bytes: magic 'KLST', version, capacity, head, size, 마지막 캔들 Starting Time, 갱신 시각, CRC32
+- 컬럼 영역 (각 capacity 행): timestamp i8 | close_time i8 | open f8 | high f8 | low f8 | close f8 | volume f8 | is_final u1
+
+기록 방식:
+- append-only 링: 마지막 체크포인트 이후 캔들만 head 뒤에 Add (Progress 중이던 마지막 캔들만 덮어씀)
+- capacity (링 버퍼와 동일, 기본 1500)를 넘으면 가장 오래된 캔들 자리에 기록 → File Size 고정, 압축 Required 없음
+- 행 기록 후 헤더를 마지막에 갱신 → 체크포인트 도중 프로세스가 죽어도 이전 헤더 기준으로 일관된 데이터
+- 공유 매핑에 기록하므로 프로세스 Terminate와 무관하게 OS 페이지 Cache를 거쳐 File에 반영 (flush는 Terminate 시 1times)
+
+Load 시 헤더 CRC / File Size / timestamp 단조 증가를 Verification하고, 손상된 File은 무시합니다 (REST 부트스트랩으로 대체).
+"""
+
+import logging
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from typing import Dict, Optional
+
+import numpy as np
+
+MAGIC = b'KLST'
+VERSION = 1
+HEADER_SIZE = 64
+# magic, version, reserved, capacity, head, size, last_timestamp, updated_ms
+_HEADER_FIELDS = struct.Struct('<4sHHIqqqq')
+_HEADER_CRC = struct.Struct('<I')
+
+# (컬럼명, dtype) - File 내 순서
+COLUMNS = [
+    ('timestamp', np.int64),
+    ('close_time', np.int64),
+    ('open', np.float64),
+    ('high', np.float64),
+    ('low', np.float64),
+    ('close', np.float64),
+    ('volume', np.float64),
+    ('is_final', np.uint8),
+]
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+ROW_BYTES = sum(np.dtype(dtype).itemsize for _, dtype in COLUMNS)
+
+_TIMEFRAME_UNITS_MS = {'m': 60_000, 'h': 3_600_000, 'd': 86_400_000, 'w': 604_800_000}
+
+
+def timeframe_to_ms(timeframe: str) -> int:
+    """'1m' / '15m' / '4h' / '1d' → 밀리초"""
+    return int(timeframe[:-1]) * _TIMEFRAME_UNITS_MS[timeframe[-1]]
+
+
+def _column_views(mm: np.memmap, capacity: int) -> Dict[str, np.ndarray]:
+    views = {}
+    offset = HEADER_SIZE
+    for name, dtype in COLUMNS:
+        nbytes = capacity * np.dtype(dtype).itemsize
+        views[name] = mm[offset:offset + nbytes].view(dtype)
+        offset += nbytes
+    return views
+
+
+def _pack_header(capacity: int, head: int, size: int, last_timestamp: int) -> bytes:
+    fields = _HEADER_FIELDS.pack(MAGIC, VERSION, 0, capacity, head, size, last_timestamp, int(time.time() * 1000))
+    header = fields + _HEADER_CRC.pack(zlib.crc32(fields))
+    return header.ljust(HEADER_SIZE, b'\0')
+
+
+def _unpack_header(raw: bytes) -> Optional[dict]:
+    fields = raw[:_HEADER_FIELDS.size]
+    (crc,) = _HEADER_CRC.unpack_from(raw, _HEADER_FIELDS.size)
+    if zlib.crc32(fields) != crc:
+        return None
+    magic, version, _, capacity, head, size, last_timestamp, updated_ms = _HEADER_FIELDS.unpack(fields)
+    if magic != MAGIC or version != VERSION or not 0 <= size <= capacity or not -1 <= head < capacity:
+        return None
+    return {'capacity': capacity, 'head': head, 'size': size,
+            'last_timestamp': last_timestamp, 'updated_ms': updated_ms}
+
+
+class KlineStore:
+    """Symbol-Timeframe별 memory-mapped 캔들 File Admin"""
+
+    def __init__(self, directory: str = 'kline_store', capacity: int = 1500, logger=None):
+        """
+        Args:
+            directory: File Save 디렉토리 (첫 기록 시 Create)
+            capacity: 새 File의 최대 캔들 수 (기존 File은 헤더의 capacity Usage)
+            logger: 로거 인스턴스
+        """
+        self.directory = directory
+        self.capacity = capacity
+        self.logger = logger or logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._headers: Dict[str, dict] = {}       # path -> 마지막으로 기록/Load한 헤더
+        self._synced_seq: Dict[str, int] = {}     # path -> 마지막 체크포인트 시점 링 버퍼 시퀀스
+
+        self.stats = {
+            'checkpoints': 0,
+            'rows_written': 0,
+            'files_written': 0,
+            'loads': 0,
+            'rows_loaded': 0,
+            'corrupt_files': 0,
+        }
+
+    def path_for(self, symbol: str, timeframe: str) -> str:
+        safe = re.sub(r'[^A-Za-z0-9]+', '_', symbol).strip('_')
+        return os.path.join(self.directory, f"{safe}__{timeframe}.klines")
+
+    def _open(self, path: str, capacity: int = None) -> Optional[np.memmap]:
+        """기존 File 매핑 (capacity 지정 시 없으면 Create)"""
+        if not os.path.exists(path):
+            if capacity is None:
+                return None
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path, 'wb') as f:
+                f.truncate(HEADER_SIZE + capacity * ROW_BYTES)
+            mm = np.memmap(path, dtype=np.uint8, mode='r+')
+            mm[:HEADER_SIZE] = np.frombuffer(_pack_header(capacity, -1, 0, 0), dtype=np.uint8)
+            return mm
+        return np.memmap(path, dtype=np.uint8, mode='r+')
+
+    def _read_header(self, path: str, mm: np.memmap) -> Optional[dict]:
+        header = _unpack_header(bytes(mm[:HEADER_SIZE]))
+        if header is None or len(mm) != HEADER_SIZE + header['capacity'] * ROW_BYTES:
+            return None
+        return header
+
+    def load(self, symbol: str, timeframe: str) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Save된 캔들을 시간순으로 Load
+
+        Returns:
+            dict: timestamp / close_time / is_final 배열과 (N, 5) 'ohlcv' 배열 (KlineRingBuffer.snapshot 형식),
+                  File이 없거나 손상되었으면 None
+        """
+        path = self.path_for(symbol, timeframe)
+        with self._lock:
+            try:
+                mm = self._open(path)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Kline store open failed ({path}): {e}")
+                return None
+            if mm is None:
+                return None
+
+            header = self._read_header(path, mm)
+            if header is None:
+                self.stats['corrupt_files'] += 1
+                self.logger.warning(f"⚠️ Kline store corrupted, ignored: {path}")
+                return None
+
+            capacity, head, size = header['capacity'], header['head'], header['size']
+            positions = (head - size + 1 + np.arange(size)) % capacity if size else np.arange(0)
+            views = _column_views(mm, capacity)
+            data = {
+                'timestamp': views['timestamp'][positions],
+                'close_time': views['close_time'][positions],
+                'is_final': views['is_final'][positions].astype(np.bool_),
+                'ohlcv': np.column_stack([views[name][positions] for name in OHLCV_COLUMNS])
+                         if size else np.zeros((0, len(OHLCV_COLUMNS))),
+            }
+            del views, mm
+
+            # 단조 증가가 깨진 지점 이후만 사용 (부분 기록 방어)
+            broken = np.nonzero(np.diff(data['timestamp']) <= 0)[0]
+            if len(broken):
+                start = broken[-1] + 1
+                data = {key: value[start:] for key, value in data.items()}
+
+            self._headers[path] = header
+            self.stats['loads'] += 1
+            self.stats['rows_loaded'] += len(data['timestamp'])
+            return data
+
+    def append(self, symbol: str, timeframe: str, data: Dict[str, np.ndarray]) -> int:
+        """
+        마지막 Save 캔들 이후 캔들 Add (마지막 캔들과 같은 Starting Time이면 덮어씀)
+
+        Args:
+            data: KlineRingBuffer.snapshot 형식 (시간순)
+
+        Returns:
+            int: 기록한 행 수
+        """
+        path = self.path_for(symbol, timeframe)
+        with self._lock:
+            return self._append_locked(path, data)
+
+    def _append_locked(self, path: str, data: Dict[str, np.ndarray]) -> int:
+        if not os.path.exists(path):
+            self._headers.pop(path, None)
+        mm = self._open(path, self.capacity)
+        header = self._headers.get(path) or self._read_header(path, mm)
+        if header is None:
+            # 손상된 File은 새로 기록
+            self.stats['corrupt_files'] += 1
+            del mm
+            os.remove(path)
+            mm = self._open(path, self.capacity)
+            header = self._read_header(path, mm)
+
+        capacity, head, size, last_ts = header['capacity'], header['head'], header['size'], header['last_timestamp']
+        timestamps = data['timestamp']
+        if size:
+            keep = timestamps >= last_ts
+            if not keep.all():
+                data = {key: value[keep] for key, value in data.items()}
+                timestamps = data['timestamp']
+        n = len(timestamps)
+        if n == 0:
+            return 0
+
+        overwrite = bool(size) and int(timestamps[0]) == last_ts
+        if n > capacity:
+            data = {key: value[-capacity:] for key, value in data.items()}
+            n = capacity
+        start = head if overwrite else head + 1
+        positions = (start + np.arange(n)) % capacity
+
+        views = _column_views(mm, capacity)
+        views['timestamp'][positions] = data['timestamp']
+        views['close_time'][positions] = data['close_time']
+        views['is_final'][positions] = data['is_final']
+        for i, name in enumerate(OHLCV_COLUMNS):
+            views[name][positions] = data['ohlcv'][:, i]
+
+        # 헤더는 행 기록 후 마지막에 갱신
+        new_head = int(positions[-1])
+        new_size = min(capacity, size + n - (1 if overwrite else 0))
+        new_last = int(data['timestamp'][-1])
+        mm[:HEADER_SIZE] = np.frombuffer(_pack_header(capacity, new_head, new_size, new_last), dtype=np.uint8)
+        del views, mm
+
+        self._headers[path] = {'capacity': capacity, 'head': new_head, 'size': new_size,
+                               'last_timestamp': new_last, 'updated_ms': int(time.time() * 1000)}
+        self.stats['rows_written'] += n
+        self.stats['files_written'] += 1
+        return n
+
+    def checkpoint(self, symbol: str, timeframe: str, buffer) -> int:
+        """
+        링 버퍼 (KlineRingBuffer)의 마지막 체크포인트 이후 변경분만 기록
+
+        Returns:
+            int: 기록한 행 수 (변경 없으면 0)
+        """
+        path = self.path_for(symbol, timeframe)
+        seq = buffer.sequence
+        if not buffer or self._synced_seq.get(path) == seq:
+            return 0
+
+        with self._lock:
+            header = self._headers.get(path)
+            if header is None and os.path.exists(path):
+                try:
+                    mm = self._open(path)
+                    header = self._read_header(path, mm)
+                    del mm
+                except (OSError, ValueError):
+                    header = None
+            last_ts = header['last_timestamp'] if header and header['size'] else None
+
+            if last_ts is None:
+                data = buffer.snapshot(0)
+            elif buffer.last_timestamp < last_ts:
+                # 버퍼가 File보다 오래됨 (재부트스트랩 도중 등) - 다음 체크포인트에서 다시 확인
+                return 0
+            else:
+                # 마지막 Save 캔들부터의 예상 캔들 수 (누락 구간이 있으면 범위를 늘려 재조times)
+                limit = (buffer.last_timestamp - last_ts) // timeframe_to_ms(timeframe) + 2
+                while True:
+                    data = buffer.snapshot(limit)
+                    if len(data['timestamp']) < limit or data['timestamp'][0] <= last_ts:
+                        break
+                    limit *= 2
+
+            written = self._append_locked(path, data)
+            self._synced_seq[path] = seq
+            return written
+
+    def checkpoint_buffers(self, buffers: Dict[str, object], timeframes=None) -> int:
+        """
+        버퍼 dict ('<symbol>_<timeframe>' → KlineRingBuffer) 전체 체크포인트
+
+        Args:
+            timeframes: 기록할 Timeframe (None이면 전체, 1m에서 재Create하는 상위 Timeframe 제외용)
+
+        Returns:
+            int: 기록한 총 행 수
+        """
+        written = 0
+        for buffer_key, buffer in list(buffers.items()):
+            symbol, _, timeframe = buffer_key.rpartition('_')
+            if not symbol or timeframe[-1:] not in _TIMEFRAME_UNITS_MS:
+                continue
+            if timeframes is not None and timeframe not in timeframes:
+                continue
+            try:
+                written += self.checkpoint(symbol, timeframe, buffer)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Kline checkpoint failed ({buffer_key}): {e}")
+        self.stats['checkpoints'] += 1
+        return written
+
+    def flush(self):
+        """페이지 Cache 내용을 디스크에 강제 기록 (Terminate 시)"""
+        with self._lock:
+            for path in list(self._headers):
+                if os.path.exists(path):
+                    with open(path, 'rb+') as f:
+                        os.fsync(f.fileno())
+
+    def get_stats(self) -> dict:
+        stats = dict(self.stats)
+        stats['files'] = len(self._headers)
+        stats['directory'] = self.directory
+        return stats
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+KlineStore (memory-mapped 캔들 체크포인트) Verification / 웜 스타트 벤치마크
+
+점검 항목:
+1. 체크포인트 → Load 왕복 시 링 버퍼 스냅샷과 동일
+2. 증분 체크포인트: 변경 없으면 기록 0행, New 캔들만 기록 (진행 중 캔들은 덮어씀)
+3. capacity 초과 시 오래된 캔들 자리에 기록 (File Size 고정)
+4. 헤더 손상 → None (REST로 대체), 헤더 갱신 전 기록된 행은 무시
+5. 웜 부트스트랩: 오래된 체크포인트 + 누락 구간 보충 결과가 콜드 부트스트랩과 동일,
+   REST 요청 캔들 수 / 소요 Time 비교 (가짜 거래소, 요청당 + 캔들당 지연 시뮬레이션)
+
+Usage:
+    python kline_store_check.py [--symbols 150] [--latency-ms 20] [--per-candle-us 40] [--stale-minutes 7]
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from binance_rate_limiter import BinanceRateLimiter
+from binance_websocket_kline_manager import BinanceWebSocketKlineManager
+from bulk_websocket_kline_manager import BulkWebSocketKlineManager
+from kline_ring_buffer import KlineRingBuffer
+from kline_store import HEADER_SIZE, ROW_BYTES, KlineStore, timeframe_to_ms
+
+T0 = 1_700_000_000_000
+
+
+def fill_buffer(buffer: KlineRingBuffer, start: int, count: int, step: int = 60_000):
+    for i in range(start, start + count):
+        buffer.upsert(T0 + i * step, i, i + 1, i - 1, i + 0.5, i * 10.0, is_final=True, close_time=T0 + i * step + step - 1)
+
+
+def same_snapshot(a: dict, b: dict) -> bool:
+    return all(np.array_equal(a[key], b[key]) for key in ('timestamp', 'close_time', 'is_final', 'ohlcv'))
+
+
+class FakeExchange:
+    """결정적 캔들을 반환하는 가짜 거래소 (요청당 지연 + 캔들당 전송 지연, 요청 캔들 수 기록)"""
+
+    def __init__(self, now_ms: int, latency: float = 0.0, per_candle: float = 0.0):
+        self.now_ms = now_ms
+        self.latency = latency
+        self.per_candle = per_candle
+        self.calls = 0
+        self.candles_requested = 0
+
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        self.calls += 1
+        self.candles_requested += limit
+        if self.latency or self.per_candle:
+            time.sleep(self.latency + self.per_candle * limit)
+        tf_ms = timeframe_to_ms(timeframe)
+        current = self.now_ms // tf_ms * tf_ms
+        first = since // tf_ms * tf_ms if since is not None else current - (limit - 1) * tf_ms
+        seed = sum(map(ord, symbol + timeframe))
+        rows = []
+        for ts in range(first, min(current, first + (limit - 1) * tf_ms) + 1, tf_ms):
+            price = 100 + (ts // tf_ms + seed) % 97
+            # 진행 중 캔들은 시각에 따라 값이 바뀜
+            volume = float(self.now_ms % 1000) if ts == current else float(seed)
+            rows.append([ts, price, price + 1, price - 1, price + 0.5, volume])
+        return rows
+
+
+def make_manager(exchange, store_dir, logger) -> BulkWebSocketKlineManager:
+    base = BinanceWebSocketKlineManager(callback=None, logger=logger)
+    return BulkWebSocketKlineManager(base, exchange, logger, kline_store_dir=store_dir,
+                                     rate_limiter=BinanceRateLimiter(logger))
+
+
+def check(results: list, name: str, passed: bool, detail: str = ''):
+    results.append(passed)
+    print(f"  {'✅' if passed else '❌'} {name}" + (f" - {detail}" if detail else ''))
+
+
+def check_roundtrip(results: list, directory: str):
+    print("\n[1] 체크포인트 / Load 왕복")
+    store = KlineStore(os.path.join(directory, 'roundtrip'), capacity=1500)
+    buffer = KlineRingBuffer(1500)
+    fill_buffer(buffer, 0, 500)
+    written = store.checkpoint('BTC/USDT:USDT', '1m', buffer)
+    loaded = KlineStore(store.directory, capacity=1500).load('BTC/USDT:USDT', '1m')
+    check(results, "500행 기록 후 동일 스냅샷", written == 500 and same_snapshot(loaded, buffer.snapshot(0)))
+    path = store.path_for('BTC/USDT:USDT', '1m')
+    check(results, "File 크기 = 헤더 + capacity x 행", os.path.getsize(path) == HEADER_SIZE + 1500 * ROW_BYTES,
+          f"{os.path.getsize(path):,} bytes ({ROW_BYTES} bytes/행)")
+
+
+def check_incremental(results: list, directory: str):
+    print("\n[2] 증분 체크포인트")
+    store = KlineStore(os.path.join(directory, 'incremental'), capacity=1500)
+    buffer = KlineRingBuffer(1500)
+    fill_buffer(buffer, 0, 500)
+    store.checkpoint('ETH/USDT:USDT', '1m', buffer)
+    check(results, "변경 없으면 0행", store.checkpoint('ETH/USDT:USDT', '1m', buffer) == 0)
+
+    fill_buffer(buffer, 500, 3)
+    buffer.upsert(T0 + 503 * 60_000, 1, 2, 0, 1, 5, is_final=False, close_time=0)
+    written = store.checkpoint('ETH/USDT:USDT', '1m', buffer)
+    check(results, "New 캔들만 기록", written == 5, f"{written}행 (마지막 Save 캔들 덮어쓰기 + 4행)")
+
+    buffer.upsert(T0 + 503 * 60_000, 1, 3, 0, 2, 9, is_final=True, close_time=T0 + 503 * 60_000 + 59_999)
+    written = store.checkpoint('ETH/USDT:USDT', '1m', buffer)
+    loaded = KlineStore(store.directory).load('ETH/USDT:USDT', '1m')
+    check(results, "진행 중 캔들 덮어쓰기", written == 1 and same_snapshot(loaded, buffer.snapshot(0)),
+          f"{written}행, 총 {len(loaded['timestamp'])}행")
+
+
+def check_wrap(results: list, directory: str):
+    print("\n[3] capacity 초과 (링)")
+    store = KlineStore(os.path.join(directory, 'wrap'), capacity=200)
+    buffer = KlineRingBuffer(200)
+    for start in range(0, 700, 70):
+        fill_buffer(buffer, start, 70)
+        store.checkpoint('SOL/USDT:USDT', '1m', buffer)
+    loaded = KlineStore(store.directory).load('SOL/USDT:USDT', '1m')
+    check(results, "최신 capacity행 유지", same_snapshot(loaded, buffer.snapshot(0)),
+          f"{len(loaded['timestamp'])}행, 마지막 {int(loaded['timestamp'][-1] - T0) // 60_000}번째 캔들")
+
+
+def check_corruption(results: list, directory: str):
+    print("\n[4] 손상 / 미완료 기록")
+    store = KlineStore(os.path.join(directory, 'corrupt'), capacity=300)
+    buffer = KlineRingBuffer(300)
+    fill_buffer(buffer, 0, 100)
+    store.checkpoint('XRP/USDT:USDT', '1m', buffer)
+    path = store.path_for('XRP/USDT:USDT', '1m')
+
+    # 헤더 갱신 전 종료: 행은 기록됐지만 헤더는 이전 상태
+    with open(path, 'r+b') as f:
+        header = f.read(HEADER_SIZE)
+    fill_buffer(buffer, 100, 10)
+    store.checkpoint('XRP/USDT:USDT', '1m', buffer)
+    with open(path, 'r+b') as f:
+        f.write(header)
+    loaded = KlineStore(store.directory).load('XRP/USDT:USDT', '1m')
+    check(results, "헤더 갱신 전 행은 무시", len(loaded['timestamp']) == 100
+          and same_snapshot(loaded, buffer.snapshot(0)) is False
+          and int(loaded['timestamp'][-1]) == T0 + 99 * 60_000)
+
+    with open(path, 'r+b') as f:
+        f.seek(20)
+        f.write(b'\xff\xff')
+    fresh = KlineStore(store.directory)
+    check(results, "헤더 CRC 불일치 → None", fresh.load('XRP/USDT:USDT', '1m') is None
+          and fresh.stats['corrupt_files'] == 1)
+    written = fresh.checkpoint('XRP/USDT:USDT', '1m', buffer)
+    check(results, "손상 File 재기록", written == 110
+          and same_snapshot(KlineStore(store.directory).load('XRP/USDT:USDT', '1m'), buffer.snapshot(0)))
+
+
+def check_warm_bootstrap(results: list, directory: str, n_symbols: int, latency: float, per_candle: float,
+                         stale_minutes: int):
+    print(f"\n[5] 웜 부트스트랩 ({n_symbols} Symbol, 요청당 {latency * 1000:.0f}ms + 캔들당 {per_candle * 1e6:.0f}µs, "
+          f"체크포인트 {stale_minutes}분 전)")
+    logger = logging.getLogger('kline_store_check')
+    logger.setLevel(logging.WARNING)
+    symbols = [f"SYM{i}/USDT:USDT" for i in range(n_symbols)]
+    store_dir = os.path.join(directory, 'warm')
+    now_ms = int(time.time() * 1000)
+
+    # 이전 실행: stale_minutes 전에 부트스트랩 후 체크포인트하고 종료
+    previous = make_manager(FakeExchange(now_ms - stale_minutes * 60_000), store_dir, logger)
+    previous.bootstrap_historical_data(symbols)
+    previous.stop_checkpointing()
+
+    cold_exchange = FakeExchange(now_ms, latency, per_candle)
+    cold = make_manager(cold_exchange, None, logger)
+    start = time.perf_counter()
+    cold.bootstrap_historical_data(symbols)
+    cold_time = time.perf_counter() - start
+
+    warm_exchange = FakeExchange(now_ms, latency, per_candle)
+    warm = make_manager(warm_exchange, store_dir, logger)
+    start = time.perf_counter()
+    warm.bootstrap_historical_data(symbols)
+    warm_time = time.perf_counter() - start
+    warm.stop_checkpointing()
+
+    frames = [(s, tf) for s in symbols for tf in BulkWebSocketKlineManager.BOOTSTRAP_LIMITS]
+    # 웜 버퍼는 체크포인트 이전 캔들을 더 갖고 있을 수 있으므로 콜드 길이만큼 비교
+    matched = all(
+        np.array_equal(cold.base_manager.kline_buffer[f"{s}_{tf}"].snapshot(0)[key],
+                       warm.base_manager.kline_buffer[f"{s}_{tf}"].snapshot(
+                           len(cold.base_manager.kline_buffer[f"{s}_{tf}"]))[key])
+        for s, tf in frames for key in ('timestamp', 'ohlcv')
+    )
+    check(results, "버퍼 내용 = 콜드 부트스트랩", matched, f"{len(frames)}count 버퍼")
+    stored = len(symbols) * len(warm.plan_bootstrap()['fetch'])  # 상위 Timeframe은 1m에서 재Create
+    check(results, "기본 Timeframe 버퍼 File Load", warm.stats['warm_frames'] == stored,
+          f"{warm.stats['warm_frames']}count")
+    check(results, "REST 요청 캔들 수 감소", warm_exchange.candles_requested * 10 < cold_exchange.candles_requested,
+          f"{cold_exchange.candles_requested:,} → {warm_exchange.candles_requested:,}개 "
+          f"(보충 {warm.stats['backfilled_candles']:,}개)")
+    check(results, "웜 부트스트랩이 더 빠름", warm_time < cold_time,
+          f"콜드 {cold_time:.2f}s (REST {cold_exchange.calls:,}times) → 웜 {warm_time:.2f}s (REST {warm_exchange.calls:,}times)")
+    print(f"  Binance weight: 콜드 {cold.stats['weight_used']:,} → 웜 {warm.stats['weight_used']:,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='KlineStore check')
+    parser.add_argument('--symbols', type=int, default=150)
+    parser.add_argument('--latency-ms', type=float, default=20, help='가짜 거래소 요청당 지연 (ms)')
+    parser.add_argument('--per-candle-us', type=float, default=40, help='가짜 거래소 캔들당 전송 지연 (µs)')
+    parser.add_argument('--stale-minutes', type=int, default=7, help='마지막 체크포인트 이후 경과 Time (분)')
+    args = parser.parse_args()
+
+    results = []
+    directory = tempfile.mkdtemp(prefix='kline_store_check_')
+    print(f"📊 KlineStore Verification ({directory})")
+    try:
+        check_roundtrip(results, directory)
+        check_incremental(results, directory)
+        check_wrap(results, directory)
+        check_corruption(results, directory)
+        check_warm_bootstrap(results, directory, args.symbols, args.latency_ms / 1000,
+                             args.per_candle_us / 1e6, args.stale_minutes)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    failed = results.count(False)
+    print(f"\n{'✅ 전체 통과' if not failed else f'❌ {failed} 항목 실패'} ({len(results)} 항목)")
+    return 0 if not failed else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -97,12 +97,50 @@ except ImportError:
     TELEGRAM_CHAT_ID = None
     HAS_TELEGRAM_CONFIG = False
 
+from indicators import add_supertrend_columns
+from kline_resampler import KlineResampler
+from incremental_indicators import IncrementalIndicatorEngine
+from indicator_cache import get_indicator_cache
+from bounded_cache import get_shared_cache
+from batch_indicators import compute_indicator_frames
+from process_scan_executor import ProcessScanExecutor
+from binance_rate_limiter import PRIORITY_BULK, get_rate_limiter, get_single_flight, install_rate_limiter
+from position_snapshot import PositionSnapshot
+from user_stream_position_sync import UserStreamPositionSync
+from persistence_scheduler import get_persistence_scheduler, install_signal_handlers
+
+try:
+    from websocket_user_data_stream import BinanceUserDataStream
+    HAS_USER_DATA_STREAM = True
+except ImportError:
+    HAS_USER_DATA_STREAM = False
+
+try:
+    from async_exchange_runtime import HAS_ASYNC_CCXT, AsyncExchangeRuntime, AsyncScanScheduler
+    HAS_ASYNC_RUNTIME = HAS_ASYNC_CCXT
+except ImportError:
+    HAS_ASYNC_RUNTIME = False
+
 from pattern_optimizations import (
     find_golden_cross_vectorized,
     find_dead_cross_vectorized,
     check_high_vs_open_vectorized,
     check_gap_within_threshold_vectorized,
-    check_value_comparison_vectorized
+    check_value_comparison_vectorized,
+    count_high_vs_open_in_range_vectorized
+)
+from vectorized_conditions import (
+    body_cross_found,
+    consecutive_bullish_found,
+    cross_positions,
+    direction_flip_found,
+    find_cross,
+    first_cross_position,
+    ma_downtrend_cross_found,
+    max_consecutive_decline,
+    open_below_high_above_positions,
+    open_to_high_surge_with_trend,
+    tail_values
 )
 
 # Add method alias for backward compatibility
@@ -226,11 +264,10 @@ import logging
 import warnings
 
 class RateLimitTracker:
-    """바이낸스 Rate Limit weight 추적 시스템 + 통계 수집"""
-    def __init__(self):
-        self.weight_used = 0
-        self.window_start = time.time()
-        self.max_weight = 2000  # per minute 제한 (바이낸스 기준: 2400, 안전여유 400)
+    """바이낸스 Rate Limit 통계 수집 (weight 추적/승인은 공용 BinanceRateLimiter)"""
+    def __init__(self, limiter=None):
+        # 프로세스 공용 Limiter - 60초 슬라이딩 윈도우 + X-MBX-USED-WEIGHT-1M 동기화
+        self.limiter = limiter or get_rate_limiter()
         self.warning_threshold = 0.70  # 70% 도달시 Warning (1400/2000)
 
         # 📊 통계 수집 시스템
@@ -253,6 +290,20 @@ class RateLimitTracker:
         self.stats_file = 'rate_limit_stats.json'
         self._load_stats()
 
+    @property
+    def max_weight(self):
+        """per minute 제한 (바이낸스 기준: 2400, 안전여유 400)"""
+        return self.limiter.get_max_weight()
+
+    @property
+    def weight_used(self):
+        """최근 60초 사용 weight (서버 헤더 동기화 반영)"""
+        return self.limiter.get_used_weight()
+
+    def usage_pct(self):
+        """budget 대비 사용률 (%)"""
+        return self.limiter.usage_pct()
+
     def _load_stats(self):
         """Save된 통계 불러오기"""
         try:
@@ -268,40 +319,31 @@ class RateLimitTracker:
             print(f"⚠️ Failed to load Rate Limit stats: {e}")
 
     def _save_stats(self):
-        """통계 Save"""
+        """통계 Save (백그라운드 디바운스 기록, 요청 시점 사본)"""
         try:
-            today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
-            stats_data = {
-                'date': today,
-                'stats': self.stats,
-                'hourly_stats': self.hourly_stats,
+            data = {
+                'date': datetime.now(timezone.utc).strftime('%Y-%m-%d'),
+                'stats': dict(self.stats),
+                'hourly_stats': {hour: dict(values) for hour, values in list(self.hourly_stats.items())},
                 'last_updated': datetime.now(timezone.utc).isoformat()
             }
-            with open(self.stats_file, 'w', encoding='utf-8') as f:
-                json.dump(stats_data, f, indent=2, ensure_ascii=False)
+            get_persistence_scheduler().schedule(self.stats_file, lambda: data)
         except Exception as e:
             print(f"⚠️ Rate Limit stats save failed: {e}")
 
     def add_request(self, weight=1):
-        """요청 weight Add"""
-        current_time = time.time()
-
-        # 1분 Elapsed시 리셋
-        if current_time - self.window_start >= 60:
-            self.weight_used = 0
-            self.window_start = current_time
-            self.stats['last_reset_time'] = current_time
-
-        self.weight_used += weight
+        """요청 통계 Add (weight 차감은 Limiter 승인/전송 훅에서 Process, 대기 없음)"""
+        weight_used = self.weight_used
+        max_weight = self.max_weight
 
         # 📊 통계 Update
         self.stats['total_requests'] += 1
         self.stats['total_weight_used'] += weight
 
         # 피크 Usage량 기록
-        current_usage_pct = (self.weight_used / self.max_weight) * 100
-        if self.weight_used > self.stats['peak_weight']:
-            self.stats['peak_weight'] = self.weight_used
+        current_usage_pct = (weight_used / max_weight) * 100
+        if weight_used > self.stats['peak_weight']:
+            self.stats['peak_weight'] = weight_used
             self.stats['peak_usage_pct'] = current_usage_pct
 
         # Time대별 통계
@@ -311,53 +353,32 @@ class RateLimitTracker:
         self.hourly_stats[current_hour]['requests'] += 1
         self.hourly_stats[current_hour]['weight'] += weight
 
-        # 80% Reached시 Warning 및 대기
-        if self.weight_used >= self.max_weight * self.warning_threshold:
-            remaining_weight = self.max_weight - self.weight_used
-            print(f"⚠️ Rate Limit {self.weight_used}/{self.max_weight} ({current_usage_pct:.1f}%) - Remaining weight: {remaining_weight}")
+        # 70% Reached시 Warning (벌크 레인은 Limiter에서 60%에 비차단 거부)
+        if weight_used >= max_weight * self.warning_threshold:
+            remaining_weight = max_weight - weight_used
+            print(f"⚠️ Rate Limit {weight_used}/{max_weight} ({current_usage_pct:.1f}%) - Remaining weight: {remaining_weight}")
 
             self.stats['warning_count'] += 1
-            if current_hour in self.hourly_stats:
-                self.hourly_stats[current_hour]['warnings'] += 1
-
-            # 60% 이상이면 30초 대기 (IP 밴 절대 방지!)
-            if self.weight_used >= self.max_weight * 0.6:
-                print(f"🛑 Rate Limit 60% exceeded - Waiting 30s (safety first)")
-                self.stats['wait_count'] += 1
-                self.stats['total_wait_time'] += 30.0
-                time.sleep(30)
-                # 대기 후 리셋
-                self.weight_used = 0
-                self.window_start = time.time()
+            self.hourly_stats[current_hour]['warnings'] += 1
 
         # 통계 Save (100번 요청마다)
         if self.stats['total_requests'] % 100 == 0:
             self._save_stats()
 
-    def can_request(self, weight=1):
-        """요청 가능 여부 Confirm"""
-        current_time = time.time()
-
-        # 1분 Elapsed시 리셋
-        if current_time - self.window_start >= 60:
-            self.weight_used = 0
-            self.window_start = current_time
-
-        # 요청 후 제한 Exceeded 여부 Confirm
-        return self.weight_used + weight < self.max_weight
-
-    def wait_if_needed(self, weight=1):
-        """Required시 대기"""
-        if not self.can_request(weight):
-            wait_time = 60 - (time.time() - self.window_start)
-            if wait_time > 0:
-                print(f"⏳ Rate Limit waiting: {wait_time:.1f}s")
-                self.stats['wait_count'] += 1
-                self.stats['total_wait_time'] += wait_time
-                time.sleep(wait_time)
-                # 대기 후 리셋
-                self.weight_used = 0
-                self.window_start = time.time()
+    def can_request(self, weight=1, priority=PRIORITY_BULK):
+        """요청 가능 여부 Confirm (레인 budget 기준, 차감 없음)"""
+        return self.limiter.has_capacity(weight, priority)
+
+    def wait_if_needed(self, weight=1, priority=PRIORITY_BULK, timeout=60.0):
+        """Required시 대기 후 weight 차감 (승인 여부 반환)"""
+        wait_start = time.time()
+        admitted = self.limiter.acquire('default', priority=priority, weight=weight, timeout=timeout)
+        wait_time = time.time() - wait_start
+        if wait_time >= 0.5:
+            print(f"⏳ Rate Limit waiting: {wait_time:.1f}s")
+            self.stats['wait_count'] += 1
+            self.stats['total_wait_time'] += wait_time
+        return admitted
 
     def get_stats_summary(self):
         """통계 요Approx 반환"""
@@ -518,7 +539,15 @@ def setup_logging():
 class OneMinuteSurgeEntryStrategy:
     """1minute candles 급등 초입 Entry 전략"""
     
-    def __init__(self, api_key=None, secret_key=None, sandbox=False):
+    def __init__(self, api_key=None, secret_key=None, sandbox=False, use_async_runtime=False,
+                 use_user_stream=True):
+        """
+        Args:
+            use_async_runtime: True면 ccxt.async_support 런타임 Starting (스캔 REST 폴백 / Position 조times를
+                               이벤트 루프에서 다중화, main()은 이벤트 루프 스케줄러로 스캔 / 모니터 Execute)
+            use_user_stream: True면 User Data Stream을 Position 상태 기준으로 Usage (REST는 5분 재조정 /
+                             스트림 공백 직후만, websocket-client 미설치 시 REST Sync Maintain)
+        """
         self.logger = setup_logging()
         
         # API Key가 None이면 BinanceConfig에서 가져오기
@@ -548,6 +577,8 @@ class OneMinuteSurgeEntryStrategy:
                         'recvWindow': 60000  # 60초 타임윈도우 (기본 10초 → 60초로 증가)
                     }
                 })
+                # 🛡️ 모든 REST 요청을 프로세스 공용 Rate Limiter로 집계 (주문 우선 레인)
+                install_rate_limiter(self.exchange, get_rate_limiter(self.logger))
 
                 # ⚡ Connections 풀 Size 최적화: Parallel processing 100count 워커 대응
                 try:
@@ -607,6 +638,7 @@ class OneMinuteSurgeEntryStrategy:
                     # 최소한의 Trade소 Settings만 Maintain
                     try:
                         self.exchange = ccxt.binance(config)
+                        install_rate_limiter(self.exchange, get_rate_limiter(self.logger))
                         # Symbol 목록만 하드코딩으로 Settings
                         self.logger.info("⚠️ WebSocket-only mode - Starting with limited features")
                         break  # WebSocket 모드로 계속 Progress
@@ -636,11 +668,9 @@ class OneMinuteSurgeEntryStrategy:
         self.initial_seed = 100.0  # 초기 시드 $100 (실제 시드에 맞게 Modify하세요)
 
         # OHLCV 데이터 Cache (Rate Limit times피용)
-        # 🚀 글로벌 Cache Usage (프Log램 재Starting 전까지 Maintain)
-        if not hasattr(self.__class__, '_global_ohlcv_cache'):
-            self.__class__._global_ohlcv_cache = {}
-        self._ohlcv_cache = self.__class__._global_ohlcv_cache  # 글로벌 Cache 참조
+        # 🚀 프로세스 공용 Cache (인스턴스 간 공유, 메모리 상한 LRU - bounded_cache.py)
         self._ohlcv_cache_ttl = 300  # 5분 (빠른 갱신으로 실Time성 향상)
+        self._ohlcv_cache = get_shared_cache().namespace('surge_ohlcv', ttl=self._ohlcv_cache_ttl)
 
         # 🚀 마켓 Info Cache (고속화: 초기 스캔 Time 90% 단축)
         self._market_cache = None
@@ -671,6 +701,14 @@ class OneMinuteSurgeEntryStrategy:
         self.position_cache = {}  # 실Time Position Cache
         self.sync_accuracy_threshold = 0.5  # 0.5% 이상 차이시 강제 Sync
 
+        # 📸 Position / mark price 공용 스냅샷 (fetch_positions / mark price 1times로 전체 갱신, 모든 소비자 공유)
+        self.position_snapshot = PositionSnapshot(self.exchange, logger=self.logger)
+
+        # ⚡ User Data Stream Position Sync (ACCOUNT_UPDATE → 스냅샷 즉시 반영, REST는 느린 재조정만)
+        self.user_stream_sync = None
+        if use_user_stream and api_key and secret_key and not sandbox:
+            self.start_user_stream()
+
         # DCA Cyclic trading수 시스템 Initialize (Sync 전에 None으로 Initialize Required)
         self.dca_manager = None
 
@@ -748,7 +786,8 @@ class OneMinuteSurgeEntryStrategy:
                 # WebSocket: 실Time Update용 (python-binance)
                 self.ws_kline_manager = BinanceWebSocketKlineManager(
                     callback=self.on_websocket_kline_update,
-                    logger=self.logger
+                    logger=self.logger,
+                    use_combined_stream=True  # Symbol당 소켓 대신 결합 스트림 다중화
                 )
 
                 # WebSocket Starting (Error Ignore and continue Progress)
@@ -767,6 +806,10 @@ class OneMinuteSurgeEntryStrategy:
                     # 🎯 동적 Symbol Subscription 시스템 Active화 (Filtering된 Symbol만 Subscription)
                     self._dynamic_websocket_subscription = True
                     self._subscribed_symbols = set()  # Current Subscription 중인 Symbol들 추적
+
+                    # 🩹 재Connections 사이 누락된 1minute candles 자동 보충 (공용 Rate Limiter 벌크 레인)
+                    if getattr(self, 'exchange', None) is not None:
+                        self.ws_kline_manager.enable_gap_repair(exchange=self.exchange)
                     print("🎯 동적 WebSocket subscription System Active화됨")
                     print("📡 Filtering된 Symbol만 동적으로 Subscription됩니다")
                 else:
@@ -791,7 +834,8 @@ class OneMinuteSurgeEntryStrategy:
                 # WebSocket 매니저 Create (공count 데이터, python-binance)
                 self.ws_kline_manager = BinanceWebSocketKlineManager(
                     callback=self.on_websocket_kline_update,
-                    logger=self.logger
+                    logger=self.logger,
+                    use_combined_stream=True  # Symbol당 소켓 대신 결합 스트림 다중화
                 )
 
                 # WebSocket Starting (Error Ignore and continue Progress)
@@ -806,6 +850,10 @@ class OneMinuteSurgeEntryStrategy:
                     # 🎯 동적 Symbol Subscription 시스템 Active화
                     self._dynamic_websocket_subscription = True
                     self._subscribed_symbols = set()
+
+                    # 🩹 재Connections 사이 누락된 1minute candles 자동 보충 (공용 Rate Limiter 벌크 레인)
+                    if getattr(self, 'exchange', None) is not None:
+                        self.ws_kline_manager.enable_gap_repair(exchange=self.exchange)
                     print("🎯 동적 WebSocket subscription System Active화됨")
                     print("📡 Filtering된 Symbol만 동적으로 Subscription됩니다")
                 else:
@@ -886,6 +934,9 @@ class OneMinuteSurgeEntryStrategy:
         # 구조: {symbol: {'partial_exits': [{...}], 'total_pnl': 0.0, 'exit_count': 0}}
         self.partial_exit_accumulator = {}
 
+        # 월간 통계 File 내용 {daily_file: monthly_data} (File당 1times Load, 이후 메모리에서 병합 → 기록만 예약)
+        self._monthly_stats = {}
+
         # Legacy 통계 File Load (재Starting 시 통계 복원)
         self._load_daily_stats()
 
@@ -901,13 +952,22 @@ class OneMinuteSurgeEntryStrategy:
         # ⚡ 고속 스캔 최적화 시스템
         self._ticker_cache = {}  # 티커 Cache (1초 TTL)
         self._scan_mode = False  # 스캔 모드 플래그 (True시 Debug 로깅 최소화)
+        self.batch_indicator_scan = True  # 스캔 지표 일괄 계산 (Symbol × 캔들 행렬, batch_indicators.py)
+        self._scan_frames = {}  # 스캔 중 (symbol, timeframe) -> 일괄 계산에 Usage한 프레임
+        self.process_scan_workers = 0  # 0: 스레드 스캔 (Legacy), N: 프로세스 N count로 Analysis (process_scan_executor.py)
+        self._process_scan_executor = None
 
         # 🕐 4Time봉 Filtering 타임스탬프 추적 (동적 증분 스캔용)
         self._last_full_scan_time = 0  # 마지막 전체 스캔 Time (timestamp)
 
         # 🛡️ Rate Limit weight 추적 시스템 Initialize
-        self.rate_tracker = RateLimitTracker()
-        self.logger.info("🛡️ Rate Limit 추적 System Initialization complete (per minute 1200 weight)")
+        self.rate_tracker = RateLimitTracker(get_rate_limiter(self.logger))
+        self.logger.info(f"🛡️ Rate Limit 추적 System Initialization complete (per minute {self.rate_tracker.max_weight} weight)")
+
+        # ⚡ 비동기 거래소 런타임 (opt-in): REST 요청을 스레드 대신 이벤트 루프 + 커넥션 풀에서 다중화
+        self.async_runtime = None
+        if use_async_runtime and not sandbox:
+            self.start_async_runtime()
 
         # 📊 주문 기록 Sync 시스템 Initialize
         self.order_history_sync = None
@@ -971,46 +1031,24 @@ class OneMinuteSurgeEntryStrategy:
             future_symbol = f"{clean_symbol}USDT"
             self.logger.debug(f"[Position check] {symbol} -> {future_symbol} 실Time 조times...")
             
-            # 특정 Symbol만 조times (전체 조times 대신)
-            try:
-                # 특정 Symbol Position만 조times (더 빠름)
-                position = self.exchange.fetch_position(future_symbol)
-                position_size = position.get('size', 0) or position.get('contracts', 0)
-                
-                has_position = position_size > 0
-                self.logger.debug(f"[Position check] {future_symbol} - Size: {position_size}, Position: {has_position}")
-                
-                # 🔧 Actual position Status와 Session cache sync
-                if has_position:
-                    # 실제로 Position이 있으면 Session Cache에 Add
-                    self._sent_signals.add(clean_symbol)
-                    self.logger.debug(f"[Position check] ✅ {clean_symbol} Session cache sync (Position 존재)")
-                else:
-                    # 실제로 Position이 없으면 Session Cache에서 Remove
-                    if clean_symbol in self._sent_signals:
-                        self._sent_signals.remove(clean_symbol)
-                        self.logger.debug(f"[Position check] 🔄 {clean_symbol} Session cache cleanup (No position)")
-                
-                return has_position
-                
-            except:
-                # fetch_position Failed 시 전체 조times로 폴백
-                positions = self.exchange.fetch_positions()
-                for position in positions:
-                    if position['symbol'] == future_symbol:
-                        position_size = position.get('size', 0) or position.get('contracts', 0)
-                        has_position = position_size > 0
-
-                        # 🔧 Actual position Status와 Session cache sync
-                        if has_position:
-                            self._sent_signals.add(clean_symbol)
-                        elif clean_symbol in self._sent_signals:
-                            self._sent_signals.remove(clean_symbol)
-
-                        return has_position
-
-                # No position
-                return False
+            # 공용 스냅샷에서 조times (오래됐으면 전체 Position 1times 갱신 - 후보 Symbol 수와 무관한 weight)
+            position = self.position_snapshot.get_position(f"{clean_symbol}/USDT:USDT")
+            position_size = abs(float(position.get('contracts') or 0)) if position else 0
+
+            has_position = position_size > 0
+            self.logger.debug(f"[Position check] {future_symbol} - Size: {position_size}, Position: {has_position}")
+
+            # 🔧 Actual position Status와 Session cache sync
+            if has_position:
+                # 실제로 Position이 있으면 Session Cache에 Add
+                self._sent_signals.add(clean_symbol)
+                self.logger.debug(f"[Position check] ✅ {clean_symbol} Session cache sync (Position 존재)")
+            elif clean_symbol in self._sent_signals:
+                # 실제로 Position이 없으면 Session Cache에서 Remove
+                self._sent_signals.remove(clean_symbol)
+                self.logger.debug(f"[Position check] 🔄 {clean_symbol} Session cache cleanup (No position)")
+
+            return has_position
             
         except Exception as e:
             # API 에러시에는 안전하게 True 반환 (중복 Entry 차단)
@@ -1169,7 +1207,7 @@ class OneMinuteSurgeEntryStrategy:
                 try:
                     ws_data = self.get_websocket_kline_data(symbol, timeframe, limit)
                     if ws_data is not None and len(ws_data) >= min(limit // 2, 200):  # 최소 50% 이상 데이터 있으면 Usage
-                        self._set_cached_data(cache_key, ws_data)
+                        # 링 버퍼 view는 Cache하지 않음 (조times 비용 O(1), 항상 최신)
                         return ws_data
                 except Exception as ws_error:
                     # WebSocket 조times Failed시 REST API fallback (무시하고 Progress)
@@ -1303,21 +1341,31 @@ class OneMinuteSurgeEntryStrategy:
                 'matched': False
             }  # 디버깅 Log Failed해도 전략 Execute은 계속
     
-    def get_ohlcv_data(self, symbol, timeframe, limit=1500):
-        """OHLCV 데이터 조times (캐싱 + WebSocket + API 폴백)"""
+    def get_cache_stats(self):
+        """OHLCV Cache 통계 (공용 Cache 전체 + surge_ohlcv 네임스페이스)"""
+        stats = get_shared_cache().get_stats()
+        stats['ohlcv'] = self._ohlcv_cache.get_stats()
+        return stats
+
+    def get_ohlcv_data(self, symbol, timeframe, limit=1500, allow_rest=True):
+        """
+        OHLCV 데이터 조times (캐싱 + WebSocket + API 폴백)
+
+        Args:
+            allow_rest: False면 Cache / WebSocket만 조times (REST 폴백 대상이면 None - 비동기 일괄 조times용)
+        """
         try:
             # 🚀 캐싱 시스템: 먼저 Cache 체크 (limit 무시하여 Cache 효율 극대화)
             cache_key = f"{symbol}_{timeframe}"  # limit Remove하여 Cache 히트율 증가
             current_time = time.time()
 
-            if hasattr(self, '_ohlcv_cache') and cache_key in self._ohlcv_cache:
-                cached_data, cached_time = self._ohlcv_cache[cache_key]
-                # Cache 유효성 Verification (TTL 체크)
-                if current_time - cached_time < self._ohlcv_cache_ttl:
-                    # Cache된 데이터가 요청된 limit보다 충분하면 슬라이싱하여 반환
-                    if len(cached_data) >= limit:
-                        return cached_data.tail(limit)
-                    return cached_data
+            # TTL 만료 항목은 None (네임스페이스 TTL = _ohlcv_cache_ttl)
+            cached_data = self._ohlcv_cache.get(cache_key) if hasattr(self, '_ohlcv_cache') else None
+            if cached_data is not None:
+                # Cache된 데이터가 요청된 limit보다 충분하면 슬라이싱하여 반환
+                if len(cached_data) >= limit:
+                    return cached_data.tail(limit)
+                return cached_data
 
             # 🚨 Rate Limit Situation에서는 WebSocket만 Usage하고 API calls 절대 금지
             if hasattr(self, '_api_rate_limited') and self._api_rate_limited:
@@ -1335,10 +1383,7 @@ class OneMinuteSurgeEntryStrategy:
                     # Rate Limit Situation에서는 WebSocket 데이터만 Usage
                     ws_data = self.get_websocket_kline_data(symbol, timeframe, limit)
                     if ws_data is not None:
-                        # 🚀 Cache에 Save
-                        if not hasattr(self, '_ohlcv_cache'):
-                            self._ohlcv_cache = {}
-                        self._ohlcv_cache[cache_key] = (ws_data, current_time)
+                        # 링 버퍼 view는 Cache하지 않음 (조times 비용 O(1), 항상 최신)
                         return ws_data
                     else:
                         self.logger.debug(f"🚨 Rate Limit Status - No WebSocket data: {symbol} {timeframe}")
@@ -1349,60 +1394,79 @@ class OneMinuteSurgeEntryStrategy:
                 # WebSocket 버퍼에서 데이터 조times Attempt
                 ws_data = self.get_websocket_kline_data(symbol, timeframe, limit)
                 if ws_data is not None and len(ws_data) >= 10:  # 최소 10count만 있어도 Usage (완화)
-                    # 🚀 Cache에 Save
-                    if not hasattr(self, '_ohlcv_cache'):
-                        self._ohlcv_cache = {}
-                    self._ohlcv_cache[cache_key] = (ws_data, current_time)
+                    # 링 버퍼 view는 Cache하지 않음 (조times 비용 O(1), 항상 최신)
                     return ws_data
                 
                 # 🚀 성능 최적화: 프리로딩 Skip (캐싱으로 대체)
                 # 프리로딩은 너무 느리므로 바로 API 폴백으로 이동
                 pass
             
-            # 🚨 Rate Limit 체크 강화: 418, 429 에러 감지시 즉시 차단
-            if hasattr(self, '_api_rate_limited') and self._api_rate_limited:
+            if not allow_rest or not self._rest_fallback_allowed(symbol, timeframe):
                 return None
-            
-            # 🔄 Hybrid mode: WebSocket 부족 시 REST API fallback (강력 제한!)
-            # 40% 미만일 때만 REST API Usage 허용 (더욱 보수적)
-            if hasattr(self, 'rate_tracker'):
-                current_usage = (self.rate_tracker.weight_used / self.rate_tracker.max_weight) * 100
-                if current_usage >= 40:  # 40% 넘으면 REST API blocked!
-                    self.logger.debug(f"Rate Limit {current_usage:.1f}% - REST API blocked: {symbol} {timeframe}")
-                    return None
 
-            try:
-                # Rate Limit 체크 및 대기
-                if hasattr(self, 'rate_tracker'):
-                    self.rate_tracker.wait_if_needed(weight=2)
-
-                # REST API로 데이터 가져오기 (Cache 효율)
-                self.logger.debug(f"Insufficient WebSocket data - REST API fallback: {symbol} {timeframe}")
-                fetch_limit = max(limit, 500)  # 2000 → 500 (더 적게)
-                ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe, limit=fetch_limit)
-
-                # Rate Limit 기록
-                if hasattr(self, 'rate_tracker'):
-                    self.rate_tracker.add_request(weight=2)
-
-                if ohlcv and len(ohlcv) >= 10:
-                    df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-                    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-
-                    # Cache Save
-                    if not hasattr(self, '_ohlcv_cache'):
-                        self._ohlcv_cache = {}
-                    self._ohlcv_cache[cache_key] = (df, current_time)
-                    return df
-                else:
-                    return None
-            except Exception as api_e:
-                self.logger.debug(f"REST API fallback Failed: {symbol} {timeframe} - {api_e}")
-                return None
+            fetch_limit = max(limit, 500)  # 2000 → 500 (더 적게)
+            fetch = lambda: self._fetch_ohlcv_rest(symbol, timeframe, fetch_limit, cache_key, current_time)
+            if self.exchange is None:
+                return fetch()
+            # 스캔 스레드 여러 count가 같은 Symbol/timeframe을 동시에 놓치면 REST 요청 한 번만 전송하고 결과 공유
+            return get_single_flight(self.exchange).do((symbol, timeframe, fetch_limit), fetch, name='fetch_ohlcv')
 
         except Exception as e:
             self.logger.error(f"{symbol} {timeframe} 데이터 조times Failed: {e}")
             return None
+
+    def _rest_fallback_allowed(self, symbol='', timeframe=''):
+        """REST 폴백 허용 여부 (418/429 감지 후 차단, budget 사용률 40% 이상이면 차단)"""
+        # 🚨 Rate Limit 체크 강화: 418, 429 에러 감지시 즉시 차단
+        if hasattr(self, '_api_rate_limited') and self._api_rate_limited:
+            return False
+
+        # 🔄 Hybrid mode: WebSocket 부족 시 REST API fallback (강력 제한!)
+        # 40% 미만일 때만 REST API Usage 허용 (더욱 보수적)
+        if hasattr(self, 'rate_tracker'):
+            current_usage = self.rate_tracker.usage_pct()
+            if current_usage >= 40:  # 40% 넘으면 REST API blocked!
+                self.logger.debug(f"Rate Limit {current_usage:.1f}% - REST API blocked: {symbol} {timeframe}")
+                return False
+        return True
+
+    def _store_ohlcv_rows(self, cache_key, ohlcv, current_time):
+        """REST OHLCV 행 → DataFrame (_ohlcv_cache Save), 10봉 미만이면 None"""
+        if ohlcv and len(ohlcv) >= 10:
+            df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+
+            # Cache Save (메모리 상한 초과 시 가장 오래 안 쓴 프레임부터 Remove)
+            self._ohlcv_cache.set(cache_key, df, current_time)
+            return df
+        return None
+
+    def _fetch_ohlcv_rest(self, symbol, timeframe, fetch_limit, cache_key, current_time):
+        """REST API fallback (벌크 레인 비차단 승인 → fetch_ohlcv → _ohlcv_cache Save)"""
+        try:
+            weight = 0
+
+            # Rate Limit 비차단 승인 (벌크 레인) - budget 없으면 대기 없이 Skip, 주문 레인은 영향 없음
+            if hasattr(self, 'rate_tracker'):
+                limiter = self.rate_tracker.limiter
+                kline_params = {'symbol': symbol, 'limit': fetch_limit}
+                weight = limiter._get_endpoint_weight('/fapi/v1/klines', kline_params)
+                if not limiter.try_acquire('/fapi/v1/klines', kline_params, priority=PRIORITY_BULK):
+                    self.logger.debug(f"Rate Limit bulk lane full - REST API skipped: {symbol} {timeframe}")
+                    return None
+
+            # REST API로 데이터 가져오기 (Cache 효율)
+            self.logger.debug(f"Insufficient WebSocket data - REST API fallback: {symbol} {timeframe}")
+            ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe, limit=fetch_limit)
+
+            # Rate Limit 기록
+            if hasattr(self, 'rate_tracker'):
+                self.rate_tracker.add_request(weight=weight)
+
+            return self._store_ohlcv_rows(cache_key, ohlcv, current_time)
+        except Exception as api_e:
+            self.logger.debug(f"REST API fallback Failed: {symbol} {timeframe} - {api_e}")
+            return None
     
     
     def update_websocket_kline(self, symbol, timeframe, kline_data):
@@ -1426,96 +1490,68 @@ class OneMinuteSurgeEntryStrategy:
             
             new_kline = [timestamp, open_price, high_price, low_price, close_price, volume]
             
-            # 버퍼에 Add (최대 1500count Maintain)
-            self._websocket_kline_buffer[buffer_key].append(new_kline)
+            # 같은 타임스탬프면 마지막 캔들 Update, 아니면 Add (최대 1500count Maintain)
+            buffer = self._websocket_kline_buffer[buffer_key]
+            if buffer and buffer[-1][0] == timestamp:
+                buffer[-1] = new_kline
+            else:
+                buffer.append(new_kline)
             
             # 조용한 데이터 수신 모니터링 (불Required한 출력 Remove)
-            if len(self._websocket_kline_buffer[buffer_key]) > 1500:
-                self._websocket_kline_buffer[buffer_key] = self._websocket_kline_buffer[buffer_key][-1500:]
+            if len(buffer) > 1500:
+                del buffer[0]
                 
         except Exception as e:
             self.logger.error(f"WebSocket kline 데이터 Update Failed ({symbol}, {timeframe}): {e}")
     
+    def _get_kline_resampler(self):
+        """상위 Timeframe 증분 집계 엔진 (kline_resampler.KlineResampler)"""
+        if not hasattr(self, '_kline_resampler'):
+            self._kline_resampler = KlineResampler()
+        return self._kline_resampler
+
+    def _get_indicator_engine(self):
+        """Symbol-Timeframe별 증분 지표 엔진 (incremental_indicators.IncrementalIndicatorEngine)"""
+        if not hasattr(self, '_indicator_engine'):
+            self._indicator_engine = IncrementalIndicatorEngine()
+        return self._indicator_engine
+
+    def get_latest_indicators(self, symbol, timeframe):
+        """증분 엔진의 최신 지표값 조times (재계산 없음, Status가 없으면 None)"""
+        return self._get_indicator_engine().latest(symbol, timeframe)
+
     def _generate_higher_timeframes_from_1m(self, symbol):
-        """1minute candles 데이터로부터 다른 Timeframe 데이터 Create"""
+        """1minute candles 데이터로부터 다른 Timeframe 데이터 Create (최신 1minute candles만 집계 엔진에 반영, Timeframe당 O(1))"""
         try:
             if not hasattr(self, '_websocket_kline_buffer'):
                 return
                 
             buffer_key_1m = f"{symbol}_1m"
-            if buffer_key_1m not in self._websocket_kline_buffer:
-                return
-                
-            kline_1m_data = self._websocket_kline_buffer[buffer_key_1m]
-            if len(kline_1m_data) < 5:  # 최소 5count는 있어야 변환 가능
+            if not self._websocket_kline_buffer.get(buffer_key_1m):
                 return
             
-            # 3minute candles Create (3count씩 묶어서)
-            if len(kline_1m_data) >= 3:
-                self._create_timeframe_from_1m(symbol, '3m', 3, kline_1m_data)
+            # 같은 1minute candles을 다시 넣어도 결과 동일 (Trade량 중복 합산 없음)
+            timestamp, open_price, high_price, low_price, close_price, volume = \
+                self._websocket_kline_buffer[buffer_key_1m][-1][:6]
+            updates = self._get_kline_resampler().update(
+                symbol, timestamp, open_price, high_price, low_price, close_price, volume
+            )
             
-            # 5minute candles Create (5count씩 묶어서)  
-            if len(kline_1m_data) >= 5:
-                self._create_timeframe_from_1m(symbol, '5m', 5, kline_1m_data)
-                
-            # 15minute candles Create (15count씩 묶어서)
-            if len(kline_1m_data) >= 15:
-                self._create_timeframe_from_1m(symbol, '15m', 15, kline_1m_data)
-                
-            # 1Time봉 Create (60count씩 묶어서)
-            if len(kline_1m_data) >= 60:
-                self._create_timeframe_from_1m(symbol, '1h', 60, kline_1m_data)
-                
-            # 4Time봉 Create (240count씩 묶어서) - 핵심 Filtering용
-            if len(kline_1m_data) >= 10:  # Test용: 최소 10count로 완화 (나중에 240으로 Recover)
-                self._create_timeframe_from_1m(symbol, '4h', 240, kline_1m_data)
+            for timeframe, candle in updates:
+                buffer_key = f"{symbol}_{timeframe}"
+                buffer = self._websocket_kline_buffer.setdefault(buffer_key, [])
                 
-            # 일봉 Create (1440count씩 묶어서) - 부분적으로라도
-            if len(kline_1m_data) >= 60:  # 최소 1Time치
-                self._create_timeframe_from_1m(symbol, '1d', 1440, kline_1m_data)
+                new_candle = list(candle[:6])  # [timestamp, open, high, low, close, volume]
+                if buffer and buffer[-1][0] == new_candle[0]:
+                    buffer[-1] = new_candle
+                else:
+                    buffer.append(new_candle)
+                    if len(buffer) > 100:  # 최근 100count만 Maintain
+                        del buffer[0]
                 
         except Exception as e:
             self.logger.error(f"Timeframe Create Failed ({symbol}): {e}")
     
-    def _create_timeframe_from_1m(self, symbol, target_timeframe, multiplier, kline_1m_data):
-        """1minute candles 데이터를 특정 Timeframe으로 변환"""
-        try:
-            buffer_key = f"{symbol}_{target_timeframe}"
-            
-            # Legacy 버퍼가 없으면 Create
-            if buffer_key not in self._websocket_kline_buffer:
-                self._websocket_kline_buffer[buffer_key] = []
-            
-            # multiplier 단위로 묶어서 변환
-            total_candles = len(kline_1m_data) // multiplier
-            if total_candles == 0:
-                return
-                
-            new_candles = []
-            for i in range(total_candles):
-                start_idx = i * multiplier
-                end_idx = start_idx + multiplier
-                candle_group = kline_1m_data[start_idx:end_idx]
-                
-                if len(candle_group) == multiplier:
-                    # OHLCV 계산
-                    timestamp = candle_group[0][0]  # 첫 번째 timestamp
-                    open_price = candle_group[0][1]  # 첫 번째 시가
-                    high_price = max(candle[2] for candle in candle_group)  # Highest price
-                    low_price = min(candle[3] for candle in candle_group)   # 최저가  
-                    close_price = candle_group[-1][4]  # 마지막 종가
-                    volume = sum(candle[5] for candle in candle_group)  # Trade량 합
-                    
-                    new_candle = [timestamp, open_price, high_price, low_price, close_price, volume]
-                    new_candles.append(new_candle)
-            
-            # 새로 Create된 캔들들로 버퍼 Update
-            if new_candles:
-                self._websocket_kline_buffer[buffer_key] = new_candles[-100:]  # 최근 100count만 Maintain
-                
-        except Exception as e:
-            self.logger.error(f"Timeframe 변환 Failed ({symbol}, {target_timeframe}): {e}")
-    
     def _fetch_all_timeframes_parallel(self, symbol, clean_symbol):
         """모든 Timeframe을 병렬로 한 번에 조times (75x 속도 향상)"""
         try:
@@ -1900,11 +1936,8 @@ class OneMinuteSurgeEntryStrategy:
                         ws_symbol += 'USDT'
 
                     for tf in ['3m', '5m', '15m', '1d']:
-                        for limit in [500, 100, 700, 150]:  # 각 Timeframe별 limit (4h Excluded)
-                            cache_key = f"{symbol}_{tf}_{limit}"
-                            if cache_key in self._ohlcv_cache:
-                                del self._ohlcv_cache[cache_key]
-                                removed_cache_count += 1
+                        if self._ohlcv_cache.pop(f"{symbol}_{tf}") is not None:
+                            removed_cache_count += 1
 
                     self._subscribed_symbols.discard(symbol)
 
@@ -1914,7 +1947,8 @@ class OneMinuteSurgeEntryStrategy:
             if to_subscribe or to_unsubscribe:
                 total_subscribed = len(self._subscribed_symbols)
                 cache_size = len(self._ohlcv_cache)
-                print(f"🎯 Symbol 추적 Update Complete: {total_subscribed}count Symbol, {cache_size}count Cache")
+                cache_mb = self._ohlcv_cache.get_stats()['bytes'] / (1024 * 1024)
+                print(f"🎯 Symbol 추적 Update Complete: {total_subscribed}count Symbol, {cache_size}count Cache ({cache_mb:.1f}MB)")
             
         except Exception as e:
             self.logger.error(f"WebSocket subscription Update Failed: {e}")
@@ -1968,8 +2002,25 @@ class OneMinuteSurgeEntryStrategy:
         # update_websocket_subscriptions()가 동적으로 Process
         pass
     
-    def calculate_indicators(self, df):
-        """기술적 지표 계산"""
+    def _cached_indicator(self, symbol, timeframe, kind, df, compute):
+        """공용 지표 Cache 조times (Symbol/Timeframe 미지정 시 바로 계산)"""
+        if df is None or symbol is None or timeframe is None:
+            return compute()
+        return get_indicator_cache().get_or_compute(symbol, timeframe, kind, df, compute)
+
+    def calculate_indicators(self, df, symbol=None, timeframe=None):
+        """
+        기술적 지표 계산
+
+        Args:
+            symbol, timeframe: 지정 시 공용 지표 Cache + 증분 지표 엔진 Usage
+                               (같은 프레임은 1times만 계산, 윈도우는 배치와 동일)
+        """
+        return self._cached_indicator(symbol, timeframe, 'surge_indicators', df,
+                                      lambda: self._compute_indicators(df, symbol, timeframe))
+
+    def _compute_indicators(self, df, symbol=None, timeframe=None):
+        """기술적 지표 계산 (Cache 미적용)"""
         try:
             if df is None:
                 return None
@@ -1994,209 +2045,145 @@ class OneMinuteSurgeEntryStrategy:
                 else:
                     return None
 
-            # 이동평균 (Length에 따라 적응적 계산)
-            df['ma5'] = df['close'].rolling(window=5).mean()
-            df['ma20'] = df['close'].rolling(window=min(20, len(df))).mean()
-            df['ma80'] = df['close'].rolling(window=min(80, len(df))).mean()
-            
-            # MA480은 데이터가 충분할 때만 계산
-            if len(df) >= 480:
-                df['ma480'] = df['close'].rolling(window=480).mean()
+            # 증분 지표 엔진: Symbol/Timeframe이 주어지면 이전 호출 이후 변경된 캔들만 반영
+            engine_df = None
+            if symbol is not None and timeframe is not None:
+                engine_df = self._get_indicator_engine().apply(symbol, timeframe, df)
+            if engine_df is None:
+                self._calculate_indicator_columns(df)
             else:
-                # 데이터가 부족하면 MA200 또는 최대 가능한 Length로 대체
-                ma_window = min(200, len(df) // 2) if len(df) > 20 else len(df) // 2
-                if ma_window > 0:
-                    df['ma480'] = df['close'].rolling(window=ma_window).mean()
-                else:
-                    df['ma480'] = df['close']
-
-            # 볼린저 밴드 (적응적 계산)
-            for period in [20, 80, 200]:
-                actual_period = min(period, len(df))
-                if actual_period >= 5:  # 최소 5count는 있어야 의미Present
-                    rolling_mean = df['close'].rolling(window=actual_period).mean()
-                    rolling_std = df['close'].rolling(window=actual_period).std()
-                    df[f'bb{period}_upper'] = rolling_mean + (rolling_std * 2)
-                    df[f'bb{period}_lower'] = rolling_mean - (rolling_std * 2)
-                else:
-                    df[f'bb{period}_upper'] = df['close']
-                    df[f'bb{period}_lower'] = df['close']
-            
-            # BB480과 BB600은 충분한 데이터가 있을 때만 계산
-            for period in [480, 600]:
-                if len(df) >= period:
-                    rolling_mean = df['close'].rolling(window=period).mean()
-                    rolling_std = df['close'].rolling(window=period).std()
-                    df[f'bb{period}_upper'] = rolling_mean + (rolling_std * 2)
-                    df[f'bb{period}_lower'] = rolling_mean - (rolling_std * 2)
-                else:
-                    # 🚀 count선된 대체 계산: 가용 데이터로 최대한 계산
-                    max_window = min(len(df) - 5, max(20, len(df) // 2))  # 최소 20, 최대 절반
-                    if max_window >= 20:
-                        # 가용한 최대 기간으로 볼린저 밴드 계산
-                        rolling_mean = df['close'].rolling(window=max_window).mean()
-                        rolling_std = df['close'].rolling(window=max_window).std()
-                        # BB600은 더 넓은 밴드를 가지도록 조정 (표준편차 배수 증가)
-                        std_multiplier = 2.5 if period == 600 else 2.2  # 600기간은 더 넓게
-                        df[f'bb{period}_upper'] = rolling_mean + (rolling_std * std_multiplier)
-                        df[f'bb{period}_lower'] = rolling_mean - (rolling_std * std_multiplier)
-                    elif f'bb200_upper' in df.columns:
-                        # BB200 기반 확장
-                        expansion_factor = 1.3 if period == 600 else 1.2
-                        df[f'bb{period}_upper'] = df['bb200_upper'] * expansion_factor
-                        df[f'bb{period}_lower'] = df['bb200_lower'] * (2 - expansion_factor)
-                    else:
-                        # MA 기반 최후 대안
-                        expansion_factor = 1.15 if period == 600 else 1.1
-                        df[f'bb{period}_upper'] = df['ma480'] * expansion_factor
-                        df[f'bb{period}_lower'] = df['ma480'] * (2 - expansion_factor)
-
-            # 일목균형표
-            # 기준선 (Kijun-sen) = (26일 Highest price + 26일 최저가) / 2
-            df['ichimoku_base'] = (df['high'].rolling(window=26).max() + df['low'].rolling(window=26).min()) / 2
-            # 전환선 (Tenkan-sen) = (9일 Highest price + 9일 최저가) / 2
-            df['ichimoku_conversion'] = (df['high'].rolling(window=9).max() + df['low'].rolling(window=9).min()) / 2
-
-            # SuperTrend 지표 Add (누락된 중요 지표)
-            if len(df) >= 20:  # SuperTrend 계산에 Required한 최소 데이터
-                try:
-                    # ATR 계산
-                    df['tr'] = np.maximum(
-                        df['high'] - df['low'],
-                        np.maximum(
-                            abs(df['high'] - df['close'].shift(1)),
-                            abs(df['low'] - df['close'].shift(1))
-                        )
-                    )
-                    df['atr'] = df['tr'].rolling(window=10).mean()
-                    
-                    # SuperTrend 계산 (10-3 Settings)
-                    hl2 = (df['high'] + df['low']) / 2
-                    multiplier = 3.0
-                    df['upper_band'] = hl2 + (multiplier * df['atr'])
-                    df['lower_band'] = hl2 - (multiplier * df['atr'])
-                    
-                    # SuperTrend 라인과 방향 계산
-                    df['supertrend'] = 0.0
-                    df['supertrend_direction'] = 0  # 1: 상승, -1: 하락
-                    df['supertrend_signal'] = 0    # 별칭 (호환성)
-                    
-                    for i in range(10, len(df)):
-                        prev_close = df['close'].iloc[i-1]
-                        curr_close = df['close'].iloc[i]
-                        upper_band = df['upper_band'].iloc[i]
-                        lower_band = df['lower_band'].iloc[i]
-                        prev_supertrend = df['supertrend'].iloc[i-1] if i > 10 else upper_band
-                        prev_direction = df['supertrend_direction'].iloc[i-1] if i > 10 else -1
-                        
-                        # SuperTrend 계산 로직
-                        if prev_direction == 1:  # 이전이 상승 트렌드
-                            if curr_close < lower_band:
-                                df.loc[df.index[i], 'supertrend'] = upper_band
-                                df.loc[df.index[i], 'supertrend_direction'] = -1
-                                df.loc[df.index[i], 'supertrend_signal'] = -1
-                            else:
-                                df.loc[df.index[i], 'supertrend'] = max(lower_band, prev_supertrend)
-                                df.loc[df.index[i], 'supertrend_direction'] = 1
-                                df.loc[df.index[i], 'supertrend_signal'] = 1
-                        else:  # 이전이 하락 트렌드
-                            if curr_close > upper_band:
-                                df.loc[df.index[i], 'supertrend'] = lower_band
-                                df.loc[df.index[i], 'supertrend_direction'] = 1
-                                df.loc[df.index[i], 'supertrend_signal'] = 1
-                            else:
-                                df.loc[df.index[i], 'supertrend'] = min(upper_band, prev_supertrend)
-                                df.loc[df.index[i], 'supertrend_direction'] = -1
-                                df.loc[df.index[i], 'supertrend_signal'] = -1
-                    
-                except Exception as st_error:
-                    self.logger.warning(f"SuperTrend 계산 Failed: {st_error}")
-                    # SuperTrend Failed시 기본값 Settings (전략 우times를 위해)
-                    df['supertrend'] = df['close']
-                    df['supertrend_direction'] = 1  # 기본값을 상승으로 Settings
-                    df['supertrend_signal'] = 1
-
-            # 최소 데이터 Verification (더 관대한 기준)
-            recent_check = df.tail(10)
-            
-            # 기본 지표 Verification
-            ma20_valid = recent_check['ma20'].notna().sum()
-            ma80_valid = recent_check['ma80'].notna().sum()
-            
-            if ma20_valid < 3 or ma80_valid < 3:
-                self._write_debug_log(f"지표 계산 Failed: 기본 MA Insufficient data (MA20:{ma20_valid}/10, MA80:{ma80_valid}/10)")
-                return None
-            
-            # MA480은 조건부 Verification (충분한 데이터가 있을 때만)
-            if len(df) >= 480:
-                ma480_valid = recent_check['ma480'].notna().sum()
-                if ma480_valid < 3:  # 5 -> 3으로 완화
-                    self._write_debug_log(f"지표 계산 Failed: MA480 Insufficient data (유효:{ma480_valid}/10)")
-                    return None
-
-            # BB600 Verification: 원래 계산 또는 대체 계산 모두 허용
-            if 'bb600_upper' in df.columns:
-                bb600_valid = recent_check['bb600_upper'].notna().sum()
-                if bb600_valid < 1:  # 2 -> 1로 완화 (대체 계산도 허용)
-                    self._write_debug_log(f"지표 계산 Failed: BB600 Insufficient data (유효:{bb600_valid}/1) - 대체계산 포함")
-                    return None
-                # 대체 계산 Usage 시 Debug Info
-                if len(df) < 600:
-                    self._write_debug_log(f"[INFO] BB600 대체계산 Usage: 데이터{len(df)}count로 추정계산")
+                df = engine_df
 
-            return df
+            return self._validate_indicator_columns(df)
         except Exception as e:
             self.logger.error(f"지표 계산 Failed: {e}")
             return None
 
-    def calculate_supertrend(self, df, period=10, multiplier=3.0):
-        """SuperTrend 지표 계산"""
+    def _validate_indicator_columns(self, df):
+        """지표 계산 결과 최소 데이터 Verification (통과 시 df, 아니면 None)"""
+        # 최소 데이터 Verification (더 관대한 기준)
+        def recent_valid(column):
+            # 최근 10봉 유효값 count (tail().notna()와 동일, 프레임 생성 없이 배열로 계산)
+            return int(np.count_nonzero(~np.isnan(df[column].to_numpy(dtype=np.float64)[-10:])))
+        
+        # 기본 지표 Verification
+        ma20_valid = recent_valid('ma20')
+        ma80_valid = recent_valid('ma80')
+        
+        if ma20_valid < 3 or ma80_valid < 3:
+            self._write_debug_log(f"지표 계산 Failed: 기본 MA Insufficient data (MA20:{ma20_valid}/10, MA80:{ma80_valid}/10)")
+            return None
+        
+        # MA480은 조건부 Verification (충분한 데이터가 있을 때만)
+        if len(df) >= 480:
+            ma480_valid = recent_valid('ma480')
+            if ma480_valid < 3:  # 5 -> 3으로 완화
+                self._write_debug_log(f"지표 계산 Failed: MA480 Insufficient data (유효:{ma480_valid}/10)")
+                return None
+
+        # BB600 Verification: 원래 계산 또는 대체 계산 모두 허용
+        if 'bb600_upper' in df.columns:
+            bb600_valid = recent_valid('bb600_upper')
+            if bb600_valid < 1:  # 2 -> 1로 완화 (대체 계산도 허용)
+                self._write_debug_log(f"지표 계산 Failed: BB600 Insufficient data (유효:{bb600_valid}/1) - 대체계산 포함")
+                return None
+            # 대체 계산 Usage 시 Debug Info
+            if len(df) < 600:
+                self._write_debug_log(f"[INFO] BB600 대체계산 Usage: 데이터{len(df)}count로 추정계산")
+
+        return df
+
+    def _calculate_indicator_columns(self, df):
+        """지표 컬럼 배치 계산 (in-place, 프레임 전체 재계산)"""
+        # 이동평균 (Length에 따라 적응적 계산)
+        df['ma5'] = df['close'].rolling(window=5).mean()
+        df['ma20'] = df['close'].rolling(window=min(20, len(df))).mean()
+        df['ma80'] = df['close'].rolling(window=min(80, len(df))).mean()
+        
+        # MA480은 데이터가 충분할 때만 계산
+        if len(df) >= 480:
+            df['ma480'] = df['close'].rolling(window=480).mean()
+        else:
+            # 데이터가 부족하면 MA200 또는 최대 가능한 Length로 대체
+            ma_window = min(200, len(df) // 2) if len(df) > 20 else len(df) // 2
+            if ma_window > 0:
+                df['ma480'] = df['close'].rolling(window=ma_window).mean()
+            else:
+                df['ma480'] = df['close']
+
+        # 볼린저 밴드 (적응적 계산)
+        for period in [20, 80, 200]:
+            actual_period = min(period, len(df))
+            if actual_period >= 5:  # 최소 5count는 있어야 의미Present
+                rolling_mean = df['close'].rolling(window=actual_period).mean()
+                rolling_std = df['close'].rolling(window=actual_period).std()
+                df[f'bb{period}_upper'] = rolling_mean + (rolling_std * 2)
+                df[f'bb{period}_lower'] = rolling_mean - (rolling_std * 2)
+            else:
+                df[f'bb{period}_upper'] = df['close']
+                df[f'bb{period}_lower'] = df['close']
+        
+        # BB480과 BB600은 충분한 데이터가 있을 때만 계산
+        for period in [480, 600]:
+            if len(df) >= period:
+                rolling_mean = df['close'].rolling(window=period).mean()
+                rolling_std = df['close'].rolling(window=period).std()
+                df[f'bb{period}_upper'] = rolling_mean + (rolling_std * 2)
+                df[f'bb{period}_lower'] = rolling_mean - (rolling_std * 2)
+            else:
+                # 🚀 count선된 대체 계산: 가용 데이터로 최대한 계산
+                max_window = min(len(df) - 5, max(20, len(df) // 2))  # 최소 20, 최대 절반
+                if max_window >= 20:
+                    # 가용한 최대 기간으로 볼린저 밴드 계산
+                    rolling_mean = df['close'].rolling(window=max_window).mean()
+                    rolling_std = df['close'].rolling(window=max_window).std()
+                    # BB600은 더 넓은 밴드를 가지도록 조정 (표준편차 배수 증가)
+                    std_multiplier = 2.5 if period == 600 else 2.2  # 600기간은 더 넓게
+                    df[f'bb{period}_upper'] = rolling_mean + (rolling_std * std_multiplier)
+                    df[f'bb{period}_lower'] = rolling_mean - (rolling_std * std_multiplier)
+                elif f'bb200_upper' in df.columns:
+                    # BB200 기반 확장
+                    expansion_factor = 1.3 if period == 600 else 1.2
+                    df[f'bb{period}_upper'] = df['bb200_upper'] * expansion_factor
+                    df[f'bb{period}_lower'] = df['bb200_lower'] * (2 - expansion_factor)
+                else:
+                    # MA 기반 최후 대안
+                    expansion_factor = 1.15 if period == 600 else 1.1
+                    df[f'bb{period}_upper'] = df['ma480'] * expansion_factor
+                    df[f'bb{period}_lower'] = df['ma480'] * (2 - expansion_factor)
+
+        # 일목균형표
+        # 기준선 (Kijun-sen) = (26일 Highest price + 26일 최저가) / 2
+        df['ichimoku_base'] = (df['high'].rolling(window=26).max() + df['low'].rolling(window=26).min()) / 2
+        # 전환선 (Tenkan-sen) = (9일 Highest price + 9일 최저가) / 2
+        df['ichimoku_conversion'] = (df['high'].rolling(window=9).max() + df['low'].rolling(window=9).min()) / 2
+
+        # SuperTrend 지표 Add (누락된 중요 지표)
+        if len(df) >= 20:  # SuperTrend 계산에 Required한 최소 데이터
+            try:
+                # SuperTrend (10-3 Settings, 벡터화 커널)
+                add_supertrend_columns(df, period=10, multiplier=3.0, start=10, signal_column=True)
+                
+            except Exception as st_error:
+                self.logger.warning(f"SuperTrend 계산 Failed: {st_error}")
+                # SuperTrend Failed시 기본값 Settings (전략 우times를 위해)
+                df['supertrend'] = df['close']
+                df['supertrend_direction'] = 1  # 기본값을 상승으로 Settings
+                df['supertrend_signal'] = 1
+
+    def calculate_supertrend(self, df, period=10, multiplier=3.0, symbol=None, timeframe=None):
+        """SuperTrend 지표 계산 (symbol/timeframe 지정 시 공용 지표 Cache Usage)"""
+        return self._cached_indicator(symbol, timeframe, ('supertrend', period, multiplier), df,
+                                      lambda: self._compute_supertrend(df, period, multiplier))
+
+    def _compute_supertrend(self, df, period=10, multiplier=3.0):
+        """SuperTrend 지표 계산 (Cache 미적용)"""
         try:
             if df is None or len(df) < period:
                 return None
             
-            # ATR 계산
-            df['tr'] = np.maximum(
-                df['high'] - df['low'],
-                np.maximum(
-                    abs(df['high'] - df['close'].shift(1)),
-                    abs(df['low'] - df['close'].shift(1))
-                )
-            )
-            df['atr'] = df['tr'].rolling(window=period).mean()
-            
-            # SuperTrend 계산
-            hl2 = (df['high'] + df['low']) / 2
-            df['upper_band'] = hl2 + (multiplier * df['atr'])
-            df['lower_band'] = hl2 - (multiplier * df['atr'])
-            
-            # SuperTrend 라인 계산
-            df['supertrend'] = 0.0
-            df['supertrend_direction'] = 0  # 1: 상승, -1: 하락
-            
-            for i in range(period, len(df)):
-                prev_close = df['close'].iloc[i-1]
-                curr_close = df['close'].iloc[i]
-                upper_band = df['upper_band'].iloc[i]
-                lower_band = df['lower_band'].iloc[i]
-                prev_supertrend = df['supertrend'].iloc[i-1] if i > period else upper_band
-                prev_direction = df['supertrend_direction'].iloc[i-1] if i > period else -1
-                
-                # SuperTrend 계산 로직
-                if prev_direction == 1:  # 이전이 상승 트렌드
-                    if curr_close < lower_band:
-                        df.loc[df.index[i], 'supertrend'] = upper_band
-                        df.loc[df.index[i], 'supertrend_direction'] = -1
-                    else:
-                        df.loc[df.index[i], 'supertrend'] = max(lower_band, prev_supertrend)
-                        df.loc[df.index[i], 'supertrend_direction'] = 1
-                else:  # 이전이 하락 트렌드
-                    if curr_close > upper_band:
-                        df.loc[df.index[i], 'supertrend'] = lower_band
-                        df.loc[df.index[i], 'supertrend_direction'] = 1
-                    else:
-                        df.loc[df.index[i], 'supertrend'] = min(upper_band, prev_supertrend)
-                        df.loc[df.index[i], 'supertrend_direction'] = -1
+            # SuperTrend 계산 (벡터화 커널)
+            add_supertrend_columns(df, period=period, multiplier=multiplier)
             
             return df
             
@@ -2211,7 +2198,7 @@ class OneMinuteSurgeEntryStrategy:
                 return False
             
             # SuperTrend 계산
-            df_5m_calc = self.calculate_supertrend(df_5m, period=10, multiplier=3.0)
+            df_5m_calc = self.calculate_supertrend(df_5m, period=10, multiplier=3.0, symbol=symbol, timeframe='5m')
             if df_5m_calc is None:
                 return False
             
@@ -2248,15 +2235,10 @@ class OneMinuteSurgeEntryStrategy:
                 self.logger.debug(f"SuperTrend 5-candle condition passed ({clean_symbol}): Currently in uptrend")
                 return True
             
-            # 조건 2: 최근 5봉 이내 하락→상승 전환 (지연 최소화)
-            for i in range(1, len(recent_5)):
-                prev_direction = recent_5.iloc[i-1][direction_col]
-                curr_direction = recent_5.iloc[i][direction_col]
-                
-                # 하락(-1)에서 상승(1)으로 전환시 매수 시그널
-                if prev_direction == -1 and curr_direction == 1:
-                    self.logger.debug(f"SuperTrend 5-candle condition passed ({symbol}): Conversion signal found")
-                    return True
+            # 조건 2: 최근 5봉 이내 하락(-1)→상승(1) 전환 (지연 최소화)
+            if direction_flip_found(recent_5[direction_col].to_numpy(), -1, 1):
+                self.logger.debug(f"SuperTrend 5-candle condition passed ({symbol}): Conversion signal found")
+                return True
             
             # 조건 3: 임시 완화 - Current price가 SuperTrend 값보다 높으면 상승 신호로 간주
             if 'supertrend' in df_5m_calc.columns:
@@ -2303,17 +2285,8 @@ class OneMinuteSurgeEntryStrategy:
                 recent_30 = df_1m.tail(30)
                 
                 if len(recent_30) >= 2 and 'ma80' in df_1m.columns and 'ma480' in df_1m.columns:
-                    for i in range(len(recent_30) - 1):
-                        prev_ma80 = recent_30.iloc[i]['ma80'] 
-                        prev_ma480 = recent_30.iloc[i]['ma480']
-                        curr_ma80 = recent_30.iloc[i+1]['ma80']
-                        curr_ma480 = recent_30.iloc[i+1]['ma480']
-                        
-                        if (pd.notna(prev_ma80) and pd.notna(prev_ma480) and 
-                            pd.notna(curr_ma80) and pd.notna(curr_ma480)):
-                            if prev_ma80 <= prev_ma480 and curr_ma80 > curr_ma480:
-                                golden_cross_index = i + 1
-                                break
+                    golden_cross_index = first_cross_position(
+                        tail_values(recent_30, 'ma80'), tail_values(recent_30, 'ma480'), golden=True)
                 
                 if golden_cross_index is not None:
                     # 골든크로스 이후 데이터 추출 (최대 60봉 범위)
@@ -2331,35 +2304,18 @@ class OneMinuteSurgeEntryStrategy:
                         if 'ichimoku_conversion' in df_1m.columns:
                             # 60봉 범위 내에서 20봉 이내 데드크로스 찾기
                             search_limit = min(20, len(target_data) - 1)
-                            for i in range(search_limit):
-                                prev_ma5 = target_data.iloc[i]['ma5']
-                                prev_conversion = target_data.iloc[i]['ichimoku_conversion']
-                                curr_ma5 = target_data.iloc[i+1]['ma5']
-                                curr_conversion = target_data.iloc[i+1]['ichimoku_conversion']
-                                
-                                if (pd.notna(prev_ma5) and pd.notna(prev_conversion) and 
-                                    pd.notna(curr_ma5) and pd.notna(curr_conversion)):
-                                    if prev_ma5 >= prev_conversion and curr_ma5 < curr_conversion:
-                                        ma5_conversion_dead_found = True
-                                        dead_cross_index = i + 1
-                                        break
+                            dead_cross_index = first_cross_position(
+                                tail_values(target_data, 'ma5'), tail_values(target_data, 'ichimoku_conversion'),
+                                golden=False, max_pairs=search_limit)
+                            ma5_conversion_dead_found = dead_cross_index is not None
                         
                         # 3봉이내 전환선 골든크로스와 MA20 골든크로스 동시 체크
                         recent_3 = df_1m.tail(3)
                         conversion_and_ma20_cross = False
                         
                         if len(recent_3) >= 1:
-                            for _, row in recent_3.iterrows():
-                                if (pd.notna(row['open']) and pd.notna(row['close']) and 
-                                    pd.notna(row['ichimoku_conversion']) and pd.notna(row['ma20'])):
-                                    # 시가<전환선 and 종가>전환선 and 시가<ma20 and 종가>ma20
-                                    conversion_cross = (row['open'] < row['ichimoku_conversion'] and 
-                                                      row['close'] > row['ichimoku_conversion'])
-                                    ma20_cross = (row['open'] < row['ma20'] and row['close'] > row['ma20'])
-                                    
-                                    if conversion_cross and ma20_cross:
-                                        conversion_and_ma20_cross = True
-                                        break
+                            # 시가<전환선 and 종가>전환선 and 시가<ma20 and 종가>ma20
+                            conversion_and_ma20_cross = body_cross_found(recent_3, ('ichimoku_conversion', 'ma20'), 3)
                         
                         condition_2 = ma5_conversion_dead_found and conversion_and_ma20_cross
                         
@@ -2416,13 +2372,7 @@ class OneMinuteSurgeEntryStrategy:
             # 3minute candles 20봉 = 60분 (1minute candles 60봉과 동일한 Time)
             extreme_surge_60_candles = False
             if df_3m is not None and len(df_3m) >= 20:
-                recent_20_3m = df_3m.tail(20)
-                for _, row in recent_20_3m.iterrows():
-                    if pd.notna(row['high']) and pd.notna(row['open']) and row['open'] > 0:
-                        open_to_high_pct = ((row['high'] - row['open']) / row['open']) * 100
-                        if open_to_high_pct >= 30.0:
-                            extreme_surge_60_candles = True
-                            break
+                extreme_surge_60_candles = count_high_vs_open_in_range_vectorized(df_3m, 30.0, recent_n=20) > 0
 
             # 30% 이상 급등 Symbol은 Excluded
             if extreme_surge_60_candles:
@@ -2443,7 +2393,7 @@ class OneMinuteSurgeEntryStrategy:
 
             if strategy_3m_additional_enabled and df_3m is not None and len(df_3m) >= 40:  # 최소 40봉 Required (BB80 돌파 조건용)
                 # 3minute candles 지표 계산
-                df_3m_calc = self.calculate_indicators(df_3m)
+                df_3m_calc = self.calculate_indicators(df_3m, symbol, '3m')
                 if df_3m_calc is not None:
                     # === 3minute candles 통합 조건: (MA80<MA480 and 40봉이내 BB80상한선 돌파) OR 300봉이내 MA80-MA480 골든크로스 ===
                     condition_3m_unified = False
@@ -2478,19 +2428,16 @@ class OneMinuteSurgeEntryStrategy:
                             bb80_std_calc = df_3m_calc['close'].rolling(window=bb80_period).std()
                             df_3m_calc['bb80_upper'] = df_3m_calc['bb80_middle'] + (bb80_std_calc * bb80_std)
                         
-                        for i, (_, row) in enumerate(recent_40_3m.iterrows()):
-                            if (pd.notna(row['open']) and pd.notna(row['high']) and 
-                                pd.notna(row['bb80_upper'])):
-                                open_below_bb80 = row['open'] < row['bb80_upper']
-                                high_above_bb80 = row['high'] > row['bb80_upper']
-                                
-                                if open_below_bb80 and high_above_bb80:
-                                    bb80_breakthrough_count += 1
-                                    if not bb80_breakthrough_found:
-                                        bb80_breakthrough_found = True
-                                        # 첫 번째 돌파 발견시 디버깅 Log
-                                        debug_msg = f"[DEBUG-통합조건2] {symbol}: 첫번째 BB80돌파 발견! 인덱스={i}, 시가={row['open']:.6f}, 고가={row['high']:.6f}, BB80상한={row['bb80_upper']:.6f}\n"
-                                        self._write_debug_log(debug_msg)
+                        # 시가 < BB80상한 and 고가 > BB80상한
+                        breakthrough_positions = open_below_high_above_positions(recent_40_3m, 'bb80_upper', 40)
+                        bb80_breakthrough_count = len(breakthrough_positions)
+                        if bb80_breakthrough_count > 0:
+                            bb80_breakthrough_found = True
+                            # 첫 번째 돌파 발견시 디버깅 Log
+                            i = int(breakthrough_positions[0])
+                            row = recent_40_3m.iloc[i]
+                            debug_msg = f"[DEBUG-통합조건2] {symbol}: 첫번째 BB80돌파 발견! 인덱스={i}, 시가={row['open']:.6f}, 고가={row['high']:.6f}, BB80상한={row['bb80_upper']:.6f}\n"
+                            self._write_debug_log(debug_msg)
                         
                     # BB80 돌파 조건 디버깅 Log
                     debug_msg = f"[DEBUG-통합조건2] {symbol}: 40봉이내 BB80돌파={bb80_breakthrough_found}, 돌파횟수={bb80_breakthrough_count}, 검사대상봉수={len(recent_40_3m) if len(df_3m_calc) >= 40 else 0}\n"
@@ -2569,7 +2516,7 @@ class OneMinuteSurgeEntryStrategy:
                         conditions_3m_2nd.append(f"[3minute candles 2번째-1] 일봉상 High vs Open 50%이하: {condition_3m_1}")
 
                         # 2. 120봉이내 bb80상단선-bb600상단선 골든크로스 OR 이격도 3% 이내
-                        df_3m_calc = self.calculate_indicators(df_3m)
+                        df_3m_calc = self.calculate_indicators(df_3m, symbol, '3m')
                         condition_3m_2 = False
                         if df_3m_calc is not None and len(df_3m_calc) >= 120:
                             bb80_bb600_golden_3m = find_golden_cross_vectorized(df_3m_calc, 'bb80_upper', 'bb600_upper', recent_n=120)
@@ -2622,13 +2569,7 @@ class OneMinuteSurgeEntryStrategy:
                     # 5. 60봉이내 High vs Open 3~20% 1times이상
                     condition_3m_5 = False
                     if df_3m is not None and len(df_3m) >= 60:
-                        recent_60_3m = df_3m.tail(60)
-                        surge_count = 0
-                        for _, row in recent_60_3m.iterrows():
-                            if pd.notna(row['open']) and pd.notna(row['high']) and row['open'] > 0:
-                                open_to_high_pct = ((row['high'] - row['open']) / row['open']) * 100
-                                if 3.0 <= open_to_high_pct <= 20.0:
-                                    surge_count += 1
+                        surge_count = count_high_vs_open_in_range_vectorized(df_3m, 3.0, 20.0, recent_n=60)
                         condition_3m_5 = surge_count >= 1
 
                     conditions_3m_2nd.append(f"[3minute candles 2번째-5] 60봉이내 High vs Open 3~20% 1times이상: {condition_3m_5}")
@@ -2638,47 +2579,12 @@ class OneMinuteSurgeEntryStrategy:
                     if df_3m_calc is not None and len(df_3m_calc) >= 30:
                         recent_30_3m = df_3m_calc.tail(30)
 
-                        # 6-1. 30봉 내 3연속 양봉 찾기
-                        has_three_green = False
-                        for i in range(len(recent_30_3m) - 2):
-                            candle1 = recent_30_3m.iloc[i]
-                            candle2 = recent_30_3m.iloc[i+1]
-                            candle3 = recent_30_3m.iloc[i+2]
-
-                            # 3연속 양봉 체크 (종가 > 시가)
-                            if (pd.notna(candle1['open']) and pd.notna(candle1['close']) and candle1['close'] > candle1['open'] and
-                                pd.notna(candle2['open']) and pd.notna(candle2['close']) and candle2['close'] > candle2['open'] and
-                                pd.notna(candle3['open']) and pd.notna(candle3['close']) and candle3['close'] > candle3['open']):
-                                has_three_green = True
-                                break
+                        # 6-1. 30봉 내 3연속 양봉 찾기 (종가 > 시가)
+                        has_three_green = consecutive_bullish_found(recent_30_3m, 30, run=3)
 
                         # 6-2. 30봉 내에서 (MA5우하향 AND 1봉전MA5돌파) 패턴 찾기
-                        ma5_pattern_found = False
-                        for i in range(1, len(recent_30_3m)):  # 1부터 Starting (이전 봉과 비교 위해)
-                            current_candle = recent_30_3m.iloc[i]
-                            prev_candle = recent_30_3m.iloc[i-1]
-                            
-                            # 해당 시점에서 MA5 우하향 체크
-                            if i >= 1 and i < len(recent_30_3m) - 1:
-                                curr_ma5 = current_candle['ma5']
-                                next_ma5 = recent_30_3m.iloc[i+1]['ma5'] if i+1 < len(recent_30_3m) else None
-                                
-                                # MA5 우하향: Current MA5 < 다음 MA5 (Time 순서상)
-                                ma5_downtrend = False
-                                if pd.notna(curr_ma5) and pd.notna(next_ma5):
-                                    ma5_downtrend = curr_ma5 > next_ma5  # Time이 지나면서 MA5가 하락
-
-                                # 해당 시점에서 MA5 돌파 체크 (시가<MA5 and 종가>MA5)
-                                ma5_cross = False
-                                if (pd.notna(current_candle['open']) and pd.notna(current_candle['close']) and 
-                                    pd.notna(current_candle['ma5'])):
-                                    ma5_cross = (current_candle['open'] < current_candle['ma5'] and
-                                               current_candle['close'] > current_candle['ma5'])
-
-                                # 두 조건 모두 만족하면 패턴 발견
-                                if ma5_downtrend and ma5_cross:
-                                    ma5_pattern_found = True
-                                    break
+                        # MA5 우하향: 해당 봉 MA5 > 다음 봉 MA5, MA5 돌파: 시가<MA5 and 종가>MA5
+                        ma5_pattern_found = ma_downtrend_cross_found(recent_30_3m, 30, 'ma5')
 
                     # Final 조건: 3연속 양봉 AND 30봉 내 (MA5우하향 AND 1봉전MA5돌파) 패턴
                     condition_3m_6 = has_three_green and ma5_pattern_found
@@ -2742,7 +2648,7 @@ class OneMinuteSurgeEntryStrategy:
                     # ⚡ SuperTrend 통과시에만 나머지 조건 체크 (조기 Terminate)
                     if supertrend_signal:
                         # 지표 계산 (SuperTrend 통과한 경우만)
-                        df_3m_calc = self.calculate_indicators(df_3m)
+                        df_3m_calc = self.calculate_indicators(df_3m, symbol, '3m')
 
                         # 1. 60봉이내 bb200상단선(표준편차2)-bb480상단선(표준편차1.5) 골든크로스
                         condition_3m_c1 = False
@@ -2847,7 +2753,7 @@ class OneMinuteSurgeEntryStrategy:
             if strategy_5m_4th_enabled and df_5m is not None and len(df_5m) >= 30:  # 30봉 Required (Approx 2.5Time)
                 try:
                     # 5minute candles 데이터에 지표 계산
-                    df_5m_calc = self.calculate_indicators(df_5m)
+                    df_5m_calc = self.calculate_indicators(df_5m, symbol, '5m')
                     
                     if df_5m_calc is not None and len(df_5m_calc) >= 30:  # 30봉 Required
                         # Initialize: 모든 조건 False로 Starting
@@ -2863,7 +2769,7 @@ class OneMinuteSurgeEntryStrategy:
                         
                         # 조건 1: 15minute candles MA80<MA480 (가장 빠른 체크)
                         if df_15m is not None and len(df_15m) >= 20:
-                            df_15m_calc = self.calculate_indicators(df_15m)
+                            df_15m_calc = self.calculate_indicators(df_15m, symbol, '15m')
                             if df_15m_calc is not None and len(df_15m_calc) > 0:
                                 latest_15m = df_15m_calc.iloc[-1]
                                 if (pd.notna(latest_15m['ma80']) and pd.notna(latest_15m['ma480'])):
@@ -2923,75 +2829,26 @@ class OneMinuteSurgeEntryStrategy:
                                         recent_data = df_5m_calc.tail(60)  # 100→60으로 완화
 
                                         # 연속 하락 구간 찾기
-                                        max_consecutive_down = 0
-                                        current_consecutive = 0
-
-                                        for i in range(1, len(recent_data)):
-                                            if (pd.notna(recent_data.iloc[i]['ma480']) and
-                                                pd.notna(recent_data.iloc[i-1]['ma480']) and
-                                                recent_data.iloc[i]['ma480'] < recent_data.iloc[i-1]['ma480']):
-                                                current_consecutive += 1
-                                                max_consecutive_down = max(max_consecutive_down, current_consecutive)
-                                            else:
-                                                current_consecutive = 0
-
+                                        max_consecutive_down = max_consecutive_decline(tail_values(recent_data, 'ma480'))
                                         ma480_downtrend_10 = max_consecutive_down >= 5
 
                                         # BB200상한선이 MA480을 골든크로스 Confirm - 700봉 전체를 대상으로 검사
                                         # "BB200상단선이 MA480을 골든크로스" = BB200 상단선이 MA480을 아래에서 위로 돌파
-                                        bb200_ma480_debug_info = []
-                                        total_cross_count = 0
-
-                                        # 700봉 전체에서 골든크로스 검사 (df_5m_calc Usage)
-                                        for i in range(1, len(df_5m_calc)):
-                                            prev_candle = df_5m_calc.iloc[i-1]
-                                            curr_candle = df_5m_calc.iloc[i]
-
-                                            if (pd.notna(prev_candle['bb200_upper']) and pd.notna(prev_candle['ma480']) and
-                                                pd.notna(curr_candle['bb200_upper']) and pd.notna(curr_candle['ma480'])):
-
-                                                # "BB200상단선이 MA480을 골든크로스": BB200 상단선이 MA480을 아래에서 위로 돌파
-                                                # 이전 봉: BB200 < MA480, Current 봉: BB200 >= MA480
-                                                bb200_golden_cross = (prev_candle['bb200_upper'] < prev_candle['ma480'] and
-                                                                      curr_candle['bb200_upper'] >= curr_candle['ma480'])
-
-                                                if bb200_golden_cross:
-                                                    bb200_ma480_golden = True
-                                                    total_cross_count += 1
-                                                    cross_info = f"BB200→MA480골든크로스 발견! 인덱스={i}: 이전봉(BB200={prev_candle['bb200_upper']:.6f} < MA480={prev_candle['ma480']:.6f}) → Current봉(BB200={curr_candle['bb200_upper']:.6f} >= MA480={curr_candle['ma480']:.6f})"
-                                                    bb200_ma480_debug_info.append(cross_info)
-                                                    # 첫 번째 골든크로스 발견 시 Terminate하지 않고 계속 검사하여 count수 세기
-                                                    if total_cross_count >= 3:  # 최대 3count까지만 디버깅 Info 수집
-                                                        break
-
-                                        # 골든크로스가 발견되지 않은 경우, 최근 5봉만 디버깅 Info 수집
-                                        if not bb200_ma480_golden and len(recent_data) >= 5:
-                                            for i in range(len(recent_data) - 5, len(recent_data)):
-                                                if i > 0:
-                                                    prev_candle = recent_data.iloc[i-1]
-                                                    curr_candle = recent_data.iloc[i]
-
-                                                    if (pd.notna(prev_candle['bb200_upper']) and pd.notna(prev_candle['ma480']) and
-                                                        pd.notna(curr_candle['bb200_upper']) and pd.notna(curr_candle['ma480'])):
-
-                                                        prev_ma480 = prev_candle['ma480']
-                                                        curr_ma480 = curr_candle['ma480']
-                                                        prev_bb200 = prev_candle['bb200_upper']
-                                                        curr_bb200 = curr_candle['bb200_upper']
-
-                                                        # 관통 패턴 Analysis
-                                                        cross_analysis = ""
-                                                        if prev_ma480 < prev_bb200 and curr_ma480 >= curr_bb200:
-                                                            cross_analysis = "→골든크로스1!"
-                                                        elif prev_ma480 >= prev_bb200 and curr_ma480 < curr_bb200:
-                                                            cross_analysis = "→골든크로스2!"
-                                                        else:
-                                                            cross_analysis = "→changeAbsent"
-
-                                                        bb200_ma480_debug_info.append(f"봉{i}: MA480={curr_ma480:.6f}, BB200상한={curr_bb200:.6f} {cross_analysis}")
+                                        # 이전 봉: BB200 < MA480, Current 봉: BB200 >= MA480 (최대 3count까지만 디버깅 Info 수집)
+                                        bb200_values = tail_values(df_5m_calc, 'bb200_upper')
+                                        ma480_values = tail_values(df_5m_calc, 'ma480')
+                                        cross_at = cross_positions(bb200_values, ma480_values, golden=True,
+                                                                   prev_inclusive=False, curr_inclusive=True, max_count=3)
+                                        bb200_ma480_golden = len(cross_at) > 0
+                                        total_cross_count = len(cross_at)
 
                                         # 디버깅 Info 출력 (MA480 5연속하락이 True인 경우 항상 출력)
                                         if ma480_downtrend_10:
+                                            bb200_ma480_debug_info = [
+                                                f"BB200→MA480골든크로스 발견! 인덱스={i}: 이전봉(BB200={bb200_values[i-1]:.6f} < MA480={ma480_values[i-1]:.6f}) → Current봉(BB200={bb200_values[i]:.6f} >= MA480={ma480_values[i]:.6f})"
+                                                for i in cross_at
+                                            ]
+
                                             debug_msg = f"[BB200-MA480 DEBUG] {symbol}: 5연속하락감지(최대연속={max_consecutive_down})"
                                             debug_msg += f" | 검사범위={len(df_5m_calc)}봉(700봉)"
 
@@ -3004,16 +2861,15 @@ class OneMinuteSurgeEntryStrategy:
                                                     last_candle = recent_data.iloc[-1]
                                                     debug_msg += f" | 최근봉: MA480={last_candle.get('ma480', 'N/A'):.6f}, BB200상한={last_candle.get('bb200_upper', 'N/A'):.6f}"
                                                     # 가장 최근의 몇 count 값도 보여주기
-                                                    recent_values = []
-                                                    for j in range(max(0, len(recent_data)-3), len(recent_data)):
-                                                        candle = recent_data.iloc[j]
-                                                        if pd.notna(candle.get('ma480')) and pd.notna(candle.get('bb200_upper')):
-                                                            ma480_val = candle['ma480']
-                                                            bb200_val = candle['bb200_upper']
-                                                            diff = bb200_val - ma480_val
-                                                            recent_values.append(f"봉{j}(차이={diff:.6f})")
-                                                    if recent_values:
-                                                        debug_msg += f" | 최근차이: {', '.join(recent_values)}"
+                                                    recent_ma480 = ma480_values[len(ma480_values) - len(recent_data):]
+                                                    recent_bb200 = bb200_values[len(bb200_values) - len(recent_data):]
+                                                    recent_diffs = [
+                                                        f"봉{j}(차이={recent_bb200[j] - recent_ma480[j]:.6f})"
+                                                        for j in range(max(0, len(recent_data)-3), len(recent_data))
+                                                        if not (np.isnan(recent_ma480[j]) or np.isnan(recent_bb200[j]))
+                                                    ]
+                                                    if recent_diffs:
+                                                        debug_msg += f" | 최근차이: {', '.join(recent_diffs)}"
 
                                             debug_msg += f" | 골든크로스={bb200_ma480_golden}"
                                             self._write_debug_log(debug_msg)
@@ -3203,20 +3059,7 @@ class OneMinuteSurgeEntryStrategy:
                 # ⚡ 스캔 모드시 Debug 출력 Skip
                 if not self._scan_mode:
                     self._write_debug_log(f"[DEBUG] [{clean_symbol}] Active positions 감지 - Analysis Skip")
-                # DCA 매니저가 있으면 Cyclic trading Status 체크
-                if self.dca_manager and hasattr(self.dca_manager, 'positions'):
-                    if symbol in self.dca_manager.positions:
-                        position = self.dca_manager.positions[symbol]
-                        # Cyclic trading 재Entry 가능 Status인지 체크
-                        if (position.cyclic_state == "cyclic_paused" and 
-                            position.cyclic_count < position.max_cyclic_count):
-                            # Cyclic trading 재Entry 허용 (이는 DCA 매니저에서 Process됨)
-                            pass
-                        else:
-                            # 일반 Position 또는 Cyclic trading Complete된 Status
-                            return None
-                else:
-                    # DCA 매니저가 없으면 Legacy 로직 Maintain
+                if self._skip_symbol_with_position(symbol):
                     return None
             
             # 🚀 성능 최적화: WebSocket 프리로딩 비Active화 (10초 병목 Remove)
@@ -3278,8 +3121,12 @@ class OneMinuteSurgeEntryStrategy:
             def safe_fetch_websocket_with_history(timeframe, limit):
                 """캐싱 Active화된 데이터 조times (get_ohlcv_data Usage)"""
                 try:
-                    # 🚀 캐싱 시스템이 적용된 get_ohlcv_data Usage
-                    df = self.get_ohlcv_data(symbol, timeframe, limit)
+                    # 스캔 일괄 계산에 Usage한 프레임 우선 (지표 Cache 히트), 없으면 get_ohlcv_data Usage
+                    scan_frames = getattr(self, '_scan_frames', None)
+                    df = scan_frames.get((symbol, timeframe)) if scan_frames else None
+                    if df is None:
+                        # 🚀 캐싱 시스템이 적용된 get_ohlcv_data Usage
+                        df = self.get_ohlcv_data(symbol, timeframe, limit)
 
                     if df is not None and len(df) >= 10:
                         # Cache 히트 여부 체크 (limit Remove)
@@ -3385,7 +3232,7 @@ class OneMinuteSurgeEntryStrategy:
 
             # 🚀 극한 최적화: 필수 지표만 계산 + 병렬화
             if df_1m is not None:
-                df_1m = self.calculate_indicators(df_1m)
+                df_1m = self.calculate_indicators(df_1m, symbol, '1m')
                 if df_1m is None:
                     # 지표 계산 Failed 시에도 기본값으로 계속 Progress
                     if not self._scan_mode:
@@ -3488,9 +3335,9 @@ class OneMinuteSurgeEntryStrategy:
             else:
                 # 🚀 지연 계산: 3minute candles, 15minute candles 지표를 조건 체크 직전에만 계산
                 if df_3m is not None:
-                    df_3m = self.calculate_indicators(df_3m)
+                    df_3m = self.calculate_indicators(df_3m, symbol, '3m')
                 if 'df_15m' in locals() and df_15m is not None:
-                    df_15m = self.calculate_indicators(df_15m)
+                    df_15m = self.calculate_indicators(df_15m, symbol, '15m')
                 elif 'df_15m' not in locals():
                     df_15m = None  # 🔒 안전장치: 변수 정의되지 않은 경우 None으로 Settings
                 
@@ -4216,6 +4063,336 @@ class OneMinuteSurgeEntryStrategy:
             print(f"\n[WATCHLIST] 관심종목 (3~4count 조 미충족)")
             print("   Absent")
 
+    # analyze_symbol이 지표를 계산하는 Timeframe / 조times 수 (safe_fetch_websocket_with_history 호출과 동일)
+    SCAN_INDICATOR_TIMEFRAMES = (('3m', 250), ('5m', 100), ('15m', 400), ('1m', 100))
+    # 프로세스 스캔: 워커는 거래소 Connections이 없으므로 analyze_symbol이 조times하는 모든 Timeframe을 미리 전달
+    SCAN_PROCESS_TIMEFRAMES = SCAN_INDICATOR_TIMEFRAMES + (('1d', 10),)
+
+    def _skip_symbol_with_position(self, symbol):
+        """Position 보유 Symbol Analysis Skip 여부 (Cyclic trading 재Entry 가능 Status면 Analysis 계속)"""
+        if symbol not in self.active_positions:
+            return False
+        # DCA 매니저가 있으면 Cyclic trading Status 체크
+        if self.dca_manager and hasattr(self.dca_manager, 'positions'):
+            if symbol in self.dca_manager.positions:
+                position = self.dca_manager.positions[symbol]
+                # Cyclic trading 재Entry 허용 (이는 DCA 매니저에서 Process됨)
+                if (position.cyclic_state == "cyclic_paused" and
+                        position.cyclic_count < position.max_cyclic_count):
+                    return False
+                # 일반 Position 또는 Cyclic trading Complete된 Status
+                return True
+            return False
+        # DCA 매니저가 없으면 Legacy 로직 Maintain
+        return True
+
+    @classmethod
+    def create_scan_worker(cls, debug_log_file=None):
+        """
+        프로세스 스캔 워커용 인스턴스 (거래소 / WebSocket / DCA Connections 없음)
+
+        analyze_symbol은 _scan_frames에 적재된 프레임만 Usage하며,
+        Position 보유 Symbol 판정은 부모 프로세스에서 미리 Process합니다.
+        """
+        strategy = cls.__new__(cls)
+        strategy.logger = logging.getLogger(f"{__name__}.scan_worker")
+        strategy.logger.setLevel(logging.ERROR)
+        strategy.debug_log_file = debug_log_file
+        strategy.exchange = None
+        strategy.ws_kline_manager = None
+        strategy.async_runtime = None  # 워커는 네트워크 없음 (_prefetch_scan_frames 동기 경로)
+        strategy.dca_manager = None
+        strategy.active_positions = {}
+        strategy._ohlcv_cache_ttl = 300
+        strategy._ohlcv_cache = get_shared_cache().namespace('surge_ohlcv', ttl=strategy._ohlcv_cache_ttl)
+        strategy._data_cache = {}
+        strategy._cache_ttl = 60
+        strategy._api_rate_limited = False
+        strategy._scan_mode = True
+        strategy._scan_frames = {}
+        strategy._last_analysis_results = {}
+        return strategy
+
+    def _prefetch_scan_frames(self, symbols, timeframes):
+        """스캔 프레임 병렬 조times (analyze_symbol과 같은 get_ohlcv_data 경로) → (symbol, timeframe) -> df"""
+        scan_frames = {}
+        pairs = [(symbol, tf, limit) for symbol in symbols for tf, limit in timeframes]
+        if self.async_runtime is not None:
+            return self._prefetch_scan_frames_async(pairs)
+        with ThreadPoolExecutor(max_workers=min(15, max(1, len(pairs)))) as executor:
+            futures = {executor.submit(self.get_ohlcv_data, symbol, tf, limit): (symbol, tf)
+                       for symbol, tf, limit in pairs}
+            for future, key in futures.items():
+                try:
+                    df = future.result(timeout=10)
+                except Exception:
+                    continue
+                if df is not None and len(df) >= 10:
+                    scan_frames[key] = df
+        return scan_frames
+
+    def _prefetch_scan_frames_async(self, pairs):
+        """
+        스캔 프레임 조times (비동기 런타임): Cache / WebSocket 버퍼는 바로, 부족한 프레임만 REST 동시 요청
+
+        REST 폴백은 스레드 풀 대신 이벤트 루프에서 한 번에 다중화하며 (커넥션 풀 재Usage),
+        벌크 레인은 동기 경로와 같이 비차단 승인 (budget이 없으면 해당 프레임만 Skip)입니다.
+        """
+        scan_frames = {}
+        missing = []
+        for symbol, tf, limit in pairs:
+            df = self.get_ohlcv_data(symbol, tf, limit, allow_rest=False)
+            if df is not None and len(df) >= 10:
+                scan_frames[(symbol, tf)] = df
+            elif df is None:
+                missing.append((symbol, tf, max(limit, 500)))
+
+        if not missing or not self._rest_fallback_allowed():
+            return scan_frames
+
+        current_time = time.time()
+        try:
+            results = self.async_runtime.fetch_ohlcv_many(missing, admission_timeout=0, timeout=30)
+        except Exception as e:
+            self.logger.debug(f"비동기 REST 폴백 Failed: {e}")
+            return scan_frames
+
+        limiter = self.rate_tracker.limiter
+        for symbol, tf, fetch_limit in missing:
+            ohlcv = results.get((symbol, tf))
+            if isinstance(ohlcv, Exception):
+                self.logger.debug(f"REST API fallback Failed: {symbol} {tf} - {ohlcv}")
+                continue
+            self.rate_tracker.add_request(
+                weight=limiter._get_endpoint_weight('/fapi/v1/klines', {'symbol': symbol, 'limit': fetch_limit}))
+            df = self._store_ohlcv_rows(f"{symbol}_{tf}", ohlcv, current_time)
+            if df is not None:
+                scan_frames[(symbol, tf)] = df
+        print(f"⚡ 비동기 REST 폴백: {len(missing)}count 프레임 동시 요청 → {len(scan_frames)}count 확보")
+        return scan_frames
+
+    def _precompute_scan_indicators(self, symbols):
+        """
+        스캔 대상 전체 Symbol의 지표를 Timeframe별 (Symbol × 캔들) 행렬로 일괄 계산
+
+        프레임은 analyze_symbol과 같은 경로(get_ohlcv_data)로 병렬 조times한 뒤 _scan_frames에 보관하고,
+        계산 결과는 공용 지표 Cache에 Save합니다. analyze_symbol은 같은 프레임을 Usage하므로
+        calculate_indicators 호출이 Cache 히트(행 슬라이스)가 됩니다.
+        행렬 계산 대상이 아닌 프레임(짧은 프레임 / NaN 포함)은 기존처럼 Symbol별로 계산됩니다.
+        """
+        start_time = time.time()
+        scan_frames = {}
+        try:
+            scan_frames = self._prefetch_scan_frames(symbols, self.SCAN_INDICATOR_TIMEFRAMES)
+
+            cache = get_indicator_cache()
+            # 스캔 프레임 + DCA/Exit 계산 항목 여유분
+            cache.reserve(len(scan_frames) * 2)
+            computed_count = 0
+            for timeframe, _ in self.SCAN_INDICATOR_TIMEFRAMES:
+                frames = {symbol: df for (symbol, tf), df in scan_frames.items() if tf == timeframe}
+                for symbol, df_calc in compute_indicator_frames(frames).items():
+                    try:
+                        result = self._validate_indicator_columns(df_calc)
+                    except Exception as e:
+                        self.logger.debug(f"일괄 지표 Verification Failed: {symbol} {timeframe} - {e}")
+                        continue
+                    if cache.store(symbol, timeframe, 'surge_indicators', frames[symbol], result):
+                        computed_count += 1
+
+            self._scan_frames = scan_frames
+            print(f"⚡ 지표 일괄 계산 Complete: {computed_count}/{len(scan_frames)}count 프레임 "
+                  f"({(time.time() - start_time) * 1000:.0f}ms)")
+        except Exception as e:
+            self._scan_frames = scan_frames
+            self.logger.error(f"지표 일괄 계산 Failed: {e}")
+
+    def _get_process_scan_executor(self):
+        """프로세스 스캔 풀 (process_scan_workers 변경 시 재Create)"""
+        executor = self._process_scan_executor
+        if executor is None or executor.workers != self.process_scan_workers:
+            if executor is not None:
+                executor.shutdown()
+            executor = ProcessScanExecutor(workers=self.process_scan_workers,
+                                           debug_log_file=getattr(self, 'debug_log_file', None))
+            self._process_scan_executor = executor
+        return executor
+
+    def shutdown_process_scan(self):
+        """프로세스 스캔 워커 Terminate"""
+        if self._process_scan_executor is not None:
+            self._process_scan_executor.shutdown()
+            self._process_scan_executor = None
+
+    def start_async_runtime(self):
+        """
+        ccxt.async_support 런타임 Starting (동기 거래소와 같은 키 / 옵션 / markets 공유)
+
+        - ccxt 내부 throttle (rateLimit 200ms 직렬화)은 끄고 공용 Rate Limiter 승인만 Usage
+        - 미설치 / Failed 시 None (동기 경로 Maintain)
+        """
+        if self.async_runtime is not None:
+            return self.async_runtime
+        if not HAS_ASYNC_RUNTIME or self.exchange is None:
+            self.logger.warning("⚠️ ccxt.async_support 사용 불가 - 동기 REST 경로 Usage")
+            return None
+        options = {key: value for key, value in self.exchange.options.items()
+                   if key in ('defaultType', 'adjustForTimeDifference', 'recvWindow', 'timeDifference')}
+        config = {
+            'apiKey': self.exchange.apiKey,
+            'secret': self.exchange.secret,
+            'enableRateLimit': False,
+            'timeout': self.exchange.timeout,
+            'options': options,
+        }
+        try:
+            self.async_runtime = AsyncExchangeRuntime(config, limiter=get_rate_limiter(self.logger),
+                                                      logger=self.logger, markets_from=self.exchange).start()
+        except Exception as e:
+            self.logger.error(f"❌ 비동기 거래소 런타임 Starting Failed - 동기 경로 Usage: {e}")
+            self.async_runtime = None
+        return self.async_runtime
+
+    def shutdown_async_runtime(self):
+        """비동기 거래소 런타임 Terminate (커넥션 풀 닫기)"""
+        if self.async_runtime is not None:
+            self.async_runtime.stop()
+            self.async_runtime = None
+
+    def start_user_stream(self):
+        """
+        User Data Stream Starting + Position 스냅샷 연결
+
+        - ACCOUNT_UPDATE로 스냅샷이 갱신되는 동안 Position Sync는 REST 없이 스냅샷을 읽음
+        - 연결 직후 / 재연결 후 / 5분마다 fetch_positions() 1times로 재조정
+        - 미설치 / Failed 시 None (5초 REST Sync Maintain)
+        """
+        if self.user_stream_sync is not None:
+            return self.user_stream_sync
+        if not HAS_USER_DATA_STREAM or self.exchange is None:
+            self.logger.warning("⚠️ User Data Stream 사용 불가 (websocket-client 미설치) - REST Position Sync Usage")
+            return None
+        try:
+            stream = BinanceUserDataStream(self.exchange, logger=self.logger)
+            self.user_stream_sync = UserStreamPositionSync(stream, self.position_snapshot, logger=self.logger,
+                                                           reconcile_interval=300)
+            self.user_stream_sync.order_callbacks.append(self._on_stream_order)
+            if not stream.start():
+                raise RuntimeError("Listen Key / WebSocket 연결 Failed")
+            self.logger.info("⚡ User Data Stream Position Sync Starting (REST 재조정 5분 주기)")
+        except Exception as e:
+            self.logger.error(f"❌ User Data Stream Starting Failed - REST Position Sync Usage: {e}")
+            self.user_stream_sync = None
+            self.position_snapshot.set_live_source(None)
+        return self.user_stream_sync
+
+    def shutdown_user_stream(self):
+        """User Data Stream Terminate (스냅샷은 REST 갱신으로 복귀)"""
+        if self.user_stream_sync is not None:
+            self.position_snapshot.set_live_source(None)
+            self.user_stream_sync.stream.stop()
+            self.user_stream_sync = None
+
+    def _on_stream_order(self, order):
+        """ORDER_TRADE_UPDATE → DCA 지정가 체결 / Cancel 즉시 반영 (주문 ID 색인, DCA 주문 아니면 무시)"""
+        if self.dca_manager and hasattr(self.dca_manager, 'on_order_update'):
+            self.dca_manager.on_order_update(order)
+
+    def wait_position_event(self, timeout):
+        """스트림 Position 변경이 오거나 timeout이 지날 때까지 대기 (스트림 없으면 sleep)"""
+        if self.user_stream_sync is not None:
+            return self.user_stream_sync.wait(timeout)
+        time.sleep(timeout)
+        return False
+
+    def _apply_stream_changes(self, reconciled):
+        """스트림으로 바뀐 Position을 DCA 시스템에 반영 (REST 재조정 직후에는 전체 Sync)"""
+        changes = self.user_stream_sync.drain_changes()
+        if not self.dca_manager:
+            return
+        if reconciled:
+            if hasattr(self.dca_manager, 'sync_with_exchange'):
+                self.dca_manager.sync_with_exchange()
+            return
+        for symbol, position in changes.items():
+            try:
+                self.dca_manager.apply_exchange_position(symbol, position)
+            except Exception as e:
+                self.logger.error(f"❌ {symbol} DCA 스트림 Position 반영 Failed: {e}")
+
+    def _fetch_positions_by_symbol(self, symbols):
+        """
+        Symbol별 Position 목록 → {symbol: Position 목록 또는 예외}
+
+        공용 스냅샷에서 읽습니다 (오래됐으면 fetch_positions() 1times로 전체 갱신 - Symbol 수와 무관한 weight).
+        갱신 Failed 시 모든 Symbol에 같은 예외를 돌려줍니다.
+        """
+        symbols = list(symbols)
+        try:
+            self.position_snapshot.refresh_positions()
+        except Exception as e:
+            return {symbol: e for symbol in symbols}
+        return {symbol: self.position_snapshot.fetch_positions([symbol]) for symbol in symbols}
+
+    def _collect_recovery_positions(self, symbols, label):
+        """DCA Recover용 {symbol: contracts / markPrice}, {symbol: mark price} (공용 스냅샷 기준)"""
+        exchange_positions = {}
+        current_prices = {}
+        for symbol, positions in self._fetch_positions_by_symbol(symbols).items():
+            if isinstance(positions, Exception):
+                print(f"[{label}] ⚠️ {symbol} Position 조times Failed: {positions}")
+                continue
+            if positions and positions[0].get('contracts', 0) > 0:
+                mark_price = positions[0]['markPrice']
+                exchange_positions[symbol] = {
+                    'contracts': positions[0]['contracts'],
+                    'markPrice': mark_price
+                }
+                current_prices[symbol] = mark_price
+        return exchange_positions, current_prices
+
+    def _scan_symbols_in_processes(self, symbols, tickers_cache):
+        """
+        프로세스 풀 스캔: 프레임을 SharedMemory로 공유하고 워커가 지표 계산 + 조건 평가
+
+        Returns:
+            tuple: (all_results, total_analyzed, results_found), Failed 시 None (스레드 스캔으로 폴백)
+        """
+        start_time = time.time()
+        try:
+            targets = [symbol for symbol in symbols
+                       if isinstance(symbol, str) and not self._skip_symbol_with_position(symbol)]
+            frames = self._prefetch_scan_frames(targets, self.SCAN_PROCESS_TIMEFRAMES)
+            tickers = {symbol: {'percentage': tickers_cache[symbol].get('percentage')}
+                       for symbol in targets if symbol in tickers_cache}
+            executor = self._get_process_scan_executor()
+            outcome = executor.scan(frames, targets, tickers)
+        except Exception as e:
+            self.logger.error(f"프로세스 스캔 Failed - 스레드 스캔으로 폴백: {e}")
+            return None
+
+        # 워커에서 Save된 전략 Info 반영 (스레드 스캔과 동일하게 check_surge_entry_conditions 기록 우선)
+        if not hasattr(self, '_last_analysis_results'):
+            self._last_analysis_results = {}
+        self._last_analysis_results.update(outcome.records)
+
+        all_results = []
+        results_found = 0
+        for symbol in targets:
+            result = outcome.results.get(symbol)
+            if not result:
+                continue
+            results_found += 1
+            if isinstance(result, dict):
+                all_results.append(result)
+            elif isinstance(result, list):
+                all_results.extend(result)
+
+        print(f"⚡ 프로세스 스캔 Complete: {len(outcome.results)}/{len(targets)}count Symbol "
+              f"(워커 {executor.workers}count, 공유 {outcome.shared_bytes / 1024:.0f}KB, "
+              f"Failed 청크 {outcome.failed_chunks}count, {(time.time() - start_time) * 1000:.0f}ms)")
+        return all_results, len(outcome.results), results_found
+
     def scan_symbols(self, symbols):
         """Symbol들 병렬 스캔 (Rate Limit 고려) - 버그 Modify된 안전 버전"""
         # 🔄 스캔 전 Position Sync (수동 Exit 반영) - 조용한 모드
@@ -4241,7 +4418,8 @@ class OneMinuteSurgeEntryStrategy:
         print("📊 티커 데이터 수집 중...")
         tickers_cache = {}
         try:
-            all_tickers = self.exchange.fetch_tickers()
+            exchange = self.async_runtime.sync if self.async_runtime is not None else self.exchange
+            all_tickers = exchange.fetch_tickers()
             for symbol in symbols:
                 if symbol in all_tickers:
                     tickers_cache[symbol] = all_tickers[symbol]
@@ -4249,8 +4427,22 @@ class OneMinuteSurgeEntryStrategy:
         except Exception as e:
             print(f"⚠️ 티커 데이터 수집 Failed: {e} - WebSocket 데이터로 폴백")
 
+        speed_test_mode = hasattr(self, '_speed_test_mode') and self._speed_test_mode
+
+        # 🚀 프로세스 스캔 (opt-in): 지표 계산 + 조건 평가를 워커 프로세스에서 Execute (멀티 코어)
+        process_scan = None
+        if self.process_scan_workers > 0 and not speed_test_mode:
+            process_scan = self._scan_symbols_in_processes(symbols, tickers_cache)
+
+        # 🚀 지표 일괄 계산: Timeframe별 (Symbol × 캔들) 행렬 1times → analyze_symbol은 Cache된 행 슬라이스 Usage
+        if process_scan is None and self.batch_indicator_scan:
+            self._precompute_scan_indicators(symbols)
+
+        if process_scan is not None:
+            all_results, total_analyzed, results_found = process_scan
+
         # 🚀 극한 속도 모드: Parallel processing 간소화 (250ms 목표)
-        if hasattr(self, '_speed_test_mode') and self._speed_test_mode:
+        elif speed_test_mode:
             # 순차 Process로 Change (Parallel processing 오버헤드 Remove)
             for symbol in symbols:
                 try:
@@ -4280,7 +4472,8 @@ class OneMinuteSurgeEntryStrategy:
                     except Exception as submit_error:
                         self.logger.error(f"{symbol} 작업 제출 Failed: {submit_error}")
 
-                # Cache 통계
+                # Cache 통계 (만료 항목 정리 후)
+                get_shared_cache().purge_expired()
                 cache_size = len(self._ohlcv_cache)
                 expected_cache_entries = len(symbols) * 4  # 4 timeframes per symbol
 
@@ -4570,6 +4763,7 @@ class OneMinuteSurgeEntryStrategy:
 
         # ⚡ 스캔 모드 비Active화 및 Log 레벨 복원
         self._scan_mode = False
+        self._scan_frames = {}
         self.logger.setLevel(original_log_level)
 
         return entry_signals
@@ -5154,7 +5348,7 @@ class OneMinuteSurgeEntryStrategy:
                 return {'exit_signal': False, 'reason': 'Insufficient data'}
 
             # 기술적 지표 계산 (ma5, bb80_upper 등)
-            df_1m = self.calculate_indicators(df_1m)
+            df_1m = self.calculate_indicators(df_1m, symbol, '1m')
             if df_1m is None:
                 return {'exit_signal': False, 'reason': '지표 계산 Failed'}
 
@@ -5337,7 +5531,7 @@ class OneMinuteSurgeEntryStrategy:
                     df_5m_exit = self.get_ohlcv_data(symbol, '5m', limit=20)
                     if df_5m_exit is not None and len(df_5m_exit) >= 10:
                         # SuperTrend 지표 계산 (period=10, multiplier=3.0)
-                        df_5m_exit = self.calculate_supertrend(df_5m_exit, period=10, multiplier=3.0)
+                        df_5m_exit = self.calculate_supertrend(df_5m_exit, period=10, multiplier=3.0, symbol=symbol, timeframe='5m')
                         if df_5m_exit is not None and len(df_5m_exit) >= 2:
                             recent_candles = df_5m_exit.tail(2)
                             prev_candle = recent_candles.iloc[0]
@@ -5390,7 +5584,7 @@ class OneMinuteSurgeEntryStrategy:
             
             # 15minute candles 체크
             if df_15m is not None and len(df_15m) >= 5:
-                df_15m_calc = self.calculate_indicators(df_15m)
+                df_15m_calc = self.calculate_indicators(df_15m, symbol, '15m')
                 if df_15m_calc is not None and 'bb600_upper' in df_15m_calc.columns:
                     bb600_breakout_15m = self._check_bb600_breakout_timeframe(df_15m_calc, '15minute candles')
                     if bb600_breakout_15m:
@@ -5398,7 +5592,7 @@ class OneMinuteSurgeEntryStrategy:
             
             # 30minute candles 체크  
             if df_30m is not None and len(df_30m) >= 5:
-                df_30m_calc = self.calculate_indicators(df_30m)
+                df_30m_calc = self.calculate_indicators(df_30m, symbol, '30m')
                 if df_30m_calc is not None and 'bb600_upper' in df_30m_calc.columns:
                     bb600_breakout_30m = self._check_bb600_breakout_timeframe(df_30m_calc, '30minute candles')
                     if bb600_breakout_30m:
@@ -5471,7 +5665,7 @@ class OneMinuteSurgeEntryStrategy:
                 return False
             
             # SuperTrend 계산 (period=10, multiplier=3.0)
-            df_1m_st = self.calculate_supertrend(df_1m, period=10, multiplier=3.0)
+            df_1m_st = self.calculate_supertrend(df_1m, period=10, multiplier=3.0, symbol=symbol, timeframe='1m')
             if df_1m_st is None or len(df_1m_st) < 2:
                 return False
             
@@ -6160,22 +6354,9 @@ class OneMinuteSurgeEntryStrategy:
         if (hasattr(self, 'dca_recovery') and self.dca_recovery and 
             current_time - self._last_enhanced_dca_recovery_time > 60):  # 1분
             try:
-                # Current Trade소 Position Info 구성
-                exchange_positions = {}
-                current_prices = {}
-                
-                for symbol in self.active_positions.keys():
-                    try:
-                        positions = self.exchange.fetch_positions([symbol])
-                        if positions and positions[0].get('contracts', 0) > 0:
-                            mark_price = positions[0]['markPrice']
-                            exchange_positions[symbol] = {
-                                'contracts': positions[0]['contracts'],
-                                'markPrice': mark_price
-                            }
-                            current_prices[symbol] = mark_price
-                    except Exception as pos_error:
-                        print(f"[강화Recover] ⚠️ {symbol} Position 조times Failed: {pos_error}")
+                # Current Trade소 Position Info 구성 (공용 스냅샷 - Position 수와 무관하게 요청 1times 이하)
+                exchange_positions, current_prices = self._collect_recovery_positions(
+                    self.active_positions.keys(), '강화Recover')
                 
                 # 강화된 DCA 주문 Recover Execute
                 if exchange_positions:
@@ -6243,18 +6424,8 @@ class OneMinuteSurgeEntryStrategy:
         elif (hasattr(self, 'dca_recovery') and self.dca_recovery and 
               current_time - self._last_dca_recovery_time > 300):  # 5분
             try:
-                # Current Trade소 Position Info 구성
-                exchange_positions = {}
-                for symbol in self.active_positions.keys():
-                    try:
-                        positions = self.exchange.fetch_positions([symbol])
-                        if positions and positions[0].get('contracts', 0) > 0:
-                            exchange_positions[symbol] = {
-                                'contracts': positions[0]['contracts'],
-                                'markPrice': positions[0]['markPrice']
-                            }
-                    except Exception as pos_error:
-                        print(f"[기본Recover] ⚠️ {symbol} Position 조times Failed: {pos_error}")
+                # Current Trade소 Position Info 구성 (공용 스냅샷)
+                exchange_positions, _ = self._collect_recovery_positions(self.active_positions.keys(), '기본Recover')
                 
                 # 기본 DCA 주문 Recover Execute
                 if exchange_positions:
@@ -6596,9 +6767,9 @@ class OneMinuteSurgeEntryStrategy:
                     pass  # 조용히 Failed (다음 주기에 재Attempt)
 
     def get_real_position_info(self, symbol):
-        """Trade소에서 실Time Position Info 조times (하이브리드 Sync)"""
+        """Trade소에서 실Time Position Info 조times (하이브리드 Sync, 공용 스냅샷)"""
         try:
-            positions = self.exchange.fetch_positions([symbol])
+            positions = self.position_snapshot.fetch_positions([symbol])
             position = next((p for p in positions if p['symbol'] == symbol and abs(p['contracts']) > 0), None)
             
             if position:
@@ -6616,8 +6787,11 @@ class OneMinuteSurgeEntryStrategy:
             return None
 
     def get_accurate_current_price(self, symbol):
-        """실Time Current price 조times (ticker Usage)"""
+        """실Time Current price 조times (공용 스냅샷 mark price 우선, 없으면 ticker Usage)"""
         try:
+            mark_price = self.position_snapshot.get_mark_price(symbol)
+            if mark_price:
+                return mark_price
             ticker = self.exchange.fetch_ticker(symbol)
             # 안전한 ticker 데이터 접근
             if isinstance(ticker, dict) and 'last' in ticker:
@@ -7646,7 +7820,7 @@ class OneMinuteSurgeEntryStrategy:
                 return {}
 
             # 지표 계산
-            df_1m = self.calculate_indicators(df_1m)
+            df_1m = self.calculate_indicators(df_1m, symbol, '1m')
             if df_1m is None or len(df_1m) == 0:
                 return {}
 
@@ -7698,7 +7872,7 @@ class OneMinuteSurgeEntryStrategy:
             # 1minute candles 데이터 조times (Exit 시점 지표)
             df_1m = self.get_ohlcv_data(symbol, '1m', limit=100)
             if df_1m is not None and len(df_1m) > 0:
-                df_1m = self.calculate_indicators(df_1m)
+                df_1m = self.calculate_indicators(df_1m, symbol, '1m')
 
             latest = df_1m.iloc[-1] if df_1m is not None and len(df_1m) > 0 else {}
 
@@ -7921,54 +8095,51 @@ class OneMinuteSurgeEntryStrategy:
             return current_balance + unrealized_pnl
 
     def _save_daily_stats(self):
-        """일일 통계 File Save - 계층적 구조"""
+        """일일 통계 File Save - 계층적 구조 (월간 데이터 병합은 즉시 / 기록만 백그라운드 디바운스)"""
         try:
             import json
             import os
             from datetime import datetime
 
-            # 통계 File Save 폴더 Confirm
-            stats_dir = "trading_stats"
-            if not os.path.exists(stats_dir):
-                os.makedirs(stats_dir)
-
             # Current Trade일 Confirm
             trading_day = self._get_trading_day()
             date_obj = datetime.strptime(trading_day, '%Y-%m-%d')
             year = date_obj.year
             month = date_obj.month
 
-            # 연도 폴더 Create
-            year_dir = os.path.join(stats_dir, str(year))
-            if not os.path.exists(year_dir):
-                os.makedirs(year_dir)
-
-            # 월간 File 경로
-            daily_file = os.path.join(year_dir, f"daily_{month:02d}.json")
+            # 월간 File 경로 (trading_stats/{year}/daily_{MM}.json)
+            daily_file = os.path.join("trading_stats", str(year), f"daily_{month:02d}.json")
 
-            # Legacy 월간 데이터 Load (없으면 새로 Create)
-            if os.path.exists(daily_file):
-                with open(daily_file, 'r', encoding='utf-8') as f:
-                    monthly_data = json.load(f)
-            else:
-                monthly_data = {
-                    'year': year,
-                    'month': month,
-                    'days': {},
-                    'summary': {}
-                }
-
-            # 오늘 날짜 데이터 Update
-            monthly_data['days'][trading_day] = {
+            # 오늘 날짜 데이터 (요청 시점 값 - 기록 전에 날짜가 바뀌어도 해당 날짜 File에 기록)
+            day_data = {
                 'total_trades': self.today_stats['total_trades'],
                 'wins': self.today_stats['wins'],
                 'losses': self.today_stats['losses'],
                 'total_pnl': self.today_stats['total_pnl'],
                 'win_rate': self.today_stats['win_rate'],
-                'trades': self.today_stats.get('trades_detail', []),
+                'trades': list(self.today_stats.get('trades_detail', [])),
                 'last_updated': get_korea_time().isoformat()
             }
 
+            # Legacy 월간 데이터 Load (File당 1times, 없으면 새로 Create) - 병합을 요청 시점에 해야 디바운스로
+            # 요청이 합쳐져도 (예: 날짜 변경 직후 두 날짜 Save) 앞선 날짜 데이터가 빠지지 않음
+            monthly_data = self._monthly_stats.get(daily_file)
+            if monthly_data is None:
+                if os.path.exists(daily_file):
+                    with open(daily_file, 'r', encoding='utf-8') as f:
+                        monthly_data = json.load(f)
+                else:
+                    monthly_data = {
+                        'year': year,
+                        'month': month,
+                        'days': {},
+                        'summary': {}
+                    }
+                self._monthly_stats = {daily_file: monthly_data}  # 지난 달 데이터는 버림
+
+            # 오늘 날짜 데이터 Update
+            monthly_data['days'][trading_day] = day_data
+
             # 월간 요Approx 재계산
             days = monthly_data['days']
             month_total_trades = sum(day['total_trades'] for day in days.values())
@@ -7993,11 +8164,13 @@ class OneMinuteSurgeEntryStrategy:
                 'worst_day_pnl': worst_day[1]['total_pnl'] if worst_day else 0
             }
 
-            # 월간 File Save
-            with open(daily_file, 'w', encoding='utf-8') as f:
-                json.dump(monthly_data, f, ensure_ascii=False, indent=2)
+            # 기록할 사본 (days 값 / summary는 요청마다 새 dict라 days만 얕은 복사하면 충분)
+            data = {**monthly_data, 'days': dict(monthly_data['days'])}
+
+            # 월간 File Save (같은 File 요청은 디바운스 창 안에서 1times으로 합침, 폴더는 기록 시 Create)
+            get_persistence_scheduler().schedule(daily_file, lambda: data)
 
-            self.logger.debug(f"📊 통계 Save Complete: {daily_file}")
+            self.logger.debug(f"📊 통계 Save 예약: {daily_file}")
 
         except Exception as e:
             self.logger.error(f"📊 통계 Save Failed: {e}")
@@ -8079,8 +8252,14 @@ class OneMinuteSurgeEntryStrategy:
                 return  # API calls 없이 Terminate
                 
             # Position 조times Attempt (Rate Limit 대응)
+            # User Data Stream이 살아있으면 스냅샷 그대로 (REST는 재조정 주기 / 스트림 공백 직후만),
+            # 없으면 Sync는 기준 조times이므로 스냅샷을 강제 갱신 (다른 소비자는 이 결과를 공유)
             try:
-                positions = self.exchange.fetch_positions()
+                if self.user_stream_sync is not None:
+                    positions, reconciled = self.user_stream_sync.positions_for_sync()
+                    self._apply_stream_changes(reconciled)
+                else:
+                    positions = self.position_snapshot.fetch_positions(max_age=0)
                 # Position이 있을 때만 Progress Situation 출력
                 if any(pos['contracts'] > 0 for pos in positions):
                     print(f"[PositionSync] 📥 1Stage: Trade소 Position 조times 중...")
@@ -8834,46 +9013,13 @@ class OneMinuteSurgeEntryStrategy:
 
                     # WebSocket에서 4h 데이터 조times (REST API blocked!)
                     ohlcv_df = self.get_ohlcv_data(symbol, '4h', limit=10)
-                    if ohlcv_df is None or len(ohlcv_df) < 5:
-                        continue
-
-                    # 🚀 OPTIMIZATION: Fast DataFrame conversion using to_numpy()
-                    timestamps = (ohlcv_df['timestamp'].astype('int64') // 10**6).to_numpy()
-                    opens = ohlcv_df['open'].to_numpy()
-                    highs = ohlcv_df['high'].to_numpy()
-                    lows = ohlcv_df['low'].to_numpy()
-                    closes = ohlcv_df['close'].to_numpy()
-                    volumes = ohlcv_df['volume'].to_numpy()
-
-                    ohlcv = [[int(t), o, h, l, c, v] for t, o, h, l, c, v in zip(
-                        timestamps, opens, highs, lows, closes, volumes
-                    )]
-
-                    if not ohlcv or len(ohlcv) < 5:  # 최소 5count Required (4봉 + 1count)
+                    if ohlcv_df is None or len(ohlcv_df) < 5:  # 최소 5count Required (4봉 + 1count)
                         continue
 
-                    # 조건 1: 최근 4봉 중 High vs Open 3% 이상 급등 1times 이상
-                    surge_found = False
-                    for i in range(-4, 0):
-                        candle = ohlcv[i]
-                        open_price = candle[1]
-                        high_price = candle[2]
-
-                        if open_price > 0:
-                            surge_pct = ((high_price - open_price) / open_price) * 100
-                            if surge_pct >= 4.0:  # 4% 급등 조건 (엄격한 Filtering)
-                                surge_found = True
-                                break
-
+                    # 조건 1: 최근 4봉 중 High vs Open 4% 이상 급등 1times 이상 (엄격한 Filtering)
                     # 조건 2: 4봉 전 시가 ~ 0봉 종가 전체 상승률 0% 이상
-                    if surge_found:
-                        first_candle_open = ohlcv[-4][1]  # 4봉 전 시가
-                        last_candle_close = ohlcv[-1][4]  # 0봉 종가
-
-                        if first_candle_open > 0:
-                            total_change_pct = ((last_candle_close - first_candle_open) / first_candle_open) * 100
-                            if total_change_pct >= 0:  # 전체 구간 0% 이상 상승이면 통과
-                                batch_filtered.append(symbol_data)
+                    if open_to_high_surge_with_trend(ohlcv_df, 4, min_surge_pct=4.0, trend_candles=4):
+                        batch_filtered.append(symbol_data)
 
                     # 🛡️ Optimized Rate Limit Protection: Maximum Speed with Safety
                     time.sleep(0.08)  # 🚀 OPTIMIZED: 0.05s → 0.08s (safe but fast)
@@ -8989,49 +9135,13 @@ class OneMinuteSurgeEntryStrategy:
                     if ohlcv_df is None or len(ohlcv_df) < 5:
                         continue
 
-                    # 🚀 OPTIMIZATION: Fast DataFrame conversion using to_numpy()
-                    timestamps = (ohlcv_df['timestamp'].astype('int64') // 10**6).to_numpy()
-                    opens = ohlcv_df['open'].to_numpy()
-                    highs = ohlcv_df['high'].to_numpy()
-                    lows = ohlcv_df['low'].to_numpy()
-                    closes = ohlcv_df['close'].to_numpy()
-                    volumes = ohlcv_df['volume'].to_numpy()
-
-                    ohlcv = [[int(t), o, h, l, c, v] for t, o, h, l, c, v in zip(
-                        timestamps, opens, highs, lows, closes, volumes
-                    )]
-
-                    if not ohlcv or len(ohlcv) < 5:
-                        continue
-
                     # 🕐 동적 검사 범위: Elapsed Time에 따라 조정
-                    # candles_to_check count수만큼만 검사 (최신 봉부터)
-                    check_start = -candles_to_check
-
-                    # 조건 1: 최근 N봉 중 High vs Open 3% 이상 급등 1times 이상
-                    surge_found = False
-                    for i in range(check_start, 0):
-                        candle = ohlcv[i]
-                        open_price = candle[1]
-                        high_price = candle[2]
-
-                        if open_price > 0:
-                            surge_pct = ((high_price - open_price) / open_price) * 100
-                            if surge_pct >= 4.0:  # 4% 급등 조건 (엄격한 Filtering)
-                                surge_found = True
-                                break
-
+                    # 조건 1: 최근 candles_to_check봉 중 High vs Open 4% 이상 급등 1times 이상 (최신 봉부터)
                     # 조건 2: 4봉 전 시가 ~ 0봉 종가 전체 상승률 0% 이상
-                    if surge_found:
-                        first_candle_open = ohlcv[-4][1]  # 4봉 전 시가 (index -4)
-                        last_candle_close = ohlcv[-1][4]  # 0봉 종가 (index -1)
-
-                        if first_candle_open > 0:
-                            total_change_pct = ((last_candle_close - first_candle_open) / first_candle_open) * 100
-                            if total_change_pct >= 0:  # 전체 구간 0% 이상 상승이면 통과
-                                batch_filtered.append(symbol_data)
-                                # Cache에 Add
-                                cache['passed_symbols'].add(symbol)
+                    if open_to_high_surge_with_trend(ohlcv_df, candles_to_check, min_surge_pct=4.0, trend_candles=4):
+                        batch_filtered.append(symbol_data)
+                        # Cache에 Add
+                        cache['passed_symbols'].add(symbol)
 
                     # 🛡️ Optimized Rate Limit Protection: Maximum Speed with Safety
                     time.sleep(0.08)  # 🚀 OPTIMIZED: 0.05s → 0.08s (safe but fast)
@@ -10066,17 +10176,7 @@ class OneMinuteSurgeEntryStrategy:
                 print(f"[DCARecover] {symbol} Recover 결과: {result}")
             else:
                 # 전체 Position Recover
-                exchange_positions = {}
-                for sym in self.active_positions.keys():
-                    try:
-                        positions = self.exchange.fetch_positions([sym])
-                        if positions and positions[0].get('contracts', 0) > 0:
-                            exchange_positions[sym] = {
-                                'contracts': positions[0]['contracts'],
-                                'markPrice': positions[0]['markPrice']
-                            }
-                    except Exception as e:
-                        print(f"[DCARecover] ⚠️ {sym} Position 조times Failed: {e}")
+                exchange_positions, _ = self._collect_recovery_positions(self.active_positions.keys(), 'DCARecover')
                 
                 result = self.dca_recovery.enhanced_scan_and_recover(exchange_positions)
                 print(f"[DCARecover] 전체 Recover 결과: {result}")
@@ -10120,17 +10220,7 @@ class OneMinuteSurgeEntryStrategy:
                 return self.dca_recovery.manual_recovery_for_symbol(symbol)
             else:
                 # 전체 Recover를 위한 간단한 구현
-                exchange_positions = {}
-                for sym in self.active_positions.keys():
-                    try:
-                        positions = self.exchange.fetch_positions([sym])
-                        if positions and positions[0].get('contracts', 0) > 0:
-                            exchange_positions[sym] = {
-                                'contracts': positions[0]['contracts'],
-                                'markPrice': positions[0]['markPrice']
-                            }
-                    except Exception as e:
-                        print(f"[긴급Recover] ⚠️ {sym} Position 조times Failed: {e}")
+                exchange_positions, _ = self._collect_recovery_positions(self.active_positions.keys(), '긴급Recover')
                 return self.dca_recovery.enhanced_scan_and_recover(exchange_positions)
         else:
             print("[ERROR] DCA Recover System이 Initialize되지 않음")
@@ -10156,21 +10246,8 @@ class OneMinuteSurgeEntryStrategy:
             
         try:
             # Current Position Info 수집
-            exchange_positions = {}
-            current_prices = {}
-            
-            for symbol in self.active_positions.keys():
-                try:
-                    positions = self.exchange.fetch_positions([symbol])
-                    if positions and positions[0].get('contracts', 0) > 0:
-                        mark_price = positions[0]['markPrice']
-                        exchange_positions[symbol] = {
-                            'contracts': positions[0]['contracts'],
-                            'markPrice': mark_price
-                        }
-                        current_prices[symbol] = mark_price
-                except Exception as e:
-                    print(f"[강제스캔] ⚠️ {symbol} Position 조times Failed: {e}")
+            exchange_positions, current_prices = self._collect_recovery_positions(
+                self.active_positions.keys(), '강제스캔')
             
             if exchange_positions:
                 print(f"🔍 강제 DCA 스캔 Execute - {len(exchange_positions)}count Position 검사")
@@ -10204,7 +10281,9 @@ class OneMinuteSurgeEntryStrategy:
             current_trading_day = self._get_trading_day()
             print(f"📊 일일 통계 재구성 Starting ({current_trading_day})")
             
-            # DCA Position File에서 직접 읽기
+            # DCA Position File에서 직접 읽기 (Save 로그를 먼저 스냅샷으로 압축)
+            if self.dca_manager and hasattr(self.dca_manager, 'flush_data'):
+                self.dca_manager.flush_data()
             dca_file = 'dca_positions.json'
             if not os.path.exists(dca_file):
                 print("❌ dca_positions.json File이 없습니다")
@@ -10595,8 +10674,8 @@ class OneMinuteSurgeEntryStrategy:
             usdt_free = balance['USDT']['free']
             usdt_used = usdt_balance - usdt_free
             
-            # 선물 Position 조times
-            futures_positions = self.exchange.fetch_positions()
+            # 선물 Position 조times (공용 스냅샷)
+            futures_positions = self.position_snapshot.fetch_positions()
             open_positions = [pos for pos in futures_positions if pos['contracts'] > 0]
             
             print("\n" + "=" * 80)
@@ -10630,8 +10709,11 @@ class OneMinuteSurgeEntryStrategy:
             self.logger.error(f"계좌 Situation 출력 Failed: {e}")
     
     def get_current_price(self, symbol):
-        """Current price 조times"""
+        """Current price 조times (Position 스냅샷 mark price 우선, 없으면 fetch_ticker)"""
         try:
+            price = self.position_snapshot.get_mark_price(symbol)
+            if price:
+                return price
             ticker = self.exchange.fetch_ticker(symbol)
             # 안전한 데이터 접근: 딕셔너리인지 Confirm
             if isinstance(ticker, dict) and 'last' in ticker:
@@ -10652,31 +10734,10 @@ class OneMinuteSurgeEntryStrategy:
             if df is None or len(df) < 2:
                 return False
             
-            # 최근 n봉만 검사
-            check_length = min(recent_n, len(df))
-            recent_df = df.tail(check_length)
-            
-            if len(recent_df) < 2:
-                return False
-            
-            # 각 인접한 캔들 쌍에서 골든크로스 찾기
-            for i in range(len(recent_df) - 1):
-                curr_idx = i
-                next_idx = i + 1
-                
-                curr_row = recent_df.iloc[curr_idx]
-                next_row = recent_df.iloc[next_idx]
-                
-                # 모든 값이 유효한지 Confirm
-                if (pd.notna(curr_row[ma1_col]) and pd.notna(curr_row[ma2_col]) and
-                    pd.notna(next_row[ma1_col]) and pd.notna(next_row[ma2_col])):
-                    
-                    # 골든크로스: 이전봉에서 ma1 < ma2, 다음봉에서 ma1 > ma2
-                    if (curr_row[ma1_col] < curr_row[ma2_col] and 
-                        next_row[ma1_col] > next_row[ma2_col]):
-                        return True
-            
-            return False
+            # 최근 n봉, 각 인접한 캔들 쌍에서 골든크로스 찾기 (NaN 쌍 제외)
+            # 골든크로스: 이전봉에서 ma1 < ma2, 다음봉에서 ma1 > ma2
+            return find_cross(df, ma1_col, ma2_col, recent_n, golden=True,
+                              prev_inclusive=False, curr_inclusive=False)
             
         except Exception as e:
             self.logger.error(f"골든크로스 탐지 Error: {e}")
@@ -10688,31 +10749,10 @@ class OneMinuteSurgeEntryStrategy:
             if df is None or len(df) < 2:
                 return False
             
-            # 최근 n봉만 검사
-            check_length = min(recent_n, len(df))
-            recent_df = df.tail(check_length)
-            
-            if len(recent_df) < 2:
-                return False
-            
-            # 각 인접한 캔들 쌍에서 데드크로스 찾기
-            for i in range(len(recent_df) - 1):
-                curr_idx = i
-                next_idx = i + 1
-                
-                curr_row = recent_df.iloc[curr_idx]
-                next_row = recent_df.iloc[next_idx]
-                
-                # 모든 값이 유효한지 Confirm
-                if (pd.notna(curr_row[ma1_col]) and pd.notna(curr_row[ma2_col]) and
-                    pd.notna(next_row[ma1_col]) and pd.notna(next_row[ma2_col])):
-                    
-                    # 데드크로스: 이전봉에서 ma1 > ma2, 다음봉에서 ma1 < ma2
-                    if (curr_row[ma1_col] > curr_row[ma2_col] and 
-                        next_row[ma1_col] < next_row[ma2_col]):
-                        return True
-            
-            return False
+            # 최근 n봉, 각 인접한 캔들 쌍에서 데드크로스 찾기 (NaN 쌍 제외)
+            # 데드크로스: 이전봉에서 ma1 > ma2, 다음봉에서 ma1 < ma2
+            return find_cross(df, ma1_col, ma2_col, recent_n, golden=False,
+                              prev_inclusive=False, curr_inclusive=False)
             
         except Exception as e:
             self.logger.error(f"데드크로스 탐지 Error: {e}")
@@ -10761,6 +10801,12 @@ class OneMinuteSurgeEntryStrategy:
             # 실Time 가격 모니터링 Callback (1minute candles만)
             if timeframe == '1m' and self.realtime_monitor:
                 self.realtime_monitor.update_price(symbol, current_price, kline_data)
+
+            # 보유 Symbol 가격을 Position 스냅샷에 반영 (ACCOUNT_UPDATE에는 mark price가 없음)
+            if timeframe == '1m' and current_price:
+                unified = f"{symbol[:-4]}/USDT:USDT" if symbol.endswith('USDT') and '/' not in symbol else symbol
+                if unified in self.active_positions:
+                    self.position_snapshot.update_mark_price(unified, current_price)
         
         except Exception as e:
             self.logger.error(f"WebSocket Kline Update Failed {symbol} {timeframe}: {e}")
@@ -10826,6 +10872,137 @@ class OneMinuteSurgeEntryStrategy:
             return None
 
 
+def run_monitor_cycle(strategy, state):
+    """Position 모니터링 1times (3초 간격 실Time 체크 + 10초 간격 상세 모니터링)"""
+    # 실Time Position 모니터링 (5초마다 - 긴급Exit용)
+    current_time_seconds = time.time()
+    if strategy.active_positions:  # Active positions이 있을 때만
+        if (current_time_seconds - state['last_position_monitor']) >= 3:  # 3초마다 실Time 체크
+            strategy.monitor_positions_realtime()
+            state['last_position_monitor'] = current_time_seconds
+        
+        # 10초마다 상세 모니터링 (기술적 Analysis 포함)
+        if int(current_time_seconds) % 10 == 0:
+            strategy.monitor_positions_detailed()
+    else:
+        # Position 없을 때는 1분마다만 체크
+        if (current_time_seconds - state['last_position_monitor']) >= 60:
+            state['last_position_monitor'] = current_time_seconds
+
+
+def run_scan_cycle(strategy, state, monitor=True):
+    """
+    스캔 1사이클: Position Sync → DCA limit order → Symbol Filtering / 스캔 → (모니터링) → 주기 출력
+
+    Args:
+        monitor: False면 Position 모니터링 생략 (스케줄러가 별도 주기로 Execute)
+    """
+    kst_now = get_korea_time()
+    current_time = kst_now.strftime('%H:%M:%S')
+    
+    print(f"\n" + "="*60)
+    print(f"🔍 [1minute candles 급등 초입 전략] 시장 스캔 Starting - {current_time}")
+    print("="*60)
+    
+    # 🔄 실Time Position Sync (매 스캔마다)
+    try:
+        strategy.sync_positions_with_exchange()
+    except Exception as e:
+        print(f"⚠️ Position Sync Failed: {e}")
+    
+    # 📋 DCA limit order Status Confirm 및 Update
+    try:
+        if strategy.dca_manager:
+            limit_order_result = strategy.dca_manager.check_and_update_limit_orders()
+            if limit_order_result.get('success') and limit_order_result.get('updated_count', 0) > 0:
+                print(f"✅ DCA limit order {limit_order_result['updated_count']}count Update됨")
+    except Exception as e:
+        print(f"⚠️ DCA limit order Confirmation failed: {e}")
+    
+    # Current 계좌 Position 간략 Info만 표시 (상세 테이블은 주기적으로 표시)
+    if strategy.active_positions:
+        print(f"📊 [Position 현황] {len(strategy.active_positions)}count Active")
+        # 최초 Execute이거나 10초마다 상세 테이블 출력
+        if not hasattr(strategy, '_first_run_done'):
+            strategy._first_run_done = True
+            strategy.print_positions_table()
+    else:
+        print(f"📊 [계좌Position] 보유중: Absent")
+    
+    # Symbol Filtering 및 Batch 스캔
+    # 🚨 Debug: 메인 루프 Execute Confirm
+    symbols = strategy.get_filtered_symbols()
+    
+    if not symbols:
+        pass  # Message는 get_filtered_symbols()에서 이미 출력됨
+    else:
+        # 🎯 Filtering된 Symbol들을 동적으로 WebSocket에 Subscription
+        print(f"🔄 [메인루프] Subscription Update 호출 Starting: {len(symbols)}count Symbol")
+        strategy.update_websocket_subscriptions(symbols)
+        print(f"✅ [메인루프] Subscription Update 호출 Complete")
+
+        # 🚀 최적화된 WebSocket 스캔 또는 Legacy 스캔 선택
+        print(f"⚡ 스캔 Starting: {len(symbols)}count Symbol")
+        
+        # 🔍 임시 디버깅: 스캔 Status Confirm
+        scan_count = 0
+        skip_count = 0
+
+        try:
+            # WebSocket 스캐너를 기본으로 Usage (IP 밴 방지 및 최대 성능)
+            # WebSocket 매니저가 있으면 항상 WebSocket 모드 Usage
+            if strategy.ws_kline_manager:
+                # ⚡ WebSocket 전용 모드: 15m Filtering Usage (4h 대체, REST API Remove)
+                # 3m, 5m, 15m, 1d 데이터로만 스캔
+                print("⚡ WebSocket 전용 스캔 모드 (15m Filtering Usage)")
+                all_signals = strategy.scan_symbols(symbols)
+                print(f"✅ WebSocket 스캔 Complete: {len(all_signals)}count 신호 발견")
+            else:
+                # WebSocket 스캐너 비Active화 시에만 Legacy 방식 Usage
+                print("⚠️ WebSocket 스캐너 비Active화 - Legacy API 스캔 Usage (IP 밴 위험)")
+                all_signals = strategy.scan_symbols(symbols)
+                print(f"✅ API 스캔 Complete: {len(all_signals)}count 신호 발견")
+
+            cache_stats = get_indicator_cache().get_stats()
+            strategy.logger.debug(f"📦 지표 Cache: hit {cache_stats['hits']} / miss {cache_stats['misses']} "
+                                  f"({cache_stats['hit_rate']:.1f}%), {cache_stats['entries']}count Save")
+                
+        except Exception as e:
+            print(f"❌ 스캔 Failed: {e}")
+            all_signals = []
+
+    if monitor:
+        run_monitor_cycle(strategy, state)
+
+    current_time_seconds = time.time()
+
+    # 🎯 DCA limit order 모니터링 (check_pending_limit_orders()로 자동 Process됨)
+    # DCA 주문 체결 Confirm은 각 Position 모니터링 시 check_pending_limit_orders()에서 자동으로 Process
+    
+    # 절반하락 Exit 시스템 Remove됨 (Usage자 요청)
+    
+    # 주기적 출력을 위한 타이머 Initialize
+    if not hasattr(strategy, '_last_stats_time'):
+        strategy._last_stats_time = 0
+        strategy._last_positions_table_time = 0
+        strategy._last_account_status_time = 0
+    
+    # 250ms 모드: 통계는 5초마다만 출력 (화면 안정성)
+    if current_time_seconds - strategy._last_stats_time >= 5:
+        strategy.print_daily_stats()
+        strategy._last_stats_time = current_time_seconds
+    
+    # Position 상세 테이블은 10초마다 출력 
+    if strategy.active_positions and (current_time_seconds - strategy._last_positions_table_time >= 10):
+        strategy.print_positions_table()
+        strategy._last_positions_table_time = current_time_seconds
+    
+    # 계좌 요Approx Situation은 30초마다 출력
+    elif current_time_seconds - strategy._last_account_status_time >= 30:
+        strategy.print_account_status()
+        strategy._last_account_status_time = current_time_seconds
+
+
 def main():
     """메인 Execute 함수 - invincible_surge_entry_strategy.py와 동일한 스캔 방식"""
     logger = setup_logging()
@@ -10837,125 +11014,29 @@ def main():
     # 전략 Initialize
     strategy = OneMinuteSurgeEntryStrategy(api_key, secret_key, sandbox=False)
     
+    # 💾 SIGTERM 시 대기 중인 JSON Save flush 후 finally 블록으로 Terminate
+    install_signal_handlers()
     
+    scheduler = None
     try:
-        last_position_monitor = time.time()
-        
-        while True:
-            kst_now = get_korea_time()
-            current_time = kst_now.strftime('%H:%M:%S')
-            
-            print(f"\n" + "="*60)
-            print(f"🔍 [1minute candles 급등 초입 전략] 시장 스캔 Starting - {current_time}")
-            print("="*60)
-            
-            # 🔄 실Time Position Sync (매 스캔마다)
-            try:
-                strategy.sync_positions_with_exchange()
-            except Exception as e:
-                print(f"⚠️ Position Sync Failed: {e}")
-            
-            # 📋 DCA limit order Status Confirm 및 Update
-            try:
-                if strategy.dca_manager:
-                    limit_order_result = strategy.dca_manager.check_and_update_limit_orders()
-                    if limit_order_result.get('success') and limit_order_result.get('updated_count', 0) > 0:
-                        print(f"✅ DCA limit order {limit_order_result['updated_count']}count Update됨")
-            except Exception as e:
-                print(f"⚠️ DCA limit order Confirmation failed: {e}")
-            
-            # Current 계좌 Position 간략 Info만 표시 (상세 테이블은 주기적으로 표시)
-            if strategy.active_positions:
-                print(f"📊 [Position 현황] {len(strategy.active_positions)}count Active")
-                # 최초 Execute이거나 10초마다 상세 테이블 출력
-                if not hasattr(strategy, '_first_run_done'):
-                    strategy._first_run_done = True
-                    strategy.print_positions_table()
-            else:
-                print(f"📊 [계좌Position] 보유중: Absent")
-            
-            # Symbol Filtering 및 Batch 스캔
-            # 🚨 Debug: 메인 루프 Execute Confirm
-            symbols = strategy.get_filtered_symbols()
-            
-            if not symbols:
-                pass  # Message는 get_filtered_symbols()에서 이미 출력됨
-            else:
-                # 🎯 Filtering된 Symbol들을 동적으로 WebSocket에 Subscription
-                print(f"🔄 [메인루프] Subscription Update 호출 Starting: {len(symbols)}count Symbol")
-                strategy.update_websocket_subscriptions(symbols)
-                print(f"✅ [메인루프] Subscription Update 호출 Complete")
+        state = {'last_position_monitor': time.time()}
+
+        if strategy.async_runtime is not None:
+            # ⚡ 이벤트 루프 스케줄러: 스캔 250ms / Position 모니터 3초 고정 주기
+            # (동기 작업은 워커 스레드 1count에서 직렬 Execute, REST 요청은 이벤트 루프에서 다중화)
+            scheduler = AsyncScanScheduler(strategy.async_runtime, logger=strategy.logger)
+            scheduler.every('scan', 0.25, lambda: run_scan_cycle(strategy, state, monitor=False))
+            scheduler.every('monitor', 3, lambda: run_monitor_cycle(strategy, state))
+            scheduler.start()
+            scheduler.run_forever()
+        else:
+            while True:
+                run_scan_cycle(strategy, state)
 
-                # 🚀 최적화된 WebSocket 스캔 또는 Legacy 스캔 선택
-                print(f"⚡ 스캔 Starting: {len(symbols)}count Symbol")
-                
-                # 🔍 임시 디버깅: 스캔 Status Confirm
-                scan_count = 0
-                skip_count = 0
-
-                try:
-                    # WebSocket 스캐너를 기본으로 Usage (IP 밴 방지 및 최대 성능)
-                    # WebSocket 매니저가 있으면 항상 WebSocket 모드 Usage
-                    if strategy.ws_kline_manager:
-                        # ⚡ WebSocket 전용 모드: 15m Filtering Usage (4h 대체, REST API Remove)
-                        # 3m, 5m, 15m, 1d 데이터로만 스캔
-                        print("⚡ WebSocket 전용 스캔 모드 (15m Filtering Usage)")
-                        all_signals = strategy.scan_symbols(symbols)
-                        print(f"✅ WebSocket 스캔 Complete: {len(all_signals)}count 신호 발견")
-                    else:
-                        # WebSocket 스캐너 비Active화 시에만 Legacy 방식 Usage
-                        print("⚠️ WebSocket 스캐너 비Active화 - Legacy API 스캔 Usage (IP 밴 위험)")
-                        all_signals = strategy.scan_symbols(symbols)
-                        print(f"✅ API 스캔 Complete: {len(all_signals)}count 신호 발견")
-                        
-                except Exception as e:
-                    print(f"❌ 스캔 Failed: {e}")
-                    all_signals = []
-            
-            # 실Time Position 모니터링 (5초마다 - 긴급Exit용)
-            current_time_seconds = time.time()
-            if strategy.active_positions:  # Active positions이 있을 때만
-                if (current_time_seconds - last_position_monitor) >= 3:  # 3초마다 실Time 체크
-                    strategy.monitor_positions_realtime()
-                    last_position_monitor = current_time_seconds
-                
-                # 10초마다 상세 모니터링 (기술적 Analysis 포함)
-                if int(current_time_seconds) % 10 == 0:
-                    strategy.monitor_positions_detailed()
-            else:
-                # Position 없을 때는 1분마다만 체크
-                if (current_time_seconds - last_position_monitor) >= 60:
-                    last_position_monitor = current_time_seconds
-            
-            # 🎯 DCA limit order 모니터링 (check_pending_limit_orders()로 자동 Process됨)
-            # DCA 주문 체결 Confirm은 각 Position 모니터링 시 check_pending_limit_orders()에서 자동으로 Process
-            
-            # 절반하락 Exit 시스템 Remove됨 (Usage자 요청)
-            
-            # 주기적 출력을 위한 타이머 Initialize
-            if not hasattr(strategy, '_last_stats_time'):
-                strategy._last_stats_time = 0
-                strategy._last_positions_table_time = 0
-                strategy._last_account_status_time = 0
-            
-            # 250ms 모드: 통계는 5초마다만 출력 (화면 안정성)
-            if current_time_seconds - strategy._last_stats_time >= 5:
-                strategy.print_daily_stats()
-                strategy._last_stats_time = current_time_seconds
-            
-            # Position 상세 테이블은 10초마다 출력 
-            if strategy.active_positions and (current_time_seconds - strategy._last_positions_table_time >= 10):
-                strategy.print_positions_table()
-                strategy._last_positions_table_time = current_time_seconds
-            
-            # 계좌 요Approx Situation은 30초마다 출력
-            elif current_time_seconds - strategy._last_account_status_time >= 30:
-                strategy.print_account_status()
-                strategy._last_account_status_time = current_time_seconds
-            
-            # 다음 스캔까지 대기 (웹소켓 기반 250ms 초High-speed mode)
-            print(f"\n🚀 다음 스캔까지 250ms Waiting...")
-            time.sleep(0.25)  # 250ms 대기 (웹소켓 기반 극한 속도)
+                # 다음 스캔까지 대기 (웹소켓 기반 250ms 초High-speed mode)
+                # User Data Stream Position 변경이 오면 즉시 다음 사이클 (체결 반영 지연 최소화)
+                print(f"\n🚀 다음 스캔까지 250ms Waiting...")
+                strategy.wait_position_event(0.25)  # 250ms 대기 (웹소켓 기반 극한 속도)
                 
     except KeyboardInterrupt:
         print("\n🛑 전략 Terminate됨 (Ctrl+C)")
@@ -10964,6 +11045,19 @@ def main():
         print(f"❌ 전략 Execute 중 Error: {e}")
 
     finally:
+        # 스케줄러 / 비동기 런타임 Terminate
+        if scheduler is not None:
+            scheduler.stop()
+        strategy.shutdown_async_runtime()
+        strategy.shutdown_user_stream()
+
+        # DCA Position 로그 → 스냅샷 압축
+        if strategy.dca_manager and hasattr(strategy.dca_manager, 'flush_data'):
+            strategy.dca_manager.flush_data()
+
+        # 프로세스 스캔 워커 Terminate
+        strategy.shutdown_process_scan()
+
         # 🚀 WebSocket 시스템 Terminate
         if hasattr(strategy, 'ws_kline_manager') and strategy.ws_kline_manager:
             try:
@@ -10972,6 +11066,13 @@ def main():
                 print("[WebSocket] ✅ 정상 Terminate Complete")
             except Exception as ws_shutdown_error:
                 print(f"[WebSocket] ⚠️ Terminate 중 Error: {ws_shutdown_error}")
+
+        # 💾 대기 중인 JSON Save 기록 (통계 / Notification 기록 / 구독 상태)
+        persistence = get_persistence_scheduler()
+        persistence.shutdown()
+        persistence_stats = persistence.get_stats()
+        print(f"💾 Save 스케줄러: 요청 {persistence_stats['requests']}times → 기록 {persistence_stats['writes']}times "
+              f"(합침 {persistence_stats['coalesced']}times, 평균 {persistence_stats['avg_write_ms']:.2f}ms)")
         import traceback
         traceback.print_exc()
 
@@ -44,13 +44,15 @@ class OptimizedWebSocketScanner:
         self.scan_interval = 2.0  # 2초마다 스캔
         self.min_data_requirement = 200  # 최소 필요 데이터 수
         self.max_scan_symbols = 50  # 동시 스캔 최대 심볼 수
+        self.max_gap_candles = 3  # 1m 버퍼 연속 누락이 이보다 크면 스캔 제외 (이하면 후순위)
         
         # 성능 모니터링
         self.scan_stats = {
             'total_scans': 0,
             'successful_scans': 0,
             'avg_scan_time': 0,
-            'signals_found': 0
+            'signals_found': 0,
+            'gap_skipped': 0  # 누락 캔들로 제외한 심볼 누적 수
         }
         
         # 동기화 락
@@ -151,9 +153,20 @@ class OptimizedWebSocketScanner:
         except Exception as e:
             print(f"⚠️ WebSocket 데이터 동기화 Error: {e}")
     
+    def _get_data_health(self, symbol: str) -> Optional[Dict]:
+        """WebSocket 버퍼 누락 캔들 상태 (매니저가 지원하지 않으면 None)"""
+        get_health = getattr(self.ws_manager, 'get_buffer_health', None)
+        if get_health is None:
+            return None
+        try:
+            return get_health(symbol)
+        except Exception:
+            return None
+
     def _get_scan_ready_symbols(self) -> List[str]:
-        """스캔 준비된 심볼 목록 반환"""
+        """스캔 준비된 심볼 목록 반환 (누락 캔들이 많은 심볼 제외, 누락이 있는 심볼은 후순위)"""
         ready_symbols = []
+        incomplete = set()
         current_time = time.time()
         
         with self.data_lock:
@@ -170,10 +183,17 @@ class OptimizedWebSocketScanner:
                     
                     # 변동률 필터 (너무 낮은 변동률 제외)
                     if abs(data.change_24h) >= 1.0:
+                        # 누락 캔들 필터 (지표가 빈 구간을 건너뛰어 계산되는 심볼)
+                        health = self._get_data_health(symbol)
+                        if health and health['gap_count']:
+                            if health['max_gap'] > self.max_gap_candles:
+                                self.scan_stats['gap_skipped'] += 1
+                                continue
+                            incomplete.add(symbol)
                         ready_symbols.append(symbol)
         
-        # 변동률 순으로 정렬하여 상위 심볼만 스캔
-        ready_symbols.sort(key=lambda s: abs(self.symbol_data[s].change_24h), reverse=True)
+        # 누락 없는 심볼 우선, 변동률 순으로 정렬하여 상위 심볼만 스캔
+        ready_symbols.sort(key=lambda s: (s in incomplete, -abs(self.symbol_data[s].change_24h)))
         
         return ready_symbols[:self.max_scan_symbols]
     
@@ -387,13 +407,17 @@ class OptimizedWebSocketScanner:
     
     def get_data_status(self) -> Dict:
         """현재 데이터 상태 반환"""
+        # _get_scan_ready_symbols가 data_lock을 획득하므로 lock 밖에서 호출
+        ready_symbols = len(self._get_scan_ready_symbols())
         with self.data_lock:
             total_symbols = len(self.symbol_data)
-            ready_symbols = len(self._get_scan_ready_symbols())
+        get_report = getattr(self.ws_manager, 'get_health_report', None)
+        incomplete = get_report() if get_report else {}
             
-            return {
-                'total_symbols': total_symbols,
-                'ready_symbols': ready_symbols,
-                'data_coverage': ready_symbols / max(1, total_symbols) * 100,
-                'scan_stats': self.scan_stats.copy()
-            }
\ No newline at end of file
+        return {
+            'total_symbols': total_symbols,
+            'ready_symbols': ready_symbols,
+            'data_coverage': ready_symbols / max(1, total_symbols) * 100,
+            'incomplete_symbols': {symbol: health['max_gap'] for symbol, health in incomplete.items()},
+            'scan_stats': self.scan_stats.copy()
+        }
\ No newline at end of file
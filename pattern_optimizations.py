@@ -9,6 +9,68 @@ import pandas as pd
 from typing import Optional, Union
 
 
+def cross_mask(
+    fast: np.ndarray,
+    slow: np.ndarray,
+    golden: bool = True,
+    prev_inclusive: bool = True,
+    curr_inclusive: bool = False
+) -> np.ndarray:
+    """
+    Vectorized cross detection over consecutive candle pairs (last axis)
+
+    Args:
+        fast: Fast line values (1-D, or 2-D with candles on the last axis)
+        slow: Slow line values (same shape as fast)
+        golden: True for golden cross (fast crosses above slow), False for dead cross
+        prev_inclusive: Previous candle may touch (golden: fast <= slow, dead: fast >= slow)
+        curr_inclusive: Current candle may touch (golden: fast >= slow, dead: fast <= slow)
+
+    Returns:
+        Boolean array with one element less on the last axis;
+        element i is True when a cross happens from candle i to candle i+1 (pairs with NaN excluded)
+    """
+    fast = np.asarray(fast, dtype=np.float64)
+    slow = np.asarray(slow, dtype=np.float64)
+    f_prev, f_curr = fast[..., :-1], fast[..., 1:]
+    s_prev, s_curr = slow[..., :-1], slow[..., 1:]
+
+    if golden:
+        prev_ok = f_prev <= s_prev if prev_inclusive else f_prev < s_prev
+        curr_ok = f_curr >= s_curr if curr_inclusive else f_curr > s_curr
+    else:
+        prev_ok = f_prev >= s_prev if prev_inclusive else f_prev > s_prev
+        curr_ok = f_curr <= s_curr if curr_inclusive else f_curr < s_curr
+
+    # NaN comparisons are already False; the explicit mask keeps the intent readable
+    valid = ~(np.isnan(f_prev) | np.isnan(s_prev) | np.isnan(f_curr) | np.isnan(s_curr))
+    return prev_ok & curr_ok & valid
+
+
+def _recent_cross(
+    df: pd.DataFrame,
+    fast_ma_col: str,
+    slow_ma_col: str,
+    recent_n: int,
+    golden: bool
+) -> bool:
+    if df is None or len(df) < 2:
+        return False
+
+    # Check if columns exist
+    if fast_ma_col not in df.columns or slow_ma_col not in df.columns:
+        return False
+
+    # Get the data for the specified period
+    look_back = min(recent_n, len(df))
+    if look_back < 2:
+        return False
+
+    fast = df[fast_ma_col].to_numpy(dtype=np.float64)[-look_back:]
+    slow = df[slow_ma_col].to_numpy(dtype=np.float64)[-look_back:]
+    return bool(cross_mask(fast, slow, golden=golden).any())
+
+
 def find_golden_cross_vectorized(
     df: pd.DataFrame,
     fast_ma_col: str, 
@@ -26,36 +88,9 @@ def find_golden_cross_vectorized(
         
     Returns:
         True if golden cross found within recent_n periods, False otherwise
+        (previous period fast <= slow, current period fast > slow, NaN pairs skipped)
     """
-    if df is None or len(df) < 2:
-        return False
-        
-    # Check if columns exist
-    if fast_ma_col not in df.columns or slow_ma_col not in df.columns:
-        return False
-        
-    # Get the data for the specified period
-    look_back = min(recent_n, len(df))
-    recent_df = df.tail(look_back)
-    
-    if len(recent_df) < 2:
-        return False
-        
-    # Check for golden cross: previous period fast <= slow, current period fast > slow
-    # Need to compare consecutive valid rows, so iterate through dataframe
-    for i in range(1, len(recent_df)):
-        prev_row = recent_df.iloc[i-1]
-        curr_row = recent_df.iloc[i]
-
-        # Check if both values are valid (not NaN) for both periods
-        if (pd.notna(prev_row[fast_ma_col]) and pd.notna(prev_row[slow_ma_col]) and
-            pd.notna(curr_row[fast_ma_col]) and pd.notna(curr_row[slow_ma_col])):
-
-            # Golden cross: previous fast <= slow, current fast > slow
-            if prev_row[fast_ma_col] <= prev_row[slow_ma_col] and curr_row[fast_ma_col] > curr_row[slow_ma_col]:
-                return True
-
-    return False
+    return _recent_cross(df, fast_ma_col, slow_ma_col, recent_n, golden=True)
 
 
 def find_dead_cross_vectorized(
@@ -75,36 +110,61 @@ def find_dead_cross_vectorized(
         
     Returns:
         True if dead cross found within recent_n periods, False otherwise
+        (previous period fast >= slow, current period fast < slow, NaN pairs skipped)
     """
-    if df is None or len(df) < 2:
-        return False
-        
-    # Check if columns exist
-    if fast_ma_col not in df.columns or slow_ma_col not in df.columns:
-        return False
-        
-    # Get the data for the specified period
-    look_back = min(recent_n, len(df))
-    recent_df = df.tail(look_back)
-    
-    if len(recent_df) < 2:
-        return False
-        
-    # Check for dead cross: previous period fast >= slow, current period fast < slow
-    # Need to compare consecutive valid rows, so iterate through dataframe
-    for i in range(1, len(recent_df)):
-        prev_row = recent_df.iloc[i-1]
-        curr_row = recent_df.iloc[i]
+    return _recent_cross(df, fast_ma_col, slow_ma_col, recent_n, golden=False)
 
-        # Check if both values are valid (not NaN) for both periods
-        if (pd.notna(prev_row[fast_ma_col]) and pd.notna(prev_row[slow_ma_col]) and
-            pd.notna(curr_row[fast_ma_col]) and pd.notna(curr_row[slow_ma_col])):
 
-            # Dead cross: previous fast >= slow, current fast < slow
-            if prev_row[fast_ma_col] >= prev_row[slow_ma_col] and curr_row[fast_ma_col] < curr_row[slow_ma_col]:
-                return True
+def open_to_high_pct_vectorized(
+    df: pd.DataFrame,
+    recent_n: int
+) -> np.ndarray:
+    """
+    Open-to-high increase percentage of the last recent_n candles
 
-    return False
+    Args:
+        df: DataFrame with OHLCV data
+        recent_n: Number of periods to look back
+
+    Returns:
+        Percentage array ((high - open) / open * 100); NaN where open/high is NaN or open <= 0
+    """
+    opens = df['open'].to_numpy(dtype=np.float64)[-recent_n:]
+    highs = df['high'].to_numpy(dtype=np.float64)[-recent_n:]
+    valid = ~(np.isnan(opens) | np.isnan(highs)) & (opens > 0)
+    pct = np.full(opens.shape, np.nan)
+    pct[valid] = ((highs[valid] - opens[valid]) / opens[valid]) * 100
+    return pct
+
+
+def count_high_vs_open_in_range_vectorized(
+    df: pd.DataFrame,
+    min_increase_pct: float,
+    max_increase_pct: Optional[float] = None,
+    recent_n: int = 20
+) -> int:
+    """
+    Number of candles whose open-to-high increase is within [min, max] (any candle color)
+
+    Unlike check_high_vs_open_vectorized, bearish candles count too and
+    frames shorter than recent_n are checked over what is available.
+
+    Args:
+        df: DataFrame with OHLCV data
+        min_increase_pct: Minimum increase percentage (inclusive)
+        max_increase_pct: Maximum increase percentage (inclusive, None = no upper bound)
+        recent_n: Number of periods to look back
+
+    Returns:
+        Count of matching candles
+    """
+    if df is None or len(df) == 0:
+        return 0
+    pct = open_to_high_pct_vectorized(df, recent_n)
+    matched = pct >= min_increase_pct
+    if max_increase_pct is not None:
+        matched &= pct <= max_increase_pct
+    return int(np.count_nonzero(matched))
 
 
 def check_high_vs_open_vectorized(
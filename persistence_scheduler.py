@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""
+Persistence Scheduler
+JSON 상태 File Save를 백그라운드 스레드 1count에서 디바운스 / 원자적 기록
+
+동작:
+- schedule(path, producer): 같은 File에 대한 Save 요청은 디바운스 창 (기본 1초) 동안 1times으로 합침
+  (마지막 producer만 사용, 기록 시점에 producer() 호출 → 그 시점 최신 상태를 기록)
+- 기록: tmp File에 JSON 기록 후 os.replace (기록 도중 Terminate되어도 기존 File은 온전)
+- schedule_call(key, func): JSON이 아닌 Save 작업 (예: Position 로그 압축)도 같은 방식으로 합침
+- flush(): 대기 중인 Save를 호출 스레드에서 즉시 기록 (Terminate / 재구성 직전)
+- shutdown(): flush 후 스레드 Terminate, 이후 요청은 동기 기록 (Terminate 직전 Save 유실 방지)
+- atexit / SIGTERM 핸들러에서 flush (install_signal_handlers)
+
+producer는 백그라운드 스레드에서 호출되므로 다른 스레드가 수정하는 상태를 읽는 경우 lock을 함께 넘기거나
+요청 시점 사본을 반환합니다 (lambda: data). dict 크기 변경 (RuntimeError) 자동 재시도는 최후 안전망일 뿐
+값이 섞인 상태 (일부 필드만 갱신)는 막지 못합니다.
+"""
+
+import atexit
+import json
+import logging
+import os
+import signal
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class _Job:
+    __slots__ = ('key', 'run', 'due', 'requested_at', 'retries')
+
+    def __init__(self, key: str, run: Callable[[], None], due: float, requested_at: float):
+        self.key = key
+        self.run = run
+        self.due = due
+        self.requested_at = requested_at
+        self.retries = 0
+
+
+class PersistenceScheduler:
+    """디바운스 + 원자적 JSON Save 스케줄러 (백그라운드 스레드 1count)"""
+
+    def __init__(self, debounce: float = 1.0, logger=None, lock_timeout: float = 5.0, max_retries: int = 3):
+        """
+        Args:
+            debounce: 같은 File Save 요청을 합치는 창 (초, 첫 요청 기준 → 계속 요청이 와도 최대 이 Time 후 기록)
+            logger: 로거 인스턴스
+            lock_timeout: producer lock 대기 한도 (초, 초과 시 다음 창으로 연기)
+            max_retries: 기록 Failed 시 재시도 횟수 (초과 시 해당 요청 폐기)
+        """
+        self.debounce = debounce
+        self.logger = logger or logging.getLogger(__name__)
+        self.lock_timeout = lock_timeout
+        self.max_retries = max_retries
+
+        self._pending: Dict[str, _Job] = {}
+        self._cond = threading.Condition()
+        self._write_lock = threading.RLock()  # 백그라운드 기록 / flush 직렬화
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+        self.stats = {
+            'requests': 0,
+            'coalesced': 0,
+            'writes': 0,
+            'sync_writes': 0,
+            'errors': 0,
+            'retries': 0,
+            'dropped': 0,
+            'bytes': 0,
+            'total_write_ms': 0.0,
+            'max_write_ms': 0.0,
+            'total_delay_ms': 0.0,
+            'max_delay_ms': 0.0,
+        }
+        self.file_writes: Dict[str, int] = {}
+
+    # ===== 요청 =====
+
+    def schedule(self, path: str, producer: Callable[[], Any], lock=None, debounce: Optional[float] = None,
+                 **dump_kwargs):
+        """
+        JSON File Save 요청 (디바운스 후 백그라운드 기록)
+
+        Args:
+            path: 대상 File 경로
+            producer: 기록할 데이터를 반환하는 함수 (기록 시점에 scheduler 스레드에서 호출)
+            lock: producer 호출 / 직렬화 중 잡을 lock (공유 상태 보호용, 선택)
+            debounce: 이 요청의 디바운스 창 (None이면 기본값)
+            **dump_kwargs: json.dumps 인자 (기본 ensure_ascii=False, indent=2)
+        """
+        path = os.path.abspath(path)  # 기록 시점의 작업 디렉토리와 무관하게
+        dump_kwargs.setdefault('ensure_ascii', False)
+        dump_kwargs.setdefault('indent', 2)
+        self._submit(path, lambda: self._write_json(path, producer, lock, dump_kwargs), debounce)
+
+    def schedule_call(self, key: str, func: Callable[[], None], debounce: Optional[float] = None):
+        """JSON이 아닌 Save 작업 요청 (key가 같은 요청끼리 합침)"""
+        self._submit(key, func, debounce)
+
+    def _submit(self, key: str, run: Callable[[], None], debounce: Optional[float]):
+        now = time.time()
+        with self._cond:
+            self.stats['requests'] += 1
+            if self._stopped:
+                sync = True
+            else:
+                sync = False
+                job = self._pending.get(key)
+                if job is not None:
+                    job.run = run  # 마지막 요청만 기록 (기록 시점 / 첫 요청 Time은 유지)
+                    self.stats['coalesced'] += 1
+                else:
+                    delay = self.debounce if debounce is None else debounce
+                    self._pending[key] = _Job(key, run, now + delay, now)
+                    self._ensure_thread()
+                    self._cond.notify()
+        if sync:
+            # Terminate 후 요청은 즉시 기록
+            self.stats['sync_writes'] += 1
+            self._execute(_Job(key, run, now, now))
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='persistence-scheduler', daemon=True)
+            self._thread.start()
+
+    # ===== 기록 =====
+
+    def _write_json(self, path: str, producer: Callable[[], Any], lock, dump_kwargs: dict):
+        if lock is not None:
+            if not lock.acquire(timeout=self.lock_timeout):
+                raise TimeoutError(f"lock 대기 초과 ({self.lock_timeout}s)")
+            try:
+                text = json.dumps(producer(), **dump_kwargs)
+            finally:
+                lock.release()
+        else:
+            text = json.dumps(producer(), **dump_kwargs)
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(temp_path, path)
+        self.stats['bytes'] += len(text)
+
+    def _execute(self, job: _Job) -> bool:
+        started = time.perf_counter()
+        try:
+            with self._write_lock:
+                job.run()
+        except Exception as e:
+            # RuntimeError: producer가 읽는 중 다른 스레드가 dict 크기를 바꾼 경우 등 → 다음 창에 재시도
+            self.stats['errors'] += 1
+            if job.retries < self.max_retries and not self._stopped:
+                job.retries += 1
+                self.stats['retries'] += 1
+                with self._cond:
+                    if job.key not in self._pending:
+                        job.due = time.time() + min(self.debounce, 0.2)
+                        self._pending[job.key] = job
+                        self._cond.notify()
+                self.logger.debug(f"💾 Save 재시도 예정 ({job.key}): {e}")
+            else:
+                self.stats['dropped'] += 1
+                self.logger.error(f"💾 Save Failed ({job.key}): {e}")
+            return False
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        delay_ms = (time.time() - job.requested_at) * 1000
+        self.stats['writes'] += 1
+        self.stats['total_write_ms'] += elapsed_ms
+        self.stats['max_write_ms'] = max(self.stats['max_write_ms'], elapsed_ms)
+        self.stats['total_delay_ms'] += delay_ms
+        self.stats['max_delay_ms'] = max(self.stats['max_delay_ms'], delay_ms)
+        self.file_writes[job.key] = self.file_writes.get(job.key, 0) + 1
+        return True
+
+    def _take_due(self) -> list:
+        now = time.time()
+        due = [job for job in self._pending.values() if job.due <= now]
+        for job in due:
+            del self._pending[job.key]
+        return due
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._stopped:
+                    now = time.time()
+                    if any(job.due <= now for job in self._pending.values()):
+                        break
+                    timeout = min(job.due for job in self._pending.values()) - now if self._pending else None
+                    self._cond.wait(timeout)
+                else:
+                    return
+            # 꺼낸 요청은 기록이 끝날 때까지 _write_lock 보유 → flush()가 진행 중 기록까지 기다림
+            with self._write_lock:
+                with self._cond:
+                    due = self._take_due()
+                for job in due:
+                    self._execute(job)
+
+    # ===== flush / Terminate =====
+
+    def flush(self) -> int:
+        """대기 중인 Save를 호출 스레드에서 즉시 기록 (백그라운드에서 기록 중인 Save도 끝날 때까지 대기, Returns: 기록 수)"""
+        with self._write_lock:
+            with self._cond:
+                jobs = list(self._pending.values())
+                self._pending.clear()
+            written = 0
+            for job in jobs:
+                written += self._execute(job)
+            return written
+
+    def shutdown(self, timeout: float = 5.0):
+        """대기 중 Save 기록 후 스레드 Terminate (이후 요청은 동기 기록)"""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        written = self.flush()
+        if written:
+            self.logger.info(f"💾 Terminate 전 Save flush: {written}count File")
+
+    def pending_count(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def get_stats(self) -> dict:
+        writes = self.stats['writes']
+        return {
+            **self.stats,
+            'pending': self.pending_count(),
+            'avg_write_ms': round(self.stats['total_write_ms'] / writes, 3) if writes else 0.0,
+            'avg_delay_ms': round(self.stats['total_delay_ms'] / writes, 1) if writes else 0.0,
+            'files': dict(self.file_writes),
+        }
+
+
+_shared_scheduler: Optional[PersistenceScheduler] = None
+_shared_scheduler_lock = threading.Lock()
+_signals_installed = False
+
+
+def get_persistence_scheduler(logger=None) -> PersistenceScheduler:
+    """프로세스 공용 Save 스케줄러 (프로세스 Terminate 시 atexit으로 flush)"""
+    global _shared_scheduler
+    if _shared_scheduler is None:
+        with _shared_scheduler_lock:
+            if _shared_scheduler is None:
+                _shared_scheduler = PersistenceScheduler(logger=logger)
+                atexit.register(_shared_scheduler.shutdown)
+    return _shared_scheduler
+
+
+def install_signal_handlers(signals=(signal.SIGTERM,)):
+    """
+    Terminate 시그널에서 대기 중 Save flush 후 기존 핸들러로 넘김 (메인 스레드에서 호출)
+
+    SIGINT는 KeyboardInterrupt → finally / atexit 경로로 flush되므로 기본 대상에서 제외.
+    기존 핸들러가 기본 동작이면 SystemExit을 올려 finally 블록이 실행되도록 합니다.
+    """
+    global _signals_installed
+    if _signals_installed or threading.current_thread() is not threading.main_thread():
+        return
+    scheduler = get_persistence_scheduler()
+
+    for sig in signals:
+        previous = signal.getsignal(sig)
+
+        def handler(signum, frame, previous=previous):
+            try:
+                scheduler.flush()
+            except Exception as e:
+                scheduler.logger.error(f"💾 시그널 flush Failed: {e}")
+            if callable(previous):
+                previous(signum, frame)
+            elif previous != signal.SIG_IGN:
+                raise SystemExit(128 + signum)
+
+        signal.signal(sig, handler)
+    _signals_installed = True
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+"""
+JSON Save 스케줄러 Verification (임시 디렉토리, 네트워크 없음)
+
+점검 항목:
+1. 디바운스: 같은 File 요청 N times → 기록 1times, 내용은 마지막 상태 / File별 독립
+2. 원자적 기록: 기록 중에도 읽는 쪽은 항상 완전한 JSON, tmp File 남지 않음
+3. flush / shutdown: 대기 중 Save 즉시 기록, Terminate 후 요청은 동기 기록
+4. lock 보유 중 / producer RuntimeError → 재시도 후 기록
+5. SIGTERM 핸들러: 대기 중 Save flush 후 SystemExit
+6. DCA 매니저: Notification 기록 Save 합침, Position 로그 압축 백그라운드, Terminate 후 Save / flush 경합 시 교착 없음
+   1분 급등 전략 월간 통계: 날짜 변경 직후 두 날짜 Save가 1times으로 합쳐져도 두 날짜 모두 기록
+7. 호출 비용: 동기 json.dump 대비 (호출 스레드 기준)
+
+Usage:
+    python persistence_scheduler_check.py [--calls 2000]
+"""
+
+import argparse
+import json
+import logging
+import os
+import signal
+import tempfile
+import threading
+import time
+
+from persistence_scheduler import PersistenceScheduler, get_persistence_scheduler, install_signal_handlers
+
+
+def check(results: list, name: str, passed: bool, detail: str = ''):
+    results.append(passed)
+    print(f"  {'✅' if passed else '❌'} {name}" + (f" - {detail}" if detail else ''))
+
+
+def read_json(path: str):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def check_debounce(results: list, calls: int):
+    print(f"\n[1] 디바운스 ({calls}times 요청)")
+    scheduler = PersistenceScheduler(debounce=0.2)
+    state = {'value': 0}
+    for i in range(calls):
+        state['value'] = i
+        scheduler.schedule('a.json', lambda: dict(state))
+    time.sleep(0.5)
+    check(results, "같은 File → 기록 1times, 마지막 상태", scheduler.stats['writes'] == 1
+          and read_json('a.json') == {'value': calls - 1},
+          f"요청 {scheduler.stats['requests']} / 합침 {scheduler.stats['coalesced']}")
+
+    for name in ('b.json', 'c.json', 'sub/d.json'):
+        scheduler.schedule(name, lambda name=name: {'file': name})
+    time.sleep(0.5)
+    check(results, "File별 독립 기록 (폴더 Create 포함)", scheduler.stats['writes'] == 4
+          and read_json('sub/d.json') == {'file': 'sub/d.json'})
+
+    scheduler.schedule('a.json', lambda: {'value': 'late'}, debounce=5)
+    started = time.time()
+    while scheduler.pending_count() and time.time() - started < 1:
+        time.sleep(0.05)
+    check(results, "요청별 디바운스 창 지정", scheduler.pending_count() == 1)
+    scheduler.shutdown()
+
+
+def check_atomic(results: list):
+    print("\n[2] 원자적 기록")
+    scheduler = PersistenceScheduler(debounce=0)
+    payload = {f"key_{i}": list(range(50)) for i in range(400)}
+    scheduler.schedule('big.json', lambda: payload)
+    scheduler.flush()
+
+    errors = []
+    reads = [0]
+    stop = threading.Event()
+
+    def reader():
+        while not stop.is_set():
+            try:
+                read_json('big.json')
+                reads[0] += 1
+            except ValueError as e:
+                errors.append(e)
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    for i in range(100):
+        payload['key_0'] = [i] * 50
+        scheduler.schedule('big.json', lambda: payload)
+        time.sleep(0.002)
+    time.sleep(0.2)
+    stop.set()
+    thread.join()
+    scheduler.shutdown()
+    leftovers = [name for name in os.listdir('.') if name.endswith('.tmp')]
+    check(results, "읽는 쪽 JSON 오류 없음", not errors and reads[0] > 0,
+          f"읽기 {reads[0]}times / 기록 {scheduler.stats['writes']}times")
+    check(results, "tmp File 남지 않음 + 최종 내용", not leftovers and read_json('big.json')['key_0'] == [99] * 50)
+
+
+def check_flush(results: list):
+    print("\n[3] flush / shutdown")
+    scheduler = PersistenceScheduler(debounce=60)
+    scheduler.schedule('flush.json', lambda: {'v': 1})
+    check(results, "flush → 즉시 기록", scheduler.flush() == 1 and read_json('flush.json') == {'v': 1})
+
+    scheduler.schedule('flush.json', lambda: {'v': 2})
+    scheduler.shutdown()
+    check(results, "shutdown → 대기 중 Save 기록", read_json('flush.json') == {'v': 2})
+
+    scheduler.schedule('flush.json', lambda: {'v': 3})
+    check(results, "Terminate 후 요청 → 동기 기록", read_json('flush.json') == {'v': 3}
+          and scheduler.stats['sync_writes'] == 1)
+
+
+def check_retry(results: list):
+    print("\n[4] 재시도")
+    scheduler = PersistenceScheduler(debounce=0, lock_timeout=0.1)
+    lock = threading.Lock()
+    lock.acquire()
+    scheduler.schedule('locked.json', lambda: {'v': 'locked'}, lock=lock)
+    time.sleep(0.15)
+    written_while_locked = os.path.exists('locked.json')
+    lock.release()
+    time.sleep(0.5)
+    check(results, "lock 보유 중 연기 → 해제 후 기록", not written_while_locked
+          and read_json('locked.json') == {'v': 'locked'} and scheduler.stats['retries'] >= 1)
+
+    attempts = [0]
+
+    def flaky():
+        attempts[0] += 1
+        if attempts[0] == 1:
+            raise RuntimeError('dictionary changed size during iteration')
+        return {'v': attempts[0]}
+
+    scheduler.schedule('flaky.json', flaky)
+    time.sleep(0.5)
+    scheduler.shutdown()
+    check(results, "producer RuntimeError → 재시도 기록", read_json('flaky.json') == {'v': 2})
+
+
+def check_signal(results: list):
+    print("\n[5] SIGTERM 핸들러")
+    previous = signal.getsignal(signal.SIGTERM)
+    scheduler = get_persistence_scheduler()
+    scheduler.schedule('signal.json', lambda: {'v': 'signal'}, debounce=60)
+    install_signal_handlers()
+    exited = None
+    try:
+        os.kill(os.getpid(), signal.SIGTERM)
+        time.sleep(0.1)
+    except SystemExit as e:
+        exited = e.code
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+    check(results, "flush 후 SystemExit", exited == 128 + signal.SIGTERM and read_json('signal.json') == {'v': 'signal'})
+
+
+def check_dca(results: list):
+    print("\n[6] DCA 매니저 연동")
+    from improved_dca_position_manager import ImprovedDCAPositionManager
+    from dca_position_journal_check import make_position
+
+    scheduler = get_persistence_scheduler()
+    manager = ImprovedDCAPositionManager(exchange=None)
+    writes = scheduler.stats['writes']
+    for i in range(200):
+        manager._sent_fill_notifications.add(f"fill_{i}")
+        manager._save_sent_notifications()
+    scheduler.flush()
+    data = read_json('sent_notifications.json')
+    check(results, "Notification 기록 200times → 기록 1times", scheduler.stats['writes'] == writes + 1
+          and data['count'] == 200)
+
+    manager.journal.compact_records = 5
+    for i in range(20):
+        manager.positions[f"P{i}/USDT:USDT"] = make_position(f"P{i}/USDT:USDT")
+        manager.save_data()
+        time.sleep(0.01)  # 백그라운드 압축이 돌 틈 (연속 예약은 1times으로 합쳐지므로 횟수가 타이밍에 좌우되지 않게)
+    scheduler.flush()
+    compactions = manager.journal.stats['compactions']
+    manager.flush_data()
+    stats = manager.journal.get_stats()
+    check(results, "Position 로그 압축 → 백그라운드, flush_data 후 스냅샷 = 전체",
+          compactions >= 3 and len(read_json(manager.positions_file)) == 20
+          and stats['wal_records'] == 0, f"백그라운드 압축 {compactions}times")
+
+    # Terminate 후 (동기 실행) 로그 Save의 압축 예약 vs flush (_write_lock → close → journal lock) 경합
+    from dca_position_journal import PositionJournal
+    stopped = PersistenceScheduler(debounce=0)
+    stopped.shutdown()
+    journal = PositionJournal('race.json', serialize=dict, compact_records=1, scheduler=stopped)
+
+    def saver():
+        for i in range(300):
+            journal.save({'A/USDT:USDT': {'v': i}})
+
+    def flusher():
+        for _ in range(300):
+            stopped.schedule_call(journal.wal_path, journal.close, debounce=0)
+            stopped.flush()
+
+    threads = [threading.Thread(target=saver, daemon=True), threading.Thread(target=flusher, daemon=True)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    check(results, "Terminate 후 Save / flush 경합 → 교착 없음", not any(thread.is_alive() for thread in threads)
+          and read_json('race.json') == {'A/USDT:USDT': {'v': 299}})
+
+
+def check_daily_stats(results: list):
+    print("\n[6-1] 1분 급등 전략 월간 통계")
+    from one_minute_surge_entry_strategy import OneMinuteSurgeEntryStrategy
+
+    # 통계 Save에 필요한 속성만 가진 전략 객체 (거래소 / 필터 Initialize 없이)
+    strategy = OneMinuteSurgeEntryStrategy.__new__(OneMinuteSurgeEntryStrategy)
+    strategy.logger = logging.getLogger('daily_stats_check')
+    strategy._monthly_stats = {}
+    strategy.today_stats = {'total_trades': 2, 'wins': 1, 'losses': 1, 'total_pnl': 1.5, 'win_rate': 50.0,
+                            'trades_detail': []}
+    strategy._get_trading_day = lambda: '2026-05-10'
+    scheduler = get_persistence_scheduler()
+    writes = scheduler.stats['writes']
+    strategy._save_daily_stats()
+
+    # 날짜 변경 → 새 날짜 통계 Save (디바운스 창 안이라 앞선 요청과 합쳐짐)
+    strategy.today_stats = {'total_trades': 1, 'wins': 1, 'losses': 0, 'total_pnl': 0.5, 'win_rate': 100.0,
+                            'trades_detail': []}
+    strategy._get_trading_day = lambda: '2026-05-11'
+    strategy._save_daily_stats()
+    scheduler.flush()
+    data = read_json(os.path.join('trading_stats', '2026', 'daily_05.json'))
+    check(results, "날짜 변경 직후 Save 합침 → 두 날짜 모두 기록", scheduler.stats['writes'] == writes + 1
+          and sorted(data['days']) == ['2026-05-10', '2026-05-11'] and data['summary']['total_trades'] == 3,
+          f"{sorted(data['days'])}")
+
+
+def check_cost(results: list, calls: int):
+    print(f"\n[7] 호출 비용 ({calls}times, Rate Limit 통계 크기)")
+    stats = {'total_requests': 0, 'total_weight_used': 0, 'peak_weight': 0, 'warning_count': 0}
+    hourly = {f"2026-01-01 {h:02d}:00": {'requests': 100, 'weight': 500, 'warnings': 0} for h in range(24)}
+
+    started = time.perf_counter()
+    for i in range(calls):
+        stats['total_requests'] = i
+        with open('sync.json', 'w', encoding='utf-8') as f:
+            json.dump({'stats': stats, 'hourly_stats': hourly}, f, indent=2, ensure_ascii=False)
+    sync_us = (time.perf_counter() - started) * 1e6 / calls
+
+    scheduler = PersistenceScheduler(debounce=0.5)
+    started = time.perf_counter()
+    for i in range(calls):
+        stats['total_requests'] = i
+        scheduler.schedule('async.json', lambda: {'stats': dict(stats), 'hourly_stats': hourly})
+    scheduled_us = (time.perf_counter() - started) * 1e6 / calls
+    scheduler.shutdown()
+    summary = scheduler.get_stats()
+    check(results, "호출 스레드 비용 감소 + 기록 횟수 감소", scheduled_us < sync_us and summary['writes'] < calls,
+          f"동기 {sync_us:.1f}us → 예약 {scheduled_us:.1f}us, 기록 {summary['writes']}times "
+          f"(평균 {summary['avg_write_ms']:.2f}ms, 지연 최대 {summary['max_delay_ms']:.0f}ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='JSON Save 스케줄러 Verification')
+    parser.add_argument('--calls', type=int, default=2000, help='요청 수')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+
+    results = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            check_debounce(results, args.calls)
+            check_atomic(results)
+            check_flush(results)
+            check_retry(results)
+            check_signal(results)
+            check_dca(results)
+            check_daily_stats(results)
+            check_cost(results, args.calls)
+        finally:
+            get_persistence_scheduler().flush()
+            os.chdir(cwd)
+
+    print()
+    if all(results):
+        print(f"✅ 전체 통과 ({len(results)} 항목)")
+    else:
+        print(f"❌ Failed {results.count(False)} / {len(results)} 항목")
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+Position / Mark Price Snapshot
+보유 Position과 mark price를 한 곳에서 갱신하고 모든 소비자가 같은 스냅샷을 읽는 공용 서비스
+
+흐름:
+- Position: fetch_positions() 1times (전체 Symbol, weight 5)로 보유 Position 전체 갱신
+- mark price: fetch_mark_prices() 1times (전체 Symbol, weight 10)로 갱신 + Position 응답의 markPrice도 반영
+- 소비자는 max_age 이내 스냅샷이면 요청 없이 읽고, 오래됐으면 1times만 갱신 (동시 요청은 하나로 합쳐짐)
+- 스트림 (User Data Stream / mark price 스트림)이 있으면 update_position / update_mark_price로 갱신 → REST 요청 자체가 줄어듦
+- set_live_source로 스트림 건강 상태를 연결하면 스트림이 살아있는 동안 Position은 REST로 갱신하지 않음
+  (force=True 재조정만 요청)
+
+보유 Position 수와 무관하게 REST weight가 주기당 일정합니다 (Symbol별 fetch_positions / fetch_ticker 대체).
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+class PositionSnapshot:
+    """보유 Position / mark price 공용 스냅샷"""
+
+    def __init__(self, exchange, logger=None, position_ttl: float = 5.0, price_ttl: float = 2.0):
+        """
+        Args:
+            exchange: ccxt exchange 객체 (Rate Limiter Installed 동기 거래소)
+            logger: 로거 인스턴스
+            position_ttl: 기본 Position 스냅샷 유효 Time (초)
+            price_ttl: 기본 mark price 유효 Time (초)
+        """
+        self.exchange = exchange
+        self.logger = logger or logging.getLogger(__name__)
+        self.position_ttl = position_ttl
+        self.price_ttl = price_ttl
+
+        self._lock = threading.Lock()
+        self._position_refresh_lock = threading.Lock()
+        self._price_refresh_lock = threading.Lock()
+
+        self._positions: Dict[str, dict] = {}  # symbol -> ccxt Position (contracts != 0)
+        self._positions_at = 0.0
+        self._position_times: Dict[str, float] = {}  # symbol -> 마지막 반영 시각 (Remove 포함)
+        self._live_source: Optional[Callable[[], bool]] = None
+        self._prices: Dict[str, float] = {}    # symbol -> mark price
+        self._price_times: Dict[str, float] = {}
+        self._prices_at = 0.0
+
+        self.stats = {
+            'position_requests': 0,
+            'price_requests': 0,
+            'position_reads': 0,
+            'price_reads': 0,
+            'stream_updates': 0,
+            'errors': 0,
+        }
+
+    # ===== 갱신 =====
+
+    def position_age(self) -> float:
+        return time.time() - self._positions_at
+
+    def set_live_source(self, is_live: Optional[Callable[[], bool]]):
+        """Position 스트림 건강 상태 (True인 동안 스냅샷을 최신으로 간주, None이면 해제)"""
+        self._live_source = is_live
+
+    def is_live(self) -> bool:
+        try:
+            return bool(self._live_source and self._live_source())
+        except Exception:
+            return False
+
+    def refresh_positions(self, max_age: Optional[float] = None, force: bool = False) -> bool:
+        """
+        스냅샷이 max_age보다 오래됐으면 fetch_positions() 1times로 갱신 (Failed 시 예외, 기존 스냅샷 Maintain)
+
+        Position 스트림이 살아있으면 (is_live) force=True일 때만 요청합니다.
+
+        Returns:
+            bool: 이번 호출에서 요청을 보냈으면 True
+        """
+        max_age = 0 if force else (self.position_ttl if max_age is None else max_age)
+        if not force and (self.is_live() or self.position_age() < max_age):
+            return False
+        with self._position_refresh_lock:
+            # 대기하는 동안 다른 스레드가 갱신했으면 그 결과 Usage
+            if self.position_age() < max_age:
+                return False
+            started = time.time()
+            try:
+                self.stats['position_requests'] += 1
+                positions = self.exchange.fetch_positions()
+            except Exception:
+                self.stats['errors'] += 1
+                raise
+            self._store_positions(positions or [], started)
+            return True
+
+    def refresh_prices(self, max_age: Optional[float] = None) -> bool:
+        """mark price 스냅샷이 max_age보다 오래됐으면 전체 Symbol 1times 조times (Failed 시 예외)"""
+        max_age = self.price_ttl if max_age is None else max_age
+        if time.time() - self._prices_at < max_age:
+            return False
+        with self._price_refresh_lock:
+            if time.time() - self._prices_at < max_age:
+                return False
+            started = time.time()
+            try:
+                self.stats['price_requests'] += 1
+                if hasattr(self.exchange, 'fetch_mark_prices'):
+                    tickers = self.exchange.fetch_mark_prices()
+                else:
+                    tickers = self.exchange.fetch_tickers()
+            except Exception:
+                self.stats['errors'] += 1
+                raise
+            prices = {}
+            for symbol, ticker in (tickers or {}).items():
+                price = ticker.get('markPrice') or ticker.get('last')
+                if price:
+                    prices[symbol] = float(price)
+            with self._lock:
+                for symbol, price in prices.items():
+                    # 요청 중 스트림으로 더 최신 값이 들어왔으면 덮어쓰지 않음
+                    if self._price_times.get(symbol, 0) <= started:
+                        self._prices[symbol] = price
+                        self._price_times[symbol] = started
+                self._prices_at = started
+            return True
+
+    def _store_positions(self, positions: List[dict], fetched_at: float):
+        fresh = {p['symbol']: p for p in positions if p and p.get('symbol') and float(p.get('contracts') or 0) != 0}
+        with self._lock:
+            # 요청을 보낸 뒤 스트림으로 들어온 변경 (추가 / Remove)은 REST 응답보다 최신
+            for symbol, updated_at in self._position_times.items():
+                if updated_at > fetched_at:
+                    if symbol in self._positions:
+                        fresh[symbol] = self._positions[symbol]
+                    else:
+                        fresh.pop(symbol, None)
+            self._position_times = {symbol: max(fetched_at, self._position_times.get(symbol, 0))
+                                    for symbol in set(fresh) | set(self._positions)}
+            self._positions = fresh
+            self._positions_at = fetched_at
+            for symbol, position in self._positions.items():
+                self._set_price_locked(symbol, position.get('markPrice'), fetched_at)
+
+    def _set_price_locked(self, symbol: str, price, timestamp: float):
+        if price and self._price_times.get(symbol, 0) <= timestamp:
+            self._prices[symbol] = float(price)
+            self._price_times[symbol] = timestamp
+
+    def invalidate(self, positions: bool = True, prices: bool = False):
+        """다음 조times 때 강제 갱신 (주문 체결 직후 등)"""
+        with self._lock:
+            if positions:
+                self._positions_at = 0.0
+            if prices:
+                self._prices_at = 0.0
+                self._price_times.clear()
+
+    # ===== 스트림 갱신 훅 =====
+
+    def update_position(self, symbol: str, position: Optional[dict], timestamp: Optional[float] = None,
+                        merge: bool = False):
+        """
+        스트림으로 받은 Position 반영 (None 또는 contracts 0이면 Remove)
+
+        Args:
+            merge: True면 기존 행 위에 값이 있는 필드만 덮어씀 (스트림에 없는 REST 필드 Maintain)
+        """
+        timestamp = timestamp or time.time()
+        with self._lock:
+            self.stats['stream_updates'] += 1
+            self._position_times[symbol] = timestamp
+            if not position or float(position.get('contracts') or 0) == 0:
+                self._positions.pop(symbol, None)
+                return
+            if merge and symbol in self._positions:
+                position = {**self._positions[symbol], **{k: v for k, v in position.items() if v is not None}}
+            self._positions[symbol] = position
+            self._set_price_locked(symbol, position.get('markPrice'), timestamp)
+
+    def update_mark_price(self, symbol: str, price: float, timestamp: Optional[float] = None):
+        """스트림으로 받은 mark price 반영"""
+        with self._lock:
+            self.stats['stream_updates'] += 1
+            self._set_price_locked(symbol, price, timestamp or time.time())
+
+    # ===== 조times =====
+
+    def fetch_positions(self, symbols: Optional[Iterable[str]] = None, max_age: Optional[float] = None) -> List[dict]:
+        """
+        exchange.fetch_positions 대체 - 스냅샷에서 보유 Position 목록 반환 (오래됐으면 1times 갱신)
+
+        보유 중인 Position만 반환합니다 (contracts 0인 Symbol은 목록에 없음).
+        """
+        self.refresh_positions(max_age)
+        with self._lock:
+            self.stats['position_reads'] += 1
+            if symbols is None:
+                return list(self._positions.values())
+            return [self._positions[symbol] for symbol in symbols if symbol in self._positions]
+
+    def get_position(self, symbol: str, max_age: Optional[float] = None) -> Optional[dict]:
+        positions = self.fetch_positions([symbol], max_age=max_age)
+        return positions[0] if positions else None
+
+    def get_mark_price(self, symbol: str, max_age: Optional[float] = None) -> Optional[float]:
+        """mark price (max_age 이내 값이 없으면 전체 1times 갱신, 갱신 Failed 시 남은 값 / None)"""
+        return self.get_mark_prices([symbol], max_age=max_age).get(symbol)
+
+    def get_mark_prices(self, symbols: Iterable[str], max_age: Optional[float] = None) -> Dict[str, float]:
+        """여러 Symbol mark price - 하나라도 오래됐으면 전체 1times 갱신"""
+        max_age = self.price_ttl if max_age is None else max_age
+        symbols = list(symbols)
+        now = time.time()
+        with self._lock:
+            stale = any(now - self._price_times.get(symbol, 0) >= max_age for symbol in symbols)
+        if stale:
+            try:
+                self.refresh_prices(max_age)
+            except Exception as e:
+                self.logger.warning(f"⚠️ mark price 스냅샷 갱신 Failed: {e}")
+        with self._lock:
+            self.stats['price_reads'] += 1
+            return {symbol: self._prices[symbol] for symbol in symbols if symbol in self._prices}
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                **self.stats,
+                'positions': len(self._positions),
+                'live': self.is_live(),
+                'prices': len(self._prices),
+                'position_age': round(self.position_age(), 2) if self._positions_at else None,
+            }
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+Position / mark price 공용 스냅샷 Verification (가짜 거래소, 네트워크 없음)
+
+점검 항목:
+1. 보유 Position N count를 소비자 여러 곳에서 읽어도 fetch_positions 1times (ttl 이내), max_age=0은 강제 갱신
+2. 동시 갱신 요청 합치기 (스레드 여러 count → 요청 1times)
+3. 갱신 Failed 시 예외 + 기존 스냅샷 Maintain
+4. mark price: Symbol 수와 무관하게 전체 1times, Position 응답 markPrice 반영
+5. 스트림 훅: update_position / update_mark_price, 요청 중 들어온 더 최신 값은 REST 결과로 덮어쓰지 않음
+6. 전략 / DCA 매니저 소비자: Symbol별 조times / 현재가 조times가 스냅샷 1times로 처리
+
+Usage:
+    python position_snapshot_check.py [--positions 30] [--threads 16]
+"""
+
+import argparse
+import logging
+import threading
+import time
+import types
+
+from position_snapshot import PositionSnapshot
+
+
+class FakeExchange:
+    """fetch_positions / fetch_mark_prices 호출 수를 세는 가짜 거래소"""
+
+    def __init__(self, symbols, latency: float = 0.0):
+        self.symbols = list(symbols)
+        self.latency = latency
+        self.calls = {'fetch_positions': 0, 'fetch_mark_prices': 0, 'fetch_ticker': 0}
+        self.fail = False
+        self.price_offset = 0.0
+
+    def _wait(self, name):
+        self.calls[name] += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if self.fail:
+            raise Exception("HTTP 503")
+
+    def fetch_positions(self, symbols=None):
+        self._wait('fetch_positions')
+        rows = [{'symbol': symbol, 'contracts': 10.0 + i, 'markPrice': 100.0 + i + self.price_offset,
+                 'entryPrice': 100.0, 'side': 'long'} for i, symbol in enumerate(self.symbols)]
+        rows.append({'symbol': 'ZERO/USDT:USDT', 'contracts': 0, 'markPrice': 1.0})
+        return rows
+
+    def fetch_mark_prices(self, symbols=None):
+        self._wait('fetch_mark_prices')
+        return {f"M{i}/USDT:USDT": {'markPrice': 10.0 + i + self.price_offset} for i in range(300)}
+
+    def fetch_ticker(self, symbol):
+        self._wait('fetch_ticker')
+        return {'last': 1.0}
+
+
+def check(results: list, name: str, passed: bool, detail: str = ''):
+    results.append(passed)
+    print(f"  {'✅' if passed else '❌'} {name}" + (f" - {detail}" if detail else ''))
+
+
+def check_positions(results: list, logger, count: int):
+    print(f"\n[1] Position 스냅샷 ({count}count 보유)")
+    symbols = [f"P{i}/USDT:USDT" for i in range(count)]
+    exchange = FakeExchange(symbols)
+    snapshot = PositionSnapshot(exchange, logger=logger)
+
+    per_symbol = [snapshot.fetch_positions([symbol]) for symbol in symbols]
+    everything = snapshot.fetch_positions()
+    check(results, "Symbol별 조times N times → 요청 1times", exchange.calls['fetch_positions'] == 1
+          and all(len(rows) == 1 for rows in per_symbol), f"요청 {exchange.calls['fetch_positions']}times")
+    check(results, "보유 Position만 (contracts 0 Excluded)", len(everything) == count
+          and snapshot.get_position('ZERO/USDT:USDT') is None)
+
+    snapshot.fetch_positions(max_age=0)
+    check(results, "max_age=0 강제 갱신", exchange.calls['fetch_positions'] == 2)
+
+    snapshot.invalidate()
+    snapshot.fetch_positions()
+    check(results, "invalidate 후 갱신", exchange.calls['fetch_positions'] == 3)
+
+
+def check_single_flight(results: list, logger, threads: int):
+    print(f"\n[2] 동시 갱신 합치기 ({threads} 스레드)")
+    exchange = FakeExchange(['A/USDT:USDT'], latency=0.2)
+    snapshot = PositionSnapshot(exchange, logger=logger)
+    barrier = threading.Barrier(threads)
+
+    def reader():
+        barrier.wait()
+        snapshot.fetch_positions(['A/USDT:USDT'])
+
+    workers = [threading.Thread(target=reader) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    check(results, "요청 1times", exchange.calls['fetch_positions'] == 1, f"요청 {exchange.calls['fetch_positions']}times")
+
+
+def check_failure(results: list, logger):
+    print("\n[3] 갱신 Failed")
+    exchange = FakeExchange(['A/USDT:USDT'])
+    snapshot = PositionSnapshot(exchange, logger=logger)
+    snapshot.fetch_positions()
+    exchange.fail = True
+    try:
+        snapshot.fetch_positions(max_age=0)
+        raised = False
+    except Exception:
+        raised = True
+    check(results, "예외 전달", raised and snapshot.stats['errors'] == 1)
+    exchange.fail = False
+    check(results, "기존 스냅샷 Maintain", snapshot._positions.get('A/USDT:USDT') is not None)
+
+
+def check_prices(results: list, logger):
+    print("\n[4] mark price")
+    exchange = FakeExchange(['A/USDT:USDT', 'B/USDT:USDT'])
+    snapshot = PositionSnapshot(exchange, logger=logger)
+    prices = snapshot.get_mark_prices([f"M{i}/USDT:USDT" for i in range(300)])
+    for i in range(300):
+        snapshot.get_mark_price(f"M{i}/USDT:USDT")
+    check(results, "300 Symbol 조times → 요청 1times", len(prices) == 300 and exchange.calls['fetch_mark_prices'] == 1,
+          f"요청 {exchange.calls['fetch_mark_prices']}times")
+
+    snapshot.fetch_positions()
+    price = snapshot.get_mark_price('A/USDT:USDT')
+    check(results, "Position 응답 markPrice 반영 (Add 요청 없음)", price == 100.0
+          and exchange.calls['fetch_mark_prices'] == 1, f"{price}")
+
+    exchange.fail = True
+    stale = snapshot.get_mark_price('M5/USDT:USDT', max_age=0)
+    exchange.fail = False
+    check(results, "갱신 Failed 시 남은 값 반환", stale == 15.0, f"{stale}")
+
+
+def check_stream(results: list, logger):
+    print("\n[5] 스트림 훅")
+    exchange = FakeExchange(['A/USDT:USDT'], latency=0.2)
+    snapshot = PositionSnapshot(exchange, logger=logger)
+    snapshot.fetch_positions()
+
+    snapshot.update_position('A/USDT:USDT', {'symbol': 'A/USDT:USDT', 'contracts': 0})
+    snapshot.update_position('C/USDT:USDT', {'symbol': 'C/USDT:USDT', 'contracts': 3, 'markPrice': 7.0})
+    check(results, "update_position Remove / Add", snapshot.get_position('A/USDT:USDT') is None
+          and snapshot.get_position('C/USDT:USDT')['contracts'] == 3 and exchange.calls['fetch_positions'] == 1)
+
+    exchange.price_offset = 1000.0
+    worker = threading.Thread(target=snapshot.refresh_prices, kwargs={'max_age': 0})
+    worker.start()
+    time.sleep(0.05)
+    snapshot.update_mark_price('M1/USDT:USDT', 42.0)
+    worker.join()
+    check(results, "요청 중 들어온 스트림 값 Maintain", snapshot.get_mark_price('M1/USDT:USDT') == 42.0
+          and snapshot.get_mark_price('M2/USDT:USDT') == 1012.0,
+          f"M1 {snapshot.get_mark_price('M1/USDT:USDT')}, M2 {snapshot.get_mark_price('M2/USDT:USDT')}")
+
+
+def check_consumers(results: list, logger, count: int):
+    print("\n[6] 전략 / DCA 매니저 소비자")
+    from improved_dca_position_manager import ImprovedDCAPositionManager
+    from one_minute_surge_entry_strategy import OneMinuteSurgeEntryStrategy
+
+    symbols = [f"P{i}/USDT:USDT" for i in range(count)]
+    exchange = FakeExchange(symbols)
+    strategy = types.SimpleNamespace(exchange=exchange, logger=logger,
+                                     position_snapshot=PositionSnapshot(exchange, logger=logger))
+    for name in ('_fetch_positions_by_symbol', '_collect_recovery_positions'):
+        setattr(strategy, name, types.MethodType(getattr(OneMinuteSurgeEntryStrategy, name), strategy))
+
+    exchange_positions, current_prices = strategy._collect_recovery_positions(symbols, 'check')
+    check(results, "DCA Recover Position 수집 → fetch_positions 1times",
+          len(exchange_positions) == count and len(current_prices) == count
+          and exchange.calls['fetch_positions'] == 1, f"요청 {exchange.calls['fetch_positions']}times")
+
+    strategy.position_snapshot.invalidate()
+    exchange.fail = True
+    failed = strategy._fetch_positions_by_symbol(symbols[:3])
+    exchange.fail = False
+    check(results, "만료 스냅샷 갱신 Failed 시 Symbol별 예외", len(failed) == 3
+          and all(isinstance(value, Exception) for value in failed.values()))
+    strategy.position_snapshot.fetch_positions()
+
+    manager = ImprovedDCAPositionManager.__new__(ImprovedDCAPositionManager)
+    manager.exchange = exchange
+    manager.strategy = strategy
+    manager.positions = {}
+    manager.logger = logger
+    prices = manager._get_current_prices(symbols)
+    for symbol in symbols:
+        manager.get_current_price(symbol)
+    check(results, "DCA 현재가 조times → Add 요청 없음 (Position 스냅샷 markPrice)",
+          len(prices) == count and exchange.calls['fetch_ticker'] == 0 and exchange.calls['fetch_mark_prices'] == 0,
+          f"{exchange.calls}")
+    positions = manager._fetch_positions([symbols[0]], max_age=1.0)
+    check(results, "DCA Exit 직전 Position (1초 이내 스냅샷)", len(positions) == 1
+          and exchange.calls['fetch_positions'] == 3, f"{exchange.calls}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Position / mark price 공용 스냅샷 Verification')
+    parser.add_argument('--positions', type=int, default=30, help='보유 Position 수')
+    parser.add_argument('--threads', type=int, default=16, help='동시 조times 스레드 수')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    logger = logging.getLogger('position_snapshot_check')
+
+    results = []
+    check_positions(results, logger, args.positions)
+    check_single_flight(results, logger, args.threads)
+    check_failure(results, logger)
+    check_prices(results, logger)
+    check_stream(results, logger)
+    check_consumers(results, logger, args.positions)
+
+    print()
+    if all(results):
+        print(f"✅ 전체 통과 ({len(results)} 항목)")
+    else:
+        print(f"❌ Failed {results.count(False)} / {len(results)} 항목")
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
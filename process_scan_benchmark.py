@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+프로세스 스캔 벤치마크 / 결과 동일성 Verification
+스레드 스캔 (ThreadPoolExecutor 15, 지표 일괄 계산 + analyze_symbol) vs 프로세스 스캔 (SharedMemory + 워커 N count)
+
+측정 항목:
+1. 스캔 Analysis 단계 wall time (프레임은 get_ohlcv_data Cache에 미리 적재 → 네트워크 제외)
+2. 워커 수별 speedup (1 ~ CPU 코어 수)
+3. 결과 동일성: Symbol별 analyze_symbol 결과 (timestamp 필드 제외) 및 전략 Save 기록
+
+Usage:
+    python process_scan_benchmark.py [--symbols 150 400] [--workers 1 2 4] [--repeat 2]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from incremental_indicator_parity import frame, make_candles
+from indicator_cache import get_indicator_cache
+from one_minute_surge_entry_strategy import OneMinuteSurgeEntryStrategy
+
+
+def make_strategy(n_symbols: int) -> tuple:
+    """거래소 Connections 없는 전략 + get_ohlcv_data Cache에 적재된 스캔 프레임"""
+    strategy = OneMinuteSurgeEntryStrategy.create_scan_worker()
+    strategy._ohlcv_cache.ttl = float('inf')
+    strategy._process_scan_executor = None
+    now = time.time()
+    symbols = []
+    for i in range(n_symbols):
+        symbol = f"SYM{i}/USDT:USDT"
+        symbols.append(symbol)
+        for j, (timeframe, limit) in enumerate(OneMinuteSurgeEntryStrategy.SCAN_PROCESS_TIMEFRAMES):
+            strategy._ohlcv_cache.set(f"{symbol}_{timeframe}", frame(make_candles(limit, i * 10 + j)), now)
+    tickers = {symbol: {'percentage': (i % 40) - 5.0} for i, symbol in enumerate(symbols)}
+    return strategy, symbols, tickers
+
+
+def run_thread_scan(strategy, symbols, tickers) -> tuple:
+    """스레드 스캔 (scan_symbols 기본 경로와 동일)"""
+    get_indicator_cache().invalidate()
+    strategy._last_analysis_results = {}
+    start = time.perf_counter()
+    strategy._precompute_scan_indicators(symbols)
+    with ThreadPoolExecutor(max_workers=min(len(symbols), 15)) as executor:
+        futures = [(symbol, executor.submit(strategy.analyze_symbol, symbol, tickers.get(symbol)))
+                   for symbol in symbols]
+        results = {symbol: future.result() for symbol, future in futures}
+    strategy._scan_frames = {}
+    return time.perf_counter() - start, results, dict(strategy._last_analysis_results)
+
+
+def run_process_scan(strategy, symbols, tickers, workers: int) -> tuple:
+    """프로세스 스캔 (_scan_symbols_in_processes)"""
+    strategy.process_scan_workers = workers
+    strategy._get_process_scan_executor().warm_up()
+    strategy._last_analysis_results = {}
+    start = time.perf_counter()
+    all_results, total_analyzed, _ = strategy._scan_symbols_in_processes(symbols, tickers)
+    return time.perf_counter() - start, all_results, total_analyzed, dict(strategy._last_analysis_results)
+
+
+def normalize(results) -> list:
+    """비교용 정규화 (분석 시각 필드 제외)"""
+    rows = []
+    for result in results:
+        rows.append(tuple(sorted((k, repr(v)) for k, v in result.items() if k != 'timestamp')))
+    return sorted(rows)
+
+
+def flatten(results: dict) -> list:
+    flat = []
+    for result in results.values():
+        if isinstance(result, list):
+            flat.extend(result)
+        elif isinstance(result, dict):
+            flat.append(result)
+    return flat
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Process scan benchmark')
+    parser.add_argument('--symbols', type=int, nargs='+', default=[150, 400])
+    parser.add_argument('--workers', type=int, nargs='+', default=None)
+    parser.add_argument('--repeat', type=int, default=2)
+    args = parser.parse_args()
+
+    cpu_count = os.cpu_count() or 1
+    worker_counts = args.workers or sorted({1, 2, 4, cpu_count} & set(range(1, cpu_count + 1)))
+
+    print(f"📊 프로세스 스캔 벤치마크 (CPU {cpu_count}코어, 프레임: "
+          f"{', '.join(f'{tf}×{n}' for tf, n in OneMinuteSurgeEntryStrategy.SCAN_PROCESS_TIMEFRAMES)})")
+    for n_symbols in args.symbols:
+        strategy, symbols, tickers = make_strategy(n_symbols)
+        with contextlib.redirect_stdout(io.StringIO()):
+            thread_times = []
+            for _ in range(args.repeat):
+                elapsed, thread_results, thread_records = run_thread_scan(strategy, symbols, tickers)
+                thread_times.append(elapsed)
+        expected = normalize(flatten(thread_results))
+        thread_ms = min(thread_times) * 1000
+        print(f"\n[{n_symbols} symbols] thread scan: {thread_ms:.0f}ms")
+
+        for workers in worker_counts:
+            with contextlib.redirect_stdout(io.StringIO()):
+                process_times = []
+                for _ in range(args.repeat):
+                    elapsed, results, analyzed, records = run_process_scan(strategy, symbols, tickers, workers)
+                    process_times.append(elapsed)
+            same = normalize(results) == expected and records == thread_records and analyzed == len(symbols)
+            process_ms = min(process_times) * 1000
+            print(f"  workers={workers:>2}: {process_ms:>7.0f}ms  speedup {thread_ms / process_ms:>4.1f}x  "
+                  f"results {len(results)} {'✅' if same else '❌ mismatch'}")
+        strategy.shutdown_process_scan()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+Process Scan Executor
+스캔 Analysis(지표 계산 + 조건 평가)을 프로세스 풀로 분산하여 GIL 제약 없이 멀티 코어 활용
+
+구조:
+- 부모 프로세스: 스캔 프레임 (symbol, timeframe) 전체를 SharedMemory 블록 1count에 적재
+  [timestamp int64 × R][ohlcv float64 × R × 5], 프레임별 (시작 행, Length) 인덱스
+- 워커 프로세스: 블록에 attach → 읽기 전용 NumPy view로 DataFrame 구성 (복사 없음)
+  → 청크 단위 지표 일괄 계산 (batch_indicators) → analyze_symbol
+  → 결과 dict와 전략 Save 기록만 반환 (프레임은 다시 직렬화하지 않음)
+- 워커 풀은 유지 (프로세스 Starting 비용은 최초 1times), 블록은 스캔마다 Create / 해제
+
+start method:
+- 부모 프로세스에서는 WebSocket / ingest 스레드가 동작하므로 fork는 안전하지 않음
+- Linux: forkserver (미지원 플랫폼은 spawn)
+
+Usage:
+    executor = ProcessScanExecutor(workers=4)
+    outcome = executor.scan(frames, symbols, tickers)
+    executor.shutdown()
+"""
+
+import gc
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from batch_indicators import compute_indicator_frames
+from incremental_indicators import _timestamps_ms
+from indicator_cache import get_indicator_cache
+from kline_ring_buffer import OHLCV_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+FrameKey = Tuple[str, str]  # (symbol, timeframe)
+
+
+class SharedFrameBlock:
+    """(symbol, timeframe) 프레임들을 담은 SharedMemory 블록"""
+
+    def __init__(self, shm: shared_memory.SharedMemory, rows: int, index: Dict[FrameKey, Tuple[int, int]],
+                 owner: bool):
+        self._shm = shm
+        self.rows = rows
+        self.index = index
+        self.owner = owner
+        self.timestamps = np.ndarray((rows,), dtype=np.int64, buffer=shm.buf, offset=0)
+        self.ohlcv = np.ndarray((rows, len(OHLCV_COLUMNS)), dtype=np.float64, buffer=shm.buf,
+                                offset=rows * 8)
+        if not owner:
+            # 워커 간 공유 메모리 → 워커에서는 읽기 전용
+            self.timestamps.flags.writeable = False
+            self.ohlcv.flags.writeable = False
+
+    @classmethod
+    def create(cls, frames: Dict[FrameKey, pd.DataFrame]) -> 'SharedFrameBlock':
+        """
+        프레임 적재 (timestamp/OHLCV 컬럼이 없는 프레임은 제외)
+
+        Args:
+            frames: (symbol, timeframe) -> OHLCV 프레임 (get_ohlcv_data 형식)
+        """
+        columns = {}
+        for key, df in frames.items():
+            if df is None or len(df) == 0:
+                continue
+            try:
+                columns[key] = (_timestamps_ms(df['timestamp']),
+                                df[OHLCV_COLUMNS].to_numpy(dtype=np.float64))
+            except (KeyError, TypeError, ValueError) as e:
+                logger.debug(f"공유 블록 적재 Skip: {key} - {e}")
+
+        rows = sum(len(timestamps) for timestamps, _ in columns.values())
+        size = max(rows * 8 * (1 + len(OHLCV_COLUMNS)), 1)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+
+        index = {}
+        start = 0
+        for key, (timestamps, _) in columns.items():
+            index[key] = (start, len(timestamps))
+            start += len(timestamps)
+
+        block = cls(shm, rows, index, owner=True)
+        for key, (timestamps, ohlcv) in columns.items():
+            start, length = index[key]
+            block.timestamps[start:start + length] = timestamps
+            block.ohlcv[start:start + length] = ohlcv
+        return block
+
+    @classmethod
+    def attach(cls, descriptor: tuple) -> 'SharedFrameBlock':
+        """워커 측 attach (descriptor: describe() 결과)"""
+        name, rows, index = descriptor
+        return cls(shared_memory.SharedMemory(name=name), rows, index, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def nbytes(self) -> int:
+        return self._shm.size
+
+    def describe(self, keys=None) -> tuple:
+        """워커 전달용 descriptor (keys 지정 시 해당 프레임 인덱스만 포함)"""
+        index = self.index if keys is None else {key: self.index[key] for key in keys if key in self.index}
+        return self._shm.name, self.rows, index
+
+    def frame(self, key: FrameKey) -> Optional[pd.DataFrame]:
+        """공유 메모리 view 기반 DataFrame (OHLCV 복사 없음, 컬럼 구성은 get_ohlcv_data와 동일)"""
+        if key not in self.index:
+            return None
+        start, length = self.index[key]
+        df = pd.DataFrame(self.ohlcv[start:start + length], columns=OHLCV_COLUMNS, copy=False)
+        df.insert(0, 'timestamp', self.timestamps[start:start + length].view('datetime64[ms]'))
+        return df
+
+    def close(self):
+        """매핑 해제 (이 블록에서 만든 DataFrame이 남아 있으면 BufferError)"""
+        self.timestamps = None
+        self.ohlcv = None
+        self._shm.close()
+
+    def unlink(self):
+        """블록 Delete (부모 프로세스만, 워커 매핑은 각자 close할 때까지 유효)"""
+        if self.owner:
+            self._shm.unlink()
+
+
+# ==================== 워커 프로세스 ====================
+
+_worker_strategy = None
+_worker_blocks: List[SharedFrameBlock] = []
+
+
+def _init_worker(debug_log_file: Optional[str]):
+    """워커 Initialize: 거래소 Connections 없는 스캔 전용 전략 인스턴스 Create"""
+    global _worker_strategy
+    from one_minute_surge_entry_strategy import OneMinuteSurgeEntryStrategy
+    _worker_strategy = OneMinuteSurgeEntryStrategy.create_scan_worker(debug_log_file)
+
+
+def _release_worker_blocks():
+    """이전 청크에서 attach한 블록 해제 (DataFrame 참조가 남아 있으면 다음 청크에서 재Attempt)"""
+    remaining = []
+    for block in _worker_blocks:
+        try:
+            block.close()
+        except BufferError:
+            remaining.append(block)
+    _worker_blocks[:] = remaining
+
+
+def _analyze_chunk(strategy, block: SharedFrameBlock, symbols: List[str], tickers: Dict[str, dict]) -> tuple:
+    """청크 내 Timeframe별 지표 일괄 계산 후 Symbol별 analyze_symbol (calculate_indicators는 Cache 히트)"""
+    frames = {key: block.frame(key) for key in block.index}
+    strategy._scan_frames = frames
+    strategy._last_analysis_results = {}
+
+    cache = get_indicator_cache()
+    cache.reserve(len(frames) * 2)
+    for timeframe in sorted({timeframe for _, timeframe in frames}):
+        tf_frames = {symbol: df for (symbol, tf), df in frames.items() if tf == timeframe}
+        for symbol, df_calc in compute_indicator_frames(tf_frames).items():
+            try:
+                result = strategy._validate_indicator_columns(df_calc)
+            except Exception:
+                continue
+            cache.store(symbol, timeframe, 'surge_indicators', tf_frames[symbol], result)
+
+    results = [(symbol, strategy.analyze_symbol(symbol, tickers.get(symbol))) for symbol in symbols]
+    return results, dict(strategy._last_analysis_results)
+
+
+def _scan_chunk(descriptor: tuple, symbols: List[str], tickers: Dict[str, dict]) -> tuple:
+    """
+    워커: 청크 Symbol Analysis
+
+    Returns:
+        tuple: ([(symbol, analyze_symbol 결과)], {symbol: 전략 Save 기록}, 소요 Time(초))
+    """
+    start = time.perf_counter()
+    strategy = _worker_strategy
+    block = SharedFrameBlock.attach(descriptor)
+    _worker_blocks.append(block)
+    try:
+        results, records = _analyze_chunk(strategy, block, symbols, tickers)
+    finally:
+        # 공유 메모리를 참조하는 프레임 / Cache 결과 정리 후 매핑 해제
+        strategy._scan_frames = {}
+        get_indicator_cache().invalidate()
+        gc.collect()
+        _release_worker_blocks()
+    return results, records, time.perf_counter() - start
+
+
+# ==================== 부모 프로세스 ====================
+
+class ScanOutcome:
+    """프로세스 스캔 결과"""
+
+    def __init__(self):
+        self.results: Dict[str, object] = {}  # symbol -> analyze_symbol 결과
+        self.records: Dict[str, dict] = {}  # symbol -> 전략 Save 기록 (_last_analysis_results)
+        self.failed_chunks = 0
+        self.worker_time = 0.0  # 워커 Analysis Time 합계 (초)
+        self.elapsed = 0.0  # 스캔 wall time (초)
+        self.shared_bytes = 0
+
+
+class ProcessScanExecutor:
+    """스캔 Analysis 프로세스 풀 (SharedMemory 프레임 블록 + 청크 단위 분배)"""
+
+    def __init__(self, workers: Optional[int] = None, chunks_per_worker: int = 4,
+                 debug_log_file: Optional[str] = None):
+        """
+        Args:
+            workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+            chunks_per_worker: 워커당 청크 수 (Symbol별 Analysis Time 편차 흡수)
+            debug_log_file: 워커 디버그 Log File (부모와 동일 File에 Add)
+        """
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunks_per_worker = max(1, chunks_per_worker)
+        self.debug_log_file = debug_log_file
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                             initializer=_init_worker, initargs=(self.debug_log_file,))
+        return self._pool
+
+    def warm_up(self, timeout: float = 60.0):
+        """워커 프로세스 미리 Starting (첫 스캔에서 import 비용 제외)"""
+        pool = self._get_pool()
+        futures = [pool.submit(os.getpid) for _ in range(self.workers)]
+        for future in futures:
+            future.result(timeout=timeout)
+
+    def _chunk(self, symbols: List[str]) -> List[List[str]]:
+        count = min(len(symbols), self.workers * self.chunks_per_worker)
+        return [symbols[i::count] for i in range(count)] if count else []
+
+    def scan(self, frames: Dict[FrameKey, pd.DataFrame], symbols: List[str], tickers: Dict[str, dict],
+             timeout: float = 60.0) -> ScanOutcome:
+        """
+        Symbol 청크를 워커에 분배하여 analyze_symbol Execute
+
+        Args:
+            frames: (symbol, timeframe) -> 프레임 (analyze_symbol이 조times하는 모든 Timeframe)
+            symbols: Analysis 대상 Symbol
+            tickers: symbol -> {'percentage': 24h 변동률}
+            timeout: 스캔 전체 제한 Time (초과한 청크는 Failed Process)
+
+        Raises:
+            BrokenProcessPool: 워커 비정상 Terminate (풀은 재Create 대상으로 Initialize)
+        """
+        outcome = ScanOutcome()
+        start = time.perf_counter()
+        block = SharedFrameBlock.create(frames)
+        outcome.shared_bytes = block.nbytes
+        try:
+            pool = self._get_pool()
+            futures = []
+            for chunk in self._chunk(list(symbols)):
+                chunk_symbols = set(chunk)
+                keys = [key for key in block.index if key[0] in chunk_symbols]
+                chunk_tickers = {symbol: tickers[symbol] for symbol in chunk if symbol in tickers}
+                futures.append(pool.submit(_scan_chunk, block.describe(keys), chunk, chunk_tickers))
+
+            deadline = start + timeout
+            for future in futures:
+                try:
+                    results, records, worker_time = future.result(timeout=max(0.0, deadline - time.perf_counter()))
+                except FutureTimeoutError:
+                    outcome.failed_chunks += 1
+                    continue
+                except BrokenProcessPool:
+                    self._pool = None
+                    raise
+                except Exception as e:
+                    logger.error(f"스캔 청크 Failed: {e}")
+                    outcome.failed_chunks += 1
+                    continue
+                outcome.results.update(results)
+                outcome.records.update(records)
+                outcome.worker_time += worker_time
+        finally:
+            block.close()
+            block.unlink()
+
+        outcome.elapsed = time.perf_counter() - start
+        return outcome
+
+    def shutdown(self):
+        """워커 풀 Terminate"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
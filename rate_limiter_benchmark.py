@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+Rate Limiter 호출당 오버헤드 벤치마크
+초 단위 버킷 링 + TTL-LRU Cache (Current) vs deque 슬라이딩 윈도우 + dict Cache (이전 구현)
+
+측정 항목:
+1. 윈도우 기록 + 합계 조times (weight / 주문 10초·1분) - 윈도우에 기록이 쌓인 상태
+2. try_acquire / has_capacity / acquire_request (로컬 accounting, 공유 budget 없음)
+3. _safe_api_call 래퍼 오버헤드 (가짜 거래소, Cache 미스 / 히트)
+4. Response Cache get/set (1000 항목 가득 찬 상태) 및 Cache 키 생성
+5. 10k calls/s 속도로 try_acquire를 호출할 때 지연 분포 (p50 / p99 / max)
+
+Usage:
+    python rate_limiter_benchmark.py [--calls 100000] [--rate 10000] [--seconds 3]
+"""
+
+import argparse
+import logging
+import time
+from collections import deque
+
+from binance_rate_limiter import (BinanceRateLimiter, RateLimitedExchange, SlidingWindowCounter,
+                                  TTLCache)
+
+
+class LegacyWindow:
+    """이전 구현: 병렬 deque + 주문 count 합계 재계산"""
+
+    def __init__(self):
+        self.request_times = deque()
+        self.weight_history = deque()
+        self.current_weight = 0
+        self.order_history = deque()
+
+    def clean(self, now):
+        cutoff = now - 60
+        while self.request_times and self.request_times[0] < cutoff:
+            self.request_times.popleft()
+            if self.weight_history:
+                self.current_weight -= self.weight_history.popleft()
+        while self.order_history and self.order_history[0][0] < cutoff:
+            self.order_history.popleft()
+
+    def record(self, now, weight, orders):
+        self.request_times.append(now)
+        self.weight_history.append(weight)
+        self.current_weight += weight
+        if orders:
+            self.order_history.append((now, orders))
+
+    def totals(self, now):
+        self.clean(now)
+        orders_1m = sum(count for _, count in self.order_history)
+        orders_10s = sum(count for ts, count in self.order_history if ts >= now - 10)
+        return self.current_weight, orders_10s, orders_1m
+
+
+class RingWindow:
+    """Current 구현: SlidingWindowCounter 4count"""
+
+    def __init__(self):
+        self.weight = SlidingWindowCounter(60)
+        self.requests = SlidingWindowCounter(60)
+        self.orders_10s = SlidingWindowCounter(10)
+        self.orders_1m = SlidingWindowCounter(60)
+
+    def record(self, now, weight, orders):
+        self.requests.add(now, 1)
+        self.weight.add(now, weight)
+        if orders:
+            self.orders_10s.add(now, orders)
+            self.orders_1m.add(now, orders)
+
+    def totals(self, now):
+        return self.weight.total(now), self.orders_10s.total(now), self.orders_1m.total(now)
+
+
+class LegacyCache:
+    """이전 구현: dict + 1000 초과 시 전체 정렬 후 10count Delete"""
+
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, key):
+        if key in self.entries:
+            data, cached_time, ttl = self.entries[key]
+            if time.time() - cached_time < ttl:
+                return data
+            del self.entries[key]
+        return None
+
+    def set(self, key, data, ttl):
+        self.entries[key] = (data, time.time(), ttl)
+        if len(self.entries) > 1000:
+            oldest = sorted(self.entries.keys(), key=lambda k: self.entries[k][1])[:10]
+            for k in oldest:
+                del self.entries[k]
+
+
+def legacy_cache_key(method_name, args, kwargs):
+    cache_args = str(sorted(args)) if args else ""
+    cache_kwargs = str(sorted(kwargs.items())) if kwargs else ""
+    return f"{method_name}:{hash(cache_args + cache_kwargs)}"
+
+
+class FakeExchange:
+    """네트워크 없는 거래소 (고정 응답)"""
+
+    def fetch_ticker(self, symbol, params=None):
+        return {'symbol': symbol, 'last': 1.0}
+
+    def fetch_positions(self, symbols=None, params=None):
+        return []
+
+
+def per_call_us(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        fn(i)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def make_limiter() -> BinanceRateLimiter:
+    """벤치마크용 로컬 limiter - 상한을 크게 잡아 승인 경로만 측정"""
+    limiter = BinanceRateLimiter(logging.getLogger('rate_limiter_benchmark'))
+    limiter._max_weight_per_minute = 10 ** 12
+    limiter._max_orders_10s = 10 ** 12
+    limiter._max_orders_1m = 10 ** 12
+    return limiter
+
+
+def bench_windows(calls: int) -> list:
+    rows = []
+    for fill in (10_000, 100_000):
+        for name, window in (('deque (이전)', LegacyWindow()), ('bucket ring', RingWindow())):
+            # 윈도우에 최근 60초 기록 fill count를 미리 적재 (10k calls/s 기준 1~10초 분량)
+            now = time.time()
+            for i in range(fill):
+                window.record(now - 59 + 59 * i / fill, 1, 1 if i % 10 == 0 else 0)
+            legacy = isinstance(window, LegacyWindow)
+            n = min(calls, 2_000) if legacy and fill >= 100_000 else calls
+
+            def step(i, window=window):
+                now = time.time()
+                window.record(now, 1, 1 if i % 10 == 0 else 0)
+                window.totals(now)
+            rows.append((f"윈도우 기록+합계 ({fill:,} 기록 적재, {name})", per_call_us(step, n)))
+    return rows
+
+
+def bench_limiter(calls: int) -> list:
+    limiter = make_limiter()
+    params = {'symbol': 'BTCUSDT', 'limit': 100}
+    rows = [
+        ('try_acquire (klines)', per_call_us(lambda i: limiter.try_acquire('/fapi/v1/klines', params), calls)),
+        ('has_capacity', per_call_us(lambda i: limiter.has_capacity(5), calls)),
+        ('acquire_request (전송 훅)', per_call_us(
+            lambda i: limiter.acquire_request('/fapi/v1/ticker/price', params, 'GET'), calls)),
+    ]
+
+    wrapper = RateLimitedExchange.__new__(RateLimitedExchange)
+    wrapper.exchange = FakeExchange()
+    wrapper.rate_limiter = make_limiter()
+    wrapper.logger = logging.getLogger('rate_limiter_benchmark')
+    symbols = [f"SYM{i}/USDT:USDT" for i in range(calls)]
+    rows.append(('_safe_api_call fetch_ticker (Cache 미스)',
+                 per_call_us(lambda i: wrapper._safe_api_call('fetch_ticker', symbols[i]), calls)))
+    rows.append(('_safe_api_call fetch_ticker (Cache 히트)',
+                 per_call_us(lambda i: wrapper._safe_api_call('fetch_ticker', symbols[i % 500]), calls)))
+    return rows
+
+
+def bench_cache(calls: int) -> list:
+    rows = []
+    keys = [f"key{i}" for i in range(calls)]
+    for name, cache in (('dict (이전)', LegacyCache()), ('TTL-LRU', TTLCache(max_entries=1000))):
+        for i in range(1000):
+            cache.set(f"warm{i}", i, 60)
+        n = min(calls, 5_000) if isinstance(cache, LegacyCache) else calls
+        rows.append((f"Cache set (가득 참, {name})", per_call_us(lambda i: cache.set(keys[i], i, 60), n)))
+        rows.append((f"Cache get (히트, {name})", per_call_us(lambda i: cache.get(keys[n - 1]), n)))
+
+    args = ('BTC/USDT:USDT', '1m')
+    kwargs = {'limit': 100, 'params': {'price': 'mark'}}
+    rows.append(('Cache 키 (str(sorted) 해시, 이전)', per_call_us(lambda i: legacy_cache_key('fetch_ohlcv', args, kwargs), calls)))
+    rows.append(('Cache 키 (인자 튜플)', per_call_us(
+        lambda i: RateLimitedExchange._make_cache_key('fetch_ohlcv', args, {'limit': 100}), calls)))
+    rows.append(('Cache 키 (dict 인자 포함)', per_call_us(
+        lambda i: RateLimitedExchange._make_cache_key('fetch_ohlcv', args, kwargs), calls)))
+    return rows
+
+
+def bench_paced(rate: int, seconds: float) -> dict:
+    """rate calls/s 속도로 try_acquire - 호출별 지연 분포"""
+    limiter = make_limiter()
+    params = {'symbol': 'BTCUSDT', 'limit': 100}
+    interval = 1.0 / rate
+    latencies = []
+    start = time.perf_counter()
+    next_call = start
+    end = start + seconds
+    while next_call < end:
+        while time.perf_counter() < next_call:
+            pass
+        t0 = time.perf_counter()
+        limiter.try_acquire('/fapi/v1/klines', params)
+        latencies.append(time.perf_counter() - t0)
+        next_call += interval
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'calls': len(latencies),
+        'achieved_rate': len(latencies) / elapsed,
+        'p50_us': latencies[len(latencies) // 2] * 1e6,
+        'p99_us': latencies[int(len(latencies) * 0.99)] * 1e6,
+        'max_us': latencies[-1] * 1e6,
+        'busy_pct': sum(latencies) / elapsed * 100,
+        'requests_per_minute': limiter.get_status()['requests_per_minute'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rate Limiter 호출당 오버헤드 벤치마크')
+    parser.add_argument('--calls', type=int, default=100_000, help='항목별 calls 횟수')
+    parser.add_argument('--rate', type=int, default=10_000, help='페이싱 측정 calls/s')
+    parser.add_argument('--seconds', type=float, default=3.0, help='페이싱 측정 Time (초)')
+    args = parser.parse_args()
+
+    print(f"📊 호출당 오버헤드 ({args.calls:,} times 기준, µs/call)")
+    for section in (bench_windows, bench_limiter, bench_cache):
+        for label, us in section(args.calls):
+            print(f"  {label:<48} {us:>10.2f} µs")
+        print()
+
+    paced = bench_paced(args.rate, args.seconds)
+    budget_us = 1e6 / args.rate
+    print(f"⏱️ {args.rate:,} calls/s 페이싱 try_acquire ({args.seconds:.0f}초, 호출당 예산 {budget_us:.0f} µs)")
+    print(f"  Calls {paced['calls']:,} times | 실제 {paced['achieved_rate']:,.0f} calls/s | "
+          f"윈도우 요청 수 {paced['requests_per_minute']:,}")
+    print(f"  p50 {paced['p50_us']:.2f} µs | p99 {paced['p99_us']:.2f} µs | max {paced['max_us']:.1f} µs | "
+          f"CPU 점유 {paced['busy_pct']:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
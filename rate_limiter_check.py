@@ -0,0 +1,468 @@
+# -*- coding: utf-8 -*-
+"""
+Rate Limiter 동작 Verification
+공용 BinanceRateLimiter (슬라이딩 윈도우 + 우선순위 레인 + 서버 헤더 동기화) 시나리오 점검
+
+점검 항목:
+1. 엔드포인트 weight (klines limit 구간, Symbol 미지정 티커, 신규 주문 weight 0)
+2. 레인 budget: 벌크 60% / 일반 80% / 주문 100%
+3. 벌크 포화 중 주문 승인 지연 (스레드 경합)
+4. X-MBX-USED-WEIGHT-1M / X-MBX-ORDER-COUNT-10S 헤더 동기화
+5. 429 백오프 시 전 레인 차단
+6. ccxt 전송 훅: try_acquire 선결제분 중복 차감 없음, Response 헤더 반영
+7. 프로세스 간 공유 budget: N count 프로세스 동시 버스트 합계 ≤ 레인 budget, 429 차단 공유, 프로세스별 사용량,
+   다른 프로세스가 SQLite 쓰기 락을 잡은 동안에도 주문 레인은 로컬 윈도우로 즉시 승인
+8. 초 단위 버킷 링 만료 / 대기 Time, 응답 Cache TTL-LRU 및 Cache 키, fetch_order는 최종 Status만 Cache
+9. 동일 요청 병합 (single-flight): 동시 조times 1times 전송, 예외 공유, 주문은 병합 제외, 래퍼 간 공유
+
+네트워크 없이 실행 (ccxt fetch를 가짜 Response로 대체), Status File은 임시 디렉토리에 Create
+
+Usage:
+    python rate_limiter_check.py [--bulk-threads 6] [--orders 50] [--processes 4] [--flight-threads 15]
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from binance_rate_limiter import (
+    PRIORITY_BULK,
+    PRIORITY_NORMAL,
+    PRIORITY_ORDER,
+    BinanceRateLimiter,
+    RateLimitedExchange,
+    SlidingWindowCounter,
+    TTLCache,
+    install_rate_limiter,
+    single_flight_stats,
+)
+from shared_rate_budget import SharedRateBudget
+
+KLINES = '/fapi/v1/klines'
+ORDER = '/fapi/v1/order'
+
+
+def new_limiter() -> BinanceRateLimiter:
+    logger = logging.getLogger('rate_limiter_check')
+    logger.setLevel(logging.CRITICAL)
+    return BinanceRateLimiter(logger)
+
+
+def check(results: list, name: str, passed: bool, detail: str = ''):
+    results.append(passed)
+    print(f"  {'✅' if passed else '❌'} {name}" + (f" - {detail}" if detail else ''))
+
+
+def check_weights(results: list):
+    print("\n[1] 엔드포인트 weight")
+    limiter = new_limiter()
+    expected = [
+        ((KLINES, {'limit': 99}), 1),
+        ((KLINES, {'limit': 100}), 2),
+        ((KLINES, {'limit': 500}), 5),
+        ((KLINES, {'limit': 1000}), 5),
+        ((KLINES, {'limit': 1500}), 10),
+        (('/fapi/v1/ticker/24hr', {'symbol': 'BTCUSDT'}), 1),
+        (('/fapi/v1/ticker/24hr', {}), 40),
+        (('/fapi/v1/depth', {'limit': 1000}), 20),
+        (('/fapi/v2/positionRisk', {}), 5),
+    ]
+    for (path, params), weight in expected:
+        actual = limiter._get_endpoint_weight(path, params)
+        check(results, f"{path} {params}", actual == weight, f"{actual} (expected {weight})")
+    actual = limiter._get_endpoint_weight(ORDER, {'symbol': 'BTCUSDT'}, 'POST')
+    check(results, "POST /fapi/v1/order", actual == 0 and limiter._get_order_count(ORDER, 'POST') == 1,
+          f"weight {actual}, 주문 count {limiter._get_order_count(ORDER, 'POST')}")
+
+
+def check_lanes(results: list):
+    print("\n[2] 레인 budget")
+    limiter = new_limiter()
+    budget = limiter._max_weight_per_minute
+    params = {'symbol': 'BTCUSDT', 'limit': 1500}
+    bulk_admitted = 0
+    while limiter.try_acquire(KLINES, params, PRIORITY_BULK):
+        bulk_admitted += 1
+    used = limiter.get_used_weight()
+    check(results, "벌크 레인 60%에서 비차단 거부", used <= budget * 0.6 < used + 10,
+          f"{bulk_admitted} 요청, {used}/{budget}")
+
+    start = time.perf_counter()
+    admitted = limiter.try_acquire(ORDER, {'symbol': 'BTCUSDT'}, PRIORITY_ORDER, method='POST')
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    check(results, "벌크 포화 중 주문 즉시 승인", admitted, f"{elapsed_ms:.2f}ms")
+
+    normal_admitted = 0
+    while limiter.try_acquire('/fapi/v2/account', {}, PRIORITY_NORMAL):
+        normal_admitted += 1
+    used = limiter.get_used_weight()
+    check(results, "일반 레인 80%에서 거부", used <= budget * 0.8 < used + 5, f"{normal_admitted} 요청, {used}/{budget}")
+    check(results, "주문 레인은 남은 budget 사용", limiter.has_capacity(budget - used, PRIORITY_ORDER)
+          and not limiter.has_capacity(budget - used + 1, PRIORITY_ORDER))
+
+
+def check_contention(results: list, bulk_threads: int, orders: int):
+    print(f"\n[3] 벌크 스레드 {bulk_threads}count 포화 중 주문 승인 지연")
+    limiter = new_limiter()
+    stop = threading.Event()
+    bulk_counts = [0] * bulk_threads
+
+    def bulk_worker(index):
+        while not stop.is_set():
+            if limiter.try_acquire(KLINES, {'symbol': 'ETHUSDT', 'limit': 500}, PRIORITY_BULK):
+                bulk_counts[index] += 1
+            else:
+                time.sleep(0.001)
+
+    threads = [threading.Thread(target=bulk_worker, args=(i,), daemon=True) for i in range(bulk_threads)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.2)
+
+    latencies = []
+    rejected = 0
+    for _ in range(orders):
+        start = time.perf_counter()
+        if not limiter.acquire(ORDER, {'symbol': 'BTCUSDT'}, PRIORITY_ORDER, method='POST', timeout=1.0):
+            rejected += 1
+        latencies.append((time.perf_counter() - start) * 1000)
+        time.sleep(0.002)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    status = limiter.get_status()
+    check(results, "벌크 레인 포화", not limiter.has_capacity(5, PRIORITY_BULK),
+          f"벌크 {sum(bulk_counts)} 요청, {status['current_weight']}/{status['max_weight']}")
+    check(results, "주문 전부 승인, 대기 없음", rejected == 0 and p99 < 50,
+          f"p50 {latencies[len(latencies) // 2]:.2f}ms, p99 {p99:.2f}ms, 거부 {rejected}")
+
+
+def check_headers(results: list):
+    print("\n[4] 서버 헤더 동기화")
+    limiter = new_limiter()
+    limiter.record_response(200, {'X-MBX-USED-WEIGHT-1M': '1500'})
+    check(results, "서버 weight 반영", limiter.get_used_weight() == 1500, f"{limiter.get_used_weight()}")
+    check(results, "벌크 레인 거부 (1500 > 60%)", not limiter.try_acquire(KLINES, {'limit': 99}, PRIORITY_BULK))
+    check(results, "일반 레인 허용 (1500 + 5 <= 80%)", limiter.try_acquire('/fapi/v2/account', {}, PRIORITY_NORMAL))
+    check(results, "헤더 이후 로컬 추가분 누적", limiter.get_used_weight() == 1505, f"{limiter.get_used_weight()}")
+
+    limiter.record_response(200, {'x-mbx-order-count-10s': str(limiter._max_orders_10s)})
+    check(results, "주문 count 10초 한도 거부",
+          not limiter.try_acquire(ORDER, {'symbol': 'BTCUSDT'}, PRIORITY_ORDER, method='POST'))
+    check(results, "주문 count 한도는 조times 레인과 무관",
+          limiter.try_acquire(ORDER, {'symbol': 'BTCUSDT'}, PRIORITY_ORDER, method='GET'))
+
+
+def check_backoff(results: list):
+    print("\n[5] 429 백오프")
+    limiter = new_limiter()
+    limiter.record_response(429, {'Retry-After': '5'})
+    lanes = [limiter.has_capacity(1, lane) for lane in (PRIORITY_ORDER, PRIORITY_NORMAL, PRIORITY_BULK)]
+    check(results, "전 레인 차단", not any(lanes), f"남은 Time {limiter.lane_wait_time(1, PRIORITY_ORDER):.0f}초")
+    start = time.perf_counter()
+    admitted = limiter.acquire(ORDER, {'symbol': 'BTCUSDT'}, PRIORITY_ORDER, method='POST', timeout=1.0)
+    check(results, "timeout 내 불가 요청은 즉시 거부", not admitted and time.perf_counter() - start < 0.1)
+
+
+class FakeExchange:
+    """ccxt fetch / on_rest_response 만 흉내내는 Exchange"""
+    id = 'binance'
+
+    def __init__(self, used_weight_header):
+        self.used_weight_header = used_weight_header
+        self.requests = []
+
+    def on_rest_response(self, code, reason, url, method, response_headers, response_body, request_headers, request_body):
+        return response_body
+
+    def fetch(self, url, method='GET', headers=None, body=None):
+        self.requests.append((method, url))
+        response_headers = {'X-MBX-USED-WEIGHT-1M': str(self.used_weight_header)}
+        return self.on_rest_response(200, 'OK', url, method, response_headers, '[]', headers, body)
+
+
+def check_transport_hook(results: list):
+    print("\n[6] ccxt 전송 훅")
+    limiter = new_limiter()
+    exchange = FakeExchange(used_weight_header=0)
+    install_rate_limiter(exchange, limiter)
+    install_rate_limiter(exchange, limiter)  # 중복 호출은 무시
+
+    url = 'https://fapi.binance.com/fapi/v1/klines?symbol=BTCUSDT&interval=1m&limit=500'
+    exchange.fetch(url)
+    check(results, "훅 단독 요청 weight 집계", limiter._current_weight == 5, f"local {limiter._current_weight}")
+
+    limiter.try_acquire(KLINES, {'symbol': 'BTCUSDT', 'limit': 500}, PRIORITY_BULK)
+    exchange.fetch(url)
+    check(results, "try_acquire 선결제분 중복 차감 없음", limiter._current_weight == 10, f"local {limiter._current_weight}")
+
+    exchange.fetch('https://api.binance.com/api/v3/exchangeInfo')
+    check(results, "현물 경로는 선물 budget 제외", limiter._current_weight == 10)
+
+    exchange.used_weight_header = 900
+    exchange.fetch('https://fapi.binance.com/fapi/v2/positionRisk?timestamp=1&signature=x')
+    check(results, "Response 헤더 동기화", limiter.get_used_weight() == 900, f"{limiter.get_used_weight()}")
+
+    body = 'symbol=BTCUSDT&side=BUY&type=MARKET&quantity=1&timestamp=1&signature=x'
+    exchange.fetch('https://fapi.binance.com/fapi/v1/order', 'POST', None, body)
+    orders_10s, _ = limiter._order_counts_locked(time.time())
+    check(results, "POST 주문 → 주문 count 집계 (IP weight 0)", orders_10s == 1 and limiter.get_used_weight() == 900,
+          f"주문 {orders_10s}, weight {limiter.get_used_weight()}")
+
+
+def burst_process(db_path: str, name: str, start_at: float, queue):
+    """공유 budget에 연결해 start_at부터 벌크 레인 버스트 (프로세스 본체)"""
+    budget = SharedRateBudget(db_path, logger=logging.getLogger('rate_limiter_check'), process_name=name)
+    limiter = BinanceRateLimiter(logging.getLogger('rate_limiter_check'), shared_budget=budget)
+    while time.time() < start_at:
+        time.sleep(0.001)
+    admitted_weight = 0
+    rejected_streak = 0
+    while rejected_streak < 50:
+        if limiter.try_acquire(KLINES, {'symbol': 'BTCUSDT', 'limit': 500}, PRIORITY_BULK):
+            admitted_weight += 5
+            rejected_streak = 0
+        else:
+            rejected_streak += 1
+    queue.put((name, admitted_weight))
+
+
+def check_cross_process(results: list, processes: int):
+    print(f"\n[7] 프로세스 간 공유 budget ({processes} 프로세스 동시 버스트)")
+    logger = logging.getLogger('rate_limiter_check')
+    db_path = os.path.abspath('cross_process_budget.db')
+    monitor = SharedRateBudget(db_path, logger=logger, process_name='monitor')
+    limiter = BinanceRateLimiter(logger, shared_budget=monitor)
+
+    queue = multiprocessing.Queue()
+    start_at = time.time() + 1.0
+    workers = [multiprocessing.Process(target=burst_process, args=(db_path, f"bot-{i}", start_at, queue))
+               for i in range(processes)]
+    for worker in workers:
+        worker.start()
+    admitted = dict(queue.get(timeout=60) for _ in workers)
+    for worker in workers:
+        worker.join()
+
+    total = sum(admitted.values())
+    bulk_cap = limiter._max_weight_per_minute * limiter.LANE_CAPS[PRIORITY_BULK]
+    check(results, "버스트 합계 ≤ 벌크 레인 budget", bulk_cap - 5 < total <= bulk_cap,
+          f"{total}/{bulk_cap:.0f} ({', '.join(f'{k} {v}' for k, v in sorted(admitted.items()))})")
+    check(results, "다른 프로세스 사용분 반영", not limiter.has_capacity(5, PRIORITY_BULK)
+          and limiter.get_used_weight() == total, f"used {limiter.get_used_weight()}")
+    check(results, "벌크 포화 중 주문 승인",
+          limiter.try_acquire(ORDER, {'symbol': 'BTCUSDT'}, PRIORITY_ORDER, method='POST'))
+
+    snapshot = monitor.snapshot()
+    per_process = {proc['name']: proc['weight_1m'] for proc in snapshot['processes']}
+    check(results, "프로세스별 사용량 스냅샷", all(per_process.get(name) == weight for name, weight in admitted.items()),
+          f"{len(snapshot['processes'])} 프로세스")
+
+    # 공유 budget이 막혀 있어도 주문 레인은 기다리지 않음: (a) 다른 프로세스의 쓰기 트랜잭션,
+    # (b) 이 프로세스의 다른 스레드가 SQLite 대기 중 (연결 락 보유)
+    def shared_orders():
+        conn = sqlite3.connect(db_path)
+        try:
+            return conn.execute("SELECT COALESCE(SUM(orders), 0) FROM usage").fetchone()[0]
+        finally:
+            conn.close()
+
+    def timed_order():
+        started = time.perf_counter()
+        admitted = limiter.try_acquire(ORDER, {'symbol': 'BTCUSDT'}, PRIORITY_ORDER, method='POST')
+        return admitted, (time.perf_counter() - started) * 1000
+
+    orders_before = shared_orders()
+    holder = sqlite3.connect(db_path, isolation_level=None)
+    holder.execute('BEGIN IMMEDIATE')
+    db_locked = timed_order()
+    holder.execute('COMMIT')
+    holder.close()
+
+    release = threading.Event()
+    holding = threading.Event()
+
+    def hold_connection():
+        with monitor._lock:
+            holding.set()
+            release.wait(10)
+
+    thread = threading.Thread(target=hold_connection, daemon=True)
+    thread.start()
+    holding.wait(5)
+    conn_locked = timed_order()
+    release.set()
+    thread.join()
+    check(results, "공유 budget 대기 중 주문 → 로컬 윈도우로 즉시 승인", db_locked[0] and conn_locked[0]
+          and max(db_locked[1], conn_locked[1]) < 200 and limiter.get_status()['shared_fallbacks'] == 2,
+          f"DB 쓰기 락 {db_locked[1]:.1f}ms / 연결 락 {conn_locked[1]:.1f}ms")
+
+    limiter.try_acquire(KLINES, {'symbol': 'ETHUSDT', 'limit': 5}, PRIORITY_NORMAL)
+    check(results, "로컬 승인분 → 다음 비주문 요청 때 공유 기록", shared_orders() == orders_before + 2
+          and limiter._shared_deferred == [0, 0])
+
+    other = BinanceRateLimiter(logger, shared_budget=SharedRateBudget(db_path, logger=logger, process_name='other'))
+    other.record_response(429, {'Retry-After': '5'})
+    check(results, "429 차단이 다른 프로세스에 공유", not limiter.has_capacity(1, PRIORITY_ORDER),
+          f"남은 Time {limiter.lane_wait_time(1, PRIORITY_ORDER):.0f}초")
+
+    monitor.set_max_weight(800)
+    check(results, "공통 weight 상한 (보수적 모드) 반영", limiter.get_max_weight() == 800)
+
+
+def check_window_and_cache(results: list):
+    print("\n[8] 버킷 링 윈도우 / 응답 Cache")
+    window = SlidingWindowCounter(60)
+    base = 1_000_000.0
+    window.add(base, 100)
+    window.add(base + 30.5, 50)
+    check(results, "윈도우 합계", window.total(base + 31) == 150, f"{window.total(base + 31)}")
+    check(results, "대기 Time = 가장 오래된 버킷 만료까지",
+          abs(window.expiry_wait(80, base + 31) - 30.0) < 1e-6, f"{window.expiry_wait(80, base + 31):.1f}s")
+    check(results, "60초 경과 버킷 만료", window.total(base + 61) == 50, f"{window.total(base + 61)}")
+    check(results, "윈도우 전체 경과 시 초기화", window.total(base + 500) == 0)
+
+    cache = TTLCache(max_entries=3)
+    for key in ('a', 'b', 'c'):
+        cache.set(key, key, 60)
+    cache.get('a')
+    cache.set('d', 'd', 60)
+    check(results, "LRU Remove (최근 조times 항목 유지)", cache.get('b') is None and cache.get('a') == 'a'
+          and len(cache) == 3)
+    cache.set('e', 'e', -1)
+    check(results, "TTL 만료 항목 미반환", cache.get('e') is None)
+
+    key1 = RateLimitedExchange._make_cache_key('fetch_ohlcv', ('BTC/USDT:USDT',), {'params': {'a': 1, 'b': 2}})
+    key2 = RateLimitedExchange._make_cache_key('fetch_ohlcv', ('BTC/USDT:USDT',), {'params': {'b': 2, 'a': 1}})
+    key3 = RateLimitedExchange._make_cache_key('fetch_ohlcv', ('ETH/USDT:USDT',), {'params': {'a': 1, 'b': 2}})
+    check(results, "dict 인자 Cache 키 (순서 무관, 인자별 구분)", key1 == key2 and key1 != key3)
+    check(results, "주문 method Cache 제외",
+          not RateLimitedExchange._is_cacheable('create_order')
+          and RateLimitedExchange._is_cacheable('fetch_ticker'))
+
+    # 미체결 목록에서 빠진 주문 조times: open / 부분 체결 Status는 Cache하지 않음 (체결 감지 지연 방지)
+    exchange = SlowExchange(0)
+    exchange.order_statuses = ['open', 'open', 'closed']
+    wrapper = RateLimitedExchange(exchange)
+    wrapper.rate_limiter = new_limiter()
+    statuses = [wrapper.fetch_order('42', 'BTC/USDT:USDT')['status'] for _ in range(4)]
+    check(results, "fetch_order: 미체결 Status Cache 안 함, 최종 Status만 Cache",
+          statuses == ['open', 'open', 'closed', 'closed'] and exchange.calls.get('fetch_order') == 3,
+          f"{statuses}, 전송 {exchange.calls.get('fetch_order')}times")
+
+
+class SlowExchange:
+    """호출마다 delay초 걸리는 가짜 거래소 (호출 횟수 기록)"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls = {}
+        self.lock = threading.Lock()
+        self._binance_rate_limiter = new_limiter()  # install_rate_limiter 생략
+
+    def _record(self, name):
+        with self.lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+        time.sleep(self.delay)
+
+    def fetch_positions(self, symbols=None, params=None):
+        self._record('fetch_positions')
+        return [{'symbol': 'BTC/USDT:USDT', 'contracts': 1.0}]
+
+    def fetch_ticker(self, symbol, params=None):
+        self._record('fetch_ticker')
+        raise ConnectionError(f"timeout {symbol}")
+
+    def fetch_order(self, id, symbol=None, params=None):
+        self._record('fetch_order')
+        return {'id': id, 'symbol': symbol, 'status': self.order_statuses.pop(0)}
+
+    def create_order(self, symbol, type, side, amount, price=None, params=None):
+        self._record('create_order')
+        return {'id': str(time.time())}
+
+
+def run_concurrently(threads: int, fn) -> list:
+    results = [None] * threads
+    barrier = threading.Barrier(threads)
+
+    def worker(i):
+        barrier.wait()
+        try:
+            results[i] = fn(i)
+        except Exception as e:
+            results[i] = e
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return results
+
+
+def check_single_flight(results: list, threads: int):
+    print(f"\n[9] 동일 요청 병합 ({threads} 스레드 동시 호출)")
+    exchange = SlowExchange(0.2)
+    monitor = RateLimitedExchange(exchange)
+    dca = RateLimitedExchange(exchange)  # 같은 거래소를 감싼 두 번째 래퍼 (DCA 매니저)
+    monitor.rate_limiter = dca.rate_limiter = new_limiter()
+
+    wrappers = [monitor, dca]
+    positions = run_concurrently(threads, lambda i: wrappers[i % 2].fetch_positions())
+    stats = monitor.get_single_flight_stats().get('fetch_positions', {})
+    check(results, "fetch_positions 1times 전송", exchange.calls.get('fetch_positions') == 1,
+          f"전송 {exchange.calls.get('fetch_positions')}times, 병합 {stats.get('coalesced')}times")
+    check(results, "모든 호출자 같은 결과", all(p is positions[0] for p in positions) and bool(positions[0]))
+    check(results, "병합 통계", stats.get('calls') == threads and stats.get('coalesced') == threads - 1)
+
+    errors = run_concurrently(threads, lambda i: monitor.fetch_ticker('BTC/USDT:USDT'))
+    check(results, "진행 중 요청 예외 공유",
+          exchange.calls.get('fetch_ticker') == 1 and all(isinstance(e, ConnectionError) for e in errors),
+          f"전송 {exchange.calls.get('fetch_ticker')}times")
+
+    run_concurrently(threads, lambda i: monitor.create_order('BTC/USDT:USDT', 'market', 'buy', 1))
+    check(results, "주문은 병합 제외", exchange.calls.get('create_order') == threads,
+          f"전송 {exchange.calls.get('create_order')}times")
+    check(results, "get_status 병합 집계", single_flight_stats()['coalesced'] >= threads - 1,
+          f"{single_flight_stats()['coalesced']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rate limiter check')
+    parser.add_argument('--bulk-threads', type=int, default=6)
+    parser.add_argument('--orders', type=int, default=50)
+    parser.add_argument('--processes', type=int, default=4)
+    parser.add_argument('--flight-threads', type=int, default=15)
+    args = parser.parse_args()
+
+    # Status File (binance_rate_limiter_state.json)이 작업 디렉토리를 건드리지 않도록
+    os.chdir(tempfile.mkdtemp(prefix='rate_limiter_check_'))
+
+    results = []
+    print("📊 Rate Limiter Verification")
+    check_weights(results)
+    check_lanes(results)
+    check_contention(results, args.bulk_threads, args.orders)
+    check_headers(results)
+    check_backoff(results)
+    check_transport_hook(results)
+    check_cross_process(results, args.processes)
+    check_window_and_cache(results)
+    check_single_flight(results, args.flight_threads)
+
+    failed = results.count(False)
+    print(f"\n{'✅ 전체 통과' if not failed else f'❌ {failed} 항목 실패'} ({len(results)} 항목)")
+    return 0 if not failed else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,11 +9,16 @@ import os
 import json
 import time
 from datetime import datetime
-from binance_rate_limiter import BinanceRateLimiter
+from binance_rate_limiter import BinanceRateLimiter, open_shared_budget
+
+LANE_NAMES = {0: '주문', 1: '일반', 2: '벌크'}
+
 
 class RateLimiterEmergencyTool:
     def __init__(self):
-        self.rate_limiter = BinanceRateLimiter()
+        # 다른 봇들과 같은 공유 budget File에 연결 (같은 작업 디렉토리에서 실행)
+        self.shared_budget = open_shared_budget()
+        self.rate_limiter = BinanceRateLimiter(shared_budget=self.shared_budget)
         
     def check_status(self):
         """현재 Rate Limiter 상태 확인"""
@@ -47,7 +52,31 @@ class RateLimiterEmergencyTool:
             
         print(f"캐시 크기: {status['cache_size']}개")
         
+        self.show_processes(status.get('shared_budget'))
+        
         return status
+    
+    def show_processes(self, shared=None):
+        """같은 IP 공유 budget - 프로세스별 사용량"""
+        if self.shared_budget is None:
+            print("\n공유 budget: 사용 불가 (프로세스별 단독 집계)")
+            return
+        shared = shared or self.shared_budget.snapshot()
+        
+        print(f"\n🔗 공유 budget ({shared['path']})")
+        print(f"전체 Weight: {shared['used_weight']} (로컬 합계 {shared['local_weight']}, 서버 {shared['server_weight']})")
+        print(f"주문 수: 10초 {shared['orders_10s']} / 1분 {shared['orders_1m']}")
+        if shared['shared_max_weight']:
+            print(f"공통 최대 weight: {shared['shared_max_weight']:.0f} (보수적 모드)")
+        if shared['blocked_remaining_seconds'] > 0:
+            print(f"🚨 전체 프로세스 차단 중: {shared['blocked_remaining_seconds']}초 남음")
+        
+        print(f"\n{'PID':>7}  {'프로세스':<36} {'Weight/분':>9} {'주문/분':>7} {'요청/분':>7} {'승인':>7} {'거부':>6} {'유휴':>6}")
+        for proc in shared['processes']:
+            print(f"{proc['pid']:>7}  {proc['name'][:36]:<36} {proc['weight_1m']:>9} {proc['orders_1m']:>7} "
+                  f"{proc['requests_1m']:>7} {proc['admitted']:>7} {proc['rejected']:>6} {proc['idle_seconds']:>5}s")
+        if not shared['processes']:
+            print("  (최근 활동한 프로세스 없음)")
         
     def emergency_reset(self):
         """긴급 리셋 (주의: 남용 금지)"""
@@ -66,8 +95,14 @@ class RateLimiterEmergencyTool:
             os.remove(state_file)
             print(f"✅ {state_file} 삭제됨")
             
+        # 공유 차단 상태 / 공통 상한 해제 (모든 프로세스에 적용)
+        if self.shared_budget is not None:
+            self.shared_budget.clear_blocks()
+            self.shared_budget.set_max_weight(None)
+            print("✅ 공유 budget 차단 상태 해제")
+        
         # Rate Limiter 재초기화
-        self.rate_limiter = BinanceRateLimiter()
+        self.rate_limiter = BinanceRateLimiter(shared_budget=self.shared_budget)
         print("✅ Rate Limiter 재초기화 완료")
         
         # 통계 리셋
@@ -110,13 +145,19 @@ class RateLimiterEmergencyTool:
         """보수적 모드 설정 (더 엄격한 제한)"""
         print("🛡️ 보수적 모드 설정 중...")
         self.rate_limiter._max_weight_per_minute = 800  # 더욱 보수적
-        print("✅ 최대 weight을 800으로 설정 (기본 1000에서 감소)")
+        if self.shared_budget is not None:
+            # 같은 IP의 모든 프로세스에 적용
+            self.shared_budget.set_max_weight(800)
+            print("✅ 모든 프로세스 최대 weight을 800으로 설정 (기본 2000에서 감소)")
+        else:
+            print("✅ 최대 weight을 800으로 설정 (기본 2000에서 감소)")
         
     def show_help(self):
         """도움말 표시"""
         print("🆘 Rate Limiter 긴급 복구 도구")
         print("=" * 40)
         print("1. status  - 현재 상태 확인")
+        print("   procs   - 프로세스별 사용량 (공유 budget)")
         print("2. reset   - 긴급 리셋 (주의)")
         print("3. wait    - 복구까지 대기")
         print("4. cache   - 캐시 정리")
@@ -140,6 +181,8 @@ def main():
         
         if command == 'status':
             tool.check_status()
+        elif command == 'procs':
+            tool.show_processes()
         elif command == 'reset':
             tool.emergency_reset()
         elif command == 'wait':
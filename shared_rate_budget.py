@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+"""
+Shared Rate Budget
+같은 IP에서 실행되는 여러 프로세스 (1분봉 전략, 15분봉 전략, 대시보드 API, 콘솔 Position 표시)가
+하나의 바이낸스 weight / 주문 count budget을 공유하도록 SQLite File에 사용 기록을 집계
+
+특징:
+- 승인 검사와 차감을 한 트랜잭션 (BEGIN IMMEDIATE)으로 처리 → 동시에 버스트해도 합계가 budget을 넘지 않음
+- 60초 슬라이딩 윈도우 (요청별 행, ts 인덱스) + 서버 헤더 (X-MBX-USED-WEIGHT-1M / ORDER-COUNT) 공유
+- 429/418 차단 상태 공유: 한 프로세스가 받은 백오프가 모든 프로세스에 즉시 적용
+- budget 상한 (max_weight) 공유: rate_limiter_emergency_tool.py 보수적 모드가 전체 프로세스에 적용
+- 프로세스별 사용량 스냅샷 (rate_limiter_emergency_tool.py 표시용)
+
+표준 라이브러리 sqlite3만 Usage (Windows / Linux 공통, 별도 브로커 프로세스 불필요)
+"""
+
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+# 기본 budget File (작업 디렉토리 기준, binance_rate_limiter_state.json과 같은 위치)
+DEFAULT_BUDGET_FILE = 'binance_rate_budget.db'
+BUDGET_FILE_ENV = 'BINANCE_RATE_BUDGET_FILE'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS usage (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts REAL NOT NULL,
+    pid INTEGER NOT NULL,
+    lane INTEGER NOT NULL,
+    weight INTEGER NOT NULL,
+    orders INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS usage_ts ON usage (ts);
+CREATE TABLE IF NOT EXISTS server_usage (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL,
+    observed REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS blocks (
+    key TEXT PRIMARY KEY,
+    until REAL NOT NULL,
+    pid INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS config (
+    key TEXT PRIMARY KEY,
+    value REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS processes (
+    pid INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    started REAL NOT NULL,
+    heartbeat REAL NOT NULL,
+    admitted INTEGER NOT NULL DEFAULT 0,
+    rejected INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# 서버 헤더 키 → 고정 윈도우 길이 (초)
+SERVER_WINDOWS = {
+    'weight_1m': 60,
+    'orders_10s': 10,
+    'orders_1m': 60,
+}
+
+
+class SharedRateBudget:
+    """프로세스 간 공유 weight / 주문 count budget (SQLite)"""
+
+    WINDOW_SECONDS = 60
+    # 하트비트가 이보다 오래된 프로세스는 스냅샷에서 제외
+    PROCESS_STALE_SECONDS = 600
+    # 다른 프로세스의 쓰기 트랜잭션 대기 상한 (초, try_charge timeout 미지정 시)
+    BUSY_TIMEOUT = 5.0
+
+    def __init__(self, path: str = None, logger=None, process_name: str = None):
+        self.logger = logger or logging.getLogger(__name__)
+        self.path = path or os.environ.get(BUDGET_FILE_ENV) or DEFAULT_BUDGET_FILE
+        self.pid = os.getpid()
+        self.process_name = process_name or os.path.basename(sys.argv[0] or 'python') or 'python'
+
+        # 연결 하나를 락으로 보호 (스레드 간 공유)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.path, timeout=self.BUSY_TIMEOUT, isolation_level=None, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+        self._register_process()
+
+        self.logger.info(f"🔗 Shared rate budget Connections: {self.path} (pid {self.pid}, {self.process_name})")
+
+    def _register_process(self):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO processes (pid, name, started, heartbeat, admitted, rejected) "
+                "VALUES (?, ?, ?, ?, 0, 0)",
+                (self.pid, self.process_name, now, now))
+
+    # ------------------------------------------------------------------
+    # 윈도우 집계 (트랜잭션 안에서 호출)
+    # ------------------------------------------------------------------
+
+    def _window_sum(self, column: str, since: float) -> int:
+        row = self._conn.execute(f"SELECT COALESCE(SUM({column}), 0) FROM usage WHERE ts >= ?", (since,)).fetchone()
+        return int(row[0])
+
+    def _server_value(self, key: str, column: str, now: float) -> int:
+        """서버 헤더 값 + 헤더 이후 전체 프로세스 추가분 (같은 고정 윈도우 안에서만 유효)"""
+        row = self._conn.execute("SELECT value, observed FROM server_usage WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return 0
+        value, observed = row
+        window = SERVER_WINDOWS[key]
+        if int(now // window) != int(observed // window):
+            return 0
+        return int(value) + self._window_sum(column, observed)
+
+    def _blocked_until(self, now: float) -> float:
+        row = self._conn.execute("SELECT MAX(until) FROM blocks WHERE until > ?", (now,)).fetchone()
+        return float(row[0]) if row and row[0] else 0.0
+
+    def _max_weight(self, local_max: int) -> float:
+        row = self._conn.execute("SELECT value FROM config WHERE key = 'max_weight'").fetchone()
+        return min(local_max, row[0]) if row else local_max
+
+    def _expiry_wait(self, column: str, excess: int, window: float, now: float) -> float:
+        """오래된 기록부터 만료시켜 excess만큼 확보되는 대기 Time"""
+        freed = 0
+        for ts, amount in self._conn.execute(
+                f"SELECT ts, {column} FROM usage WHERE ts >= ? AND {column} > 0 ORDER BY ts", (now - window,)):
+            freed += amount
+            if freed >= excess:
+                return max(0.0, ts + window - now)
+        return window - (now % window)
+
+    def _wait_locked(self, weight: int, orders: int, lane_cap: float, local_max: int,
+                     max_orders_10s: int, max_orders_1m: int, now: float) -> float:
+        blocked_until = self._blocked_until(now)
+        if blocked_until:
+            return blocked_until - now
+
+        if weight > 0:
+            cap = self._max_weight(local_max) * lane_cap
+            if weight > cap:
+                return float('inf')
+            local_used = self._window_sum('weight', now - self.WINDOW_SECONDS)
+            used = max(local_used, self._server_value('weight_1m', 'weight', now))
+            if used + weight > cap:
+                if used > local_used:
+                    return 60 - (now % 60)
+                return self._expiry_wait('weight', used + weight - cap, 60, now)
+
+        if orders > 0:
+            orders_10s = max(self._window_sum('orders', now - 10), self._server_value('orders_10s', 'orders', now))
+            if orders_10s + orders > max_orders_10s:
+                return self._expiry_wait('orders', orders_10s + orders - max_orders_10s, 10, now)
+            orders_1m = max(self._window_sum('orders', now - 60), self._server_value('orders_1m', 'orders', now))
+            if orders_1m + orders > max_orders_1m:
+                return self._expiry_wait('orders', orders_1m + orders - max_orders_1m, 60, now)
+
+        return 0.0
+
+    # ------------------------------------------------------------------
+    # 승인 / 차감
+    # ------------------------------------------------------------------
+
+    def admission_wait(self, weight: int, orders: int, lane_cap: float, local_max: int,
+                       max_orders_10s: int, max_orders_1m: int) -> float:
+        """전체 프로세스 기준 승인까지 대기 Time (차감하지 않음)"""
+        with self._lock:
+            return self._wait_locked(weight, orders, lane_cap, local_max,
+                                     max_orders_10s, max_orders_1m, time.time())
+
+    def try_charge(self, weight: int, orders: int, lane: int, lane_cap: float, local_max: int,
+                   max_orders_10s: int, max_orders_1m: int, timeout: Optional[float] = None) -> Optional[float]:
+        """
+        승인 검사 + 차감 (원자적)
+
+        Args:
+            timeout: 연결 락 / 다른 프로세스 쓰기 트랜잭션 대기 상한 (초, None = BUSY_TIMEOUT)
+
+        Returns:
+            0 = 차감 완료, None = timeout 안에 트랜잭션을 시작하지 못함 (차감 안 함),
+            그 외 = 승인까지 대기 Time (차감 안 함)
+        """
+        if not self._lock.acquire(timeout=-1 if timeout is None else timeout):
+            return None
+        try:
+            conn = self._conn
+            if timeout is not None:
+                conn.execute(f'PRAGMA busy_timeout = {int(timeout * 1000)}')
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+            except sqlite3.OperationalError:
+                if timeout is None:
+                    raise
+                return None  # 다른 프로세스가 쓰기 중 (database is locked)
+            finally:
+                if timeout is not None:
+                    conn.execute(f'PRAGMA busy_timeout = {int(self.BUSY_TIMEOUT * 1000)}')
+            try:
+                now = time.time()
+                wait_time = self._wait_locked(weight, orders, lane_cap, local_max,
+                                              max_orders_10s, max_orders_1m, now)
+                if wait_time <= 0:
+                    self._insert_locked(weight, orders, lane, now)
+                    conn.execute("UPDATE processes SET heartbeat = ?, admitted = admitted + 1 WHERE pid = ?",
+                                 (now, self.pid))
+                else:
+                    conn.execute("UPDATE processes SET heartbeat = ?, rejected = rejected + 1 WHERE pid = ?",
+                                 (now, self.pid))
+                conn.execute('COMMIT')
+                return wait_time
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+        finally:
+            self._lock.release()
+
+    def charge(self, weight: int, orders: int = 0, lane: int = 1):
+        """승인 없이 차감 (이미 보낸 요청 기록용)"""
+        with self._lock:
+            conn = self._conn
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                now = time.time()
+                self._insert_locked(weight, orders, lane, now)
+                conn.execute("UPDATE processes SET heartbeat = ? WHERE pid = ?", (now, self.pid))
+                conn.execute('COMMIT')
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+
+    def _insert_locked(self, weight: int, orders: int, lane: int, now: float):
+        if weight <= 0 and orders <= 0:
+            return
+        self._conn.execute("INSERT INTO usage (ts, pid, lane, weight, orders) VALUES (?, ?, ?, ?, ?)",
+                           (now, self.pid, lane, weight, orders))
+        self._conn.execute("DELETE FROM usage WHERE ts < ?", (now - self.WINDOW_SECONDS,))
+
+    # ------------------------------------------------------------------
+    # 서버 헤더 / 차단 / Settings 공유
+    # ------------------------------------------------------------------
+
+    def publish_server_usage(self, values: Dict[str, int]):
+        """Response 헤더 사용량 공유 (key: weight_1m / orders_10s / orders_1m)"""
+        if not values:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO server_usage (key, value, observed) VALUES (?, ?, ?)",
+                [(key, int(value), now) for key, value in values.items() if key in SERVER_WINDOWS])
+
+    def set_block(self, key: str, until: float):
+        """429 백오프 / 418 IP 차단 공유 (key: 'backoff' / 'ban')"""
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO blocks (key, until, pid) VALUES (?, ?, ?)",
+                               (key, until, self.pid))
+
+    def blocked_remaining(self) -> float:
+        now = time.time()
+        with self._lock:
+            blocked_until = self._blocked_until(now)
+        return max(0.0, blocked_until - now) if blocked_until else 0.0
+
+    def clear_blocks(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM blocks")
+
+    def set_max_weight(self, max_weight: Optional[int]):
+        """전체 프로세스 공통 weight 상한 (None = 각 프로세스 기본값)"""
+        with self._lock:
+            if max_weight is None:
+                self._conn.execute("DELETE FROM config WHERE key = 'max_weight'")
+            else:
+                self._conn.execute("INSERT OR REPLACE INTO config (key, value) VALUES ('max_weight', ?)",
+                                   (float(max_weight),))
+
+    def get_max_weight(self) -> Optional[float]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM config WHERE key = 'max_weight'").fetchone()
+        return row[0] if row else None
+
+    def used_weight(self) -> int:
+        """전체 프로세스 사용 weight (최근 60초, 서버 헤더 반영)"""
+        now = time.time()
+        with self._lock:
+            return max(self._window_sum('weight', now - self.WINDOW_SECONDS),
+                       self._server_value('weight_1m', 'weight', now))
+
+    # ------------------------------------------------------------------
+    # 스냅샷
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> dict:
+        """전체 / 프로세스별 사용량 (최근 60초)"""
+        now = time.time()
+        with self._lock:
+            conn = self._conn
+            local_weight = self._window_sum('weight', now - self.WINDOW_SECONDS)
+            server_weight = self._server_value('weight_1m', 'weight', now)
+            orders_10s = max(self._window_sum('orders', now - 10), self._server_value('orders_10s', 'orders', now))
+            orders_1m = max(self._window_sum('orders', now - 60), self._server_value('orders_1m', 'orders', now))
+            blocked_until = self._blocked_until(now)
+
+            usage = {
+                pid: (weight, orders, requests, last_ts)
+                for pid, weight, orders, requests, last_ts in conn.execute(
+                    "SELECT pid, SUM(weight), SUM(orders), COUNT(*), MAX(ts) FROM usage "
+                    "WHERE ts >= ? GROUP BY pid", (now - self.WINDOW_SECONDS,))
+            }
+            processes: List[dict] = []
+            for pid, name, started, heartbeat, admitted, rejected in conn.execute(
+                    "SELECT pid, name, started, heartbeat, admitted, rejected FROM processes "
+                    "WHERE heartbeat >= ? ORDER BY started", (now - self.PROCESS_STALE_SECONDS,)):
+                weight, orders, requests, _ = usage.get(pid, (0, 0, 0, None))
+                processes.append({
+                    'pid': pid,
+                    'name': name,
+                    'weight_1m': int(weight),
+                    'orders_1m': int(orders),
+                    'requests_1m': int(requests),
+                    'admitted': admitted,
+                    'rejected': rejected,
+                    'idle_seconds': int(now - heartbeat),
+                })
+
+        return {
+            'path': self.path,
+            'used_weight': max(local_weight, server_weight),
+            'local_weight': local_weight,
+            'server_weight': server_weight,
+            'orders_10s': orders_10s,
+            'orders_1m': orders_1m,
+            'shared_max_weight': self.get_max_weight(),
+            'blocked_remaining_seconds': int(max(0.0, blocked_until - now)) if blocked_until else 0,
+            'processes': processes,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+SuperTrend 커널 벤치마크 / 동일성 Verification
+Legacy 행 단위 .loc 루프 구현과 indicators.py 공용 커널을 비교
+
+측정 항목:
+1. 전략형 SuperTrend (calculate_indicators / calculate_supertrend)
+2. Exit 시스템형 추적 SuperTrend (BasicExitSystem / ImprovedDCAPositionManager)
+3. 결과 동일성 (supertrend / 방향 값 완전 일치, NaN 위치 포함)
+
+Usage:
+    python supertrend_benchmark.py [--rows 1000] [--symbols 150] [--legacy-symbols 5]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from indicators import HAS_NUMBA, add_supertrend_columns, trailing_supertrend
+
+
+def legacy_supertrend(df: pd.DataFrame, period: int = 10, multiplier: float = 3.0, start: int = None) -> pd.DataFrame:
+    """Legacy calculate_supertrend (행 단위 df.loc 기록)"""
+    start = period if start is None else start
+    df['tr'] = np.maximum(
+        df['high'] - df['low'],
+        np.maximum(
+            abs(df['high'] - df['close'].shift(1)),
+            abs(df['low'] - df['close'].shift(1))
+        )
+    )
+    df['atr'] = df['tr'].rolling(window=period).mean()
+
+    hl2 = (df['high'] + df['low']) / 2
+    df['upper_band'] = hl2 + (multiplier * df['atr'])
+    df['lower_band'] = hl2 - (multiplier * df['atr'])
+
+    df['supertrend'] = 0.0
+    df['supertrend_direction'] = 0
+
+    for i in range(start, len(df)):
+        curr_close = df['close'].iloc[i]
+        upper_band = df['upper_band'].iloc[i]
+        lower_band = df['lower_band'].iloc[i]
+        prev_supertrend = df['supertrend'].iloc[i-1] if i > start else upper_band
+        prev_direction = df['supertrend_direction'].iloc[i-1] if i > start else -1
+
+        if prev_direction == 1:
+            if curr_close < lower_band:
+                df.loc[df.index[i], 'supertrend'] = upper_band
+                df.loc[df.index[i], 'supertrend_direction'] = -1
+            else:
+                df.loc[df.index[i], 'supertrend'] = max(lower_band, prev_supertrend)
+                df.loc[df.index[i], 'supertrend_direction'] = 1
+        else:
+            if curr_close > upper_band:
+                df.loc[df.index[i], 'supertrend'] = lower_band
+                df.loc[df.index[i], 'supertrend_direction'] = 1
+            else:
+                df.loc[df.index[i], 'supertrend'] = min(upper_band, prev_supertrend)
+                df.loc[df.index[i], 'supertrend_direction'] = -1
+    return df
+
+
+def legacy_trailing_supertrend(df: pd.DataFrame, period: int = 10, multiplier: float = 3.0):
+    """Legacy BasicExitSystem.calculate_supertrend (행 단위 .iloc 기록)"""
+    high_low = df['high'] - df['low']
+    high_close = np.abs(df['high'] - df['close'].shift())
+    low_close = np.abs(df['low'] - df['close'].shift())
+    true_range = np.maximum(high_low, np.maximum(high_close, low_close))
+    atr = true_range.rolling(window=period).mean()
+
+    hl2 = (df['high'] + df['low']) / 2
+    upper_band = hl2 + (multiplier * atr)
+    lower_band = hl2 - (multiplier * atr)
+
+    supertrend = pd.Series(index=df.index, dtype=float)
+    trend = pd.Series(index=df.index, dtype=int)
+    supertrend.iloc[0] = lower_band.iloc[0]
+    trend.iloc[0] = 1
+
+    for i in range(1, len(df)):
+        if lower_band.iloc[i] > lower_band.iloc[i-1] or df['close'].iloc[i-1] < lower_band.iloc[i-1]:
+            lower_band.iloc[i] = lower_band.iloc[i]
+        else:
+            lower_band.iloc[i] = lower_band.iloc[i-1]
+
+        if upper_band.iloc[i] < upper_band.iloc[i-1] or df['close'].iloc[i-1] > upper_band.iloc[i-1]:
+            upper_band.iloc[i] = upper_band.iloc[i]
+        else:
+            upper_band.iloc[i] = upper_band.iloc[i-1]
+
+        if trend.iloc[i-1] == 1:
+            if df['close'].iloc[i] <= lower_band.iloc[i]:
+                trend.iloc[i] = -1
+                supertrend.iloc[i] = upper_band.iloc[i]
+            else:
+                trend.iloc[i] = 1
+                supertrend.iloc[i] = lower_band.iloc[i]
+        else:
+            if df['close'].iloc[i] >= upper_band.iloc[i]:
+                trend.iloc[i] = 1
+                supertrend.iloc[i] = lower_band.iloc[i]
+            else:
+                trend.iloc[i] = -1
+                supertrend.iloc[i] = upper_band.iloc[i]
+    return supertrend, trend
+
+
+def make_ohlcv(rows: int, seed: int, nan_rows: int = 0) -> pd.DataFrame:
+    """랜덤 워크 OHLCV (nan_rows > 0이면 임의 행에 NaN 삽입)"""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, rows))
+    open_ = close + rng.normal(0, 0.2, rows)
+    high = np.maximum(open_, close) + rng.random(rows) * 0.5
+    low = np.minimum(open_, close) - rng.random(rows) * 0.5
+    df = pd.DataFrame({'open': open_, 'high': high, 'low': low, 'close': close,
+                       'volume': rng.random(rows) * 1000})
+    if nan_rows:
+        df.loc[rng.choice(rows, nan_rows, replace=False), 'close'] = np.nan
+    return df
+
+
+def check_parity(rows: int, cases: int) -> int:
+    """Legacy 구현과 결과 비교, 불일치 case 수 반환"""
+    mismatches = 0
+    for seed in range(cases):
+        for period, multiplier, start in ((10, 3.0, None), (10, 3.0, 10), (10, 2.0, None), (7, 0.5, None)):
+            base = make_ohlcv(rows, seed, nan_rows=3 if seed % 4 == 3 else 0)
+
+            expected = legacy_supertrend(base.copy(), period, multiplier, start)
+            actual = add_supertrend_columns(base.copy(), period, multiplier, start=start)
+            for column in ('supertrend', 'supertrend_direction'):
+                if not np.array_equal(expected[column].to_numpy(), actual[column].to_numpy(), equal_nan=True):
+                    mismatches += 1
+                    print(f"  ❌ strategy mismatch: seed={seed} period={period} mult={multiplier} col={column}")
+
+            expected_st, expected_trend = legacy_trailing_supertrend(base.copy(), period, multiplier)
+            actual_st, actual_trend = trailing_supertrend(base.copy(), period, multiplier)
+            if not (np.array_equal(expected_st.to_numpy(), actual_st.to_numpy(), equal_nan=True)
+                    and np.array_equal(expected_trend.to_numpy(), actual_trend.to_numpy(), equal_nan=True)):
+                mismatches += 1
+                print(f"  ❌ trailing mismatch: seed={seed} period={period} mult={multiplier}")
+    return mismatches
+
+
+def bench(func, frames) -> float:
+    start = time.perf_counter()
+    for df in frames:
+        func(df.copy())
+    return (time.perf_counter() - start) / len(frames)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SuperTrend kernel benchmark')
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--symbols', type=int, default=150)
+    parser.add_argument('--legacy-symbols', type=int, default=5, help='Legacy 루프 측정 Symbol 수 (느림)')
+    parser.add_argument('--parity-cases', type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"📊 SuperTrend 벤치마크: {args.rows} rows, numba={'on' if HAS_NUMBA else 'off'}")
+
+    mismatches = check_parity(min(args.rows, 300), args.parity_cases)
+    print(f"  {'✅' if mismatches == 0 else '❌'} Parity: {mismatches} mismatches "
+          f"({args.parity_cases} seeds × 4 Settings, NaN 포함 case 포함)")
+
+    frames = [make_ohlcv(args.rows, seed) for seed in range(args.symbols)]
+    legacy_frames = frames[:args.legacy_symbols]
+
+    results = [
+        ('strategy', lambda df: legacy_supertrend(df), lambda df: add_supertrend_columns(df)),
+        ('trailing', lambda df: legacy_trailing_supertrend(df), lambda df: trailing_supertrend(df)),
+    ]
+    print(f"{'variant':>10} {'legacy ms':>10} {'kernel ms':>10} {'speedup':>9} {'scan ms':>14}")
+    for name, legacy_func, kernel_func in results:
+        legacy_time = bench(legacy_func, legacy_frames)
+        kernel_time = bench(kernel_func, frames)
+        print(f"{name:>10} {legacy_time * 1000:>10.2f} {kernel_time * 1000:>10.3f} "
+              f"{legacy_time / kernel_time:>8.0f}x "
+              f"{legacy_time * args.symbols * 1000:>6.0f}→{kernel_time * args.symbols * 1000:<6.1f}")
+    print(f"  (scan ms = {args.symbols} symbols 1times 스캔 기준 Legacy→커널)")
+
+
+if __name__ == "__main__":
+    main()
@@ -26,6 +26,8 @@ from dataclasses import dataclass, asdict
 from collections import defaultdict
 import logging
 
+from persistence_scheduler import get_persistence_scheduler
+
 def get_korea_time():
     """한국 표준시(KST) 현재 시간 반환"""
     return datetime.now(timezone(timedelta(hours=9)))
@@ -119,14 +121,13 @@ class TradingSignalLogger:
             return []
     
     def _save_trade_history(self):
-        """거래 이력 파일 저장"""
-        with self.file_lock:
-            try:
-                with open(self.history_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.trade_history, f, ensure_ascii=False, indent=2)
-                self.logger.debug("거래 이력 저장 완료")
-            except Exception as e:
-                self.logger.error(f"거래 이력 저장 실패: {e}")
+        """거래 이력 파일 저장 (백그라운드 디바운스 기록, 직렬화는 file_lock 안에서)"""
+        try:
+            get_persistence_scheduler(self.logger).schedule(self.history_file, lambda: list(self.trade_history),
+                                                            lock=self.file_lock)
+            self.logger.debug("거래 이력 저장 예약")
+        except Exception as e:
+            self.logger.error(f"거래 이력 저장 실패: {e}")
     
     def log_signal(self, signal: TradingSignal):
         """거래 신호 로그 기록"""
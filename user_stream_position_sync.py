@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+User Stream Position Sync
+User Data Stream (ACCOUNT_UPDATE / ORDER_TRADE_UPDATE)을 Position 상태의 기준으로 삼고
+REST는 느린 재조정 (기본 5분) / 스트림 공백 직후에만 사용
+
+흐름:
+- ACCOUNT_UPDATE → 공용 PositionSnapshot 즉시 갱신 (ms) + 변경 Symbol 기록 + 이벤트 알림
+- 전략 Sync (sync_positions_with_exchange)는 positions_for_sync()로 스냅샷을 읽음 → REST 없음
+- 재조정 조건: 스트림 (재)연결 직후, 스트림 끊김, reconcile_interval 경과 → fetch_positions() 1times
+- ORDER_TRADE_UPDATE → order_callbacks (모든 주문 이벤트, DCA 지정가 체결 / Cancel 반영),
+  체결 (execution_type TRADE) → fill_callbacks 호출
+
+스트림은 변경분만 보내므로 연결 후 첫 REST 재조정이 끝나기 전에는 live로 보지 않습니다.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class UserStreamPositionSync:
+    """User Data Stream → PositionSnapshot 연결 + REST 재조정 주기 관리"""
+
+    def __init__(self, stream, snapshot, logger=None, reconcile_interval: float = 300):
+        """
+        Args:
+            stream: BinanceUserDataStream (position_callback / order_callback / reconnect_callback 지원)
+            snapshot: PositionSnapshot
+            logger: 로거 인스턴스
+            reconcile_interval: 스트림이 건강할 때 REST 재조정 주기 (초)
+        """
+        self.stream = stream
+        self.snapshot = snapshot
+        self.logger = logger or logging.getLogger(__name__)
+        self.reconcile_interval = reconcile_interval
+
+        self._lock = threading.Lock()
+        self._changed: Dict[str, dict] = {}  # symbol -> 마지막 스트림 Position (drain 전까지)
+        self._reconcile_requested = True      # 연결 직후 / 공백 후 REST 재조정 필요
+        self._last_reconcile = 0.0
+        self.event = threading.Event()        # 스트림 Position 변경 알림 (메인 루프 대기 해제용)
+        self.order_callbacks: List[Callable] = []
+        self.fill_callbacks: List[Callable] = []
+
+        self.stats = {
+            'stream_positions': 0,
+            'stream_fills': 0,
+            'reconciles': 0,
+            'stream_syncs': 0,
+            'gaps': 0,
+        }
+
+        stream.position_callback = self._on_position
+        stream.order_callback = self._on_order
+        stream.reconnect_callback = self._on_reconnect
+        snapshot.set_live_source(self.is_live)
+
+    # ===== 스트림 Callback (WebSocket 스레드) =====
+
+    def _on_position(self, symbol: str, position: dict):
+        # ACCOUNT_UPDATE에는 mark price가 없음 → 스냅샷에 있는 값 (요청 없이)으로 notional 계산
+        position = dict(position)
+        if not position.get('markPrice'):
+            position['markPrice'] = self.snapshot.get_mark_prices([symbol], max_age=float('inf')).get(symbol)
+        contracts = float(position.get('contracts') or 0)
+        position['notional'] = contracts * float(position.get('markPrice') or position.get('entryPrice') or 0)
+        self.snapshot.update_position(symbol, position, merge=True)
+        with self._lock:
+            self._changed[symbol] = position
+            self.stats['stream_positions'] += 1
+        self.event.set()
+
+    def _on_order(self, order_id, order: dict):
+        callbacks = list(self.order_callbacks)
+        if order.get('execution_type') == 'TRADE':
+            self.stats['stream_fills'] += 1
+            callbacks += self.fill_callbacks
+        for callback in callbacks:
+            try:
+                callback(order)
+            except Exception as e:
+                self.logger.error(f"❌ 체결 Callback Failed ({order.get('symbol')}): {e}")
+
+    def _on_reconnect(self):
+        with self._lock:
+            if self._last_reconcile:
+                self.stats['gaps'] += 1
+            self._reconcile_requested = True
+        self.event.set()
+
+    # ===== 상태 =====
+
+    def is_live(self) -> bool:
+        """스트림 연결 중 + 연결 이후 REST 재조정 Complete → 스냅샷이 최신"""
+        return self.stream.is_healthy() and not self._reconcile_requested
+
+    def reconcile_due(self) -> bool:
+        if not self.stream.is_healthy() or self._reconcile_requested:
+            return True
+        return time.time() - self._last_reconcile >= self.reconcile_interval
+
+    def positions_for_sync(self) -> Tuple[List[dict], bool]:
+        """
+        전략 Sync용 Position 목록
+
+        Returns:
+            (positions, reconciled): reconciled=True면 이번 호출에서 REST 재조정 (fetch_positions 1times)
+        """
+        if self.reconcile_due():
+            healthy = self.stream.is_healthy()
+            self.snapshot.refresh_positions(force=True)  # Failed 시 예외 (호출측 Rate Limit Process)
+            positions = self.snapshot.fetch_positions()
+            with self._lock:
+                # 스트림이 끊긴 상태면 다음 Sync도 REST (재연결 시 다시 요청됨)
+                self._reconcile_requested = not healthy
+                self._last_reconcile = time.time()
+                self._changed.clear()
+                self.stats['reconciles'] += 1
+            return positions, True
+
+        self.stats['stream_syncs'] += 1
+        return self.snapshot.fetch_positions(), False
+
+    def drain_changes(self) -> Dict[str, dict]:
+        """마지막 drain 이후 스트림으로 바뀐 Position {symbol: Position (contracts 0 = 청산)}"""
+        with self._lock:
+            changed, self._changed = self._changed, {}
+        self.event.clear()
+        return changed
+
+    def wait(self, timeout: float) -> bool:
+        """스트림 Position 변경까지 대기 (timeout 경과 시 False)"""
+        return self.event.wait(timeout)
+
+    def get_stats(self) -> dict:
+        return {
+            **self.stats,
+            'live': self.is_live(),
+            'pending_changes': len(self._changed),
+            'last_reconcile_age': round(time.time() - self._last_reconcile, 1) if self._last_reconcile else None,
+            'stream': self.stream.get_stats() if hasattr(self.stream, 'get_stats') else {},
+        }
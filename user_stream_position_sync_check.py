@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""
+User Data Stream 기반 Position Sync Verification (가짜 거래소 / 가짜 이벤트, 네트워크 없음)
+
+점검 항목:
+1. 연결 직후 REST 재조정 1times, 이후 스트림이 살아있는 동안 Sync / 스냅샷 조times에 REST 없음
+2. ACCOUNT_UPDATE → 스냅샷 즉시 반영 (unified symbol, 추가 / 청산), 과거 이벤트 무시, 변경 알림 이벤트
+3. 재연결 / 끊김 / 재조정 주기 경과 → REST 재조정, 재조정 중 들어온 스트림 값은 REST 응답으로 덮어쓰지 않음
+4. ORDER_TRADE_UPDATE 체결 → fill_callbacks
+5. 전략 / DCA 매니저: positions_for_sync 경로, apply_exchange_position (Register / Update / 청산)
+6. 250ms Sync 10분 기준 REST weight 비교 (매 Sync fetch_positions vs 스트림 + 5분 재조정)
+
+Usage:
+    python user_stream_position_sync_check.py [--minutes 10]
+"""
+
+import argparse
+import json
+import logging
+import threading
+import time
+import types
+
+from position_snapshot import PositionSnapshot
+from user_stream_position_sync import UserStreamPositionSync
+from websocket_user_data_stream import BinanceUserDataStream
+
+FETCH_POSITIONS_WEIGHT = 5
+
+
+class FakeExchange:
+    """fetch_positions 호출 수를 세는 가짜 거래소 (markets 미로드 → USDT 규칙으로 unified symbol)"""
+
+    apiKey = 'key'
+    secret = 'secret'
+
+    def __init__(self, rows=None, latency: float = 0.0):
+        self.rows = list(rows or [])
+        self.latency = latency
+        self.calls = {'fetch_positions': 0, 'fetch_mark_prices': 0, 'fetch_ticker': 0}
+
+    def fetch_positions(self, symbols=None):
+        self.calls['fetch_positions'] += 1
+        rows = [dict(row) for row in self.rows]
+        if self.latency:
+            time.sleep(self.latency)
+        return rows
+
+    def fetch_mark_prices(self, symbols=None):
+        self.calls['fetch_mark_prices'] += 1
+        return {}
+
+    def fetch_ticker(self, symbol):
+        self.calls['fetch_ticker'] += 1
+        return {'last': 1.0}
+
+
+def row(symbol: str, contracts: float, entry: float = 100.0, mark: float = 101.0) -> dict:
+    return {'symbol': symbol, 'contracts': contracts, 'side': 'long', 'entryPrice': entry, 'markPrice': mark,
+            'notional': contracts * mark, 'leverage': 10}
+
+
+def account_update(market_id: str, amount: float, entry: float, transaction_time: int) -> str:
+    return json.dumps({'e': 'ACCOUNT_UPDATE', 'E': transaction_time, 'T': transaction_time,
+                       'a': {'m': 'ORDER', 'B': [],
+                             'P': [{'s': market_id, 'pa': str(amount), 'ep': str(entry), 'up': '0', 'ps': 'BOTH'}]}})
+
+
+def order_update(market_id: str, execution_type: str, filled: float, price: float) -> str:
+    return json.dumps({'e': 'ORDER_TRADE_UPDATE', 'E': 1, 'T': 1,
+                       'o': {'s': market_id, 'i': 7, 'c': 'dca_2', 'X': 'FILLED', 'x': execution_type, 'S': 'BUY',
+                             'o': 'LIMIT', 'p': str(price), 'q': str(filled), 'z': str(filled), 'ap': str(price),
+                             'l': str(filled), 'L': str(price), 'R': False, 'rp': '0', 'T': 1}})
+
+
+def make_sync(logger, exchange, reconcile_interval: float = 300):
+    """연결된 스트림 (start 없이 _on_open으로 연결 상태 재현) + 스냅샷 + Sync"""
+    stream = BinanceUserDataStream(exchange, logger=logger)
+    snapshot = PositionSnapshot(exchange, logger=logger)
+    sync = UserStreamPositionSync(stream, snapshot, logger=logger, reconcile_interval=reconcile_interval)
+    stream.running = True
+    stream._on_open(None)
+    return stream, snapshot, sync
+
+
+def check(results: list, name: str, passed: bool, detail: str = ''):
+    results.append(passed)
+    print(f"  {'✅' if passed else '❌'} {name}" + (f" - {detail}" if detail else ''))
+
+
+def check_live(results: list, logger):
+    print("\n[1] 연결 직후 재조정 → 이후 REST 없음")
+    exchange = FakeExchange([row('BTC/USDT:USDT', 0.5)])
+    stream, snapshot, sync = make_sync(logger, exchange)
+
+    check(results, "재조정 전에는 live 아님", not sync.is_live() and not snapshot.is_live())
+    positions, reconciled = sync.positions_for_sync()
+    check(results, "첫 Sync = REST 재조정 1times", reconciled and len(positions) == 1
+          and exchange.calls['fetch_positions'] == 1, f"요청 {exchange.calls['fetch_positions']}times")
+
+    for _ in range(200):
+        sync.positions_for_sync()
+        snapshot.fetch_positions()
+        snapshot.get_position('BTC/USDT:USDT', max_age=0)
+    check(results, "live 동안 Sync / 조times 600times → REST 0times", sync.is_live()
+          and exchange.calls['fetch_positions'] == 1, f"요청 {exchange.calls['fetch_positions']}times")
+
+
+def check_stream_events(results: list, logger):
+    print("\n[2] ACCOUNT_UPDATE 반영")
+    exchange = FakeExchange([row('BTC/USDT:USDT', 0.5)])
+    stream, snapshot, sync = make_sync(logger, exchange)
+    sync.positions_for_sync()
+    snapshot.update_mark_price('ETH/USDT:USDT', 2000.0)
+
+    started = time.perf_counter()
+    stream._on_message(None, account_update('ETHUSDT', 2.0, 1990.0, 1000))
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    eth = snapshot.get_position('ETH/USDT:USDT')
+    check(results, "새 Position 즉시 반영 (unified symbol)", eth is not None and eth['contracts'] == 2.0
+          and eth['entryPrice'] == 1990.0, f"{elapsed_ms:.2f}ms")
+    check(results, "mark price는 스냅샷 값으로 notional 계산", eth is not None and eth['notional'] == 4000.0,
+          f"{eth and eth.get('notional')}")
+    check(results, "변경 알림 이벤트", sync.wait(0) and 'ETH/USDT:USDT' in sync._changed)
+
+    stream._on_message(None, account_update('ETHUSDT', 3.0, 1995.0, 900))
+    check(results, "과거 이벤트 무시", snapshot.get_position('ETH/USDT:USDT')['contracts'] == 2.0
+          and stream.stats['stale_events'] == 1)
+
+    stream._on_message(None, account_update('BTCUSDT', 0, 0, 1100))
+    changes = sync.drain_changes()
+    check(results, "청산 반영 + drain", snapshot.get_position('BTC/USDT:USDT') is None
+          and set(changes) == {'ETH/USDT:USDT', 'BTC/USDT:USDT'} and not sync.wait(0))
+    check(results, "REST 없음", exchange.calls['fetch_positions'] == 1, f"요청 {exchange.calls['fetch_positions']}times")
+
+
+def check_reconcile(results: list, logger):
+    print("\n[3] 재조정 조건")
+    exchange = FakeExchange([row('BTC/USDT:USDT', 0.5)])
+    stream, snapshot, sync = make_sync(logger, exchange, reconcile_interval=0.2)
+    sync.positions_for_sync()
+
+    stream._on_close(None, 1006, 'gone')
+    check(results, "끊김 → live 해제", not sync.is_live() and not snapshot.is_live())
+    sync.positions_for_sync()
+    sync.positions_for_sync()
+    check(results, "끊긴 동안 Sync마다 REST", exchange.calls['fetch_positions'] == 3)
+
+    stream._on_open(None)
+    _, reconciled = sync.positions_for_sync()
+    _, again = sync.positions_for_sync()
+    check(results, "재연결 → 재조정 1times 후 live", reconciled and not again and sync.is_live()
+          and sync.stats['gaps'] == 1 and stream.stats['reconnections'] == 1, f"{sync.get_stats()}")
+
+    time.sleep(0.25)
+    _, reconciled = sync.positions_for_sync()
+    check(results, "재조정 주기 경과 → REST 1times", reconciled and exchange.calls['fetch_positions'] == 5)
+
+    # REST 응답 대기 중 스트림으로 청산 → 응답의 옛 Position이 되살아나지 않아야 함
+    exchange.latency = 0.2
+    worker = threading.Thread(target=snapshot.refresh_positions, kwargs={'force': True})
+    worker.start()
+    time.sleep(0.05)
+    stream._on_message(None, account_update('BTCUSDT', 0, 0, 2000))
+    worker.join()
+    check(results, "재조정 중 들어온 스트림 청산 Maintain", snapshot.get_position('BTC/USDT:USDT') is None)
+
+
+def check_fills(results: list, logger):
+    print("\n[4] 체결 Callback")
+    exchange = FakeExchange()
+    stream, snapshot, sync = make_sync(logger, exchange)
+    fills = []
+    sync.fill_callbacks.append(fills.append)
+    stream._on_message(None, order_update('SOLUSDT', 'NEW', 0, 150.0))
+    stream._on_message(None, order_update('SOLUSDT', 'TRADE', 4.0, 150.0))
+    check(results, "TRADE만 전달 (unified symbol / 체결 Quantity)", len(fills) == 1
+          and fills[0]['symbol'] == 'SOL/USDT:USDT' and fills[0]['last_filled_quantity'] == 4.0
+          and fills[0]['client_order_id'] == 'dca_2')
+
+
+def check_consumers(results: list, logger):
+    print("\n[5] 전략 / DCA 매니저")
+    from improved_dca_position_manager import ImprovedDCAPositionManager
+    from one_minute_surge_entry_strategy import OneMinuteSurgeEntryStrategy
+
+    exchange = FakeExchange([row('BTC/USDT:USDT', 0.5)])
+    stream, snapshot, sync = make_sync(logger, exchange)
+
+    manager = ImprovedDCAPositionManager.__new__(ImprovedDCAPositionManager)
+    manager.exchange = exchange
+    manager.positions = {}
+    manager.logger = logger
+    manager.sync_lock = threading.Lock()
+    manager.saves = 0
+    manager.save_data = lambda: setattr(manager, 'saves', manager.saves + 1)
+    manager.sync_with_exchange = lambda force_sync=False: setattr(manager, 'full_syncs',
+                                                                  getattr(manager, 'full_syncs', 0) + 1)
+    calls = []
+
+    def register(symbol, pos):
+        calls.append(('register', symbol, pos['contracts'], pos['notional']))
+        manager.positions[symbol] = pos
+
+    def cleanup(symbol):
+        calls.append(('cleanup', symbol))
+        manager.positions.pop(symbol, None)
+
+    def update(symbol, pos):
+        calls.append(('update', symbol, pos['contracts']))
+        return True
+
+    manager._register_existing_position = register
+    manager._cleanup_orphaned_position = cleanup
+    manager._update_position_from_exchange = update
+
+    strategy = types.SimpleNamespace(logger=logger, position_snapshot=snapshot, user_stream_sync=sync,
+                                     dca_manager=manager)
+    strategy._apply_stream_changes = types.MethodType(OneMinuteSurgeEntryStrategy._apply_stream_changes, strategy)
+
+    positions, reconciled = sync.positions_for_sync()
+    strategy._apply_stream_changes(reconciled)
+    check(results, "재조정 직후 DCA 전체 Sync", getattr(manager, 'full_syncs', 0) == 1 and not calls)
+
+    snapshot.update_mark_price('ETH/USDT:USDT', 2000.0)
+    stream._on_message(None, account_update('ETHUSDT', 2.0, 1990.0, 1000))
+    stream._on_message(None, account_update('ETHUSDT', 2.5, 1992.0, 1001))
+    stream._on_message(None, account_update('BTCUSDT', 0, 0, 1002))
+    manager.positions['BTC/USDT:USDT'] = object()
+    positions, reconciled = sync.positions_for_sync()
+    strategy._apply_stream_changes(reconciled)
+    check(results, "스트림 변경 → Symbol 단위 반영 (Symbol당 마지막 값)",
+          ('register', 'ETH/USDT:USDT', 2.5, 5000.0) in calls and ('cleanup', 'BTC/USDT:USDT') in calls
+          and len(calls) == 2 and manager.saves == 2, f"{calls}")
+    check(results, "Sync 결과 = 스냅샷 (REST 없음)", [p['symbol'] for p in positions] == ['ETH/USDT:USDT']
+          and exchange.calls['fetch_positions'] == 1)
+
+    stream._on_message(None, account_update('ETHUSDT', 3.0, 1994.0, 1003))
+    strategy._apply_stream_changes(False)
+    check(results, "기존 DCA Position Update", calls[-1] == ('update', 'ETH/USDT:USDT', 3.0), f"{calls[-1]}")
+
+
+def check_weight(results: list, logger, minutes: int):
+    print(f"\n[6] REST weight ({minutes}분, 250ms Sync)")
+    cycles = minutes * 60 * 4
+    legacy = cycles * FETCH_POSITIONS_WEIGHT
+
+    exchange = FakeExchange([row('BTC/USDT:USDT', 0.5)])
+    stream, snapshot, sync = make_sync(logger, exchange, reconcile_interval=300)
+    clock = [time.time()]
+    import user_stream_position_sync as module
+    module.time = types.SimpleNamespace(time=lambda: clock[0])
+    try:
+        for _ in range(cycles):
+            sync.positions_for_sync()
+            clock[0] += 0.25
+    finally:
+        module.time = time
+    streamed = exchange.calls['fetch_positions'] * FETCH_POSITIONS_WEIGHT
+    reduction = (1 - streamed / legacy) * 100
+    check(results, "Sync REST weight 90% 이상 감소", reduction >= 90,
+          f"{legacy} → {streamed} weight ({reduction:.2f}% 감소, 재조정 {exchange.calls['fetch_positions']}times)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='User Data Stream 기반 Position Sync Verification')
+    parser.add_argument('--minutes', type=int, default=10, help='weight 비교 구간 (분)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    logger = logging.getLogger('user_stream_position_sync_check')
+
+    results = []
+    check_live(results, logger)
+    check_stream_events(results, logger)
+    check_reconcile(results, logger)
+    check_fills(results, logger)
+    check_consumers(results, logger)
+    check_weight(results, logger, args.minutes)
+
+    print()
+    if all(results):
+        print(f"✅ 전체 통과 ({len(results)} 항목)")
+    else:
+        print(f"❌ Failed {results.count(False)} / {len(results)} 항목")
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+Vectorized Conditions
+진입 조건 경로의 윈도우 검사 (최근 N봉 iterrows / iloc 루프)를 NumPy 마스크 연산으로 대체
+
+특징:
+- 크로스 탐지는 pattern_optimizations.cross_mask 하나로 통일 (이전봉/다음봉 포함 여부 파라미터)
+- 시가 대비 고가 상승률은 pattern_optimizations.open_to_high_pct_vectorized 공유
+- 루프 버전과 같은 규칙: NaN 포함 봉/쌍은 조건 불충족, 비교 연산자 (<, <=) 그대로 유지
+- 인덱스를 반환하는 함수는 루프 버전과 같은 위치 (윈도우 내 0-based) 반환 → 디버그 Log 동일
+
+결과 동일성은 vectorized_conditions_parity.py (루프 버전 vs 벡터 버전)로 Verification합니다.
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from pattern_optimizations import cross_mask, open_to_high_pct_vectorized
+
+
+def tail_values(df: pd.DataFrame, column: str, recent_n: Optional[int] = None) -> np.ndarray:
+    """컬럼의 최근 recent_n봉 (df.tail(recent_n)[column]와 같은 범위) float64 배열"""
+    values = df[column].to_numpy(dtype=np.float64)
+    if recent_n is None:
+        return values
+    return values[len(values) - min(recent_n, len(values)):]
+
+
+def find_cross(
+    df: pd.DataFrame,
+    fast_col: str,
+    slow_col: str,
+    recent_n: int,
+    golden: bool = True,
+    prev_inclusive: bool = True,
+    curr_inclusive: bool = False
+) -> bool:
+    """
+    최근 recent_n봉 이내 크로스 여부
+
+    컬럼이 없으면 KeyError (호출 측 예외 처리 유지)
+    """
+    if df is None or len(df) < 2:
+        return False
+    fast = tail_values(df, fast_col, recent_n)
+    slow = tail_values(df, slow_col, recent_n)
+    if len(fast) < 2:
+        return False
+    return bool(cross_mask(fast, slow, golden, prev_inclusive, curr_inclusive).any())
+
+
+def cross_positions(
+    fast: np.ndarray,
+    slow: np.ndarray,
+    golden: bool = True,
+    prev_inclusive: bool = True,
+    curr_inclusive: bool = False,
+    max_pairs: Optional[int] = None,
+    max_count: Optional[int] = None
+) -> np.ndarray:
+    """
+    크로스가 발생한 봉 위치 (크로스 직후 봉, 배열 내 0-based)
+
+    Args:
+        max_pairs: 앞에서부터 검사할 인접 쌍 수 (None = 전체)
+        max_count: 반환할 최대 count수 (앞에서부터)
+    """
+    if len(fast) < 2:
+        return np.empty(0, dtype=np.intp)
+    mask = cross_mask(fast, slow, golden, prev_inclusive, curr_inclusive)
+    if max_pairs is not None:
+        mask = mask[:max(max_pairs, 0)]
+    positions = np.flatnonzero(mask) + 1
+    return positions if max_count is None else positions[:max_count]
+
+
+def first_cross_position(
+    fast: np.ndarray,
+    slow: np.ndarray,
+    golden: bool = True,
+    prev_inclusive: bool = True,
+    curr_inclusive: bool = False,
+    max_pairs: Optional[int] = None
+) -> Optional[int]:
+    """첫 번째 크로스 직후 봉 위치 (없으면 None)"""
+    positions = cross_positions(fast, slow, golden, prev_inclusive, curr_inclusive, max_pairs, max_count=1)
+    return int(positions[0]) if len(positions) else None
+
+
+def direction_flip_found(directions: np.ndarray, from_value: float = -1, to_value: float = 1) -> bool:
+    """인접 봉 방향 전환 (from_value → to_value) 여부 - SuperTrend 하락→상승"""
+    directions = np.asarray(directions)
+    if len(directions) < 2:
+        return False
+    return bool(((directions[:-1] == from_value) & (directions[1:] == to_value)).any())
+
+
+def body_cross_found(df: pd.DataFrame, levels: Sequence[str], recent_n: int) -> bool:
+    """
+    최근 recent_n봉 중 한 봉이 모든 levels를 몸통으로 관통 (시가 < 레벨 and 종가 > 레벨)
+
+    NaN 값이 하나라도 있는 봉은 제외
+    """
+    opens = tail_values(df, 'open', recent_n)
+    closes = tail_values(df, 'close', recent_n)
+    matched = np.ones(len(opens), dtype=bool)
+    for level in levels:
+        values = tail_values(df, level, recent_n)
+        matched &= (opens < values) & (closes > values)
+    return bool(matched.any())
+
+
+def open_below_high_above_positions(df: pd.DataFrame, level_col: str, recent_n: int) -> np.ndarray:
+    """최근 recent_n봉 중 시가 < 레벨 and 고가 > 레벨 (윗꼬리 돌파) 봉 위치"""
+    level = tail_values(df, level_col, recent_n)
+    opens = tail_values(df, 'open', recent_n)
+    highs = tail_values(df, 'high', recent_n)
+    return np.flatnonzero((opens < level) & (highs > level))
+
+
+def consecutive_bullish_found(df: pd.DataFrame, recent_n: int, run: int = 3) -> bool:
+    """최근 recent_n봉 이내 run봉 연속 양봉 (종가 > 시가) 여부"""
+    bullish = tail_values(df, 'close', recent_n) > tail_values(df, 'open', recent_n)
+    if len(bullish) < run:
+        return False
+    return bool(sliding_window_view(bullish, run).all(axis=1).any())
+
+
+def ma_downtrend_cross_found(df: pd.DataFrame, recent_n: int, ma_col: str = 'ma5') -> bool:
+    """
+    최근 recent_n봉 이내 (MA 우하향 and MA 몸통 돌파) 봉 여부
+
+    봉 i (1 <= i < len-1): MA[i] > MA[i+1] and 시가[i] < MA[i] < 종가[i]
+    """
+    ma = tail_values(df, ma_col, recent_n)
+    if len(ma) < 3:
+        return False
+    opens = tail_values(df, 'open', recent_n)
+    closes = tail_values(df, 'close', recent_n)
+    body = slice(1, len(ma) - 1)
+    downtrend = ma[body] > ma[2:]
+    cross = (opens[body] < ma[body]) & (closes[body] > ma[body])
+    return bool((downtrend & cross).any())
+
+
+def max_consecutive_decline(values: np.ndarray) -> int:
+    """인접 봉 연속 하락 (values[i] < values[i-1]) 최대 횟수, NaN에서 끊김"""
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) < 2:
+        return 0
+    declining = np.concatenate(([False], values[1:] < values[:-1], [False]))
+    edges = np.diff(declining.astype(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return int((ends - starts).max()) if len(starts) else 0
+
+
+def open_to_high_surge_with_trend(
+    df: pd.DataFrame,
+    check_candles: int,
+    min_surge_pct: float = 4.0,
+    trend_candles: int = 4
+) -> bool:
+    """
+    최근 check_candles봉 중 시가 대비 고가 min_surge_pct% 이상 1times 이상
+    and trend_candles봉 전 시가 ~ 최신 종가 상승률 0% 이상 (4h Filtering)
+    """
+    if df is None or len(df) < max(check_candles, trend_candles):
+        return False
+    if not (open_to_high_pct_vectorized(df, check_candles) >= min_surge_pct).any():
+        return False
+    first_open = float(df['open'].iat[-trend_candles])
+    last_close = float(df['close'].iat[-1])
+    if not first_open > 0:
+        return False
+    return ((last_close - first_open) / first_open) * 100 >= 0
@@ -0,0 +1,596 @@
+# -*- coding: utf-8 -*-
+"""
+진입 조건 윈도우 검사 결과 동일성 Verification
+Legacy 행 루프 (iterrows / iloc) 버전 vs vectorized_conditions / pattern_optimizations 벡터 버전
+
+검사 항목 (one_minute_surge_entry_strategy 진입 경로와 같은 윈도우):
+1. [Excluded조건] 3m 20봉 High vs Open 30% 이상, 60봉 3~20% count수
+2. 40봉 BB80 윗꼬리 돌파 (count수, 첫 인덱스), 30봉 3연속 양봉, 30봉 MA5 우하향+돌파
+3. D전략-4: 60봉 MA480 최대 연속 하락, 전체 BB200→MA480 골든크로스 (최대 3count + 디버그 문자열)
+4. SuperTrend 5봉 하락→상승 전환
+5. check_high_surge_conditions 전체 (조건 문자열 포함), _find_golden_cross / _find_dead_cross,
+   find_golden_cross_vectorized / find_dead_cross_vectorized
+6. 4h Filtering (최근 N봉 4% 급등 + 4봉 상승률)
+
+프레임: 랜덤 워크 + 추세 전환 + 경계값 급등 (3/4/20/30%) + 이평선 동일값 (크로스 경계) + NaN 구간
+기록된 프레임: --frames-dir (CSV, OHLCV 또는 지표 포함) / --save-frames로 현재 프레임 세트 기록
+
+Usage:
+    python vectorized_conditions_parity.py [--frames 300] [--seed 7]
+    python vectorized_conditions_parity.py --save-frames recorded_frames
+    python vectorized_conditions_parity.py --frames-dir recorded_frames --frames 0
+"""
+
+import argparse
+import glob
+import logging
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from incremental_indicator_parity import frame, make_strategy
+from pattern_optimizations import (
+    count_high_vs_open_in_range_vectorized,
+    find_dead_cross_vectorized,
+    find_golden_cross_vectorized,
+)
+from vectorized_conditions import (
+    body_cross_found,
+    consecutive_bullish_found,
+    cross_positions,
+    direction_flip_found,
+    first_cross_position,
+    ma_downtrend_cross_found,
+    max_consecutive_decline,
+    open_below_high_above_positions,
+    open_to_high_surge_with_trend,
+    tail_values,
+)
+
+FRAME_LENGTHS = (30, 60, 100, 250, 400, 700)
+SURGE_PCTS = (3.0, 4.0, 10.0, 20.0, 30.0, 35.0)
+CROSS_PAIRS = (('ma5', 'ma20', 10), ('ma5', 'ma20', 100), ('ma80', 'ma480', 300),
+               ('bb200_upper', 'bb480_upper', 200), ('ma5', 'ichimoku_conversion', 20))
+
+
+# ========== Legacy 루프 버전 (벡터화 이전 코드 그대로) ==========
+
+def legacy_open_to_high_count(df, recent_n, min_pct, max_pct=None):
+    count = 0
+    for _, row in df.tail(recent_n).iterrows():
+        if pd.notna(row['open']) and pd.notna(row['high']) and row['open'] > 0:
+            open_to_high_pct = ((row['high'] - row['open']) / row['open']) * 100
+            if open_to_high_pct >= min_pct and (max_pct is None or open_to_high_pct <= max_pct):
+                count += 1
+    return count
+
+
+def legacy_bb80_breakthrough(df):
+    recent_40_3m = df.tail(40)
+    count, first = 0, None
+    for i, (_, row) in enumerate(recent_40_3m.iterrows()):
+        if pd.notna(row['open']) and pd.notna(row['high']) and pd.notna(row['bb80_upper']):
+            if row['open'] < row['bb80_upper'] and row['high'] > row['bb80_upper']:
+                count += 1
+                if first is None:
+                    first = i
+    return count, first
+
+
+def legacy_three_green(df):
+    recent_30_3m = df.tail(30)
+    for i in range(len(recent_30_3m) - 2):
+        candle1 = recent_30_3m.iloc[i]
+        candle2 = recent_30_3m.iloc[i+1]
+        candle3 = recent_30_3m.iloc[i+2]
+        if (pd.notna(candle1['open']) and pd.notna(candle1['close']) and candle1['close'] > candle1['open'] and
+            pd.notna(candle2['open']) and pd.notna(candle2['close']) and candle2['close'] > candle2['open'] and
+            pd.notna(candle3['open']) and pd.notna(candle3['close']) and candle3['close'] > candle3['open']):
+            return True
+    return False
+
+
+def legacy_ma5_pattern(df):
+    recent_30_3m = df.tail(30)
+    for i in range(1, len(recent_30_3m)):
+        current_candle = recent_30_3m.iloc[i]
+        if i >= 1 and i < len(recent_30_3m) - 1:
+            curr_ma5 = current_candle['ma5']
+            next_ma5 = recent_30_3m.iloc[i+1]['ma5'] if i+1 < len(recent_30_3m) else None
+            ma5_downtrend = False
+            if pd.notna(curr_ma5) and pd.notna(next_ma5):
+                ma5_downtrend = curr_ma5 > next_ma5
+            ma5_cross = False
+            if (pd.notna(current_candle['open']) and pd.notna(current_candle['close']) and
+                pd.notna(current_candle['ma5'])):
+                ma5_cross = (current_candle['open'] < current_candle['ma5'] and
+                             current_candle['close'] > current_candle['ma5'])
+            if ma5_downtrend and ma5_cross:
+                return True
+    return False
+
+
+def legacy_ma480_decline(df):
+    recent_data = df.tail(60)
+    max_consecutive_down = 0
+    current_consecutive = 0
+    for i in range(1, len(recent_data)):
+        if (pd.notna(recent_data.iloc[i]['ma480']) and
+            pd.notna(recent_data.iloc[i-1]['ma480']) and
+            recent_data.iloc[i]['ma480'] < recent_data.iloc[i-1]['ma480']):
+            current_consecutive += 1
+            max_consecutive_down = max(max_consecutive_down, current_consecutive)
+        else:
+            current_consecutive = 0
+    return max_consecutive_down
+
+
+def legacy_bb200_ma480_cross(df):
+    bb200_ma480_golden = False
+    bb200_ma480_debug_info = []
+    total_cross_count = 0
+    for i in range(1, len(df)):
+        prev_candle = df.iloc[i-1]
+        curr_candle = df.iloc[i]
+        if (pd.notna(prev_candle['bb200_upper']) and pd.notna(prev_candle['ma480']) and
+            pd.notna(curr_candle['bb200_upper']) and pd.notna(curr_candle['ma480'])):
+            if (prev_candle['bb200_upper'] < prev_candle['ma480'] and
+                curr_candle['bb200_upper'] >= curr_candle['ma480']):
+                bb200_ma480_golden = True
+                total_cross_count += 1
+                bb200_ma480_debug_info.append(f"BB200→MA480골든크로스 발견! 인덱스={i}: 이전봉(BB200={prev_candle['bb200_upper']:.6f} < MA480={prev_candle['ma480']:.6f}) → Current봉(BB200={curr_candle['bb200_upper']:.6f} >= MA480={curr_candle['ma480']:.6f})")
+                if total_cross_count >= 3:
+                    break
+    recent_data = df.tail(60)
+    recent_values = []
+    for j in range(max(0, len(recent_data)-3), len(recent_data)):
+        candle = recent_data.iloc[j]
+        if pd.notna(candle.get('ma480')) and pd.notna(candle.get('bb200_upper')):
+            diff = candle['bb200_upper'] - candle['ma480']
+            recent_values.append(f"봉{j}(차이={diff:.6f})")
+    return bb200_ma480_golden, total_cross_count, bb200_ma480_debug_info, recent_values
+
+
+def legacy_supertrend_flip(df):
+    recent_5 = df.tail(5)
+    for i in range(1, len(recent_5)):
+        if recent_5.iloc[i-1]['supertrend_direction'] == -1 and recent_5.iloc[i]['supertrend_direction'] == 1:
+            return True
+    return False
+
+
+def legacy_find_cross(df, ma1_col, ma2_col, recent_n, golden, prev_inclusive):
+    """_find_golden_cross / _find_dead_cross (strict) 및 find_*_cross_vectorized (이전봉 포함) 루프"""
+    if df is None or len(df) < 2:
+        return False
+    recent_df = df.tail(min(recent_n, len(df)))
+    for i in range(len(recent_df) - 1):
+        curr_row = recent_df.iloc[i]
+        next_row = recent_df.iloc[i + 1]
+        if (pd.notna(curr_row[ma1_col]) and pd.notna(curr_row[ma2_col]) and
+            pd.notna(next_row[ma1_col]) and pd.notna(next_row[ma2_col])):
+            if golden:
+                prev_ok = curr_row[ma1_col] <= curr_row[ma2_col] if prev_inclusive else curr_row[ma1_col] < curr_row[ma2_col]
+                if prev_ok and next_row[ma1_col] > next_row[ma2_col]:
+                    return True
+            else:
+                prev_ok = curr_row[ma1_col] >= curr_row[ma2_col] if prev_inclusive else curr_row[ma1_col] > curr_row[ma2_col]
+                if prev_ok and next_row[ma1_col] < next_row[ma2_col]:
+                    return True
+    return False
+
+
+def legacy_high_surge_entry(df_1m):
+    """check_high_surge_conditions 조건 2 (골든크로스 인덱스, 데드크로스 인덱스, 전환선&MA20 동시 돌파)"""
+    golden_cross_index = None
+    recent_30 = df_1m.tail(30)
+    for i in range(len(recent_30) - 1):
+        prev_ma80 = recent_30.iloc[i]['ma80']
+        prev_ma480 = recent_30.iloc[i]['ma480']
+        curr_ma80 = recent_30.iloc[i+1]['ma80']
+        curr_ma480 = recent_30.iloc[i+1]['ma480']
+        if (pd.notna(prev_ma80) and pd.notna(prev_ma480) and
+            pd.notna(curr_ma80) and pd.notna(curr_ma480)):
+            if prev_ma80 <= prev_ma480 and curr_ma80 > curr_ma480:
+                golden_cross_index = i + 1
+                break
+    dead_cross_index = None
+    if golden_cross_index is not None:
+        target_data = recent_30.iloc[golden_cross_index:]
+        if len(target_data) >= 2:
+            for i in range(min(20, len(target_data) - 1)):
+                prev_ma5 = target_data.iloc[i]['ma5']
+                prev_conversion = target_data.iloc[i]['ichimoku_conversion']
+                curr_ma5 = target_data.iloc[i+1]['ma5']
+                curr_conversion = target_data.iloc[i+1]['ichimoku_conversion']
+                if (pd.notna(prev_ma5) and pd.notna(prev_conversion) and
+                    pd.notna(curr_ma5) and pd.notna(curr_conversion)):
+                    if prev_ma5 >= prev_conversion and curr_ma5 < curr_conversion:
+                        dead_cross_index = i + 1
+                        break
+    conversion_and_ma20_cross = False
+    for _, row in df_1m.tail(3).iterrows():
+        if (pd.notna(row['open']) and pd.notna(row['close']) and
+            pd.notna(row['ichimoku_conversion']) and pd.notna(row['ma20'])):
+            conversion_cross = (row['open'] < row['ichimoku_conversion'] and
+                                row['close'] > row['ichimoku_conversion'])
+            ma20_cross = (row['open'] < row['ma20'] and row['close'] > row['ma20'])
+            if conversion_cross and ma20_cross:
+                conversion_and_ma20_cross = True
+                break
+    return golden_cross_index, dead_cross_index, conversion_and_ma20_cross
+
+
+def legacy_4h_filter(df, candles_to_check):
+    timestamps = (df['timestamp'].astype('int64') // 10**6).to_numpy()
+    ohlcv = [[int(t), o, h, l, c, v] for t, o, h, l, c, v in zip(
+        timestamps, df['open'].to_numpy(), df['high'].to_numpy(), df['low'].to_numpy(),
+        df['close'].to_numpy(), df['volume'].to_numpy())]
+    surge_found = False
+    for i in range(-candles_to_check, 0):
+        open_price = ohlcv[i][1]
+        high_price = ohlcv[i][2]
+        if open_price > 0:
+            if ((high_price - open_price) / open_price) * 100 >= 4.0:
+                surge_found = True
+                break
+    if surge_found:
+        first_candle_open = ohlcv[-4][1]
+        last_candle_close = ohlcv[-1][4]
+        if first_candle_open > 0:
+            return ((last_candle_close - first_candle_open) / first_candle_open) * 100 >= 0
+    return False
+
+
+def legacy_check_high_surge_conditions(self, symbol, df_1m, change_24h):
+    """check_high_surge_conditions 벡터화 이전 버전 (전체 메서드)"""
+    try:
+        conditions = []
+        failed_conditions = 0
+        latest = df_1m.iloc[-1]
+        
+        conditions.append(f"[급등특별] 24h상승률: +{change_24h:.1f}%")
+        
+        # 1. 30봉 이내 ma80-ma480 골든크로스
+        ma80_ma480_golden = find_golden_cross_vectorized(df_1m, 'ma80', 'ma480', recent_n=30)
+        condition_1 = ma80_ma480_golden
+        conditions.append(f"[급등-1] 30봉이내 MA80-MA480 골든크로스: {condition_1}")
+        if not condition_1:
+            failed_conditions += 1
+        
+        # 2. 골든크로스 이후 Entry 조건
+        condition_2 = False
+        condition_2_details = ""
+        
+        if condition_1:  # 골든크로스가 있을 때만 체크
+            # 30봉 내에서 MA80-MA480 골든크로스 발생 시점 찾기
+            golden_cross_index = None
+            recent_30 = df_1m.tail(30)
+            
+            if len(recent_30) >= 2 and 'ma80' in df_1m.columns and 'ma480' in df_1m.columns:
+                for i in range(len(recent_30) - 1):
+                    prev_ma80 = recent_30.iloc[i]['ma80'] 
+                    prev_ma480 = recent_30.iloc[i]['ma480']
+                    curr_ma80 = recent_30.iloc[i+1]['ma80']
+                    curr_ma480 = recent_30.iloc[i+1]['ma480']
+                    
+                    if (pd.notna(prev_ma80) and pd.notna(prev_ma480) and 
+                        pd.notna(curr_ma80) and pd.notna(curr_ma480)):
+                        if prev_ma80 <= prev_ma480 and curr_ma80 > curr_ma480:
+                            golden_cross_index = i + 1
+                            break
+            
+            if golden_cross_index is not None:
+                # 골든크로스 이후 데이터 추출 (최대 60봉 범위)
+                after_golden_cross = recent_30.iloc[golden_cross_index:]
+                lookback_period = min(60, len(after_golden_cross))
+                target_data = after_golden_cross.head(lookback_period)  # 골든크로스 이후 60봉 범위
+                
+                condition_2_details = f"골든크로스 후 {len(after_golden_cross)}봉 Elapsed, 60봉 범위내 {lookback_period}봉 Analysis"
+                
+                if len(target_data) >= 2:
+                    # MA5-일목전환선 데드크로스 찾기
+                    ma5_conversion_dead_found = False
+                    dead_cross_index = None
+                    
+                    if 'ichimoku_conversion' in df_1m.columns:
+                        # 60봉 범위 내에서 20봉 이내 데드크로스 찾기
+                        search_limit = min(20, len(target_data) - 1)
+                        for i in range(search_limit):
+                            prev_ma5 = target_data.iloc[i]['ma5']
+                            prev_conversion = target_data.iloc[i]['ichimoku_conversion']
+                            curr_ma5 = target_data.iloc[i+1]['ma5']
+                            curr_conversion = target_data.iloc[i+1]['ichimoku_conversion']
+                            
+                            if (pd.notna(prev_ma5) and pd.notna(prev_conversion) and 
+                                pd.notna(curr_ma5) and pd.notna(curr_conversion)):
+                                if prev_ma5 >= prev_conversion and curr_ma5 < curr_conversion:
+                                    ma5_conversion_dead_found = True
+                                    dead_cross_index = i + 1
+                                    break
+                    
+                    # 3봉이내 전환선 골든크로스와 MA20 골든크로스 동시 체크
+                    recent_3 = df_1m.tail(3)
+                    conversion_and_ma20_cross = False
+                    
+                    if len(recent_3) >= 1:
+                        for _, row in recent_3.iterrows():
+                            if (pd.notna(row['open']) and pd.notna(row['close']) and 
+                                pd.notna(row['ichimoku_conversion']) and pd.notna(row['ma20'])):
+                                # 시가<전환선 and 종가>전환선 and 시가<ma20 and 종가>ma20
+                                conversion_cross = (row['open'] < row['ichimoku_conversion'] and 
+                                                  row['close'] > row['ichimoku_conversion'])
+                                ma20_cross = (row['open'] < row['ma20'] and row['close'] > row['ma20'])
+                                
+                                if conversion_cross and ma20_cross:
+                                    conversion_and_ma20_cross = True
+                                    break
+                    
+                    condition_2 = ma5_conversion_dead_found and conversion_and_ma20_cross
+                    
+                    if ma5_conversion_dead_found:
+                        condition_2_details += f", MA5-전환선데드크로스발견(+{dead_cross_index}봉째)"
+                    else:
+                        condition_2_details += f", MA5-전환선데드크로스Absent"
+                    
+                    if conversion_and_ma20_cross:
+                        condition_2_details += f", 3봉이내 전환선&MA20 동시골든크로스:True"
+                    else:
+                        condition_2_details += f", 3봉이내 전환선&MA20 동시골든크로스:False"
+                else:
+                    condition_2_details += ", 골든크로스 이후 Insufficient data"
+            else:
+                condition_2_details = "30봉이내 MA80-MA480 골든크로스 Absent"
+        else:
+            condition_2_details = "전제조건 미충족 (골든크로스 Absent)"
+        
+        conditions.append(f"[급등-2] 골든크로스후 60봉범위내 20봉이내 Entry조건: {condition_2}")
+        conditions.append(f"  ㄴ {condition_2_details}")
+        if not condition_2:
+            failed_conditions += 1
+        
+        # 모든 조건 충족 여부
+        is_signal = failed_conditions == 0
+        
+        return is_signal, conditions
+        
+    except Exception as e:
+        self.logger.error(f"급등 조 체크 Failed ({symbol}): {e}")
+        return False, [f"[급등특별] Error 발생: {str(e)}"]
+
+
+# ========== 벡터 버전 (전략 코드와 같은 호출) ==========
+
+def vector_bb200_ma480_cross(df):
+    bb200_values = tail_values(df, 'bb200_upper')
+    ma480_values = tail_values(df, 'ma480')
+    cross_at = cross_positions(bb200_values, ma480_values, golden=True,
+                               prev_inclusive=False, curr_inclusive=True, max_count=3)
+    debug_info = [
+        f"BB200→MA480골든크로스 발견! 인덱스={i}: 이전봉(BB200={bb200_values[i-1]:.6f} < MA480={ma480_values[i-1]:.6f}) → Current봉(BB200={bb200_values[i]:.6f} >= MA480={ma480_values[i]:.6f})"
+        for i in cross_at
+    ]
+    recent_len = min(60, len(df))
+    recent_ma480 = ma480_values[len(ma480_values) - recent_len:]
+    recent_bb200 = bb200_values[len(bb200_values) - recent_len:]
+    recent_diffs = [
+        f"봉{j}(차이={recent_bb200[j] - recent_ma480[j]:.6f})"
+        for j in range(max(0, recent_len-3), recent_len)
+        if not (np.isnan(recent_ma480[j]) or np.isnan(recent_bb200[j]))
+    ]
+    return len(cross_at) > 0, len(cross_at), debug_info, recent_diffs
+
+
+def vector_high_surge_entry(df_1m):
+    recent_30 = df_1m.tail(30)
+    golden_cross_index = first_cross_position(
+        tail_values(recent_30, 'ma80'), tail_values(recent_30, 'ma480'), golden=True)
+    dead_cross_index = None
+    if golden_cross_index is not None:
+        target_data = recent_30.iloc[golden_cross_index:]
+        if len(target_data) >= 2:
+            dead_cross_index = first_cross_position(
+                tail_values(target_data, 'ma5'), tail_values(target_data, 'ichimoku_conversion'),
+                golden=False, max_pairs=min(20, len(target_data) - 1))
+    return (golden_cross_index, dead_cross_index,
+            body_cross_found(df_1m.tail(3), ('ichimoku_conversion', 'ma20'), 3))
+
+
+def build_checks(strategy) -> list:
+    """(이름, legacy(df), vector(df))"""
+    checks = [
+        ('extreme_surge_30pct_20',
+         lambda df: legacy_open_to_high_count(df, 20, 30.0) > 0,
+         lambda df: count_high_vs_open_in_range_vectorized(df, 30.0, recent_n=20) > 0),
+        ('surge_3_20pct_count_60',
+         lambda df: legacy_open_to_high_count(df, 60, 3.0, 20.0),
+         lambda df: count_high_vs_open_in_range_vectorized(df, 3.0, 20.0, recent_n=60)),
+        ('bb80_breakthrough_40',
+         legacy_bb80_breakthrough,
+         lambda df: (lambda p: (len(p), int(p[0]) if len(p) else None))(
+             open_below_high_above_positions(df.tail(40), 'bb80_upper', 40))),
+        ('three_green_30', legacy_three_green, lambda df: consecutive_bullish_found(df.tail(30), 30, run=3)),
+        ('ma5_downtrend_cross_30', legacy_ma5_pattern, lambda df: ma_downtrend_cross_found(df.tail(30), 30, 'ma5')),
+        ('ma480_max_decline_60', legacy_ma480_decline,
+         lambda df: max_consecutive_decline(tail_values(df.tail(60), 'ma480'))),
+        ('bb200_ma480_cross_debug', legacy_bb200_ma480_cross, vector_bb200_ma480_cross),
+        ('supertrend_flip_5', legacy_supertrend_flip,
+         lambda df: direction_flip_found(df.tail(5)['supertrend_direction'].to_numpy(), -1, 1)),
+        ('high_surge_entry_indices', legacy_high_surge_entry, vector_high_surge_entry),
+    ]
+    for fast, slow, n in CROSS_PAIRS:
+        checks.append((f'_find_golden_cross {fast}/{slow}/{n}',
+                       lambda df, f=fast, s=slow, n=n: legacy_find_cross(df, f, s, n, True, False),
+                       lambda df, f=fast, s=slow, n=n: strategy._find_golden_cross(df, f, s, recent_n=n)))
+        checks.append((f'_find_dead_cross {fast}/{slow}/{n}',
+                       lambda df, f=fast, s=slow, n=n: legacy_find_cross(df, f, s, n, False, False),
+                       lambda df, f=fast, s=slow, n=n: strategy._find_dead_cross(df, f, s, recent_n=n)))
+        checks.append((f'find_golden_cross_vectorized {fast}/{slow}/{n}',
+                       lambda df, f=fast, s=slow, n=n: legacy_find_cross(df, f, s, n, True, True),
+                       lambda df, f=fast, s=slow, n=n: find_golden_cross_vectorized(df, f, s, n)))
+        checks.append((f'find_dead_cross_vectorized {fast}/{slow}/{n}',
+                       lambda df, f=fast, s=slow, n=n: legacy_find_cross(df, f, s, n, False, True),
+                       lambda df, f=fast, s=slow, n=n: find_dead_cross_vectorized(df, f, s, n)))
+    for candles in (1, 2, 3, 4):
+        checks.append((f'4h_surge_trend_{candles}',
+                       lambda df, c=candles: legacy_4h_filter(df.tail(10), c),
+                       lambda df, c=candles: open_to_high_surge_with_trend(df.tail(10), c, 4.0, 4)))
+    return checks
+
+
+# ========== 프레임 생성 / 기록 ==========
+
+def make_pattern_candles(rows: int, rng: np.random.Generator) -> np.ndarray:
+    """추세 전환 랜덤 워크 + 경계값 급등 캔들 [timestamp, open, high, low, close, volume]"""
+    turn = int(rows * rng.uniform(0.5, 0.95))
+    drift = np.where(np.arange(rows) < turn, -rng.uniform(0, 0.15), rng.uniform(0, 0.4))
+    close = 100 + np.cumsum(drift + rng.normal(0, 0.4, rows))
+    close = np.maximum(close, 1.0)
+    open_ = close * (1 + rng.normal(0, 0.003, rows))
+    high = np.maximum(open_, close) * (1 + rng.random(rows) * 0.004)
+    low = np.minimum(open_, close) * (1 - rng.random(rows) * 0.004)
+    # 경계값 급등: 시가 대비 고가 정확히 N%
+    for idx in rng.choice(rows, size=min(rows, rng.integers(0, 6)), replace=False):
+        high[idx] = open_[idx] * (1 + rng.choice(SURGE_PCTS) / 100)
+    if rng.random() < 0.5:
+        idx = rows - int(rng.integers(1, 5))
+        high[idx] = open_[idx] * (1 + rng.choice(SURGE_PCTS) / 100)
+    timestamp = 1_700_000_000_000 + np.arange(rows, dtype=np.int64) * 60_000
+    return np.column_stack([timestamp, open_, high, low, close, rng.random(rows) * 1000])
+
+
+def inject_edges(df: pd.DataFrame, rng: np.random.Generator) -> pd.DataFrame:
+    """크로스 경계 (동일값) / NaN 구간 / 음수·0 시가 주입"""
+    df = df.copy()
+    rows = len(df)
+    for fast, slow, _ in CROSS_PAIRS:
+        if slow in df.columns and rng.random() < 0.5:
+            idx = rng.choice(rows, size=min(rows, 3), replace=False)
+            df.loc[df.index[idx], fast] = df[slow].to_numpy()[idx]
+    if rng.random() < 0.3:
+        columns = [c for c in ('open', 'high', 'close', 'ma5', 'ma20', 'ma480', 'bb200_upper',
+                               'bb80_upper', 'ichimoku_conversion', 'supertrend_direction') if c in df.columns]
+        for column in rng.choice(columns, size=3, replace=False):
+            start = int(rng.integers(0, rows))
+            df.loc[df.index[start:start + int(rng.integers(1, 4))], column] = np.nan
+    if rng.random() < 0.1:
+        df.loc[df.index[-int(rng.integers(1, min(rows, 20) + 1))], 'open'] = rng.choice([0.0, -1.0])
+    if 'supertrend_direction' in df.columns and rng.random() < 0.3:
+        flip = rows - int(rng.integers(1, 6))
+        df.loc[df.index[flip - 1], 'supertrend_direction'] = -1
+        df.loc[df.index[flip], 'supertrend_direction'] = 1
+    return df
+
+
+def generate_frames(strategy, count: int, seed: int) -> list:
+    rng = np.random.default_rng(seed)
+    frames = []
+    for i in range(count):
+        rows = FRAME_LENGTHS[i % len(FRAME_LENGTHS)]
+        # 짧은 프레임은 지표 계산 후 tail (지표 최소 Length 미만)
+        df = strategy._compute_indicators(frame(make_pattern_candles(max(rows, 100), rng)))
+        if df is None:
+            continue
+        df = df.tail(rows).reset_index(drop=True)
+        frames.append((f"synthetic_{i}_{rows}", inject_edges(df, rng)))
+    return frames
+
+
+def load_frames(strategy, frames_dir: str) -> list:
+    """기록된 프레임 (CSV) 로드, 지표 컬럼이 없으면 계산"""
+    frames = []
+    for path in sorted(glob.glob(os.path.join(frames_dir, '*.csv'))):
+        df = pd.read_csv(path)
+        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        if 'ma5' not in df.columns:
+            df = strategy._compute_indicators(df)
+            if df is None:
+                continue
+        frames.append((os.path.basename(path), df))
+    return frames
+
+
+def save_frames(frames: list, frames_dir: str):
+    os.makedirs(frames_dir, exist_ok=True)
+    for name, df in frames:
+        df.to_csv(os.path.join(frames_dir, f"{name}.csv"), index=False)
+    print(f"💾 프레임 {len(frames)}count Save: {frames_dir}")
+
+
+def run_parity(strategy, frames: list) -> list:
+    """검사 항목별 (이름, 불일치 수, 참 결과 수, legacy ms, vector ms, 첫 불일치 프레임)"""
+    report = []
+    for name, legacy, vector in build_checks(strategy):
+        mismatches, positives, legacy_time, vector_time, first_bad = 0, 0, 0.0, 0.0, None
+        for frame_name, df in frames:
+            start = time.perf_counter()
+            expected = legacy(df)
+            legacy_time += time.perf_counter() - start
+            start = time.perf_counter()
+            actual = vector(df)
+            vector_time += time.perf_counter() - start
+            if expected != actual:
+                mismatches += 1
+                first_bad = first_bad or f"{frame_name}: legacy={expected!r} vector={actual!r}"
+            positives += bool(expected if not isinstance(expected, tuple) else expected[0])
+        report.append((name, mismatches, positives, legacy_time * 1000, vector_time * 1000, first_bad))
+    return report
+
+
+def run_method_parity(strategy, frames: list) -> tuple:
+    """check_high_surge_conditions 전체 출력 (is_signal, 조건 문자열) 비교"""
+    mismatches, checked = 0, 0
+    for _, df in frames:
+        if len(df) < 30:
+            continue
+        checked += 1
+        expected = legacy_check_high_surge_conditions(strategy, 'PARITY/USDT:USDT', df, 25.0)
+        actual = strategy.check_high_surge_conditions('PARITY/USDT:USDT', df, 25.0)
+        if (bool(expected[0]), expected[1]) != (bool(actual[0]), actual[1]):
+            mismatches += 1
+    return checked, mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Vectorized entry condition parity check')
+    parser.add_argument('--frames', type=int, default=300, help='synthetic frame count')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--frames-dir', default=None, help='recorded frames (CSV) directory')
+    parser.add_argument('--save-frames', default=None, help='record the checked frames as CSV')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    strategy = make_strategy()
+
+    frames = generate_frames(strategy, args.frames, args.seed) if args.frames > 0 else []
+    if args.frames_dir:
+        frames += load_frames(strategy, args.frames_dir)
+    if args.save_frames:
+        save_frames(frames, args.save_frames)
+    if not frames:
+        print("⚠️ 검사할 프레임 Absent")
+        return
+
+    print(f"📊 진입 조건 결과 동일성 (프레임 {len(frames)}count, Length {sorted({len(df) for _, df in frames})})")
+    print(f"{'check':<56} {'mismatch':>8} {'true':>6} {'legacy ms':>10} {'vector ms':>10} {'speedup':>8}")
+    total_mismatches, total_legacy, total_vector = 0, 0.0, 0.0
+    for name, mismatches, positives, legacy_ms, vector_ms, first_bad in run_parity(strategy, frames):
+        total_mismatches += mismatches
+        total_legacy += legacy_ms
+        total_vector += vector_ms
+        print(f"{name:<56} {mismatches:>8} {positives:>6} {legacy_ms:>10.1f} {vector_ms:>10.1f} "
+              f"{legacy_ms / max(vector_ms, 1e-9):>7.1f}x {'✅' if not mismatches else '❌'}")
+        if first_bad:
+            print(f"    ㄴ {first_bad}")
+
+    checked, method_mismatches = run_method_parity(strategy, frames)
+    total_mismatches += method_mismatches
+    print(f"{'check_high_surge_conditions (full method)':<56} {method_mismatches:>8} {checked:>6}")
+    print(f"\nTotal: 불일치 {total_mismatches}, legacy {total_legacy:.0f}ms → vector {total_vector:.0f}ms "
+          f"({total_legacy / max(total_vector, 1e-9):.1f}x) {'✅' if not total_mismatches else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -214,10 +214,10 @@ class WebSocketDefenseSystem:
                 return None
 
             buffer_key = f"{symbol}_{timeframe}"
-            buffer = self.bulk_manager.base_manager.kline_buffer.get(buffer_key, [])
+            buffer = self.bulk_manager.base_manager.kline_buffer.get(buffer_key)
 
             if buffer:
-                return buffer[-1]  # 마지막 캔들
+                return buffer.last()  # 마지막 캔들
 
         except Exception as e:
             self.logger.debug(f"최신 캔들 조times Failed ({symbol}): {e}")
@@ -236,12 +236,12 @@ class WebSocketDefenseSystem:
             # 캔들의 is_final 플래그 Settings
             candle['is_final'] = True
 
-            # 버퍼 Update
+            # 버퍼 Update (같은 캔들이 아직 마지막이면 확정 표시)
             buffer_key = f"{symbol}_{timeframe}"
             if hasattr(self.bulk_manager.base_manager, 'kline_buffer'):
-                buffer = self.bulk_manager.base_manager.kline_buffer.get(buffer_key, [])
-                if buffer and buffer[-1] == candle:
-                    buffer[-1] = candle
+                buffer = self.bulk_manager.base_manager.kline_buffer.get(buffer_key)
+                if buffer and buffer.last_timestamp == candle.get('timestamp'):
+                    buffer.mark_last_final()
 
             # 스캔 트리거 (옵션)
             if self.bulk_manager.scan_callback:
@@ -13,6 +13,10 @@ Binance User Data Stream:
 - Listen Key-based authentication (refresh every 60 minutes)
 - Real-time position/balance/order events
 - 99% Rate Limit reduction compared to REST API
+
+Positions are keyed by unified ccxt symbol (BTC/USDT:USDT) and shaped like
+ccxt fetch_positions rows. The stream only carries deltas, so after every
+(re)connect the caller must reconcile once over REST (reconnect_callback).
 """
 
 import time
@@ -60,12 +64,24 @@ class BinanceUserDataStream:
         self.position_callback: Optional[Callable] = None
         self.balance_callback: Optional[Callable] = None
         self.order_callback: Optional[Callable] = None
+        self.reconnect_callback: Optional[Callable] = None  # (재)연결 직후 - 끊긴 동안의 이벤트는 유실되므로 REST 재조정 필요
+
+        # 연결 상태 (스트림 공백 감지)
+        self.connected = False
+        self.connected_at = 0.0
+        self.last_message_time = 0.0
+        self._ever_connected = False
+        self._position_event_times: Dict[str, int] = {}  # symbol -> 마지막 반영 transaction time (ms)
+        self._listen_key_expired = False
+        self.reconnect_delay = 5
 
         # 통계
         self.stats = {
             'position_updates': 0,
             'balance_updates': 0,
             'order_updates': 0,
+            'stale_events': 0,
+            'disconnects': 0,
             'reconnections': 0
         }
 
@@ -108,30 +124,52 @@ class BinanceUserDataStream:
         except Exception as e:
             self.logger.error(f"[ERROR] Listen Key refresh failed: {e}")
 
+    def _unified_symbol(self, market_id: str) -> str:
+        """BTCUSDT → BTC/USDT:USDT (markets 로드 시 ccxt 매핑, 없으면 USDT 무기한 규칙)"""
+        if getattr(self.exchange, 'markets_by_id', None):
+            symbol = self.exchange.safe_symbol(market_id, None, None, 'swap')
+            if symbol and symbol != market_id:
+                return symbol
+        if market_id and market_id.endswith('USDT'):
+            return f"{market_id[:-4]}/USDT:USDT"
+        return market_id
+
     def _handle_account_update(self, data: Dict):
         """ACCOUNT_UPDATE 이벤트 처리 (포지션/잔고 변경)"""
         try:
             event_time = data.get('E', 0)
+            transaction_time = data.get('T', event_time)
             update_data = data.get('a', {})
 
             # 1️⃣ 포지션 업데이트
             positions = update_data.get('P', [])
             for pos in positions:
-                symbol = pos.get('s')  # BTCUSDT
+                symbol = self._unified_symbol(pos.get('s'))  # BTCUSDT → BTC/USDT:USDT
+
+                # 재연결 / 재전송으로 늦게 도착한 과거 이벤트는 무시
+                if transaction_time < self._position_event_times.get(symbol, 0):
+                    self.stats['stale_events'] += 1
+                    continue
+                self._position_event_times[symbol] = transaction_time
+
                 position_amount = float(pos.get('pa', 0))  # Position Amount
                 entry_price = float(pos.get('ep', 0))  # Entry Price
                 unrealized_pnl = float(pos.get('up', 0))  # Unrealized PnL
+                previous = self.positions.get(symbol, {})
 
-                # 포지션 데이터 업데이트
+                # 포지션 데이터 업데이트 (ACCOUNT_UPDATE에는 mark price / 레버리지가 없음 → None / 직전 값)
                 self.positions[symbol] = {
                     'symbol': symbol,
+                    'id': pos.get('s'),
                     'contracts': abs(position_amount),
                     'side': 'long' if position_amount > 0 else 'short' if position_amount < 0 else 'none',
                     'entryPrice': entry_price,
-                    'markPrice': float(pos.get('mp', 0)),  # Mark Price
+                    'markPrice': float(pos['mp']) if pos.get('mp') else None,
                     'unrealizedPnl': unrealized_pnl,
-                    'leverage': int(pos.get('l', 1)),  # Leverage
-                    'timestamp': event_time
+                    'leverage': int(pos['l']) if pos.get('l') else previous.get('leverage'),
+                    'positionSide': pos.get('ps'),
+                    'timestamp': transaction_time,
+                    'info': pos
                 }
 
                 self.stats['position_updates'] += 1
@@ -171,7 +209,7 @@ class BinanceUserDataStream:
             event_time = data.get('E', 0)
             order_data = data.get('o', {})
 
-            symbol = order_data.get('s')  # BTCUSDT
+            symbol = self._unified_symbol(order_data.get('s'))  # BTCUSDT → BTC/USDT:USDT
             order_id = order_data.get('i')  # Order ID
             status = order_data.get('X')  # Order Status (NEW, FILLED, CANCELED, etc.)
             side = order_data.get('S')  # BUY/SELL
@@ -192,7 +230,13 @@ class BinanceUserDataStream:
                 'quantity': quantity,
                 'filled_quantity': filled_quantity,
                 'avg_price': avg_price,
-                'timestamp': event_time
+                'execution_type': order_data.get('x'),  # NEW / TRADE / CANCELED / EXPIRED
+                'last_filled_quantity': float(order_data.get('l', 0)),
+                'last_filled_price': float(order_data.get('L', 0)),
+                'client_order_id': order_data.get('c'),
+                'reduce_only': order_data.get('R', False),
+                'realized_pnl': float(order_data.get('rp', 0)),
+                'timestamp': order_data.get('T', event_time)
             }
 
             self.stats['order_updates'] += 1
@@ -208,6 +252,7 @@ class BinanceUserDataStream:
     def _on_message(self, ws, message):
         """WebSocket message handler"""
         try:
+            self.last_message_time = time.time()
             data = json.loads(message)
             event_type = data.get('e')
 
@@ -217,6 +262,13 @@ class BinanceUserDataStream:
             elif event_type == 'ORDER_TRADE_UPDATE':
                 self._handle_order_update(data)
 
+            elif event_type == 'listenKeyExpired':
+                # 키 만료 → 새 키로 재연결 (끊긴 동안의 이벤트는 재연결 후 REST 재조정으로 보완)
+                self.logger.warning("[WARNING] Listen Key expired - reconnecting with a new key")
+                self._listen_key_expired = True
+                if self.ws:
+                    self.ws.close()
+
         except Exception as e:
             self.logger.error(f"[ERROR] WebSocket message processing failed: {e}")
 
@@ -226,12 +278,42 @@ class BinanceUserDataStream:
 
     def _on_close(self, ws, close_status_code, close_msg):
         """WebSocket connection closed"""
+        if self.connected:
+            self.stats['disconnects'] += 1
+        self.connected = False
         self.logger.warning(f"[WARNING] WebSocket closed: {close_status_code} - {close_msg}")
 
     def _on_open(self, ws):
         """WebSocket connection opened"""
+        self.connected = True
+        self.connected_at = time.time()
+        if self._ever_connected:
+            self.stats['reconnections'] += 1
+        self._ever_connected = True
         self.logger.info("[OK] WebSocket User Data Stream connected")
 
+        # 연결 전 / 끊긴 동안의 변경은 스트림에 없음 → 호출측 REST 재조정
+        if self.reconnect_callback:
+            try:
+                self.reconnect_callback()
+            except Exception as e:
+                self.logger.error(f"[ERROR] Reconnect callback failed: {e}")
+
+    def is_healthy(self) -> bool:
+        """연결 중인지 (User Data Stream은 변경이 없으면 메시지도 없으므로 무음은 정상)"""
+        return self.running and self.connected
+
+    def _connect_ws(self):
+        import websocket
+        self.ws = websocket.WebSocketApp(
+            f"wss://fstream.binance.com/ws/{self.listen_key}",
+            on_message=self._on_message,
+            on_error=self._on_error,
+            on_close=self._on_close,
+            on_open=self._on_open
+        )
+        return self.ws
+
     def start(self):
         """Start WebSocket User Data Stream"""
         try:
@@ -244,27 +326,28 @@ class BinanceUserDataStream:
             self.listen_key_created_at = time.time()
 
             # 2. Connect WebSocket
-            import websocket
-            ws_url = f"wss://fstream.binance.com/ws/{self.listen_key}"
-
-            self.ws = websocket.WebSocketApp(
-                ws_url,
-                on_message=self._on_message,
-                on_error=self._on_error,
-                on_close=self._on_close,
-                on_open=self._on_open
-            )
+            self._connect_ws()
 
             self.running = True
 
-            # 3. Run WebSocket in background
+            # 3. Run WebSocket in background (끊기면 재연결, 키 만료 시 새 키)
             def run_ws():
                 while self.running:
                     try:
-                        self.ws.run_forever()
+                        self.ws.run_forever(ping_interval=60, ping_timeout=10)
                     except Exception as e:
                         self.logger.error(f"[ERROR] WebSocket run failed: {e}")
-                        time.sleep(5)
+                    self.connected = False
+                    if not self.running:
+                        break
+                    time.sleep(self.reconnect_delay)
+                    if self._listen_key_expired or time.time() - self.listen_key_created_at > 55 * 60:
+                        listen_key = self._create_listen_key()
+                        if listen_key:
+                            self.listen_key = listen_key
+                            self.listen_key_created_at = time.time()
+                            self._listen_key_expired = False
+                    self._connect_ws()
 
             self.ws_thread = threading.Thread(target=run_ws, daemon=True)
             self.ws_thread.start()
@@ -305,8 +388,8 @@ class BinanceUserDataStream:
             self.logger.error(f"[ERROR] User Data Stream stop failed: {e}")
 
     def get_position(self, symbol: str) -> Optional[Dict]:
-        """Get real-time position (replaces REST API)"""
-        return self.positions.get(symbol)
+        """Get real-time position (replaces REST API) - unified symbol or market id"""
+        return self.positions.get(symbol) or self.positions.get(self._unified_symbol(symbol))
 
     def get_all_positions(self) -> List[Dict]:
         """Get all positions (replaces REST API)"""
@@ -320,6 +403,7 @@ class BinanceUserDataStream:
         """Get statistics"""
         return {
             **self.stats,
+            'connected': self.connected,
             'total_positions': len(self.positions),
             'active_positions': len([p for p in self.positions.values() if p.get('contracts', 0) > 0]),
             'listen_key_age': int(time.time() - self.listen_key_created_at) if self.listen_key_created_at else 0